@@ -0,0 +1 @@
+"""Performance benchmarks for meshTools (see benchmarks/run.py)."""
@@ -0,0 +1,324 @@
+"""Benchmark cases: every Mesh operation and native module entry point.
+
+A case is a setup function registered with @case. setup(size, variant)
+builds its input outside the timed region and returns (run, items): run()
+is the timed call and items the amount of work it does, in the case's
+unit, so throughput is items per second.
+
+Variants name the implementation under test. A variant called "python" is
+the pure-Python fallback (NoisePy, DelaunayPy, the Python Hull); run.py
+reports the speedup of every other variant of the case over it.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import meshTools
+import numpy as np
+from meshTools import (
+    BBox,
+    Ray,
+    Vector,
+    VectorArray,
+    chull,
+    kGeotype,
+    noise,
+    noise_volume,
+)
+from meshTools import delaunay as delaunay_module
+
+from .inputs import grid, scan, sphere, toArrayMesh, toMesh, toPoints
+
+__all__ = ["CASES", "Case", "case"]
+
+CASES: dict = {}
+
+MESHES = {"Mesh": toMesh, "ArrayMesh": toArrayMesh}
+
+
+class Case:
+    """One registered benchmark and its variants."""
+
+    def __init__(self, name, setup, variants, unit, limits, available):
+        self.name = name
+        self.setup = setup
+        self.variants = list(variants)
+        self.unit = unit
+        self.limits = dict(limits)
+        self.available = available
+
+    def skipReason(self, size: int, variant: str):
+        """Return why variant cannot run at size, or None if it can."""
+        if self.available is not None:
+            reason = self.available(variant)
+            if reason:
+                return reason
+        limit = self.limits.get(variant)
+        if limit is not None and size > limit:
+            return f"{variant} is limited to {limit} {self.unit}"
+        return None
+
+
+def case(name, variants, unit, limits=None, available=None):
+    """Register a benchmark.
+
+    Args:
+        name: Case name, dotted by area ("mesh.relax").
+        variants: Implementations to time.
+        unit: What items counts ("faces", "points", ...).
+        limits: Largest size per variant; bigger sizes are skipped, which
+            keeps slow pure-Python fallbacks out of the 1M runs.
+        available: Optional callable(variant) returning a reason string
+            when the variant's extension is not built.
+    """
+
+    def register(setup):
+        CASES[name] = Case(name, setup, variants, unit, limits or {}, available)
+        return setup
+
+    return register
+
+
+def _native(module, attr):
+    """available() callback: skip non-python variants if module.attr is None."""
+
+    def check(variant):
+        if variant != "python" and getattr(module, attr) is None:
+            return f"{attr} extension not built"
+        return None
+
+    return check
+
+
+@contextmanager
+def _patched(module, name, value):
+    saved = getattr(module, name)
+    setattr(module, name, value)
+    try:
+        yield
+    finally:
+        setattr(module, name, saved)
+
+
+# Mesh operations --------------------------------------------------------
+
+
+@case("mesh.selectConvert", MESHES, "faces")
+def selectConvert(size, variant):
+    mesh = MESHES[variant](grid(size))
+    faces = list(range(0, len(mesh.faces), 2))
+
+    def run():
+        verts = mesh.selectConvert(faces, kGeotype.face, kGeotype.vertex)
+        edges = mesh.selectConvert(verts, kGeotype.vertex, kGeotype.edge)
+        mesh.selectConvert(edges, kGeotype.edge, kGeotype.face)
+
+    return run, len(faces)
+
+
+@case("mesh.relax", MESHES, "vertex iterations")
+def relax(size, variant):
+    positions, counts, indices = grid(size)
+    jitter = np.random.default_rng(2).normal(0, 0.1, positions.shape)
+    mesh = MESHES[variant]((positions + jitter, counts, indices))
+    verts = list(range(len(mesh.vertices)))
+    iterations = 10
+
+    def run():
+        mesh.relax(
+            verts,
+            selection_type=kGeotype.vertex,
+            factor=0.5,
+            iterations=iterations,
+        )
+
+    return run, len(verts) * iterations
+
+
+@case(
+    "mesh.extrude",
+    MESHES,
+    "faces",
+    limits={"Mesh": 100_000, "ArrayMesh": 100_000},
+)
+def extrude(size, variant):
+    mesh = MESHES[variant](grid(size))
+    # a centred block of a quarter of the faces
+    n = round(len(mesh.faces) ** 0.5)
+    block = range(n // 4, n // 4 + n // 2)
+    faces = [row * n + col for row in block for col in block]
+
+    def run():
+        mesh.extrude(faces, selection_type=kGeotype.face, height=0.5)
+
+    return run, len(faces)
+
+
+@case("mesh.clipPlane", MESHES, "faces")
+def clipPlane(size, variant):
+    mesh = MESHES[variant](sphere(size))
+    ray = Ray(Vector(0, 0.3, 0), Vector(0.2, 1, 0.1))
+
+    def run():
+        mesh.clipPlane(True, ray, cap=True)
+
+    return run, len(mesh.faces)
+
+
+@case("mesh.triangulate", MESHES, "faces")
+def triangulate(size, variant):
+    mesh = MESHES[variant](sphere(size))
+    faces = list(range(len(mesh.faces)))
+
+    def run():
+        mesh.triangulate(faces, selection_type=kGeotype.face)
+
+    return run, len(faces)
+
+
+@case("mesh.noise", MESHES, "vertices")
+def meshNoise(size, variant):
+    mesh = MESHES[variant](grid(size))
+    verts = list(range(len(mesh.vertices)))
+
+    def run():
+        mesh.noise(verts, selection_type=kGeotype.vertex, amount=0.5)
+
+    return run, len(verts)
+
+
+# Native modules against their pure-Python fallbacks ---------------------
+
+
+@case(
+    "noise.fBm",
+    ["native", "python"],
+    "points",
+    limits={"python": 500_000},
+    available=_native(noise, "_NoiseCpp"),
+)
+def fBm(size, variant):
+    points = scan(size) * 4
+    generator = noise.NoisePy() if variant == "python" else noise.Noise()
+
+    def run():
+        generator.fBmArray(points, 4, 2.0, 0.5)
+
+    return run, size
+
+
+@case(
+    "noise.NoiseVolume.sample",
+    ["native", "python"],
+    "points",
+    available=_native(noise_volume, "_sampleGrid"),
+)
+def noiseVolumeSample(size, variant):
+    points = scan(size) * 4
+    volume = noise_volume.NoiseVolume.get("fBm", 8, resolution=64)
+    native = variant != "python"
+
+    def run():
+        if native:
+            volume.sample(points)
+        else:
+            with _patched(noise_volume, "_sampleGrid", None):
+                volume.sample(points)
+
+    return run, size
+
+
+@case(
+    "chull.Hull",
+    ["quickhull", "incremental", "python"],
+    "points",
+    limits={"incremental": 100_000, "python": 10_000},
+    available=_native(chull, "_CHull"),
+)
+def hull(size, variant):
+    points = scan(size)
+    if variant == "python":
+        vertices = toPoints(points)
+
+        def run():
+            with _patched(chull, "_CHull", None):
+                chull.Hull(vertices)
+
+    else:
+        quickhull = variant == "quickhull"
+
+        def run():
+            chull.Hull.fromArray(points, quickhull)
+
+    return run, size
+
+
+@case(
+    "delaunay.Delaunay",
+    ["native", "python"],
+    "points",
+    limits={"python": 2_000},
+    available=_native(delaunay_module, "_DelaunayCpp"),
+)
+def delaunay(size, variant):
+    # a solid ball rather than a shell, so most points are interior
+    points = scan(size) * np.cbrt(
+        np.random.default_rng(3).random((size, 1))
+    ).astype(np.float32)
+    if variant == "python":
+        vertices = toPoints(points)
+
+        def run():
+            delaunay_module.DelaunayPy(vertices, 2.0)
+
+    else:
+
+        def run():
+            delaunay_module.Delaunay.fromArray(points)
+
+    return run, size
+
+
+@case("geometry.BBox", ["VectorArray", "threads", "list", "numpy"], "points")
+def bbox(size, variant):
+    points = scan(size)
+    if variant == "numpy":
+
+        def run():
+            points.min(axis=0), points.max(axis=0)
+
+    elif variant == "list":
+        vertices = toPoints(points)
+
+        def run():
+            BBox().fromPointSet(vertices)
+
+    else:
+        array = VectorArray(points)
+        threads = 0 if variant == "threads" else 1
+
+        def run():
+            BBox().fromPointSet(array, threads)
+
+    return run, size
+
+
+@case(
+    "bezier.interpolate",
+    ["Bezier", "Lagrange", "Spline"],
+    "control points",
+    available=_native(meshTools, "_bezier"),
+)
+def curves(size, variant):
+    bezier = meshTools._bezier
+    t = np.linspace(0, 8 * np.pi, max(size, 8))
+    control = np.stack([t, np.sin(t)], axis=1).ravel().tolist()
+    curve = getattr(bezier, variant)(control)
+    # Bezier takes the total sample count, the others samples per segment
+    samples = 8 * len(t) if variant == "Bezier" else 8
+
+    def run():
+        curve.interpolate(samples)
+
+    return run, len(t)
@@ -0,0 +1,128 @@
+"""Procedural benchmark inputs: grids, spheres and noisy scans.
+
+Every generator takes a target vertex (or point) count and returns NumPy
+arrays, so each benchmark can build whichever mesh class or point format
+it needs. Inputs are seeded and therefore identical between runs.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from meshTools import ArrayMesh, Mesh, Point
+
+__all__ = ["grid", "scan", "sphere", "toArrayMesh", "toMesh", "toPoints"]
+
+
+def grid(size: int, height: float = 0.1):
+    """Quad grid of about size vertices with a gentle height field.
+
+    Args:
+        size: Target vertex count.
+        height: Amplitude of the sine bumps along y.
+
+    Returns:
+        (positions float32 (N, 3), face_counts, face_indices).
+    """
+    n = max(2, round(math.sqrt(size)))
+    x, z = np.meshgrid(np.arange(n, dtype=np.float32), np.arange(n))
+    y = height * np.sin(0.7 * x) * np.cos(0.5 * z)
+    positions = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+    corner = (np.arange(n - 1)[None, :] + n * np.arange(n - 1)[:, None]).ravel()
+    quads = np.stack([corner, corner + 1, corner + n + 1, corner + n], axis=1)
+    counts = np.full(len(quads), 4)
+    return positions.astype(np.float32), counts, quads.ravel()
+
+
+def sphere(size: int, radius: float = 1.0):
+    """Closed UV sphere of about size vertices: quads plus triangle caps.
+
+    Args:
+        size: Target vertex count.
+        radius: Sphere radius.
+
+    Returns:
+        (positions float32 (N, 3), face_counts, face_indices).
+    """
+    rings = max(3, round(math.sqrt(size / 2)))
+    segments = 2 * rings
+    theta = np.pi * np.arange(1, rings) / rings
+    phi = 2 * np.pi * np.arange(segments) / segments
+    sin_t = np.sin(theta)[:, None]
+    body = np.stack(
+        [
+            sin_t * np.cos(phi),
+            np.cos(theta)[:, None] + 0 * phi,
+            sin_t * np.sin(phi),
+        ],
+        axis=-1,
+    ).reshape(-1, 3)
+    positions = np.concatenate([[(0, 1, 0)], body, [(0, -1, 0)]]) * radius
+    ring = np.arange(segments)
+    following = (ring + 1) % segments
+    faces = [np.stack([ring * 0, following + 1, ring + 1], axis=1)]
+    for r in range(rings - 2):
+        top, bottom = 1 + r * segments, 1 + (r + 1) * segments
+        faces.append(
+            np.stack(
+                [
+                    top + ring,
+                    top + following,
+                    bottom + following,
+                    bottom + ring,
+                ],
+                axis=1,
+            )
+        )
+    last = len(positions) - 1
+    base = 1 + (rings - 2) * segments
+    faces.append(
+        np.stack([base + ring, base + following, ring * 0 + last], axis=1)
+    )
+    counts = np.concatenate([np.full(len(f), f.shape[1]) for f in faces])
+    indices = np.concatenate([f.ravel() for f in faces])
+    return positions.astype(np.float32), counts, indices
+
+
+def scan(size: int, noise: float = 0.02, seed: int = 1):
+    """Noisy scan: size points near the unit sphere, plus a few outliers.
+
+    Args:
+        size: Number of points.
+        noise: Standard deviation of the radial jitter.
+        seed: Random seed.
+
+    Returns:
+        float32 (size, 3) array.
+    """
+    rng = np.random.default_rng(seed)
+    directions = rng.normal(size=(size, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    radii = 1 + noise * rng.normal(size=(size, 1))
+    # one point in a hundred sits well inside, as scanner noise does
+    radii[rng.random(size) < 0.01] *= 0.5
+    return (directions * radii).astype(np.float32)
+
+
+def toArrayMesh(arrays):
+    """ArrayMesh from (positions, face_counts, face_indices)."""
+    return ArrayMesh(*arrays)
+
+
+def toMesh(arrays):
+    """List-backed Mesh from (positions, face_counts, face_indices)."""
+    positions, counts, indices = arrays
+    mesh = Mesh()
+    flat = indices.tolist()
+    ends = np.cumsum(counts).tolist()
+    for p in positions.tolist():
+        mesh.addVertex(Point(*p))
+    for end, count in zip(ends, counts.tolist()):
+        mesh.addFace(flat[end - count : end])
+    return mesh
+
+
+def toPoints(points):
+    """List of Points from an (N, 3) array."""
+    return [Point(*p) for p in points.tolist()]
@@ -0,0 +1,316 @@
+"""Run the meshTools benchmarks and write a JSON report.
+
+Usage (from the repo root, after building):
+
+    python benchmarks/run.py --scale 1k --scale 100k -o report.json
+    python benchmarks/run.py --case mesh. --scale 1M --repeat 5
+    python benchmarks/run.py --baseline old.json --tolerance 0.2
+
+Each (case, scale) pair runs in a fresh worker process, so the peak
+resident memory it reports belongs to that case alone and one case
+running out of memory does not abort the rest. Throughput is the case's
+items per second over the best of --repeat runs; every run gets a fresh
+setup, outside the timed region.
+
+The report has one entry per (case, variant, scale) with seconds,
+throughput, peak RSS growth and the Python allocation peak
+(tracemalloc), plus the speedup of each variant over the case's "python"
+variant. With --baseline, throughputs that dropped by more than
+--tolerance make the run exit with status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_repo_root = Path(__file__).resolve().parent.parent
+
+kScales = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+
+
+def _setupPaths():
+    """Find meshTools the same way tests/conftest.py does."""
+    build_dir = Path(
+        os.environ.get("MESHTOOLS_BUILD_DIR", _repo_root / "build")
+    )
+    candidates = [build_dir / "scripts"]
+    for target in sorted((build_dir / "bindings").glob("*")):
+        candidates += [target / "Debug", target / "Release", target]
+    candidates.append(_repo_root / "python")
+    for directory in reversed(candidates):
+        if directory.exists():
+            path = str(directory.resolve())
+            if path not in sys.path:
+                sys.path.insert(0, path)
+    if str(_repo_root) not in sys.path:
+        sys.path.insert(0, str(_repo_root))
+
+
+def parseScale(text: str) -> int:
+    """Return the size for "1k", "100k", "1M" or a plain number."""
+    if text in kScales:
+        return kScales[text]
+    try:
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"scale must be one of {list(kScales)} or an integer"
+        ) from None
+
+
+def _peakRss() -> int | None:
+    """Peak resident set size of this process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(bench, size: int, variant: str, repeat: int) -> dict:
+    """Time one variant of a case at size.
+
+    Returns:
+        Result dict; "skipped" holds the reason if the variant cannot run.
+    """
+    result = {"case": bench.name, "variant": variant, "size": size}
+    reason = bench.skipReason(size, variant)
+    if reason:
+        result["skipped"] = reason
+        return result
+    # a warm-up run loads lazily imported modules and fills caches, so
+    # neither is charged to the first timed run
+    run, items = bench.setup(size, variant)
+    run()
+    del run
+    times = []
+    rss_before = _peakRss()
+    for _ in range(repeat):
+        run, items = bench.setup(size, variant)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+        del run
+    rss_after = _peakRss()
+    # a separate traced run: tracemalloc slows allocation-heavy code down
+    run, items = bench.setup(size, variant)
+    tracemalloc.start()
+    run()
+    python_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    best = min(times)
+    result.update(
+        items=items,
+        unit=bench.unit,
+        seconds=best,
+        mean_seconds=sum(times) / len(times),
+        throughput=items / best if best > 0 else None,
+        peak_rss_bytes=(
+            None if rss_before is None else max(0, rss_after - rss_before)
+        ),
+        python_peak_bytes=python_peak,
+    )
+    return result
+
+
+def _worker(name: str, size: int, repeat: int) -> list:
+    from benchmarks.cases import CASES
+
+    bench = CASES[name]
+    results = []
+    for variant in bench.variants:
+        try:
+            results.append(measure(bench, size, variant, repeat))
+        except Exception as error:  # noqa: BLE001 - reported per variant
+            results.append(
+                {
+                    "case": name,
+                    "variant": variant,
+                    "size": size,
+                    "error": f"{type(error).__name__}: {error}",
+                }
+            )
+    return results
+
+
+def _runIsolated(name: str, size: int, repeat: int) -> list:
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--worker",
+        name,
+        "--scale",
+        str(size),
+        "--repeat",
+        str(repeat),
+    ]
+    process = subprocess.run(
+        command, check=False, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        error = process.stderr.strip().splitlines() or ["worker failed"]
+        return [{"case": name, "size": size, "error": error[-1]}]
+    return json.loads(process.stdout)
+
+
+def speedups(results: list) -> list:
+    """Speedup of every variant over the "python" variant of its case."""
+    reference = {
+        (r["case"], r["size"]): r["seconds"]
+        for r in results
+        if r.get("variant") == "python" and "seconds" in r
+    }
+    rows = []
+    for r in results:
+        key = (r["case"], r["size"])
+        if r.get("variant") == "python" or "seconds" not in r:
+            continue
+        if key in reference and r["seconds"] > 0:
+            rows.append(
+                {
+                    "case": r["case"],
+                    "variant": r["variant"],
+                    "size": r["size"],
+                    "speedup": reference[key] / r["seconds"],
+                }
+            )
+    return rows
+
+
+def regressions(results: list, baseline: dict, tolerance: float) -> list:
+    """Results whose throughput fell more than tolerance below baseline."""
+    previous = {
+        (r["case"], r.get("variant"), r["size"]): r.get("throughput")
+        for r in baseline.get("results", [])
+    }
+    rows = []
+    for r in results:
+        old = previous.get((r["case"], r.get("variant"), r["size"]))
+        new = r.get("throughput")
+        if old and new and new < old * (1 - tolerance):
+            rows.append(
+                {
+                    "case": r["case"],
+                    "variant": r["variant"],
+                    "size": r["size"],
+                    "baseline": old,
+                    "throughput": new,
+                }
+            )
+    return rows
+
+
+def _format(result: dict) -> str:
+    label = f"{result['case']} [{result.get('variant', '-')}] {result['size']}"
+    if "error" in result:
+        return f"{label}: error: {result['error']}"
+    if "skipped" in result:
+        return f"{label}: skipped ({result['skipped']})"
+    rss = result["peak_rss_bytes"]
+    memory = "" if rss is None else f", +{rss / 2**20:.1f} MiB"
+    return (
+        f"{label}: {result['seconds'] * 1e3:.2f} ms, "
+        f"{result['throughput']:.4g} {result['unit']}/s{memory}"
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        action="append",
+        type=parseScale,
+        help="input size: 1k, 100k, 1M or a number (repeatable; default 1k)",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        default=[],
+        help="run cases whose name starts with this prefix (repeatable)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="earlier report to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--list", action="store_true", help="list cases")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    _setupPaths()
+    scales = args.scale or [kScales["1k"]]
+    if args.worker:
+        json.dump(_worker(args.worker, scales[0], args.repeat), sys.stdout)
+        return 0
+
+    from benchmarks.cases import CASES
+
+    names = [
+        name
+        for name in CASES
+        if not args.case or any(name.startswith(p) for p in args.case)
+    ]
+    if args.list:
+        for name in names:
+            print(f"{name}: {', '.join(CASES[name].variants)}")
+        return 0
+
+    results = []
+    for size in scales:
+        for name in names:
+            for result in _runIsolated(name, size, args.repeat):
+                print(_format(result), file=sys.stderr)
+                results.append(result)
+
+    import meshTools
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "meshTools": getattr(meshTools, "__version__", None),
+            "repeat": args.repeat,
+            "scales": scales,
+        },
+        "results": results,
+        "speedups": speedups(results),
+    }
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as stream:
+            report["regressions"] = regressions(
+                results, json.load(stream), args.tolerance
+            )
+        for row in report["regressions"]:
+            print(
+                f"regression: {row['case']} [{row['variant']}] {row['size']}:"
+                f" {row['throughput']:.4g} < {row['baseline']:.4g}",
+                file=sys.stderr,
+            )
+        status = 1 if report["regressions"] else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
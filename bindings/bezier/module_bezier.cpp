@@ -4,25 +4,46 @@
 #include <nanobind/nanobind.h>
 #include <nanobind/stl/vector.h>
 
+#include <geometry/counters.h>
+
 #include "curves.h"
+#include "export_counters.h"
 
 namespace nb = nanobind;
 
+/** Curve::interpolate, counted as name by the values it returns. */
+template <typename Curve> static auto countedInterpolate(const char *name) {
+    // resolved once at bind time: the registry lookup takes a lock
+    return [&counter = meshTools::Geometry::namedCounter(name)](
+               Curve &curve, size_t samples) {
+        meshTools::Geometry::CounterScope scope(counter);
+        std::vector<float> values = curve.interpolate(samples);
+        scope.setItems(values.size());
+        return values;
+    };
+}
+
 void exportBezierModule(nb::module_ &m) {
     nb::class_<curves::Bezier>(m, "Bezier")
         .def(nb::init<>())
         .def(nb::init<std::vector<float>>())
-        .def("interpolate", &curves::Bezier::interpolate);
+        .def("interpolate",
+             countedInterpolate<curves::Bezier>("Bezier.interpolate"));
 
     nb::class_<curves::Lagrange>(m, "Lagrange")
         .def(nb::init<>())
         .def(nb::init<std::vector<float>>())
-        .def("interpolate", &curves::Lagrange::interpolate);
+        .def("interpolate",
+             countedInterpolate<curves::Lagrange>("Lagrange.interpolate"));
 
     nb::class_<curves::Spline>(m, "Spline")
         .def(nb::init<>())
         .def(nb::init<std::vector<float>>())
-        .def("interpolate", &curves::Spline::interpolate);
+        .def("interpolate",
+             countedInterpolate<curves::Spline>("Spline.interpolate"));
 }
 
-NB_MODULE(_bezier, m) { exportBezierModule(m); }
+NB_MODULE(_bezier, m) {
+    exportBezierModule(m);
+    meshTools::exportCounters(m);
+}
@@ -1,7 +1,17 @@
 #include <chull/chull.h>
+#include <chull/obb.h>
+#include <cstdint>
+#include <geometry/counters.h>
 #include <geometry/vector.h>
+#include <geometry/vector_array.h>
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/string.h>
 #include <nanobind/stl/vector.h>
+#include <stdexcept>
+#include <string>
+
+#include "export_counters.h"
 
 namespace nb = nanobind;
 using namespace nb::literals;
@@ -9,12 +19,125 @@ using namespace nb::literals;
 namespace meshTools {
 namespace Chull {
 
+using PointArray =
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu>;
+
+/** Copy a flat buffer into a new (size / columns, columns) numpy array. */
+template <typename T>
+nb::ndarray<nb::numpy, T> toArray(const std::vector<T> &values,
+                                  size_t columns) {
+    auto *copy = new std::vector<T>(values);
+    nb::capsule owner(copy, [](void *p) noexcept {
+        delete static_cast<std::vector<T> *>(p);
+    });
+    size_t shape[2] = {copy->size() / columns, columns};
+    return nb::ndarray<nb::numpy, T>(copy->data(), columns == 1 ? 1 : 2, shape,
+                                     owner);
+}
+
+using IndexArray =
+    nb::ndarray<const uint32_t, nb::ndim<1>, nb::c_contig, nb::device::cpu>;
+
+/** ObbMethod from its Python name. */
+ObbMethod obbMethod(const std::string &name) {
+    if (name == "covariance")
+        return ObbMethod::Covariance;
+    if (name == "hull")
+        return ObbMethod::HullCovariance;
+    if (name == "minvolume")
+        return ObbMethod::MinVolume;
+    throw std::invalid_argument(
+        "method must be 'covariance', 'hull' or 'minvolume'");
+}
+
 void exportChullModule(nb::module_ &m) {
+    m.def(
+        "orientedBox",
+        [](PointArray points, const std::string &method) {
+            const ObbMethod obb = obbMethod(method);
+            nb::gil_scoped_release release;
+            static Geometry::Counter &counter =
+                Geometry::namedCounter("orientedBox");
+            Geometry::CounterScope scope(counter, points.shape(0));
+            return orientedBox(points.data(), points.shape(0), obb);
+        },
+        "points"_a, "method"_a = "minvolume",
+        "Oriented bounding box (a _geometry.BBox with axis, min, max in the "
+        "axis frame and a world center) of an (N, 3) float32 array. method "
+        "is 'covariance' (principal axes of all points), 'hull' (principal "
+        "axes of the hull vertices) or 'minvolume' (smallest box over the "
+        "hull face normals).");
+    m.def(
+        "orientedBoxes",
+        [](PointArray points, IndexArray offsets, const std::string &method,
+           unsigned threads) {
+            const ObbMethod obb = obbMethod(method);
+            if (offsets.shape(0) == 0)
+                throw std::invalid_argument("offsets must not be empty");
+            const size_t ranges = offsets.shape(0) - 1;
+            const uint32_t *off = offsets.data();
+            for (size_t r = 0; r < ranges; r++)
+                if (off[r] > off[r + 1])
+                    throw std::invalid_argument(
+                        "offsets must be non-decreasing");
+            if (off[ranges] > points.shape(0))
+                throw std::invalid_argument("offsets run past the end");
+            auto *out = new std::vector<float>(18 * ranges);
+            {
+                nb::gil_scoped_release release;
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("orientedBoxes");
+                Geometry::CounterScope scope(counter, ranges);
+                orientedBoxes(points.data(), off, ranges, obb, out->data(),
+                              threads);
+            }
+            nb::capsule owner(out, [](void *p) noexcept {
+                delete static_cast<std::vector<float> *>(p);
+            });
+            size_t shape[3] = {ranges, 6, 3};
+            return nb::ndarray<nb::numpy, float>(out->data(), 3, shape, owner);
+        },
+        "points"_a, "offsets"_a, "method"_a = "minvolume", "threads"_a = 1,
+        nb::rv_policy::take_ownership,
+        "Oriented boxes of the point ranges offsets[r]:offsets[r + 1] as a "
+        "(ranges, 6, 3) float32 array of rows min, max, center, axis 0, 1, "
+        "2. threads=0 uses every core.");
+
     nb::class_<Hull>(m, "Hull",
                      "Convex hull of a 3D point set. Use exportHull() for "
                      "[faces, vertices].")
-        .def(nb::init<const std::vector<Geometry::Vector> &>(), "v"_a,
-             "Build convex hull from list of Vector points.")
+        .def(
+            "__init__",
+            [](Hull *self, const Geometry::VectorArray &v, bool quickhull) {
+                nb::gil_scoped_release release;
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Hull");
+                Geometry::CounterScope scope(counter, v.size());
+                if (quickhull)
+                    new (self) Hull(v.data(), v.size(), true);
+                else
+                    new (self) Hull(v.vectors(), false);
+            },
+            "v"_a, "quickhull"_a = false,
+            "Build from a VectorArray without converting its points.")
+        .def(nb::init<const std::vector<Geometry::Vector> &, bool>(), "v"_a,
+             "quickhull"_a = false,
+             "Build convex hull from list of Vector points; quickhull selects "
+             "the Quickhull engine instead of the incremental one.")
+        .def_static(
+            "fromArray",
+            [](PointArray points, bool quickhull) {
+                const float *data = points.data();
+                size_t count = points.shape(0);
+                nb::gil_scoped_release release;
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Hull");
+                Geometry::CounterScope scope(counter, count);
+                return Hull(data, count, quickhull);
+            },
+            "points"_a, "quickhull"_a = true,
+            "Build from an (N, 3) float32 array; the GIL is released while "
+            "hulling. Uses Quickhull unless quickhull is False.")
         .def(
             "exportHull",
             [](const Hull &h) {
@@ -32,10 +155,29 @@ void exportChullModule(nb::module_ &m) {
                 return nb::make_tuple(pyFaces, pyVertices);
             },
             "Return [faces, vertices]: faces are [[v0,v1,v2], ...], vertices "
-            "are Vector.");
+            "are Vector.")
+        .def_prop_ro(
+            "face_indices",
+            [](const Hull &h) { return toArray(h.getFaceIndices(), 3); },
+            nb::rv_policy::take_ownership,
+            "(F, 3) uint32 array of indices into positions, counterclockwise "
+            "seen from outside.")
+        .def_prop_ro(
+            "positions",
+            [](const Hull &h) { return toArray(h.getPositions(), 3); },
+            nb::rv_policy::take_ownership,
+            "(V, 3) float32 array of hull vertex positions.")
+        .def_prop_ro(
+            "point_ids",
+            [](const Hull &h) { return toArray(h.getPointIds(), 1); },
+            nb::rv_policy::take_ownership,
+            "(V,) uint32 array: input point index of each hull vertex.");
 }
 
 } // namespace Chull
 } // namespace meshTools
 
-NB_MODULE(_chull, m) { meshTools::Chull::exportChullModule(m); }
+NB_MODULE(_chull, m) {
+    meshTools::Chull::exportChullModule(m);
+    meshTools::exportCounters(m);
+}
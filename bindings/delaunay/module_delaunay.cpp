@@ -1,22 +1,57 @@
+#include <cstdint>
 #include <delaunay/delaunay.h>
+#include <geometry/counters.h>
 #include <geometry/vector.h>
+#include <geometry/vector_array.h>
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <nanobind/stl/vector.h>
 
+#include "export_counters.h"
+
 namespace nb = nanobind;
 using namespace nb::literals;
 
 namespace meshTools {
 namespace Delaunay {
 
+using PointArray =
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu>;
+
 void exportDelaunayModule(nb::module_ &m) {
     nb::class_<Delaunay>(m, "Delaunay",
                          "3D Delaunay tetrahedralization built incrementally "
                          "from a point set.")
+        .def(
+            "__init__",
+            [](Delaunay *self, const Geometry::VectorArray &v, float) {
+                nb::gil_scoped_release release;
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Delaunay");
+                Geometry::CounterScope scope(counter, v.size());
+                new (self) Delaunay(v.data(), v.size());
+            },
+            "vertices"_a, "max"_a,
+            "Build from a VectorArray without converting its points.")
         .def(
             nb::init<const std::vector<Geometry::Vector> &, float>(),
             "vertices"_a, "max"_a,
-            "Build from list of Vector and max value for bounding tetrahedron.")
+            "Build from list of Vector; max is unused (the hull is closed by a "
+            "symbolic vertex at infinity).")
+        .def_static(
+            "fromArray",
+            [](PointArray points) {
+                const float *data = points.data();
+                size_t count = points.shape(0);
+                nb::gil_scoped_release release;
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Delaunay");
+                Geometry::CounterScope scope(counter, count);
+                return Delaunay(data, count);
+            },
+            "points"_a,
+            "Build from an (N, 3) float32 array; the GIL is released while "
+            "tetrahedralizing.")
         .def_prop_ro(
             "orig_vertices",
             [](const Delaunay &d) {
@@ -36,7 +71,7 @@ void exportDelaunayModule(nb::module_ &m) {
                     L.append(vec);
                 return L;
             },
-            "All vertices (bounding + input).")
+            "All vertices; same as orig_vertices.")
         .def_prop_ro(
             "tetras",
             [](const Delaunay &d) {
@@ -50,10 +85,30 @@ void exportDelaunayModule(nb::module_ &m) {
                 }
                 return L;
             },
-            "Tetrahedra as list of 4-tuples of vertex indices.");
+            "Tetrahedra as list of 4-tuples of indices into vertices.")
+        .def_prop_ro(
+            "tetra_indices",
+            [](const Delaunay &d) {
+                auto *indices = new std::vector<uint32_t>(d.getTetraIndices());
+                nb::capsule owner(indices, [](void *p) noexcept {
+                    delete static_cast<std::vector<uint32_t> *>(p);
+                });
+                size_t shape[2] = {indices->size() / 4, 4};
+                return nb::ndarray<nb::numpy, uint32_t>(indices->data(), 2,
+                                                        shape, owner);
+            },
+            nb::rv_policy::take_ownership,
+            "(T, 4) uint32 array of indices into orig_vertices.")
+        .def_prop_ro("tetra_count", &Delaunay::tetraCount,
+                     "Number of tetrahedra.")
+        .def_prop_ro("duplicate_count", &Delaunay::duplicateCount,
+                     "Input points skipped because they repeat a vertex.");
 }
 
 } // namespace Delaunay
 } // namespace meshTools
 
-NB_MODULE(_delaunay, m) { meshTools::Delaunay::exportDelaunayModule(m); }
+NB_MODULE(_delaunay, m) {
+    meshTools::Delaunay::exportDelaunayModule(m);
+    meshTools::exportCounters(m);
+}
@@ -0,0 +1,42 @@
+/**
+ * @file export_counters.h
+ * @brief Bind a module's native counters (geometry/counters.h) to Python
+ */
+
+#pragma once
+
+#include <geometry/counters.h>
+#include <nanobind/nanobind.h>
+
+namespace meshTools {
+
+/**
+ * @brief Add counters() and resetCounters() to an extension module.
+ *
+ * counters() returns {name: {"calls", "items", "seconds"}} for the entry
+ * points of this module that have run at least once since the last reset.
+ */
+inline void exportCounters(nanobind::module_ &m) {
+    namespace nb = nanobind;
+    m.def(
+        "counters",
+        []() {
+            nb::dict result;
+            for (const Geometry::CounterValue &c : Geometry::counterValues()) {
+                if (c.calls == 0)
+                    continue;
+                nb::dict entry;
+                entry["calls"] = c.calls;
+                entry["items"] = c.items;
+                entry["seconds"] = static_cast<double>(c.nanoseconds) * 1e-9;
+                result[c.name.c_str()] = entry;
+            }
+            return result;
+        },
+        "Calls, items and seconds spent per batched entry point of this "
+        "module since the last resetCounters().");
+    m.def("resetCounters", &Geometry::resetCounters,
+          "Zero this module's native counters.");
+}
+
+} // namespace meshTools
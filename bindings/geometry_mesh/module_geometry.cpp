@@ -1,15 +1,29 @@
 #include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <optional>
+#include <stdexcept>
+#include <string>
 
+#include <nanobind/make_iterator.h>
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <nanobind/operators.h>
+#include <nanobind/stl/optional.h>
+#include <nanobind/stl/string.h>
 #include <nanobind/stl/vector.h>
 
 #include <geometry/bbox.h>
+#include <geometry/bvh.h>
+#include <geometry/counters.h>
 #include <geometry/math.h>
 #include <geometry/polygon.h>
 #include <geometry/ray.h>
 #include <geometry/transform.h>
 #include <geometry/vector.h>
+#include <geometry/vector_array.h>
+
+#include "export_counters.h"
 
 namespace nb = nanobind;
 using namespace nb::literals;
@@ -26,10 +40,134 @@ static std::vector<Vector> bboxAxis(const Bbox &b) {
     return {b.axis[0], b.axis[1], b.axis[2]};
 }
 
+using PointArray = nb::ndarray<const float, nb::shape<-1, 3>, nb::device::cpu>;
+
+using OutArray =
+    nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu>;
+using InArray =
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu>;
+
+using IndexArray =
+    nb::ndarray<const uint32_t, nb::ndim<1>, nb::c_contig, nb::device::cpu>;
+
+/** @brief New NumPy array of the given shape (float32 unless T says
+ * otherwise); data receives its buffer */
+template <class T>
+static nb::object newArray(size_t ndim, const size_t *shape, T *&data) {
+    size_t size = 1;
+    for (size_t i = 0; i < ndim; i++)
+        size *= shape[i];
+    data = new T[size];
+    nb::capsule owner(data, [](void *p) noexcept { delete[] (T *)p; });
+    return nb::cast(nb::ndarray<nb::numpy, T>(data, ndim, shape, owner));
+}
+
+/** @brief Check CSR faces against the points; returns the face count */
+static size_t checkFaces(const InArray &positions, const IndexArray &offsets,
+                         const IndexArray &indices) {
+    if (offsets.shape(0) == 0)
+        throw std::invalid_argument("offsets must not be empty");
+    const size_t faces = offsets.shape(0) - 1;
+    const uint32_t *off = offsets.data();
+    for (size_t f = 0; f < faces; f++)
+        if (off[f] > off[f + 1])
+            throw std::invalid_argument("offsets must be non-decreasing");
+    if (off[faces] > indices.shape(0))
+        throw std::invalid_argument("offsets run past the end of indices");
+    const uint32_t *idx = indices.data();
+    for (size_t i = off[0]; i < off[faces]; i++)
+        if (idx[i] >= positions.shape(0))
+            throw std::invalid_argument("vertex index out of range");
+    return faces;
+}
+
+/** @brief Build a Bvh after checking the CSR faces against the points */
+static Bvh makeBvh(InArray positions, IndexArray offsets, IndexArray indices) {
+    const size_t faces = checkFaces(positions, offsets, indices);
+    nb::gil_scoped_release release;
+    static Counter &counter = namedCounter("Bvh");
+    CounterScope scope(counter, faces);
+    return Bvh(positions.data(), positions.shape(0), offsets.data(),
+               indices.data(), faces);
+}
+
+static void checkRays(const InArray &origins, const InArray &directions) {
+    if (origins.shape(0) != directions.shape(0))
+        throw std::invalid_argument(
+            "origins and directions must have the same number of rows");
+}
+
+/**
+ * @brief Return out as a writable float32 (rows, 3) buffer, or a new NumPy
+ * array if out is None.
+ */
+static nb::object outputArray(nb::object out, size_t rows, float *&data) {
+    if (!out.is_none()) {
+        OutArray array;
+        if (!nb::try_cast(out, array, false))
+            throw nb::type_error(
+                "out must be a writable contiguous float32 (N, 3) array");
+        if (array.shape(0) != rows)
+            throw std::invalid_argument("out has the wrong number of rows");
+        data = array.data();
+        return out;
+    }
+    size_t shape[2] = {rows, 3};
+    return newArray(2, shape, data);
+}
+
+static size_t checkIndex(const VectorArray &a, Py_ssize_t index) {
+    Py_ssize_t size = static_cast<Py_ssize_t>(a.size());
+    if (index < 0)
+        index += size;
+    if (index < 0 || index >= size)
+        throw nb::index_error("VectorArray index out of range");
+    return static_cast<size_t>(index);
+}
+
+// Buffer protocol: expose the storage as a writable float32 (N, 3) array
+static int vectorArrayGetBuffer(PyObject *exporter, Py_buffer *view,
+                                int flags) {
+    VectorArray *a = nb::inst_ptr<VectorArray>(exporter);
+    Py_ssize_t *layout = new Py_ssize_t[4]{static_cast<Py_ssize_t>(a->size()),
+                                           3, 3 * sizeof(float), sizeof(float)};
+    view->buf = a->data();
+    view->obj = exporter;
+    Py_INCREF(exporter);
+    view->len = static_cast<Py_ssize_t>(3 * sizeof(float) * a->size());
+    view->readonly = 0;
+    view->itemsize = sizeof(float);
+    view->format = (flags & PyBUF_FORMAT) ? const_cast<char *>("f") : nullptr;
+    view->ndim = 2;
+    view->shape = (flags & PyBUF_ND) == PyBUF_ND ? layout : nullptr;
+    view->strides =
+        (flags & PyBUF_STRIDES) == PyBUF_STRIDES ? layout + 2 : nullptr;
+    view->suboffsets = nullptr;
+    view->internal = layout;
+    return 0;
+}
+
+static void vectorArrayReleaseBuffer(PyObject *, Py_buffer *view) {
+    delete[] static_cast<Py_ssize_t *>(view->internal);
+}
+
+static PyType_Slot vectorArraySlots[] = {
+    {Py_bf_getbuffer, reinterpret_cast<void *>(vectorArrayGetBuffer)},
+    {Py_bf_releasebuffer, reinterpret_cast<void *>(vectorArrayReleaseBuffer)},
+    {0, nullptr}};
+
 void exportGeometryModule(nb::module_ &m) {
     // Math functions
     m.def("epsilonTest", &math::epsilonTest, "value"_a, "test"_a = 0.0f,
           "eps"_a = 0.000001f, "Floating-point equality test");
+    // VectorArray overloads come first so arrays are never converted
+    // element by element as sequences
+    m.def(
+        "pointInPoly",
+        [](const Vector &point, const VectorArray &poly) {
+            return math::pointInPoly(point, poly.vectors());
+        },
+        "point"_a, "poly"_a);
     m.def("pointInPoly", &math::pointInPoly);
     m.def("interpolateBezier", &math::interpolateBezier);
     m.def("interpolateCatmullRom", &math::interpolateCatmullRom);
@@ -37,7 +175,89 @@ void exportGeometryModule(nb::module_ &m) {
     m.def("solveCubic", &math::solveCubic);
     m.def("fit", &math::fit);
     m.def("getBarycentric", &math::getBarycentric);
+    m.def(
+        "sortedVectorArray",
+        [](const VectorArray &v, int axis) {
+            return VectorArray(sortedVectorArray(v.vectors(), axis));
+        },
+        "v"_a, "axis"_a);
     m.def("sortedVectorArray", &sortedVectorArray);
+    m.def(
+        "rangeBounds",
+        [](InArray points, IndexArray offsets,
+           std::optional<IndexArray> indices, unsigned threads) {
+            if (offsets.shape(0) == 0)
+                throw std::invalid_argument("offsets must not be empty");
+            const size_t rows = points.shape(0);
+            const size_t ranges = offsets.shape(0) - 1;
+            const uint32_t *off = offsets.data();
+            const uint32_t *idx = indices ? indices->data() : nullptr;
+            const size_t entries = indices ? indices->shape(0) : rows;
+            for (size_t r = 0; r < ranges; r++)
+                if (off[r] > off[r + 1])
+                    throw std::invalid_argument(
+                        "offsets must be non-decreasing");
+            if (off[ranges] > entries)
+                throw std::invalid_argument("offsets run past the end");
+            for (size_t i = off[0]; idx && i < off[ranges]; i++)
+                if (idx[i] >= rows)
+                    throw std::invalid_argument("point index out of range");
+            float *data = nullptr;
+            size_t shape[3] = {ranges, 2, 3};
+            nb::object result = newArray(3, shape, data);
+            nb::gil_scoped_release release;
+            static Counter &counter = namedCounter("rangeBounds");
+            CounterScope scope(counter, ranges);
+            rangeBounds(points.data(), off, ranges, idx, data, threads);
+            return result;
+        },
+        "points"_a, "offsets"_a, "indices"_a = nb::none(), "threads"_a = 1,
+        "Bounds of point ranges given CSR-style: range r covers "
+        "offsets[r]:offsets[r + 1] of indices, or of points if indices is "
+        "None. Returns a float32 (ranges, 2, 3) array of (min, max); empty "
+        "ranges get (inf, -inf). threads=0 uses every core.");
+
+    // VectorArray
+    nb::class_<VectorArray>(
+        m, "VectorArray", nb::type_slots(vectorArraySlots),
+        "Fixed-size array of Vectors in one float32 (N, 3) buffer. Supports "
+        "the buffer protocol, so numpy.asarray() views it without copying.")
+        .def(nb::init<>())
+        .def(nb::init<size_t>(), "count"_a, "Array of count zero vectors.")
+        .def(
+            "__init__",
+            [](VectorArray *self, PointArray points) {
+                size_t count = points.shape(0);
+                new (self) VectorArray(count);
+                auto view = points.view();
+                for (size_t i = 0; i < count; ++i)
+                    (*self)[i] = Vector(view(i, 0), view(i, 1), view(i, 2));
+            },
+            "points"_a, "Copy an (N, 3) float32 array.")
+        .def(nb::init<std::vector<Vector>>(), "vectors"_a,
+             "Copy a list of Vector.")
+        .def("__len__", &VectorArray::size)
+        .def("__getitem__",
+             [](const VectorArray &a, Py_ssize_t index) {
+                 return a[checkIndex(a, index)];
+             })
+        .def("__setitem__",
+             [](VectorArray &a, Py_ssize_t index, const Vector &v) {
+                 a[checkIndex(a, index)] = v;
+             })
+        .def(
+            "__iter__",
+            [](const VectorArray &a) {
+                return nb::make_iterator(nb::type<VectorArray>(), "iterator",
+                                         a.vectors().begin(),
+                                         a.vectors().end());
+            },
+            nb::keep_alive<0, 1>())
+        .def("__repr__",
+             [](const VectorArray &a) {
+                 return "VectorArray(size=" + std::to_string(a.size()) + ")";
+             })
+        .def("toList", &VectorArray::vectors, "Return a list of Vector.");
 
     // Vector
     nb::class_<Vector>(m, "Vector")
@@ -88,21 +308,206 @@ void exportGeometryModule(nb::module_ &m) {
         .def("pointPlaneSide", &Ray::pointPlaneSide)
         .def("pointDistance", &Ray::pointDistance)
         .def("intersectRayLine", &Ray::intersectRayLine)
+        .def("segmentPlaneHit", &Ray::segmentPlaneHit, "segment0"_a,
+             "segment1"_a)
+        .def(
+            "triangleRayHit",
+            [](const Ray &r, const Vector &v0, const Vector &v1,
+               const Vector &v2) {
+                const Vector triangle[3] = {v0, v1, v2};
+                return r.triangleRayHit(triangle);
+            },
+            "v0"_a, "v1"_a, "v2"_a,
+            "Two-sided hit with a triangle as Vector(u, v, t), where "
+            "origin + t * direction is the hit point; Vector() on a miss")
         .def_prop_ro("origin", [](const Ray &r) { return r.origin; })
         .def_prop_ro("direction", [](const Ray &r) { return r.direction; });
 
+    // Bvh
+    const float inf = std::numeric_limits<float>::infinity();
+    nb::class_<Bvh>(
+        m, "Bvh",
+        "Bounding volume hierarchy over the triangles of a polygon mesh for "
+        "batched ray and closest-point queries. Faces are CSR-style: face f "
+        "is indices[offsets[f]:offsets[f + 1]], fan-triangulated.")
+        .def(
+            "__init__",
+            [](Bvh *self, InArray positions, IndexArray offsets,
+               IndexArray indices) {
+                new (self) Bvh(makeBvh(positions, offsets, indices));
+            },
+            "positions"_a, "offsets"_a, "indices"_a)
+        .def_prop_ro("node_count",
+                     [](const Bvh &b) { return b.nodes().size(); })
+        .def_prop_ro("triangle_count", &Bvh::triangleCount)
+        .def(
+            "raycast",
+            [](const Bvh &b, InArray origins, InArray directions,
+               float maxDistance, float minDistance, unsigned threads) {
+                checkRays(origins, directions);
+                const size_t rows = origins.shape(0);
+                const size_t shape[2] = {rows, 3};
+                float *distances, *points, *normals;
+                int32_t *faces;
+                nb::object d = newArray(1, shape, distances);
+                nb::object f = newArray(1, shape, faces);
+                nb::object p = newArray(2, shape, points);
+                nb::object n = newArray(2, shape, normals);
+                {
+                    nb::gil_scoped_release release;
+                    static Counter &counter = namedCounter("Bvh.raycast");
+                    CounterScope scope(counter, rows);
+                    b.intersect(origins.data(), directions.data(), rows,
+                                minDistance, maxDistance, distances, faces,
+                                points, normals, threads);
+                }
+                return nb::make_tuple(d, f, p, n);
+            },
+            "origins"_a, "directions"_a, "max_distance"_a = inf,
+            "min_distance"_a = 0.0f, "threads"_a = 1,
+            "Closest hit per ray, either triangle side, with t in "
+            "[min_distance, max_distance]. Returns (t, face, point, normal): "
+            "t is in units of the direction length and inf on a miss, face "
+            "is -1 and point and the unit triangle normal are NaN on a miss. "
+            "threads=0 uses every core.")
+        .def(
+            "occluded",
+            [](const Bvh &b, InArray origins, InArray directions,
+               float maxDistance, float minDistance, unsigned threads) {
+                checkRays(origins, directions);
+                const size_t rows = origins.shape(0);
+                bool *data;
+                nb::object result = newArray(1, &rows, data);
+                static_assert(sizeof(bool) == sizeof(uint8_t));
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("Bvh.occluded");
+                CounterScope scope(counter, rows);
+                b.occluded(origins.data(), directions.data(), rows, minDistance,
+                           maxDistance, reinterpret_cast<uint8_t *>(data),
+                           threads);
+                return result;
+            },
+            "origins"_a, "directions"_a, "max_distance"_a = inf,
+            "min_distance"_a = 0.0f, "threads"_a = 1,
+            "Whether each ray hits anything with t in [min_distance, "
+            "max_distance]; stops at the first hit found, so it is cheaper "
+            "than raycast. Returns a bool array.")
+        .def(
+            "closestPoint",
+            [](const Bvh &b, InArray points, float maxDistance,
+               unsigned threads) {
+                const size_t rows = points.shape(0);
+                const size_t shape[2] = {rows, 3};
+                float *closest, *distances;
+                int32_t *faces;
+                nb::object c = newArray(2, shape, closest);
+                nb::object f = newArray(1, shape, faces);
+                nb::object d = newArray(1, shape, distances);
+                {
+                    nb::gil_scoped_release release;
+                    static Counter &counter = namedCounter("Bvh.closestPoint");
+                    CounterScope scope(counter, rows);
+                    b.closestPoints(points.data(), rows, maxDistance, closest,
+                                    faces, distances, threads);
+                }
+                return nb::make_tuple(c, f, d);
+            },
+            "points"_a, "max_distance"_a = inf, "threads"_a = 1,
+            "Closest surface point per query within max_distance. Returns "
+            "(point, face, distance); NaN, -1 and inf where nothing is in "
+            "range.");
+
     // Polygon
     nb::class_<Polygon>(m, "Polygon")
+        .def(
+            "__init__",
+            [](Polygon *self, const VectorArray &points,
+               const std::vector<int> &indices, const Vector &normal) {
+                new (self) Polygon(points.vectors(), indices, normal);
+            },
+            "points"_a, "indices"_a, "normal"_a)
         .def(nb::init<const std::vector<Vector> &, std::vector<int>, Vector>())
         .def("triangulate", &Polygon::triangulate);
+    m.def(
+        "triangulatePolygons",
+        [](InArray points, IndexArray offsets, IndexArray indices,
+           unsigned threads) {
+            const size_t polygons = checkFaces(points, offsets, indices);
+            uint32_t *data = nullptr;
+            size_t shape[2] = {triangulatedCount(offsets.data(), polygons), 3};
+            nb::object result = newArray(2, shape, data);
+            nb::gil_scoped_release release;
+            static Counter &counter = namedCounter("triangulatePolygons");
+            CounterScope scope(counter, polygons);
+            triangulatePolygons(points.data(), offsets.data(), indices.data(),
+                                polygons, data, threads);
+            return result;
+        },
+        "points"_a, "offsets"_a, "indices"_a, "threads"_a = 1,
+        "Ear-clip CSR polygons (polygon f is indices[offsets[f]:offsets[f + "
+        "1]]) into a uint32 (M, 3) array of vertex ids. Polygon f gives "
+        "max(n - 2, 0) triangles in order, wound like the polygon.");
 
     // BBox
     nb::class_<Bbox>(m, "BBox")
         .def(nb::init<>())
         .def(nb::init<Vector, Vector>())
         .def(nb::init<Vector, Vector, Vector>())
-        .def("fromPointSet", &Bbox::fromPointSet)
-        .def("obbFromPointSet", &Bbox::obbFromPointSet)
+        .def(
+            "fromPointSet",
+            [](Bbox &b, const VectorArray &points, unsigned threads) {
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("BBox.fromPointSet");
+                CounterScope scope(counter, points.size());
+                b.fromPointSet(points.data(), points.size(), threads);
+            },
+            "pointset"_a, "threads"_a = 1)
+        .def(
+            "fromPointSet",
+            [](Bbox &b, InArray points, unsigned threads) {
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("BBox.fromPointSet");
+                CounterScope scope(counter, points.shape(0));
+                b.fromPointSet(points.data(), points.shape(0), threads);
+            },
+            "pointset"_a, "threads"_a = 1,
+            "Axis-aligned bounds in one min/max pass; threads=0 uses every "
+            "core.")
+        .def(
+            "fromPointSet",
+            [](Bbox &b, const std::vector<Vector> &points, unsigned threads) {
+                static Counter &counter = namedCounter("BBox.fromPointSet");
+                CounterScope scope(counter, points.size());
+                b.fromPointSet(points, threads);
+            },
+            "pointset"_a, "threads"_a = 1)
+        .def(
+            "obbFromPointSet",
+            [](Bbox &b, const VectorArray &points) {
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("BBox.obbFromPointSet");
+                CounterScope scope(counter, points.size());
+                b.obbFromPointSet(points.data(), points.size());
+            },
+            "pointset"_a)
+        .def(
+            "obbFromPointSet",
+            [](Bbox &b, InArray points) {
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("BBox.obbFromPointSet");
+                CounterScope scope(counter, points.shape(0));
+                b.obbFromPointSet(points.data(), points.shape(0));
+            },
+            "pointset"_a,
+            "Oriented bounds along the principal axes (one covariance pass "
+            "and a double-precision eigen-solve); axis[0] has the largest "
+            "variance.")
+        .def(
+            "obbFromPointSet",
+            [](Bbox &b, const std::vector<Vector> &points) {
+                b.obbFromPointSet(points);
+            },
+            "pointset"_a)
         .def("calcCenter", &Bbox::calcCenter)
         .def("__getitem__", &getitem<Vector, Bbox>)
         .def_prop_ro("axis", &bboxAxis)
@@ -140,6 +545,41 @@ void exportGeometryModule(nb::module_ &m) {
         .def("getEuler", &Transform::getEuler)
         .def("getTranslate", &Transform::getTranslate)
         .def("__str__", &Transform::toString)
+        .def(
+            "applyToArray",
+            [](const Transform &t, InArray points, nb::object out) {
+                float *data = nullptr;
+                nb::object result = outputArray(out, points.shape(0), data);
+                nb::gil_scoped_release release;
+                static Counter &counter =
+                    namedCounter("Transform.applyToArray");
+                CounterScope scope(counter, points.shape(0));
+                t.applyToArray(points.data(), data, points.shape(0));
+                return result;
+            },
+            "points"_a, "out"_a = nb::none(),
+            "Transform an (N, 3) float32 point array. Writes into out (which "
+            "may be points itself) or returns a new array.")
+        .def(
+            "applyToNormals",
+            [](const Transform &t, InArray normals, nb::object out,
+               bool normalize) {
+                float *data = nullptr;
+                nb::object result = outputArray(out, normals.shape(0), data);
+                nb::gil_scoped_release release;
+                static Counter &counter =
+                    namedCounter("Transform.applyToNormals");
+                CounterScope scope(counter, normals.shape(0));
+                t.applyToNormals(normals.data(), data, normals.shape(0),
+                                 normalize);
+                return result;
+            },
+            "normals"_a, "out"_a = nb::none(), "normalize"_a = true,
+            "Transform an (N, 3) float32 normal array by the inverse-transpose "
+            "of the 3x3 part; see applyToArray for out.")
+        .def_static("fuse", &Transform::fuse, "chain"_a,
+                    "Fuse transforms, listed in the order they apply to a "
+                    "point, into one matrix.")
         .def(nb::self *= nb::self)
         .def(nb::self * nb::self)
         .def_prop_ro("m", [](const Transform &t) {
@@ -157,4 +597,7 @@ void exportGeometryModule(nb::module_ &m) {
 } // namespace Geometry
 } // namespace meshTools
 
-NB_MODULE(_geometry, m) { meshTools::Geometry::exportGeometryModule(m); }
+NB_MODULE(_geometry, m) {
+    meshTools::Geometry::exportGeometryModule(m);
+    meshTools::exportCounters(m);
+}
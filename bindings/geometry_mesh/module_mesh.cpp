@@ -1,23 +1,255 @@
 #include <cstddef>
 #include <cstdint>
+#include <string>
+#include <utility>
 
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/tuple.h>
 #include <nanobind/stl/vector.h>
 
+#include <geometry/counters.h>
 #include <mesh/mesh.h>
+#include <mesh/mesh_io.h>
+
+#include "export_counters.h"
 
 namespace nb = nanobind;
+using namespace nb::literals;
 
 using namespace meshTools::Mesh;
 
+using PositionArray =
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu>;
+using IndexArray =
+    nb::ndarray<const uint32_t, nb::ndim<1>, nb::c_contig, nb::device::cpu>;
+
+static Mesh meshFromNdarrays(PositionArray positions, IndexArray faceCounts,
+                             IndexArray faceIndices) {
+    static meshTools::Geometry::Counter &counter =
+        meshTools::Geometry::namedCounter("Mesh.fromArrays");
+    meshTools::Geometry::CounterScope scope(counter, faceCounts.shape(0));
+    return Mesh::fromArrays(positions.data(), positions.shape(0),
+                            faceCounts.data(), faceCounts.shape(0),
+                            faceIndices.data(), faceIndices.shape(0));
+}
+
+static Mesh meshFromLists(const std::vector<Vector> &positions,
+                          const std::vector<uint32_t> &faceCounts,
+                          const std::vector<uint32_t> &faceIndices) {
+    std::vector<float> flat;
+    flat.reserve(positions.size() * 3);
+    for (const Vector &p : positions) {
+        flat.push_back(p.x);
+        flat.push_back(p.y);
+        flat.push_back(p.z);
+    }
+    return Mesh::fromArrays(flat.data(), positions.size(), faceCounts.data(),
+                            faceCounts.size(), faceIndices.data(),
+                            faceIndices.size());
+}
+
+/** @brief Move a flat buffer into a new (size / columns, columns) numpy
+ * array without copying; columns 0 gives a 1-D array */
+template <class T>
+static nb::ndarray<nb::numpy, T> takeArray(std::vector<T> &values,
+                                           size_t columns = 0) {
+    auto *owned = new std::vector<T>(std::move(values));
+    values = std::vector<T>();
+    nb::capsule owner(owned, [](void *p) noexcept {
+        delete static_cast<std::vector<T> *>(p);
+    });
+    size_t shape[2] = {columns ? owned->size() / columns : owned->size(),
+                       columns};
+    return nb::ndarray<nb::numpy, T>(owned->data(), columns ? 2 : 1, shape,
+                                     owner);
+}
+
+using ValueArray =
+    nb::ndarray<const double, nb::ndim<1>, nb::c_contig, nb::device::cpu>;
+
+static void exportMeshIo(nb::module_ &m) {
+    nb::class_<ObjReader>(m, "ObjReader",
+                          "Chunked Wavefront OBJ parser (v, vt and f "
+                          "statements); feed() whole lines, take() arrays")
+        .def(nb::init<bool>(), "topology_only"_a = false)
+        .def(
+            "feed",
+            [](ObjReader &reader, nb::bytes data) {
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("ObjReader.feed");
+                CounterScope scope(counter, data.size());
+                reader.feed(data.c_str(), data.size());
+            },
+            "data"_a,
+            "Parse whole lines; the last line may lack its newline. Raises "
+            "ValueError on a malformed v, vt or f statement.")
+        .def(
+            "take",
+            [](ObjReader &reader) {
+                auto result = nb::make_tuple(
+                    takeArray(reader.positions, 3), takeArray(reader.uvs, 3),
+                    takeArray(reader.faceCounts), takeArray(reader.faceIndices),
+                    takeArray(reader.faceUvIndices));
+                reader.clear();
+                return result;
+            },
+            "Move out what was parsed since the last take(): positions "
+            "(N, 3), uvs (U, 3), face_counts, face_indices and "
+            "face_uv_indices (-1 for corners without a UV).")
+        .def_ro("vertex_total", &ObjReader::vertexTotal)
+        .def_ro("uv_total", &ObjReader::uvTotal)
+        .def_ro("line", &ObjReader::line);
+
+    m.def(
+        "parseNumbers",
+        [](nb::bytes data) {
+            std::vector<double> values;
+            {
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("parseNumbers");
+                CounterScope scope(counter, data.size());
+                parseNumbers(data.c_str(), data.size(), values);
+            }
+            return takeArray(values);
+        },
+        "data"_a,
+        "Parse whitespace-separated ASCII numbers into a float64 array.");
+
+    m.def(
+        "decodeTextLists",
+        [](ValueArray values, size_t before, size_t after, size_t maxRows) {
+            std::vector<uint32_t> counts;
+            std::vector<int32_t> indices;
+            size_t used;
+            {
+                nb::gil_scoped_release release;
+                used = decodeTextLists(values.data(), values.shape(0), before,
+                                       after, maxRows, counts, indices);
+            }
+            return nb::make_tuple(takeArray(counts), takeArray(indices), used);
+        },
+        "values"_a, "before"_a, "after"_a, "max_rows"_a,
+        "Decode ASCII PLY list rows (before values, count, ids, after "
+        "values); returns (counts, indices, values consumed).");
+
+    m.def(
+        "decodeBinaryLists",
+        [](nb::bytes data, const std::string &countType,
+           const std::string &indexType, size_t before, size_t after,
+           bool bigEndian, size_t maxRows) {
+            const PlyType count = plyType(countType);
+            const PlyType index = plyType(indexType);
+            std::vector<uint32_t> counts;
+            std::vector<int32_t> indices;
+            size_t used;
+            {
+                nb::gil_scoped_release release;
+                static Counter &counter = namedCounter("decodeBinaryLists");
+                CounterScope scope(counter, data.size());
+                used = decodeBinaryLists(
+                    reinterpret_cast<const uint8_t *>(data.c_str()),
+                    data.size(), count, index, before, after, bigEndian,
+                    maxRows, counts, indices);
+            }
+            return nb::make_tuple(takeArray(counts), takeArray(indices), used);
+        },
+        "data"_a, "count_type"_a, "index_type"_a, "before"_a, "after"_a,
+        "big_endian"_a, "max_rows"_a,
+        "Decode binary PLY list rows (before bytes, count, ids, after "
+        "bytes); returns (counts, indices, bytes consumed).");
+}
+
 void exportMeshModule(nb::module_ &m) {
     nb::class_<Vert>(m, "Vert")
         .def(nb::init<>())
+        .def_ro("id", &Vert::id)
+        .def_ro("v", &Vert::v)
         .def("computeNormal", &Vert::computeNormal);
 
+    nb::class_<Edge>(m, "Edge").def_ro("id", &Edge::id);
+
+    nb::class_<Face>(m, "Face")
+        .def_ro("id", &Face::id)
+        .def_ro("normal", &Face::normal);
+
     nb::class_<Mesh>(m, "Mesh")
         .def(nb::init<>())
-        .def_prop_ro("verts", [](const Mesh &mesh) { return mesh.verts; });
+        .def_static("fromArrays", &meshFromNdarrays, "positions"_a,
+                    "face_counts"_a, "face_indices"_a,
+                    "Build a mesh and its half-edge index from flat buffers")
+        .def_static("fromArrays", &meshFromLists, "positions"_a,
+                    "face_counts"_a, "face_indices"_a)
+        .def_prop_ro(
+            "verts", [](const Mesh &mesh) { return mesh.verts; },
+            nb::rv_policy::reference_internal)
+        .def_prop_ro(
+            "edges", [](const Mesh &mesh) { return mesh.edges; },
+            nb::rv_policy::reference_internal)
+        .def_prop_ro(
+            "faces", [](const Mesh &mesh) { return mesh.faces; },
+            nb::rv_policy::reference_internal)
+        .def_prop_ro("vertexCount",
+                     [](const Mesh &mesh) { return mesh.verts.size(); })
+        .def_prop_ro("edgeCount",
+                     [](const Mesh &mesh) { return mesh.edges.size(); })
+        .def_prop_ro("faceCount",
+                     [](const Mesh &mesh) { return mesh.faces.size(); })
+        .def_prop_ro("halfEdgeCount",
+                     [](const Mesh &mesh) { return mesh.halfEdges.size(); })
+        .def("findEdge", &Mesh::findEdge, "v0"_a, "v1"_a)
+        .def("findHalfEdge", &Mesh::findHalfEdge, "from_vert"_a, "to_vert"_a)
+        .def(
+            "opposite",
+            [](const Mesh &mesh, uint32_t h) {
+                return mesh.halfEdges.at(h).opposite;
+            },
+            "half_edge"_a)
+        .def(
+            "next",
+            [](const Mesh &mesh, uint32_t h) {
+                return mesh.halfEdges.at(h).next;
+            },
+            "half_edge"_a)
+        .def(
+            "prev",
+            [](const Mesh &mesh, uint32_t h) {
+                return mesh.halfEdges.at(h).prev;
+            },
+            "half_edge"_a)
+        .def(
+            "origin",
+            [](const Mesh &mesh, uint32_t h) {
+                return mesh.halfEdges.at(h).vert;
+            },
+            "half_edge"_a)
+        .def(
+            "halfEdgeFace",
+            [](const Mesh &mesh, uint32_t h) {
+                return mesh.halfEdges.at(h).face;
+            },
+            "half_edge"_a)
+        .def(
+            "halfEdgeEdge",
+            [](const Mesh &mesh, uint32_t h) {
+                return mesh.halfEdges.at(h).edge;
+            },
+            "half_edge"_a)
+        .def("vertexNeighbors", &Mesh::vertexNeighbors, "vert"_a)
+        .def("oneRing", &Mesh::oneRing, "vert"_a)
+        .def("faceNeighbors", &Mesh::faceNeighbors, "vert"_a, "faces"_a)
+        .def("vertexFaces", &Mesh::vertexFaces, "vert"_a)
+        .def("edgeFaces", &Mesh::edgeFaces, "edge"_a)
+        .def("faceEdges", &Mesh::faceEdges, "face"_a)
+        .def("edgeVerts", &Mesh::edgeVerts, "edge"_a)
+        .def("isBoundaryEdge", &Mesh::isBoundaryEdge, "edge"_a)
+        .def("isBoundaryVertex", &Mesh::isBoundaryVertex, "vert"_a)
+        .def("boundaryEdges", &Mesh::boundaryEdges);
 }
 
-NB_MODULE(_mesh, m) { exportMeshModule(m); }
+NB_MODULE(_mesh, m) {
+    exportMeshModule(m);
+    exportMeshIo(m);
+    meshTools::exportCounters(m);
+}
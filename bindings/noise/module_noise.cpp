@@ -1,16 +1,109 @@
+#include <cstddef>
+#include <stdexcept>
+
+#include <geometry/counters.h>
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <noise/noise.h>
 
+#include "export_counters.h"
+
 namespace nb = nanobind;
 using namespace nb::literals;
 
 namespace meshTools {
 namespace Noise {
 
+using PointArray =
+    nb::ndarray<const float, nb::ndim<2>, nb::c_contig, nb::device::cpu>;
+using OutArray = nb::ndarray<float, nb::c_contig, nb::device::cpu>;
+
+/**
+ * @brief Return out as a float32 buffer of size elements, or a new NumPy
+ * array of shape (rows) / (rows, cols) if out is None.
+ */
+static nb::object outputArray(nb::object out, size_t rows, size_t cols,
+                              float *&data) {
+    if (!out.is_none()) {
+        OutArray array;
+        if (!nb::try_cast(out, array, false))
+            throw nb::type_error("out must be a contiguous float32 array");
+        if (array.size() != rows * cols)
+            throw std::invalid_argument("out has the wrong number of elements");
+        data = array.data();
+        return out;
+    }
+    data = new float[rows * cols];
+    nb::capsule owner(data, [](void *p) noexcept { delete[] (float *)p; });
+    size_t shape[2] = {rows, cols};
+    return nb::cast(
+        nb::ndarray<nb::numpy, float>(data, cols == 1 ? 1 : 2, shape, owner));
+}
+
+static void checkColumns(const PointArray &points, size_t cols) {
+    if (points.shape(1) != cols)
+        throw std::invalid_argument("points must have shape (N, 3)");
+}
+
+/** Run fn over the points with the GIL released, counted in counter. */
+template <typename Fn>
+static nb::object batch(Geometry::Counter &counter, const PointArray &points,
+                        nb::object out, size_t outCols, Fn fn) {
+    float *data = nullptr;
+    nb::object result = outputArray(out, points.shape(0), outCols, data);
+    {
+        nb::gil_scoped_release release;
+        Geometry::CounterScope scope(counter, points.shape(0));
+        fn(points.data(), points.shape(0), data);
+    }
+    return result;
+}
+
+using GridArray =
+    nb::ndarray<const float, nb::ndim<4>, nb::c_contig, nb::device::cpu>;
+
 void exportNoiseModule(nb::module_ &m) {
+    m.def(
+        "sampleGrid",
+        [](GridArray grid, PointArray points, float period, bool cubic,
+           nb::object out, unsigned threads) {
+            const size_t resolution = grid.shape(0);
+            if (grid.shape(1) != resolution || grid.shape(2) != resolution)
+                throw std::invalid_argument(
+                    "grid must have shape (R, R, R, channels)");
+            checkColumns(points, 3);
+            const size_t channels = grid.shape(3);
+            static Geometry::Counter &counter =
+                Geometry::namedCounter("sampleGrid");
+            return batch(counter, points, out, channels,
+                         [&](const float *p, size_t count, float *o) {
+                             sampleGrid(grid.data(), resolution, channels,
+                                        period, p, count, cubic, o, threads);
+                         });
+        },
+        "grid"_a, "points"_a, "period"_a, "cubic"_a = false,
+        "out"_a = nb::none(), "threads"_a = 0,
+        "Trilinear (or Catmull-Rom, cubic=True) lookups of (N, 3) float32 "
+        "points in a periodic (R, R, R, C) float32 grid covering [0, "
+        "period)^3");
+
     nb::class_<Noise>(m, "Noise",
                       "Procedural Simplex-style noise generator (2D, 3D, 4D).")
         .def(nb::init<>())
+        .def_ro_static("packet_size", &Noise::kPacketSize,
+                       "Points evaluated together by the SIMD packet kernels")
+        .def_static("simd", &Noise::simd,
+                    "Whether the packet kernels run on AVX2")
+        .def_static("setSimd", &Noise::setSimd, "enable"_a,
+                    "Turn the AVX2 packet path on or off (process wide); "
+                    "returns whether it is now in use")
+        .def("setThreads", &Noise::setThreads, "threads"_a = 0,
+             "Keep a pool of worker threads (0: hardware concurrency) that "
+             "the *Array methods use when called with threads=0")
+        .def("clearThreads", &Noise::clearThreads,
+             "Drop the worker pool; *Array methods start threads per call")
+        .def_prop_ro("threads", &Noise::threads,
+                     "Worker pool size, or 0 without a pool")
         .def("snoise",
              nb::overload_cast<float, float>(&Noise::snoise, nb::const_), "x"_a,
              "y"_a)
@@ -83,10 +176,103 @@ void exportNoiseModule(nb::module_ &m) {
                 L.append(oz);
                 return L;
             },
-            "x"_a, "y"_a, "z"_a, "octaves"_a, "lacunarity"_a, "gain"_a);
+            "x"_a, "y"_a, "z"_a, "octaves"_a, "lacunarity"_a, "gain"_a)
+        .def(
+            "snoiseArray",
+            [](const Noise &n, PointArray points, nb::object out,
+               unsigned threads) {
+                int dims = static_cast<int>(points.shape(1));
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Noise.snoiseArray");
+                return batch(counter, points, out, 1,
+                             [&](const float *p, size_t count, float *o) {
+                                 n.snoiseArray(p, count, dims, o, threads);
+                             });
+            },
+            "points"_a, "out"_a = nb::none(), "threads"_a = 0,
+            "Scalar noise of (N, 2/3/4) float32 points into an (N,) array")
+        .def(
+            "vsnoiseArray",
+            [](const Noise &n, PointArray points, nb::object out,
+               unsigned threads) {
+                int dims = static_cast<int>(points.shape(1));
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Noise.vsnoiseArray");
+                return batch(counter, points, out, points.shape(1),
+                             [&](const float *p, size_t count, float *o) {
+                                 n.vsnoiseArray(p, count, dims, o, threads);
+                             });
+            },
+            "points"_a, "out"_a = nb::none(), "threads"_a = 0,
+            "Vector noise of (N, 2/3/4) float32 points into an (N, D) array")
+        .def(
+            "fBmArray",
+            [](const Noise &n, PointArray points, int octaves, float lacunarity,
+               float gain, nb::object out, unsigned threads) {
+                checkColumns(points, 3);
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Noise.fBmArray");
+                return batch(counter, points, out, 1,
+                             [&](const float *p, size_t count, float *o) {
+                                 n.fBmArray(p, count, octaves, lacunarity, gain,
+                                            o, threads);
+                             });
+            },
+            "points"_a, "octaves"_a, "lacunarity"_a, "gain"_a,
+            "out"_a = nb::none(), "threads"_a = 0)
+        .def(
+            "turbulenceArray",
+            [](const Noise &n, PointArray points, int octaves, float lacunarity,
+               float gain, nb::object out, unsigned threads) {
+                checkColumns(points, 3);
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Noise.turbulenceArray");
+                return batch(counter, points, out, 1,
+                             [&](const float *p, size_t count, float *o) {
+                                 n.turbulenceArray(p, count, octaves,
+                                                   lacunarity, gain, o,
+                                                   threads);
+                             });
+            },
+            "points"_a, "octaves"_a, "lacunarity"_a, "gain"_a,
+            "out"_a = nb::none(), "threads"_a = 0)
+        .def(
+            "vfBmArray",
+            [](const Noise &n, PointArray points, int octaves, float lacunarity,
+               float gain, nb::object out, unsigned threads) {
+                checkColumns(points, 3);
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Noise.vfBmArray");
+                return batch(counter, points, out, 3,
+                             [&](const float *p, size_t count, float *o) {
+                                 n.vfBmArray(p, count, octaves, lacunarity,
+                                             gain, o, threads);
+                             });
+            },
+            "points"_a, "octaves"_a, "lacunarity"_a, "gain"_a,
+            "out"_a = nb::none(), "threads"_a = 0)
+        .def(
+            "vturbulenceArray",
+            [](const Noise &n, PointArray points, int octaves, float lacunarity,
+               float gain, nb::object out, unsigned threads) {
+                checkColumns(points, 3);
+                static Geometry::Counter &counter =
+                    Geometry::namedCounter("Noise.vturbulenceArray");
+                return batch(counter, points, out, 3,
+                             [&](const float *p, size_t count, float *o) {
+                                 n.vturbulenceArray(p, count, octaves,
+                                                    lacunarity, gain, o,
+                                                    threads);
+                             });
+            },
+            "points"_a, "octaves"_a, "lacunarity"_a, "gain"_a,
+            "out"_a = nb::none(), "threads"_a = 0);
 }
 
 } // namespace Noise
 } // namespace meshTools
 
-NB_MODULE(_noise, m) { meshTools::Noise::exportNoiseModule(m); }
+NB_MODULE(_noise, m) {
+    meshTools::Noise::exportNoiseModule(m);
+    meshTools::exportCounters(m);
+}
@@ -1,5 +1,7 @@
 """meshTools: 3D mesh geometry library with C++ bindings and pure-Python layer."""
 
+import importlib
+
 # Expose C extension modules for code that uses them directly (e.g. meshTools._mesh).
 # Prefer package-internal (pip install); fall back to top-level (dev with build on path).
 try:
@@ -10,25 +12,12 @@ except ImportError:
     except ImportError:
         _geometry = None  # type: ignore[assignment]
 
-try:
-    from . import _mesh
-except ImportError:
-    try:
-        import _mesh
-    except ImportError:
-        _mesh = None  # type: ignore[assignment]
-
-try:
-    from . import _bezier
-except ImportError:
-    try:
-        import _bezier
-    except ImportError:
-        _bezier = None  # type: ignore[assignment]
-
-# Re-export common public API from geometry and mesh
+# Re-export common public API from geometry and mesh. geometry is eager and
+# cheap; everything that pulls in NumPy or the noise, hull and Delaunay
+# fallbacks loads on first attribute access (see __getattr__ below).
 from .geometry import (
     BBox,
+    Bvh,
     EPSILON,
     OBBox,
     Point,
@@ -36,6 +25,7 @@ from .geometry import (
     Ray,
     Transform,
     Vector,
+    VectorArray,
     epsilonTest,
     fit,
     getBarycentric,
@@ -43,10 +33,76 @@ from .geometry import (
     interpolateCatmullRom,
     lerp,
     pointInPoly,
+    rangeBounds,
     solveCubic,
     sortedVectorArray,
+    triangulatePolygons,
+)
+
+# Lazily resolved public names: name -> submodule that defines it
+_LAZY_ATTRS = {
+    "ArrayMesh": "array_mesh",
+    "MeshBuffers": "buffers",
+    "Mesh": "mesh",
+    "kGeotype": "mesh",
+    "kResult": "mesh",
+}
+
+# Optional C++ extensions other than _geometry (None if not built)
+_LAZY_EXTENSIONS = ("_mesh", "_bezier")
+
+_SUBMODULES = (
+    "array_mesh",
+    "buffers",
+    "chull",
+    "clip",
+    "delaunay",
+    "formats",
+    "geometry",
+    "laplacian",
+    "lists",
+    "mesh",
+    "meshfile",
+    "noise",
+    "noise_volume",
+    "noise_tabs",
+    "normals",
+    "profiling",
+    "selection",
+    "triangulate",
 )
-from .mesh import Mesh, kGeotype, kResult
+
+
+def _importExtension(name: str):
+    """Import a C++ extension from the package or, in a dev build, from
+    the top level; None if it is not built."""
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ImportError:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            return None
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_EXTENSIONS:
+        value = _importExtension(name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache, so __getattr__ runs once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
+
 
 __all__ = [
     # C extensions (may be None if not built)
@@ -55,6 +111,7 @@ __all__ = [
     "_bezier",
     # Geometry
     "BBox",
+    "Bvh",
     "EPSILON",
     "OBBox",
     "Point",
@@ -62,6 +119,7 @@ __all__ = [
     "Ray",
     "Transform",
     "Vector",
+    "VectorArray",
     "epsilonTest",
     "fit",
     "getBarycentric",
@@ -69,10 +127,15 @@ __all__ = [
     "interpolateCatmullRom",
     "lerp",
     "pointInPoly",
+    "rangeBounds",
     "solveCubic",
     "sortedVectorArray",
+    "triangulatePolygons",
     # Mesh
     "Mesh",
     "kGeotype",
     "kResult",
+    # Array-backed mesh storage (requires numpy)
+    "ArrayMesh",
+    "MeshBuffers",
 ]
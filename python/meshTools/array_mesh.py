@@ -0,0 +1,343 @@
+"""Mesh subclass storing geometry in contiguous arrays.
+
+ArrayMesh keeps positions in a float32 (N, 3) array and faces in CSR form
+(see meshTools.buffers). mesh.vertices and mesh.faces are list-like views,
+so the existing Mesh operations run unchanged, while new code can work on
+mesh.buffers arrays directly.
+"""
+
+from .buffers import (
+    FaceView,
+    MeshBuffers,
+    VertexView,
+    _positionsOf,
+    np,
+    requireNumpy,
+)
+from .geometry import Vector
+from .mesh import Mesh, _faceCount, _mesh
+from .profiling import profiled
+from .selection import SelectionEngine
+
+__all__ = ["ArrayMesh"]
+
+
+class ArrayMesh(Mesh):
+    """Mesh backed by MeshBuffers: float32 positions and CSR faces."""
+
+    def __init__(self, positions=None, face_counts=None, face_indices=None):
+        """Create a mesh from optional arrays.
+
+        Args:
+            positions: (N, 3) array-like of vertex positions.
+            face_counts: Number of vertices per face.
+            face_indices: Concatenated face vertex ids.
+        """
+        requireNumpy()
+        # arrays from fromArrays not yet converted to list attributes
+        self._stored = {}
+        self._stored_key = None
+        self._topology = None
+        self._selection_engine = None
+        self._bvh = None
+        self._bvh_key = None
+        self._setBuffers(MeshBuffers())
+        Mesh.__init__(self)
+        if positions is not None or face_counts is not None:
+            self._setBuffers(MeshBuffers(positions, face_counts, face_indices))
+            self.edges = self.buffers.edgePairs().tolist()
+
+    @classmethod
+    def fromMesh(cls, mesh: Mesh) -> "ArrayMesh":
+        """Build an ArrayMesh from a list-backed Mesh.
+
+        Args:
+            mesh: Source mesh; vertices, faces, normals, edges and uvs are
+                copied.
+
+        Returns:
+            New ArrayMesh.
+        """
+        result = cls()
+        result.vertices = mesh.vertices
+        result.faces = mesh.faces
+        result.normals = list(mesh.normals)
+        result.edges = [list(edge) for edge in mesh.edges]
+        result.uvs = list(mesh.uvs)
+        result.face_uvs = [list(face) for face in mesh.face_uvs]
+        return result
+
+    @classmethod
+    def fromArrays(
+        cls,
+        positions,
+        face_offsets,
+        face_indices,
+        normals=None,
+        uvs=None,
+        face_uv_indices=None,
+        edges=None,
+    ) -> "ArrayMesh":
+        """Wrap existing arrays, e.g. memory-mapped ones, without copying.
+
+        positions and the face arrays become the mesh buffers as they are.
+        edges, uvs, face_uvs and normals are converted to their list form
+        only when first read; stored normals are used only if the mesh has
+        not been edited by then. Missing edges and normals are derived from
+        the faces on first read.
+
+        Args:
+            positions: float32 (N, 3) array.
+            face_offsets: int64 CSR offsets, length F + 1.
+            face_indices: int32 concatenated face vertex ids.
+            normals: Optional (F, 3) face normals.
+            uvs: Optional (U, 3) UV coordinates.
+            face_uv_indices: Optional per-corner UV ids, laid out like
+                face_indices.
+            edges: Optional (E, 2) edge vertex pairs.
+
+        Returns:
+            New ArrayMesh.
+
+        Raises:
+            ValueError: Arrays with the wrong dtype or shape.
+        """
+        result = cls()
+        result._setBuffers(
+            MeshBuffers.wrap(positions, face_offsets, face_indices)
+        )
+        # None edges and normals are derived from the faces when first
+        # read, and left out by save() while the mesh is unedited
+        result._stored = {"edges": edges, "normals": normals}
+        if uvs is not None:
+            result._stored["uvs"] = uvs
+        if face_uv_indices is not None:
+            result._stored["face_uvs"] = (face_offsets, face_uv_indices)
+        result._stored_key = result._normalsKey()
+        return result
+
+    def _resolveStored(self, name: str) -> None:
+        """Convert a stored array to its list attribute on first access."""
+        if name not in self._stored:
+            return
+        array = self._stored.pop(name)
+        if name == "normals" and array is None:
+            return
+        if name == "edges" and array is None:
+            value = self.buffers.edgePairs().tolist()
+        elif name == "face_uvs":
+            # laid out like the faces fromArrays was given
+            offsets, flat = array[0].tolist(), array[1].tolist()
+            value = [
+                flat[offsets[f] : offsets[f + 1]]
+                for f in range(len(offsets) - 1)
+            ]
+        elif name in ("uvs", "normals"):
+            value = [Vector(*row) for row in array.tolist()]
+        else:
+            value = array.tolist()
+        setattr(self, name, value)
+
+    def _storedArrays(self) -> dict:
+        """Stored arrays still valid for save(), keyed by file section."""
+        arrays = {}
+        fresh = self._stored_key == self._normalsKey()
+        for name, array in self._stored.items():
+            if name == "edges" and (array is not None or fresh):
+                arrays["edges"] = array
+            elif name == "uvs":
+                arrays["uvs"] = array
+            elif fresh and name == "face_uvs":
+                arrays["face_uv_indices"] = array[1]
+            elif fresh and name == "normals":
+                arrays["normals"] = array
+        return arrays
+
+    @property
+    def edges(self):
+        self._resolveStored("edges")
+        return Mesh.edges.fget(self)
+
+    @edges.setter
+    def edges(self, value) -> None:
+        self._stored.pop("edges", None)
+        Mesh.edges.fset(self, value)
+
+    @property
+    def uvs(self) -> list:
+        self._resolveStored("uvs")
+        return self._uvs
+
+    @uvs.setter
+    def uvs(self, value) -> None:
+        self._stored.pop("uvs", None)
+        self._uvs = value
+
+    @property
+    def face_uvs(self) -> list:
+        self._resolveStored("face_uvs")
+        return self._face_uvs
+
+    @face_uvs.setter
+    def face_uvs(self, value) -> None:
+        self._stored.pop("face_uvs", None)
+        self._face_uvs = value
+
+    @property
+    def normals(self):
+        # stored normals are stale once the buffers have changed
+        if self._stored_key == self._normalsKey():
+            self._resolveStored("normals")
+        else:
+            self._stored.pop("normals", None)
+        return Mesh.normals.fget(self)
+
+    @normals.setter
+    def normals(self, value) -> None:
+        self._stored.pop("normals", None)
+        Mesh.normals.fset(self, value)
+
+    def _setBuffers(self, buffers: MeshBuffers) -> None:
+        self.buffers = buffers
+        self._stored.pop("normals", None)
+        self._topology_version = -1
+        self._edge_counts = None
+        self._bvh = None
+        self._face_normals = None
+        self._vertex_view = VertexView(buffers)
+        self._face_view = FaceView(buffers)
+
+    @property
+    def vertices(self) -> VertexView:
+        return self._vertex_view
+
+    @vertices.setter
+    def vertices(self, value) -> None:
+        if value is self._vertex_view:
+            return
+        self.buffers.setPositions(_positionsOf(value))
+
+    @property
+    def faces(self) -> FaceView:
+        return self._face_view
+
+    @faces.setter
+    def faces(self, value) -> None:
+        if value is self._face_view:
+            return
+        if isinstance(value, FaceView):
+            self.buffers.setFacesCSR(
+                value.buffers.face_counts, value.buffers.face_indices
+            )
+        else:
+            self.buffers.setFaces(value)
+
+    def _facesKey(self):
+        return self.buffers.topology_version
+
+    def _syncTopology(self):
+        version = self.buffers.topology_version
+        if self._topology_version != version:
+            self.invalidateTopology()
+            self._topology_version = version
+
+    def topology(self):
+        self._syncTopology()
+        return Mesh.topology(self)
+
+    def _currentTopology(self):
+        self._syncTopology()
+        return Mesh._currentTopology(self)
+
+    def selectionEngine(self):
+        self._syncTopology()
+        return Mesh.selectionEngine(self)
+
+    def _buildSelectionEngine(self):
+        return SelectionEngine(self.buffers, self.edges)
+
+    def bvh(self):
+        """Return the cached Bvh, rebuilt after the buffers change.
+
+        Writes straight into buffers.positions are not seen; increment
+        buffers.position_version after them.
+        """
+        buffers = self.buffers
+        key = (buffers.topology_version, buffers.position_version)
+        if self._bvh is None or self._bvh_key != key:
+            self._bvh = Mesh.bvh(self)
+            self._bvh_key = key
+        return self._bvh
+
+    def _meshBuffers(self) -> MeshBuffers:
+        return self.buffers
+
+    def _replaceGeometry(self, positions, face_counts, face_indices) -> None:
+        self._setBuffers(MeshBuffers(positions, face_counts, face_indices))
+
+    def _getVertexPositions(self, ids):
+        return self.buffers.positions[ids].astype(np.float64)
+
+    def _setVertexPositions(self, ids, positions) -> None:
+        fresh = self._normalsFresh()
+        buffers = self.buffers
+        buffers.setVertices(ids, positions)
+        moved = np.isin(buffers.face_indices, np.asarray(ids))
+        faces = np.repeat(np.arange(buffers.face_count), buffers.face_counts)
+        self._markNormalsDirty(np.unique(faces[moved]).tolist(), fresh)
+
+    def _buildTopology(self):
+        return _mesh.Mesh.fromArrays(
+            self.buffers.positions,
+            self.buffers.face_counts,
+            self.buffers.face_indices,
+        )
+
+    def _normalsKey(self):
+        return (self.buffers.topology_version, self.buffers.position_version)
+
+    def _faceArrays(self, faces=None):
+        buffers = self.buffers
+        if faces is None:
+            return buffers.positions, buffers.face_offsets, buffers.face_indices
+        faces = np.asarray(faces, dtype=np.int64)
+        counts = buffers.face_counts[faces]
+        offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        corners = np.repeat(
+            buffers.face_offsets[faces] - offsets[:-1], counts
+        ) + np.arange(offsets[-1])
+        return buffers.positions, offsets, buffers.face_indices[corners]
+
+    def addVertex(self, value):
+        self.buffers.appendVertex(value)
+
+    def getVertex(self, id):
+        return self.vertices[id]
+
+    def updateVertex(self, id, value):
+        fresh = self._normalsFresh()
+        id = self.buffers.setVertex(id, value)
+        self._markNormalsDirty(self.buffers.vertexFaces(id), fresh)
+
+    def addFace(self, value):
+        # uvs should be handled here
+        fresh = self._normalsFresh()
+        counts = self._freshEdgeFaceCounts()
+        self.buffers.appendFace(value)
+        self._addFaceEdges(value, counts)
+        self._markNormalsDirty([self.buffers.face_count - 1], fresh)
+
+    def updateFace(self, id, value):
+        # uvs should be handled here
+        fresh = self._normalsFresh()
+        counts = self._freshEdgeFaceCounts()
+        old = self.buffers.face(id)
+        self.buffers.setFace(id, value)
+        self._addFaceEdges(value, counts, old)
+        self._markNormalsDirty([id], fresh)
+
+    @profiled(items=_faceCount)
+    def rebuildVertP(self):
+        # parent faces are derived from the face arrays; nothing to rebuild
+        self.buffers.vertexFaceTable()
@@ -0,0 +1,709 @@
+"""Array-backed mesh storage: float32 positions and CSR face arrays.
+
+MeshBuffers keeps vertex positions in a contiguous float32 (N, 3) array and
+faces in CSR form (face_offsets, face_indices). A vertex -> face CSR table is
+derived on demand and kept in sync incrementally while faces are edited.
+VertexView and FaceView expose the buffers through the list protocol so code
+written against Mesh.vertices / Mesh.faces keeps working.
+
+NumPy is optional for the package; it is required only by this module.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+from .geometry import Point, Vector
+
+__all__ = ["BufferPoint", "FaceRow", "FaceView", "MeshBuffers", "VertexView"]
+
+POSITION_DTYPE = "float32"
+INDEX_DTYPE = "int32"
+OFFSET_DTYPE = "int64"
+
+
+def requireNumpy() -> None:
+    """Raise ImportError if NumPy is not installed.
+
+    Raises:
+        ImportError: NumPy is not available.
+    """
+    if np is None:
+        raise ImportError(
+            "meshTools array storage requires numpy (pip install numpy)"
+        )
+
+
+def _xyz(value) -> tuple:
+    """Return (x, y, z) from a Vector-like or a 3-sequence."""
+    if isinstance(value, Vector):
+        return (value.x, value.y, value.z)
+    return (value[0], value[1], value[2])
+
+
+class MeshBuffers:
+    """Contiguous position and CSR face storage for a polygon mesh.
+
+    Face edits that keep the face size are written in place; other edits are
+    staged and folded back into the CSR arrays by compact(), which runs
+    lazily the next time face_offsets or face_indices is read.
+    """
+
+    def __init__(self, positions=None, face_counts=None, face_indices=None):
+        """Create buffers from optional arrays.
+
+        Args:
+            positions: (N, 3) array-like of vertex positions.
+            face_counts: Number of vertices per face, length F.
+            face_indices: Concatenated face vertex ids, length sum(counts).
+
+        Raises:
+            ValueError: face_counts and face_indices are inconsistent.
+        """
+        requireNumpy()
+        self._positions = np.zeros((0, 3), dtype=POSITION_DTYPE)
+        self._vertex_count = 0
+        self._face_offsets = np.zeros(1, dtype=OFFSET_DTYPE)
+        self._face_indices = np.zeros(0, dtype=INDEX_DTYPE)
+        self._csr_count = 0
+        self._face_count = 0
+        self._staged = {}
+        self._vf = None
+        self._vf_overlay = {}
+        self.topology_version = 0
+        self.position_version = 0
+        if positions is not None:
+            self.setPositions(positions)
+        if face_counts is not None or face_indices is not None:
+            self.setFacesCSR(
+                face_counts if face_counts is not None else [],
+                face_indices if face_indices is not None else [],
+            )
+
+    @classmethod
+    def wrap(cls, positions, face_offsets, face_indices) -> MeshBuffers:
+        """Adopt existing arrays (e.g. memory-mapped ones) without copying.
+
+        Args:
+            positions: float32 (N, 3) array.
+            face_offsets: int64 CSR offsets, length F + 1, starting at 0.
+            face_indices: int32 concatenated face vertex ids.
+
+        Raises:
+            ValueError: Wrong dtypes or shapes, or offsets that do not
+                match face_indices.
+        """
+        requireNumpy()
+        if (
+            positions.dtype != POSITION_DTYPE
+            or positions.ndim != 2
+            or positions.shape[1] != 3
+            or face_offsets.dtype != OFFSET_DTYPE
+            or face_offsets.ndim != 1
+            or face_indices.dtype != INDEX_DTYPE
+            or face_indices.ndim != 1
+        ):
+            raise ValueError(
+                "wrap needs float32 (N, 3) positions, int64 offsets and "
+                "int32 indices"
+            )
+        if (
+            len(face_offsets) == 0
+            or face_offsets[0] != 0
+            or face_offsets[-1] != len(face_indices)
+        ):
+            raise ValueError("face_offsets do not match face_indices")
+        buffers = cls()
+        buffers._positions = positions
+        buffers._vertex_count = len(positions)
+        buffers._face_offsets = face_offsets
+        buffers._face_indices = face_indices
+        buffers._csr_count = buffers._face_count = len(face_offsets) - 1
+        return buffers
+
+    # ------------------------------------------------------------------
+    # Positions
+    # ------------------------------------------------------------------
+
+    @property
+    def vertex_count(self) -> int:
+        return self._vertex_count
+
+    @property
+    def positions(self):
+        """float32 (N, 3) view of the live positions (writable)."""
+        return self._positions[: self._vertex_count]
+
+    def _reserveVertices(self, count: int) -> None:
+        if count <= len(self._positions):
+            return
+        capacity = max(count, 2 * len(self._positions), 16)
+        grown = np.zeros((capacity, 3), dtype=POSITION_DTYPE)
+        grown[: self._vertex_count] = self.positions
+        self._positions = grown
+
+    def setPositions(self, positions) -> None:
+        """Replace all positions.
+
+        Args:
+            positions: (N, 3) array-like.
+        """
+        positions = np.array(positions, dtype=POSITION_DTYPE).reshape(-1, 3)
+        self._positions = positions
+        self._vertex_count = len(positions)
+        self.position_version += 1
+
+    def appendVertex(self, value) -> int:
+        """Append one vertex and return its id.
+
+        Args:
+            value: Vector or 3-sequence.
+
+        Returns:
+            Id of the new vertex.
+        """
+        self._reserveVertices(self._vertex_count + 1)
+        self._positions[self._vertex_count] = _xyz(value)
+        self._vertex_count += 1
+        self.position_version += 1
+        return self._vertex_count - 1
+
+    def appendVertices(self, positions) -> None:
+        """Append vertices from an (M, 3) array-like."""
+        positions = np.asarray(positions, dtype=POSITION_DTYPE).reshape(-1, 3)
+        self._reserveVertices(self._vertex_count + len(positions))
+        start = self._vertex_count
+        self._positions[start : start + len(positions)] = positions
+        self._vertex_count += len(positions)
+        self.position_version += 1
+
+    def _vertexIndex(self, index: int) -> int:
+        """index with negative ids counted from the end, range-checked."""
+        if index < 0:
+            index += self._vertex_count
+        if not 0 <= index < self._vertex_count:
+            raise IndexError("vertex index out of range")
+        return index
+
+    def setVertex(self, index: int, value) -> int:
+        """Overwrite the position of vertex index.
+
+        Args:
+            index: Vertex id; negative ids count from the end.
+            value: Vector or 3-sequence.
+
+        Returns:
+            The (non-negative) id written.
+
+        Raises:
+            IndexError: index is out of range.
+        """
+        index = self._vertexIndex(index)
+        self._positions[index] = _xyz(value)
+        self.position_version += 1
+        return index
+
+    def setVertices(self, ids, positions) -> None:
+        """Overwrite the positions of several vertices.
+
+        Args:
+            ids: Vertex ids.
+            positions: (len(ids), 3) array-like.
+        """
+        self.positions[np.asarray(ids, dtype=OFFSET_DTYPE)] = np.asarray(
+            positions, dtype=POSITION_DTYPE
+        ).reshape(-1, 3)
+        self.position_version += 1
+
+    def vertex(self, index: int) -> tuple:
+        """Return (x, y, z) of vertex index as Python floats."""
+        x, y, z = self._positions[self._vertexIndex(index)].tolist()
+        return x, y, z
+
+    def truncateVertices(self, count: int) -> None:
+        """Drop all vertices with id >= count."""
+        self._vertex_count = min(count, self._vertex_count)
+        self.position_version += 1
+
+    # ------------------------------------------------------------------
+    # Faces
+    # ------------------------------------------------------------------
+
+    @property
+    def face_count(self) -> int:
+        return self._face_count
+
+    @property
+    def face_offsets(self):
+        """int64 CSR offsets, length F + 1."""
+        self.compact()
+        return self._face_offsets
+
+    @property
+    def face_indices(self):
+        """int32 concatenated face vertex ids."""
+        self.compact()
+        return self._face_indices
+
+    @property
+    def face_counts(self):
+        """int64 number of vertices per face."""
+        return np.diff(self.face_offsets)
+
+    def face(self, index: int) -> list:
+        """Return the vertex ids of face index as a new list."""
+        if index < 0:
+            index += self._face_count
+        if not 0 <= index < self._face_count:
+            raise IndexError("face index out of range")
+        staged = self._staged.get(index)
+        if staged is not None:
+            return list(staged)
+        start, end = self._face_offsets[index : index + 2]
+        return self._face_indices[start:end].tolist()
+
+    def faces(self) -> list:
+        """Return all faces as a list of lists."""
+        offsets = self.face_offsets.tolist()
+        indices = self._face_indices.tolist()
+        return [
+            indices[offsets[i] : offsets[i + 1]]
+            for i in range(self._face_count)
+        ]
+
+    def setFacesCSR(self, face_counts, face_indices) -> None:
+        """Replace all faces from CSR counts and indices.
+
+        Raises:
+            ValueError: sum(face_counts) != len(face_indices).
+        """
+        counts = np.asarray(face_counts, dtype=OFFSET_DTYPE).reshape(-1)
+        indices = np.array(face_indices, dtype=INDEX_DTYPE).reshape(-1)
+        if int(counts.sum()) != len(indices):
+            raise ValueError(
+                f"face_counts sum ({int(counts.sum())}) does not match "
+                f"face_indices length ({len(indices)})"
+            )
+        offsets = np.zeros(len(counts) + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(counts, out=offsets[1:])
+        self._face_offsets = offsets
+        self._face_indices = indices
+        self._csr_count = len(counts)
+        self._face_count = len(counts)
+        self._staged = {}
+        self._topologyChanged(rebuild=True)
+
+    def setFaces(self, faces) -> None:
+        """Replace all faces from a list of vertex id lists."""
+        counts = [len(face) for face in faces]
+        indices = np.fromiter(
+            (v for face in faces for v in face),
+            dtype=INDEX_DTYPE,
+            count=sum(counts),
+        )
+        self.setFacesCSR(counts, indices)
+
+    def appendFace(self, face) -> int:
+        """Append a face and return its id."""
+        face = [int(v) for v in face]
+        index = self._face_count
+        self._staged[index] = face
+        self._face_count += 1
+        if self._vf is not None:
+            for v in face:
+                self._vertexFacesMutable(v).append(index)
+        self._topologyChanged()
+        return index
+
+    def setFace(self, index: int, face) -> None:
+        """Replace the vertex ids of face index."""
+        if index < 0:
+            index += self._face_count
+        face = [int(v) for v in face]
+        old = self.face(index)
+        if self._vf is not None:
+            for v in old:
+                faces = self._vertexFacesMutable(v)
+                if index in faces:
+                    faces.remove(index)
+            for v in face:
+                self._vertexFacesMutable(v).append(index)
+        if index < self._csr_count:
+            start, end = self._face_offsets[index : index + 2]
+            if end - start == len(face):
+                self._face_indices[start:end] = face
+                self._staged.pop(index, None)
+                self._topologyChanged()
+                return
+        self._staged[index] = face
+        self._topologyChanged()
+
+    def deleteFaces(self, faces) -> None:
+        """Delete faces by id; later faces are renumbered down."""
+        self.compact()
+        keep = np.ones(self._face_count, dtype=bool)
+        keep[np.asarray(list(faces), dtype=OFFSET_DTYPE)] = False
+        counts = np.diff(self._face_offsets)
+        slot_keep = np.repeat(keep, counts)
+        self.setFacesCSR(counts[keep], self._face_indices[slot_keep])
+
+    def compact(self) -> None:
+        """Fold staged face edits back into the CSR arrays."""
+        if not self._staged:
+            return
+        staged = self._staged
+        ids = np.fromiter(staged.keys(), dtype=OFFSET_DTYPE, count=len(staged))
+        old_offsets = self._face_offsets
+        old_counts = np.diff(old_offsets)
+        counts = np.zeros(self._face_count, dtype=OFFSET_DTYPE)
+        counts[: self._csr_count] = old_counts
+        counts[ids] = [len(staged[i]) for i in ids.tolist()]
+        offsets = np.zeros(self._face_count + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(counts, out=offsets[1:])
+        indices = np.empty(int(offsets[-1]), dtype=INDEX_DTYPE)
+
+        keep = np.ones(self._csr_count, dtype=bool)
+        keep[ids[ids < self._csr_count]] = False
+        slot_face = np.repeat(np.arange(self._csr_count), old_counts)
+        src = np.nonzero(keep[slot_face])[0]
+        face = slot_face[src]
+        indices[offsets[face] + (src - old_offsets[face])] = self._face_indices[
+            src
+        ]
+        for i in ids.tolist():
+            indices[offsets[i] : offsets[i + 1]] = staged[i]
+
+        self._face_offsets = offsets
+        self._face_indices = indices
+        self._csr_count = self._face_count
+        self._staged = {}
+
+    def faceEdgePairs(self):
+        """Return (K, 2) directed corner pairs (face[i], face[i + 1]).
+
+        One row per face corner, in face order; the last corner of each
+        face pairs with its first.
+        """
+        offsets = self.face_offsets
+        indices = self._face_indices
+        counts = np.diff(offsets)
+        following = np.arange(1, len(indices) + 1)
+        nonempty = counts > 0
+        following[offsets[1:][nonempty] - 1] = offsets[:-1][nonempty]
+        return np.stack([indices, indices[following]], axis=1)
+
+    def edgePairs(self):
+        """Return (E, 2) unique undirected edges in first-seen order.
+
+        Each edge keeps the direction of the first face corner using it,
+        matching the order Mesh.addFace registers edges in.
+        """
+        pairs = self.faceEdgePairs()
+        keys = np.sort(pairs, axis=1).astype(OFFSET_DTYPE)
+        _, first = np.unique((keys[:, 0] << 32) | keys[:, 1], return_index=True)
+        first.sort()
+        return pairs[first]
+
+    def _topologyChanged(self, rebuild: bool = False) -> None:
+        self.topology_version += 1
+        if rebuild:
+            self._vf = None
+            self._vf_overlay = {}
+
+    # ------------------------------------------------------------------
+    # Vertex -> face table
+    # ------------------------------------------------------------------
+
+    def vertexFaceTable(self) -> tuple:
+        """Return the vertex -> face CSR table (offsets, faces).
+
+        The table is rebuilt from the face arrays when stale; incremental
+        edits since the last build are folded in first.
+        """
+        if self._vf is None or self._vf_overlay:
+            self._buildVertexFaces()
+        return self._vf
+
+    def vertexFaces(self, vertex: int) -> list:
+        """Return ids of faces using vertex (Point.parent_faces)."""
+        if self._vf is None:
+            self._buildVertexFaces()
+        faces = self._vf_overlay.get(vertex)
+        if faces is not None:
+            return list(faces)
+        offsets, table = self._vf
+        if vertex >= len(offsets) - 1:
+            return []
+        return table[offsets[vertex] : offsets[vertex + 1]].tolist()
+
+    def _vertexFacesMutable(self, vertex: int) -> list:
+        faces = self._vf_overlay.get(vertex)
+        if faces is None:
+            offsets, table = self._vf
+            if vertex < len(offsets) - 1:
+                faces = table[offsets[vertex] : offsets[vertex + 1]].tolist()
+            else:
+                faces = []
+            self._vf_overlay[vertex] = faces
+        return faces
+
+    def _buildVertexFaces(self) -> None:
+        offsets = self.face_offsets
+        indices = self._face_indices
+        vertex_count = max(
+            self._vertex_count, int(indices.max()) + 1 if len(indices) else 0
+        )
+        slot_face = np.repeat(
+            np.arange(self._face_count, dtype=INDEX_DTYPE), np.diff(offsets)
+        )
+        order = np.argsort(indices, kind="stable")
+        vf_offsets = np.zeros(vertex_count + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(
+            np.bincount(indices, minlength=vertex_count), out=vf_offsets[1:]
+        )
+        self._vf = (vf_offsets, slot_face[order])
+        self._vf_overlay = {}
+
+    def copy(self) -> MeshBuffers:
+        """Return a deep copy of the buffers."""
+        other = MeshBuffers(self.positions.copy())
+        other.setFacesCSR(self.face_counts, self.face_indices.copy())
+        return other
+
+
+class BufferPoint(Point):
+    """Point snapshot read from MeshBuffers.
+
+    parent_faces resolves through the buffers' vertex -> face table and
+    rulers are kept by the owning VertexView, so both survive re-reading the
+    vertex. Writing parent_faces is ignored: topology is owned by the faces.
+    """
+
+    def __init__(self, view: VertexView, index: int):
+        x, y, z = view.buffers.vertex(index)
+        Vector.__init__(self, x, y, z)
+        self._view = view
+        self._index = index
+
+    @property
+    def parent_faces(self) -> list:
+        return self._view.buffers.vertexFaces(self._index)
+
+    @parent_faces.setter
+    def parent_faces(self, value) -> None:
+        pass
+
+    @property
+    def ruler(self):
+        try:
+            return self._view.rulers[self._index]
+        except KeyError:
+            raise AttributeError("ruler") from None
+
+    @ruler.setter
+    def ruler(self, value) -> None:
+        self._view.rulers[self._index] = value
+
+
+class VertexView:
+    """List-like view of MeshBuffers positions yielding BufferPoint items.
+
+    Slicing and copy() return a detached VertexView over a copy of the
+    positions, so the common "copy, edit, assign back" idiom stays O(N) in
+    NumPy rather than building Point objects.
+    """
+
+    def __init__(self, buffers: MeshBuffers):
+        self.buffers = buffers
+        self.rulers = {}
+
+    @property
+    def positions(self):
+        return self.buffers.positions
+
+    def __len__(self) -> int:
+        return self.buffers.vertex_count
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("vertex index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VertexView(MeshBuffers(self.positions[index].copy()))
+        return BufferPoint(self, self._index(index))
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            self.positions[index] = _positionsOf(value)
+            self.buffers.position_version += 1
+            return
+        self.buffers.setVertex(self._index(index), value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield BufferPoint(self, i)
+
+    def append(self, value) -> None:
+        self.buffers.appendVertex(value)
+
+    def extend(self, values) -> None:
+        self.buffers.appendVertices(_positionsOf(values))
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __add__(self, values) -> VertexView:
+        result = _detach(self)
+        result.extend(values)
+        return result
+
+    def __copy__(self) -> VertexView:
+        return _detach(self)
+
+    def __repr__(self) -> str:
+        return f"VertexView({len(self)} vertices)"
+
+
+def _detach(view: VertexView) -> VertexView:
+    """Return a detached VertexView over a copy of view's positions."""
+    return VertexView(MeshBuffers(view.positions.copy()))
+
+
+def _positionsOf(values):
+    """Convert a VertexView, array or sequence of Vectors to (M, 3) floats."""
+    if isinstance(values, VertexView):
+        return values.positions
+    if np is not None and isinstance(values, np.ndarray):
+        return values
+    values = list(values)
+    return np.array([_xyz(v) for v in values], dtype=POSITION_DTYPE).reshape(
+        -1, 3
+    )
+
+
+class FaceRow(list):
+    """Snapshot of one face's vertex ids that writes edits back.
+
+    Behaves as a plain list; in-place edits (item assignment, append, pop,
+    ...) are written through to the owning MeshBuffers.
+    """
+
+    def __init__(self, buffers: MeshBuffers, index: int, verts: list):
+        list.__init__(self, verts)
+        self._buffers = buffers
+        self._index = index
+
+    def _commit(self) -> None:
+        self._buffers.setFace(self._index, list(self))
+
+    def __setitem__(self, index, value) -> None:
+        list.__setitem__(self, index, value)
+        self._commit()
+
+    def __delitem__(self, index) -> None:
+        list.__delitem__(self, index)
+        self._commit()
+
+    def __iadd__(self, values):
+        list.extend(self, values)
+        self._commit()
+        return self
+
+    def append(self, value) -> None:
+        list.append(self, value)
+        self._commit()
+
+    def extend(self, values) -> None:
+        list.extend(self, values)
+        self._commit()
+
+    def insert(self, index, value) -> None:
+        list.insert(self, index, value)
+        self._commit()
+
+    def pop(self, index=-1):
+        value = list.pop(self, index)
+        self._commit()
+        return value
+
+    def remove(self, value) -> None:
+        list.remove(self, value)
+        self._commit()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._commit()
+
+    def __copy__(self) -> list:
+        return list(self)
+
+
+class FaceView:
+    """List-like view of MeshBuffers faces yielding FaceRow items."""
+
+    def __init__(self, buffers: MeshBuffers):
+        self.buffers = buffers
+
+    def __len__(self) -> int:
+        return self.buffers.face_count
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("face index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self.buffers.face(i) for i in range(*index.indices(len(self)))
+            ]
+        index = self._index(index)
+        return FaceRow(self.buffers, index, self.buffers.face(index))
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            faces = self.buffers.faces()
+            faces[index] = value
+            self.buffers.setFaces(faces)
+            return
+        self.buffers.setFace(self._index(index), value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield FaceRow(self.buffers, i, self.buffers.face(i))
+
+    def append(self, value) -> None:
+        self.buffers.appendFace(value)
+
+    def extend(self, values) -> None:
+        for value in values:
+            self.buffers.appendFace(value)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def pop(self, index: int = -1) -> list:
+        index = self._index(index)
+        value = self.buffers.face(index)
+        self.buffers.deleteFaces([index])
+        return value
+
+    def __copy__(self) -> list:
+        return self.buffers.faces()
+
+    def __eq__(self, other) -> bool:
+        return self.buffers.faces() == list(other)
+
+    def __repr__(self) -> str:
+        return repr(self.buffers.faces())
@@ -3,11 +3,22 @@
 Implements the double-triangle method: start from a non-degenerate tetrahedron,
 then add points one by one, updating faces and edges. Exports hull as
 faces and vertices for mesh use. Uses C++ _chull extension when available.
+
+The C++ extension also has a Quickhull engine, selected with
+``Hull(points, quickhull=True)`` or ``Hull.fromArray(points)``, for large
+point sets; face_indices, positions and point_ids return the hull as flat
+NumPy arrays. orientedBox and orientedBoxes fit oriented bounding boxes,
+optionally to the hull only or as a minimum-volume search over hull faces.
 """
 
 import logging
 
-from .geometry import Point
+from .geometry import BBox, Point
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 debug = False
@@ -22,9 +33,75 @@ except ImportError:
 
         _CHull = _chull.Hull
     except ImportError:
+        _chull = None
         _CHull = None
 
 
+OBB_METHODS = ("covariance", "hull", "minvolume")
+
+
+def orientedBox(points, method: str = "minvolume"):
+    """Oriented bounding box of a point set.
+
+    Args:
+        points: (N, 3) array-like, VectorArray or list of Vectors.
+        method: "covariance" fits the principal axes of all points, "hull"
+            the principal axes of the convex hull vertices, and "minvolume"
+            keeps the smallest box over the hull face normals. Hull methods
+            fall back to "covariance" for flat input, and all methods do
+            without the _chull extension.
+
+    Returns:
+        BBox with axis set; min and max are extents in the axis frame and
+        center is in world space.
+
+    Raises:
+        ValueError: Unknown method.
+    """
+    if method not in OBB_METHODS:
+        raise ValueError(f"method must be one of {OBB_METHODS}")
+    if _chull is not None and np is not None:
+        if not isinstance(points, np.ndarray):
+            points = [(p.x, p.y, p.z) for p in points]
+        points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+        return _chull.orientedBox(points, method)
+    box = BBox()
+    box.obbFromPointSet(points)
+    return box
+
+
+def orientedBoxes(points, offsets, method: str = "minvolume", threads=1):
+    """Oriented bounding boxes of many point ranges in one call.
+
+    Args:
+        points: (N, 3) array-like of all points.
+        offsets: (R + 1,) array-like; range r is
+            points[offsets[r]:offsets[r + 1]].
+        method: See orientedBox.
+        threads: Worker threads; 0 uses every core.
+
+    Returns:
+        float32 (R, 6, 3) array with rows min, max, center, axis 0, axis 1,
+        axis 2 per range.
+
+    Raises:
+        ImportError: NumPy is not installed.
+        ValueError: Unknown method or invalid offsets.
+    """
+    if np is None:
+        raise ImportError("orientedBoxes requires numpy")
+    points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+    offsets = np.ascontiguousarray(offsets, dtype=np.uint32)
+    if _chull is not None:
+        return _chull.orientedBoxes(points, offsets, method, threads)
+    result = np.zeros((max(len(offsets) - 1, 0), 6, 3), dtype=np.float32)
+    for r in range(len(result)):
+        box = orientedBox(points[offsets[r] : offsets[r + 1]], method)
+        rows = [box.min, box.max, box.center] + list(box.axis)
+        result[r] = [(v.x, v.y, v.z) for v in rows]
+    return result
+
+
 class Vertex:
     """Convex hull vertex: point v, index vnum, and flags for hull construction."""
 
@@ -217,9 +294,16 @@ PROCESSED = True
 class Hull:
     """Convex hull of a 3D point set. Use exportHull() for [faces, vertices]."""
 
-    def __init__(self, v):
+    def __init__(self, v, quickhull: bool = False):
+        """Build the hull of points v.
+
+        Args:
+            v: Points (Vector or Point).
+            quickhull: Use the C++ Quickhull engine. The pure-Python
+                fallback is always incremental.
+        """
         if _CHull is not None:
-            self._impl = _CHull(v)
+            self._impl = _CHull(v, quickhull)
             return
         self.vertices = []
         self.edges = []
@@ -229,6 +313,56 @@ class Hull:
         self.ConstructHull(v)
         self.EdgeOrderOnFaces()
 
+    @classmethod
+    def fromArray(cls, points, quickhull: bool = True) -> "Hull":
+        """Build the hull of an (N, 3) point array.
+
+        Args:
+            points: (N, 3) array-like; converted to float32.
+            quickhull: Use the Quickhull engine (default) instead of the
+                incremental one.
+
+        Returns:
+            New Hull.
+
+        Raises:
+            ImportError: NumPy is not installed.
+            ValueError: points does not have shape (N, 3).
+        """
+        if np is None:
+            raise ImportError("Hull.fromArray requires numpy")
+        points = np.ascontiguousarray(points, dtype=np.float32)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError("points must have shape (N, 3)")
+        if _CHull is None:
+            return cls([Point(*p) for p in points.tolist()])
+        hull = cls.__new__(cls)
+        hull._impl = _CHull.fromArray(points, quickhull)
+        return hull
+
+    @property
+    def face_indices(self):
+        """(F, 3) uint32 array of indices into positions."""
+        if hasattr(self, "_impl"):
+            return self._impl.face_indices
+        faces = self._exportHullPython()[0]
+        return np.array(faces, dtype=np.uint32).reshape(-1, 3)
+
+    @property
+    def positions(self):
+        """(V, 3) float32 array of hull vertex positions."""
+        if hasattr(self, "_impl"):
+            return self._impl.positions
+        points = [(v.v.x, v.v.y, v.v.z) for v in self.vertices]
+        return np.array(points, dtype=np.float32).reshape(-1, 3)
+
+    @property
+    def point_ids(self):
+        """(V,) uint32 array: input point index of each hull vertex."""
+        if hasattr(self, "_impl"):
+            return self._impl.point_ids
+        return np.array([v.vnum for v in self.vertices], dtype=np.uint32)
+
     def exportHull(self) -> list:
         """Return [faces, vertices] for mesh use.
 
@@ -548,12 +682,11 @@ class Hull:
 
     def _exportHullPython(self) -> list:
         """Pure-Python export (used when _chull extension not available)."""
+        # number by position without touching vnum, the input index
+        index = {id(vert): i for i, vert in enumerate(self.vertices)}
         faces = []
-        for i in range(len(self.vertices)):
-            self.vertices[i].vnum = i
-
         for f in self.faces:
-            faces.append([f.vertex[0].vnum, f.vertex[1].vnum, f.vertex[2].vnum])
+            faces.append([index[id(vert)] for vert in f.vertex])
         vertices = []
         for vert in self.vertices:
             vertices.append(Point(vert.v.x, vert.v.y, vert.v.z))
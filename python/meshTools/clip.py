@@ -0,0 +1,381 @@
+"""Streaming plane clipping of polygon meshes in CSR form.
+
+clipPlanes cuts every face by one or more planes without per-face Python
+work. Vertex sides come from one vectorized signed-distance pass, each cut
+edge gets exactly one new vertex (cut edges are deduplicated by their
+(min, max) key), and the surviving pieces are written as new CSR arrays in
+one pass over the face corners (Sutherland-Hodgman). Only faces that the
+plane crosses more than twice (concave faces) are split in Python, by
+pairing their cut points along the plane. Cut loops can be closed with
+cap faces.
+
+A vertex is kept when its signed distance to the plane is >= 0, the same
+test as Ray.pointPlaneSide. Vertices exactly on the plane are reused
+instead of creating zero-length cut edges.
+"""
+
+from __future__ import annotations
+
+from .buffers import INDEX_DTYPE, OFFSET_DTYPE, np, requireNumpy
+
+__all__ = ["ClipResult", "clipPlanes"]
+
+
+class ClipResult:
+    """Mesh arrays produced by clipPlanes.
+
+    Attributes:
+        positions: float32 (V, 3) positions. Surviving input vertices come
+            first in input order, then the vertices created on cuts.
+        face_offsets: CSR offsets, length F + 1.
+        face_indices: Concatenated face vertex ids.
+        face_sources: Input face of each output face, -1 for cap faces.
+        vertex_sources: Input vertex of each output vertex, -1 for vertices
+            created on a cut.
+        corner_data: (len(face_indices), K) per-corner values interpolated
+            from the input corner_data (zeros on cap faces), or None.
+    """
+
+    def __init__(
+        self,
+        positions,
+        face_offsets,
+        face_indices,
+        face_sources,
+        vertex_sources,
+        corner_data=None,
+    ):
+        self.positions = positions
+        self.face_offsets = face_offsets
+        self.face_indices = face_indices
+        self.face_sources = face_sources
+        self.vertex_sources = vertex_sources
+        self.corner_data = corner_data
+
+    @property
+    def face_counts(self):
+        """Vertex count of each output face."""
+        return np.diff(self.face_offsets)
+
+
+def _plane(plane):
+    """Return float64 (origin, normal) from a Ray or an (origin, normal)."""
+    if hasattr(plane, "origin"):
+        origin, normal = plane.origin, plane.direction
+    else:
+        origin, normal = plane
+    origin = np.array([origin[0], origin[1], origin[2]], dtype=np.float64)
+    normal = np.array([normal[0], normal[1], normal[2]], dtype=np.float64)
+    return origin, normal
+
+
+def _cycles(successor, starts) -> list:
+    """Closed cycles of a successor map visited from starts.
+
+    Args:
+        successor: Integer array; -1 marks a missing link.
+        starts: Candidate first nodes.
+
+    Returns:
+        List of node id arrays, one per closed cycle. Open chains are
+        skipped.
+    """
+    visited = np.zeros(len(successor), dtype=bool)
+    loops = []
+    for start in starts.tolist():
+        if visited[start]:
+            continue
+        loop = []
+        node = start
+        while node >= 0 and not visited[node]:
+            visited[node] = True
+            loop.append(node)
+            node = int(successor[node])
+        if node == start:
+            loops.append(np.array(loop, dtype=OFFSET_DTYPE))
+    return loops
+
+
+class _Pass:
+    """One plane cut of the current arrays: sides, corners and cut vertices."""
+
+    def __init__(self, positions, offsets, indices, origin, normal):
+        self.positions = positions
+        self.offsets = offsets
+        self.indices = indices
+        self.normal = normal
+        vertex_count = len(positions)
+        face_count = len(offsets) - 1
+        counts = np.diff(offsets)
+        corner_count = len(indices)
+
+        self.distance = (positions - origin) @ normal
+        d = self.distance
+        self.face_of = np.repeat(np.arange(face_count), counts)
+        following = np.arange(1, corner_count + 1, dtype=OFFSET_DTYPE)
+        nonempty = counts > 0
+        following[offsets[1:][nonempty] - 1] = offsets[:-1][nonempty]
+        self.following = following
+        a = indices
+        b = indices[following]
+        self.a, self.b = a, b
+        # strictly opposite signs: on-plane vertices are reused, not cut
+        self.cross = ((d[a] > 0) & (d[b] < 0)) | ((d[a] < 0) & (d[b] > 0))
+
+        keys = np.minimum(a, b) * vertex_count + np.maximum(a, b)
+        edges, inverse = np.unique(keys[self.cross], return_inverse=True)
+        low, high = edges // vertex_count, edges % vertex_count
+        t = d[low] / (d[low] - d[high])
+        cut_positions = positions[low] + t[:, None] * (
+            positions[high] - positions[low]
+        )
+        self.cut_count = len(edges)
+        self.all_positions = np.concatenate([positions, cut_positions])
+        self.cut_id = np.full(corner_count, -1, dtype=OFFSET_DTYPE)
+        self.cut_id[self.cross] = vertex_count + inverse.reshape(-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.corner_t = np.where(self.cross, d[a] / (d[a] - d[b]), 0.0)
+
+        on_plane = d[a] == 0
+        self.all_on_plane = (
+            np.bincount(self.face_of, weights=~on_plane, minlength=face_count)
+            == 0
+        )
+
+    def pieces(self, above: bool):
+        """Face pieces on one side of the plane.
+
+        Args:
+            above: True for the kept side (distance >= 0), False for the
+                other side (distance <= 0).
+
+        Returns:
+            (items, corners, t, offsets, sources, bridges): output vertex
+            ids, the input corner each item comes from, the cut parameter
+            along that corner's edge (0 for a kept vertex), piece CSR
+            offsets, input face per piece, and (entry, exit) vertex pairs of
+            every piece edge that cuts through a face along the plane.
+        """
+        d = self.distance
+        a, b, face_of = self.a, self.b, self.face_of
+        face_count = len(self.offsets) - 1
+        keep = d >= 0 if above else d <= 0
+        strict = d > 0 if above else d < 0
+        has_piece = (
+            np.bincount(face_of, weights=strict[a], minlength=face_count) > 0
+        )
+        if above:
+            has_piece |= self.all_on_plane & (np.diff(self.offsets) > 0)
+            self.kept_faces = has_piece
+
+        kept = keep[a] & has_piece[face_of]
+        cross = self.cross & has_piece[face_of]
+        emitted = kept.astype(OFFSET_DTYPE) + cross
+        ends = np.cumsum(emitted)
+        starts = ends - emitted
+        total = int(ends[-1]) if len(ends) else 0
+        corner_ids = np.arange(len(a), dtype=OFFSET_DTYPE)
+        items = np.empty(total, dtype=OFFSET_DTYPE)
+        corners = np.empty(total, dtype=OFFSET_DTYPE)
+        t = np.zeros(total, dtype=np.float64)
+        items[starts[kept]] = a[kept]
+        corners[starts[kept]] = corner_ids[kept]
+        at = starts[cross] + kept[cross]
+        items[at] = self.cut_id[cross]
+        corners[at] = corner_ids[cross]
+        t[at] = self.corner_t[cross]
+
+        face_sizes = np.bincount(face_of, weights=emitted, minlength=face_count)
+        face_sizes = face_sizes.astype(OFFSET_DTYPE)
+        face_starts = np.concatenate([[0], np.cumsum(face_sizes)])
+        # the last item before a run of dropped corners leaves the side;
+        # the next item in the ring comes back onto it
+        leaves = (emitted > 0) & ~keep[b]
+        exits = ends[leaves] - 1
+        exit_faces = face_of[leaves]
+        entries = exits + 1
+        wrap = entries == face_starts[exit_faces + 1]
+        entries[wrap] = face_starts[exit_faces[wrap]]
+        bridge_count = np.bincount(exit_faces, minlength=face_count)
+
+        simple = bridge_count[exit_faces] < 2
+        bridges = [np.stack([items[entries[simple]], items[exits[simple]]], 1)]
+        faces = np.flatnonzero(face_sizes > 0)
+        complex_faces = np.flatnonzero(bridge_count > 1)
+        order = np.arange(total, dtype=OFFSET_DTYPE)
+        piece_sizes = face_sizes[faces]
+        piece_sources = faces
+        if len(complex_faces):
+            keep_item = np.ones(total, dtype=bool)
+            split_order, split_sizes, split_sources = [], [], []
+            for face in complex_faces.tolist():
+                first, last = face_starts[face], face_starts[face + 1]
+                keep_item[first:last] = False
+                loops, pairs = self._split(
+                    items[first:last], exits[exit_faces == face] - first, face
+                )
+                bridges.append(pairs)
+                for loop in loops:
+                    split_order.append(loop + first)
+                    split_sizes.append(len(loop))
+                    split_sources.append(face)
+            simple_faces = face_sizes[faces] > 0
+            simple_faces &= bridge_count[faces] < 2
+            order = np.concatenate([order[keep_item]] + split_order)
+            piece_sizes = np.concatenate(
+                [face_sizes[faces][simple_faces], split_sizes]
+            ).astype(OFFSET_DTYPE)
+            piece_sources = np.concatenate(
+                [faces[simple_faces], split_sources]
+            ).astype(OFFSET_DTYPE)
+        offsets = np.concatenate([[0], np.cumsum(piece_sizes)]).astype(
+            OFFSET_DTYPE
+        )
+        return (
+            items[order],
+            corners[order],
+            t[order],
+            offsets,
+            piece_sources,
+            np.concatenate(bridges).astype(OFFSET_DTYPE),
+        )
+
+    def _split(self, ring, exits, face):
+        """Split a piece ring whose face the plane crosses several times.
+
+        Cut points are sorted along the line where the plane meets the face
+        and paired in order; each exit then continues at its partner.
+
+        Returns:
+            (loops, bridges): local item index arrays, one per piece, and
+            the (entry, exit) vertex pairs of the new plane edges.
+        """
+        size = len(ring)
+        entries = (exits + 1) % size
+        first, last = self.offsets[face], self.offsets[face + 1]
+        corners = self.positions[self.indices[first:last]]
+        face_normal = np.cross(corners, np.roll(corners, -1, axis=0)).sum(0)
+        line = np.cross(self.normal, face_normal)
+        ends = np.concatenate([exits, entries])
+        coordinate = self.all_positions[ring[ends]] @ line
+        ordered = ends[np.argsort(coordinate, kind="stable")]
+        partner = dict(zip(ordered[0::2].tolist(), ordered[1::2].tolist()))
+        partner.update(zip(ordered[1::2].tolist(), ordered[0::2].tolist()))
+        successor = (np.arange(size) + 1) % size
+        entry_set = set(entries.tolist())
+        if all(partner.get(x) in entry_set for x in exits.tolist()):
+            for x in exits.tolist():
+                successor[x] = partner[x]
+        loops = _cycles(successor, np.arange(size))
+        pairs = np.array(
+            [[ring[successor[x]], ring[x]] for x in exits.tolist()],
+            dtype=OFFSET_DTYPE,
+        ).reshape(-1, 2)
+        return loops, pairs
+
+
+def clipPlanes(
+    positions,
+    face_offsets,
+    face_indices,
+    planes,
+    keep_both: bool = False,
+    cap: bool = False,
+    corner_data=None,
+) -> ClipResult:
+    """Cut a polygon mesh by a sequence of planes.
+
+    Each plane is applied to the output of the previous one, so caps and
+    pieces from earlier planes are cut again.
+
+    Args:
+        positions: (N, 3) vertex positions.
+        face_offsets: CSR face offsets, length F + 1.
+        face_indices: Concatenated face vertex ids.
+        planes: Sequence of Rays or (origin, normal) pairs; the kept side is
+            where (p - origin) . normal >= 0.
+        keep_both: Keep the pieces on both sides (split the mesh along the
+            plane) instead of dropping everything below it.
+        cap: Close every cut loop with a face. Loops are not bridged, so a
+            cross-section with holes gets overlapping caps. Ignored when
+            keep_both is set.
+        corner_data: Optional (len(face_indices), K) per-corner values such
+            as UVs, interpolated along cut edges.
+
+    Returns:
+        ClipResult with the new arrays.
+    """
+    requireNumpy()
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    offsets = np.asarray(face_offsets, dtype=OFFSET_DTYPE)
+    indices = np.asarray(face_indices, dtype=OFFSET_DTYPE)
+    face_sources = np.arange(len(offsets) - 1, dtype=OFFSET_DTYPE)
+    vertex_sources = np.arange(len(positions), dtype=OFFSET_DTYPE)
+    data = None
+    if corner_data is not None:
+        data = np.asarray(corner_data, dtype=np.float64)
+        data = data.reshape(len(indices), -1)
+
+    for plane in planes:
+        origin, normal = _plane(plane)
+        cut = _Pass(positions, offsets, indices, origin, normal)
+        sides = [True, False] if keep_both else [True]
+        parts = [cut.pieces(above) for above in sides]
+        items = np.concatenate([p[0] for p in parts])
+        corners = np.concatenate([p[1] for p in parts])
+        t = np.concatenate([p[2] for p in parts])
+        sizes = np.concatenate([np.diff(p[3]) for p in parts])
+        sources = np.concatenate([face_sources[p[4]] for p in parts])
+
+        if data is not None:
+            start = data[corners]
+            data = start + t[:, None] * (data[cut.following[corners]] - start)
+        if cap and not keep_both:
+            successor = np.full(len(cut.all_positions), -1, dtype=OFFSET_DTYPE)
+            bridges = parts[0][5]
+            successor[bridges[:, 0]] = bridges[:, 1]
+            # on-plane edges of dropped faces now border the cap
+            d = cut.distance
+            dropped = ~cut.kept_faces[cut.face_of]
+            rim = dropped & (d[cut.a] == 0) & (d[cut.b] == 0)
+            successor[cut.a[rim]] = cut.b[rim]
+            loops = [
+                loop
+                for loop in _cycles(successor, np.flatnonzero(successor >= 0))
+                if len(loop) > 2
+            ]
+            if loops:
+                items = np.concatenate([items] + loops)
+                sizes = np.concatenate([sizes, [len(loop) for loop in loops]])
+                sources = np.concatenate(
+                    [sources, np.full(len(loops), -1, dtype=OFFSET_DTYPE)]
+                )
+                if data is not None:
+                    filler = np.zeros((sum(map(len, loops)), data.shape[1]))
+                    data = np.concatenate([data, filler])
+
+        vertex_count = len(positions)
+        if keep_both:
+            survivors = np.ones(vertex_count, dtype=bool)
+        else:
+            survivors = cut.distance >= 0
+        survivors = np.concatenate(
+            [survivors, np.ones(cut.cut_count, dtype=bool)]
+        )
+        remap = np.cumsum(survivors) - 1
+        positions = cut.all_positions[survivors]
+        vertex_sources = np.concatenate(
+            [vertex_sources, np.full(cut.cut_count, -1, dtype=OFFSET_DTYPE)]
+        )[survivors]
+        indices = remap[items]
+        offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(OFFSET_DTYPE)
+        face_sources = sources.astype(OFFSET_DTYPE)
+
+    return ClipResult(
+        positions.astype(np.float32),
+        offsets,
+        indices.astype(INDEX_DTYPE),
+        face_sources,
+        vertex_sources,
+        data,
+    )
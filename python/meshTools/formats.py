@@ -0,0 +1,750 @@
+"""Streaming Wavefront OBJ and PLY import and export.
+
+Readers go through the file in fixed-size chunks and return the same dict
+of arrays as meshfile.readArrays (positions, face_offsets, face_indices
+and, when present, uvs and face_uv_indices), so memory stays close to the
+size of the result. Chunks are tokenized by the _mesh extension
+(ObjReader, parseNumbers, decodeTextLists, decodeBinaryLists); without it
+the same work is done in Python, much more slowly.
+
+Supported input:
+
+    OBJ  v, vt and f statements; v/vt/vn corners and negative ids.
+         Normals, groups, materials and other statements are ignored.
+    PLY  ascii, binary_little_endian and binary_big_endian. Vertex x, y,
+         z and u, v (or s, t / texture_u, texture_v) properties, and a
+         face vertex_indices (or vertex_index) list. Elements with only
+         scalar properties are skipped wherever they appear.
+
+Writers stream the arrays out in blocks of rows. Mesh.load and Mesh.save
+pick the format from the file suffix. NumPy is required.
+"""
+
+from __future__ import annotations
+
+import struct
+
+from .buffers import INDEX_DTYPE, OFFSET_DTYPE, POSITION_DTYPE, np, requireNumpy
+
+try:
+    from . import _mesh
+except ImportError:
+    try:
+        import _mesh
+    except ImportError:
+        _mesh = None  # type: ignore[assignment]
+
+__all__ = ["readObj", "readPly", "writeObj", "writePly"]
+
+# bytes read per chunk, and rows formatted per block when writing
+kChunkSize = 1 << 22
+kWriteRows = 1 << 16
+
+# PLY type name -> numpy type code (without byte order)
+_kPlyTypes = {
+    "char": "i1",
+    "int8": "i1",
+    "uchar": "u1",
+    "uint8": "u1",
+    "short": "i2",
+    "int16": "i2",
+    "ushort": "u2",
+    "uint16": "u2",
+    "int": "i4",
+    "int32": "i4",
+    "uint": "u4",
+    "uint32": "u4",
+    "float": "f4",
+    "float32": "f4",
+    "double": "f8",
+    "float64": "f8",
+}
+_kUvNames = (("u", "v"), ("s", "t"), ("texture_u", "texture_v"))
+_kFaceLists = ("vertex_indices", "vertex_index")
+
+
+# -- Python fallbacks for the _mesh tokenizers --------------------------------
+
+
+class _PyObjReader:
+    """Python version of _mesh.ObjReader."""
+
+    def __init__(self, topology_only=False):
+        self.topology_only = topology_only
+        self.vertex_total = 0
+        self.uv_total = 0
+        self.line = 0
+        self._clear()
+
+    def _clear(self):
+        self._positions = []
+        self._uvs = []
+        self._counts = []
+        self._indices = []
+        self._uv_indices = []
+
+    def _fail(self, keyword):
+        raise ValueError(f"OBJ line {self.line}: malformed {keyword} statement")
+
+    @staticmethod
+    def _resolve(token, total):
+        id = int(token)
+        if id > 0:
+            return id - 1
+        if id < 0 and -id <= total:
+            return total + id
+        raise ValueError(token)
+
+    def feed(self, data):
+        lines = data.split(b"\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        for line in lines:
+            self.line += 1
+            tokens = line.split()
+            if not tokens:
+                continue
+            keyword = tokens[0]
+            try:
+                if keyword == b"v":
+                    if len(tokens) < 4:
+                        raise ValueError(line)
+                    self._positions.append([float(t) for t in tokens[1:4]])
+                    self.vertex_total += 1
+                elif keyword == b"vt":
+                    self.uv_total += 1
+                    if not self.topology_only:
+                        uvw = [float(t) for t in tokens[1:4]]
+                        if not uvw:
+                            raise ValueError(line)
+                        self._uvs.append(uvw + [0.0] * (3 - len(uvw)))
+                elif keyword == b"f":
+                    if len(tokens) < 4:
+                        raise ValueError(line)
+                    for corner in tokens[1:]:
+                        parts = corner.split(b"/")
+                        if len(parts) > 3:
+                            raise ValueError(corner)
+                        self._indices.append(
+                            self._resolve(parts[0], self.vertex_total)
+                        )
+                        uv = -1
+                        if len(parts) > 1 and parts[1]:
+                            uv = self._resolve(parts[1], self.uv_total)
+                        if len(parts) > 2:
+                            int(parts[2])
+                        if not self.topology_only:
+                            self._uv_indices.append(uv)
+                    self._counts.append(len(tokens) - 1)
+            except ValueError:
+                self._fail(keyword.decode(errors="replace"))
+
+    def take(self):
+        result = (
+            np.array(self._positions, dtype=POSITION_DTYPE).reshape(-1, 3),
+            np.array(self._uvs, dtype=POSITION_DTYPE).reshape(-1, 3),
+            np.array(self._counts, dtype=np.uint32),
+            np.array(self._indices, dtype=INDEX_DTYPE),
+            np.array(self._uv_indices, dtype=INDEX_DTYPE),
+        )
+        self._clear()
+        return result
+
+
+def _pyParseNumbers(data):
+    try:
+        return np.array(data.split(), dtype=np.float64)
+    except ValueError as error:
+        raise ValueError(f"not a number: {error}") from None
+
+
+def _pyDecodeTextLists(values, before, after, max_rows):
+    counts, indices = [], []
+    values = values.tolist()
+    pos = 0
+    for _ in range(max_rows):
+        if pos + before >= len(values):
+            break
+        count = values[pos + before]
+        if count < 0 or count != int(count):
+            raise ValueError("bad PLY list count")
+        first = pos + before + 1
+        end = first + int(count)
+        if end + after > len(values):
+            break
+        counts.append(int(count))
+        indices.extend(int(v) for v in values[first:end])
+        pos = end + after
+    return (
+        np.array(counts, dtype=np.uint32),
+        np.array(indices, dtype=INDEX_DTYPE),
+        pos,
+    )
+
+
+def _pyDecodeBinaryLists(
+    data, count_type, index_type, before, after, big_endian, max_rows
+):
+    order = ">" if big_endian else "<"
+    count_format = struct.Struct(order + np.dtype(_kPlyTypes[count_type]).char)
+    index_code = np.dtype(_kPlyTypes[index_type]).char
+    index_size = np.dtype(_kPlyTypes[index_type]).itemsize
+    counts, indices = [], []
+    pos = 0
+    for _ in range(max_rows):
+        if pos + before + count_format.size > len(data):
+            break
+        (count,) = count_format.unpack_from(data, pos + before)
+        count = int(count)
+        if count < 0:
+            raise ValueError("bad PLY list count")
+        first = pos + before + count_format.size
+        end = first + count * index_size
+        if end + after > len(data):
+            break
+        counts.append(count)
+        indices.extend(
+            int(v)
+            for v in struct.unpack_from(
+                f"{order}{count}{index_code}", data, first
+            )
+        )
+        pos = end + after
+    return (
+        np.array(counts, dtype=np.uint32),
+        np.array(indices, dtype=INDEX_DTYPE),
+        pos,
+    )
+
+
+if _mesh is not None:
+    _ObjReader = _mesh.ObjReader
+    _parseNumbers = _mesh.parseNumbers
+    _decodeTextLists = _mesh.decodeTextLists
+    _decodeBinaryLists = _mesh.decodeBinaryLists
+else:
+    _ObjReader = _PyObjReader
+    _parseNumbers = _pyParseNumbers
+    _decodeTextLists = _pyDecodeTextLists
+    _decodeBinaryLists = _pyDecodeBinaryLists
+
+
+# -- shared helpers ------------------------------------------------------------
+
+
+def _concatenate(blocks, dtype, columns=0):
+    if blocks:
+        return np.concatenate(blocks)
+    return np.zeros((0, columns) if columns else 0, dtype=dtype)
+
+
+def _offsets(counts):
+    offsets = np.zeros(len(counts) + 1, dtype=OFFSET_DTYPE)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _checkRange(path, ids, total, what):
+    if len(ids) and (int(ids.min()) < 0 or int(ids.max()) >= total):
+        raise ValueError(f"{path}: {what} id out of range (have {total})")
+
+
+def _meshArrays(path, positions, counts, indices, uvs=None, uv_indices=None):
+    """Range-check the parsed arrays and key them by file section."""
+    _checkRange(path, indices, len(positions), "face vertex")
+    arrays = {
+        "positions": positions,
+        "face_offsets": _offsets(counts),
+        "face_indices": indices,
+    }
+    if uvs is not None and len(uvs):
+        arrays["uvs"] = uvs
+        if uv_indices is not None and len(uv_indices) == len(indices):
+            _checkRange(path, uv_indices, len(uvs), "face UV")
+            arrays["face_uv_indices"] = uv_indices
+    return arrays
+
+
+def _faceRows(offsets, indices, uv_indices, prefix, counted):
+    """Format faces as text lines, e.g. 'f 1/1 2/2 3/3' or '3 0 1 2'.
+
+    Args:
+        offsets: CSR offsets of the faces in the block.
+        indices: Face vertex ids (already shifted for the format).
+        uv_indices: Optional UV ids written as v/vt corners.
+        prefix: Line prefix ('f ' for OBJ, '' for PLY).
+        counted: Start each line with the corner count (PLY).
+    """
+    counts = np.diff(offsets)
+    if len(counts) and (counts == counts[0]).all():
+        # uniform block: one % template for all faces
+        n = int(counts[0])
+        corner = "%d" if uv_indices is None else "%d/%d"
+        line = prefix + (f"{n} " if counted else "") + " ".join([corner] * n)
+        if uv_indices is not None:
+            values = np.stack([indices, uv_indices], axis=1).reshape(-1)
+        else:
+            values = indices
+        return ((line + "\n") * len(counts)) % tuple(values.tolist())
+    if uv_indices is None:
+        tokens = list(map(str, indices.tolist()))
+    else:
+        tokens = [
+            f"{v}/{t}" for v, t in zip(indices.tolist(), uv_indices.tolist())
+        ]
+    bounds = offsets.tolist()
+    lines = []
+    for f in range(len(counts)):
+        head = prefix + (f"{counts[f]} " if counted else "")
+        lines.append(head + " ".join(tokens[bounds[f] : bounds[f + 1]]) + "\n")
+    return "".join(lines)
+
+
+def _faceBlocks(arrays):
+    """Yield (local offsets, indices, uv indices or None) per block."""
+    offsets = np.asarray(arrays["face_offsets"], dtype=OFFSET_DTYPE)
+    indices = np.asarray(arrays["face_indices"], dtype=INDEX_DTYPE)
+    uv_indices = arrays.get("face_uv_indices")
+    if uv_indices is not None:
+        uv_indices = np.asarray(uv_indices, dtype=INDEX_DTYPE)
+    for start in range(0, len(offsets) - 1, kWriteRows):
+        local = offsets[start : start + kWriteRows + 1]
+        first, last = int(local[0]), int(local[-1])
+        yield (
+            local - first,
+            indices[first:last],
+            None if uv_indices is None else uv_indices[first:last],
+        )
+
+
+def _rowsText(rows, template):
+    return ((template + "\n") * len(rows)) % tuple(rows.reshape(-1).tolist())
+
+
+# -- OBJ -----------------------------------------------------------------------
+
+
+def readObj(path, topology_only=False, chunk_size=kChunkSize) -> dict:
+    """Read a Wavefront OBJ file in chunks.
+
+    Args:
+        path: File path.
+        topology_only: Skip vt statements and face UV ids.
+        chunk_size: Bytes read per chunk.
+
+    Returns:
+        Dict of section name -> array (see meshTools.meshfile). uvs and
+        face_uv_indices are present only when every face corner has a UV.
+
+    Raises:
+        ImportError: NumPy is not installed.
+        ValueError: Malformed statement or out-of-range face id.
+    """
+    requireNumpy()
+    reader = _ObjReader(topology_only)
+    blocks = ([], [], [], [], [])
+    tail = b""
+    with open(path, "rb") as stream:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            chunk = tail + chunk
+            cut = chunk.rfind(b"\n") + 1
+            tail = chunk[cut:]
+            reader.feed(chunk[:cut])
+            for block, array in zip(blocks, reader.take()):
+                if len(array):
+                    block.append(array)
+    if tail:
+        reader.feed(tail)
+        for block, array in zip(blocks, reader.take()):
+            if len(array):
+                block.append(array)
+    positions = _concatenate(blocks[0], POSITION_DTYPE, 3)
+    counts = _concatenate(blocks[2], np.uint32)
+    indices = _concatenate(blocks[3], INDEX_DTYPE)
+    if topology_only:
+        return _meshArrays(path, positions, counts, indices)
+    uv_indices = _concatenate(blocks[4], INDEX_DTYPE)
+    if len(uv_indices) and int(uv_indices.min()) < 0:
+        # some corners have no UV: drop face UVs rather than guess
+        uv_indices = None
+    return _meshArrays(
+        path,
+        positions,
+        counts,
+        indices,
+        _concatenate(blocks[1], POSITION_DTYPE, 3),
+        uv_indices,
+    )
+
+
+def writeObj(path, arrays: dict) -> None:
+    """Write a dict of section arrays as a Wavefront OBJ file.
+
+    UVs are written with two components unless some have a nonzero w.
+    Faces reference UVs when face_uv_indices is given.
+
+    Args:
+        path: Output file path.
+        arrays: positions, face_offsets, face_indices and optional uvs
+            and face_uv_indices.
+    """
+    requireNumpy()
+    positions = np.asarray(arrays["positions"], dtype=POSITION_DTYPE)
+    uvs = arrays.get("uvs")
+    face_uvs = arrays.get("face_uv_indices") is not None and uvs is not None
+    with open(path, "w", encoding="ascii") as stream:
+        stream.write("# meshTools\n")
+        for start in range(0, len(positions), kWriteRows):
+            block = positions[start : start + kWriteRows]
+            stream.write(_rowsText(block, "v %.9g %.9g %.9g"))
+        if uvs is not None:
+            uvs = np.asarray(uvs, dtype=POSITION_DTYPE).reshape(-1, 3)
+            if not uvs[:, 2].any():
+                uvs = uvs[:, :2]
+            template = "vt" + " %.9g" * uvs.shape[1]
+            for start in range(0, len(uvs), kWriteRows):
+                stream.write(
+                    _rowsText(uvs[start : start + kWriteRows], template)
+                )
+        stream.writelines(
+            _faceRows(
+                offsets,
+                indices + 1,
+                uv_indices + 1 if face_uvs else None,
+                "f ",
+                counted=False,
+            )
+            for offsets, indices, uv_indices in _faceBlocks(arrays)
+        )
+
+
+# -- PLY -----------------------------------------------------------------------
+
+
+class _PlyElement:
+    """One element of a PLY header."""
+
+    def __init__(self, name, count):
+        self.name = name
+        self.count = count
+        # (name, type) for scalars, (name, count type, item type) for lists
+        self.properties = []
+
+    @property
+    def lists(self):
+        return [p for p in self.properties if len(p) == 3]
+
+    def dtype(self, order):
+        return np.dtype(
+            [(p[0], order + _kPlyTypes[p[1]]) for p in self.properties]
+        )
+
+
+def _readPlyHeader(stream, path):
+    """Parse the header; returns (format, elements)."""
+    if stream.readline().strip() != b"ply":
+        raise ValueError(f"{path}: not a PLY file")
+    format = None
+    elements = []
+    while True:
+        line = stream.readline()
+        if not line:
+            raise ValueError(f"{path}: truncated PLY header")
+        tokens = line.decode("ascii", errors="replace").split()
+        if not tokens or tokens[0] in ("comment", "obj_info"):
+            continue
+        keyword = tokens[0]
+        try:
+            if keyword == "end_header":
+                break
+            if keyword == "format":
+                format = tokens[1]
+            elif keyword == "element":
+                elements.append(_PlyElement(tokens[1], int(tokens[2])))
+            elif keyword == "property" and tokens[1] == "list":
+                _, _, count_type, item_type, name = tokens[:5]
+                if not {count_type, item_type} <= _kPlyTypes.keys():
+                    raise ValueError(tokens)
+                elements[-1].properties.append((name, count_type, item_type))
+            elif keyword == "property":
+                if tokens[1] not in _kPlyTypes:
+                    raise ValueError(tokens)
+                elements[-1].properties.append((tokens[2], tokens[1]))
+            else:
+                raise ValueError(keyword)
+        except (IndexError, KeyError, ValueError):
+            raise ValueError(
+                f"{path}: bad PLY header line {line.strip()!r}"
+            ) from None
+    if format not in ("ascii", "binary_little_endian", "binary_big_endian"):
+        raise ValueError(f"{path}: unsupported PLY format {format!r}")
+    return format, elements
+
+
+class _BinaryStream:
+    """Bytes after the header, read on demand in chunks."""
+
+    def __init__(self, stream, path, chunk_size):
+        self.stream = stream
+        self.path = path
+        self.chunk_size = chunk_size
+        self.data = b""
+
+    def fill(self) -> None:
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            raise ValueError(f"{self.path}: truncated PLY data")
+        self.data = self.data + chunk if self.data else chunk
+
+    def take(self, size):
+        while len(self.data) < size:
+            self.fill()
+        data, self.data = self.data[:size], self.data[size:]
+        return data
+
+
+class _TextStream:
+    """Numbers after the header, parsed on demand in chunks."""
+
+    def __init__(self, stream, path, chunk_size):
+        self.stream = stream
+        self.path = path
+        self.chunk_size = chunk_size
+        self.data = np.zeros(0, dtype=np.float64)
+        self.tail = b""
+        self.done = False
+
+    def fill(self) -> None:
+        if self.done:
+            raise ValueError(f"{self.path}: truncated PLY data")
+        chunk = self.stream.read(self.chunk_size)
+        if chunk:
+            chunk = self.tail + chunk
+            # cut after the last whitespace so no number is split
+            cut = max(chunk.rfind(c) for c in (b" ", b"\n", b"\t", b"\r")) + 1
+            chunk, self.tail = chunk[:cut], chunk[cut:]
+        else:
+            chunk, self.tail, self.done = self.tail, b"", True
+        values = _parseNumbers(chunk)
+        self.data = (
+            np.concatenate([self.data, values]) if len(self.data) else values
+        )
+
+    def take(self, size):
+        while len(self.data) < size:
+            self.fill()
+        data, self.data = self.data[:size], self.data[size:]
+        return data
+
+
+def _plyVertices(element, source, binary, order, topology_only):
+    """Read the vertex element; returns (positions, uvs or None)."""
+    names = [p[0] for p in element.properties]
+    if element.lists or not {"x", "y", "z"} <= set(names):
+        raise ValueError(f"{source.path}: PLY vertex needs scalar x, y, z")
+    uv_names = None
+    if not topology_only:
+        uv_names = next(
+            (pair for pair in _kUvNames if set(pair) <= set(names)), None
+        )
+    positions = np.empty((element.count, 3), dtype=POSITION_DTYPE)
+    uvs = None
+    if uv_names is not None:
+        uvs = np.zeros((element.count, 3), dtype=POSITION_DTYPE)
+    dtype = element.dtype(order)
+    rows_per_chunk = max(1, source.chunk_size // dtype.itemsize)
+    columns = [names.index(n) for n in ("x", "y", "z")]
+    uv_columns = [names.index(n) for n in uv_names] if uv_names else None
+    for start in range(0, element.count, rows_per_chunk):
+        rows = min(rows_per_chunk, element.count - start)
+        if binary:
+            block = np.frombuffer(source.take(rows * dtype.itemsize), dtype)
+            positions[start : start + rows] = np.stack(
+                [block[n] for n in ("x", "y", "z")], axis=1
+            )
+            if uvs is not None:
+                uvs[start : start + rows, :2] = np.stack(
+                    [block[n] for n in uv_names], axis=1
+                )
+        else:
+            block = source.take(rows * len(names)).reshape(rows, len(names))
+            positions[start : start + rows] = block[:, columns]
+            if uvs is not None:
+                uvs[start : start + rows, :2] = block[:, uv_columns]
+    return positions, uvs
+
+
+def _plyFaces(element, source, binary, big_endian):
+    """Read the face element; returns (counts, indices)."""
+    lists = element.lists
+    if len(lists) != 1 or lists[0][0] not in _kFaceLists:
+        raise ValueError(
+            f"{source.path}: PLY face needs one vertex_indices list and "
+            "no other list properties"
+        )
+    position = element.properties.index(lists[0])
+    if binary:
+        sizes = [
+            np.dtype(_kPlyTypes[p[1]]).itemsize for p in element.properties
+        ]
+    else:
+        sizes = [1] * len(element.properties)
+    before = sum(sizes[:position])
+    after = sum(sizes[position + 1 :])
+    counts, indices = [], []
+    remaining = element.count
+    while remaining:
+        if binary:
+            block_counts, block_indices, used = _decodeBinaryLists(
+                source.data,
+                lists[0][1],
+                lists[0][2],
+                before,
+                after,
+                big_endian,
+                remaining,
+            )
+        else:
+            block_counts, block_indices, used = _decodeTextLists(
+                source.data, before, after, remaining
+            )
+        if not len(block_counts):
+            source.fill()
+            continue
+        source.data = source.data[used:]
+        counts.append(block_counts)
+        indices.append(block_indices)
+        remaining -= len(block_counts)
+    counts = _concatenate(counts, np.uint32)
+    if len(counts) and int(counts.min()) < 3:
+        raise ValueError(f"{source.path}: PLY face with fewer than 3 vertices")
+    return counts, _concatenate(indices, INDEX_DTYPE)
+
+
+def readPly(path, topology_only=False, chunk_size=kChunkSize) -> dict:
+    """Read an ASCII or binary PLY file in chunks.
+
+    Per-vertex u, v properties become uvs, with face_uv_indices equal to
+    the face vertex ids.
+
+    Args:
+        path: File path.
+        topology_only: Skip UV properties.
+        chunk_size: Bytes read per chunk.
+
+    Returns:
+        Dict of section name -> array (see meshTools.meshfile).
+
+    Raises:
+        ImportError: NumPy is not installed.
+        ValueError: Unsupported or malformed file, or out-of-range face id.
+    """
+    requireNumpy()
+    with open(path, "rb") as stream:
+        format, elements = _readPlyHeader(stream, path)
+        binary = format != "ascii"
+        big_endian = format == "binary_big_endian"
+        order = ">" if big_endian else "<"
+        if binary:
+            source = _BinaryStream(stream, path, chunk_size)
+        else:
+            source = _TextStream(stream, path, chunk_size)
+        positions = uvs = None
+        counts = np.zeros(0, dtype=np.uint32)
+        indices = np.zeros(0, dtype=INDEX_DTYPE)
+        wanted = {e.name for e in elements} & {"vertex", "face"}
+        for element in elements:
+            if not wanted:
+                break
+            wanted.discard(element.name)
+            if element.name == "vertex":
+                positions, uvs = _plyVertices(
+                    element, source, binary, order, topology_only
+                )
+            elif element.name == "face":
+                counts, indices = _plyFaces(element, source, binary, big_endian)
+            elif element.lists:
+                raise ValueError(
+                    f"{path}: cannot skip PLY element {element.name!r} "
+                    "with list properties"
+                )
+            elif binary:
+                source.take(element.count * element.dtype(order).itemsize)
+            else:
+                source.take(element.count * len(element.properties))
+    if positions is None:
+        raise ValueError(f"{path}: PLY file has no vertex element")
+    return _meshArrays(path, positions, counts, indices, uvs, indices)
+
+
+def writePly(path, arrays: dict, binary=True) -> None:
+    """Write a dict of section arrays as a PLY file.
+
+    UVs are written as per-vertex u, v properties, so only when
+    face_uv_indices equal face_indices (one UV per vertex).
+
+    Args:
+        path: Output file path.
+        arrays: positions, face_offsets, face_indices and optional uvs
+            and face_uv_indices.
+        binary: Write binary_little_endian instead of ascii.
+    """
+    requireNumpy()
+    positions = np.asarray(arrays["positions"], dtype=POSITION_DTYPE)
+    offsets = np.asarray(arrays["face_offsets"], dtype=OFFSET_DTYPE)
+    indices = np.asarray(arrays["face_indices"], dtype=INDEX_DTYPE)
+    uvs = arrays.get("uvs")
+    uv_indices = arrays.get("face_uv_indices")
+    per_vertex = (
+        uvs is not None
+        and uv_indices is not None
+        and len(uvs) >= len(positions)
+        and np.array_equal(np.asarray(uv_indices), indices)
+    )
+    columns = positions
+    properties = ["x", "y", "z"]
+    if per_vertex:
+        uvs = np.asarray(uvs, dtype=POSITION_DTYPE).reshape(-1, 3)
+        columns = np.concatenate([positions, uvs[: len(positions), :2]], axis=1)
+        properties += ["u", "v"]
+    counts = np.diff(offsets)
+    count_type = "uchar" if not len(counts) or counts.max() < 256 else "uint"
+    header = [
+        "ply",
+        f"format {'binary_little_endian' if binary else 'ascii'} 1.0",
+        "comment meshTools",
+        f"element vertex {len(positions)}",
+        *(f"property float {name}" for name in properties),
+        f"element face {len(counts)}",
+        f"property list {count_type} int vertex_indices",
+        "end_header\n",
+    ]
+    count_dtype = np.dtype(_kPlyTypes[count_type]).newbyteorder("<")
+    with open(path, "wb") as stream:
+        stream.write("\n".join(header).encode("ascii"))
+        for start in range(0, len(columns), kWriteRows):
+            block = columns[start : start + kWriteRows]
+            if binary:
+                stream.write(block.astype("<f4").tobytes())
+            else:
+                template = " ".join(["%.9g"] * len(properties))
+                stream.write(_rowsText(block, template).encode("ascii"))
+        for local, ids, _ in _faceBlocks(arrays):
+            if not binary:
+                text = _faceRows(local, ids, None, "", counted=True)
+                stream.write(text.encode("ascii"))
+                continue
+            # count then ids per face, assembled as one byte buffer
+            block_counts = np.diff(local)
+            size = count_dtype.itemsize
+            out = np.empty(len(block_counts) * size + 4 * len(ids), np.uint8)
+            heads = local[:-1] * 4 + np.arange(len(block_counts)) * size
+            is_count = np.zeros(len(out), dtype=bool)
+            for byte in range(size):
+                is_count[heads + byte] = True
+            out[is_count] = block_counts.astype(count_dtype).view(np.uint8)
+            out[~is_count] = ids.astype("<i4").view(np.uint8)
+            stream.write(out.tobytes())
@@ -1,4 +1,4 @@
-"""Geometry module: vectors, transforms, bounding boxes, rays, polygons.
+"""Geometry module: vectors, transforms, bounding boxes, rays, polygons, BVH.
 
 Exposes C extension primitives when available (_geometry), otherwise imports
 from the top-level build. Provides Point as a Vector subclass with optional
@@ -9,10 +9,12 @@ parent face tracking.
 try:
     from ._geometry import (
         BBox,
+        Bvh,
         Transform,
         Vector,
         Ray,
         Polygon,
+        VectorArray,
         epsilonTest,
         pointInPoly,
         interpolateBezier,
@@ -21,15 +23,19 @@ try:
         solveCubic,
         fit,
         getBarycentric,
+        rangeBounds,
         sortedVectorArray,
+        triangulatePolygons,
     )
 except ImportError:
     from _geometry import (
         BBox,
+        Bvh,
         Transform,
         Vector,
         Ray,
         Polygon,
+        VectorArray,
         epsilonTest,
         pointInPoly,
         interpolateBezier,
@@ -38,7 +44,9 @@ except ImportError:
         solveCubic,
         fit,
         getBarycentric,
+        rangeBounds,
         sortedVectorArray,
+        triangulatePolygons,
     )
 
 # Backward compatibility: OBBox was used in mesh.py for oriented bbox
@@ -46,6 +54,7 @@ OBBox = BBox
 
 __all__ = [
     "BBox",
+    "Bvh",
     "OBBox",
     "EPSILON",
     "Point",
@@ -53,6 +62,7 @@ __all__ = [
     "Ray",
     "Transform",
     "Vector",
+    "VectorArray",
     "epsilonTest",
     "fit",
     "getBarycentric",
@@ -60,8 +70,10 @@ __all__ = [
     "interpolateCatmullRom",
     "lerp",
     "pointInPoly",
+    "rangeBounds",
     "solveCubic",
     "sortedVectorArray",
+    "triangulatePolygons",
 ]
 
 EPSILON = 0.000001
@@ -0,0 +1,309 @@
+"""Sparse Laplacian smoothing over CSR mesh adjacency.
+
+LaplacianRelax builds the uniform or cotangent Laplacian of a vertex
+selection once, as a CSR matrix, and then runs smoothing iterations as
+sparse mat-vec products on an (N, 3) position array. The implicit
+(backward-Euler) mode solves (D + factor * (D - A)) x' = D x for each step
+with a Jacobi-preconditioned conjugate gradient, so large factors stay
+stable.
+
+Unselected vertices are fixed and act as boundary conditions.
+"""
+
+from __future__ import annotations
+
+from .buffers import OFFSET_DTYPE, MeshBuffers, np, requireNumpy
+
+__all__ = ["CsrMatrix", "LaplacianRelax", "conjugateGradient"]
+
+_kWeights = ("uniform", "cotangent")
+
+
+class CsrMatrix:
+    """Minimal compressed sparse row matrix for mat-vec products."""
+
+    def __init__(self, indptr, indices, data, shape: tuple):
+        """Wrap CSR arrays.
+
+        Args:
+            indptr: Row offsets, length rows + 1.
+            indices: Column ids, length nnz.
+            data: Values, length nnz.
+            shape: (rows, columns).
+        """
+        requireNumpy()
+        self.indptr = np.asarray(indptr, dtype=OFFSET_DTYPE)
+        self.indices = np.asarray(indices, dtype=OFFSET_DTYPE)
+        self.data = np.asarray(data, dtype=np.float64)
+        self.shape = (int(shape[0]), int(shape[1]))
+        starts = self.indptr[:-1]
+        self._nonempty = starts < self.indptr[1:]
+        self._starts = starts[self._nonempty]
+
+    @classmethod
+    def fromCoo(cls, rows, cols, data, shape: tuple) -> CsrMatrix:
+        """Build from coordinate triplets; duplicates are summed.
+
+        Args:
+            rows: Row ids.
+            cols: Column ids.
+            data: Values.
+            shape: (rows, columns).
+
+        Returns:
+            New CsrMatrix with columns sorted within each row.
+        """
+        requireNumpy()
+        rows = np.asarray(rows, dtype=OFFSET_DTYPE)
+        cols = np.asarray(cols, dtype=OFFSET_DTYPE)
+        data = np.asarray(data, dtype=np.float64)
+        keys = rows * shape[1] + cols
+        unique, inverse = np.unique(keys, return_inverse=True)
+        summed = np.bincount(inverse.reshape(-1), data, minlength=len(unique))
+        unique_rows = unique // shape[1]
+        indptr = np.zeros(shape[0] + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(np.bincount(unique_rows, minlength=shape[0]), out=indptr[1:])
+        return cls(indptr, unique % shape[1], summed, shape)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def rowSums(self):
+        """Return the sum of each row."""
+        sums = np.zeros(self.shape[0])
+        if self.nnz:
+            sums[self._nonempty] = np.add.reduceat(self.data, self._starts)
+        return sums
+
+    def matvec(self, x):
+        """Return self @ x for x of shape (columns,) or (columns, k)."""
+        x = np.asarray(x, dtype=np.float64)
+        products = x[self.indices]
+        products *= self.data.reshape((-1,) + (1,) * (x.ndim - 1))
+        out = np.zeros((self.shape[0],) + x.shape[1:])
+        if self.nnz:
+            out[self._nonempty] = np.add.reduceat(products, self._starts)
+        return out
+
+
+def conjugateGradient(
+    matvec, b, x0=None, diagonal=None, tol: float = 1e-8, max_iter=None
+):
+    """Solve A x = b for symmetric positive definite A.
+
+    Columns of b are solved independently in one pass.
+
+    Args:
+        matvec: Callable returning A @ x for x shaped like b.
+        b: Right-hand side, (n,) or (n, k).
+        x0: Initial guess; defaults to zeros.
+        diagonal: Diagonal of A, used as a Jacobi preconditioner.
+        tol: Relative residual tolerance per column.
+        max_iter: Iteration limit; defaults to n.
+
+    Returns:
+        Solution shaped like b.
+    """
+    requireNumpy()
+    b = np.asarray(b, dtype=np.float64)
+    shape = b.shape
+    b = b.reshape(len(b), -1)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, np.float64)
+    x = x.reshape(b.shape)
+    if diagonal is None:
+        inverse = np.ones((len(b), 1))
+    else:
+        inverse = 1.0 / np.asarray(diagonal, np.float64).reshape(-1, 1)
+    if max_iter is None:
+        max_iter = max(len(b), 1)
+
+    def apply(v):
+        return np.asarray(matvec(v.reshape(shape))).reshape(v.shape)
+
+    limit = tol * np.linalg.norm(b, axis=0)
+    r = b - apply(x)
+    z = r * inverse
+    p = z.copy()
+    rz = np.einsum("ij,ij->j", r, z)
+    for _ in range(max_iter):
+        if np.all(np.linalg.norm(r, axis=0) <= limit):
+            break
+        ap = apply(p)
+        pap = np.einsum("ij,ij->j", p, ap)
+        alpha = np.divide(rz, pap, out=np.zeros_like(rz), where=pap != 0)
+        x += alpha * p
+        r -= alpha * ap
+        z = r * inverse
+        rz_next = np.einsum("ij,ij->j", r, z)
+        beta = np.divide(rz_next, rz, out=np.zeros_like(rz), where=rz != 0)
+        p = z + beta * p
+        rz = rz_next
+    return x.reshape(shape)
+
+
+def _uniformWeights(buffers: MeshBuffers):
+    """Return unique directed edge pairs with unit weights."""
+    pairs = buffers.faceEdgePairs().astype(OFFSET_DTYPE)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    stride = int(pairs.max()) + 1 if len(pairs) else 1
+    keys = np.unique(
+        np.concatenate(
+            [
+                pairs[:, 0] * stride + pairs[:, 1],
+                pairs[:, 1] * stride + pairs[:, 0],
+            ]
+        )
+    )
+    pairs = np.stack([keys // stride, keys % stride], axis=1)
+    return pairs, np.ones(len(pairs))
+
+
+def _cotangentWeights(buffers: MeshBuffers):
+    """Return directed pairs with clamped cotangent weights.
+
+    Polygons are fan-triangulated from their first vertex; negative
+    weights (obtuse triangles) are clamped to zero.
+    """
+    offsets = buffers.face_offsets
+    indices = buffers.face_indices.astype(OFFSET_DTYPE)
+    counts = np.diff(offsets)
+    slot_face = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(len(indices)) - offsets[:-1][slot_face]
+    fan = np.flatnonzero((local >= 1) & (local <= counts[slot_face] - 2))
+    tri = np.stack(
+        [indices[offsets[:-1][slot_face[fan]]], indices[fan], indices[fan + 1]],
+        axis=1,
+    )
+    points = buffers.positions.astype(np.float64)
+    pairs = []
+    weights = []
+    for k in range(3):
+        # corner k faces edge (k + 1, k + 2)
+        a, b, c = tri[:, k], tri[:, (k + 1) % 3], tri[:, (k + 2) % 3]
+        u = points[b] - points[a]
+        v = points[c] - points[a]
+        dot = np.einsum("ij,ij->i", u, v)
+        cross = np.linalg.norm(np.cross(u, v), axis=1)
+        cot = np.divide(dot, cross, out=np.zeros_like(dot), where=cross > 0)
+        pairs += [np.stack([b, c], axis=1), np.stack([c, b], axis=1)]
+        weights += [0.5 * cot, 0.5 * cot]
+    pairs = np.concatenate(pairs)
+    weights = np.concatenate(weights)
+    keep = pairs[:, 0] != pairs[:, 1]
+    pairs, weights = pairs[keep], weights[keep]
+    keys = pairs[:, 0] * len(points) + pairs[:, 1]
+    unique, first, inverse = np.unique(
+        keys, return_index=True, return_inverse=True
+    )
+    summed = np.bincount(inverse.reshape(-1), weights, minlength=len(unique))
+    return pairs[first], np.maximum(summed, 0.0)
+
+
+class LaplacianRelax:
+    """Laplacian smoothing of a vertex selection.
+
+    The Laplacian is built once in the constructor; relax() can then be
+    called any number of times on positions of the same mesh.
+    """
+
+    def __init__(self, buffers: MeshBuffers, selection, weights="uniform"):
+        """Build the selection's Laplacian.
+
+        Args:
+            buffers: Mesh faces in CSR form; positions are read for
+                cotangent weights.
+            selection: Vertex ids to smooth.
+            weights: "uniform" (neighbor average) or "cotangent".
+
+        Raises:
+            ValueError: Unknown weights.
+        """
+        requireNumpy()
+        if weights not in _kWeights:
+            raise ValueError(f"weights must be one of {_kWeights}")
+        self.weights = weights
+        self.selection = np.unique(np.asarray(selection, dtype=OFFSET_DTYPE))
+        indices = buffers.face_indices
+        self.vertex_count = max(
+            buffers.vertex_count,
+            int(indices.max()) + 1 if len(indices) else 0,
+            int(self.selection[-1]) + 1 if len(self.selection) else 0,
+        )
+        if weights == "uniform":
+            pairs, values = _uniformWeights(buffers)
+        else:
+            pairs, values = _cotangentWeights(buffers)
+
+        size = len(self.selection)
+        lookup = np.full(self.vertex_count, -1, dtype=OFFSET_DTYPE)
+        lookup[self.selection] = np.arange(size)
+        rows = lookup[pairs[:, 0]]
+        keep = rows >= 0
+        rows, cols, values = rows[keep], pairs[keep, 1], values[keep]
+        self.adjacency = CsrMatrix.fromCoo(
+            rows, cols, values, (size, self.vertex_count)
+        )
+        self.degree = self.adjacency.rowSums()
+        # split columns into free (selected) and fixed vertices
+        local = lookup[cols]
+        inner = local >= 0
+        self._inner = CsrMatrix.fromCoo(
+            rows[inner], local[inner], values[inner], (size, size)
+        )
+        self._outer = CsrMatrix.fromCoo(
+            rows[~inner],
+            cols[~inner],
+            values[~inner],
+            (size, self.vertex_count),
+        )
+
+    def relax(
+        self,
+        positions,
+        factor: float = 1.0,
+        iterations: int = 1,
+        implicit: bool = False,
+        tol: float = 1e-6,
+    ):
+        """Smooth the selected vertices.
+
+        Explicit steps move each vertex toward its weighted neighbor average
+        by factor (Jacobi update). Implicit steps take a backward-Euler step
+        of size factor, stable for any factor.
+
+        Args:
+            positions: (N, 3) array-like of all vertex positions.
+            factor: Step size; 1 moves explicit steps fully to the average.
+            iterations: Number of steps.
+            implicit: Use backward-Euler steps.
+            tol: Relative residual tolerance of the implicit solve.
+
+        Returns:
+            float64 (N, 3) array of smoothed positions.
+        """
+        x = np.array(positions, dtype=np.float64).reshape(-1, 3)
+        sel = self.selection
+        free = self.degree > 0
+        if not len(sel) or not free.any():
+            return x
+        degree = np.where(free, self.degree, 1.0).reshape(-1, 1)
+        if not implicit:
+            moving = sel[free]
+            inverse = 1.0 / degree[free]
+            for _ in range(iterations):
+                average = self.adjacency.matvec(x)[free] * inverse
+                x[moving] += factor * (average - x[moving])
+            return x
+
+        diagonal = (1.0 + factor) * degree
+
+        def matvec(y):
+            return diagonal * y - factor * self._inner.matvec(y)
+
+        for _ in range(iterations):
+            current = x[sel]
+            b = degree * current + factor * self._outer.matvec(x)
+            b[~free] = diagonal[~free] * current[~free]
+            x[sel] = conjugateGradient(matvec, b, current, diagonal, tol)
+        return x
@@ -194,15 +194,7 @@ def remove_valuez(lst: list, value) -> list:
     Returns:
         New list with value removed.
     """
-    find = 0
-    n = copy(lst)
-    while find > -1:
-        find = find(n, value)
-        if find > -1:
-            n.pop(find)
-    if not n:
-        n = []
-    return n
+    return [x for x in lst if x != value]
 
 
 def cycle(lst: list, cycles: int) -> list:
@@ -4,6 +4,7 @@ MayaMesh extends Mesh with OpenMaya MFnMesh loading/saving, Maya selection
 integration, and Maya-specific operations. Requires Maya Python environment.
 """
 
+import itertools
 import logging
 import math
 import random
@@ -12,8 +13,11 @@ import maya.OpenMaya as OpenMaya
 import maya.cmds as cmds
 
 import meshTools.lists as lists
+from meshTools.buffers import np
 from meshTools.geometry import BBox, Point, Transform, Vector, pointInPoly
+from meshTools.maya import transfer
 from meshTools.mesh import Mesh, kGeotype
+from meshTools.normals import faceNormals
 
 logger = logging.getLogger(__name__)
 
@@ -55,59 +59,33 @@ class MayaMesh(Mesh):
                 min=Vector(min.x, min.y, min.z), max=Vector(max.x, max.y, max.z)
             )
 
-        # start_time = time()
-        if kwargs.get("vertices", 0):
-            numVertices = self.meshFn.numVertices()
-            verticesArray = OpenMaya.MFloatPointArray()
-            self.meshFn.getPoints(verticesArray, OpenMaya.MSpace.kWorld)
-
-            for i in range(numVertices):
-                self.vertices.append(
-                    Point(
-                        verticesArray[i][0],
-                        verticesArray[i][1],
-                        verticesArray[i][2],
-                    )
+        # one bulk read for everything requested (see transfer.py)
+        if any(kwargs.get(key, 0) for key in ("vertices", "faces", "normals")):
+            arrays = transfer.readArrays(self.meshFn, uvs=False)
+            if kwargs.get("vertices", 0):
+                self.vertices = [
+                    Point(*p) for p in arrays["positions"].tolist()
+                ]
+            if kwargs.get("faces", 0):
+                offsets = arrays["face_offsets"].tolist()
+                ids = arrays["face_indices"].tolist()
+                self.faces = [ids[a:b] for a, b in itertools.pairwise(offsets)]
+            if kwargs.get("normals", 0):
+                # computed from the world-space positions that were read
+                normals = faceNormals(
+                    arrays["positions"],
+                    arrays["face_offsets"],
+                    arrays["face_indices"],
                 )
-        # elapsed_time = time() - start_time
-        # print(str(elapsed_time)+" Elapsed on loading verts")
-
-        # start_time = time()
-        if kwargs.get("faces", 0):
-            numPolygons = self.meshFn.numPolygons()
-            polyList = OpenMaya.MIntArray()
-            for i in range(numPolygons):
-                self.meshFn.getPolygonVertices(i, polyList)
-                self.faces += [list(polyList)]
-        # elapsed_time = time() - start_time
-        # print(str(elapsed_time)+" Elapsed on loading faces")
-
-        if kwargs.get("normals", 0):
-            numPolygons = self.meshFn.numPolygons()
-            v = OpenMaya.MVector()
-            for i in range(numPolygons):
-                self.meshFn.getPolygonNormal(i, v)
-                self.normals += [Vector(v.x, v.y, v.z)]
-
-        # start_time = time()
+                self.normals = [Vector(*n) for n in normals.tolist()]
+
         if kwargs.get("edges", 0):
             self.loadEdges()
-        # elapsed_time = time() - start_time
-        # print(str(elapsed_time)+" Elapsed on loading edges")
         if kwargs.get("build", 0):
             self.rebuildVertP()
 
     def loadEdges(self):
-        numEdges = self.meshFn.numEdges()
-        pArray = [0, 0]
-        x = OpenMaya.MScriptUtil()
-        x.createFromList(pArray, 2)
-        y = x.asInt2Ptr()
-        for i in range(0, numEdges):
-            self.meshFn.getEdgeVertices(i, y)
-            self.edges.append(
-                [x.getInt2ArrayItem(y, 0, 0), x.getInt2ArrayItem(y, 0, 1)]
-            )
+        self.edges = transfer.readEdges(self.meshFn).tolist()
 
     def tileScatter(
         self,
@@ -318,63 +296,35 @@ class MayaMesh(Mesh):
         # self.meshToMaya()
 
     def meshToMaya(self, **kwargs):
-        polygonCounts_final = OpenMaya.MIntArray()
-        polygonConnects_final = OpenMaya.MIntArray()
-
-        vertexArray_final = OpenMaya.MFloatPointArray()
-        uArray = OpenMaya.MFloatArray()
-        vArray = OpenMaya.MFloatArray()
-        uvConnects = OpenMaya.MIntArray()
-
-        for i in range(len(self.vertices)):
-            vertexArray_final.append(
-                self.vertices[i].x, self.vertices[i].y, self.vertices[i].z
-            )
-            # uArray.append(self.vertices[i].x)
-            # vArray.append(self.vertices[i].z)
-
-        for i in self.faces:
-            id = 0
-            for j in i:
-                if j > len(self.vertices) - 1:
-                    logger.error("segmentation unknown vertex")
-                else:
-                    polygonConnects_final.append(j)
-                id = id + 1
-            polygonCounts_final.append(id)
-        meshFS_n = OpenMaya.MFnMesh()
-
-        if "parent" in kwargs:
-            meshFS_n.create(
-                len(self.vertices),
-                len(self.faces),
-                vertexArray_final,
-                polygonCounts_final,
-                polygonConnects_final,
-                kwargs.get("parent"),
-            )
-        else:
-            meshFS_n.create(
-                len(self.vertices),
-                len(self.faces),
-                vertexArray_final,
-                polygonCounts_final,
-                polygonConnects_final,
+        buffers = self._meshBuffers()
+        offsets, indices = buffers.face_offsets, buffers.face_indices
+        valid = (indices >= 0) & (indices < buffers.vertex_count)
+        if not valid.all():
+            logger.error("segmentation unknown vertex")
+            faces = np.repeat(
+                np.arange(buffers.face_count), buffers.face_counts
             )
-
-        uvs = kwargs.get("uvs", 0)
-        if uvs:
-            for i in range(len(self.uvs)):
-                uArray.append(self.uvs[i].x)
-                vArray.append(self.uvs[i].y)
-            for i in self.face_uvs:
-                for j in i:
-                    if j > len(self.uvs) - 1:
-                        logger.error("segmentation unknown uv")
-                    else:
-                        uvConnects.append(j)
-            meshFS_n.setUVs(uArray, vArray)
-            meshFS_n.assignUVs(polygonCounts_final, uvConnects)
+            counts = np.bincount(faces[valid], minlength=buffers.face_count)
+            offsets = np.concatenate([[0], np.cumsum(counts)])
+            indices = indices[valid]
+
+        uvs = face_uv_indices = None
+        if kwargs.get("uvs", 0):
+            uvs = np.array(
+                [(uv.x, uv.y) for uv in self.uvs], dtype=np.float64
+            ).reshape(-1, 2)
+            face_uv_indices = [j for face in self.face_uvs for j in face]
+            if any(j > len(uvs) - 1 for j in face_uv_indices):
+                logger.error("segmentation unknown uv")
+                face_uv_indices = [j for j in face_uv_indices if j < len(uvs)]
+        meshFS_n = transfer.createMesh(
+            buffers.positions,
+            offsets,
+            indices,
+            uvs,
+            face_uv_indices,
+            parent=kwargs.get("parent"),
+        )
 
         """
 		for i in range(len(self.faces)):
@@ -462,7 +412,7 @@ logger.info("%s Elapsed on loading to mesh class", elapsed_time)
 #m.test()
 #m.meshToMaya(name = 'proxy')
 """
-"""
+r"""
 sl = cmds.ls(sl=True)
 sel_object = sl[0].split('.')[0]
 
@@ -6,21 +6,27 @@ and aligns it to the OBB axes.
 
 from math import degrees
 
-from meshTools.geometry import BBox, Transform, Vector
+from meshTools.chull import orientedBox
+from meshTools.geometry import Transform, Vector
 import maya.cmds as cmds
 
 
 def perform(**kwargs):
-    """Build OBB from current Maya selection and create aligned polyCube."""
+    """Build OBB from current Maya selection and create aligned polyCube.
+
+    Args:
+        method: orientedBox method, "minvolume" (default), "hull" or
+            "covariance".
+    """
+    method = kwargs.get("method", "minvolume")
     sel = cmds.ls(sl=True)
     sel3 = []
     for s in sel:
         sel3 += cmds.xform(s, q=True, ws=True, t=True)
     pointset = []
-    for i in range(len(sel3) / 3):
+    for i in range(len(sel3) // 3):
         pointset += [Vector(sel3[i * 3], sel3[i * 3 + 1], sel3[i * 3 + 2])]
-    bbox = BBox()
-    bbox.obbFromPointSet(pointset)
+    bbox = orientedBox(pointset, method)
     t = Transform(bbox.axis[0], bbox.axis[1], bbox.axis[2])
     t = t.transpose()
     z = t.getEuler()
@@ -0,0 +1,251 @@
+"""Bulk mesh transfer between Maya and flat arrays.
+
+Reading goes through the OpenMaya 2.0 whole-mesh getters (getFloatPoints,
+getVertices, getUVs, getAssignedUVs), one call per attribute instead of one
+per polygon, and returns the same dict of section arrays as
+meshTools.meshfile.readArrays. Writing builds the OpenMaya 1.0 arrays that
+MFnMesh.create takes in one MScriptUtil conversion each, so the result can
+be parented under mesh data created by API 1.0 plugins (see
+tube_deformer.py). Requires NumPy.
+
+API 1.0 mesh data outside the DAG (e.g. a deformer's input mesh) has no
+API 2.0 counterpart; it is read with the API 1.0 whole-mesh getters, which
+return arrays that are converted element by element.
+"""
+
+import maya.api.OpenMaya as om2
+from maya import OpenMaya
+
+from meshTools.buffers import (
+    INDEX_DTYPE,
+    OFFSET_DTYPE,
+    POSITION_DTYPE,
+    np,
+    requireNumpy,
+)
+
+__all__ = [
+    "createMesh",
+    "meshFunctionSet",
+    "readArrayMesh",
+    "readArrays",
+    "readEdges",
+]
+
+
+def meshFunctionSet(target) -> "om2.MFnMesh":
+    """Return an API 2.0 MFnMesh for target.
+
+    Args:
+        target: om2.MFnMesh, om2.MDagPath or om2.MObject, a DAG path name,
+            or an API 1.0 MDagPath / MFnMesh (looked up by full path name).
+    """
+    if isinstance(target, om2.MFnMesh):
+        return target
+    if isinstance(target, (om2.MDagPath, om2.MObject)):
+        return om2.MFnMesh(target)
+    name = target if isinstance(target, str) else target.fullPathName()
+    if not name:
+        raise RuntimeError("mesh is not in the DAG")
+    selection = om2.MSelectionList()
+    selection.add(name)
+    return om2.MFnMesh(selection.getDagPath(0))
+
+
+def readArrays(target, space=om2.MSpace.kWorld, uvs=True, edges=False) -> dict:
+    """Read a Maya mesh into flat arrays.
+
+    Args:
+        target: Mesh to read (see meshFunctionSet).
+        space: Space of the returned positions.
+        uvs: Read the current UV set; face_uv_indices is returned only
+            when every face has UVs.
+        edges: Read Maya's edge list (see readEdges).
+
+    Returns:
+        Dict with positions, face_offsets, face_indices and, when read,
+        uvs, face_uv_indices and edges.
+    """
+    requireNumpy()
+    try:
+        meshFn = meshFunctionSet(target)
+    except RuntimeError:
+        return _readMeshData(target, space, uvs, edges)
+    points = np.array(meshFn.getFloatPoints(space), dtype=POSITION_DTYPE)
+    counts, connects = meshFn.getVertices()
+    arrays = _faceArrays(points, counts, connects)
+    if uvs and meshFn.numUVs():
+        arrays.update(
+            _uvArrays(meshFn.getUVs(), meshFn.getAssignedUVs(), counts)
+        )
+    if edges:
+        arrays["edges"] = readEdges(meshFn)
+    return arrays
+
+
+def _faceArrays(points, counts, connects) -> dict:
+    """positions, face_offsets and face_indices from getter results."""
+    counts = np.array(counts, dtype=OFFSET_DTYPE)
+    offsets = np.zeros(len(counts) + 1, dtype=OFFSET_DTYPE)
+    np.cumsum(counts, out=offsets[1:])
+    return {
+        "positions": points.reshape(-1, 4)[:, :3],
+        "face_offsets": offsets,
+        "face_indices": np.array(connects, dtype=INDEX_DTYPE),
+    }
+
+
+def _uvArrays(uv_values, assigned, counts) -> dict:
+    """uvs and, if every face has UVs, face_uv_indices."""
+    u, v = uv_values
+    uv_counts, uv_ids = assigned
+    uvs = np.zeros((len(u), 3), dtype=POSITION_DTYPE)
+    uvs[:, 0] = u
+    uvs[:, 1] = v
+    arrays = {"uvs": uvs}
+    if np.array_equal(
+        np.array(uv_counts, dtype=OFFSET_DTYPE),
+        np.array(counts, dtype=OFFSET_DTYPE),
+    ):
+        arrays["face_uv_indices"] = np.array(uv_ids, dtype=INDEX_DTYPE)
+    return arrays
+
+
+def _readMeshData(meshFn, space, uvs, edges) -> dict:
+    """readArrays for an API 1.0 MFnMesh that is not in the DAG."""
+    points = OpenMaya.MFloatPointArray()
+    meshFn.getPoints(points, space)
+    counts, connects = OpenMaya.MIntArray(), OpenMaya.MIntArray()
+    meshFn.getVertices(counts, connects)
+    points = [
+        (points[i].x, points[i].y, points[i].z, 1.0)
+        for i in range(points.length())
+    ]
+    arrays = _faceArrays(
+        np.array(points, dtype=POSITION_DTYPE), list(counts), list(connects)
+    )
+    if uvs and meshFn.numUVs():
+        u, v = OpenMaya.MFloatArray(), OpenMaya.MFloatArray()
+        meshFn.getUVs(u, v)
+        uv_counts, uv_ids = OpenMaya.MIntArray(), OpenMaya.MIntArray()
+        meshFn.getAssignedUVs(uv_counts, uv_ids)
+        arrays.update(
+            _uvArrays(
+                (list(u), list(v)), (list(uv_counts), list(uv_ids)), counts
+            )
+        )
+    if edges:
+        arrays["edges"] = readEdges(meshFn)
+    return arrays
+
+
+def readEdges(target):
+    """Return Maya's edges as an int32 (E, 2) array, in Maya edge order.
+
+    There is no whole-mesh getter for edges, so this costs one
+    getEdgeVertices call per edge (without the MScriptUtil round trip of
+    the API 1.0 version).
+    """
+    requireNumpy()
+    try:
+        meshFn = meshFunctionSet(target)
+    except RuntimeError:
+        # API 1.0 mesh data: edge vertices come back through MScriptUtil
+        util = OpenMaya.MScriptUtil()
+        util.createFromList([0, 0], 2)
+        pair = util.asInt2Ptr()
+        edges = []
+        for e in range(target.numEdges()):
+            target.getEdgeVertices(e, pair)
+            edges.append(
+                (
+                    util.getInt2ArrayItem(pair, 0, 0),
+                    util.getInt2ArrayItem(pair, 0, 1),
+                )
+            )
+        return np.array(edges, dtype=INDEX_DTYPE).reshape(-1, 2)
+    getEdgeVertices = meshFn.getEdgeVertices
+    return np.array(
+        [getEdgeVertices(e) for e in range(meshFn.numEdges)],
+        dtype=INDEX_DTYPE,
+    ).reshape(-1, 2)
+
+
+def readArrayMesh(target, space=om2.MSpace.kWorld, uvs=True, edges=False):
+    """Read a Maya mesh straight into an ArrayMesh (no per-vertex objects).
+
+    Arguments are those of readArrays; edges not read are derived from
+    the faces when first used.
+    """
+    from meshTools.array_mesh import ArrayMesh
+
+    arrays = readArrays(target, space, uvs, edges)
+    return ArrayMesh.fromArrays(
+        arrays["positions"],
+        arrays["face_offsets"],
+        arrays["face_indices"],
+        uvs=arrays.get("uvs"),
+        face_uv_indices=arrays.get("face_uv_indices"),
+        edges=arrays.get("edges"),
+    )
+
+
+def _intArray(values) -> "OpenMaya.MIntArray":
+    result = OpenMaya.MIntArray()
+    OpenMaya.MScriptUtil.createIntArrayFromList(
+        np.asarray(values).tolist(), result
+    )
+    return result
+
+
+def _floatArray(values) -> "OpenMaya.MFloatArray":
+    result = OpenMaya.MFloatArray()
+    OpenMaya.MScriptUtil.createFloatArrayFromList(
+        np.asarray(values).tolist(), result
+    )
+    return result
+
+
+def createMesh(
+    positions,
+    face_offsets,
+    face_indices,
+    uvs=None,
+    face_uv_indices=None,
+    parent=None,
+) -> "OpenMaya.MFnMesh":
+    """Create a Maya mesh from flat arrays.
+
+    Args:
+        positions: (N, 3) vertex positions.
+        face_offsets: CSR face offsets, length F + 1.
+        face_indices: Concatenated face vertex ids.
+        uvs: Optional (U, 2) or (U, 3) UVs; only u and v are used.
+        face_uv_indices: Per-corner UV ids laid out like face_indices;
+            required for the UVs to be assigned.
+        parent: Optional API 1.0 parent MObject (transform or mesh data).
+
+    Returns:
+        API 1.0 MFnMesh attached to the new mesh.
+    """
+    requireNumpy()
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    # MFloatPointArray is built from a float[4] array: pad with w = 1
+    homogeneous = np.ones((len(positions), 4))
+    homogeneous[:, :3] = positions
+    util = OpenMaya.MScriptUtil()
+    util.createFromList(homogeneous.reshape(-1).tolist(), homogeneous.size)
+    points = OpenMaya.MFloatPointArray(util.asFloat4Ptr(), len(positions))
+    counts = _intArray(np.diff(np.asarray(face_offsets, dtype=OFFSET_DTYPE)))
+    connects = _intArray(face_indices)
+    meshFn = OpenMaya.MFnMesh()
+    args = (len(positions), len(counts), points, counts, connects)
+    if parent is not None:
+        meshFn.create(*args, parent)
+    else:
+        meshFn.create(*args)
+    if uvs is not None and face_uv_indices is not None:
+        uvs = np.asarray(uvs, dtype=np.float64)
+        meshFn.setUVs(_floatArray(uvs[:, 0]), _floatArray(uvs[:, 1]))
+        meshFn.assignUVs(counts, _intArray(face_uv_indices))
+    return meshFn
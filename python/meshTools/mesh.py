@@ -8,11 +8,12 @@ selection/neighbor utilities.
 import logging
 import math  # degrees,tan,pi,sin,cos,modf
 import random
+from bisect import bisect_left
 from copy import copy
-from time import time
 
 from .geometry import (
     BBox,
+    Bvh,
     EPSILON,
     OBBox,
     Point,
@@ -22,30 +23,74 @@ from .geometry import (
     Vector,
     fit,
     interpolateBezier,
+    triangulatePolygons,
 )
-from .noise import Noise
 
 from . import lists
-from .chull import Hull
-from .delaunay import Delaunay
+from .buffers import INDEX_DTYPE, OFFSET_DTYPE, MeshBuffers, np, requireNumpy
+from .clip import clipPlanes
+from .formats import readObj, readPly, writeObj, writePly
+from .laplacian import LaplacianRelax
 from .lists import CycleList
+from .meshfile import kSections, readArrays, writeArrays
+from .normals import faceNormals, vertexNormals
+from .profiling import profiled
+from .selection import SelectionEngine
+
+# Half-edge topology index; optional C++ extension
+try:
+    from . import _mesh
+except ImportError:
+    try:
+        import _mesh
+    except ImportError:
+        _mesh = None  # type: ignore[assignment]
 
-VERBOSE = 1
 kGeotype = lists.Enumeration("face|edge|vertex")
 kResult = lists.Enumeration("updateVertex|updateMesh|updateSelection")
 
 logger = logging.getLogger(__name__)
 
+# sections OBJ and PLY files can hold
+_kTextSections = (
+    "positions",
+    "face_offsets",
+    "face_indices",
+    "uvs",
+    "face_uv_indices",
+)
+
+
+def _fileFormat(path) -> str:
+    """Lower-case suffix of path: '.obj', '.ply' or anything else (.mtm)."""
+    name = str(path).lower()
+    return name[name.rfind(".") :] if "." in name else ""
+
+
+def edgeKey(v0, v1):
+    """Return the undirected edge key (min(v0, v1), max(v0, v1))."""
+    return (v0, v1) if v0 < v1 else (v1, v0)
+
 
-def printv(*args):
-    """Log debug message if VERBOSE >= last arg (verbosity level)."""
-    if VERBOSE >= args[-1]:
-        logger.debug("%s", args[:-1])
+def _selectionSize(mesh, selection=(), *args, **kwargs):
+    """Element count of a Mesh operation: the size of its selection."""
+    return len(selection)
+
+
+def _faceCount(mesh, *args, **kwargs):
+    """Element count of a whole-mesh operation: its face count."""
+    return len(mesh.faces)
 
 
 class Mesh(object):
     """Polygon mesh: vertices, faces, normals, edges, UVs; supports selection and operations."""
 
+    # bumped whenever mesh.faces is replaced; keys the normals cache
+    _faces_version = 0
+    # edgeKey -> number of face sides using the edge, see _edgeFaceCounts
+    _edge_counts = None
+    _edge_counts_key = -1
+
     def __init__(self):
         self.faces = []
         self.vertices = []
@@ -82,6 +127,500 @@ class Mesh(object):
     def __call__(self):
         return self
 
+    @property
+    def edges(self):
+        return self._edges
+
+    @edges.setter
+    def edges(self, value):
+        self._edges = value
+        self._edge_index = None
+        self._selection_engine = None
+
+    @property
+    def faces(self):
+        return self._faces
+
+    @faces.setter
+    def faces(self, value):
+        self._faces = value
+        self._faces_version += 1
+        self.invalidateTopology()
+
+    @property
+    def normals(self):
+        """Unit face normals, one Vector per face.
+
+        Computed lazily. Edits made through the Mesh API (addFace,
+        updateFace, updateVertex, face deletion) mark the faces they touch,
+        and the next read recomputes just those faces in one batch.
+        Replacing mesh.faces marks every face. Edits made in place on
+        vertices or face lists are not seen; call invalidateNormals() after
+        them.
+        """
+        normals = self._face_normals
+        count = len(self.faces)
+        if (
+            normals is None
+            or self._normals_key != self._normalsKey()
+            or len(normals) > count
+        ):
+            normals = self._computeFaceNormals(None)
+        else:
+            dirty = {face for face in self._dirty_normals if face < count}
+            if len(normals) < count:
+                dirty.update(range(len(normals), count))
+                normals.extend([None] * (count - len(normals)))
+            if dirty:
+                dirty = sorted(dirty)
+                for face, normal in zip(dirty, self._computeFaceNormals(dirty)):
+                    normals[face] = normal
+        self._face_normals = normals
+        self._dirty_normals = set()
+        self._normals_key = self._normalsKey()
+        return normals
+
+    @normals.setter
+    def normals(self, value):
+        self._face_normals = value if isinstance(value, list) else list(value)
+        self._dirty_normals = set()
+        self._vertex_normals = {}
+        self._normals_key = self._normalsKey()
+
+    def invalidateNormals(self):
+        """Mark every face and vertex normal for recomputation.
+
+        Call after moving vertices or editing face lists in place.
+        """
+        self._markNormalsDirty()
+
+    def _normalsKey(self):
+        """Version of the faces and positions the normals cache reflects."""
+        return self._faces_version
+
+    def _normalsFresh(self) -> bool:
+        """True if the normals cache has seen every change so far."""
+        return self._normals_key == self._normalsKey()
+
+    def _markNormalsDirty(self, faces=None, fresh=True) -> None:
+        """Queue face normals for recomputation on the next read.
+
+        Vertex normals are always dropped and rebuilt in one batch.
+
+        Args:
+            faces: Ids of faces whose shape changed; None marks every face.
+            fresh: Result of _normalsFresh() taken before the edit. If the
+                cache had already missed a change, every face is marked.
+        """
+        self._vertex_normals = {}
+        if faces is None or not fresh:
+            self._face_normals = None
+            self._dirty_normals = set()
+        elif self._face_normals is not None:
+            self._dirty_normals.update(faces)
+        self._normals_key = self._normalsKey()
+
+    @profiled(
+        "Mesh.normals",
+        items=lambda mesh, faces: len(mesh.faces if faces is None else faces),
+    )
+    def _computeFaceNormals(self, faces):
+        """Return unit normals (list of Vectors) of face ids, None for all."""
+        if np is None:
+            if faces is None:
+                faces = range(len(self.faces))
+            return [self.__computeFaceNormal(face) for face in faces]
+        normals = faceNormals(*self._faceArrays(faces))
+        return [Vector(*normal) for normal in normals.tolist()]
+
+    def _faceArrays(self, faces=None):
+        """Return (positions, offsets, indices) CSR arrays of face ids.
+
+        Args:
+            faces: Face ids, or None for every face.
+        """
+        if faces is None:
+            buffers = self._meshBuffers()
+            return buffers.positions, buffers.face_offsets, buffers.face_indices
+        # one position row per corner, so the subset needs no remapping
+        vertices = self.vertices
+        rings = [self.faces[face] for face in faces]
+        positions = [
+            (vertices[v].x, vertices[v].y, vertices[v].z)
+            for ring in rings
+            for v in ring
+        ]
+        offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+        np.cumsum([len(ring) for ring in rings], out=offsets[1:])
+        return (
+            np.array(positions, dtype=np.float64).reshape(-1, 3),
+            offsets,
+            np.arange(offsets[-1]),
+        )
+
+    def vertexNormals(self, weighting="area"):
+        """Return unit vertex normals, recomputed in one batch after edits.
+
+        Args:
+            weighting: "area" weights each face by its area, "angle" by the
+                corner angle it makes at the vertex.
+
+        Returns:
+            Read-only float64 (len(vertices), 3) array; zero for vertices
+            not used by any face.
+
+        Raises:
+            ImportError: NumPy is not installed.
+            ValueError: Unknown weighting.
+        """
+        requireNumpy()
+        if not self._normalsFresh():
+            self._markNormalsDirty()
+        normals = self._vertex_normals.get(weighting)
+        if normals is None:
+            buffers = self._meshBuffers()
+            normals = vertexNormals(
+                buffers.positions,
+                buffers.face_offsets,
+                buffers.face_indices,
+                weighting,
+                len(self.vertices),
+            )
+            normals.flags.writeable = False
+            self._vertex_normals[weighting] = normals
+        return normals
+
+    def topology(self):
+        """Return the _mesh half-edge index of the current faces.
+
+        Built on first use and dropped whenever faces are replaced, added,
+        updated or deleted through the Mesh API.
+
+        Returns:
+            _mesh.Mesh, or None if the _mesh extension is not available.
+        """
+        if _mesh is None:
+            return None
+        topology = self._topology
+        if topology is None or topology.faceCount != len(self.faces):
+            topology = self._buildTopology()
+            self._topology = topology
+        return topology
+
+    def _currentTopology(self):
+        """Return the half-edge index if it is built and current, else None.
+
+        For per-vertex queries: rebuilding the whole index after every edit
+        would make a sequence of edit + query steps quadratic.
+        """
+        topology = self._topology
+        if topology is not None and topology.faceCount == len(self.faces):
+            return topology
+        return None
+
+    def invalidateTopology(self):
+        """Drop cached topology (half-edge index, selection engine).
+
+        Call after editing faces in place.
+        """
+        self._topology = None
+        self._selection_engine = None
+        self._edge_counts = None
+
+    def selectionEngine(self):
+        """Return a SelectionEngine over the current faces and edges.
+
+        Built on first use and dropped together with the half-edge index.
+
+        Returns:
+            SelectionEngine, or None if NumPy is not installed.
+        """
+        if np is None:
+            return None
+        engine = self._selection_engine
+        if (
+            engine is None
+            or engine.face_count != len(self.faces)
+            or engine.edge_count != len(self.edges)
+        ):
+            engine = self._buildSelectionEngine()
+            self._selection_engine = engine
+        return engine
+
+    def _buildSelectionEngine(self):
+        buffers = MeshBuffers()
+        buffers.setFaces(self.faces)
+        return SelectionEngine(buffers, self.edges, len(self.vertices))
+
+    @profiled(items=_faceCount)
+    def bvh(self):
+        """Return a Bvh over the faces for batched ray and closest-point queries.
+
+        Faces are fan-triangulated. A list-backed Mesh cannot tell when
+        vertices move, so every call builds a new tree; keep it while the
+        mesh is unchanged. ArrayMesh caches it until its buffers change.
+
+        Returns:
+            Bvh built from the current positions and faces.
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+        requireNumpy()
+        buffers = self._meshBuffers()
+        return Bvh(
+            buffers.positions, buffers.face_offsets, buffers.face_indices
+        )
+
+    def _meshBuffers(self) -> MeshBuffers:
+        """Return positions and faces as MeshBuffers (a snapshot copy)."""
+        buffers = MeshBuffers([(v.x, v.y, v.z) for v in self.vertices])
+        buffers.setFaces(self.faces)
+        return buffers
+
+    @profiled(items=_faceCount)
+    def save(self, path, binary=True) -> None:
+        """Write the mesh to a file; the format follows the suffix.
+
+        .obj and .ply files get positions, faces and UVs (PLY only when
+        there is one UV per vertex; see meshTools.formats). Any other
+        suffix writes the binary .mtm container (see meshTools.meshfile):
+        positions, faces, face normals, edges, UVs and face_uvs as aligned
+        arrays that load() can map without copying. face_uvs are written
+        only when they have one UV id per face corner.
+
+        Args:
+            path: Output file path.
+            binary: Write binary rather than ASCII PLY.
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+        requireNumpy()
+        suffix = _fileFormat(path)
+        if suffix == ".obj":
+            writeObj(path, self._fileArrays(_kTextSections))
+        elif suffix == ".ply":
+            writePly(path, self._fileArrays(_kTextSections), binary=binary)
+        else:
+            writeArrays(path, self._fileArrays())
+
+    @classmethod
+    def load(cls, path, mmap=True, topology_only=False):
+        """Open a mesh written by save(), meshfile.MeshWriter or another
+        tool; the format follows the suffix.
+
+        .obj and .ply files are parsed in chunks (see meshTools.formats).
+        Other files are read as .mtm: with mmap=True the file is mapped
+        copy-on-write and positions and faces are used in place, so
+        opening takes the same time for any mesh size, pages are read from
+        disk when first touched, and edits never reach the file. Edges,
+        UVs and normals become lists on first read. .mtm face vertex ids
+        are not range-checked.
+
+        Args:
+            path: File path.
+            mmap: Map a .mtm file instead of reading it into memory.
+            topology_only: Load positions and faces (and stored edges)
+                only, skipping UVs and normals.
+
+        Returns:
+            ArrayMesh, or cls if it is an ArrayMesh subclass.
+
+        Raises:
+            ImportError: NumPy is not installed.
+            ValueError: Not a valid mesh file.
+        """
+        from .array_mesh import ArrayMesh
+
+        suffix = _fileFormat(path)
+        if suffix == ".obj":
+            arrays = readObj(path, topology_only)
+        elif suffix == ".ply":
+            arrays = readPly(path, topology_only)
+        else:
+            arrays = readArrays(path, mmap)
+            if topology_only:
+                for name in ("normals", "uvs", "face_uv_indices"):
+                    arrays.pop(name, None)
+        if "positions" not in arrays:
+            raise ValueError(f"{path}: mesh file has no positions")
+        target = cls if issubclass(cls, ArrayMesh) else ArrayMesh
+        return target.fromArrays(
+            arrays["positions"],
+            arrays.get("face_offsets", np.zeros(1, dtype=OFFSET_DTYPE)),
+            arrays.get("face_indices", np.zeros(0, dtype=INDEX_DTYPE)),
+            normals=arrays.get("normals"),
+            uvs=arrays.get("uvs"),
+            face_uv_indices=arrays.get("face_uv_indices"),
+            edges=arrays.get("edges"),
+        )
+
+    def _fileArrays(self, names=kSections) -> dict:
+        """Return the arrays save() writes, keyed by file section.
+
+        Args:
+            names: Sections to return; others are not computed.
+        """
+        buffers = self._meshBuffers()
+        arrays = {
+            "positions": buffers.positions,
+            "face_offsets": buffers.face_offsets,
+            "face_indices": buffers.face_indices,
+        }
+        stored = self._storedArrays()
+        if "normals" in names and "normals" not in stored:
+            arrays["normals"] = faceNormals(*self._faceArrays())
+        if "edges" in names and "edges" not in stored and self.edges:
+            arrays["edges"] = self.edges
+        if "uvs" not in stored and self.uvs:
+            arrays["uvs"] = [(uv.x, uv.y, uv.z) for uv in self.uvs]
+        if "face_uv_indices" not in stored and self.face_uvs:
+            face_uvs = self.face_uvs
+            if len(face_uvs) == buffers.face_count and all(
+                len(uvs) == len(face) for uvs, face in zip(face_uvs, self.faces)
+            ):
+                arrays["face_uv_indices"] = [i for uvs in face_uvs for i in uvs]
+        arrays.update(stored)
+        return {
+            name: arrays[name]
+            for name in kSections
+            if name in arrays and name in names
+        }
+
+    def _storedArrays(self) -> dict:
+        """Arrays save() can write as they are (see ArrayMesh)."""
+        return {}
+
+    def _getVertexPositions(self, ids):
+        """Return float64 (len(ids), 3) positions of the given vertices."""
+        vertices = self.vertices
+        return np.array(
+            [(vertices[v].x, vertices[v].y, vertices[v].z) for v in ids],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+
+    def _setVertexPositions(self, ids, positions) -> None:
+        """Write (len(ids), 3) positions back to the given vertices."""
+        for v, p in zip(ids, positions.tolist()):
+            self.updateVertex(v, Point(p))
+
+    @staticmethod
+    def _transformCopies(vertices, transforms):
+        """Return one transformed copy of vertices per transform.
+
+        With NumPy the positions are gathered once and each copy is a single
+        Transform.applyToArray call; otherwise every vertex is transformed
+        with Vector.applyTransform.
+
+        Args:
+            vertices: Sequence of Vectors.
+            transforms: Sequence of Transforms.
+
+        Returns:
+            List of lists of Points, one list per transform.
+        """
+        if np is None:
+            return [
+                [Point(v.applyTransform(t)) for v in vertices]
+                for t in transforms
+            ]
+        positions = np.array(
+            [(v.x, v.y, v.z) for v in vertices], dtype=np.float32
+        ).reshape(-1, 3)
+        out = np.empty_like(positions)
+        copies = []
+        for t in transforms:
+            t.applyToArray(positions, out=out)
+            copies.append([Point(p) for p in out.tolist()])
+        return copies
+
+    def edgeIndex(self):
+        """Return the edgeKey -> edge id map of self.edges.
+
+        Built from self.edges on first use (the first of duplicate edges
+        wins) and kept in sync by addFace, updateFace and the delete paths.
+        Rebuilt if self.edges is replaced or appended to directly. Edges a
+        face loses in updateFace stay until a delete path prunes them, so
+        edge ids are stable during an operation.
+
+        Returns:
+            Dict mapping (min(v0, v1), max(v0, v1)) to an index in self.edges.
+        """
+        if self._edge_index is None or self._edge_index_size != len(
+            self._edges
+        ):
+            index = {}
+            for i, edge in enumerate(self._edges):
+                index.setdefault(edgeKey(edge[0], edge[1]), i)
+            self._edge_index = index
+            self._edge_index_size = len(self._edges)
+        return self._edge_index
+
+    def findEdge(self, v0, v1):
+        """Return the id of the edge joining v0 and v1, or -1."""
+        return self.edgeIndex().get(edgeKey(v0, v1), -1)
+
+    def _addFaceEdges(self, face, counts=None, old=()):
+        # register edges of a new or updated face missing from self.edges;
+        # counts are the edge face counts taken before the edit (None if
+        # stale) and old the vertex list the face had
+        index = self.edgeIndex()
+        for i in range(len(face)):
+            v0, v1 = face[i], face[(i + 1) % len(face)]
+            key = edgeKey(v0, v1)
+            if key not in index:
+                index[key] = len(self._edges)
+                self._edges.append([v0, v1])
+        self._edge_index_size = len(self._edges)
+        if counts is not None:
+            for i in range(len(old)):
+                counts[edgeKey(old[i - 1], old[i])] -= 1
+            for i in range(len(face)):
+                key = edgeKey(face[i - 1], face[i])
+                counts[key] = counts.get(key, 0) + 1
+            self._keepEdgeFaceCounts(counts)
+
+    def _facesKey(self):
+        """Version of the face lists the edge face counts reflect."""
+        return self._faces_version
+
+    def _edgeFaceCounts(self):
+        # edgeKey -> number of face sides using the edge; built on first
+        # use, patched by addFace, updateFace and __deleteFaces
+        if self._freshEdgeFaceCounts() is None:
+            counts = {}
+            for face in self.faces:
+                for i in range(len(face)):
+                    key = edgeKey(face[i - 1], face[i])
+                    counts[key] = counts.get(key, 0) + 1
+            self._keepEdgeFaceCounts(counts)
+        return self._edge_counts
+
+    def _freshEdgeFaceCounts(self):
+        # the edge face counts if no face changed since they were taken
+        if self._edge_counts_key == self._facesKey():
+            return self._edge_counts
+        return None
+
+    def _keepEdgeFaceCounts(self, counts):
+        self._edge_counts = counts
+        self._edge_counts_key = self._facesKey()
+
+    def _deleteEdges(self, keys):
+        # drop edges whose key is in keys; later edge ids shift down
+        if keys:
+            self.edges = [
+                edge
+                for edge in self._edges
+                if edgeKey(edge[0], edge[1]) not in keys
+            ]
+
+    def _buildTopology(self):
+        counts = [len(face) for face in self.faces]
+        indices = [vert for face in self.faces for vert in face]
+        return _mesh.Mesh.fromArrays(self.vertices, counts, indices)
+
     def backup(self):
         self.backup = self
 
@@ -94,6 +633,11 @@ class Mesh(object):
     """                                        SELECTIONS                                             """
 
     def findVertexNeighbor(self, vertex, faces):
+        # a stale index is not rebuilt here: scanning the given faces is
+        # O(len(faces)), while rebuilding is O(mesh)
+        topology = self._currentTopology()
+        if topology is not None:
+            return topology.faceNeighbors(vertex, faces)
         neighbors = []
         for face in faces:
             inface_id = lists.find(self.faces[face], vertex)
@@ -116,139 +660,94 @@ class Mesh(object):
                     neighbors.append(last)
         return neighbors
 
-    def __selectFaceBorders(self, select):
-        border_edges = []
-        # separate by pairs
-        for f in select:
-            for i in range(1, len(self.faces[f])):
-                border_edges.append([self.faces[f][i - 1], self.faces[f][i]])
-            border_edges.append(
-                [self.faces[f][len(self.faces[f]) - 1], self.faces[f][0]]
-            )
-        # remove duplicates
+    def __selectBorderSides(self, select):
+        # directed sides of the selected faces, in selection and face
+        # order, split into border and interior (see
+        # SelectionEngine.borderCorners)
+        engine = self.selectionEngine()
+        if engine is not None:
+            on_border = engine.borderCorners(select, as_mask=True).tolist()
+            offsets = engine.face_offsets.tolist()
+        else:
+            uses = {}
+            for f in select:
+                face = self.faces[f]
+                for i in range(len(face)):
+                    side = (face[i - 1], face[i])
+                    uses[side] = uses.get(side, 0) + 1
         border = []
-        for i in range(0, len(border_edges)):
-            if not (
-                len(lists.duplicates_of(border_edges, border_edges[i])) == 1
-                and len(
-                    lists.duplicates_of(
-                        border_edges, [border_edges[i][1], border_edges[i][0]]
+        interior = []
+        for f in select:
+            face = self.faces[f]
+            for i in range(len(face)):
+                side = [face[i], face[(i + 1) % len(face)]]
+                if engine is not None:
+                    is_border = on_border[offsets[f] + i]
+                else:
+                    is_border = not (
+                        uses[(side[0], side[1])] == 1
+                        and uses.get((side[1], side[0]), 0) == 1
                     )
-                )
-                == 1
-            ):
-                border.append(border_edges[i])
-
-        # sort 2d
-        def srt(k):
-            if len(k) < 1:
-                return []
-            lst = []
-            lst.append(k[0])
-            m = []
-            for i in range(0, len(k)):
-                for j in range(0, len(k)):
-                    if k[j] not in lst:
-                        if lst[len(lst) - 1][1] == k[j][0]:
-                            lst.append(k[j])
-                            break
-            for i in range(0, len(k)):
-                if k[i] not in lst:
-                    m.append(k[i])
-            n = []
-            n.append(lst)
-            n.extend(srt(m))
-            return n
-
-        lst = srt(border)
+                if is_border:
+                    border.append(side)
+                else:
+                    interior.append(side)
+        return border, interior
+
+    @staticmethod
+    def __chainSides(sides):
+        # order directed sides into loops of their start vertices; a loop
+        # starts at the first unused side and follows the first unused
+        # side leaving its end
+        sides = list(dict.fromkeys(tuple(side) for side in sides))
+        leaving = {}
+        for i in range(len(sides) - 1, -1, -1):
+            leaving.setdefault(sides[i][0], []).append(i)
+        used = [False] * len(sides)
+        loops = []
+        for start in range(len(sides)):
+            if used[start]:
+                continue
+            loop = []
+            i = start
+            while i is not None:
+                used[i] = True
+                loop.append(sides[i][0])
+                following = leaving.get(sides[i][1], [])
+                while following and used[following[-1]]:
+                    following.pop()
+                i = following[-1] if following else None
+            loops.append(loop)
+        return loops
 
-        # get first element only
-        border_vertices = []
-        for i in range(0, len(lst)):
-            s = []
-            for j in range(0, len(lst[i])):
-                s.append(lst[i][j][0])
-            border_vertices.append(s)
-        return border_vertices
+    def __selectFaceBorders(self, select):
+        border, _ = self.__selectBorderSides(select)
+        return self.__chainSides(border)
 
     def __selectFaceBordersEx(self, select):
-        border_edges = []
-        # separate by pairs
+        border, border_reject = self.__selectBorderSides(select)
+        border_vertices = self.__chainSides(border)
+        # selected faces around each border loop
+        vertex_faces = {}
         for f in select:
-            for i in range(1, len(self.faces[f])):
-                border_edges.append([self.faces[f][i - 1], self.faces[f][i]])
-            border_edges.append(
-                [self.faces[f][len(self.faces[f]) - 1], self.faces[f][0]]
-            )
-        # remove duplicates
-        border = []
-        border_reject = []
-        for i in range(0, len(border_edges)):
-            if not (
-                len(lists.duplicates_of(border_edges, border_edges[i])) == 1
-                and len(
-                    lists.duplicates_of(
-                        border_edges, [border_edges[i][1], border_edges[i][0]]
-                    )
-                )
-                == 1
-            ):
-                border.append(border_edges[i])
-            else:
-                border_reject.append(border_edges[i])
-
-        # sort 2d
-        def srt(k):
-            if len(k) < 1:
-                return []
-            lst = []
-            lst.append(k[0])
-            m = []
-            for i in range(0, len(k)):
-                for j in range(0, len(k)):
-                    if k[j] not in lst:
-                        if lst[len(lst) - 1][1] == k[j][0]:
-                            lst.append(k[j])
-                            break
-            for i in range(0, len(k)):
-                if k[i] not in lst:
-                    m.append(k[i])
-            n = []
-            n.append(lst)
-            n.extend(srt(m))
-            return n
-
-        lst = srt(border)
-
-        # get first element only
-        border_vertices = []
-        for i in range(0, len(lst)):
-            s = []
-            for j in range(0, len(lst[i])):
-                s.append(lst[i][j][0])
-            border_vertices.append(s)
-        # SLOW get group faces
-        border_group_dup = []
-        for i in range(0, len(border_vertices)):
-            border_group_dup.append([])
-            for k in range(0, len(border_vertices[i])):
-                for j in select:
-                    if border_vertices[i][k] in self.faces[j]:
-                        border_group_dup[len(border_group_dup) - 1].extend([j])
-        # remove group duplicates
+            for vert in self.faces[f]:
+                vertex_faces.setdefault(vert, []).append(f)
         border_group = []
-        for i in range(0, len(border_group_dup)):
-            border_group.append(list(set(border_group_dup[i])))
+        for loop in border_vertices:
+            group = set()
+            for vert in loop:
+                group.update(vertex_faces[vert])
+            border_group.append(list(group))
         return [border_vertices, border_group, border_reject]
 
     def __selectFacesInterior(self, select):
-        all_verts = []
-        for f in select:
-            for i in range(len(self.faces[f])):
-                all_verts.append(self.faces[f][i])
-        border = self.__selectFaceBorders(select)
-        all_verts = list(set(all_verts))
-        return lists.remove_duplicates(all_verts, border[0])
+        engine = self.selectionEngine()
+        if engine is not None:
+            return engine.interior(select).tolist()
+        border, _ = self.__selectBorderSides(select)
+        on_border = {vert for side in border for vert in side}
+        all_verts = list({vert for f in select for vert in self.faces[f]})
+        return [vert for vert in all_verts if vert not in on_border]
 
     def __selectEdgesGroups(self, sel_edges):
         sel_pairs = []
@@ -340,6 +839,14 @@ class Mesh(object):
 
     def __selectConvertVF2(self, edges):
         # select face if exact vertex pair in it| in case of empty edges array
+        topology = self.topology()
+        if topology is not None:
+            sel_faces = []
+            for edge in edges:
+                edge_id = topology.findEdge(edge[0], edge[1])
+                if edge_id != -1:
+                    sel_faces += topology.edgeFaces(edge_id)
+            return list(set(sel_faces))
         mesh_edges = []
         for i in range(0, len(self.faces)):
             mesh_edges.append([])
@@ -364,6 +871,16 @@ class Mesh(object):
 
     def __selectConvertEF(self, edges):
         # select if both edge vertices in face
+        topology = self.topology()
+        if topology is not None:
+            faces = set()
+            for edge in edges:
+                v1, v2 = self.edges[edge][0], self.edges[edge][1]
+                faces.update(
+                    set(topology.vertexFaces(v1))
+                    & set(topology.vertexFaces(v2))
+                )
+            return list(faces)
         faces = []
         for edge in edges:
             v1 = self.edges[edge][0]
@@ -376,6 +893,13 @@ class Mesh(object):
 
     def __selectConvertEF1(self, edges):
         # select if one edge vertex in face
+        topology = self.topology()
+        if topology is not None:
+            faces = set()
+            for edge in edges:
+                faces.update(topology.vertexFaces(self.edges[edge][0]))
+                faces.update(topology.vertexFaces(self.edges[edge][1]))
+            return list(faces)
         faces = []
         for edge in edges:
             v1 = self.edges[edge][0]
@@ -399,23 +923,14 @@ class Mesh(object):
         return edge_verts
 
     def __selectConvertFE(self, faces):
-        edge_verts = []
+        edges = set()
         for face in faces:
             face_verts = self.faces[face]
             for i in range(len(face_verts)):
-                if i == len(face_verts) - 1:
-                    edge_verts.append([face_verts[i], face_verts[0]])
-                    edge_verts.append([face_verts[0], face_verts[i]])
-                else:
-                    edge_verts.append([face_verts[i], face_verts[i + 1]])
-                    edge_verts.append([face_verts[i + 1], face_verts[i]])
-        edges = []
-        for i in range(len(edge_verts)):
-            find = lists.find(self.edges, edge_verts[i])
-            if find != -1:
-                edges.append(find)
-        edges = list(set(edges))
-        return edges
+                find = self.findEdge(face_verts[i - 1], face_verts[i])
+                if find != -1:
+                    edges.add(find)
+        return list(edges)
 
     def __selectConvertVF(self, vertices):
         faces = []
@@ -425,22 +940,90 @@ class Mesh(object):
 
         return faces
 
+    @profiled(items=_selectionSize)
     def selectGrowF(self, sel_faces):
+        engine = self.selectionEngine()
+        if engine is not None:
+            return engine.grow(sel_faces, kGeotype.face).tolist()
         verts = self.__selectConvertFV(sel_faces)
         return self.__selectConvertVF(verts)
 
+    @profiled(items=_selectionSize)
     def selectGrowE(self, sel_edges):
+        engine = self.selectionEngine()
+        if engine is not None:
+            return engine.grow(sel_edges, kGeotype.edge).tolist()
         verts = self.__selectConvertEV(sel_edges)
         return self.__selectConvertVE(verts)
 
+    @profiled(items=_selectionSize)
     def selectGrowV(self, sel_verts):
-        new_verts = []
+        engine = self.selectionEngine()
+        if engine is not None:
+            return engine.grow(sel_verts, kGeotype.vertex).tolist()
+        new_verts = list(sel_verts)
         for vert in sel_verts:
-            new_verts += [
-                self.findVertexNeighbor(vert, self.vertices[vert].parent_faces)
-            ]
-        new_verts = lists.group_duplicates(new_verts)
-        return new_verts
+            new_verts += self.findVertexNeighbor(
+                vert, self.vertices[vert].parent_faces
+            )
+        return lists.group_duplicates(new_verts)
+
+    def __openVertices(self):
+        # vertices on a mesh boundary: on an edge used by a single face
+        return {
+            vert
+            for key, count in self._edgeFaceCounts().items()
+            if count == 1
+            for vert in key
+        }
+
+    @profiled(items=_selectionSize)
+    def selectShrinkF(self, sel_faces):
+        engine = self.selectionEngine()
+        if engine is not None:
+            return engine.shrink(sel_faces, kGeotype.face).tolist()
+        selected = set(sel_faces)
+        open_verts = self.__openVertices()
+        for f in range(len(self.faces)):
+            if f not in selected:
+                open_verts.update(self.faces[f])
+        return [
+            f
+            for f in sorted(selected)
+            if not open_verts.intersection(self.faces[f])
+        ]
+
+    @profiled(items=_selectionSize)
+    def selectShrinkE(self, sel_edges):
+        engine = self.selectionEngine()
+        if engine is not None:
+            return engine.shrink(sel_edges, kGeotype.edge).tolist()
+        selected = set(sel_edges)
+        open_verts = self.__openVertices()
+        for e in range(len(self.edges)):
+            if e not in selected:
+                open_verts.update(self.edges[e])
+        return [
+            e
+            for e in sorted(selected)
+            if not open_verts.intersection(self.edges[e])
+        ]
+
+    @profiled(items=_selectionSize)
+    def selectShrinkV(self, sel_verts):
+        engine = self.selectionEngine()
+        if engine is not None:
+            return engine.shrink(sel_verts, kGeotype.vertex).tolist()
+        selected = set(sel_verts)
+        open_verts = self.__openVertices()
+        for face in self.faces:
+            for i in range(len(face)):
+                a, b = face[i - 1], face[i]
+                if a not in selected:
+                    open_verts.add(b)
+                if b not in selected:
+                    open_verts.add(a)
+        return sorted(selected - open_verts)
 
     def __selectLoopGroupAnchors(self, border):
         anchors = []
@@ -511,15 +1094,18 @@ class Mesh(object):
         return vertices
 
     def __selectConvertVE(self, sel_verts):
+        sel_verts = set(sel_verts)
         sel_edges = []
-        for i in range(len(self.edges)):
-            if self.edges[i][0] in sel_verts:
-                sel_edges += [i]
-            elif self.edges[i][1] in sel_verts:
+        for i, edge in enumerate(self.edges):
+            if edge[0] in sel_verts or edge[1] in sel_verts:
                 sel_edges += [i]
         return sel_edges
 
+    @profiled(items=_selectionSize)
     def selectConvert(self, selection, fromtype, totype):
+        engine = self.selectionEngine()
+        if engine is not None and fromtype != totype:
+            return engine.convert(selection, fromtype, totype).tolist()
         if fromtype == kGeotype.face:
             if totype == kGeotype.edge:
                 return self.__selectConvertFE(selection)
@@ -570,6 +1156,7 @@ class Mesh(object):
         else:
             return 0
 
+    @profiled(items=_selectionSize)
     def selectFByAngle(self, sel_faces, angle=0.0):
         grow_faces = copy(sel_faces)
         for face in grow_faces:
@@ -585,6 +1172,7 @@ class Mesh(object):
                     grow_faces += [grow]
         return grow_faces
 
+    @profiled(items=_selectionSize)
     def selectFByNormal(self, sel_faces, delta=0.05):
         def sort_normals(a, b):
             if a[0].x < b[0].x:
@@ -650,9 +1238,11 @@ class Mesh(object):
 
     """                                        MISCELLANEOUS                                          """
 
+    @profiled(items=_faceCount)
     def recomputeNormals(self):
-        for face in range(len(self.faces)):
-            self.normals.append(self.__computeFaceNormal(face))
+        """Recompute every face normal now and return them."""
+        self._markNormalsDirty()
+        return self.normals
 
     def __spherifyPoint(self, center, radius, vert, factor):
         vert1 = vert - center
@@ -676,6 +1266,8 @@ class Mesh(object):
         return normal
 
     def __computeVertexNormal(self, vert, faces=None):
+        if not faces and np is not None:
+            return Vector(*self.vertexNormals()[vert].tolist())
         if not faces:
             neighbors = self.findVertexNeighbor(
                 vert, self.vertices[vert].parent_faces
@@ -739,6 +1331,7 @@ class Mesh(object):
         # self.faces[0]=new_verts
         return new_verts
 
+    @profiled(items=_selectionSize)
     def __deleteVertices(self, verts):
 
         verts.sort()
@@ -757,7 +1350,6 @@ class Mesh(object):
                     verts_swap = verts_swap[1:]
             i += 1
 
-        start_time = time()
         for k in range(len(swap)):
             self.vertices[verts[k]] = self.vertices[swap[k]]
             faces_involved = self.__selectConvertVF([swap[k]])
@@ -765,38 +1357,65 @@ class Mesh(object):
                 find = lists.find(self.faces[face], swap[k])
                 # uvs should be handled here
                 self.faces[face][find] = verts[k]
-
-        start_time = time() - start_time
-        printv(str(start_time) + " __deleteVertices faces update Elapsed", 2)
+        self.invalidateTopology()
+
+        # drop edges of deleted vertices and rename the moved ones
+        deleted = set(verts)
+        moved = dict(zip(swap, verts))
+        self.edges = [
+            [moved.get(edge[0], edge[0]), moved.get(edge[1], edge[1])]
+            for edge in self.edges
+            if edge[0] not in deleted and edge[1] not in deleted
+        ]
 
         self.vertices = self.vertices[: len(self.vertices) - len(verts)]
 
-    def __deleteNormals(self, faces):
-        start_time = time()
-        # faces.sort()
-
-        new_normals = self.normals[: faces[0]]
+    @profiled()
+    def __deleteNormals(self, faces, fresh):
+        # faces are sorted
+        normals = self._face_normals
+        if normals is None or not fresh:
+            self._markNormalsDirty()
+            return
+        new_normals = normals[: faces[0]]
         for i in range(len(faces) - 1):
-            new_normals += self.normals[faces[i] + 1 : faces[i + 1]]
-        new_normals += self.normals[faces[len(faces) - 1] + 1 :]
+            new_normals += normals[faces[i] + 1 : faces[i + 1]]
+        new_normals += normals[faces[len(faces) - 1] + 1 :]
+        # dirty ids shift down past the deleted faces
+        deleted = set(faces)
+        dirty = [
+            face - bisect_left(faces, face)
+            for face in self._dirty_normals
+            if face not in deleted
+        ]
         self.normals = new_normals
+        self._dirty_normals.update(dirty)
 
-        start_time = time() - start_time
-        logger.debug("%s __deleteNormals Elapsed", start_time)
-
+    @profiled(items=lambda mesh, faces: len(faces))
     def __deleteFaces(self, faces):
         if len(faces) > 0:
-            start_time = time()
+            fresh = self._normalsFresh()
             faces.sort()
+            counts = self._edgeFaceCounts()
+            deleted_keys = set()
+            for face in faces:
+                face_verts = self.faces[face]
+                for i in range(len(face_verts)):
+                    key = edgeKey(face_verts[i - 1], face_verts[i])
+                    counts[key] -= 1
+                    if counts[key] == 0:
+                        # no remaining face uses the edge
+                        deleted_keys.add(key)
+                        del counts[key]
             new_faces = copy(self.faces[: faces[0]])
             for i in range(len(faces) - 1):
                 new_faces += self.faces[faces[i] + 1 : faces[i + 1]]
             new_faces += self.faces[faces[-1] + 1 :]
             self.faces = new_faces
-            start_time = time() - start_time
-            logger.debug("%s __deleteFaces Elapsed", start_time)
+            self._keepEdgeFaceCounts(counts)
+            self._deleteEdges(deleted_keys)
 
-            self.__deleteNormals(faces)
+            self.__deleteNormals(faces, fresh)
 
     def getNormal(self, face):
         return self.normals[face]
@@ -808,25 +1427,56 @@ class Mesh(object):
         return self.vertices[id]
 
     def updateVertex(self, id, value):
+        if not isinstance(value, Point):
+            # Point + Vector arithmetic returns a plain Vector
+            value = Point(value.x, value.y, value.z)
         p = self.vertices[id].parent_faces
         self.vertices[id] = value  # copy(value)
         self.vertices[id].parent_faces = p
+        # without face links (Points assigned directly, rebuildVertP not
+        # run) the faces using the vertex are unknown: mark them all
+        self._markNormalsDirty(p if p else None)
 
     def addFace(self, value):
+        """Append a face.
+
+        Edges of the face missing from self.edges are appended to it, so
+        edge ids already in self.edges (e.g. from loadEdges) keep their
+        order and the new ones follow.
+
+        Args:
+            value: List of vertex ids.
+        """
         # uvs should be handled here
+        counts = self._freshEdgeFaceCounts()
         self.faces.append(value)
-        self.normals.append(self.__computeFaceNormal(len(self.faces) - 1))
+        self.invalidateTopology()
+        self._addFaceEdges(value, counts)
+        self._markNormalsDirty([len(self.faces) - 1])
         for i in value:
             self.vertices[i].parent_faces += [len(self.faces) - 1]
 
     def updateFace(self, id, value):
+        """Replace the vertex list of a face.
+
+        Like addFace, edges the new list adds are appended to self.edges.
+        Edges the face loses stay until a delete path prunes them.
+
+        Args:
+            id: Face id.
+            value: List of vertex ids.
+        """
         # uvs should be handled here
+        counts = self._freshEdgeFaceCounts()
+        old = self.faces[id]
         for vert in self.faces[id]:
             self.vertices[vert].parent_faces = lists.remove_valuez(
                 self.vertices[vert].parent_faces, id
             )
         self.faces[id] = copy(value)
-        self.normals[id] = self.__computeFaceNormal(id)
+        self.invalidateTopology()
+        self._addFaceEdges(value, counts, old)
+        self._markNormalsDirty([id])
         for vert in self.faces[id]:
             self.vertices[vert].parent_faces += [id]
 
@@ -842,17 +1492,16 @@ class Mesh(object):
             + self.faces[id][find_id + 1 :],
         )
 
+    @profiled(items=_faceCount)
     def rebuildVertP(self):
         # add face links to vertices
-        start_time = time()
+        self.invalidateTopology()
 
         for i in range(len(self.vertices)):
             self.vertices[i].parent_faces = []
         for i in range(len(self.faces)):
             for vert in self.faces[i]:
                 self.vertices[vert].parent_faces += [i]
-        start_time = time() - start_time
-        logger.debug("%s rebuildVertP Elapsed", start_time)
 
     def __connectFace(self, sel_face, first, second, connections):
         # first and second are ids | corner not implemented
@@ -932,12 +1581,10 @@ class Mesh(object):
         for v in o.vectors:
             self.addVertex(v)
 
+    @profiled()
     def multiDuplicateTransform(self, mesh, matrix, **kwargs):
-        new_vertices = []
         old_vcount = len(self.vertices)
-        for i in range(len(mesh.vertices)):
-            new_vertices += [mesh.vertices[i].applyTransform(matrix)]
-        self.vertices += new_vertices
+        self.vertices += self._transformCopies(mesh.vertices, [matrix])[0]
         do_faces = kwargs.get("faces", 1)
         if do_faces:
             new_faces = []
@@ -947,6 +1594,7 @@ class Mesh(object):
                     new_faces[-1] += [mesh.faces[i][j] + old_vcount]
             self.faces += new_faces
 
+    @profiled(items=_selectionSize)
     def gridTasselate(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         step_size = kwargs.get("step_size", 1)
@@ -962,33 +1610,23 @@ class Mesh(object):
         xsteps = int((self.bbox[1].x - self.bbox[0].x) / step_size) + 1
         ysteps = int((self.bbox[1].y - self.bbox[0].y) / step_size) + 1
         zsteps = int((self.bbox[1].z - self.bbox[0].z) / step_size) + 1
-        printv("xyzsteps", xsteps, ysteps, zsteps, 3)
-        for i in range(xsteps):
-            self.clipPlane(
-                False,
-                Ray(
-                    Vector(self.bbox[0].x + step_size * i, 0, 0),
-                    Vector(1, 0, 0),
-                ),
-            )
-        for i in range(ysteps):
-            self.clipPlane(
-                False,
-                Ray(
-                    Vector(0, self.bbox[0].y + step_size * i, 0),
-                    Vector(0, 1, 0),
-                ),
-            )
-        for i in range(zsteps):
-            self.clipPlane(
-                False,
-                Ray(
-                    Vector(0, 0, self.bbox[0].z + step_size * i),
-                    Vector(0, 0, 1),
-                ),
-            )
+        logger.debug("xyzsteps %s %s %s", xsteps, ysteps, zsteps)
+        rays = [
+            Ray(Vector(self.bbox[0].x + step_size * i, 0, 0), Vector(1, 0, 0))
+            for i in range(xsteps)
+        ]
+        rays += [
+            Ray(Vector(0, self.bbox[0].y + step_size * i, 0), Vector(0, 1, 0))
+            for i in range(ysteps)
+        ]
+        rays += [
+            Ray(Vector(0, 0, self.bbox[0].z + step_size * i), Vector(0, 0, 1))
+            for i in range(zsteps)
+        ]
+        self.clipPlanes(rays, False)
         return [kResult.updateMesh]
 
+    @profiled(items=_faceCount)
     def delaunay(self):
         def addSphere(c, r):
             self.addVertex(c)
@@ -1004,6 +1642,8 @@ class Mesh(object):
                 z = ze + c.z
                 self.addVertex(Point(x, y, z))
 
+        from .delaunay import Delaunay
+
         # d = Delaunay()
         verts = []
         min, max = -10, 10
@@ -1033,6 +1673,7 @@ class Mesh(object):
 
         logger.debug("%s", self)
 
+    @profiled(items=_selectionSize)
     def detach(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         if selection_type != kGeotype.face:
@@ -1056,24 +1697,20 @@ class Mesh(object):
         self.faces = new_faces
         return [kResult.updateMesh]
 
+    @profiled(items=_faceCount)
     def radialSymmetry(self, copies):
         # set attributes not implemented yet
         angle = math.pi / float(copies)
-        self.clipPlane(True, Ray(Vector(0, 0, 0), Vector(0, 0, -1)))
-        self.rebuildVertP()
-        self.clipPlane(
-            True, Ray(Vector(0, 0, 0), Vector(0, 1, 1 / math.tan(angle)))
+        self.clipPlanes(
+            [
+                Ray(Vector(0, 0, 0), Vector(0, 0, -1)),
+                Ray(Vector(0, 0, 0), Vector(0, 1, 1 / math.tan(angle))),
+            ]
         )
 
-        new_vertices = copy(self.vertices)
-
-        t = Transform()
-        t.scale(Vector(1, 1, -1))
+        t = Transform().scale(Vector(1, 1, -1))
         old_vcount = len(self.vertices)
-        for i in range(old_vcount):
-            new_vertices[i] = t.applyTransform(new_vertices[i])
-
-        self.vertices += new_vertices
+        self.vertices += self._transformCopies(self.vertices, [t])[0]
         new_faces = copy(self.faces)
 
         for i in range(len(new_faces)):
@@ -1084,16 +1721,13 @@ class Mesh(object):
 
         sym_vertices = copy(self.vertices)
         sym_faces = copy(self.faces)
-        t_rotate = Transform()
-
-        for i in range(copies - 1):
-            t_rotate.rotateAxis(angle * 2 * (i + 1), Vector(1, 0, 0))
+        rotations = [
+            Transform().rotateAxis(angle * 2 * (i + 1), Vector(1, 0, 0))
+            for i in range(copies - 1)
+        ]
 
-            new_vertices = copy(sym_vertices)
+        for new_vertices in self._transformCopies(sym_vertices, rotations):
             old_vcount = len(self.vertices)
-            for i in range(len(sym_vertices)):
-                new_vertices[i] = t_rotate.applyTransform(new_vertices[i])
-
             self.vertices += new_vertices
             new_faces = copy(sym_faces)
 
@@ -1104,19 +1738,14 @@ class Mesh(object):
             self.faces += new_faces
         return [kResult.updateMesh]
 
+    @profiled(items=_faceCount)
     def symmetry(self):
         # set attributes not implemented yet
         self.clipPlane(True, Ray(Vector(0, 0, 0), Vector(0, 0, -1)))
 
-        new_vertices = copy(self.vertices)
-
-        t = Transform()
-        t.scale(Vector(1, 1, -1))
+        t = Transform().scale(Vector(1, 1, -1))
         old_vcount = len(self.vertices)
-        for i in range(old_vcount):
-            new_vertices[i] = t.applyTransform(new_vertices[i])
-
-        self.vertices += new_vertices
+        self.vertices += self._transformCopies(self.vertices, [t])[0]
         new_faces = copy(self.faces)
 
         for i in range(len(new_faces)):
@@ -1126,195 +1755,107 @@ class Mesh(object):
         self.faces += new_faces
         return [kResult.updateMesh]
 
+    @profiled(items=_faceCount)
     def clipPlane(
-        self, delete_remains=True, ray=Ray(Vector(0, 0, 0), Vector(0, 1, 0))
+        self,
+        delete_remains=True,
+        ray=Ray(Vector(0, 0, 0), Vector(0, 1, 0)),
+        cap=False,
     ):
-        verts_rejected = []
-        verts_sides = []
-        for i in range(len(self.vertices)):
-            ray_test = ray.pointPlaneSide(self.vertices[i])
-            verts_sides.append(ray_test)
-            if not ray_test:
-                verts_rejected += [i]
-
-        faces_involved = []
-        faces_rejected = []
-
-        start_time = time()
-        for i in range(0, len(self.faces)):
-            intersect = 0
-            for j in range(len(self.faces[i])):
-                intersect += verts_sides[self.faces[i][j]]
-            if intersect == 0:
-                faces_rejected += [i]
-            elif intersect < len(self.faces[i]):
-                faces_involved.append(i)
-
-        start_time = time() - start_time
-        printv(start_time, "point side test Elapsed", 2)
-        start_time = time()
-
-        computed_edges = []
-        computed_points = []
-        faces_points = []
-        # compute intersect points
-        for j in range(len(faces_involved)):
-            cycle_face = CycleList(self.faces[faces_involved[j]])
-            faces_points.append([])
-            # computed_edges.append([])
-            for i in range(len(cycle_face)):
-                if (
-                    verts_sides[cycle_face[i]] + verts_sides[cycle_face[i + 1]]
-                    == 1
-                ):
-                    find = lists.find(
-                        computed_edges, [cycle_face[i], cycle_face[i + 1]]
-                    )
-                    if find == -1:
-                        we = ray.segmentPlaneHit(
-                            [
-                                self.vertices[cycle_face[i]],
-                                self.vertices[cycle_face[i + 1]],
-                            ]
-                        )
-                        if we != 0:
-                            # computed_edges[j].extend([[cycle_face[i], cycle_face[i+1]],[cycle_face[i+1], cycle_face[i]]])
-                            computed_edges += [
-                                [cycle_face[i], cycle_face[i + 1]],
-                                [cycle_face[i + 1], cycle_face[i]],
-                            ]
-                            self.addVertex(Point(we.x, we.y, we.z))
-                            faces_points[j].extend([len(self.vertices) - 1])
-                            computed_points += [len(self.vertices) - 1]
-                    else:
-                        faces_points[len(faces_points) - 1].extend(
-                            [computed_points[int(find / 2)]]
-                        )
-
-        start_time = time() - start_time
-        printv(start_time, "intersection Elapsed", 2)
-
-        def sort_by1(a, b):
-            if a[1] > b[1]:
-                return 1
-            elif a[1] == b[1]:
-                return 0
-            else:
-                return -1
+        """Cut the mesh by the plane through ray.origin with normal ray.direction.
+
+        Args:
+            delete_remains: Drop everything below the plane (where
+                ray.pointPlaneSide is False); otherwise keep both halves,
+                split along the plane.
+            ray: Plane as a Ray.
+            cap: Close every cut loop with a face.
+
+        Returns:
+            [kResult.updateMesh]
+        """
+        return self.clipPlanes([ray], delete_remains, cap)
+
+    @profiled(items=_faceCount)
+    def clipPlanes(self, rays, delete_remains=True, cap=False):
+        """Cut the mesh by several planes in one call (see clipPlane).
+
+        Runs meshTools.clip.clipPlanes on the CSR buffers: one vectorized
+        pass per plane, with each cut edge split once. Face UVs are
+        interpolated along cut edges; edges are rebuilt if the mesh had
+        them.
+
+        Args:
+            rays: Planes as Rays, applied in order.
+            delete_remains: Drop everything below each plane.
+            cap: Close every cut loop with a face.
+
+        Returns:
+            [kResult.updateMesh]
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+        requireNumpy()
+        buffers = self._meshBuffers()
+        corner_uvs = None
+        face_count = len(self.faces)
+        has_uvs = bool(self.uvs) and len(self.face_uvs) == face_count
+        if has_uvs:
+            uvs = np.array([(uv.x, uv.y, uv.z) for uv in self.uvs])
+            corner_uvs = uvs[[i for face in self.face_uvs for i in face]]
+        result = clipPlanes(
+            buffers.positions,
+            buffers.face_offsets,
+            buffers.face_indices,
+            rays,
+            keep_both=not delete_remains,
+            cap=cap,
+            corner_data=corner_uvs,
+        )
+        had_edges = bool(self.edges)
+        self._replaceGeometry(
+            result.positions, result.face_counts, result.face_indices
+        )
+        if had_edges:
+            self._rebuildEdges(result.face_counts, result.face_indices)
+        if has_uvs:
+            uvs, uv_ids = np.unique(
+                result.corner_data, axis=0, return_inverse=True
+            )
+            self.uvs = [Vector(*uv) for uv in uvs.tolist()]
+            uv_ids = uv_ids.reshape(-1).tolist()
+            offsets = result.face_offsets.tolist()
+            self.face_uvs = [
+                uv_ids[offsets[f] : offsets[f + 1]]
+                for f in range(len(offsets) - 1)
+            ]
+        return [kResult.updateMesh]
 
-        def build_poly(lst):
-            ll = []
-            lst2 = [x for x in lst if x]
-            if not lst2:
-                return [], []
-            r = lst2[0]
-            for n in lst2[1:]:
-                q = [x for x in r if x in n]
-                if q:
-                    r.extend(n)
-                else:
-                    ll.append(n)
-            return ll, r
-
-        # self.addFace(computed_points)
-
-        start_time = time()
-        for facenum in range(len(faces_involved)):
-            # sort new vertices by signed length
-            sorted_verts = []
-            if len(faces_points[facenum]) > 2:
-                x = self.vertices[faces_points[facenum][0]]
-                y = self.vertices[faces_points[facenum][1]]
-                xy = (x - y).length()
-                sorted_verts += [[faces_points[facenum][0], 0.0]]
-                sorted_verts += [[faces_points[facenum][1], xy]]
-                for j in range(2, len(faces_points[facenum])):
-                    z = self.vertices[faces_points[facenum][j]]
-                    xz = (x - z).length()
-                    yz = (y - z).length()
-                    if xz > yz or yz < xy:
-                        sorted_verts += [[faces_points[facenum][j], xz]]
-                    else:
-                        sorted_verts += [[faces_points[facenum][j], -xz]]
-                sorted_verts.sort(sort_by1)
-                sorted_verts = lists.get_row(sorted_verts, 0)
-                if verts_sides[self.faces[faces_involved[facenum]][0]]:
-                    sorted_verts = sorted_verts[::-1]
+    def _replaceGeometry(self, positions, face_counts, face_indices) -> None:
+        """Replace all vertices and faces with the given arrays.
+
+        Vertex parent_faces links are rebuilt for the new faces.
+        """
+        self.vertices = [Point(p) for p in positions.tolist()]
+        flat = face_indices.tolist()
+        ends = np.cumsum(face_counts).tolist()
+        self.faces = [
+            flat[end - count : end]
+            for end, count in zip(ends, face_counts.tolist())
+        ]
+        self.rebuildVertP()
 
-                pair_sorted_verts = lists.to_pairs(sorted_verts)
-            else:
-                sorted_verts = faces_points[facenum]
-                if not verts_sides[self.faces[faces_involved[facenum]][0]]:
-                    sorted_verts = sorted_verts[::-1]
-                pair_sorted_verts = [sorted_verts]
-
-            edges = self.__selectConvertFEV([faces_involved[facenum]])
-            edges_bottom = copy(edges)
-            for j in range(len(edges)):
-                if (
-                    not verts_sides[edges[j][0]]
-                    and not verts_sides[edges[j][1]]
-                ):
-                    edges[j] = []
-                else:
-                    find = lists.find(computed_edges, edges[j]) / 2
-                    if find > -1:
-                        findy = (
-                            lists.find(sorted_verts, computed_points[find]) / 2
-                        )
-                        if verts_sides[edges[j][0]]:
-                            edges[j] = [edges[j][0]] + pair_sorted_verts[findy]
-                        else:
-                            edges[j] = pair_sorted_verts[findy] + [edges[j][1]]
-            if not delete_remains:
-                for j in range(len(edges_bottom)):
-                    if (
-                        verts_sides[edges_bottom[j][0]]
-                        and verts_sides[edges_bottom[j][1]]
-                    ):
-                        edges_bottom[j] = []
-                    else:
-                        find = lists.find(computed_edges, edges_bottom[j]) / 2
-                        if find > -1:
-                            findy = (
-                                lists.find(sorted_verts, computed_points[find])
-                                / 2
-                            )
-                            if not verts_sides[edges_bottom[j][0]]:
-                                edges_bottom[j] = [
-                                    edges_bottom[j][0]
-                                ] + pair_sorted_verts[findy][::-1]
-                            else:
-                                edges_bottom[j] = pair_sorted_verts[findy][
-                                    ::-1
-                                ] + [edges_bottom[j][1]]
-            ret = []
-            while edges:
-                edges, g = build_poly(edges)
-                ret.append(g)
-            for i in range(len(ret)):
-                ret[i] = lists.group_duplicates(ret[i])
-            self.updateFace(faces_involved[facenum], ret[0])
-            self.addFaces(ret[1:])
-
-            if not delete_remains:
-                ret = []
-                while edges_bottom:
-                    edges_bottom, g = build_poly(edges_bottom)
-                    ret.append(g)
-                for i in range(len(ret)):
-                    ret[i] = lists.group_duplicates(ret[i])
-                self.addFaces([ret[0]])
-                self.addFaces(ret[1:])
-
-        start_time = time() - start_time
-        printv(start_time, "build new faces Elapsed", 2)
-        if delete_remains:
-            self.__deleteVertices(verts_rejected)
-            self.__deleteFaces(faces_rejected)
-        return [kResult.updateMesh]
+    def _rebuildEdges(self, face_counts, face_indices) -> None:
+        """Rebuild the edge list from CSR faces after _replaceGeometry."""
+        buffers = MeshBuffers()
+        buffers.setFacesCSR(face_counts, face_indices)
+        self.edges = buffers.edgePairs().tolist()
 
+    @profiled()
     def generateConvexHull(self, num_verts, vert_count):
+        from .chull import Hull
+
         vert_ids = []
         verts = []
         for i in range(num_verts):
@@ -1328,33 +1869,125 @@ class Mesh(object):
         self.faces = export_hull[0]
         return [kResult.updateMesh]
 
-    def triangulate(self, selection, **kwargs):
+    @profiled(items=_selectionSize)
+    def triangulate(self, selection, threads=1, **kwargs):
+        """Replace the selected faces by triangles.
+
+        With NumPy all selected faces are ear-clipped in one
+        triangulatePolygons call over the CSR buffers; otherwise each face
+        goes through Polygon.triangulate. The triangles are appended after
+        the remaining faces, n - 2 per n-gon in face order. face_uvs
+        aligned with the faces are triangulated alongside them; otherwise
+        they are cleared.
+
+        Args:
+            selection: Component ids, converted to faces if needed.
+            threads: Worker threads for the batched triangulation.
+            **kwargs: selection_type overrides the mesh selection type.
+
+        Returns:
+            [kResult.updateMesh]
+        """
         selection_type = kwargs.get("selection_type", self.selectionType)
         if selection_type != kGeotype.face:
             selection = self.selectConvert(
                 selection, selection_type, kGeotype.face
             )
-        for face in selection:
-            poly_verts = []
-            for i in range(len(self.faces[face])):
-                poly_verts.append(self.vertices[self.faces[face][i]])
-            poly = Polygon(
-                self.vertices, self.faces[face], self.getNormal(face)
-            )
-            triPlainIndices = poly.triangulate()
-            triIndices = []
-            for i in range(len(triPlainIndices) / 3):
-                triIndices += [
-                    [
-                        triPlainIndices[i * 3],
-                        triPlainIndices[i * 3 + 1],
-                        triPlainIndices[i * 3 + 2],
-                    ]
+        has_uvs = bool(self.uvs) and len(self.face_uvs) == len(self.faces)
+        if np is None:
+            face_uvs = []
+            picked = set(selection)
+            if has_uvs:
+                face_uvs = [
+                    uvs
+                    for f, uvs in enumerate(self.face_uvs)
+                    if f not in picked
                 ]
-            self.addFaces(triIndices)
-        self.__deleteFaces(selection)
+            for face in selection:
+                poly = Polygon(
+                    self.vertices, self.faces[face], self.getNormal(face)
+                )
+                flat = poly.triangulate()
+                if has_uvs:
+                    corner_uv = {}
+                    for vert, uv in zip(self.faces[face], self.face_uvs[face]):
+                        corner_uv.setdefault(vert, uv)
+                    face_uvs += [
+                        [corner_uv[vert] for vert in flat[i : i + 3]]
+                        for i in range(0, len(flat) - 2, 3)
+                    ]
+                self.addFaces(
+                    [flat[i : i + 3] for i in range(0, len(flat) - 2, 3)]
+                )
+            self.__deleteFaces(selection)
+            self.rebuildVertP()
+            self.face_uvs = face_uvs
+            return [kResult.updateMesh]
+
+        buffers = self._meshBuffers()
+        counts = buffers.face_counts
+        picked = np.zeros(len(counts), dtype=bool)
+        picked[list(selection)] = True
+        corners = np.repeat(picked, counts)
+        offsets = np.zeros(picked.sum() + 1, dtype=np.int64)
+        np.cumsum(counts[picked], out=offsets[1:])
+        triangles = triangulatePolygons(
+            buffers.positions,
+            offsets,
+            buffers.face_indices[corners],
+            threads=threads,
+        )
+        face_counts = np.concatenate(
+            (counts[~picked], np.full(len(triangles), 3, dtype=counts.dtype))
+        )
+        face_indices = np.concatenate(
+            (
+                buffers.face_indices[~corners],
+                triangles.reshape(-1).astype(buffers.face_indices.dtype),
+            )
+        )
+        face_uvs = []
+        if has_uvs:
+            face_uvs = self.__triangulateFaceUvs(
+                buffers, picked, corners, triangles, face_counts
+            )
+        had_edges = bool(self.edges)
+        self._replaceGeometry(buffers.positions, face_counts, face_indices)
+        if had_edges:
+            self._rebuildEdges(face_counts, face_indices)
+        self.face_uvs = face_uvs
         return [kResult.updateMesh]
 
+    def __triangulateFaceUvs(
+        self, buffers, picked, corners, triangles, face_counts
+    ):
+        # face_uvs for triangulate's output: kept rows of the unpicked
+        # faces, then each triangle vertex takes the uv of the first corner
+        # of its source face with that vertex
+        counts = buffers.face_counts[picked]
+        polygons = np.arange(len(counts))
+        source = np.repeat(polygons, np.maximum(counts - 2, 0))
+        vertex_count = len(buffers.positions)
+        keys = (
+            np.repeat(polygons, counts) * vertex_count
+            + buffers.face_indices[corners]
+        )
+        order = np.argsort(keys, kind="stable")
+        triangle_keys = np.repeat(source, 3) * vertex_count + triangles.reshape(
+            -1
+        )
+        found = order[np.searchsorted(keys[order], triangle_keys)]
+        uvs = np.array(
+            [uv for face in self.face_uvs for uv in face], dtype=np.int64
+        )
+        flat = np.concatenate((uvs[~corners], uvs[corners][found])).tolist()
+        ends = np.cumsum(face_counts).tolist()
+        return [
+            flat[end - count : end]
+            for end, count in zip(ends, face_counts.tolist())
+        ]
+
+    @profiled(items=_selectionSize)
     def makeNgon(self, selection, **kwargs):
         # TODO detect quad faces and apply autoorientation
         selection_type = kwargs.get("selection_type", self.selectionType)
@@ -1405,6 +2038,7 @@ class Mesh(object):
                 self.updateVertex(group[i], p)
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def makePlanar(self, selection, **kwargs):
         # TODO group detect
         selection_type = kwargs.get("selection_type", self.selectionType)
@@ -1435,6 +2069,7 @@ class Mesh(object):
             )
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def dissolve(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         if selection_type != kGeotype.face:
@@ -1452,6 +2087,7 @@ class Mesh(object):
         self.__deleteFaces(selection)
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def noise(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         amount = kwargs.get("amount", 0.5)
@@ -1460,9 +2096,16 @@ class Mesh(object):
                 selection, selection_type, kGeotype.vertex
             )
 
-        start_time = time()
+        from .noise import Noise
+
+        n = Noise()
+        if np is not None:
+            ids = list(selection)
+            positions = self._getVertexPositions(ids)
+            positions[:, 1] += n.turbulenceArray(positions, 2, 1.2, amount)
+            self._setVertexPositions(ids, positions)
+            return [kResult.updateVertex]
         for vert in selection:
-            n = Noise()
             # v = n.snoise(self.vertices[vert])
             # self.pushVertices([vert],v*amount)
             # v = n.vsnoise(self.vertices[vert])
@@ -1487,10 +2130,9 @@ class Mesh(object):
                     self.vertices[vert].z,
                 ),
             )
-        start_time = time() - start_time
-        logger.debug("%s noise Elapsed", start_time)
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def push(self, selection, **kwargs):
         # TODO impement shrink faces for push
         selection_type = kwargs.get("selection_type", self.selectionType)
@@ -1526,35 +2168,68 @@ class Mesh(object):
             )
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def relax(self, selection, **kwargs):
-        # Laplacian smoothing
+        """Laplacian smoothing of the selected vertices.
+
+        With NumPy installed the Laplacian is built once as a sparse matrix
+        (see meshTools.laplacian) and all iterations run as mat-vec products.
+
+        Args:
+            selection: Component ids of selection_type.
+            **kwargs: selection_type, factor (step size, default 1),
+                iterations (default 1), weights ("uniform" or "cotangent"),
+                implicit (backward-Euler steps, stable for large factors).
+
+        Returns:
+            [kResult.updateVertex]
+        """
         selection_type = kwargs.get("selection_type", self.selectionType)
         factor = kwargs.get("factor", 1)
         iterations = kwargs.get("iterations", 1)
+        weights = kwargs.get("weights", "uniform")
+        implicit = kwargs.get("implicit", False)
         if selection_type != kGeotype.vertex:
             selection = self.selectConvert(
                 selection, selection_type, kGeotype.vertex
             )
 
+        if np is not None:
+            buffers = self._meshBuffers()
+            engine = LaplacianRelax(buffers, selection, weights)
+            positions = engine.relax(
+                buffers.positions, factor, iterations, implicit
+            )
+            ids = engine.selection
+            self._setVertexPositions(ids.tolist(), positions[ids])
+            return [kResult.updateVertex]
+        if weights != "uniform" or implicit:
+            requireNumpy()
+
         neighbor_list = []
         for v in selection:
             vertex_faces = self.__selectConvertVF([v])
             neighbor_list += [self.findVertexNeighbor(v, vertex_faces)]
         for iteration in range(iterations):
+            # Jacobi step like LaplacianRelax: every new position is computed
+            # from the previous iteration before any vertex is moved
+            positions = []
             for v in range(len(selection)):
                 newPos = Point()
                 for i in neighbor_list[v]:
                     newPos += self.vertices[i]
                 newPos = newPos / len(neighbor_list[v])
-                self.updateVertex(
-                    selection[v],
-                    self.vertices[selection[v]].lerp(newPos, factor),
+                positions.append(
+                    Point(self.vertices[selection[v]].lerp(newPos, factor))
                 )
+            for v, position in zip(selection, positions):
+                self.updateVertex(v, position)
                 # Additive smoothing
                 # inverse = 1/float(iterations+len(self.vertices[v].neighbor)*factor)
                 # newPos=(newPos+Vector(factor,factor,factor))*inverse
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def spherify(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         factor = kwargs.get("factor", 1)
@@ -1575,9 +2250,8 @@ class Mesh(object):
             radius = kwargs.get("radius")
         else:
             radius = 0
-            v1 = Vector()
             for i in range(0, len(selection)):
-                v1.fromPoints(self.vertices[selection[i]], center)
+                v1 = center - self.vertices[selection[i]]
                 radius += v1.length()
             radius = radius / len(selection)
         for sel_vert in selection:
@@ -1589,6 +2263,7 @@ class Mesh(object):
             )
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def collapse(self, selection, **kwargs):
         # TODO edges and faces groups
         selection_type = kwargs.get("selection_type", self.selectionType)
@@ -1628,6 +2303,7 @@ class Mesh(object):
             self.__deleteFaces(delete_faces)
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def connectVertices(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         if selection_type != kGeotype.vertex:
@@ -1858,6 +2534,7 @@ class Mesh(object):
         elif divisions - 2 == 0:
             new_faces.append(inner_points)
 
+    @profiled(items=_selectionSize)
     def quadChamfer(self, sel_face):
         # ,sel_edges,width,round
 
@@ -1905,8 +2582,10 @@ class Mesh(object):
         )
         self.faces.extend(new_faces)
         self.faces.pop(face)
+        self.invalidateTopology()
         logger.debug("%s", self)
 
+    @profiled(items=_selectionSize)
     def quadChamfer1(self, sel_edges, chamfer_size):
         edges = self.edges
 
@@ -1945,23 +2624,20 @@ class Mesh(object):
                         )
                         neighbor = neighbors[0]
                         edge_vertex = edge_vertex[0]
-                        v2 = Vector()
-                        v2.fromPoints(
-                            self.vertices[neighbor], self.vertices[vertex]
-                        )
+                        v2 = self.vertices[vertex] - self.vertices[neighbor]
                         v2 = v2.normalize()
                         a = -v2.setLength(chamfer_size)
                     else:
                         # corner vertex
-                        v1 = Vector()
-                        v1.fromPoints(
-                            self.vertices[vertex], self.vertices[edge_vertex[0]]
+                        v1 = (
+                            self.vertices[edge_vertex[0]]
+                            - self.vertices[vertex]
                         )
                         v1 = v1.normalize()
 
-                        v2 = Vector()
-                        v2.fromPoints(
-                            self.vertices[edge_vertex[1]], self.vertices[vertex]
+                        v2 = (
+                            self.vertices[vertex]
+                            - self.vertices[edge_vertex[1]]
                         )
                         v2 = v2.normalize()
                         angle = v1.angle(v2)
@@ -1982,6 +2658,7 @@ class Mesh(object):
                     new_face[repl_id] = new_vertex
 
             self.faces[face] = copy(new_face)
+            self.invalidateTopology()
 
         chamfer_data = lists.group_by_1st(chamfer_data)
 
@@ -1989,6 +2666,7 @@ class Mesh(object):
         for chamfer_element in chamfer_data:
             if len(chamfer_element) > 3:
                 self.faces.append(chamfer_element[1:])
+                self.invalidateTopology()
                 self.quadChamfer(len(self.faces) - 1)
             else:
                 for face_t in faces_terminate:
@@ -2011,7 +2689,9 @@ class Mesh(object):
                             + chamfer_element[1:]
                             + self.faces[face_t][repl_id + 1 :]
                         )
+                        self.invalidateTopology()
 
+    @profiled(items=_selectionSize)
     def insertCylinder(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         factor = kwargs.get("factor", self.selectionType)
@@ -2101,11 +2781,13 @@ class Mesh(object):
             self.addVertex(p)
 
             self.faces[len(self.faces) - 2] += [len(self.vertices) - 1]
+            self.invalidateTopology()
 
             rectp = t.applyTransform(rectp)
 
             self.addVertex(p)
             self.faces[len(self.faces) - 1] += [len(self.vertices) - 1]
+            self.invalidateTopology()
 
             p = p.lerp(rectp, 1)
 
@@ -2183,6 +2865,7 @@ class Mesh(object):
         self.__deleteFaces(selection)
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def capParallel(self, selection, **kwargs):
         selection_type = kwargs.get("selection_type", self.selectionType)
         if selection_type != kGeotype.face:
@@ -2195,10 +2878,7 @@ class Mesh(object):
             max_id = 0
             len_max = 0
             for i in range(0, len(face) - 1):
-                v1 = Vector()
-                v1.fromPoints(
-                    self.vertices[face[i]], self.vertices[face[i + 1]]
-                )
+                v1 = self.vertices[face[i + 1]] - self.vertices[face[i]]
                 length = v1.length()
                 if len_max < length:
                     len_max = length
@@ -2233,6 +2913,7 @@ class Mesh(object):
         self.__deleteFaces(selection)
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def extrude(self, selection, **kwargs):
         # TODO Coplanar edges in a row not implemented
         # TODO implement faces interior extrude
@@ -2284,25 +2965,23 @@ class Mesh(object):
                 borders_rejected.append(borders[2][i][0])
 
             for i in range(1, len(borders[0][f])):
-                v1 = Vector()
-                v2 = Vector()
                 if i < len(borders[0][f]) - 1:
-                    v1.fromPoints(
-                        self.vertices[borders[3][f][i]],
-                        self.vertices[borders[3][f][i - 1]],
+                    v1 = (
+                        self.vertices[borders[3][f][i - 1]]
+                        - self.vertices[borders[3][f][i]]
                     )
-                    v2.fromPoints(
-                        self.vertices[borders[3][f][i + 1]],
-                        self.vertices[borders[3][f][i]],
+                    v2 = (
+                        self.vertices[borders[3][f][i]]
+                        - self.vertices[borders[3][f][i + 1]]
                     )
                 else:
-                    v1.fromPoints(
-                        self.vertices[borders[3][f][i]],
-                        self.vertices[borders[3][f][i - 1]],
+                    v1 = (
+                        self.vertices[borders[3][f][i - 1]]
+                        - self.vertices[borders[3][f][i]]
                     )
-                    v2.fromPoints(
-                        self.vertices[borders[3][f][1]],
-                        self.vertices[borders[3][f][i]],
+                    v2 = (
+                        self.vertices[borders[3][f][i]]
+                        - self.vertices[borders[3][f][1]]
                     )
                 v1 = v1.normalize()
                 v2 = v2.normalize()
@@ -2360,6 +3039,7 @@ class Mesh(object):
                 # self.vertices[borders[3][f][i]] += self.vertices[borders[3][f][i]].ruler
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def capCylinder(self, faces):
         # automatic orientation not implemented
 
@@ -2531,6 +3211,7 @@ class Mesh(object):
             # self.relax(grid_vertices,1,10)
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def straightLoop(self, sel_edges):
         borders = self.__selectEdgesGroups(sel_edges)
         t1 = Transform()
@@ -2561,6 +3242,7 @@ class Mesh(object):
                 )
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def scaleGroups(self, selection, scale, **kwargs):
         # TODO group for faces and edges
         selection_type = kwargs.get("selection_type", self.selectionType)
@@ -2587,6 +3269,7 @@ class Mesh(object):
                 t.invert()
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def flowLoop(self, sel_edges, factor=1):
         def list_1dimension(lst):
             n = []
@@ -2631,6 +3314,7 @@ class Mesh(object):
                 #    self.addVertex(pi)
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def slideLoop(self, sel_edges, percent=0.5):
         borders = self.__selectEdgesGroups(sel_edges)
         for border in borders:
@@ -2652,6 +3336,7 @@ class Mesh(object):
                     )
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def spaceLoops(self, sel_edges):
         borders = self.__selectEdgesGroups(sel_edges)
         for border in borders:
@@ -2672,6 +3357,7 @@ class Mesh(object):
                 self.updateVertex(border[i - 1], edge_center - edge_v)
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def centerLoops(self, sel_edges, ellipse_interpolation=False):
         borders = self.__selectEdgesGroups(sel_edges)
         for border in borders:
@@ -2704,6 +3390,7 @@ class Mesh(object):
                 )
         return [kResult.updateVertex]
 
+    @profiled(items=_selectionSize)
     def collapseEdges(self, sel_edges):
         delete_faces = []
         delete_verts = []
@@ -2732,6 +3419,7 @@ class Mesh(object):
             self.__deleteFaces(delete_faces)
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def splitEdges(self, sel_edges):
         # TODO split faces
         borders = self.__selectEdgesGroups(sel_edges)
@@ -2765,6 +3453,7 @@ class Mesh(object):
                 self.updateFace(i, upd_face)
         return [kResult.updateMesh]
 
+    @profiled(items=_selectionSize)
     def connectEdges(self, sel_edges, connections=1):
         # TODO sometimes wrong connections
         new_edges = []
@@ -0,0 +1,290 @@
+"""Binary mesh container with memory-mapped loading.
+
+A .mtm file is a 64-byte file header followed by named array sections.
+Every section is a 64-byte header (name, dtype, rows, columns, byte size)
+followed by the raw little-endian array data, padded so that each header
+and each array starts on a 64-byte boundary. Readers can therefore map the
+file and wrap every section as an array without copying it; pages are
+read from disk only when the array is touched.
+
+Standard sections (all optional except positions):
+
+    positions        float32 (N, 3)  vertex positions
+    face_offsets     int64   (F + 1) CSR face offsets
+    face_indices     int32   (K,)    concatenated face vertex ids
+    normals          float32 (F, 3)  face normals
+    uvs              float32 (U, 3)  UV coordinates
+    face_uv_indices  int32   (K,)    per-corner UV ids, laid out like
+                                     face_indices
+    edges            int32   (E, 2)  edge vertex pairs
+
+Face counts are stored as CSR offsets so that loaded faces can be used by
+MeshBuffers as they are. Unknown sections are kept by readArrays, which
+lets newer files carry extra data.
+
+MeshWriter streams sections to disk piece by piece, so a mesh that does
+not fit in memory can still be written. NumPy is required.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+
+from .buffers import INDEX_DTYPE, OFFSET_DTYPE, POSITION_DTYPE, np, requireNumpy
+
+__all__ = ["MeshWriter", "readArrays", "writeArrays"]
+
+kMagic = b"MTMESH\x00\x01"
+# written first and replaced by kMagic on close, so files left behind by
+# an interrupted writer are rejected instead of read as shorter meshes
+_kPartialMagic = b"MTMESH\x00\x00"
+kVersion = 1
+kAlignment = 64
+
+# magic, version, section count (patched when the writer closes)
+_kFileHeader = struct.Struct("<8sII48x")
+# name, dtype, rows, columns, byte size
+_kSectionHeader = struct.Struct("<24s8sQQQ8x")
+
+# name -> (dtype, columns); columns 0 means a 1-D array
+kSections = {
+    "positions": (POSITION_DTYPE, 3),
+    "face_offsets": (OFFSET_DTYPE, 0),
+    "face_indices": (INDEX_DTYPE, 0),
+    "normals": (POSITION_DTYPE, 3),
+    "uvs": (POSITION_DTYPE, 3),
+    "face_uv_indices": (INDEX_DTYPE, 0),
+    "edges": (INDEX_DTYPE, 2),
+}
+
+
+def _padding(position: int) -> int:
+    return -position % kAlignment
+
+
+def _sectionArray(name: str, rows):
+    """Convert rows to the dtype and shape of section name."""
+    dtype, columns = kSections[name]
+    rows = np.asarray(rows, dtype=np.dtype(dtype).newbyteorder("<"))
+    if columns:
+        return rows.reshape(-1, columns)
+    return rows.reshape(-1)
+
+
+class MeshWriter:
+    """Write a .mtm file section by section.
+
+    Each section is written in one contiguous run: write() calls with the
+    same name append rows, and starting a new name closes the previous
+    section, which cannot be reopened. addFaces streams face_indices and
+    writes face_offsets when the writer closes.
+
+    Example:
+
+        with MeshWriter("scan.mtm") as writer:
+            for block in blocks:
+                writer.addVertices(block)
+            writer.addFaces(counts, indices)
+    """
+
+    def __init__(self, path):
+        """Create path (replacing any existing file) and write its header.
+
+        Args:
+            path: Output file path.
+        """
+        requireNumpy()
+        self._stream = open(path, "wb")  # noqa: SIM115 - closed by close()
+        self._stream.write(_kFileHeader.pack(_kPartialMagic, kVersion, 0))
+        self._written = []
+        self._current = None
+        self._face_counts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # leave the file marked incomplete
+            self._stream.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._stream.closed
+
+    def write(self, name: str, rows) -> None:
+        """Append rows to section name.
+
+        Args:
+            name: One of kSections.
+            rows: Array-like, converted to the section's dtype and columns.
+
+        Raises:
+            ValueError: Unknown section, or the section was already closed.
+        """
+        if name not in kSections:
+            raise ValueError(f"unknown mesh file section {name!r}")
+        if self.closed:
+            raise ValueError("write to a closed MeshWriter")
+        if self._current is None or self._current[0] != name:
+            self._beginSection(name)
+        rows = _sectionArray(name, rows)
+        self._stream.write(rows.tobytes())
+        self._current[2] += len(rows)
+
+    def addVertices(self, positions) -> None:
+        """Append an (M, 3) block of vertex positions."""
+        self.write("positions", positions)
+
+    def addFaces(self, face_counts, face_indices) -> None:
+        """Append faces in CSR form.
+
+        Raises:
+            ValueError: sum(face_counts) != len(face_indices).
+        """
+        counts = np.asarray(face_counts, dtype=OFFSET_DTYPE).reshape(-1)
+        indices = _sectionArray("face_indices", face_indices)
+        if int(counts.sum()) != len(indices):
+            raise ValueError(
+                f"face_counts sum ({int(counts.sum())}) does not match "
+                f"face_indices length ({len(indices)})"
+            )
+        self.write("face_indices", indices)
+        self._face_counts.append(counts)
+
+    def close(self) -> None:
+        """Finish the open section, write face_offsets and the header."""
+        if self.closed:
+            return
+        try:
+            self._endSection()
+            if self._face_counts:
+                counts = np.concatenate(self._face_counts)
+                self._face_counts = []
+                offsets = np.zeros(len(counts) + 1, dtype=OFFSET_DTYPE)
+                np.cumsum(counts, out=offsets[1:])
+                self.write("face_offsets", offsets)
+                self._endSection()
+            self._stream.seek(0)
+            self._stream.write(
+                _kFileHeader.pack(kMagic, kVersion, len(self._written))
+            )
+        finally:
+            self._stream.close()
+
+    def _beginSection(self, name: str) -> None:
+        self._endSection()
+        if name in self._written:
+            raise ValueError(f"section {name!r} was already written")
+        if name == "face_offsets" and self._face_counts:
+            raise ValueError("face_offsets is written by addFaces")
+        start = self._stream.tell()
+        self._stream.write(bytes(_kSectionHeader.size))
+        self._current = [name, start, 0]
+
+    def _endSection(self) -> None:
+        if self._current is None:
+            return
+        name, start, rows = self._current
+        dtype, columns = kSections[name]
+        itemsize = np.dtype(dtype).itemsize * max(columns, 1)
+        end = self._stream.tell()
+        self._stream.seek(start)
+        self._stream.write(
+            _kSectionHeader.pack(
+                name.encode(),
+                np.dtype(dtype).newbyteorder("<").str.encode(),
+                rows,
+                columns,
+                rows * itemsize,
+            )
+        )
+        self._stream.seek(end)
+        self._stream.write(bytes(_padding(end)))
+        self._written.append(name)
+        self._current = None
+
+
+def writeArrays(path, arrays: dict) -> None:
+    """Write a dict of section name -> array as a .mtm file.
+
+    face_offsets is written as given; use MeshWriter.addFaces to write
+    faces from counts.
+    """
+    with MeshWriter(path) as writer:
+        for name, rows in arrays.items():
+            if rows is not None:
+                writer.write(name, rows)
+
+
+def readArrays(path, mmap: bool = True) -> dict:
+    """Read every section of a .mtm file.
+
+    Args:
+        path: File path.
+        mmap: Map the file copy-on-write and return views into it, so
+            opening costs no reads and edits never reach the file. False
+            reads every section into memory.
+
+    Returns:
+        Dict of section name -> array, in file order.
+
+    Raises:
+        ValueError: Not a mesh file, unsupported version, truncated, or a
+            section dtype that is not a plain NumPy dtype.
+    """
+    requireNumpy()
+    size = os.path.getsize(path)
+    with open(path, "rb") as stream:
+        header = stream.read(_kFileHeader.size)
+        if len(header) < _kFileHeader.size:
+            raise ValueError(f"{path}: not a meshTools mesh file")
+        magic, version, count = _kFileHeader.unpack(header)
+        if magic == _kPartialMagic:
+            raise ValueError(
+                f"{path}: incomplete mesh file (writer not closed)"
+            )
+        if magic != kMagic:
+            raise ValueError(f"{path}: not a meshTools mesh file")
+        if version != kVersion:
+            raise ValueError(f"{path}: unsupported mesh file version {version}")
+        sections = []
+        position = _kFileHeader.size
+        for _ in range(count):
+            stream.seek(position)
+            header = stream.read(_kSectionHeader.size)
+            if len(header) < _kSectionHeader.size:
+                raise ValueError(f"{path}: truncated mesh file")
+            name, dtype, rows, columns, nbytes = _kSectionHeader.unpack(header)
+            name = name.rstrip(b"\x00").decode()
+            try:
+                dtype = np.dtype(dtype.rstrip(b"\x00").decode())
+            except (TypeError, ValueError):
+                dtype = None
+            if dtype is None or dtype.hasobject or dtype.itemsize == 0:
+                raise ValueError(f"{path}: bad section dtype")
+            start = position + _kSectionHeader.size
+            if (
+                nbytes != rows * max(columns, 1) * dtype.itemsize
+                or start + nbytes > size
+            ):
+                raise ValueError(f"{path}: truncated mesh file")
+            sections.append((name, dtype, rows, columns, start, nbytes))
+            position = start + nbytes + _padding(start + nbytes)
+
+        data = np.memmap(path, dtype=np.uint8, mode="c") if mmap else None
+        arrays = {}
+        for name, dtype, rows, columns, start, nbytes in sections:
+            shape = (rows, columns) if columns else (rows,)
+            if mmap:
+                array = np.asarray(data[start : start + nbytes]).view(dtype)
+            else:
+                stream.seek(start)
+                array = np.fromfile(
+                    stream, dtype=dtype, count=nbytes // dtype.itemsize
+                )
+            arrays[name] = array.reshape(shape)
+    return arrays
@@ -3,2581 +3,436 @@
 perm: 256-element permutation table for hash indices.
 uniform: 256-element uniform [0,1] values.
 grads2, grads3, grads4: 2D/3D/4D gradient vectors for interpolation.
+
+The tables are stored as one base64 blob (256 uint8 perm entries, then the
+uniform, grads2, grads3 and grads4 values as little-endian float64) and are
+only decoded when first used, so importing meshTools does not build ~2,600
+Python floats that the C++ _noise extension never reads.
 """
 
-perm = [
-    174,
-    170,
-    229,
-    205,
-    0,
-    154,
-    247,
-    103,
-    188,
-    49,
-    143,
-    9,
-    238,
-    162,
-    179,
-    209,
-    120,
-    105,
-    199,
-    48,
-    194,
-    27,
-    202,
-    77,
-    84,
-    3,
-    118,
-    17,
-    11,
-    20,
-    141,
-    58,
-    75,
-    14,
-    234,
-    215,
-    250,
-    248,
-    64,
-    80,
-    51,
-    22,
-    220,
-    175,
-    18,
-    113,
-    181,
-    155,
-    200,
-    56,
-    62,
-    227,
-    185,
-    70,
-    241,
-    122,
-    16,
-    121,
-    47,
-    164,
-    152,
-    13,
-    60,
-    101,
-    246,
-    32,
-    53,
-    251,
-    134,
-    76,
-    232,
-    100,
-    99,
-    90,
-    130,
-    178,
-    240,
-    123,
-    192,
-    8,
-    144,
-    147,
-    193,
-    72,
-    111,
-    207,
-    166,
-    88,
-    233,
-    52,
-    87,
-    150,
-    177,
-    24,
-    91,
-    96,
-    124,
-    254,
-    151,
-    190,
-    214,
-    50,
-    131,
-    115,
-    196,
-    171,
-    244,
-    33,
-    161,
-    6,
-    172,
-    195,
-    142,
-    108,
-    1,
-    106,
-    55,
-    210,
-    114,
-    98,
-    186,
-    216,
-    102,
-    29,
-    125,
-    139,
-    107,
-    59,
-    136,
-    126,
-    203,
-    19,
-    40,
-    218,
-    44,
-    222,
-    201,
-    153,
-    92,
-    169,
-    163,
-    66,
-    93,
-    112,
-    25,
-    208,
-    149,
-    89,
-    168,
-    69,
-    85,
-    4,
-    68,
-    135,
-    206,
-    67,
-    145,
-    65,
-    183,
-    21,
-    82,
-    212,
-    35,
-    38,
-    42,
-    187,
-    173,
-    146,
-    242,
-    211,
-    223,
-    83,
-    74,
-    34,
-    225,
-    15,
-    78,
-    10,
-    182,
-    94,
-    79,
-    243,
-    97,
-    148,
-    189,
-    219,
-    71,
-    73,
-    39,
-    128,
-    138,
-    54,
-    117,
-    61,
-    36,
-    157,
-    160,
-    140,
-    184,
-    46,
-    63,
-    110,
-    253,
-    133,
-    198,
-    255,
-    167,
-    129,
-    217,
-    5,
-    197,
-    23,
-    104,
-    132,
-    239,
-    28,
-    165,
-    249,
-    224,
-    86,
-    45,
-    236,
-    245,
-    235,
-    26,
-    231,
-    81,
-    127,
-    221,
-    12,
-    158,
-    37,
-    228,
-    137,
-    116,
-    30,
-    230,
-    31,
-    176,
-    41,
-    57,
-    252,
-    119,
-    43,
-    2,
-    159,
-    237,
-    226,
-    204,
-    7,
-    156,
-    109,
-    213,
-    180,
-    191,
-    95,
-]
+import sys
+from array import array
+from base64 import b64decode
+
+_TABLES = ("perm", "uniform", "grads2", "grads3", "grads4")
+
+kSize = 256
+
+_BLOB = (
+    b"rqrlzQCa92e8MY8J7qKz0XhpxzDCG8pNVAN2EQsUjTpLDurX+vhAUDMW3K8ScbWbyDg+47lG"
+    b"8XoQeS+kmA08ZfYgNfuGTOhkY1qCsvB7wAiQk8FIb8+mWOk0V5axGFtgfP6XvtYyg3PEq/Qh"
+    b"oQasw45sAWo30nJiuthmHX2LazuIfssTKNos3smZXKmjQl1wGdCVWahFVQREh85DkUG3FVLU"
+    b"IyYqu62S8tPfU0oi4Q9OCrZeT/NhlL3bR0kngIo2dT0knaCMuC4/bv2Fxv+ngdkFxRdohO8c"
+    b"pfngVi3s9esa51F/3QyeJeSJdB7mH7ApOfx3KwKf7eLMB5xt1bS/X4AAUsjay8s/oEmGGnpR"
+    b"7D9scJTQYvPqP6Sq5lj5Vug/ohCgT6Rm6j8ghM++34G8PwCaKv8UOKI/2GBeSpV12z/g60uv"
+    b"FLrkP0Aa1os3s6I/uAtqbPOo4j9e+QCOnc7qP9jyoNZ+PdA/GJVoEsYg1D8wkGG2gsvDPxBV"
+    b"jx5E8uk/cDVqRGLDzT+A+eR3Kx3FPzwjzKSKDu8/4DB5jfEl7T8WchAQQ/TtP9AxJzrCIMA/"
+    b"WIw+97qX0z/YFjfJ/HfLP5BFqueNdus/ok7apSyi6z8uYhb1PpDoP004QQADOuw/qPHjEKUc"
+    b"1T80oRdlFHnmP+ZC8qJvYu4/aOKmhXMc4j8o97RIX7rCP4AgPwL3bdc/OrepJAX/6z/iyxyK"
+    b"eVXuPzgEnW0Q1dI/yCalndJfyT9WurRF+t7lP3IlYD8bCOY/x5ToAPru5z8QpsT8xp+1P8id"
+    b"d45VG9w/AIarz/zwvz+wuJADqmvuP9g6xuSHguo/jKdJUu1M1j+4l6Hh/XTrPxTmFhsSIuY/"
+    b"UhVD8vME6j964obv2ADqP2zJRQVVZt8/gM8Lzg7yoD9g+6S/Jh3dP6HPQCzosu4/sAQSEXhD"
+    b"wD+ELvJ9CV/gP4CI3RlN27M/cPTSUqS3wj8o0XOOAmfWP5Br/pBPjM8/yqqQO0U36z+iJSLE"
+    b"LVXlP4M0vY3+Vek/JJgZdDYK7T+AUWie6ofhP/AFuPf9Z7M/DE0y88xM6T9EePeocdbgP/AB"
+    b"sB/ipd0/bE2asprO0z8/v7615fbqP81ZudVZ2eY/kDzfR1a21T8cLE32dmbiPyT7c1/eOO8/"
+    b"gI10Sxuuuj/4XtBrlz3TP0ZWsRxWyuk/oM0d83cJxT9A0mzKdEa2Pxh9sRzute4/LB4Y0jaF"
+    b"0T+Y1JdPtlnRP6QmCFnrctk/4KpTMWZqxz9AMg2sT+/uPyBL6YNavKQ/ki7V1Qfw6j/IC37a"
+    b"XkPpP7yib95fx+k/EtWeaFlc6D8AXpvK78SpP5jqQCGYTcY/ioUnxGFKzz8GQkAtHHnkPw5i"
+    b"D7Xsbuo/VH8yqSf95T9WGlEUL03sPwhCJiJ8edc/RDd1tSTE7D+oWAghYfXTP+aRuNjrfuk/"
+    b"iEbrNSxL6z+CFzImwsDuP8CSVdUeRrI/ACfzjfUDnj8A2WiCh+OrPxZoSvYQReg/fpu7e36q"
+    b"7D/g+6wCCfa0P6R3hMDZFOM/QLwipHrQ3D/AdsbfBu6ZP5RezBNm7ds/sKxwLc6/1D86v8eb"
+    b"IKXrP0BB0lCBG+0/+LdlD0Od0j9ZS2vyB27tPwAYIR8GJMY/2BhMnGhq4z8AClKB4ih6P2xb"
+    b"TPRx2OM/krbPXL0H6z9gG7oRlfTAP0DJFh/OC7I/T6pOMp/96z/scPLjdijiP7wsysqFauk/"
+    b"AKIzLIqZhz+8057wAqLkPzg+S9p5Ku4/QPDIHbD24T+oE/lYN3XgP/idCEX2je0/xGcSl5+1"
+    b"3D9eiAl3IvThP3D7Po3+oeU/YJp3Ltqbzj/0Pjl6Bo7qP5CVHPrquMY/IMhHmBKu6j/AYVJs"
+    b"5uSQPzw4EgyT8+Q/8KRbXe+03j8g4NVhNPXKPxajxrxW/uk/UGEhfFek7T96pNkB4U3hP9BU"
+    b"UOLXq74/mATNWMF03z9Malm7Jg3XPygY8Haaqsk/hEm/5hez7D8gLqdMzhGiP0Cx7Dvds7s/"
+    b"+L4HtRs02j9oh/t+hFnQP66zUl249+M/kpdylm6y6z+AHIcPa83OP8i5bgRAieU/1A23u7F0"
+    b"1j/+VpyN79zlP6iwCZHRGO8/sFGDe+wv2z/sIsNNeRfSPwJyleSFLuU/MFqDY9d2zj9oxHxy"
+    b"OrPTPwrZ6M9LZuk/0L1/5mdY2D/ASqD/VajXP6ZASeGJ5uw/oCeqbaYQ3j9kxh3U3EDaP8ie"
+    b"w0UFc9Q/mIpAquY94j/M2hl3dK7YPwg4+PHlhuQ/2D5mk56+3T/k70y2vsnfP/DLXEngtcU/"
+    b"oB26k3/R4D/orICIjmDYPyTiLFOOkdo/OLteZvXp7D84mcgh97/EP/Ycka2XOuw/kIk5gshZ"
+    b"yz9qSexc0IrgP+g6V/6dIdI/KBZeHnhc6D/qaTboX6DmP37LO6imueA/YPVYpHVluT8Aq3lO"
+    b"j2a2PxAPWg8ukOg/miop5Ldp6z/E1649srDnPzR1R2JmrNs/wOr8T1lawT9Qvrgt9cfMP3BY"
+    b"pHes5t4/8I9+zo9k0T++0CvxnV/pPyDqWi/GCeE/6CUjHKJ31D80O/oS4lPoP+yRni2TW9Q/"
+    b"GGdvm4GB2T/GE5PEtXzjP2j6kYwAxOg/uAyxXOr86D9s3rcylDPiP3BXnBAHVcc/QGz1ODAm"
+    b"xD8wVCGQlhXjP0B8PzrIm78/XOkKJkiO4z/IzVucxGvjP56iyKHpnec/IEOKdMo2pz+UVA1C"
+    b"Yx7oP9AXARgowbU/RuDHU7qc7z8QAPKPbV/kP8WDK3DZxe4/+EJMET/d6T/o/PZvqRbnP2g2"
+    b"Bd9SO9M/8kzyZMQG5j/8uDKvB5jiP6jXJf1lle0/Lv/KBINp4T+QQZ/KRwDSP5QtUhhb6OQ/"
+    b"jhAAQkI+7T8g7ugUY9TQP2BGNl4g6qM/ajvhAxYb5D8wtBcur/fLP0iXEl+GMdw/KDQ9kWlm"
+    b"xj+AbFOIihu6P6Bvw6sLfdY/gEJ+ppYKkT89oCwVBhLZPwAJSXXi+Z4/AGikP4SLqD8Al5Jk"
+    b"bruzP5RiRclJi+4/q7pfe+dWyz+MHkuSH0XXP7juB/yJee8/G4YiaULl3D+FZIS2g43sv6RG"
+    b"9S013e8/VixW9qSRt7+KICmzQ57vPy7cIAWUtsM/ojtTiJoW7j8fb2YKFsrVv4FrPScYdue/"
+    b"m1PxCvjC5T9wPJufjr7jv+C/U6e6Luk/vdLtDY6H7b/zLdt1hqjYP5NtR7qBjOi/No0OHOOG"
+    b"5D85i+XN607ovzVT37Osz+S/32X0M0MH2D9k2Z2it6jtP0HD4jn4P+y/+d119hgQ3j9bTPJt"
+    b"omnHP9GfZt3Lde8/TnrrlWMIs7+XrQwHVOnvvzd4RTzENe6/B7pcr9sa1b+vkjXJ1jbovwXz"
+    b"zuas6+Q/G9SJ2TQt5b81vTllnP3nPz+4l0RZv+4/RbFVqAu70b9yWcnSUlbuv0Nph2m1XNS/"
+    b"+sEhrmfz6r+cQJJwrkDhP/fRT0aH+u6/Ax2ag2AK0L+Es6ZUIOfrPyg8K/MfVd+/5MNvkfnp"
+    b"kT/bFLkQv/7vP/mOBuvfR7A/xL9GsWrv77/SEkyoFffvPyOPJCtk4ae/jSr8eQ9g1D8u+z3K"
+    b"wlXuv9L6TDicqew/dTYahCV13D8ffqBsydfvP40MvS6bVbk/fPNQayJN5L/6ubOeWbzoP6oR"
+    b"wBw+G+u/BxcauNIB4T8sRKvgtMDXv8+EuJHptu0/WKkoTbE41j/CXjuLWgLuv2cPe20d5OM/"
+    b"wecwvBoR6b+nUggh4pDmPxzJOMJPsOa/2QR+y1gVwj9evQ/z1a3vv1cNM9keed4/oFbghcgj"
+    b"7D++F3LMs3jvv7hgGv7QKse/gghFmFNlz79R2nzswAXvv2duHoYYI++/J/MHYE2Gzb9nyyKC"
+    b"iLm9v0aitxCXyO+/UnL7vvPX77/fWpo2S0i5v/Esjl7OBeg/ffvcdOgj5b+USrtH7BzvP2Ni"
+    b"pbe27c2/fibOKCjL5D//Mqk8yVLoPx/kO655h9y/CdgcvQ2l7D8hCMrBEEjpv21hSBUTnuM/"
+    b"BQ3pAjO6jb+sEEYPI//vP/ZZUQpmKO+/HVm88EEszb8+A2d/mx3UP/3WNzLXYO4/LhveBDTx"
+    b"0r+vDCyT+JDuv8RiZHvuo8c/jrJPNxJz778W12qdtbrIPxbqkD+pZe+/xBV22wPd6L+sj7vP"
+    b"EyXkP7y+MdHB/e+/jr/AguH1l79BRbnBTfLpv1h7EU6muuI/GG8ICihSy7/plkZvN0PvP9DF"
+    b"b1jz4Ng/YQr/sLZ77b+hEVx8T0WvP7iTZOi08O8/nUgqehtx6j8aA/jA5QXiP8X23roV4Ok/"
+    b"JjWn6snT4j8poMdv62btvwGYIruiQtk/C7x2no426r9oAp+7pVriP6iAaUh7zuC/0QBtHzE7"
+    b"67+H+6LEUEPnv+VupuQ3+eW/eqmVQv6E6T/LzHdwjk7jv00ce4Sk3Oy/T31kINOj2z+2VFYI"
+    b"NQfvP6/0Oa1PTs8/md+knY0SzT/uWVpp5invv0mSS3nlqpS/XwbszlT+77/kKxwfLX3bP/tX"
+    b"nVrd5ew/nKYXnVyR5T8g9fy2uqPnvynZTVqGcNG/yqVyGf/J7j+Ap2XCHXjqv1g8rgiZ++E/"
+    b"giC0EjAL5j9d18tmSjLnP5nINB6f2++/NiweW1kZuL+hUPeJ+K3RPwToPAw7we4/ZnZtASBU"
+    b"4j8mnVSIHjvqv/Ucj2z0wt6/sy1/5asP7D96/AogvSDlP0rxAvuXCOg/bx3oH/Al7z8ZVPqO"
+    b"LlbNv6Cu0i3Kae8/NfyqTkFmyD8tn1g1xT/uPyW8KzY84dQ/d75Z6EFQ778b3FoO+l7Kv86O"
+    b"saAkcOe/gK2ZzmDJ5b9gF3Tcbymgv2kQlOrq+++/pkNc+Al+5D8f/XYN5ZPoP5y8LUnGVcA/"
+    b"/sLYgwS977+I+vrYePPuv0HS3MaBQNA/klE0tRXgf789fyp/wP/vv8aPpBEwY+K/YSHtspEw"
+    b"6r9cbdkG3dfgP6sTlZRkNes/XjezZosFwT9UT+YgPrfvP3z26aOmw+q/jjlt3GeK4b8BWNEh"
+    b"m1zvv/+p5En1b8k/FAUXm7sJ7j/G9eLyqxDWv6qS0BID2aQ/WhybxTT577/l1QwYWUTmP35j"
+    b"7ktx++Y/4w/oUkz67z+fyHTJehmjP7NJ6g2Gu+w/XH6q3oYs3D+JmucCwBPovyeETIkFFOU/"
+    b"xCXa9JXJ3z+ZYJ5lHsbrP8b+nm2m3MW/cTL7PKGH77+Ahtc7rILvv2aMQF/bTca/d1aYYMr+"
+    b"7j9t2Z6bntLPP9TUtIzq822/9sFO+/H/7z86tUWmpc3Vv5v7JW71Fe4/oH3uMIDU7r+ul2X4"
+    b"qiXRP8/uRUp5/+2/mL1ypzlI1j8x98SvG5Tvv6+e0dmntMS//toTcV+F7z9XnNwdfBDGv8AF"
+    b"wyX/ue+/jRx/yqOywD8LJ+WOS/HmPzMVQ4HNTuY/G9qDDsMI67/7/UvlIx/hP+EM3T8dc9u/"
+    b"wj1UY0Ho7D+EdqDefpzVv9FS3MnRHu4/kTBz9ih44j8CQv20yyHqPxQzbtRnWNE/SiK65GbN"
+    b"7j8iuFUIyYPvv6ohjwmnNMa/lfbC9TMX5L/PrNs+O+joP72BGpEtduo/6QzQDnP+4T8AA9HW"
+    b"vMTuvx6tSyJ/ldG/rAkYC3MDvz9PDkm/qcPvvxm4KoVjZ+y/VcfDUxB63T/MSKAeRG3rv/zk"
+    b"ollFfOC/RwLvCDUn7r9UvoeIgm3Vv0OMtwYpiNM/f/Eb9y557j/HIXwPk5HJP1xtIbTlWu8/"
+    b"kNdfBXDZ4j9KH/WT+NvpvxrTU8sQ8cC/Rw38j+23779k06F9Orvav4hWL4g2E+0/93gvAY7r"
+    b"779vvyXpRhOyv+/LCneKttA/UmXb/b3j7r+/NaadGdTcv28tAHrZkey/pqaFjsiR7z84eo8o"
+    b"E+3Ev7KFKZwFHes/UlSaZ/z+4L/6pLN2GpHcP0d2/oWnouy/Au/aSAyp6b++TaLziB7jv2dD"
+    b"KYQZvNG/PtX4WzK/7j+ZpoR5+HbBvzbImjdjs++/7OxRI0WJxT9UD8YoN4vvv3gP9WGTGOE/"
+    b"Q5pvQ+oM67/nklZ0EFnpPwI0EkQXiOO/YJFjV79R4b9RsONHc+jqv3SFuUvon7g/XyUbfQPa"
+    b"778BQ2J8YIHmv0Eq6Gixv+Y/VIOLcH6y3b9UOZ2+rVjsP+3ED9TRa+Y/+gTM4PDU5r/tgmbm"
+    b"S1TdP0Sy3/kncew/NsraVmyJ1j86tJOwSfPtPzW4OwMit9a/pMxcbabq7b8bMrJvIJnUv9y0"
+    b"ULkeTO4/BUTj/oIx4j86EGU2LFPqP1cgnF/U5e6/nZg+JBSn0L/3ld+pubvoP2+4hkrlTeS/"
+    b"/AVIe0SD3z9FLSWlH9rrP7byOcRvEiC/zsL2+///77/4pxR/X8/tvzRm8RjZRNe/0gN3wtey"
+    b"7r+8keKS6RDSP0q1Dq9am+Y/fPio5OCl5j8W+P+yfLbqP8RnLn5tnuE/Pj4M6w8g6z/O9drS"
+    b"IfrgP7vpLo6EGqM/LQkntEv67z9oh2eQGxHkvzC36akk7eg/6p77Idov7T9VBpCOOj3av4rL"
+    b"qZvQBe4/3D0u8/Ul1j/jcXWoVVPPv9K+h+njBu+/ehygWYC57T/f0Ag9vLPXv9nkBMXP59C/"
+    b"yAVqTwnd7j8INNjjT4/tPyS9hdk8g9g/+XX+orv07L/zkM2pTz7bP+tItIodK+s/Y77s72vo"
+    b"4D/lDAbcusXDvyBL21Gsne8/bzCMUfrp679x2UVz9Urfv5gpQviN3Oc/DlZsTm1S5T9RUkA5"
+    b"xNzDP8ESg0XFnO+/n5xkuNd26b9zO6F2NGHjv7O27EO9R9Q/52xFk9VZ7r+B9pfbDQLHv2UJ"
+    b"ejKSeu+/DdsoOzzu7D8xKrqC3lnbP6veGiiewt0/ACFYLXNU7D92A+yrVgDHPzMLw0Gmeu8/"
+    b"DWLvMbr6778DPbd77F2iv0BpEMWk+tq/TPTrIY4E7T+XJ2bSPp7kv6ju+sHmeOg/U7GkBwSC"
+    b"5D/pu/6rk5Dov+HD9ukwuee/CG2cDL955b+BSyBpALDuP7972ysuJNI/zn20a1zs7z+O02sE"
+    b"Orexv948+OF+Trw//NNdVcTN778mlLJV5VLYv1kz7/BJme0/EmMb4WqunT+ldI/Vjvzvv8zq"
+    b"EI41C+O/xbzwP2e36T8Ah19G9p3bPx+xbKkL3uw/TV7cfjmY5T/LmBz6dZ3nP3xDbX3J0+8/"
+    b"5SMCgKuPur+hFMS7iBrgv1oUuCUYp+s/+PFAl/Pi578s3r94QkvlP5wzJib/d+E/dmbvM67P"
+    b"6r+IOH/zdWbTP2067DWQfu6/3TU4z7C66j8H85dKDJjhP0n5k2oSp+4/IS4H7i1g0j+a/yPi"
+    b"pn7oPzZGVZRpl+Q/r8A6zu8a7z91rVkRrQ7OP5Hl4aRIn7+/ZTaWFEPB7z/nkh1STYLvP3Kx"
+    b"6S47VsY/sLw7+GWQ4z9O9uuRp1Lpv2DDIJcH3e+/gOcvgAihtz8K8N3400LqP554XcUSSeI/"
+    b"vN/gvCDYsb8QDugeE+zvP5fbGYp5v++/Prwbo6oIwL9ifAkeYQftv2rRnPZ67to/OT/ej/dv"
+    b"6L8P4yjo1Kjkv7/Vz6tnces/s5D0nGB14L8VHeB0nrjsv5eFcyVdONy/6yUbdHqS779QM5Is"
+    b"RtzEv7ahZG6Ibs+/bB8LwisF778XTv14t+3vP0L9IJsTGLE/emSw7WRF7T9VMdi3i9zZv7eF"
+    b"0r3EPdA//oBa19Tz7j8fPVc8nmrvP4I5tN8qVcg/XLRcZjPZ7z9GOvq11uK4vwC62FlHjew/"
+    b"M17M+TDm3D/8aQTEDOPoPxlnncGeHeQ/lvlbeNrR6z+dQImQb6Dfv/7SVBJcmJm/Yw0jyXD9"
+    b"77+KOqoMV8rmPwd6jUOYdua/R7ZIoNsZ4r/c1OF5dWPqPwSLxzo+kde/X0y0y1rA7T+ux8Ue"
+    b"yVvvP9dPWboegMm/goNJrrHt779T1vK+xxqxv0tQO3V5ypa/+DqDgvj977+he+Xojz3pPxYs"
+    b"Yc2Uq+O/wpmvZb3x1L9wFoXT6jzuPwnEGQ0YzeK/e2ofcfPk6T/x6C6K3QbTPwwRnFGbje6/"
+    b"seB9Nnuixr+up86B5n7vv59Klr0q7t2/DZwnnvhI7D/N0jBjmJvVP5/DmCD7Hu4/O5uZKWN+"
+    b"x78Ry09Q1HTvP+8Q1fHaDu8/YiImRwnUzr+6uOc1BinrPwx/l6vH6+C/+OI1k63k7r977omz"
+    b"na/QP+mZ7wxKveM/O3ldFbkv6b+0QFS8LXnmP4K2kMjKx+Y/+gnzBvad679j6g9/LSrgv4zS"
+    b"Ud2GzOK/VZMr2Vzl6T+lQMiQrMjTPwVpxLXFbu4/XXEMVvTOyb/AIAHzwFfvPwkh2AcIqse/"
+    b"ntei0Mhy779/1TEr5Erkv2B8wsAwvui/0vTXCdJZ4T+CJZhWP+Pqv+NUnZZKIu2/xs6JFD55"
+    b"2j+dOMpwJ9W4P+bwLyBe2e8/k5ZmJWE1oj8TwGph0frvv2aJ8oEG4Iu/XKJXvD3/7z+VtPcq"
+    b"dEDuP7GASutF3dS/EBfeKReI4D8CZZXsJWbrv80wPRkjfuo/Je0L89AP4L/FD6c08wTQP1ak"
+    b"XR6TwM+/KR77ClTj5b+QT4+cyPPlP3wE7+K4Qus/EnWAtiWruL/pD5saAnngvx0WjwIGQM4/"
+    b"NyYem7aR6L8DMFvYjA7jP4/zXn7hHem/JDVa4ONNkT84qwKbFdLjPyQmB5Xh6eE/3KLmJyBI"
+    b"4z8Unm6svjPiP4OQSyqgNZ+/ccxUojVZ3z8l10waneHrP3dEZPnh+7y/eJgjnozYvL9fkVut"
+    b"0Jbvv59UAwThY8E/9NI4shHT6D/pZpE1GLjjv3VVknysaNE/Xg143Bmc0D9OpPcdAKftP0i5"
+    b"UWSDA+E/h1LNtIz+4r/GcGSmI1Xjv07IfbD6cLc/Mo/HdOPg4j/1huKm3Kvpv5X8hm4r5d2/"
+    b"h5AQmLIP0j/2IXkAgtDqP9Get1lTDu4/q6pATwEW1b9sC4kQWKO4v+0DQzvTY7k/2sP4xMq4"
+    b"4b8mKsujdnTqP4Ha7SyJlN6/HeVFojcqwb/W6ykXAMjrvwd0ggdv4uU/QmgqOvhcxb/ol6q+"
+    b"RLrmP2DguTWP2q8/RNocPrZ46T9uy+OmfETjv7vtJEFLW+s/DaTGZRrvzL+LAZ5ky+LdP9Jk"
+    b"3aPXYeY/NBVTNzyedD+hgIatk97mv/vcpHJTLuY/lUVfLB+k1j++rhLtlBjkv8HctI/ckem/"
+    b"pgEQvaXA4j9XEFN15DfBvyYaObtYZMG/SyQ+Opvk5T8MdIdNHu7mv+Rizids0ro/xQJZTMKk"
+    b"6j/YftwERWfhv8JZta/ITby/BKkQVeo72D+HOXJCtWftv4mkEkgl7+6/F8p9MDETxz/BI8CJ"
+    b"PEHHPzRqJKEIioo/C+ryf6r87T/3ow9qYVPWP9Ttz5figu6/+Gn0hYGDyr9t618+PQnMP5IV"
+    b"K4+55eM/dsTDaYYk5b8acbfW0enaP/PW5MQ75NM/gs5dTTdZ7r95OcdSoxmwPx/RCRkXEuq/"
+    b"5nkR192YyD/iIKeh4IHhv/g2hcYjssq/YHSbh+U8779Ph2ja15Suv2TBUUwgodQ/diqpqc5J"
+    b"7r+82YbVSGCOv6bM1f2U5tQ/pwZIyFT4yj8jKpBGAHztv3BnenUF/d2/1PM4c2PM3j/hjvwB"
+    b"FrXnv2rInU35pu+/b7iKtf6gmL9yJfdd3ZDCv5PCSTYEx+k/g8JACVOY4j/73iPAWKq9P9sQ"
+    b"3SjJo+W/6c3iq31/5z/V2gfcmjOuP23ymb+j+rC/vwzbhyECxr9jVE1TsHPvv8xoUepDE+U/"
+    b"TsQKGshz4z8X3y/D12Lcv7Kc/vNiydm/KnooaAUa7T9Xl6rw6Fu6P4wPZdXZAOw//sxAnXXE"
+    b"2L+RAHgjtZjSPyEqXGWRV9a/clb4r6nX179kYMrN64PrP1B3z4faVei/NKtfjpwxyL//xSI7"
+    b"OuHjv32TDn7Eie+/utujLUEwxD8YrrbIMHuvvxaN8NTWc5w/8olC8Ocj5L9u5VSv5NnoP9DK"
+    b"3PQVHOe/2nQ84P7E5T92ooIeyAPAv5MAiWXnXuG/NYFqak495z8znWaKw/7aP/OJzYW2LJ2/"
+    b"4toucvNG0T/U1P1wZszuP4ckXorcat6//S5Y1G5Y3r8iLl4FfLfnv6sbQxoCh9s/dfY6BP6d"
+    b"0T8l0USHWYPrv1DGuaKq2uW/9QeoGptTpD8GcdGQLlfnvwgZxTipHOw/WwaUikhInz8CvjkW"
+    b"WoPevy/npGw+juM/JcucMqJp4b+YQ4vYIGXiP4Pb9yYlb+I/V86oSAsxx7+uLyUyloHpv0j2"
+    b"P1+mzO2/qOPdOUFR1j8BwVhKkBq7v3b4FliBMOC/mvC0EXAdoL+5oJlDjJXrP4tMijmjhOM/"
+    b"r9lRWVsN57+Ti5TuyiHVvxX2K3qZk+S/ot/EaSQvx78YqM7m3s/nv9EMN1OeiNU/U8RL//d4"
+    b"37/0Z3YW+rLpP+jtVu2mXuE/Q744V7h/6r+pTMO47u7BP53hk9rM3do/9S+uG6954z865L8R"
+    b"9Yvlv/WXTuLq172/dzbjBbal6j/ExHf6FVLhvxbBIOsoNOg/ICOvmOaR5D90CpJT2Qq/v6t3"
+    b"s7b0hci/JcqU7Non4j97yL2ct6Dpvx5A/V2R0oM/bVyhJWdj3r/QUFRfNynsP9KgwEcYyO4/"
+    b"dzFn/qRMwD9NKXVZbfTOPys7LzOe5+I/57M7BU014D/uWQgT7Rjkv+a9GQbKieC/UaRzMqcT"
+    b"679/q0S1eqfAP0w1Mbzb1dI/ZJPZm/lHqD9oulOojIvuv3IJUH71k+o/eb2WxfKP4b9TNXR1"
+    b"SDy4v9fGG9JyjeC/aFf/YGzv0D/5shqXYAvqP4X5IJfDw6K/JOzIYyDP2L/gLBwpf3ntP7AZ"
+    b"QG66UeO/aoJO+WN+1b8F5ubRzCLnP14MBDfM58w/XRl0n+fO37+VRgvsqM/qPw5MsXm4nu2/"
+    b"V+PixgUw1r+L1v6RzWzDv3mBMSBdXOs/eipX4zAo2z9r5iZgeBTTv/puIO9N+rm/AOM261ez"
+    b"47+FO3YpwgHpPyuAMMfkoeu/WG4PNF3q3r/AhgxUEY3CPxMYqZ23mds/rrPmSgB66r/l+bmq"
+    b"kAbXP/RO9fLkmNi/pk2HrVEm2b/EUcu3ebvqv9AkaRDoneE/inLHfovt5z/YNNSD4MHXP+Y1"
+    b"+z91cba/r+K64lob7j/tSpePvvLUv+jnP/ed7OU/y0yUYg+A4j/aVEseEFzcv1yGOnTLida/"
+    b"VpXvob9U5z/OHrn3i8fiPy7WTmSs1tW/LpeGUvmZ0j+dxaTD95rsP/4u8BGvEOI/NAMU33b7"
+    b"6T/7woLR3gDDP48L1mTAANs/E590pHsUxD9ZGNF5G5Psv5AZg/CZEcC/Qj2zl0tr6r81kXip"
+    b"j5rhP1sjIv53nt0/susmFeBXzz/XdmixXEPrP3Mp9GgwfOq/iX0rVdbw4b+xkdSy9iSaPxxN"
+    b"g2yLkO6/Kr7MyANjzb+R36DncfHHP1KRogFQSN0/DTQvjMZdy79zERr/i57rP5aArJQzOuG/"
+    b"pieiLFUwrT+kCovhu+fqP0mZGx9aReM/PrknKAg13j8ZLaa0jprkP9J0amFersm/bMX2zJdp"
+    b"7j8/MG4HPG3Ovws95YhMeuM/EwvnH/iK47/U3PEMNzXgP5LOBQdhqbw/2joGBikeyr8uoMJp"
+    b"CB/vPy4YW1iBcd+/jBBD1FTi5T+KR2AjnELhP0Nwboy+bNM/b4db09Pd679nlzE6t7/YP+Hp"
+    b"KJQuh+m/yrEL8tahtT8gwx0A6xrjPxdZukfRLcM/Sp5Ri0/x5T/1BAfhEcvmv5MtMX5lF7G/"
+    b"KXYwm25m6z+Uiqp4IGTgP80gMVRCDM6/NiZYxIcU7z+vnW7EjC+kv5AeIb19kc+/0GpxnJjd"
+    b"7j++S5Wg8wm4v1bMQ6nPJMc/Tv5PJGqEzL/8cJV7iqfuP4jPjz8B1eE/JMRtBRUM1b8vi4sK"
+    b"8GXov5n180C3Meu/rozu006c1L8c9hqkO7TaP6Qtsjwh/ui/Af+E7j6ezz9NbncVuVrivwda"
+    b"Gcugicc/4FgJo2lf17/Z+usR6jPtP9n471tJ4eS/rZfCw+eV3D9odces3JbjvysTbXJLKuC/"
+    b"zpRGp8e96T//jOoYygHUPw6XRh3sdNW/WRticj2C5b+lZ+bmDyDlP7B9maxD8dA/PSzYTjTY"
+    b"7b+OSOWYG2HPv0AZ6Z/Yu9G/T9TrN0A02z/PywmkHZPrv2swc++9yOg/cc7kKGja2r/zoSLp"
+    b"9kveP1wARWi/1d6/c+pqs2kz6T9pkkgJIpjYv4CuVnc2MeW/Tn5zLOe6qL9OmUQxTu3nPyjw"
+    b"DMjXHLe/1tumElnGzj/4G/uXO+3uv0zmIRTbn+Y/NvvNEciJ0L/auu/rxhDlP/KTzWrv6s2/"
+    b"oaZIA2qLR7/Ngad6Fh3vv2+sOzflkOC/+hwyVcac5j+jtFd32d7ev9KnrWBvYrU/t7kkukkU"
+    b"5j8jzuHdAgLnv5Ka2tBiadG/IFncy+bB6j99R1NRunrev4eYyCSnYdU//GYmHNE2hr9LK22/"
+    b"zCjuvz4st15XEek/bfg+vDRu3z9Reb7jMGLYv8oVdYaJGeA/Ha1l/Fpl6D+wiJtFiAzaP3ZA"
+    b"vvigTNs/dordnUXq7L/HrJobnkCkv2rIKwOkKuw/lBBWzPG72T9+nkzEgSLQv4yn1bH0L8W/"
+    b"GtTPxv3M7j/GKb3IZX/Lv4pZkSrNgtU/8nR9cnWP6T/E/JSdxO/fv4mgyXYXMdM/F872OY59"
+    b"7j/Vc9bk7gGoP8qPh7CCw8U/d+d39D6m3D85J7ObuhfsP0jnlv3IdcY/17GWYhZN57/bYPcG"
+    b"vTPlPwUwvoY2/uS/Q/e208pf2z+uU4NvDubjvzRDkElH2OM/M4/SsmP16D+rsvh/k4u1PzgL"
+    b"GzZSvN0/GqaCDv3Z1D+3YSx6QVnqP70Xt+IRHO6/BOYEyYKM07+Ho1yfuLTCv8/oBUr+Vus/"
+    b"66/ke/Ha3T8wJdRB7k/Nvwn9GYl2L8q/xAMVVkGNxj9gd512yc/uv2BPtr/iG+6/xjcas5NP"
+    b"zL/eZN1VGGrQv0mvmEgwR+A/+9XlxCYD6L8Aen9jeAPbv9bjHKUg1O6/ISRj5Vu7xj+/T+3W"
+    b"u7TJv7fp/U3Dca2/xE0zYsi/67/upi5kG6nfvxvTpxdzC92/ufNeAjIuzr+8GbNeo3/rPxtL"
+    b"xNAe89S/6HutyxPf7D+evrJWCPjRP9umcd8uM+W/oQ9N7q6r37/CMcTRnf7hP9VQD7q1pcw/"
+    b"ktHjji8z5j8T8Hxx7Oflv8YPhJ1fkOS/AJiPjursz78I/u+Yri7nP0rrpTJxp+E/4P2d4FzN"
+    b"t7+3UlQj8oXqP5v1zeY+5+I/SC25/3Pe3j+AkOcu57LkP3gW2MDiDdE/C3wFKFEG67+JcKJ0"
+    b"p7rdv1l5mySQG+6/1vAkH0TU0D9X42VQe1fLv1a6w/6CEOE/U5tgBEzh6j9Lmrr3kaG5v6+d"
+    b"qyGYU+6/6iXesdXvwT8Tvi6F8FnSPw3Z2daztdy/bhR9AXHubL9tvsLXcJnsv76OWVXbzu2/"
+    b"hWKQ/FZG1z8uDGlkq059v9A2DXzsTN0/SF5tcRno2L9bsldeOZTpP7Glt4wkOLs/gyD+huAu"
+    b"7T9t4Qkf5lvZv8QzCvqFku+//q10TFCexD8Ph5keYB+ZP6Io/JUQRuu/P1SVGn3Ryz+ENLLZ"
+    b"2HLevzLcNZILF+w/HdLp9jx93j+WxjC3UZCpv/MtDH0fieG/9jSywV374b8YlwUG/dPjP7k/"
+    b"n95Gq9M/LHSBhabd6L9wXQtt35PhvwfAVvROsce/8JPiJGJu778pYFt7KPOfv8XWJWKdktE/"
+    b"Bmu3Eqo/0z+MU9WK6Tntv/EmKMIFE+8/UWONJAhZzr9DRmC7DRSdPzAI9sZWzso/p7NYe5cb"
+    b"1r+w7DlR20Xtv8LVj/3tEu6/9ro0IzSoyr/mtyB3WVbRP+M5XXOw8O4//2jRuy0Dfj8wcki6"
+    b"7FPQP9xCQkQcSdE/8lA3CMQe5j8BEPxQlnLlP9hte6H4J+W/zz9V+S6gsz/yxZbiDuLnv+jL"
+    b"8JG+3tQ/ETOqYljbp79mPpaEyTbuP8vsGfoXVO8/zZbbrRpYwD8fE4PXSlTEv61hNTfSFu8/"
+    b"mne44Rejxr8N2zd8oCzEv4AYT0FFU9M/NNo4J/HKyT9iIG7XJ9HtvwtVYLFtteq/LCUDMiRj"
+    b"xL/NFa19Qd/gv1VJ/q5vfec/5pbKF8HGyL9MYtCZQ9TkP4hK+LxHQLA/McadP/gD7b8v0pUS"
+    b"bq7aP5q//6OiOLE/QyecumMVzL+QPMAkYCXvPx9Xy58mNMK/4JaaXI6W6r8Eqj04FDfhv/IG"
+    b"xf5xtOm/0pqs/vAE4r/zntmvFtfIvzkbwHC26NW///oBv7KY6D+v2DLYvUrhvwPFnahKmd4/"
+    b"J0zXF8nU5z9hah93rMzdv1oP2IB4wd2/uwxESVpat79mAFg6Ji7sPzApJJjBOdg/lburVYLL"
+    b"6j+1m5Z8Xj7ZPwVL5kJCudG/SxaM0f9E7b9kf6iMwNfSv1roo9Oe2as/n/0h59QO5D8VkkHl"
+    b"Zt/ovzhZIW8TP84/h0yGVy2n7r+1pFPX3t3Ev/GQosfjbuW/iyXkUKiwzj+SuDmOKn3mvxr1"
+    b"S5j1rqg/HiU1EbMA7j9bGTC0mgrWP/b4j2QqZuK/9xLK6hMK479PPwbLtvjhPzLeTQ9SFcG/"
+    b"YKd+6oZl7L8EzcaLyj3cvwV4zv/30LQ/QuHSPgiFzj9vJwl1y/fuP7XatAgS794/IykZnHu2"
+    b"5L8Hx9iEhdziP9YruW5gXu6/xvpWRnhNur/Xx//RahLTP6dFyPdPFOM/cS6JTodT4r9eHjY3"
+    b"5QDiP5wO/5CGuuW/HJWwRyQ65j9gXikfnWrOvyqlL6KxadC/VJb9Juxz5b+MVcbW3UfmP7kF"
+    b"aTkoHec/uVes81ZT5T8j6IkSYafHP6GIuFLiaO6/jjcPiYw7zT9y/FR5FBXLv3oDbrRBSZc/"
+    b"y+QCu2Db0z9nKwh3f2nuP6gRha4Rcuu/2qfgrPUm4L9IfsMdkxq5P20Ngq4kKNk/CY4PvWF6"
+    b"1L+uzSX+0pXrv1duAl8D692/86DeonON1r+3OR7yk/Hpv1nlskPgVuI/LcEx6EJ55j+cVPak"
+    b"qgbbv25iKO1Fiuw/z9n0mVflxD9sDTlQgf7aPwTMuVmRsN6/kEQoKpJQ6z8KlodlAw/Kv3MJ"
+    b"M6Nx2u+/QcHbLM9odT/7wWi60XK4v3zCdBhcKeO/jD/Ebp//5r8tJ4CUaJ7Wv/fbhjTWkuI/"
+    b"9TlBgMcO6r99TntO04twP07ZZUDV8ea/2gJsIr/E2L+pX9ZHSI3iv+lHooK3NJ+/Q2/Feoyb"
+    b"4D9UmwdS61Xrv/d6sUL2xtk/nHdLHrga5z/WzzgogwDiP5Ls7vzA+d8/r+eMyWNQvL8ToVfo"
+    b"M37rv3QaREUOvcM/2CE0K2Ai778eBv0iOAXGP8gjAXmUB+M/HyWaNlQM5j8Gf+gPrIPaP6NG"
+    b"S0CDNri/EKVdIcNe4T+jKIi2SbTqv0wVq82O/+u/aWAigAHU3j8XHFRCSlCpv2oax6wuWd2/"
+    b"qPkDC8f30z9REVFgeaDqP7JpQL8aOuE/O/NWz6kW6T+j44pyS8fTvwRYbv8vX+O/Ko+ewwq7"
+    b"2T/JcwzFb/vlP1bfO4f3/MG/qhZkQlvm6z9z2gesagbev/bcvFW8auU/FGVQ3NHyqL+TowRz"
+    b"pLnnv7LTiTMJtuO/EGkw5Lci37827WqAwdPjP2GQAZ6nOdK/LudEFq8x3r8bCBkM67PqP1wu"
+    b"sCAViOS/ty0VgYp56D9USSJCJ62tv0kbW5l3yOO/6gIqq4Ku57+A3ZQ9qvLQP+uTOhtMLsU/"
+    b"SeJAbVmy4D9YPKhbvsfqv/po6FzyVOE/6qSDctqk57+YcH/kNKjZv+X5MRDAEOg/BPcptHrQ"
+    b"0z9uTolYtZ7iPzTnSNLA4+U/cnHZa3uM2z+LZ6jKJtjiP7isPrrDYNU/DCvSKQ7d4r82EsZa"
+    b"Donnvza61vNVl9C/tVtDUR9k2r+dmy0VjfLrv1GDoVe2eNS/M+oRww0B7r+yg6zQaG3Bv26u"
+    b"OhH/O+O/glNFXJBl3b8xZoPBqu3kP6b8Ku/3Y9c/gN5xYlDV079wXTP5RxbsP1Ny7QcdBeY/"
+    b"9HYAgQUw0T9iwT1u75Hlv4jIdmQmlcU/wTEa8JI877+xOo5NWILBv/9/RSFqX7S/rPnWy+oq"
+    b"5b+4y8OQ8dznP2+u5y1c2+S/YzIDJo0v1r/Yn9YP65XlPz5iK1YUKK6/C9vaebW47z+0k6dn"
+    b"gCO+v9CRugH72ca/GYjRSx7E1T9SevI8lovtv1ijwgVkaNe/BBagey9l6D82raSotRXhP6Lk"
+    b"OmI9lOS/zOi4k+KG3D+F+LMeIO3jPwrk9+E0ZeS/XNjWyuea4j/8KD7Nxi7gP6DmqnTCv3W/"
+    b"3rYjrauo7b+bQNDB4AbYP01+uuR7tsu/I7D45W4l7r9ayM7sT2XQv3lxJvBA8Ne/G0+kHuEd"
+    b"6j/E4HFXXzDcv67aB+vA4ek/Ht5r1dMZ4r9e69ECI5bEP8SFK9zBXe2/hNQNpPLFyb/+Wc9j"
+    b"MuvVv2tkTEQ699q/ibI9IlL0qT87yxrku/nsv3LL3MSbPdk/AjHgEvU+2b/nqwYCJI/qvxvn"
+    b"WjKMjeu/HoOClHqcqz9McVlimi7gP51auTCNVuW/p5JbXa7qwb8oZujsNWznP//fSVlDKOe/"
+    b"6v1DZR6Oh7/6goKR7xTmv3a/qq7DX+a/doX9VBIg5L+BPwsnUIfTPymmg+5kMsO/dAEEEqFf"
+    b"2T+YzqQ+rl/Qv51oaHBghtU/K1MK+ZgU6r8I/KKBHlTXP0CA+3pHctY/cqNVkhzx578Wy0Ka"
+    b"l3rbv+o9/rI4nKi/GeePeBaJ5j+WjmcBJN60P4moW6cohOa/2Ox9SYa04L9EXJkl+g/hP64x"
+    b"R5fZUuQ/UHM3YK6Jyb8hTVY8FiXgv4Xrx+w4NKe/wXQRfWOd6j/iUeqvQhfNP5FzmMAULuW/"
+    b"DPMxbvnbvL/Tx9X4vaDmv5bK4dKsY8w/o61+G8DruL8QSHdHAE3fv6g3Iu07vOs/3vZBnSS0"
+    b"hb+J/MwXqmDmP1u67V/Yz+I/+fIwNBg10b/htSlCE4fTP8yoGidukt6/tb7vk4xzsb+jZ96G"
+    b"46npv7GFQp79iNa/uA8SyJwr6b+NE3gKp07bv6e7r1+zt9i/jdG0FbmlzD+Sib5nBBPiP5gj"
+    b"EgZQYMc/DCgrcLLP6L8blC1fUZbLP9GY7Nc069+/u5g6ssUQ178hl8mGgyzpv+pgiQg+pak/"
+    b"BQ6WWHaU3D+LnPDAN/7ov2Jwvzf1M9O/Au2LnyJL1L/tmUGCqAXuP5REevOhNra/+aSA1Qct"
+    b"1T/DEqTFbw2rvys1LGvuHOW/JpI7xkc65L/kcnQm5AbMP+Uxor1n6NW/h7LxY7Zs4T+BKeip"
+    b"zdDqPxOf0L5gNZ+/0xa7TDD6kr8ek6LAsI/Vv6uwNYRb6OA/nf8T87Re478XByhZDmrfv1ol"
+    b"vRyVWaC/4AVp5vZUyr/Up+ebijTiPyxvvBemdek/qBylADs03b+9uaGgdbHiP+K2dBFFfbE/"
+    b"3EfIdg5e5b8lj0T/pI7hv8Mo+7i+ct4/3kN9pZFizL8m/BeCytLkP2Y7jPAsvei/nmdWM3TV"
+    b"1z9QeoqmOkLRv2Dq1Vry9tu/wk5/nE9qxr/eJSrip/ftP1xy4zPYI9M/IzHvJg6Pqz+ji6Cr"
+    b"rZ3Yv71Fj1meK8K/Q2i19Wja7L+glTpkMpvBv7eKg6zeLKI/2i4PaUyq7T+qjZvHGLbVP0AB"
+    b"Xh9w78M/vl9mG3CN278lJ58MsmXjP7oXd9loJeQ/qbuPKe3ezD/5f7cYG1TWvwrlMKECGbm/"
+    b"AkDBCTAK1j/5gHIi2LbrPynWx/UAjNC/kAw1BB1Z1z/wkhQtBHO7Pzqxroebauw/ngzgEZyy"
+    b"4L+s/2RtVq3Zv8V5cr307Oa/aT7Bu6SazT+A6CP6jjLkPyVkLcWK5tU/71w7UqwVzT/vppF0"
+    b"5Q3lP6bhkpOoCt6/YopYIDXu6L/wgvdkhbvTv+9fQsMz1dG/R1tun01CwT/apmCsFELVv2s5"
+    b"ynkhlew/q6uchilf0T/V3e0F2AbKv8R7YznCpuU//5cD4orp1z8lCSsFzDvjP9PuqWHbY8q/"
+    b"Ft0ZAKUI7b99qMv+e5ycP1qXaICKYtc/c28zw7Ay6j9pFKh8N+zUv4VOTzx7Tro/67rpeV99"
+    b"3T/D63SGqUndP2fXjS4c9Nc/xRjmzAq25b8hSgQC9ejbP+s4qg2nSKg/4efBqzgb5j8ldMwe"
+    b"renUP6D0Gu1PleS/diB893jt5L9s02A2UyPjPy/q7bS2Fty/hJ+EWD/8wj+zG6WunMPUv1+c"
+    b"Lb6JJM+/12SV9XYh2r9T9A6boivqP+63rgGcaJG/JB87vK0L47/smBfh2vXWv4qztIX3AOe/"
+    b"A+sGT2iA0z/rTdnB1XHbPxrAnDNxuaq/JX2UwLsp6z9A8J355rLLP1uQGhXxqNQ/PIq2E15s"
+    b"4r8rSNvPIAXnv+4QLiwFOdQ/RaQarE8I6b+8MZJmAQPAv1jp3ofntOA/FRZ0K7hR1T9tqmrO"
+    b"w8Hlv2IwhWBpYtq/Pu9noW434L9gaxcXlNTiv+3VC0UOjby/1Yz/Bbv/4b+X3VOhlD3ivwg0"
+    b"PS8WdM4/N3ZjvgVv3j/VBg4XiWznP4LRnP0IQ9s/sr4g4aKO5b/NZpHObT6iP0Fmv02l8aW/"
+    b"Q+3T+/iU5z+FZ3wEQlrnv90OVSI+UOQ/8Nlg3YSbzj+FlhT3f921P+dsisdl/6I/iZDGrAce"
+    b"7r8oLcrKTITQv/NUqHxQhcu/AVxJKfHnyz9Pdu5yViHSv6ipJj81UO0/styM94FIx7+2RDMH"
+    b"vQrSv0XLsl0J3cU/HiTLpEjc4r9EZtbf+JnnvwbR52BdU94/XdtfSr3f5z+GSdKormTYPwOI"
+    b"sX7JXNG/stumx2lK3b9R/hSFt+2Qv3s16mjqENk/LTrL75CJ6b9ql1oBCNLkv3lm+NVi4OG/"
+    b"cqjFZVfnzT8QvczgRlTdv1yHCScDfug/P7V/+vPO4j/8kxOWrJ/Ov2nTvdNqb7s/A4qjCaf5"
+    b"kb+/MEu6KHe7v5vKS5JjIec/gUUXfW3W5b/EllskwLLkv38JrlNrZui/wd3aRjQujb+TCJ4U"
+    b"vABrP4d92zsU5uy/ObNHql2kYb8qASoDjk/bPx2k4uYDuqi/XeN32qXV5z+bAxIo9a6Ev9HP"
+    b"IkJC9sm/S+jhYNVW5D9M3om1uqzsP34RPwz5Ktw/mlKtauw4oj/mLAwnIzinP35Jy+3oluo/"
+    b"0oeB7getxD91vDSoyZzJv6CewAPHk98/GZSW8iws3D+ZsSIRbzXqvy6Qw1Uloc2/9tLqR0FP"
+    b"0r8gu+IfVJLcP4dxpxb826W/8Hxz7t8A1r+YVlzFpmbqP8mp9UmLOdS/XRVeEsyz4z9/JZwc"
+    b"VRjnvzM0YkKe4Io/D8MvgZpZ7r8SiU7LiunQP0+vmqyMdsI/QevyUGFhuT/6x0bWhbDUP1Ty"
+    b"Iyikwug/tx6NiNpl27+Z3Lv4YpDVvxAHId+Wk+o/NDUQiArf3T9ycg9hE6HSP7kM7pNwa7a/"
+    b"0dMl9CRa2b+LsmkCgx3Xv0hd8Kp/A+u/2/Qgb0OjOz8QlP+vGu/ov6HzX8ogHdu/+bbLK60h"
+    b"3b/9BhqYkia0v+gbbsQxh+Y/BxZuy+6Hyj+r0xRbnS3jv/mD9/6mdtQ/dUSNTur75D+tYu8u"
+    b"NJ7kv0ZbmNLWcNc/5FzJrflqwj82v3Pnj9DoP7ksjAbVMdO/34FGNxol4b+MIsz+4tXCP1wu"
+    b"H9+Og9w/Ph0e/d9Uwj/q0tqx1bSlP47UJO0+P+y/+NthvT1U6j8NmKMATaChP6bhPkawkd6/"
+    b"ebGLXTqX07+B0/QXa9TLvzHdCJkPlcW/gCzJn9fa7D9zeyxVxVfVv0yCfWe+GZa/bhkplaGU"
+    b"xj8dwSxOX33uP+OrH7gFgc8/mjUqNhLk5D87Ut/2wt7LP5tNnU36Wua/JTv9OzIQyb/XDO/g"
+    b"OSLivyidBksYIug/UHYMiBd4zr+ePhMM6pfNPxEq0atS3tW/pJebuhya5T8aeziifmbkP9IO"
+    b"LSN1mcK/hUNhaivGxb+MKjcGXTXpv76Xim3qYeA/fI+gpisH07+y9hG5b2vLv+Pr86b+H9C/"
+    b"6iPJWVrXxr+lCgmxl6ftP597Ul2AUec/DsFn85mkm78lJiF8n1flP7vokNcamsM/3mqs/oOq"
+    b"5D8TdwGYDgPhv08CJM1iedC/pCF7vzX23j8TSJILR2qzP2XGvBqWRrE/10NuyLtOxz8zGwnh"
+    b"/0vvP4PG6YIJzN0/YHwJaVOi6T92nNsXsKjNvyMb1kDn99K/PpezpI1h0r8HafCB4CflP8ot"
+    b"4lyuvOU/bzab4D2mwb8ckOBladbmvxdQkYDnGNQ/XweQBYJ74j8QYykNSvPOP0Z03ZrQfr4/"
+    b"ijE1anCc5b+ts8NFwWrGv76k2/oVm+a/7Oc6Lm5w5j8dAJJtpJPlPzyKknFWNq2/gQ2MIVO7"
+    b"zL9FksLv+1zOP6o/US9pwO6/ROIcQ99Wtb/kcZj9lIG9Pw6eSAC7mNG/fVmX+y/U1j/9ZcQo"
+    b"OYHWP1WRazMIQ+o/PKIz9eg42T+8IkTH95vovyd5xd+265a/zE8yL5UW4D+aaOu7rjXKPxz4"
+    b"khOeq96/75XBvbTN6L82jqlU/tzWPxXgyM/qstu/J6Qekl7wwb/F/d2PtpPXP08q3UXD8em/"
+    b"PnM1VGzd6T97nXn0tVDiv3YMOes8q6k/H9dL+tN7wL9CN8L1NH/mv63ulS9cNsE/JSWMh7YF"
+    b"5T8ccjqkelDOvweUlXLCBd2/OYTKoCnJ2z9vChUKPH28P6gdGWH0pug/pIIuQ4WDwD/lIKBt"
+    b"jXDhvyZNINNiceo/KS/kXSdNrj89VV1KXxvcP4XAe5/LyeI/KrfPtO8Kl78CdikEiL/lPzsv"
+    b"o9VJbOA/NwHu+X1Tzj+pRcPEco/VP2lYitNyGOi/Souo9ZcA5b8DTKZDfUmoP4+W2y91wdG/"
+    b"MUXwAYdm5j+gpfezvSThP+z34mp3H9Q/ybbYdWuIzr/xBTzRIuPnP1a4Dis6H6y/j4sSyZar"
+    b"6D/z0CyFZQbgvyMwifRh8Ni/Pr9exLNm0b8j4hF/c8Hov10ACYEFgdK/r2CyRB6d37+VvrzF"
+    b"7XbVP5vvHCVLft6/6CYT+GNq578ujzxOJaLWP0edyb05jeE/bm3DaZpz0r+Ni+RxXS7PP/wV"
+    b"8aY54Oe/hIprZl1M4L8AToyk6jG8v/MsouMsPOk/sJbv/sTk1D//huEk6X7HPz9GgWLVl+g/"
+    b"k1YJZ9GJ47+AxDJmMWKrvzoMn/pgLem/yL+IFp9z078Krpxv1pjbPwNoRIlPgdS/2kkCoriP"
+    b"zj/nF44UGojAv/3yfJzAju6/Kal7vkrAvr89LdXaL0jgv6NVmwfiKsw/PRVzGoBp5r+xfOKn"
+    b"gsbcv6LBrMc1KrE/slzZa7JFwT/3/NtlDjTrP+he0huoJeC/VlqXt6Z6yL+8x1Qx9LftPx6U"
+    b"Lea+aLS//Ke2U6Cu079Y7/5QXbnpv9MLUuf0bt+/KB/5Ju4t1b+Czt/e4zysP3j8aGI7/uK/"
+    b"XiAY5o28zz8NMvyHj77Dvwo9U3S3/+e/A/MANaax4r8+yeVhFybHP8NdCAx34OC/vu3pK63f"
+    b"4r+bF4gDllTHP1E9s6AzQeS/dVeM1g6N1j8C4tpAMUblv8S9iLE8MeU/Zz3N9TDl0790wCVk"
+    b"YMvlP8/6O+JD5J6/GO7P+Y1i1b8Gv2M9CJLsP2TUR/xNydG/NIAAkOJDvj8RYF7mmuDmv0yp"
+    b"UH9ebdk/AbfIQ3GAvz/qECSRVfzhP4xbEryRVs+/JbUVF5gx3z9bH2HBiFnXP6bUD2ODJei/"
+    b"/07Yji1mzr+J3PrK8wPnv7q1PaMiBMQ/CP8Q7wdJ5L8PlYP7A6LGv9eIXQBpJdY/DV8zaf73"
+    b"5r+shABV83ziP9huceiGPOi/SKrHo1guyL/E+Qtfsu/bv5sZ7/Kpodw/9y1O1+pr0z/bI5K0"
+    b"t7jPv6LrDZV3+Oo/8uoMJwad1z9gWHNmZ3DjP2XSKKrs29W/psolbs5A1z+VltGIPsnjv0UJ"
+    b"9cMiPuy/oZeTJYdR3b+RyoE6Cj21v95x/Vmzy7A/6IvAg50e6z9eWtRGP9O6vywdagKlVuC/"
+    b"wjlkEzm5uT8OGp+QVx29P4KypO4Wy+A/sJVSQMtx1r8oJC30T43ov45br4+xJtS/fqpKJaTU"
+    b"xD/10Wx/8c7rP4TNV/SOGNY/qxGrej+ayL9IHfsuNc/iP65icHDpON2/1tW0iYB35L9D/Bpd"
+    b"gwCxP6o+71DSE+w/pEQrnsd/3b8cDy85TX69v+3dQH+4seg/f0zms9+b0z+rxB6OUWzFvzcr"
+    b"/+TjAuE/y5l4l5951L9GtZOdlObjPz0ayRqg+l2/k5J0Blzf5j/Mow9XaxrNPx5+ayDh0NA/"
+    b"P8zUrbQN5T+X7pqEW2HlP+rgtJCodsO/a5QxZwolqL9gdthrGp7CP8oPe1xDP+8/QNVTVjMc"
+    b"0D+f5+JYTfbpv/Bc39IauuC/s0il1Ilnsr+uOc1xO/FFP64EnbwNEc8/1dCh5FBA4T+uDlhX"
+    b"887pP1E2LvQ8dO2/cs+VG4Lhwj8tvJYMDWqdv0zARGoQGNc/ezJTduYd1z8+GDvkjkbOv7OQ"
+    b"bg+3tuQ/MzqbVeUZ5D9K3XJY7PrBv752LTCuWu+/DUT1TNQewj+GamQnSJKLv68fB46DKME/"
+    b"d8DnFY4/6z+kFcr/FeyXP2EffDNANOA/D95IWTS/079UnIhLS2bnPwVIMmz/uNe/eB+b73Pf"
+    b"3r/yNqT4PE9xP3cD3rcGnO4/f0D+rP80nz8hlrxvl47SPx1dMzet/9o/cO1K5WNJ17/Z3sey"
+    b"J56mv4VXi0Nrieo/h4HqvrXi3T/NVLOM2y/Nv5THG5x2O+u//r5Uim1jsz+r9kkosTXiP1VS"
+    b"bxN4BII/cYS2jGdL6T+OkxvrcPzMv5rWro4839y/0vcksgxh4L+OFew/r73hvxkM2bJhgN4/"
+    b"9HssaRk35T+9M+S9xQ7mPzhjiCHAiNE/4qoeQlrvub+X0BI7cLzpv99demSLH86/TyoyE4zp"
+    b"1D9sQaFa3PjbP5XCvdNJ2rw/qBpt6FJD3j8Y3CzO73XWv7fCBz5ZnOm/XY/IZN9R6D+wU1Ir"
+    b"RbbCv3QYKQ/bm8s/My6gPpsN4z9q/iaDP+7qP5XX60igsdc/pQZd0HVT0j+3ESJGJkHRP/i7"
+    b"sMvaHtA/lZuffdae7T+GHpMcECXQPz83ZCQiP8A/OF6DD5ea5D+Rerd2kFTXP3pbc/HHq8Q/"
+    b"daQDLrjl5D8FS3CMg7nlvw4kBV3efNW/295MMuHRwT/aki/eK2rkv/peFWLMOOw/B2zHOtW8"
+    b"wj/UT/FwxnLbP1ubgi56msA/k09nk91dyL9WQI+x0+LXv5D3Zo8G7N2/QLtFDYjo6D/HJh5b"
+    b"jnfhP1wrt+R279Y/hLDbQr350T+VrsSUE4LmPx7rU6klFeA/BZ0eo6QtyD8ozUXsI/ylv0Ky"
+    b"2sgn9uq/P3XIn3dy1b8l7QY5O27BP1fNtJBXMYu/w3JdEoLU7b+KZAIlE1LVP49Sv2PfvMY/"
+    b"Sv1eV8x+47/wVq+Lv1Dmv3lhB+IZmuI/ZpL0wi4R2782IMFKHqDBv1nyTRS0zeW/EITAPTlG"
+    b"wD/+SeJDGebmv+5+K09tteQ/keLdiY91zb8ZuLdNFdGivwep9yls/8Q/DRiqpfiY47+7FMR9"
+    b"5bfoP78yAjTPLLi/bZBkTpTmob8mOF+kOcTcP5u0rnQ0Z+w/hQyLex+H4L9SReuEcOTTv0KU"
+    b"EuO8meI/5Gz1sZ594b+Ppn7DO+viP4fSV0han+M/GFgrmtKs3785HqBB+fvFPxtLC0bsx+O/"
+    b"HzTABkM+6L/B8b7qdn/Bv1XluALJVcS/9Kq2+A1H6z/OkBRvBUTVP+5N71V46NO/U5h6n6t3"
+    b"0L9Dsru0QGzNP+5I5LJW9Om/rM2xd07s2T+hxEf5d6bWP9d225uVMuk/7cCHQRTL0b/yAQM7"
+    b"w4zcP+utTslGm9S/on6VLF19s7884neyR2HvPziaSLaRy7Q/5S+mdaehxD9IEPlU/PLsP3Q1"
+    b"+nKpdYA/OpBztc621b+qlJVGMn7QPwYLNrO0iu2/OYiHrZZ/x79ygJ92iw7Rv5r1Go8+i8o/"
+    b"yrk6IMIR4T/EbrWfmfHXv89jzEa6cuE/FhcbBNDg4D8hRMatHe7ov03XiOLN79i/VaSvW9dX"
+    b"wT/+svMG6TbeP77Qf/jCdte/1GX2J4eH6D8Yidwp1IjZv7hAc/t/D9Y/XnrjEtukwD+IO/IP"
+    b"bTHnPz7O5D0Aq+O/dZf2M54a0j9oM0hxIY/mP7B9sDG2NuS/Dhz5Yag91D9S4n5hZiOwPwIW"
+    b"tyxkIb+/zeSEv3gV6z+6tPoIok/Vv7huCfVKcNm/ajvUMVWJ7T/sYKi2/4XKv3gWHVH/wsW/"
+    b"A6RZP8Sq0T/wW8Zt6pzdPwSJ058+C9G/QcXT8+fd6T97ArZhGsPPv2Ay4uQcuNM/++XQSNYg"
+    b"1z/jgw+eD0vpv+nGqcOPw9g/z4xVjTuSwT8Owce1D4LZvz/PscHV1ts/Cy6+Oh526b97GknR"
+    b"D4HVv1RASXXu0uO/O73rc+a22r/Ruz1CdFvivz+WhOogndm/C9Llcl3s4z/0cATFYROxP4Jb"
+    b"pzORaeW/FnoaUFlj579HjX7Ovi3Rv8cmfpg/TNC/TXCGP0Ba4r9f2PGYKQHbP86XPAa3yes/"
+    b"iFYIRfr7wr8PEkY9smvLv0hA+qtT5eu/tumWTnt10r+11q1rQq7Yv+AlyulgILe/gLK7t11u"
+    b"0L9mbGQHyIaNP118i3MrJua/zMNFKI6U5T8Fg+3vmq2gP6dzpo/SU9o/HzLwh/hCxj8GqXE9"
+    b"t5zsP2eOyDIlPsS/ucc+iOH77j/8ig5A56TIP+wHn36J8ZS/FihUEwyi0D85gM7UjQrrv8/6"
+    b"6TrxR6S/LkOiE6bM3b828wXx8xnTPxWqq+TPYOG/qTOtWqnm6L9ROvoEQDK6vyPdx16hM6A/"
+    b"STUJqDoK5j81arRzqibjP92TGmKLHNo/zxgSZz+ezD+faK6DaVLZv0NP3m6wUOu/vyN1295L"
+    b"0D92+m7PkMbQP5dijy5109q/wEH4h0pE5L9++3pbag3jv9HBkspFGOW/vgrf5s5z4r/ZFcO/"
+    b"DqLXvx1X1kZ349O/QluIYeq0078oX7fHYMfkP41zEKeNvtA/SVoRs/Cd5D9F2pV/tamFv/Jk"
+    b"erv3Oce/8oiKT6xS3r8EzpWh0ZLrPyK49QaoFuc/8jFv/2gJxL/7pcpy/tvQv4MdBHdq3uO/"
+    b"6aP4GFPa2T8+MDlwX8Dpv5GKdSyxJcK/5lM8wvVR2r/u2SD6LR6wP8cyXFuh6LK/mNMFIECf"
+    b"77/ZC9OBTFu+P83eKUngwN6/Me5IPhS25L+UX3dBFd3Xv74Vlk7kaN2/TiB6ayNKjD9xz0bt"
+    b"9/XSvynaAAOX5NW/235ic0+I7L/lmfXxBg3aP6ZS9sxPZtk/3wwyZtGhrT+0t1yfukLqPyq/"
+    b"a9rVZ9+/PAcaCB695T9l1KsF33Tav+xBznaayta/RWR/FLVz3r92JykcmajqP/tQUfVUFdE/"
+    b"e83VnA5dtz+bvz/4jrfMPw09Jooioca/gNLLoyajib8watfiB6ruP64ms4NCML+/bVfmJbc1"
+    b"6T/SxalcdujQv6oNxi5MX+G/aNMcCjwi4r/n9YXL7oCxv58duh1wksw/PmtXuRhJ6T93qCJO"
+    b"20PiP3eK7O6wHqG/zpF3X3Q/6j8MekykqUmRPwg8/PJHrdc/A7hETTZqxz+0WGGKMKrsP+6x"
+    b"5yk0IsU/fF15fkpnjj9c7RPT1I7ov4r7nvmHIco/A7fdjj5x4z9u6TIDxiXevzGT9LPHJb6/"
+    b"sBG7LNHHyb9RsNSl2Djrvxx0+6haZ8I/HgeFM8W55b9QQbkeYMzAP0O6nz9Zp+a/2ahE6Yll"
+    b"3j9Rp08MN4jov0ZUoXzZrtC/o/bGBBwO1j8jN6ZsyJSmvzpOGgyG386/GxTI8dUx0D8qL2eT"
+    b"ofLtP2aFXtmdpMg/vKLZLjfK7r8bBb3vk4vFv+AaeMf1BLg/66eK4Qp3sT8ho97KBXzDP0+9"
+    b"BOljsaK/R3yecK6H7z+X9JIcS6Lkv1tcZO9AcMu/nPrJ+XhH0L9xA3X8awXmv7n9z1kG8bc/"
+    b"rVGS5eyIyz+73CPI7nXfv1m8kqY51uo/HU8z+Digyj/Dbz4UXOHLP+lTOBpqba4/E1i7u2t0"
+    b"7r+iDVFy06Plvw+IWLNOOr+//t6asB2x4T9gu26uGirev36uCu2cCdA/tUvMYr3c2L/c7aXP"
+    b"Zn+/P09j7D/ZGey/f7Y3zhO0278oLPNO0d7XP/y1A7MeZ8W/R48Eof616T+uqcfSc/Xqv9Ex"
+    b"15etDo2/A0bk2aK43T8OSdi+xHTRv8n0OtdlS9I/LxVElrwy4z9yK5e7mZ/jP14Y3n51U9s/"
+    b"ANtVffWO779aeGykUIm2v7VqJHxgJrm/K8yQI6ibuT+/y9687uW8P1fRqaOGA5C/XMX4tQrJ"
+    b"7j9yxnz8f73PP522YZSL1eM/1hwx1abD5j8dueO0oO7Sv9zFQ6o6GMM/4GJnHF3U2z8Za83c"
+    b"rcrFv6TypDC1vdk/ZLsapj4z6b/3C/t9zIvhv9TXYcHNiOW/3Re7th6h3z8CVuv7i0SoPw//"
+    b"MRfIROY/Imy95jlZkb85BdmQf/XmPyWRoJkpuZo/Fs2JlQ1F2z+2JJT9WxXZv4DP3HNR1Ok/"
+    b"Kmr5oJaLvb9l+rKtILLUv2I9dKQFNOm/UKaewP0c2z+Tc1s06crTv0umf30PlNC/xRuu7uL/"
+    b"07/i5pj6g/3avw0+s8oT8um/it9RLvLZ5D9m6SOPh9Tkv88Tb0iwwNU/7PGd2DZXyL9K/9H2"
+    b"fUeaPydvmueh3dG/RDkLd3v95j8aFLZBAF/kP+Xe2zAUptq/pLbenX+i4T+xUvxvjq/mv/pC"
+    b"36fIQcI/Kr369oLN4z+yjfNV85TDP0wUq8k69W4/LeObEq+n6D8HsZgPlPPFP9CBCqPhHqU/"
+    b"ZaJmqoio5z+VmGVmeMvkvwC+J6hUS90/AQBJ6PuNwL+Pgp876ubrvxkXotD4ur2/2aSxJjgI"
+    b"5r+f8fGR4Vqwv58sRPNC5sM/Pu+dPFqT5j+82d2NsffaP+gldm1gT9m/2//BbgSEwT+NkcgM"
+    b"Ar/pv5wmD9zyINc/b2ayoQIRxT/AzaHbxZjhP+dCXl1xg+e/3VAipUEc678LXcWU+XLLP0H2"
+    b"UV7FPbM/1D7qrwW83j+hHKz5Rpnrv12CfhCZctA/BNEfP3u52z+foY4iz2CpPyS6B+rwM5O/"
+    b"AzswyPABc79Jyxgc7Ufjv154oJ8WiOk/1Xa+Gr0I4b++JcMkDQbCvxOXruSZY+U/vUmVsVcA"
+    b"4D/a6HE7043iP/HKS8Ouxea/myplepCD17/qsnAMkSnDvwyevtCWAD8/VW8nC1WW6j9pUqxg"
+    b"HEfEP9Ty6c4tEuE/HEj8q9UYvr+ENFq2qdjUv1ZC4bsoMew/4VBjaKKh1D95aTu8afjtv+4h"
+    b"XF4IJM6/RYwLPYpK0D+D6kcI5Qiqv8C3sf2tXtc/72VgwIu007/3WGKCBGDpv0OTZTf7NNg/"
+)
+
+
+def _rows(values: array, start: int, width: int) -> list:
+    end = start + kSize * width
+    return [values[i : i + width].tolist() for i in range(start, end, width)]
 
-uniform = [
-    0.21715864926591522,
-    0.88494591885164553,
-    0.8422102044892319,
-    0.76061694491848586,
-    0.82502952148253805,
-    0.11135672005140451,
-    0.035584121845477767,
-    0.42905170691075289,
-    0.64771494138346597,
-    0.03652356702791737,
-    0.58312388586670405,
-    0.83772161231153652,
-    0.25375338516077539,
-    0.314500349022937,
-    0.15464815049483738,
-    0.81082349747399185,
-    0.23252514210291109,
-    0.16495269159527126,
-    0.97052509486193328,
-    0.91088178283237298,
-    0.93606713426157984,
-    0.12599971618182204,
-    0.30613588471368791,
-    0.21459922623596728,
-    0.85822196242422599,
-    0.8635466803848042,
-    0.76760814541473166,
-    0.88208150911101202,
-    0.32987333917096828,
-    0.70228023285475283,
-    0.94951612306075783,
-    0.56597305396924202,
-    0.14631262827054425,
-    0.36608672351258775,
-    0.87488038216336084,
-    0.94793393111319468,
-    0.29425440506389888,
-    0.19823677728191158,
-    0.68346894850203443,
-    0.68848955514947208,
-    0.74792194535680145,
-    0.084469258032776162,
-    0.43916834748094091,
-    0.12477092809742629,
-    0.95064259239531701,
-    0.82843393976676349,
-    0.34844525371465163,
-    0.85803121632192525,
-    0.69165902415187697,
-    0.81310460392766459,
-    0.81260344297977771,
-    0.49062085642721942,
-    0.033096754696003039,
-    0.45490425792006839,
-    0.95933922427365215,
-    0.12705899079813809,
-    0.51160120581467128,
-    0.077565020384584571,
-    0.1462293056883115,
-    0.35003723060005365,
-    0.24646944598938747,
-    0.85049687990007183,
-    0.66664779956152054,
-    0.7917473572102981,
-    0.90749666858460332,
-    0.54784136713946907,
-    0.075805542925102776,
-    0.79062507151903239,
-    0.52617724419884171,
-    0.46324971289143857,
-    0.30948512498544889,
-    0.84263883111086801,
-    0.71403209441160131,
-    0.33925396937133545,
-    0.57500789743187708,
-    0.97569197314428324,
-    0.1042191561905863,
-    0.300634246146259,
-    0.80594926456496618,
-    0.1643514573184861,
-    0.087012576503931349,
-    0.9597082672516164,
-    0.27375574605000241,
-    0.27110059521448582,
-    0.39763911909595095,
-    0.18293454559837752,
-    0.96671279529397935,
-    0.040499523737386633,
-    0.84180061115462679,
-    0.78947394060411913,
-    0.80558770603700891,
-    0.76127310212783272,
-    0.050330632669723485,
-    0.17424298881254141,
-    0.24445745542383818,
-    0.63978394353949919,
-    0.82604060519503419,
-    0.68715270086611691,
-    0.88442186325193961,
-    0.36678984961420769,
-    0.89894328537932511,
-    0.31185177064743153,
-    0.79674331978145285,
-    0.8529263547045085,
-    0.96103007755367309,
-    0.07138245304447377,
-    0.029311978138855999,
-    0.05447028605378712,
-    0.75843093970911712,
-    0.89581226507731038,
-    0.081879199174167194,
-    0.59629523850502553,
-    0.4502245524299191,
-    0.025322062881619756,
-    0.43636466916493899,
-    0.32420687139046844,
-    0.86390715051491118,
-    0.90960756097232576,
-    0.29084850791593864,
-    0.91968152377590251,
-    0.17297436256393439,
-    0.60673933531577529,
-    0.0063866470201241476,
-    0.62017152513986451,
-    0.84469478728506631,
-    0.13246405950141149,
-    0.070492632474985051,
-    0.87470969987527691,
-    0.56743950386910802,
-    0.79425325019237603,
-    0.011523322557381199,
-    0.64477679248977138,
-    0.94268505702525029,
-    0.56136327569357292,
-    0.51430861833124641,
-    0.92357934458863067,
-    0.44858541253199413,
-    0.56105159043751107,
-    0.67602470004190529,
-    0.23913123387247293,
-    0.82983707305717624,
-    0.17751824581607112,
-    0.83374910108819122,
-    0.016498184548795924,
-    0.65473320348406316,
-    0.47979339711180469,
-    0.21060805108186376,
-    0.81229721899316831,
-    0.92631124729363457,
-    0.54075670586929836,
-    0.11980962062110057,
-    0.4915011756130041,
-    0.360177691419868,
-    0.20051890189660182,
-    0.89686198299232034,
-    0.035292097909032316,
-    0.10821325982096131,
-    0.40943043402420143,
-    0.25546371842039273,
-    0.62398927905234358,
-    0.86553124794294178,
-    0.24064386614029232,
-    0.67300415864684116,
-    0.35087245303676906,
-    0.68321969660129844,
-    0.97177961662011558,
-    0.42480003415883072,
-    0.28268272966356167,
-    0.66192907948749302,
-    0.23800175055539929,
-    0.30781422787101187,
-    0.79373732192360191,
-    0.38039586553256033,
-    0.36964940989961903,
-    0.90314191819381473,
-    0.46976624211731099,
-    0.41020889963610885,
-    0.31952030003456544,
-    0.57005627872816245,
-    0.38564788466412092,
-    0.64146706828773947,
-    0.46475948709938342,
-    0.49668853571688332,
-    0.16961291868355444,
-    0.52557352879459884,
-    0.380893357566221,
-    0.41513403055754083,
-    0.90355939859532608,
-    0.16210831784810309,
-    0.88215240382933646,
-    0.21367746695166234,
-    0.51694505833647253,
-    0.28330182874644416,
-    0.76128774577290859,
-    0.70707698205961589,
-    0.52266247614021188,
-    0.099204399703884061,
-    0.087502438220024459,
-    0.76760008810421887,
-    0.85665506899507027,
-    0.74031936690766331,
-    0.43239745709964272,
-    0.13556972890531505,
-    0.22485222561361917,
-    0.48282920535837714,
-    0.2717628017946927,
-    0.79292199233761784,
-    0.53244313477563665,
-    0.31980183360846448,
-    0.76023963648353865,
-    0.31808928923626811,
-    0.39852943591323386,
-    0.60897339242421178,
-    0.77392604308245172,
-    0.78087347129657925,
-    0.56879625230699338,
-    0.18228233634061608,
-    0.15741541653810209,
-    0.59638527059963131,
-    0.1234707967955595,
-    0.61111838751029834,
-    0.60690527476111189,
-    0.73802644346604374,
-    0.045339895940861519,
-    0.75370943928523326,
-    0.084978586063783057,
-    0.98788181651526297,
-    0.636648923056784,
-    0.96165153415869808,
-    0.80825761202331048,
-    0.72151634090542149,
-    0.30049583224613352,
-    0.6883260699854914,
-    0.58105835169206399,
-    0.92448710864004102,
-    0.54412985740780129,
-    0.28126711642564661,
-    0.653363749982804,
-    0.91384995356249177,
-    0.26296307603817759,
-    0.038895617962350526,
-    0.62830639608169503,
-    0.21849622488608267,
-    0.44052275928912765,
-    0.17500037757636844,
-    0.10198274448650757,
-    0.35138217710277253,
-    0.016641954338015186,
-    0.39172508304409687,
-    0.030250109108473033,
-    0.047939427155327508,
-    0.077078723481999845,
-    0.95450295744656666,
-    0.21358960651510492,
-    0.36359395300358055,
-    0.98358630394746793,
-]
 
+def _decode() -> dict:
+    """Unpack the blob into the public tables."""
+    data = b64decode(_BLOB)
+    values = array("d", data[kSize:])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return {
+        "perm": list(data[:kSize]),
+        "uniform": values[:kSize].tolist(),
+        "grads2": _rows(values, kSize, 2),
+        "grads3": _rows(values, 3 * kSize, 3),
+        "grads4": _rows(values, 6 * kSize, 4),
+    }
 
-grads2 = [
-    [0.45149288432193807, -0.89227471969492511],
-    [0.99575289703553382, -0.09206610693051806],
-    [0.9880693911773204, 0.15400934458168208],
-    [0.94025923372270293, -0.34045935645711894],
-    [-0.73316581405684655, 0.68004991662256786],
-    [-0.61701136754153474, 0.7869542377575236],
-    [-0.92279722900874328, 0.38528596410171118],
-    [-0.76715170271511324, 0.64146571616985315],
-    [-0.75963392461958457, -0.65035090571709608],
-    [0.37544326852511561, 0.92684537659696931],
-    [-0.88280879312342375, 0.46973251408004973],
-    [0.18291120880585052, 0.98312943689688315],
-    [-0.074346756078264437, -0.99723245026455032],
-    [-0.94406329890967455, -0.32976429105011146],
-    [-0.75669421480832522, 0.65376896934284956],
-    [-0.66176836479155854, 0.74970836420644693],
-    [0.96085799595835641, -0.27704135359706],
-    [-0.94803754014246366, -0.31815848641931072],
-    [-0.84221252451067063, 0.53914567934591018],
-    [-0.96808208210728608, -0.25063336231001204],
-    [0.87196365865166614, -0.48957060572587574],
-    [0.017494105817551189, 0.99984696642118409],
-    [0.06359672058038858, -0.99797567962922828],
-    [0.99891169424571502, -0.046641474024254025],
-    [0.31836306488609339, -0.94796885967648392],
-    [0.89570437427740957, 0.44465005779861794],
-    [0.99509116378971274, 0.098962496672401382],
-    [-0.63441582641790673, 0.77299195286269584],
-    [-0.84707551589285868, 0.53147254903225949],
-    [-0.37113687458355815, 0.92857817135895881],
-    [0.34721024069826489, -0.9377873153088887],
-    [0.6215960634512897, -0.78333794361173414],
-    [0.70518595172560061, -0.7090224069018265],
-    [0.1412764543165739, -0.98997018311449003],
-    [0.47614260874634823, 0.87936807773322201],
-    [-0.98348417216106276, -0.18099415213942449],
-    [-0.24527974066774411, -0.96945234478955389],
-    [-0.97303415484516342, -0.23066107930198962],
-    [-0.11611226250788108, -0.99323609604932339],
-    [-0.99511134434903625, -0.098759365874097935],
-    [0.75070875614019716, -0.66063330483289884],
-    [0.97228063592986524, -0.23381694762317115],
-    [0.64979942292957538, 0.76010572288359401],
-    [-0.44576875700983182, 0.89514815269535675],
-    [-0.79004705285501953, 0.61304620892319195],
-    [-0.014515303160016044, 0.99989464743750522],
-    [-0.97368146910849762, -0.22791313414263295],
-    [0.31430709306373561, 0.94932136352755914],
-    [-0.29597187495567112, -0.95519665474457394],
-    [0.18469029450422714, -0.98279677203170634],
-    [0.19319791971582195, -0.98115980544327175],
-    [-0.77697937835244391, 0.62952604840073922],
-    [-0.99972620828881231, -0.02339889870216854],
-    [-0.81082809292471592, 0.58528437850678028],
-    [-0.21344471444978619, 0.97695514424841889],
-    [0.38872989307773498, -0.92135176248150341],
-    [0.061075672083492856, 0.99813313855394536],
-    [0.8263070474661337, 0.56321990670412281],
-    [0.80860411165459622, 0.58835311728185924],
-    [-0.91881343681325689, 0.39469211840548729],
-    [-0.81915980291330592, 0.57356535572769207],
-    [-0.52520527022354191, -0.85097557199335416],
-    [-0.72696722417445947, -0.68667215975025597],
-    [0.79748452191169794, -0.60333940473938108],
-    [-0.90193391680885215, 0.43187406695684144],
-    [0.96962978008618594, 0.24457736929244819],
-    [0.22712869832480179, -0.97386475159401953],
-    [-0.020183167961379565, -0.99979629911849688],
-    [0.42951515234079651, 0.90305965135735222],
-    [0.67399435693842547, -0.73873649349085113],
-    [-0.27249296969184172, 0.9621577736881417],
-    [-0.8271626278703792, 0.56196262069159797],
-    [0.68886569645930273, 0.72488899304765264],
-    [-0.9955592718090599, -0.094136795754977992],
-    [0.27624333832978648, 0.96108772649972751],
-    [0.57276916769815212, -0.81971670748763326],
-    [-0.48064909554928131, 0.87691302131263738],
-    [0.66024643190748056, 0.75104903245623089],
-    [0.9733811019113271, -0.22919256192531703],
-    [0.98166378927040299, 0.19062057820517145],
-    [0.94528446597266724, 0.32624726572152191],
-    [-0.97854705220193139, -0.20602346135066871],
-    [-0.73243934045282244, -0.68083229400274092],
-    [-0.031566138897729301, -0.99950166526879258],
-    [0.64038561351673162, 0.76805355672687259],
-    [0.1276176316564247, -0.99182344199479622],
-    [-0.96722071055394654, 0.2539371912019171],
-    [-0.0077820632898418941, -0.9999697192870155],
-    [-0.57460788198340462, -0.81842884966412666],
-    [0.52635051095732477, 0.85026768703447908],
-    [0.13298170580531637, 0.99111849237167826],
-    [-0.83638317121922467, -0.54814522792894294],
-    [-0.98005444149998777, 0.19872919185702639],
-    [0.93868809023857347, -0.34476755828276529],
-    [0.040718170210572183, -0.99917067141440019],
-    [0.6958432645539544, 0.7181936724692688],
-    [0.99930397217439937, 0.037303769199199303],
-    [0.8978910705357549, 0.44021770233846325],
-    [-0.75241089408230366, 0.65869404617490523],
-    [0.4966788188108604, 0.86793441626925294],
-    [-0.17079620697585635, -0.98530637655637865],
-    [-0.98470126808042835, -0.17425100470527183],
-    [0.96860236040329439, 0.24861509894044378],
-    [-0.0036563473746818818, 0.99999331553959681],
-    [-0.34067670094994507, 0.94018050683358767],
-    [-0.96344003254846555, 0.26792406327728713],
-    [-0.93743576532821205, 0.34815827705730262],
-    [-0.98682960824928589, -0.16176317344365063],
-    [0.98503086171589849, -0.17237807710737016],
-    [-0.99145467162468748, 0.13045165431524133],
-    [0.71695497426228039, 0.69711947676174757],
-    [-0.84481957278223108, 0.53505129608669166],
-    [-0.42890101658504248, 0.90335149193008868],
-    [-0.33767673245333918, 0.94126214433580391],
-    [0.5771679700351503, 0.81662545537443543],
-    [0.27102084870493681, 0.96257347749003341],
-    [-0.98483707073114979, -0.17348182646516125],
-    [-0.62783239364917398, 0.77834856297467947],
-    [0.82692602482352806, 0.56231072323899156],
-    [-0.96151582676256453, -0.27474954938107199],
-    [0.12114638348433598, -0.99263465271401141],
-    [-0.88762069710878955, 0.46057518177177786],
-    [-0.85708814603483452, -0.51516978747454756],
-    [-0.94228603119706456, -0.33480895360023522],
-    [0.30518556266742197, 0.95229290259844379],
-    [0.19975507980440296, 0.97984585935357016],
-    [0.58904267358478712, -0.80810192964507022],
-    [-0.13235673835847522, -0.99120214578616916],
-    [-0.41767751950037835, 0.90859533880821264],
-    [-0.99750423652201803, -0.070606643601193161],
-    [0.26114141106808025, -0.96530055600593756],
-    [-0.45044556041179001, -0.89280389621982958],
-    [0.98654582821219061, -0.16348494987956186],
-    [0.84729271412304841, -0.53112621531421156],
-    [0.44635640708891311, -0.89485527201367965],
-    [-0.80188574056180095, -0.59747741303220159],
-    [-0.27710569292417236, 0.96083944285661693],
-    [-0.13644319470886471, -0.99064789638783313],
-    [0.16825165009127063, -0.9857440754280824],
-    [0.5342499650218846, -0.84532654925426021],
-    [0.79212210390377613, -0.61036265654695421],
-    [-0.54122893398429639, -0.84087528267765255],
-    [0.096189993369554305, -0.99536299166463127],
-    [-0.70329307836263422, 0.71090002526882057],
-    [-0.46401940336914049, 0.8858250353749022],
-    [0.70066157739907242, -0.71349376588491897],
-    [0.45827004909555918, 0.88881300738791724],
-    [0.35213764650248736, 0.93594822395028321],
-    [-0.35492754283666567, -0.93489381179678732],
-    [-0.3218461123258593, 0.94679199404131564],
-    [0.56854390890850992, 0.8226529180906319],
-    [-0.96555536912729678, -0.26019767322066817],
-    [0.7729156797255986, -0.6345087485876898],
-    [0.4923869327468251, 0.87037641768385099],
-    [-0.00012261976563711856, -0.99999999248219651],
-    [-0.93156409092375636, -0.36357715068661212],
-    [-0.95933139783312016, 0.28228225082628078],
-    [0.70646413985165535, 0.70774883899845475],
-    [0.83477625809587397, 0.55058931965617619],
-    [0.84766384036806364, 0.53053370649984699],
-    [0.037311689716676942, 0.99930367647201523],
-    [-0.62708833888994508, 0.77894814668773016],
-    [0.91209131848606018, -0.40998710558060242],
-    [0.93820982363682615, 0.34606693981274161],
-    [-0.24473067021871406, -0.9695910988939096],
-    [0.92889420990913085, -0.37034517250437021],
-    [-0.26414865722797526, 0.96448197851730644],
-    [0.92374414921653258, 0.38301011316703382],
-    [-0.90487462839854438, 0.42567817289660964],
-    [0.84901311007186331, 0.52837178097065551],
-    [-0.15447173827497021, 0.98799720752353792],
-    [-0.8723117439963185, -0.48895012147058653],
-    [0.74567316520669902, 0.66631188694981502],
-    [0.15517475886794554, -0.98788703514636478],
-    [-0.79575716032276833, -0.605615836809973],
-    [0.31687862046497201, -0.94846609844117047],
-    [-0.179750187133255, -0.98371229037028896],
-    [0.90408145479782009, 0.42736017958000888],
-    [0.46500352779865278, 0.88530882698344726],
-    [0.17969783205628759, 0.98372185558432645],
-    [-0.99935636284777873, -0.035872831441901475],
-    [-0.42154807323972321, 0.90680605531054814],
-    [-0.64431706517756282, 0.76475847136267294],
-    [0.64087106221044576, -0.76764854042801034],
-    [-0.74135633178786631, -0.67111160719960683],
-    [0.95898457081271726, 0.28345827372498528],
-    [0.99760266338483361, -0.069202066497224574],
-    [0.11057274834478245, -0.99386803315303451],
-    [-0.38005956047919864, 0.9249620157002979],
-    [0.028985662450256085, -0.99957982741365881],
-    [-0.59511831042558461, 0.8036381005130343],
-    [0.43151623604181566, 0.90210517016160796],
-    [0.67483210351469725, 0.73797129487936652],
-    [0.99460291383193988, -0.10375472903446299],
-    [-0.50323902771983253, 0.86414725653652202],
-    [-0.74645404378639935, 0.66543696960338172],
-    [0.54589803172131068, -0.83785162108979594],
-    [0.30312870768546718, -0.95294962436476072],
-    [0.83528938744137415, 0.54981054848721633],
-    [0.95789452377338435, 0.28712032551695371],
-    [0.76546043556298859, 0.64348296138104533],
-    [0.97203817633819323, 0.23482287738020671],
-    [-0.12352422738503878, 0.99234155674794222],
-    [0.98465601003826186, 0.17450656691233807],
-    [0.61137674792361985, -0.791339669230817],
-    [-0.99573115842040849, 0.092300921722111795],
-    [0.82065771681618682, 0.57142008350253426],
-    [-0.069704099762815497, 0.99756771122378218],
-    [-0.99212338421681323, -0.12526448215746372],
-    [-0.90715080134021897, 0.42080568393000439],
-    [-0.763667851440892, -0.64560933440870538],
-    [0.8575933795643137, -0.51432829528177704],
-    [-0.89753649546847447, -0.44094017655705769],
-    [-0.98663065602266664, -0.16297223259280225],
-    [-0.24556069746291848, -0.96938121699439028],
-    [0.9977681506229058, 0.066773629544504082],
-    [0.91472097800864494, -0.40408604577603074],
-    [0.25377005135859626, 0.96726457654224851],
-    [0.98176490578945053, 0.19009910510107991],
-    [0.9952637671718878, -0.097211284092034139],
-    [0.89224593685304399, 0.45154976267210428],
-    [0.77771604809396377, 0.62861573996926545],
-    [0.86936686999961199, -0.49416722407205232],
-    [-0.024995268458229518, -0.99968756947093274],
-    [0.71219971154808204, -0.70197690194965012],
-    [-0.56565648370241994, 0.82464097790821311],
-    [-0.36823993435079694, 0.92973079477304654],
-    [0.97995430002469219, -0.19922241305414332],
-    [-0.9977653888746405, -0.066814884298616747],
-    [-0.022256753711943394, -0.99975228777643022],
-    [0.78876491057950571, -0.61469497788619054],
-    [-0.32725462847011155, 0.94493619263148609],
-    [-0.58753588255615441, 0.80919811338692627],
-    [0.29729403013665406, -0.95478597583181246],
-    [-0.17683353577354446, -0.98424077370622398],
-    [-0.46766155733454612, 0.88390761270136553],
-    [0.33762178122132697, 0.9412818562178592],
-    [-0.18354453593493666, 0.98301139531972315],
-    [0.9705633853232295, -0.24084583257742326],
-    [0.84875784424163858, -0.52878173364658343],
-    [-0.96541479827928267, 0.26071875126920191],
-    [0.61685659910727708, -0.78707555935742535],
-    [0.70229231627492661, 0.71188868687541196],
-    [-0.86303235394763012, -0.50514864746885413],
-    [-0.58746665216911387, 0.80924837509210568],
-    [0.30912317408457063, 0.95102200986301055],
-    [-0.20162824822990447, 0.97946212255285303],
-    [-0.18487644560833186, -0.98276177167166501],
-    [-0.63414200245340158, -0.77321660660153313],
-    [0.5422144119508181, -0.84024016297296122],
-    [-0.91043595711621739, 0.41365005498594731],
-    [0.09700247291240989, 0.99528414045883262],
-    [0.035563503089446467, -0.99936741854435451],
-    [-0.013610888329200942, 0.99990736756906129],
-    [0.94536789314374181, -0.32600543954505229],
-    [0.51661260773900786, -0.85621925552109723],
-]
 
+def __getattr__(name: str):
+    if name not in _TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # decode once; later lookups find the tables in the module globals
+    globals().update(_decode())
+    return globals()[name]
 
-grads3 = [
-    [0.82789759568688626, -0.5019306895259531, 0.25030212537626212],
-    [-0.24806441290573628, -0.68400003571236312, 0.68600874498450715],
-    [0.85189480135899442, -0.096361500793552574, -0.51477151104381591],
-    [0.23632884144733249, -0.76778726860465596, 0.59552614457197739],
-    [-0.78489756280724687, 0.016898689812071002, 0.61939506793473864],
-    [0.55979994875923866, 0.60255439561032231, 0.56881650617737245],
-    [-0.030478003102772277, 0.48981991627369498, 0.87129073273419932],
-    [-0.11321842516578494, -0.11267927990738424, -0.9871600519077609],
-    [0.13586056419322731, 0.77576527413347529, -0.61622248136992852],
-    [0.27201378026196404, 0.25952765016719137, 0.92663579800604068],
-    [0.53167886346435811, -0.59357295334719218, -0.60414297579293286],
-    [0.091567676628785594, 0.58995220955373484, -0.80222923845960159],
-    [-0.46711240571671314, 0.28220810747212294, 0.83795261471192251],
-    [0.93924872897056322, -0.32946808566581848, -0.096242431675859386],
-    [0.099179460495193175, -0.55380762549441021, 0.82671672812404462],
-    [-0.4778159083138363, -0.13410087035644205, -0.86816410564585555],
-    [0.68389083353724878, -0.16689970817680161, 0.7102378581955664],
-    [0.062214350994452827, 0.79598533755672252, -0.60211021991413616],
-    [0.85489428256499111, -0.22604684800651889, 0.46696743799113766],
-    [0.69944364552352511, 0.0050337173644881446, -0.71467002765350085],
-    [0.69315502540021556, 0.35376719792574224, -0.62800070098224814],
-    [-0.7990553671615076, 0.58601653028749889, -0.13451820114835542],
-    [-0.13587483541250939, 0.68415604949508102, -0.71656718389897511],
-    [0.10477329227286308, 0.83261217986736169, -0.5438561530063124],
-    [-0.11056188859706764, 0.37865694338928813, -0.91890967347880881],
-    [-0.96669258190844787, 0.18027319782011439, 0.18167835928059442],
-    [0.012958590905829494, 0.93709301939026213, 0.34883914334801552],
-    [-0.95347718859505415, -0.20713824311026463, 0.2190319590152642],
-    [0.62179258310850316, -0.66070862443133538, 0.42052122085967059],
-    [0.3108052656929054, -0.94839062796241103, 0.062891204556967298],
-    [-0.8147082795171946, 0.19216511727695645, -0.54710418293782603],
-    [-0.20856139367463533, -0.97618366704740467, -0.059729333316012594],
-    [0.32233436062872145, -0.94650967728496371, -0.014832085624999596],
-    [0.32657360828961612, 0.21070346621859423, -0.92138685018409594],
-    [-0.46856819603419009, 0.48122488262361895, -0.7408552206802278],
-    [-0.98913254889909052, -0.02405164702457124, -0.14504592025904689],
-    [0.80554400065564591, 0.58109428221912685, 0.11588053408547332],
-    [-0.67624338132057049, 0.73431285449481465, 0.058987464293684212],
-    [-0.066324457433390285, -0.17194003232552821, -0.98287216443953829],
-    [0.6586017204783956, 0.6078835018762534, -0.44353288708906419],
-    [-0.40291665866466098, 0.90942640632039695, 0.10296493411678163],
-    [0.87510387114206045, -0.38699093205214286, 0.290570530545673],
-    [-0.3490947236865925, -0.37253801521851593, 0.85985365098441635],
-    [-0.76048018002959772, -0.18901402427521818, -0.62124358701674953],
-    [-0.98556732769485189, 0.15772261360663525, -0.061486744404955995],
-    [0.027785641428761464, -0.62938305784001458, 0.77659830326517265],
-    [-0.72217843842221363, 0.6802973155605756, -0.12511540879974675],
-    [-0.54283494788252751, 0.72623368057614945, 0.42179955020624788],
-    [-0.028490878979377809, 0.26995550299345272, 0.96245119160325965],
-    [-0.47527230751490673, -0.47414751755489687, -0.74114800499359412],
-    [0.43011524738943291, 0.27526808179013723, -0.85978390140238459],
-    [-0.68294269354209725, 0.0397003622092739, -0.72939232144156629],
-    [0.87849865997193977, 0.030549176653045112, -0.47676708384003075],
-    [0.61111375064431239, -0.54414472470520947, 0.57484476369619397],
-    [0.57606752024626962, -0.1811842064649791, -0.7970686892890535],
-    [-0.93123167613493596, 0.34870939875650686, -0.10587407889466151],
-    [-0.50592105107331409, -0.03147459236285606, 0.86200535967966296],
-    [0.60994111288381825, -0.72038047261485427, -0.33018754290440561],
-    [-0.64301751958527353, -0.18112616695884493, -0.7441248424486302],
-    [0.33646352888554271, -0.49175834590193296, 0.80309776675426159],
-    [0.54280420642265614, -0.82809083018759855, 0.14010414144158759],
-    [0.41978761048769703, 0.60860400587398422, -0.6733346316024218],
-    [-0.11657588982652085, 0.83272839689170908, -0.54127024573804094],
-    [0.75636716769625667, 0.6428101522552403, -0.12125929155630805],
-    [-0.19158801003407908, 0.56736513335483052, -0.80086880315344844],
-    [0.0096789700325246551, -0.47481707262836076, 0.88003128642096762],
-    [0.96192564024115712, 0.12733900472666068, 0.24183432453203083],
-    [0.59077367779705037, 0.50650645277130202, -0.62804273335751559],
-    [-0.51681996528162411, -0.84614906171658266, 0.13011106348980303],
-    [0.29430287721773563, 0.047424125933310163, -0.95453484417323597],
-    [0.83056139631689363, -0.54882181731765833, -0.094669846225049967],
-    [-0.51726666485611872, 0.26461324188618685, 0.81388883125836664],
-    [-0.036649810980168097, -0.38764199967016766, 0.92108114270504515],
-    [-0.60372659238128357, -0.33583926531176778, 0.72299805637811743],
-    [0.22582390486067799, -0.4970034653819278, 0.83784910299637494],
-    [-0.92562507408217853, -0.34668106482017919, -0.1517579043262923],
-    [0.85502487457055942, 0.4243280620691291, -0.29812440290297698],
-    [-0.10147559249929464, -0.61564250889122718, 0.78146465394989717],
-    [-0.86351241020384373, -0.48305444797526809, 0.14493004421188083],
-    [0.43125715633903033, -0.8273927176393181, 0.3597757022143056],
-    [-0.38433192945852501, -0.39296380945344322, -0.8353851880770482],
-    [0.55052569585054734, 0.74774718057195, 0.37120831369322849],
-    [-0.087668731804306427, 0.94083923609931286, -0.32731594107205703],
-    [0.68513391772216625, 0.57813233617562199, -0.44311907728599709],
-    [-0.3521603236241384, 0.72909528377628408, 0.58685873397276977],
-    [-0.34122762485216895, 0.29064782199053496, 0.89391697131775383],
-    [0.56453660491521851, 0.81194633073764644, 0.14846406202334336],
-    [0.42192087027813668, 0.15687509088569893, -0.89295743744220168],
-    [-0.12553714984660447, -0.82559756878792023, 0.55011733150289521],
-    [0.46279716317854075, 0.24486924202741772, 0.85197291040432332],
-    [-0.82765980242520099, -0.56064907679312725, 0.025531630196512448],
-    [-0.95514460748600838, -0.22958419136692615, 0.18705581483822845],
-    [0.45753860625906839, -0.21379930348339862, 0.86310386490417412],
-    [-0.53835467374666979, 0.057009374330916615, 0.84078783084290309],
-    [0.60221582484954539, 0.47198680802729942, 0.64386687548668242],
-    [-0.20063380962975558, 0.95038976699849576, -0.2377085720330587],
-    [0.60867907273669297, -0.61071401816329496, 0.50649597671772506],
-    [0.11195951863720158, -0.20404541772992141, 0.97253819137859465],
-    [-0.49130281094074035, 0.68387834031502015, 0.5393810931147851],
-    [0.30351222719196275, -0.87082854538696874, 0.38670139964084743],
-    [-0.79775170266594497, 0.084500726788696273, 0.59703588507372629],
-    [0.14983573915805756, 0.6857068749495252, -0.71228879881542062],
-    [-0.066763251598948067, 0.85625391302500475, 0.51222251479733183],
-    [-0.23474911795552203, 0.97125614498617696, -0.039425276735808416],
-    [-0.24662753805954596, 0.96455030970840916, -0.093901850418929705],
-    [0.18081088795551875, -0.22279097340650583, 0.95795177590801428],
-    [0.55725157179266294, -0.32886243372110102, -0.76244356212223419],
-    [-0.84981882749677873, -0.3220402784010713, 0.4172505476561541],
-    [-0.7810217080563473, 0.24701677938900704, -0.5735745829837896],
-    [0.18388757626480887, -0.36519852563414013, 0.91258719921446663],
-    [-0.65250080067178395, 0.44664949528884784, -0.61216577287602281],
-    [-0.50516292904703641, 0.80441649123226866, 0.31260921891426102],
-    [-0.33526137217482777, -0.67214844074701852, 0.66016383264217338],
-    [0.26472560744692952, -0.93264212989141237, -0.24515099492652265],
-    [-0.27709022156013319, 0.42506413899474621, -0.86170846976016857],
-    [0.7745046307332023, -0.41958049768002242, 0.47338650481336159],
-    [-0.4817961233384318, 0.787525988030508, -0.38428545862760771],
-    [-0.66225741680450767, -0.048300956894078526, 0.74771794912957446],
-    [-0.090283857670272583, 0.24042809878093746, -0.9664590805413118],
-    [0.7070136445247015, -0.25840951670390966, 0.6582979782231988],
-    [-0.23373215403549313, -0.00071852375419219708, -0.97230075794146276],
-    [-0.51768742358889408, 0.70663754119678335, -0.48235165266562258],
-    [0.08353324995337566, 0.68997656208175939, -0.71899550758684361],
-    [-0.27205725093737343, 0.83616962257909577, -0.47624071065830959],
-    [0.33408526031633595, -0.010846742316789719, -0.94248044383980678],
-    [0.78336685656666538, 0.49110144027134234, -0.3809931015074613],
-    [0.50311733494953015, 0.76237248703310778, 0.40701491162884462],
-    [0.42655205050778677, -0.90359764893612637, -0.039555493230488951],
-    [0.88020516032544305, 0.40209622339922046, -0.25210613412716742],
-    [-0.16552599604920848, 0.96252335386691645, -0.21482536603646291],
-    [0.33610848576554331, 0.79876205788937527, -0.499009279144911],
-    [0.29987131691314822, 0.95282660790548135, 0.04688974898747459],
-    [0.17002900714498842, 0.44764684556832129, 0.8778965989124351],
-    [0.17546951658533261, -0.72816008811565325, 0.66256572113618561],
-    [-0.65603185955978971, 0.4277216975714177, -0.62183305530435518],
-    [0.62015117996097624, 0.77995476652401974, 0.084161013358150669],
-    [0.46461921008829021, 0.32580496232057643, 0.82339547979341077],
-    [-0.94092649727166811, -0.30545110350394133, -0.14614017278043098],
-    [0.85436930139192124, 0.46648823832469927, -0.22900179113666175],
-    [-0.20457345671091101, 0.17618576720454204, -0.96286461989414462],
-    [-0.94090402072695767, -0.22117849583849941, -0.25647552857624401],
-    [0.50869001559247196, -0.75038469750023695, -0.42208680836293411],
-    [-0.96339447258571442, 0.17759274197149558, -0.2008280562828286],
-    [-0.057508567114342872, -0.86716098003164932, -0.49469647200986244],
-    [-0.45382382688630835, -0.23578477016226687, 0.85933083053605896],
-    [-0.32733888995532973, 0.90223111897273345, 0.28076370684264329],
-    [-0.66249793664357115, -0.4948537184866329, 0.56233111352917597],
-    [0.22380706391289232, 0.69374826343714546, -0.68456098714477986],
-    [-0.64262371792619244, -0.24941760979635319, 0.7244484889087639],
-    [0.55168971912585474, -0.092977337682888628, 0.82885081196089672],
-    [0.59072823599824476, 0.48232746098502277, 0.64683875237507493],
-    [0.266472519230184, -0.84452112023052572, -0.4645174635895804],
-    [-0.94086463117472896, 0.26295569459376844, -0.21360722947772601],
-    [0.53326558836654203, 0.84000206809001055, -0.10012161539143809],
-    [-0.94770437790150719, 0.14013167557668221, 0.28673947340118494],
-    [-0.44859024030246603, -0.0035316664833851463, -0.89373056545987384],
-    [-0.93150107068910137, 0.36366820015386053, -0.0071551032074835107],
-    [0.45782005419173988, -0.38916622235180798, 0.79934376169473909],
-    [0.10632542071802821, 0.91197229734190477, -0.39623406439888847],
-    [-0.98663615070255917, 0.16108134968941096, 0.02453375040784694],
-    [-0.85230283063835466, 0.21733058736814034, -0.47575970897089115],
-    [0.8778131347343161, 0.4763939296019844, -0.04992919312679793],
-    [-0.5479886476836654, -0.56193435508035239, 0.61962748695507042],
-    [0.30732890835224286, -0.7770569427044669, -0.54930087373479175],
-    [-0.18509852343186159, -0.98222453312030034, -0.031201012162313333],
-    [0.27457365593668853, 0.30076076343327462, -0.91331936946754544],
-    [0.97107208176859505, -0.23709203514843094, 0.028396811067130889],
-    [0.20942196574111582, -0.34543406529956616, -0.91477743019586022],
-    [-0.9398107483272542, -0.20825816840211758, 0.27089535363745509],
-    [0.96688101322234521, 0.0073272501441243856, 0.25512235824297402],
-    [0.27008730569745665, 0.69125558476164728, 0.67023769204433858],
-    [-0.66112929858666813, 0.076662956116023681, -0.74634498840003816],
-    [0.32609524013531521, -0.046595346492813168, 0.94418788810612564],
-    [0.97901533935455498, 0.12768872727536121, -0.158822398405527],
-    [0.97153578551210773, -0.17685221215736818, -0.15761190476742862],
-    [0.30195742967442385, 0.20150579848423578, -0.93178169323165272],
-    [-0.83464703220184455, -0.15927555505758428, -0.52725290819278714],
-    [0.73406204393749397, -0.19356549894035097, 0.65091114084050039],
-    [0.063480838427759534, -0.90673458504733706, 0.41689636054005325],
-    [0.067270436323950383, -0.21940275775733128, 0.97331244638361802],
-    [-0.14221651842552149, -0.83087843023960417, -0.53797350868745797],
-    [-0.80327701339430591, -0.56310319653570162, -0.1940639837878205],
-    [-0.34232865343840363, 0.76863992029379336, -0.54037372804920902],
-    [0.47810617891725843, 0.74472479492613253, -0.46561729081228093],
-    [-0.46493351538105332, -0.091222422492182639, 0.88063346286072597],
-    [0.37852516038460049, 0.83734242184242424, 0.39443170706584435],
-    [-0.27693230183756185, -0.91467276503744566, -0.29441846595908872],
-    [0.054394687018387969, 0.62681050437088348, -0.77727074410046504],
-    [0.23629992414743994, -0.95790736288690048, -0.16302094949722848],
-    [-0.66978634825912142, 0.23976615857854386, -0.70277908113873111],
-    [0.048209833947092842, 0.93758538590296658, 0.34439723583672838],
-    [-0.57497138634769729, -0.59498020036025323, 0.56161060002521335],
-    [-0.13346315142892845, -0.88739343452219188, -0.44127143526129964],
-    [0.081313610031855957, 0.23843482081952955, 0.96774838312670208],
-    [0.48334170198669862, -0.64727573860117038, 0.58941913553846426],
-    [-0.94902059198045197, -0.10274459569243807, 0.29799910075882735],
-    [0.59622953791602107, -0.5726963552383052, 0.56260929854847652],
-    [-0.67901924438088512, 0.69459737779530739, -0.23762859365045852],
-    [-0.25645104254234019, -0.67040069213244147, 0.69627277324859582],
-    [0.72230921948373983, 0.66642329780983467, 0.18479550748071558],
-    [-0.95030323177731557, 0.22837979023318805, -0.21158080982602062],
-    [0.022740389478261382, 0.3102647615701925, 0.95037816284580579],
-    [-0.8576744469251496, -0.50475581898831057, 0.098061747328295756],
-    [0.39307515184210368, -0.31996959174122758, -0.86203908575264676],
-    [-0.46746906545897587, -0.35238352685202229, -0.81073949135480106],
-    [0.57310498449730141, 0.70230241156062834, -0.42228189572899466],
-    [0.89187904662965223, 0.16324896829037391, 0.4217837603975656],
-    [-0.47952684175760418, 0.85358532174918089, -0.20358316857816333],
-    [-0.99541551470637868, 0.0052269070417739214, -0.095502002725659382],
-    [-0.59879879738407693, -0.71870395311451452, -0.35341848852168561],
-    [0.58042440661563333, -0.81430411386264601, 0.0040395979082920004],
-    [-0.71702063157753471, -0.38700846063151817, -0.57974638014546997],
-    [-0.030474536274205297, 0.51898788431888254, -0.85423818608692637],
-    [0.40276867402091859, 0.72201162259056018, 0.56256254058689126],
-    [0.49961876583592713, -0.1106016509119445, -0.8591556108413293],
-    [0.15420702345018678, -0.97294624746524061, 0.1720342799035714],
-    [0.59467528947527004, 0.68900499977567964, 0.41428662828001028],
-    [-0.094581797787464825, 0.54281765476949495, -0.83450780535465119],
-    [-0.87494602365101448, 0.48168981087793, -0.049440689656016605],
-    [-0.45856825707270465, 0.3119981391500013, 0.83208912669992163],
-    [0.53834283212500211, 0.7840165185549276, -0.30903898416323211],
-    [-0.60536956681130549, 0.4020411405892782, 0.68694294439375725],
-    [-0.1405324373552001, 0.87186968771921625, -0.4691416435229378],
-    [0.66927925820973999, -0.048727567809871669, -0.74141142334439036],
-    [-0.61597118440714937, -0.48649403843013861, 0.61959910470560575],
-    [-0.28476896696361648, -0.47178246664735723, 0.83446266520354884],
-    [-0.64161163696685319, 0.76483655177565069, -0.057961680243482278],
-    [-0.61822109176942164, -0.74005254202355997, 0.26481109632319288],
-    [0.16547538117916302, 0.52177115763249404, -0.83688276197234313],
-    [0.54161947389664467, -0.73887369504987288, -0.40089151682128366],
-    [0.75204470790032174, 0.30959956735738126, 0.5818735818124432],
-    [0.68405190535779647, 0.43044934780279853, 0.58888568479163561],
-    [0.33403104007693285, -0.58948429268034053, -0.73548047761193547],
-    [-0.25923680126553295, -0.41236098228312851, -0.87335828911169566],
-    [-0.31986769254404118, -0.93762863254170836, -0.13615141095308797],
-    [-0.60107377400477247, -0.45932396899052474, 0.65401208682596323],
-    [0.36547659260026888, -0.30989465345144396, 0.87771986648560407],
-    [0.68812419460625518, 0.26855599973519806, -0.67406436473360665],
-    [0.16861419587582227, -0.97614428420052246, -0.13679031168836311],
-    [-0.0795809107999048, -0.66148891270113586, 0.74572065615063021],
-    [-0.65177735296079031, -0.34665230476529113, 0.67455056279595293],
-    [-0.05889953185914408, 0.99129747199808216, -0.11772921114568541],
-    [-0.17852723678983162, 0.34009511379383778, -0.92328941253419772],
-    [-0.36574650347261217, 0.76235174317906784, 0.53390009821069984],
-    [-0.64309567628437869, 0.44573273111349176, 0.62269598004037674],
-    [-0.63735431799352793, 0.5814093553260693, 0.50571003042685403],
-    [-0.0053098293234882521, -0.92683967415151947, 0.37541979720209334],
-    [-0.2165064684713677, -0.94206948200508511, -0.25618360639339743],
-    [-0.37403891994633615, 0.81614738449795554, -0.44045241870436436],
-    [0.80880781082563202, -0.56565276798113806, 0.16083181035704802],
-    [-0.91769497873263406, -0.20135338793230428, -0.34248027560298044],
-    [-0.42133957547918638, 0.050692145042238464, -0.90548510123912906],
-    [0.39438528275348184, -0.39446760981878992, -0.82997322459902712],
-    [-0.8610287650583105, 0.053928213719023996, 0.50568885048736822],
-    [-0.66681537166990135, -0.13997439917070162, 0.73195930739456561],
-    [-0.72366492690252915, -0.011501538720493937, -0.69005564136395425],
-]
 
-grads4 = [
-    [
-        -0.69918998827596002,
-        -0.62891499137565066,
-        0.30513385594257875,
-        -0.14997541090205971,
-    ],
-    [
-        0.39646174201336426,
-        -0.2558398830180777,
-        0.33632670380905855,
-        -0.81501434937181239,
-    ],
-    [
-        0.36450922641591932,
-        0.35072505006792554,
-        -0.74818256932222327,
-        -0.42935743393461345,
-    ],
-    [
-        -0.048066875314471805,
-        0.70423434779442851,
-        0.081514597266102079,
-        -0.70363266646497025,
-    ],
-    [
-        -0.52203668931852132,
-        0.53320033401076516,
-        0.63511352106575258,
-        -0.19951419542385418,
-    ],
-    [
-        -0.50452720436661391,
-        -0.045320300010607752,
-        0.83171247889881539,
-        0.22727235402693596,
-    ],
-    [
-        -0.66187512985526287,
-        -0.11273154201803609,
-        -0.70712183571435572,
-        0.22179184243176014,
-    ],
-    [
-        -0.097347265923124968,
-        -0.48907477358909635,
-        0.86672779383819876,
-        -0.010597501801608396,
-    ],
-    [
-        0.6992998566492058,
-        0.58787173019465955,
-        -0.26886563393399815,
-        0.30511933766578464,
-    ],
-    [
-        -0.47768739527476778,
-        -0.068169389836607433,
-        -0.80198837606007023,
-        -0.35211124854148595,
-    ],
-    [
-        -0.78657378269462352,
-        -0.426675567840271,
-        -0.38621219963436676,
-        0.22380746421698597,
-    ],
-    [
-        0.56482143652492511,
-        0.1826267270701265,
-        -0.77535364063192125,
-        0.21552483699193278,
-    ],
-    [
-        -0.49873086057995147,
-        -0.36039869694867449,
-        -0.78668381047893743,
-        0.050088823835439403,
-    ],
-    [
-        0.4465614190196166,
-        -0.78103244479724887,
-        -0.30004625743982249,
-        -0.31708589153977595,
-    ],
-    [
-        0.9381907028262596,
-        -0.086771127646232238,
-        0.33087344980101779,
-        -0.052836888195121577,
-    ],
-    [
-        -0.65978165561833657,
-        -0.63211430280040726,
-        0.21896030309371561,
-        -0.34230988997367567,
-    ],
-    [
-        0.54452056427324258,
-        0.83798869309366364,
-        -0.030477058073443319,
-        -0.018532519038464933,
-    ],
-    [
-        -0.33689516841904943,
-        0.52836395094120314,
-        -0.60531089283175599,
-        -0.49084814745593647,
-    ],
-    [
-        -0.031933460004959627,
-        -0.2057179093408612,
-        0.56891375017334633,
-        0.79561142574263988,
-    ],
-    [
-        -0.45631289542184073,
-        0.58416253445994182,
-        0.06831771541757406,
-        -0.66773150634457634,
-    ],
-    [
-        -0.5486626611422919,
-        0.47575347961959497,
-        -0.22175808506520317,
-        0.65073132904933995,
-    ],
-    [
-        -0.77309271795261902,
-        0.37240319264821575,
-        -0.26966730369341452,
-        -0.43694743033089445,
-    ],
-    [
-        -0.17511935368985659,
-        0.93648142025739012,
-        0.29906277720673358,
-        0.053825800183036308,
-    ],
-    [
-        -0.3846239257856558,
-        -0.1419561326315896,
-        -0.90166137685742631,
-        -0.1375487317465458,
-    ],
-    [
-        0.035498579558198733,
-        0.92703838843723507,
-        0.33923930638249067,
-        0.15574456721879848,
-    ],
-    [
-        -0.43050768543025331,
-        0.60616400208639176,
-        0.62956659768746381,
-        0.22555317429893521,
-    ],
-    [
-        -0.34888341344594626,
-        -0.098037876466055135,
-        0.34437180473923956,
-        0.86606985786423174,
-    ],
-    [
-        -0.25854515077603196,
-        0.36481404696332564,
-        0.10722375965685749,
-        0.88801361561267034,
-    ],
-    [
-        -0.52180293551682033,
-        -0.40120468791064456,
-        -0.71642529488945483,
-        0.23128184478490546,
-    ],
-    [
-        0.63117169242401872,
-        0.3421961713370954,
-        0.227223911430634,
-        0.65794632689832422,
-    ],
-    [
-        -0.46940054332255909,
-        -0.77907806699324689,
-        -0.30832037792246947,
-        -0.27863782947815613,
-    ],
-    [
-        0.13483591351242749,
-        -0.33215824922318193,
-        0.89320443904015911,
-        0.27143324037268241,
-    ],
-    [
-        -0.20333385743627611,
-        0.67660628517830235,
-        0.37362930366214181,
-        0.60104943284412526,
-    ],
-    [
-        -0.20617239254703765,
-        -0.9073052408192861,
-        0.027940690447316719,
-        0.3653894666662062,
-    ],
-    [
-        0.81868780255488927,
-        -0.32691752599232032,
-        0.10276003096015003,
-        0.4607771578366015,
-    ],
-    [
-        0.45762098436869908,
-        0.37427429720206934,
-        -0.67847194690036672,
-        0.43609357068013038,
-    ],
-    [
-        0.047429294984896085,
-        0.69082292124153011,
-        0.32676246650391,
-        -0.64322658834102597,
-    ],
-    [
-        -0.65398834549797757,
-        0.59806213970896982,
-        -0.43888633412248884,
-        0.14832298109217501,
-    ],
-    [
-        -0.32443921141787796,
-        -0.24330255304377865,
-        -0.40829252226610663,
-        0.81782655987593456,
-    ],
-    [
-        -0.017000615694705283,
-        -0.59517561687332377,
-        -0.35875579816492009,
-        -0.7188680278246562,
-    ],
-    [
-        0.30471236913187755,
-        0.42882293634940422,
-        -0.0521960616591743,
-        0.84884441006935119,
-    ],
-    [
-        0.21639716327979563,
-        0.32281138478197641,
-        -0.57572845316128207,
-        -0.71937599751459425,
-    ],
-    [
-        0.3159802371449264,
-        -0.78226455320430743,
-        -0.12509171970704169,
-        0.52208305871253469,
-    ],
-    [
-        0.33311275714399474,
-        -0.67990293803934565,
-        -0.41225656915481157,
-        -0.50676661991699468,
-    ],
-    [
-        -0.5884495211606513,
-        -0.11152733979891823,
-        -0.56246710940868161,
-        -0.57001716145798553,
-    ],
-    [
-        0.23791768366427868,
-        0.47552627174977452,
-        0.73199896338356985,
-        0.42596649901249617,
-    ],
-    [
-        -0.67366165132803801,
-        0.035632544961755032,
-        -0.042859235516243384,
-        0.73693513093113727,
-    ],
-    [
-        -0.72976780773318295,
-        0.6347952528526225,
-        0.23912106332291172,
-        0.085411069700592604,
-    ],
-    [
-        0.037104778869627535,
-        -0.94116576905482063,
-        -0.25807494929968522,
-        -0.21500593268198251,
-    ],
-    [
-        0.21801580921120947,
-        -0.28328477119234646,
-        0.91604101499733748,
-        -0.18190025889791667,
-    ],
-    [
-        -0.28190541937972158,
-        0.17080800128095511,
-        -0.58939010797724101,
-        -0.73754543035756415,
-    ],
-    [
-        0.47383818114691711,
-        0.74606194044359209,
-        0.38114515768497659,
-        -0.27128827450189891,
-    ],
-    [
-        -0.45766682145352455,
-        -0.016531817910843852,
-        0.39165745015710457,
-        -0.79804274401414477,
-    ],
-    [
-        -0.65063858284405041,
-        -0.55864087859227063,
-        0.23362247914639372,
-        -0.45826885178662824,
-    ],
-    [
-        0.76538236259896619,
-        0.58776282239492861,
-        -0.23924786880448312,
-        0.10716884297819508,
-    ],
-    [
-        -0.017553911174113434,
-        -0.10728697345911352,
-        0.72282579968880911,
-        -0.68242525512521024,
-    ],
-    [
-        -0.64682013608099753,
-        -0.76250234931676164,
-        -0.014248283779450756,
-        0.0032962487647987897,
-    ],
-    [
-        -0.90308582011123029,
-        -0.0021535710713948245,
-        0.4267306357287618,
-        -0.048294183668368108,
-    ],
-    [
-        0.74483006162254706,
-        -0.010099330220556804,
-        -0.20282772282882758,
-        0.63559979364732422,
-    ],
-    [
-        0.89608512360332204,
-        0.44012285419400843,
-        0.035590541860675631,
-        0.045350168720767844,
-    ],
-    [
-        0.83092161602171166,
-        0.16153048654365293,
-        -0.20009728158172249,
-        0.49339461676070506,
-    ],
-    [
-        0.44019626322034494,
-        -0.81902268740445827,
-        -0.23148028075877519,
-        -0.28608734152957938,
-    ],
-    [
-        0.44643118966898676,
-        -0.042693975224867002,
-        -0.34380338941805544,
-        0.82503069445620536,
-    ],
-    [
-        -0.31601221296901066,
-        0.61569789492993332,
-        -0.72172027194862653,
-        0.013123737717501615,
-    ],
-    [
-        -0.94843793136360144,
-        0.2642542825143589,
-        0.14424284389439854,
-        0.099142153036990713,
-    ],
-    [
-        0.32327409673155183,
-        0.77375991668629718,
-        -0.42809165320475578,
-        -0.33693765917218738,
-    ],
-    [
-        0.83051627712140608,
-        0.46673835074837489,
-        0.29108128050373872,
-        -0.0875769005925119,
-    ],
-    [
-        -0.39612697451167117,
-        -0.36117625461228248,
-        -0.84417708765514821,
-        0.00042171856251001027,
-    ],
-    [
-        -0.77918753027609178,
-        -0.42365283740201148,
-        -0.45518044735841517,
-        -0.078713571676441732,
-    ],
-    [
-        0.70400322308784968,
-        0.20727333958727476,
-        -0.59931819714858159,
-        0.31974196337802102,
-    ],
-    [
-        0.65575137464669686,
-        -0.64431199233066183,
-        0.36626215520793826,
-        0.14388962732002775,
-    ],
-    [
-        0.77545924382682219,
-        -0.29991651191148666,
-        -0.53577910228710468,
-        0.14715230408934976,
-    ],
-    [
-        0.44552966870535271,
-        0.14321517810115297,
-        0.042395284615315124,
-        -0.8827204353061846,
-    ],
-    [
-        0.82278334606860337,
-        0.034426122978217767,
-        -0.47764212474751344,
-        -0.30610522399253842,
-    ],
-    [
-        -0.21741999311202778,
-        -0.16861147854226879,
-        0.90171414573832465,
-        -0.33348210637807724,
-    ],
-    [
-        -0.021582579676193966,
-        0.17641086371640874,
-        0.95280423420448168,
-        0.24612494936385962,
-    ],
-    [
-        0.65284071520879938,
-        0.21773564390481845,
-        -0.6986056819827583,
-        -0.19580676964911806,
-    ],
-    [
-        -0.56667798931484981,
-        0.75416197446330546,
-        -0.23803991454126328,
-        0.23119855489357105,
-    ],
-    [
-        -0.34169451502808196,
-        0.67506252714951076,
-        0.63751155551640015,
-        -0.14530815332010732,
-    ],
-    [
-        -0.17011015600521887,
-        -0.78776408399547071,
-        0.51195260424423572,
-        -0.2973126532763144,
-    ],
-    [
-        -0.21421619927052898,
-        -0.25195280364977019,
-        -0.1784470499426612,
-        0.92670807435236624,
-    ],
-    [
-        0.72869890429489093,
-        -0.026995091897277716,
-        0.66694616550484354,
-        0.15314040685354322,
-    ],
-    [
-        0.64581489315909457,
-        -0.53162316979043778,
-        -0.25740880997912979,
-        0.48377746295275359,
-    ],
-    [
-        0.075840416264583418,
-        0.067483312156377886,
-        0.18209025656372432,
-        0.97802728607425704,
-    ],
-    [
-        0.4655784395646167,
-        0.8010651637558901,
-        -0.23171044506964095,
-        -0.29638081866908034,
-    ],
-    [
-        -0.28720418056615304,
-        0.66111779574137663,
-        0.6792823614245489,
-        -0.13788579432587109,
-    ],
-    [
-        -0.71367330453768174,
-        0.31402003817970708,
-        0.57757664762923955,
-        0.24179959910068094,
-    ],
-    [
-        0.11912254124531882,
-        -0.67534657233913831,
-        -0.17513290316074173,
-        -0.70643137927722655,
-    ],
-    [
-        0.70122441319767637,
-        0.67427274132205961,
-        -0.057055188525982875,
-        -0.22446669710198466,
-    ],
-    [
-        0.23721265036614816,
-        -0.96098765603709535,
-        -0.083356813321082746,
-        0.11525851432128992,
-    ],
-    [
-        -0.27494692828847256,
-        0.35670089311079051,
-        0.35163716298265496,
-        0.82068262141232629,
-    ],
-    [
-        0.39409851022222475,
-        -0.7690390483777132,
-        -0.022383553893967758,
-        0.50275668352196012,
-    ],
-    [
-        0.20476326156387331,
-        -0.47922470008404772,
-        -0.77511059819943096,
-        0.35723837154202742,
-    ],
-    [
-        -0.43279524127456287,
-        -0.14014799246550178,
-        0.36839069413687425,
-        -0.81076205869005402,
-    ],
-    [
-        0.80827919432667961,
-        -0.57235238789591791,
-        0.050134566987730375,
-        -0.12877893182274477,
-    ],
-    [
-        -0.70302818298089442,
-        0.13447143863219449,
-        0.65694738840207789,
-        -0.2368310262580885,
-    ],
-    [
-        -0.45347653570053165,
-        0.43415299131635582,
-        0.11128592725894192,
-        0.77038020100092286,
-    ],
-    [
-        0.12901368885379327,
-        -0.54498931323271604,
-        0.82634106860715373,
-        0.059182386599870469,
-    ],
-    [
-        0.43917066824117851,
-        0.58713322781660848,
-        -0.022502656374789577,
-        0.67963028729326447,
-    ],
-    [
-        0.51321880079328908,
-        0.2369229765281575,
-        0.336880390311388,
-        -0.75298444096075656,
-    ],
-    [
-        -0.65632245998526995,
-        0.047435678966529359,
-        -0.27743272470102281,
-        0.70001554850219894,
-    ],
-    [
-        0.53573498868825098,
-        0.31442056120056239,
-        -0.23853820089555303,
-        0.74647656313044142,
-    ],
-    [
-        -0.054925744777719984,
-        0.7709459235378392,
-        -0.50078083048586419,
-        -0.38967179184396822,
-    ],
-    [
-        -0.27189344574707153,
-        -0.77361464327174578,
-        -0.28912484742250461,
-        -0.4939647360674923,
-    ],
-    [
-        0.33538383779794262,
-        -0.47645834564513628,
-        -0.7317371220790081,
-        0.35364658966340101,
-    ],
-    [
-        0.54848944728738835,
-        -0.28830585792976293,
-        0.24360244809312484,
-        -0.74612124067124297,
-    ],
-    [
-        -0.50932188037798243,
-        -0.11013666646277187,
-        0.78859562358539248,
-        0.32646298309405619,
-    ],
-    [
-        0.1835605077822535,
-        0.76853436698201694,
-        -0.61057348369895903,
-        -0.053483527875308745,
-    ],
-    [
-        -0.78678940724819957,
-        -0.30393197250941428,
-        0.43120346927273145,
-        -0.3203924980640524,
-    ],
-    [
-        0.23876102362244361,
-        -0.1291534996382204,
-        -0.95492582859114317,
-        -0.1201216425940045,
-    ],
-    [
-        -0.5088118814541428,
-        0.22005868312286933,
-        -0.70037846723486263,
-        -0.44961611170760835,
-    ],
-    [
-        0.067050324677217193,
-        0.13493948236530212,
-        0.85010452169799933,
-        -0.50459676202714565,
-    ],
-    [
-        -0.19124301876464028,
-        0.92870530734057111,
-        -0.079723292537508844,
-        -0.30753334212442929,
-    ],
-    [
-        -0.80387750453472062,
-        -0.49114725675479781,
-        -0.33092836194963349,
-        0.055152054745033943,
-    ],
-    [
-        -0.59353417607043379,
-        0.24794172034330847,
-        -0.15425295009517051,
-        -0.7499654075599278,
-    ],
-    [
-        -0.58418569900786144,
-        0.18084995536953302,
-        -0.52740051603444049,
-        -0.58980425431166572,
-    ],
-    [
-        0.18226885960046676,
-        -0.63295918833493137,
-        0.35235949470494826,
-        -0.66481840769762379,
-    ],
-    [
-        0.6622603862251073,
-        -0.31086372379373589,
-        0.6810762363438827,
-        -0.030167637522931664,
-    ],
-    [
-        -0.33414029498791953,
-        0.89282619466936874,
-        -0.27791165959144437,
-        0.11822334304497489,
-    ],
-    [
-        -0.71491761201741799,
-        0.39730036194909668,
-        0.12305362610706184,
-        0.5620525202544091,
-    ],
-    [
-        -0.24482938464344917,
-        0.48740198377966443,
-        0.36483973393159425,
-        -0.75457925174727758,
-    ],
-    [
-        -0.2374932239041456,
-        -0.71923246044652089,
-        0.15637619944338416,
-        -0.63391491596846183,
-    ],
-    [
-        -0.1768193224044485,
-        0.3460333350723323,
-        -0.71777267977719961,
-        0.57775274850805181,
-    ],
-    [
-        -0.75738854788820742,
-        -0.18891437527720911,
-        -0.43650492937004182,
-        0.44736717914602203,
-    ],
-    [
-        0.30346175218502885,
-        -0.24782463375984673,
-        0.84283045875723794,
-        0.36895898641129954,
-    ],
-    [
-        0.60747118005634704,
-        -0.34154812447676469,
-        0.36333046681026315,
-        -0.61831595156100383,
-    ],
-    [
-        -0.88258493683705608,
-        -0.45810106916030163,
-        -0.082962645801482063,
-        0.065608224363536277,
-    ],
-    [
-        0.84748721821631268,
-        -0.10478587607608733,
-        -0.51057672950347444,
-        0.10048252795625159,
-    ],
-    [
-        0.11372897415922287,
-        0.52479120836285653,
-        -0.35069543153289384,
-        -0.76725003901186017,
-    ],
-    [
-        -0.31486166984307651,
-        0.16273929425127059,
-        0.86901163947783167,
-        0.34524892675036534,
-    ],
-    [
-        -0.19220727433834148,
-        0.58779391456565921,
-        -0.45659862499591497,
-        -0.6395876588418854,
-    ],
-    [
-        0.066414079886258512,
-        0.87741962249306948,
-        -0.46092405744736653,
-        -0.11520846029366932,
-    ],
-    [
-        0.77169442037751212,
-        0.30638878410645271,
-        -0.1673681205698235,
-        0.53160280919960357,
-    ],
-    [
-        -0.3199233035287789,
-        0.62189703728442036,
-        -0.0018297732850826164,
-        0.71476556073010256,
-    ],
-    [
-        0.22736875296621262,
-        0.2627489868736762,
-        0.65792306853689542,
-        0.66813445949033479,
-    ],
-    [
-        -0.15205866876363611,
-        -0.047157597634204539,
-        0.14544992700477888,
-        0.97647255003584488,
-    ],
-    [
-        0.2517212241212583,
-        -0.81131617889990426,
-        -0.52271786867177461,
-        -0.071892370620193088,
-    ],
-    [
-        0.00066962626042670558,
-        0.24270793637882576,
-        0.53910107283311481,
-        0.80651251849527283,
-    ],
-    [
-        -0.92043922130114642,
-        0.14750696513112477,
-        -0.028724864858016886,
-        0.3608437574175738,
-    ],
-    [
-        0.36119996600317678,
-        -0.23652826446613234,
-        0.64730408681909635,
-        0.62816111297599375,
-    ],
-    [
-        -0.14047006911071441,
-        -0.97981938752828746,
-        0.14156583554952853,
-        -0.013462604238658981,
-    ],
-    [
-        0.134048885678792,
-        0.85150818136572937,
-        0.023361533867974807,
-        0.5063782697261382,
-    ],
-    [
-        -0.30854519576266254,
-        0.73123707535422477,
-        -0.37066636625343136,
-        -0.48238848113077593,
-    ],
-    [
-        0.0042259580316234991,
-        0.9565461722523726,
-        0.030475611623444806,
-        0.28995309745582359,
-    ],
-    [
-        0.42185526266753631,
-        -0.36385438339103526,
-        -0.044175377439328485,
-        0.8292747801994983,
-    ],
-    [
-        0.46696227687973429,
-        -0.22802299852506849,
-        -0.85100870599693446,
-        0.075735899231172937,
-    ],
-    [
-        0.56905420178346355,
-        0.0087975865298314613,
-        0.79045464976310431,
-        -0.22645389060849336,
-    ],
-    [
-        -0.45112527784235967,
-        -0.51184687417821295,
-        -0.55440485462956857,
-        0.47658579316720445,
-    ],
-    [
-        0.66297598401786084,
-        0.68930327499548805,
-        0.27397158884700756,
-        -0.10130848039868171,
-    ],
-    [
-        -0.80425273454467827,
-        -0.23533766180183499,
-        0.32675458788495332,
-        0.43706425524307835,
-    ],
-    [
-        0.11270581645454521,
-        0.47285912225599214,
-        -0.35094828733730443,
-        -0.80033552279754516,
-    ],
-    [
-        0.75999421772256037,
-        -0.14618744483291612,
-        0.21569383850345825,
-        0.59541094047148702,
-    ],
-    [
-        0.84158301940619862,
-        0.37021643754212025,
-        0.28634400699602686,
-        0.2696014103787791,
-    ],
-    [
-        0.25188321963918225,
-        0.92563938651879829,
-        0.25226214209076436,
-        0.12692667748381756,
-    ],
-    [
-        0.64387085943139422,
-        0.36453639596394632,
-        0.16149234094219961,
-        0.65304192530778826,
-    ],
-    [
-        -0.67889573506758494,
-        -0.33574637493126225,
-        0.13921751934116497,
-        -0.63796037097616964,
-    ],
-    [
-        0.88193339497499257,
-        0.14638772363727545,
-        0.42888031987717778,
-        0.1297142722225669,
-    ],
-    [
-        -0.19036454865874627,
-        -0.37321941699793137,
-        -0.46753086094019469,
-        0.77838518707526561,
-    ],
-    [
-        0.54584424778405427,
-        0.35836574874399729,
-        0.28086787728421592,
-        0.70337847763353756,
-    ],
-    [
-        0.50258143493497065,
-        0.18889291729758653,
-        -0.042939303008916518,
-        -0.84254826764442492,
-    ],
-    [
-        -0.33511152843296438,
-        0.13617649349712582,
-        -0.013277706245026151,
-        -0.93219092928810487,
-    ],
-    [
-        0.33313444723314289,
-        0.17763893480755086,
-        -0.60922829689654034,
-        -0.69735696108065603,
-    ],
-    [
-        0.58131117006546085,
-        -0.42292374647721542,
-        -0.13769892358891561,
-        -0.68136028257101622,
-    ],
-    [
-        0.12714305415377725,
-        -0.71558821924764948,
-        0.64714684927818467,
-        -0.23015016776823363,
-    ],
-    [
-        -0.036751428353326961,
-        0.16404487656775066,
-        -0.61242325168928036,
-        0.77244829715404906,
-    ],
-    [
-        -0.094433736989411252,
-        -0.034962305612027268,
-        0.44947663356731693,
-        0.88759825505771361,
-    ],
-    [
-        -0.51649450425647159,
-        -0.31081784229634934,
-        0.58126682615387204,
-        -0.54658446080739198,
-    ],
-    [
-        0.59121502096714262,
-        0.61320222978118089,
-        -0.4949232583579728,
-        0.17175212578170987,
-    ],
-    [
-        -0.61815465622416654,
-        -0.75760032003893574,
-        -0.13670240843010897,
-        -0.15886795647547083,
-    ],
-    [
-        0.85242365433563672,
-        0.33227668616951866,
-        -0.31106384651249541,
-        -0.2573041016970638,
-    ],
-    [
-        0.22986611199248061,
-        -0.81107649745743315,
-        0.40504800499840132,
-        0.35391043990882493,
-    ],
-    [
-        0.78742485466838275,
-        -0.27801996612016816,
-        0.44609146845689829,
-        -0.32197732600135848,
-    ],
-    [
-        -0.076131652245289533,
-        0.98062500817383791,
-        0.08123121929438859,
-        0.16118329281414315,
-    ],
-    [
-        0.90466133686323591,
-        0.0080369222844420621,
-        -0.33928268165459807,
-        0.25770241635320679,
-    ],
-    [
-        -0.92318186762017329,
-        -0.18358119462124181,
-        -0.26651274284632287,
-        0.20737440097393006,
-    ],
-    [
-        0.53341776175312217,
-        -0.37412109943919014,
-        0.54525483920871831,
-        0.52744293977659384,
-    ],
-    [
-        -0.77906688633277466,
-        -0.38963648912919241,
-        0.13549320198879636,
-        0.47210145644093859,
-    ],
-    [
-        -0.36662363307483392,
-        0.76654393963979794,
-        -0.39897636497529865,
-        0.3446960406845494,
-    ],
-    [
-        0.13003099844259486,
-        0.7247834502648951,
-        -0.61462413872363419,
-        0.28287463259254447,
-    ],
-    [
-        0.70497200131795257,
-        -0.63167867379154607,
-        0.3162632900970842,
-        0.063040159990927408,
-    ],
-    [
-        -0.12160326091460408,
-        0.84637105375363719,
-        -0.33298540951620803,
-        -0.39747880868319951,
-    ],
-    [
-        0.92301425678475124,
-        -0.20721432131609363,
-        -0.17001334629656006,
-        0.27604776560343697,
-    ],
-    [
-        0.46270237655829671,
-        -0.2663113175205043,
-        0.80833814260964953,
-        -0.24814157267612189,
-    ],
-    [
-        0.30811235763466094,
-        0.36137921439112092,
-        -0.79041272040569444,
-        0.38693613155110868,
-    ],
-    [
-        0.13727516556818961,
-        -0.39856331588727378,
-        0.43498748698697293,
-        -0.79566871140690532,
-    ],
-    [
-        -0.33600230634730338,
-        -0.61949847133110802,
-        -0.41741334267040359,
-        -0.57366383493160289,
-    ],
-    [
-        -0.40021536733761204,
-        0.62260315361942398,
-        0.066701994514406782,
-        -0.66913662041302779,
-    ],
-    [
-        -0.73087754864883681,
-        -0.26841707387412267,
-        -0.25465383426545113,
-        -0.5735169640279395,
-    ],
-    [
-        0.42194595275885222,
-        0.86837340562919407,
-        -0.14831474657755828,
-        -0.21422412864571114,
-    ],
-    [
-        -0.87174399937976776,
-        -0.28842051195865837,
-        -0.38563595309765769,
-        -0.090337807729290898,
-    ],
-    [
-        -0.25673621123022627,
-        0.014417231298059895,
-        -0.69215939109188762,
-        0.67438419213987677,
-    ],
-    [
-        0.032574502742823731,
-        0.4113661196550375,
-        0.17391878736124597,
-        0.89413034439829242,
-    ],
-    [
-        -0.15814652423533745,
-        0.96824719057462183,
-        0.19253244998716201,
-        -0.020452640870423908,
-    ],
-    [
-        0.25989057433673801,
-        -0.84503833354756985,
-        -0.039611376229904509,
-        -0.46561576764456702,
-    ],
-    [
-        0.29845903909135829,
-        -0.54306788122386485,
-        -0.7781569262530087,
-        -0.10232925530929406,
-    ],
-    [
-        0.031643908328925961,
-        0.68874867267155893,
-        0.59846994970877765,
-        0.40799221592379614,
-    ],
-    [
-        0.22357933552502238,
-        -0.39565503940105801,
-        -0.85359975484832551,
-        0.25463077002910589,
-    ],
-    [
-        0.2621194864004005,
-        -0.41915635630497533,
-        -0.63333632046310839,
-        -0.59538762919679278,
-    ],
-    [
-        -0.65921296658603457,
-        -0.57663674442331803,
-        -0.36926621176493551,
-        -0.31075841825200873,
-    ],
-    [
-        -0.30791720890686147,
-        0.64933814055527694,
-        0.26163045229787302,
-        0.6442798135202078,
-    ],
-    [
-        -0.010577600437256094,
-        -0.18145653394893874,
-        -0.47379596488657605,
-        0.86167222556690648,
-    ],
-    [
-        0.72151566848129201,
-        -0.15653717491512925,
-        -0.26342736444584575,
-        -0.62090037579848489,
-    ],
-    [
-        0.40395047606085527,
-        -0.80473300856238672,
-        -0.14177527113777846,
-        -0.41125244110418036,
-    ],
-    [
-        0.062960504118428878,
-        -0.07386215668175132,
-        -0.98818975691266342,
-        0.11858060998478893,
-    ],
-    [
-        -0.48052222390059002,
-        -0.64722644963280207,
-        -0.37286883729165621,
-        -0.45952708887520177,
-    ],
-    [
-        0.013813282697143017,
-        -0.29626272365134471,
-        -0.3420770196275123,
-        -0.8916394475563395,
-    ],
-    [
-        0.40704511288495687,
-        0.39686961189117154,
-        0.057875198102033336,
-        0.82064562917161377,
-    ],
-    [
-        -0.49071260767140024,
-        0.6793356092677878,
-        -0.41338325074986521,
-        -0.35611592867010589,
-    ],
-    [
-        -0.4758122158214671,
-        0.83308082103870507,
-        0.2669269939117524,
-        0.09126368836387215,
-    ],
-    [
-        0.22435176011594823,
-        -0.17679244752478276,
-        -0.012518216966307394,
-        0.95825571351026007,
-    ],
-    [
-        -0.12183013644530646,
-        0.78780705835627673,
-        -0.26418837594164046,
-        -0.54288300643422827,
-    ],
-    [
-        -0.56667901969067902,
-        -0.068373608291913621,
-        0.22321893168939952,
-        0.7901729221297058,
-    ],
-    [
-        0.57078328381363874,
-        -0.033437279859090667,
-        0.82024592061912371,
-        0.016882563260077574,
-    ],
-    [
-        0.36995123604805302,
-        0.18292883656380363,
-        0.89577509906191333,
-        0.16510631605287024,
-    ],
-    [
-        0.01484544943302412,
-        -0.7674354670156549,
-        0.20414828957106251,
-        0.60757377532510792,
-    ],
-    [
-        -0.47105551063909601,
-        -0.11776397841874765,
-        -0.20141043361776445,
-        -0.85068924321013573,
-    ],
-    [
-        0.14377911807142219,
-        -0.67892704069547327,
-        0.13123704433611261,
-        -0.70792829920339562,
-    ],
-    [
-        0.47494743137452883,
-        -0.76662781147499903,
-        -0.26067197009007648,
-        0.34461117235682986,
-    ],
-    [
-        -0.044103873503543299,
-        -0.24119639960245981,
-        0.25304173099022059,
-        0.93586806096707176,
-    ],
-    [
-        0.19252369989139168,
-        -0.96218451643388603,
-        -0.16832207876181191,
-        0.093825684736752901,
-    ],
-    [
-        0.068222694457886909,
-        0.15222237020250254,
-        -0.036509630388872887,
-        0.98531267162241754,
-    ],
-    [
-        -0.64481120663517089,
-        -0.21436320962013408,
-        -0.25436233895735838,
-        -0.68816184337639019,
-    ],
-    [
-        0.093521496703025245,
-        0.21511613091992157,
-        -0.49157304329805712,
-        0.83865053685975532,
-    ],
-    [
-        0.20801460379754469,
-        0.21781493175956088,
-        0.059428516102492619,
-        -0.95171152750367793,
-    ],
-    [
-        -0.67624828650916791,
-        -0.12198345068512161,
-        0.55287060254246945,
-        -0.47131983789852505,
-    ],
-    [
-        0.2505867304668995,
-        -0.38847288749928605,
-        0.1230377442315595,
-        -0.878155350542423,
-    ],
-    [
-        -0.43286605013313556,
-        0.37297470769834939,
-        -0.167209470185682,
-        0.80346614311972864,
-    ],
-    [
-        -0.84246245544391285,
-        -0.014188152500445835,
-        0.46439429548726724,
-        -0.27275198590463468,
-    ],
-    [
-        0.28585191744407418,
-        0.59994344090288176,
-        0.61323248518725237,
-        0.42696893109712686,
-    ],
-    [
-        -0.98620104293408417,
-        -0.088032760756023093,
-        -0.098241834934394159,
-        0.10003138416577488,
-    ],
-    [
-        0.11288349257556173,
-        -0.015638450373857662,
-        0.96204124013290082,
-        0.24797057941900708,
-    ],
-    [
-        0.61981753330993039,
-        0.71138326300651999,
-        -0.29581468262667149,
-        0.14917691529949095,
-    ],
-    [
-        0.43483665250600545,
-        -0.1702477768074793,
-        0.40220384359762762,
-        -0.78750545923490423,
-    ],
-    [
-        -0.54831528287502251,
-        -0.67294967431984754,
-        0.49420898289497278,
-        0.047397970678201076,
-    ],
-    [
-        0.69589619188625018,
-        -0.01694193335366035,
-        0.71746805468152453,
-        0.026096963884030395,
-    ],
-    [
-        0.42608966449115948,
-        -0.39192867053550218,
-        0.80716774587061479,
-        -0.11541119985614814,
-    ],
-    [
-        -0.32337204897695521,
-        -0.78760034675535118,
-        0.42364448366661112,
-        -0.30925970185290302,
-    ],
-    [
-        -0.25903689628339482,
-        -0.31249306973080265,
-        -0.42172336075200978,
-        -0.81080045308948601,
-    ],
-    [
-        0.65160473868216795,
-        -0.65094354588590586,
-        0.33988577912924439,
-        -0.1901615674686491,
-    ],
-    [
-        0.025663345517841031,
-        -0.27915237061982839,
-        0.71844266176939486,
-        0.63659680208423031,
-    ],
-    [
-        -0.41638664981245049,
-        0.55108624299983378,
-        -0.70893022415346796,
-        0.14263256260758067,
-    ],
-    [
-        0.61883686292813889,
-        0.15298310944409149,
-        0.0037790439795082672,
-        0.77046922335202839,
-    ],
-    [
-        0.17149592172189207,
-        0.041251231338950256,
-        0.7393229797499542,
-        -0.64983768462549796,
-    ],
-    [
-        0.4577228204861683,
-        -0.12933300821350716,
-        -0.87193786282667129,
-        -0.11613421529372338,
-    ],
-    [
-        -0.6885033374539048,
-        -0.063886736041189426,
-        0.1554645240615615,
-        0.70548736418957225,
-    ],
-    [
-        0.42136801580582151,
-        -0.39546976747132456,
-        0.13684134872528272,
-        -0.80456640717288652,
-    ],
-    [
-        0.36138602724222735,
-        0.16458161254267931,
-        0.54989903351673064,
-        -0.73479526744821733,
-    ],
-    [
-        -0.84719927075141366,
-        0.21444625629622069,
-        0.075161300208457696,
-        0.48022596530152595,
-    ],
-    [
-        -0.86246060146449477,
-        0.25699450121650164,
-        0.43319588818054933,
-        0.049566719978716416,
-    ],
-    [
-        -0.018752826961582994,
-        -0.0046405225321126701,
-        -0.60253005492845901,
-        0.79786235024563346,
-    ],
-    [
-        -0.53231673453748363,
-        -0.14080967230829161,
-        0.66840834297610952,
-        0.50004181560716854,
-    ],
-    [
-        0.57981263742774591,
-        -0.71163118499529621,
-        -0.36740505173353605,
-        -0.14970601184304339,
-    ],
-    [
-        0.00047305757538615499,
-        0.8308510988094705,
-        0.15842013092391774,
-        0.5334691087042196,
-    ],
-    [
-        -0.11756644677032607,
-        -0.32572405631874113,
-        0.88100086875244688,
-        0.32236538118492147,
-    ],
-    [
-        -0.9365738560111786,
-        -0.23547463042656552,
-        0.25454956017910418,
-        -0.050849110852102995,
-    ],
-    [
-        0.36515378737282944,
-        -0.30789464747212397,
-        -0.79297090020807459,
-        0.37823372278062467,
-    ],
-]
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_TABLES))
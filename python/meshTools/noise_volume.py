@@ -0,0 +1,488 @@
+"""Baked noise volumes: periodic 3D grids of a noise function.
+
+A NoiseVolume samples one noise function (snoise, fBm, turbulence or their
+vector forms) with fixed octaves, lacunarity and gain on a resolution^3
+grid covering one period of noise space, and answers batched lookups by
+trilinear or tricubic (Catmull-Rom) interpolation. A lookup costs one
+gather of 8 or 64 grid values instead of evaluating every octave of
+gradient noise; the result is a low-pass copy of the field, fine for
+displacement previews.
+
+The grid is made seamless by blending the function over [period,
+2 * period) with the same function over [0, period) (weighted by the
+position within the period, along each axis), so lookups wrap without a
+visible edge; only non-negative coordinates are evaluated. The blend
+softens the contrast towards the center of the cube.
+
+Lookups run in the C++ _noise extension (GIL released, threaded) when it
+is built, otherwise as NumPy gathers.
+
+NoiseVolume.get memoizes volumes by their parameters in a process-wide
+LRU cache bounded by a byte budget, and can keep baked volumes in a
+directory of .mtn files that later processes map instead of re-baking.
+
+A .mtn file is a 64-byte header (magic, version, function, octaves,
+lacunarity, gain, resolution, period) followed by the grid as
+little-endian float32 (resolution, resolution, resolution, channels),
+indexed [x, y, z]. NumPy is required.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+from .buffers import np, requireNumpy
+from .noise import Noise, _kBlockRows, _outputArray, _pointArray
+
+try:
+    from ._noise import sampleGrid as _sampleGrid
+except ImportError:
+    try:
+        from _noise import sampleGrid as _sampleGrid
+    except ImportError:
+        _sampleGrid = None
+
+__all__ = [
+    "NoiseVolume",
+    "cacheBudget",
+    "clearCache",
+    "setCacheBudget",
+]
+
+kMagic = b"MTNOISE\x01"
+kVersion = 1
+kExtension = ".mtn"
+
+# magic, version, function, octaves, lacunarity, gain, resolution, period
+_kHeader = struct.Struct("<8sI16sIffIf16x")
+
+# function -> channels
+kFunctions = {
+    "snoise": 1,
+    "fBm": 1,
+    "turbulence": 1,
+    "vsnoise": 3,
+    "vfBm": 3,
+    "vturbulence": 3,
+}
+_kFractals = ("fBm", "turbulence", "vfBm", "vturbulence")
+
+kModes = ("trilinear", "tricubic")
+
+# default byte budget of the NoiseVolume.get cache
+kCacheBudget = 256 << 20
+
+
+def _f32(value) -> float:
+    """value rounded to float32, as stored in files and used by Noise."""
+    return float(np.float32(value))
+
+
+def _catmullRom(t):
+    """Catmull-Rom weights of the 4 taps around t in [0, 1)."""
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        0.5 * (-t3 + 2.0 * t2 - t),
+        0.5 * (3.0 * t3 - 5.0 * t2 + 2.0),
+        0.5 * (-3.0 * t3 + 4.0 * t2 + t),
+        0.5 * (t3 - t2),
+    )
+
+
+class NoiseVolume:
+    """A periodic 3D grid of baked noise values with batched lookups.
+
+    Build one with bake (always bakes), get (memoized) or load (from a
+    .mtn file).
+    """
+
+    def __init__(
+        self, values, function, octaves, lacunarity, gain, period
+    ) -> None:
+        """Wrap an already baked grid.
+
+        Args:
+            values: float32 (R, R, R, C) grid indexed [x, y, z].
+            function: Name of the baked function (see kFunctions).
+            octaves: Fractal octaves (0 for snoise / vsnoise).
+            lacunarity: Fractal lacunarity (0 for snoise / vsnoise).
+            gain: Fractal gain (0 for snoise / vsnoise).
+            period: Size of the noise-space cube the grid covers.
+        """
+        self.key = _volumeKey(
+            function, octaves, lacunarity, gain, len(values), period
+        )
+        if values.shape != (len(values),) * 3 + (kFunctions[function],):
+            raise ValueError("values do not match the volume function")
+        self.values = values
+        (
+            self.function,
+            self.octaves,
+            self.lacunarity,
+            self.gain,
+            self.resolution,
+            self.period,
+        ) = self.key
+
+    def __repr__(self) -> str:
+        return (
+            f"NoiseVolume({self.function!r}, octaves={self.octaves}, "
+            f"resolution={self.resolution}, period={self.period})"
+        )
+
+    @property
+    def channels(self) -> int:
+        """Values per lookup: 1 for scalar functions, 3 for vector ones."""
+        return self.values.shape[3]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the grid in bytes."""
+        return self.values.nbytes
+
+    @classmethod
+    def bake(
+        cls,
+        function="fBm",
+        octaves=4,
+        lacunarity=2.0,
+        gain=0.5,
+        resolution=64,
+        period=4.0,
+        noise=None,
+        threads=0,
+    ) -> NoiseVolume:
+        """Evaluate function on a resolution^3 grid covering one period.
+
+        Args:
+            function: "snoise", "fBm", "turbulence", "vsnoise", "vfBm" or
+                "vturbulence" (3D forms).
+            octaves: Fractal octaves (ignored by snoise / vsnoise).
+            lacunarity: Fractal lacunarity (ignored by snoise / vsnoise).
+            gain: Fractal gain (ignored by snoise / vsnoise).
+            resolution: Grid samples per axis.
+            period: Size of the noise-space cube the grid covers; lookups
+                repeat every period along each axis.
+            noise: Noise to evaluate (e.g. one with a worker pool); a new
+                Noise by default.
+            threads: Worker threads passed to the Noise *Array methods.
+
+        Raises:
+            ValueError: Unknown function or bad resolution / period.
+        """
+        requireNumpy()
+        key = _volumeKey(
+            function, octaves, lacunarity, gain, resolution, period
+        )
+        function, octaves, lacunarity, gain, resolution, period = key
+        noise = Noise() if noise is None else noise
+        evaluate = getattr(noise, function + "Array")
+        args = (octaves, lacunarity, gain) if function in _kFractals else ()
+        channels = kFunctions[function]
+
+        axis = np.arange(resolution) * (period / resolution)
+        # position within the period: weight of the unshifted copy
+        t = np.arange(resolution) / resolution
+        y, z = (a.reshape(-1) for a in np.meshgrid(axis, axis, indexing="ij"))
+        ty, tz = (a.reshape(-1) for a in np.meshgrid(t, t, indexing="ij"))
+        values = np.empty((resolution,) * 3 + (channels,), dtype=np.float32)
+        points = np.empty((len(y), 3), dtype=np.float32)
+        sample = np.empty((len(y), channels), dtype=np.float32)
+        for ix in range(resolution):
+            blend = np.zeros((len(y), channels))
+            # low copies (s = 0) are shifted up one period and fade out
+            # across it, so both faces of the cube see f(period)
+            for sx, sy, sz in np.ndindex(2, 2, 2):
+                points[:, 0] = axis[ix] + (1 - sx) * period
+                points[:, 1] = y + (1 - sy) * period
+                points[:, 2] = z + (1 - sz) * period
+                weight = (
+                    (t[ix] if sx else 1.0 - t[ix])
+                    * (ty if sy else 1.0 - ty)
+                    * (tz if sz else 1.0 - tz)
+                )
+                evaluate(points, *args, out=sample, threads=threads)
+                blend += weight[:, None] * sample
+            values[ix] = blend.reshape(resolution, resolution, channels)
+        return cls(values, *key[:4], period)
+
+    @classmethod
+    def get(
+        cls,
+        function="fBm",
+        octaves=4,
+        lacunarity=2.0,
+        gain=0.5,
+        resolution=64,
+        period=4.0,
+        directory=None,
+        noise=None,
+        threads=0,
+    ) -> NoiseVolume:
+        """Return the volume for these parameters, baking it at most once.
+
+        Volumes are kept in a process-wide LRU cache bounded by
+        cacheBudget(); a volume larger than the whole budget is returned
+        without being cached.
+
+        Args:
+            directory: Optional directory of .mtn files; a volume missing
+                from the cache is mapped from there if present, otherwise
+                baked and saved there.
+            Others: As for bake.
+        """
+        requireNumpy()
+        key = _volumeKey(
+            function, octaves, lacunarity, gain, resolution, period
+        )
+        volume = _cache.lookup(key)
+        if volume is not None:
+            return volume
+        path = None
+        if directory is not None:
+            path = os.path.join(os.fspath(directory), _fileName(key))
+            if os.path.exists(path):
+                volume = cls.load(path)
+        if volume is None:
+            volume = cls.bake(*key, noise=noise, threads=threads)
+            if path is not None:
+                os.makedirs(os.fspath(directory), exist_ok=True)
+                volume.save(path)
+        return _cache.insert(key, volume)
+
+    def sample(self, points, mode="trilinear", out=None, threads=0):
+        """Interpolate the volume at an (N, 3) array of points.
+
+        Points are in the noise space the volume was baked in and wrap
+        every period.
+
+        Args:
+            points: (N, 3) array-like of coordinates.
+            mode: "trilinear" (8 grid values per point) or "tricubic"
+                (Catmull-Rom over 64 values; smoother, may overshoot the
+                grid's range slightly).
+            out: Optional float32 (N,) or (N, 3) buffer to write into.
+            threads: Worker threads (used by the C++ implementation).
+
+        Returns:
+            float32 (N,) array for scalar functions, (N, 3) for vector
+            ones (out if given).
+
+        Raises:
+            ValueError: Unknown mode or points of the wrong shape.
+        """
+        if mode not in kModes:
+            raise ValueError(f"mode must be one of {kModes}, not {mode!r}")
+        points = _pointArray(points, 3)
+        if _sampleGrid is not None:
+            values = np.ascontiguousarray(self.values, dtype=np.float32)
+            return _sampleGrid(
+                values,
+                points,
+                self.period,
+                mode == "tricubic",
+                out,
+                threads,
+            )
+        result = _outputArray(out, len(points), self.channels)
+        rows = result.reshape(len(points), self.channels)
+        flat = self.values.reshape(-1, self.channels)
+        for start in range(0, len(points), _kBlockRows):
+            block = points[start : start + _kBlockRows]
+            rows[start : start + len(block)] = self._interpolate(
+                flat, block, mode == "tricubic"
+            )
+        return result if out is None else out
+
+    def _interpolate(self, flat, points, cubic):
+        """Interpolated (n, C) values at a block of points."""
+        resolution = self.resolution
+        cells = points.astype(np.float64) * (resolution / self.period)
+        base = np.floor(cells)
+        t = cells - base
+        base = base.astype(np.int64)
+        if cubic:
+            offsets = (-1, 0, 1, 2)
+            weights = [_catmullRom(t[:, axis]) for axis in range(3)]
+        else:
+            offsets = (0, 1)
+            weights = [(1.0 - t[:, axis], t[:, axis]) for axis in range(3)]
+        ids = [
+            [(base[:, axis] + o) % resolution for o in offsets]
+            for axis in range(3)
+        ]
+        total = np.zeros((len(points), self.channels))
+        for a in range(len(offsets)):
+            row_x = ids[0][a] * resolution
+            for b in range(len(offsets)):
+                row_xy = (row_x + ids[1][b]) * resolution
+                weight_xy = weights[0][a] * weights[1][b]
+                for c in range(len(offsets)):
+                    total += (weight_xy * weights[2][c])[:, None] * flat[
+                        row_xy + ids[2][c]
+                    ]
+        return total
+
+    def save(self, path) -> None:
+        """Write the volume as a .mtn file (replacing any existing file)."""
+        values = np.ascontiguousarray(self.values, dtype="<f4")
+        with open(path, "wb") as stream:
+            stream.write(
+                _kHeader.pack(
+                    kMagic,
+                    kVersion,
+                    self.function.encode(),
+                    self.octaves,
+                    self.lacunarity,
+                    self.gain,
+                    self.resolution,
+                    self.period,
+                )
+            )
+            values.tofile(stream)
+
+    @classmethod
+    def load(cls, path, mmap=True) -> NoiseVolume:
+        """Read a .mtn file.
+
+        Args:
+            path: File path.
+            mmap: Map the grid copy-on-write instead of reading it, so
+                opening costs no reads and pages load on first lookup.
+
+        Raises:
+            ValueError: Not a noise volume file, unsupported version, or
+                truncated.
+        """
+        requireNumpy()
+        with open(path, "rb") as stream:
+            header = stream.read(_kHeader.size)
+        if len(header) < _kHeader.size or header[:8] != kMagic:
+            raise ValueError(f"{path}: not a meshTools noise volume file")
+        (
+            _,
+            version,
+            function,
+            octaves,
+            lacunarity,
+            gain,
+            resolution,
+            period,
+        ) = _kHeader.unpack(header)
+        if version != kVersion:
+            raise ValueError(
+                f"{path}: unsupported noise volume version {version}"
+            )
+        function = function.rstrip(b"\x00").decode()
+        if function not in kFunctions:
+            raise ValueError(f"{path}: unknown noise function {function!r}")
+        shape = (resolution,) * 3 + (kFunctions[function],)
+        count = int(np.prod(shape))
+        if os.path.getsize(path) < _kHeader.size + 4 * count:
+            raise ValueError(f"{path}: truncated noise volume file")
+        if mmap:
+            values = np.memmap(
+                path, dtype="<f4", mode="c", offset=_kHeader.size, shape=shape
+            )
+        else:
+            values = np.fromfile(
+                path, dtype="<f4", count=count, offset=_kHeader.size
+            ).reshape(shape)
+        return cls(values, function, octaves, lacunarity, gain, period)
+
+
+def _volumeKey(function, octaves, lacunarity, gain, resolution, period):
+    """Normalized (function, octaves, lacunarity, gain, resolution, period).
+
+    Floats are rounded to float32 so that keys match what files store;
+    snoise and vsnoise ignore the fractal parameters, which become 0.
+    """
+    if function not in kFunctions:
+        raise ValueError(
+            f"function must be one of {tuple(kFunctions)}, not {function!r}"
+        )
+    if int(resolution) < 2:
+        raise ValueError("resolution must be at least 2")
+    if not period > 0:
+        raise ValueError("period must be positive")
+    if function in _kFractals:
+        fractal = (int(octaves), _f32(lacunarity), _f32(gain))
+    else:
+        fractal = (0, 0.0, 0.0)
+    return (function, *fractal, int(resolution), _f32(period))
+
+
+def _fileName(key) -> str:
+    """Stable .mtn file name for a volume key."""
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+    return f"{key[0]}_{key[4]}_{digest}{kExtension}"
+
+
+class _VolumeCache:
+    """Thread-safe LRU of NoiseVolumes bounded by their total bytes."""
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.nbytes = 0
+        self._volumes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        with self._lock:
+            volume = self._volumes.get(key)
+            if volume is not None:
+                self._volumes.move_to_end(key)
+            return volume
+
+    def insert(self, key, volume):
+        """Cache volume and return the cached volume for key."""
+        with self._lock:
+            # another thread may have baked the same volume meanwhile
+            cached = self._volumes.get(key)
+            if cached is not None:
+                self._volumes.move_to_end(key)
+                return cached
+            if volume.nbytes <= self.budget:
+                self._volumes[key] = volume
+                self.nbytes += volume.nbytes
+                self._evict()
+            return volume
+
+    def resize(self, budget: int) -> None:
+        with self._lock:
+            self.budget = budget
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._volumes.clear()
+            self.nbytes = 0
+
+    def _evict(self) -> None:
+        while self.nbytes > self.budget:
+            _, volume = self._volumes.popitem(last=False)
+            self.nbytes -= volume.nbytes
+
+
+_cache = _VolumeCache(kCacheBudget)
+
+
+def cacheBudget() -> int:
+    """Byte budget of the NoiseVolume.get cache."""
+    return _cache.budget
+
+
+def setCacheBudget(nbytes: int) -> None:
+    """Set the NoiseVolume.get cache budget, evicting least recently used
+    volumes until the cache fits."""
+    _cache.resize(int(nbytes))
+
+
+def clearCache() -> None:
+    """Drop every cached volume (files written by get are kept)."""
+    _cache.clear()
@@ -0,0 +1,119 @@
+"""Vectorized face and vertex normals over CSR faces.
+
+Face normals use the same formula as Mesh: the normalized sum of
+v[i] x v[i + 1] around the face (Newell's method), which is twice the
+vector area of the polygon. Vertex normals sum the faces around each
+vertex, weighted by face area or by the corner angle at the vertex.
+
+Degenerate faces and isolated vertices get a zero normal.
+"""
+
+from __future__ import annotations
+
+from .buffers import OFFSET_DTYPE, np, requireNumpy
+
+__all__ = ["faceNormals", "vertexNormals"]
+
+_kWeightings = ("area", "angle")
+
+
+def _corners(face_offsets, face_indices):
+    """Return (corner face ids, next corner ids, face counts) for CSR faces."""
+    offsets = np.asarray(face_offsets, dtype=OFFSET_DTYPE)
+    counts = np.diff(offsets)
+    face_count = len(counts)
+    corner_face = np.repeat(np.arange(face_count), counts)
+    corner_next = np.arange(offsets[0] + 1, offsets[-1] + 1, dtype=OFFSET_DTYPE)
+    # the last corner of each face wraps to its first
+    filled = counts > 0
+    corner_next[offsets[1:][filled] - 1 - offsets[0]] = offsets[:-1][filled]
+    return corner_face, corner_next - offsets[0], counts
+
+
+def _normalize(vectors):
+    lengths = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+    safe = np.where(lengths > 0, lengths, 1.0)
+    return vectors / safe[:, None]
+
+
+def _sumRows(ids, values, count: int):
+    """Sum (N, 3) values into count rows by id."""
+    return np.stack(
+        [np.bincount(ids, values[:, k], minlength=count) for k in range(3)],
+        axis=1,
+    )
+
+
+def _faceVectors(positions, face_offsets, face_indices):
+    """Unit normals and Newell vectors per face, plus the corner tables."""
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    offsets = np.asarray(face_offsets, dtype=OFFSET_DTYPE)
+    indices = np.asarray(face_indices, dtype=OFFSET_DTYPE)
+    indices = indices[offsets[0] : offsets[-1]]
+    corner_face, corner_next, counts = _corners(offsets, indices)
+    corner_points = positions[indices]
+    crosses = np.cross(corner_points, corner_points[corner_next])
+    # corners of a face are contiguous: sum them per face start
+    vectors = np.zeros((len(counts), 3))
+    filled = counts > 0
+    starts = offsets[:-1][filled] - offsets[0]
+    if len(starts):
+        vectors[filled] = np.add.reduceat(crosses, starts, axis=0)
+    return _normalize(vectors), vectors, indices, corner_face, corner_next
+
+
+def faceNormals(positions, face_offsets, face_indices):
+    """Unit normal of every face.
+
+    Args:
+        positions: (N, 3) vertex positions.
+        face_offsets: Face start offsets into face_indices, length F + 1.
+        face_indices: Concatenated face vertex ids.
+
+    Returns:
+        float64 (F, 3) array.
+    """
+    requireNumpy()
+    return _faceVectors(positions, face_offsets, face_indices)[0]
+
+
+def vertexNormals(
+    positions, face_offsets, face_indices, weighting="area", vertex_count=None
+):
+    """Unit normal of every vertex from the faces around it.
+
+    Args:
+        positions: (N, 3) vertex positions.
+        face_offsets: Face start offsets into face_indices, length F + 1.
+        face_indices: Concatenated face vertex ids.
+        weighting: "area" weights each face by its area; "angle" by the
+            corner angle the face makes at the vertex.
+        vertex_count: Number of rows to return; defaults to len(positions).
+
+    Returns:
+        float64 (vertex_count, 3) array.
+
+    Raises:
+        ValueError: Unknown weighting.
+    """
+    requireNumpy()
+    if weighting not in _kWeightings:
+        raise ValueError(f"weighting must be one of {_kWeightings}")
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    if vertex_count is None:
+        vertex_count = len(positions)
+    unit, vectors, indices, corner_face, corner_next = _faceVectors(
+        positions, face_offsets, face_indices
+    )
+    if weighting == "area":
+        weighted = vectors[corner_face]
+    else:
+        # corner_prev is the inverse permutation of corner_next
+        corner_prev = np.empty_like(corner_next)
+        corner_prev[corner_next] = np.arange(len(corner_next))
+        corner_points = positions[indices]
+        to_next = _normalize(corner_points[corner_next] - corner_points)
+        to_prev = _normalize(corner_points[corner_prev] - corner_points)
+        cosines = np.clip(np.einsum("ij,ij->i", to_next, to_prev), -1.0, 1.0)
+        weighted = unit[corner_face] * np.arccos(cosines)[:, None]
+    return _normalize(_sumRows(indices, weighted, vertex_count))
@@ -0,0 +1,545 @@
+"""Structured timing instrumentation: named, nested spans and native counters.
+
+Mesh operations are wrapped in spans with @profiled; any code can open its
+own with ``with profiling.span("stage", items=n):``. Spans are off by
+default and cost one attribute check when disabled. Once enabled they
+record wall time, time spent outside child spans (self time), call and
+element counts and, optionally, the tracemalloc allocation peak.
+
+    from meshTools import profiling
+
+    with profiling.profile(memory=True) as profiler:
+        mesh.extrude(faces, height=0.5)
+        mesh.relax(verts, iterations=10)
+    report = profiler.report()
+    print(report)                      # call tree with times and counts
+    report["Mesh.relax"].seconds       # aggregate stats per span name
+    report.saveChromeTrace("ops.json")  # chrome://tracing / Perfetto
+
+The C++ extensions keep matching call/item/time counters for their batched
+entry points (see nativeCounters()); a report includes how much they grew
+while the profiler was enabled.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import threading
+import tracemalloc
+from time import perf_counter
+
+__all__ = [
+    "ProfileReport",
+    "Profiler",
+    "SpanStats",
+    "disable",
+    "enable",
+    "nativeCounters",
+    "profile",
+    "profiled",
+    "profiler",
+    "report",
+    "reset",
+    "resetNativeCounters",
+    "span",
+]
+
+# extension modules that expose counters() / resetCounters()
+_kNativeModules = (
+    "_geometry",
+    "_mesh",
+    "_chull",
+    "_delaunay",
+    "_noise",
+    "_bezier",
+)
+
+
+def _loadedNativeModules():
+    """Yield (name, module) for the extensions already imported."""
+    for name in _kNativeModules:
+        module = sys.modules.get(f"meshTools.{name}") or sys.modules.get(name)
+        if module is not None and hasattr(module, "counters"):
+            yield name, module
+
+
+def nativeCounters() -> dict:
+    """Counters of every loaded C++ extension.
+
+    Returns:
+        {"_module.entry": {"calls", "items", "seconds"}} for each batched
+        native entry point that has run since the last reset. Extensions
+        that are not imported yet are not imported by this call.
+    """
+    counters = {}
+    for name, module in _loadedNativeModules():
+        for entry, values in module.counters().items():
+            counters[f"{name}.{entry}"] = dict(values)
+    return counters
+
+
+def resetNativeCounters() -> None:
+    """Zero the counters of every loaded C++ extension."""
+    for _, module in _loadedNativeModules():
+        module.resetCounters()
+
+
+def _counterDelta(before: dict, after: dict) -> dict:
+    delta = {}
+    for name, values in after.items():
+        old = before.get(name, {})
+        change = {key: values[key] - old.get(key, 0) for key in values}
+        if change["calls"]:
+            delta[name] = change
+    return delta
+
+
+class SpanStats:
+    """Aggregate of every closed span with one name (or one call path)."""
+
+    __slots__ = (
+        "calls",
+        "items",
+        "name",
+        "peak_memory",
+        "seconds",
+        "self_seconds",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+        self.items = 0
+        self.peak_memory = None
+
+    def _add(self, seconds, self_seconds, items, memory):
+        self.calls += 1
+        self.seconds += seconds
+        self.self_seconds += self_seconds
+        if items:
+            self.items += items
+        if memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, memory)
+
+    @property
+    def throughput(self):
+        """Items per second, or None without items or time."""
+        if not self.items or self.seconds <= 0:
+            return None
+        return self.items / self.seconds
+
+    def toDict(self) -> dict:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "self_seconds": self.self_seconds,
+            "items": self.items,
+            "throughput": self.throughput,
+            "peak_memory": self.peak_memory,
+        }
+
+    def __repr__(self):
+        return (
+            f"SpanStats({self.name!r}, calls={self.calls}, "
+            f"seconds={self.seconds:.6f}, items={self.items})"
+        )
+
+
+class _Frame:
+    """An open span on a thread's stack."""
+
+    __slots__ = (
+        "child_seconds",
+        "items",
+        "memory_peak",
+        "memory_start",
+        "name",
+        "path",
+        "start",
+    )
+
+
+class _Span:
+    """Context manager returned by Profiler.span()."""
+
+    __slots__ = ("_frame", "_items", "_name", "_profiler")
+
+    def __init__(self, profiler, name, items):
+        self._profiler = profiler
+        self._name = name
+        self._items = items
+        self._frame = None
+
+    def __enter__(self):
+        if self._profiler.enabled:
+            self._frame = self._profiler._push(self._name, self._items)
+        return self
+
+    def __exit__(self, *exc):
+        if self._frame is not None:
+            self._profiler._pop(self._frame)
+            self._frame = None
+        return False
+
+    def setItems(self, items: int) -> None:
+        """Set the element count once it is known inside the span."""
+        if self._frame is not None:
+            self._frame.items = items
+
+
+class Profiler:
+    """Collects nested timing spans.
+
+    Args:
+        max_events: Most span events kept for the Chrome trace; aggregate
+            stats keep counting past it.
+    """
+
+    def __init__(self, max_events: int = 100_000):
+        self.enabled = False
+        self.memory = False
+        self.max_events = max_events
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self.reset()
+
+    def enable(self, memory: bool = False) -> None:
+        """Start recording spans.
+
+        Args:
+            memory: Also record each span's tracemalloc allocation peak.
+                Starts tracemalloc if needed; tracing slows allocation-heavy
+                Python code down noticeably.
+        """
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.memory = memory
+        self._native_start = nativeCounters()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; collected spans are kept until reset()."""
+        self.enabled = False
+        self._native_delta = self._nativeDelta()
+        self._native_start = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.memory = False
+
+    def reset(self) -> None:
+        """Drop every recorded span."""
+        with self._lock:
+            self._stats = {}
+            self._paths = {}
+            self._events = []
+            self.dropped_events = 0
+            self._origin = perf_counter()
+            self._native_start = nativeCounters() if self.enabled else None
+            self._native_delta = {}
+
+    def span(self, name: str, items: int | None = None) -> _Span:
+        """Context manager timing the block as a span called name.
+
+        Args:
+            name: Span name; spans with the same name are aggregated.
+            items: Elements processed, for throughput; can also be set
+                later with setItems() on the returned object.
+        """
+        return _Span(self, name, items)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, name, items):
+        stack = self._stack()
+        frame = _Frame()
+        frame.name = name
+        frame.path = f"{stack[-1].path}/{name}" if stack else name
+        frame.items = items
+        frame.child_seconds = 0.0
+        frame.memory_start = None
+        if self.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # tracemalloc has one global peak: fold it into the parent
+            # before restarting it for this span
+            if stack and stack[-1].memory_start is not None:
+                stack[-1].memory_peak = max(stack[-1].memory_peak, peak)
+            tracemalloc.reset_peak()
+            frame.memory_start = current
+            frame.memory_peak = current
+        stack.append(frame)
+        frame.start = perf_counter()
+        return frame
+
+    def _pop(self, frame):
+        end = perf_counter()
+        stack = self._stack()
+        # tolerate spans closed out of order (e.g. by a generator)
+        while stack and stack[-1] is not frame:
+            stack.pop()
+        if stack:
+            stack.pop()
+        seconds = end - frame.start
+        memory = None
+        if frame.memory_start is not None and tracemalloc.is_tracing():
+            peak = max(frame.memory_peak, tracemalloc.get_traced_memory()[1])
+            memory = peak - frame.memory_start
+            if stack and stack[-1].memory_start is not None:
+                stack[-1].memory_peak = max(stack[-1].memory_peak, peak)
+            tracemalloc.reset_peak()
+        if stack:
+            stack[-1].child_seconds += seconds
+        self_seconds = seconds - frame.child_seconds
+        with self._lock:
+            for table, key in (
+                (self._stats, frame.name),
+                (self._paths, frame.path),
+            ):
+                stats = table.get(key)
+                if stats is None:
+                    stats = table[key] = SpanStats(key)
+                stats._add(seconds, self_seconds, frame.items, memory)
+            if len(self._events) < self.max_events:
+                self._events.append(
+                    (
+                        frame.name,
+                        frame.start - self._origin,
+                        seconds,
+                        threading.get_ident(),
+                        frame.items,
+                        memory,
+                    )
+                )
+            else:
+                self.dropped_events += 1
+
+    def _nativeDelta(self):
+        """Native counter growth over every enabled period since reset."""
+        delta = {name: dict(v) for name, v in self._native_delta.items()}
+        if self._native_start is not None:
+            current = _counterDelta(self._native_start, nativeCounters())
+            for name, change in current.items():
+                total = delta.setdefault(name, dict.fromkeys(change, 0))
+                for key, value in change.items():
+                    total[key] += value
+        return delta
+
+    def report(self) -> ProfileReport:
+        """Snapshot of everything recorded so far."""
+        with self._lock:
+            return ProfileReport(
+                {k: _copyStats(s) for k, s in self._stats.items()},
+                {k: _copyStats(s) for k, s in self._paths.items()},
+                list(self._events),
+                self._nativeDelta(),
+                self.dropped_events,
+            )
+
+
+def _copyStats(stats):
+    copy = SpanStats(stats.name)
+    for slot in SpanStats.__slots__:
+        setattr(copy, slot, getattr(stats, slot))
+    return copy
+
+
+class ProfileReport:
+    """Queryable snapshot of a Profiler.
+
+    Attributes:
+        stats: {span name: SpanStats} over all call paths.
+        paths: {"outer/inner" call path: SpanStats}.
+        events: (name, start, seconds, thread, items, memory) per span,
+            start in seconds since the profiler was reset.
+        native: {"_module.entry": {"calls", "items", "seconds"}} growth of
+            the native counters while the profiler was enabled.
+        dropped_events: Spans past Profiler.max_events left out of events.
+    """
+
+    def __init__(self, stats, paths, events, native, dropped_events=0):
+        self.stats = stats
+        self.paths = paths
+        self.events = events
+        self.native = native
+        self.dropped_events = dropped_events
+
+    def __getitem__(self, name: str) -> SpanStats:
+        return self.stats[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.stats
+
+    def names(self) -> list:
+        """Span names in first-closed order."""
+        return list(self.stats)
+
+    def top(self, count: int = 10, key: str = "self_seconds") -> list:
+        """The count spans with the largest key ("seconds", "calls", ...)."""
+        return sorted(
+            self.stats.values(), key=lambda s: getattr(s, key), reverse=True
+        )[:count]
+
+    def children(self, path: str) -> list:
+        """Stats of the spans opened directly inside call path."""
+        prefix = path + "/"
+        return [
+            stats
+            for key, stats in self.paths.items()
+            if key.startswith(prefix) and "/" not in key[len(prefix) :]
+        ]
+
+    def toDict(self) -> dict:
+        """JSON-ready dict of spans, call paths and native counters."""
+        return {
+            "spans": [s.toDict() for s in self.stats.values()],
+            "paths": [s.toDict() for s in self.paths.values()],
+            "native": self.native,
+            "dropped_events": self.dropped_events,
+        }
+
+    def toChromeTrace(self) -> dict:
+        """Trace Event Format dict for chrome://tracing or Perfetto."""
+        pid = os.getpid()
+        trace = []
+        for name, start, seconds, thread, items, memory in self.events:
+            args = {}
+            if items is not None:
+                args["items"] = items
+            if memory is not None:
+                args["peak_memory"] = memory
+            trace.append(
+                {
+                    "name": name,
+                    "cat": "meshTools",
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": seconds * 1e6,
+                    "pid": pid,
+                    "tid": thread,
+                    "args": args,
+                }
+            )
+        return {
+            "traceEvents": trace,
+            "displayTimeUnit": "ms",
+            "otherData": {"native": self.native},
+        }
+
+    def save(self, path) -> None:
+        """Write toDict() as JSON."""
+        import json
+
+        with open(path, "w") as stream:
+            json.dump(self.toDict(), stream, indent=2)
+
+    def saveChromeTrace(self, path) -> None:
+        """Write toChromeTrace() as JSON."""
+        import json
+
+        with open(path, "w") as stream:
+            json.dump(self.toChromeTrace(), stream)
+
+    def __str__(self):
+        header = (
+            f"{'span':<40} {'calls':>7} {'total ms':>10} {'self ms':>10}"
+            f" {'items':>10}"
+        )
+        lines = [header]
+        for path in sorted(self.paths, key=lambda p: p.split("/")):
+            stats = self.paths[path]
+            label = "  " * path.count("/") + stats.name.rsplit("/", 1)[-1]
+            lines.append(
+                f"{label:<40} {stats.calls:>7} {stats.seconds * 1e3:>10.3f}"
+                f" {stats.self_seconds * 1e3:>10.3f} {stats.items:>10}"
+            )
+        for name, values in sorted(self.native.items()):
+            lines.append(
+                f"{name:<40} {values['calls']:>7}"
+                f" {values['seconds'] * 1e3:>10.3f} {'':>10}"
+                f" {values['items']:>10}"
+            )
+        return "\n".join(lines)
+
+
+profiler = Profiler()
+
+
+def enable(memory: bool = False) -> None:
+    """Enable the default profiler (see Profiler.enable)."""
+    profiler.enable(memory)
+
+
+def disable() -> None:
+    """Disable the default profiler."""
+    profiler.disable()
+
+
+def reset() -> None:
+    """Drop the spans recorded by the default profiler."""
+    profiler.reset()
+
+
+def report() -> ProfileReport:
+    """Report of the default profiler."""
+    return profiler.report()
+
+
+def span(name: str, items: int | None = None) -> _Span:
+    """Span on the default profiler (see Profiler.span)."""
+    return profiler.span(name, items)
+
+
+class profile:
+    """Enable the default profiler for a block, starting from empty.
+
+    Args:
+        memory: Record tracemalloc peaks (see Profiler.enable).
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+
+    def __enter__(self) -> Profiler:
+        profiler.reset()
+        profiler.enable(self.memory)
+        return profiler
+
+    def __exit__(self, *exc):
+        profiler.disable()
+        return False
+
+
+def profiled(name: str | None = None, items=None):
+    """Decorator running every call of a function in a span.
+
+    Args:
+        name: Span name; defaults to the function's qualified name.
+        items: Optional callable taking the call's arguments and returning
+            the element count of the call.
+    """
+
+    def decorate(function):
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            count = items(*args, **kwargs) if items is not None else None
+            with profiler.span(span_name, count):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,299 @@
+"""Batch selection conversion over CSR mesh adjacency.
+
+SelectionEngine converts whole selections between face, edge and vertex
+ids with NumPy mask operations instead of per-element Python loops. It
+also answers grow, shrink, border and interior queries. Selections may be
+given as integer id arrays or boolean masks. Results are sorted id arrays
+or, with as_mask=True, boolean masks. toBitset/fromBitset pack masks into
+compact bitsets.
+
+Edge ids follow the edge list the engine is built with (Mesh.edges), so
+results can be used with the rest of the Mesh API.
+"""
+
+from __future__ import annotations
+
+from .buffers import OFFSET_DTYPE, MeshBuffers, np, requireNumpy
+from .lists import Enumeration
+
+__all__ = ["SelectionEngine", "fromBitset", "toBitset"]
+
+# Same values as meshTools.mesh.kGeotype
+_kGeotype = Enumeration("face|edge|vertex")
+
+
+def _packKeys(pairs):
+    """Pack (K, 2) vertex pairs into undirected int64 keys."""
+    pairs = np.sort(np.asarray(pairs, dtype=OFFSET_DTYPE), axis=1)
+    return (pairs[:, 0] << 32) | pairs[:, 1]
+
+
+def toBitset(mask):
+    """Pack a boolean mask into a little-endian uint8 bitset.
+
+    Args:
+        mask: Boolean array.
+
+    Returns:
+        uint8 array of ceil(len(mask) / 8) bytes.
+    """
+    requireNumpy()
+    return np.packbits(np.asarray(mask, dtype=bool), bitorder="little")
+
+
+def fromBitset(bits, count: int):
+    """Unpack a bitset produced by toBitset into a boolean mask.
+
+    Args:
+        bits: uint8 bitset.
+        count: Number of elements.
+
+    Returns:
+        Boolean mask of length count.
+    """
+    requireNumpy()
+    return np.unpackbits(
+        np.asarray(bits, dtype=np.uint8), count=count, bitorder="little"
+    ).astype(bool)
+
+
+class SelectionEngine:
+    """Whole-array selection queries over CSR face adjacency.
+
+    The engine snapshots the mesh topology when built; rebuild it after
+    faces or edges change (Mesh.selectionEngine() does this).
+    """
+
+    def __init__(self, buffers: MeshBuffers, edges=None, vertex_count=None):
+        """Build adjacency arrays.
+
+        Args:
+            buffers: Mesh faces in CSR form.
+            edges: (E, 2) vertex pairs defining edge ids; defaults to
+                buffers.edgePairs(). For duplicate edges the first id wins.
+            vertex_count: Number of vertices; defaults to the buffers'
+                vertex count (grown to cover every face index).
+        """
+        requireNumpy()
+        offsets = buffers.face_offsets
+        indices = buffers.face_indices.astype(OFFSET_DTYPE)
+        self.face_count = buffers.face_count
+        self.vertex_count = max(
+            vertex_count if vertex_count is not None else buffers.vertex_count,
+            int(indices.max()) + 1 if len(indices) else 0,
+        )
+        if edges is None:
+            edges = buffers.edgePairs()
+        self.edges = np.asarray(edges, dtype=OFFSET_DTYPE).reshape(-1, 2)
+        self.edge_count = len(self.edges)
+
+        self.face_offsets = offsets
+        self.face_indices = indices
+        self.slot_face = np.repeat(
+            np.arange(self.face_count, dtype=OFFSET_DTYPE), np.diff(offsets)
+        )
+        # directed corner pairs (face[i], face[i + 1]) and their edge ids
+        self.corner_pairs = buffers.faceEdgePairs().astype(OFFSET_DTYPE)
+        edge_keys = _packKeys(self.edges)
+        order = np.argsort(edge_keys, kind="stable")
+        sorted_keys = edge_keys[order]
+        corner_keys = _packKeys(self.corner_pairs)
+        pos = np.searchsorted(sorted_keys, corner_keys)
+        pos = np.minimum(pos, max(len(sorted_keys) - 1, 0))
+        if len(sorted_keys):
+            found = sorted_keys[pos] == corner_keys
+            self.corner_edge = np.where(found, order[pos], -1)
+        else:
+            self.corner_edge = np.full(len(corner_keys), -1, OFFSET_DTYPE)
+        self._corner_keys = corner_keys
+        self._boundary_vertex = None
+
+    # ------------------------------------------------------------------
+    # Masks
+    # ------------------------------------------------------------------
+
+    def count(self, seltype: int) -> int:
+        """Return the number of elements of a kGeotype."""
+        if seltype == _kGeotype.face:
+            return self.face_count
+        if seltype == _kGeotype.edge:
+            return self.edge_count
+        return self.vertex_count
+
+    def toMask(self, selection, seltype: int):
+        """Return a boolean mask for ids or a mask of a kGeotype."""
+        size = self.count(seltype)
+        selection = np.asarray(selection)
+        if selection.dtype == bool:
+            if len(selection) != size:
+                raise ValueError(
+                    f"mask length {len(selection)} does not match {size}"
+                )
+            return selection
+        mask = np.zeros(size, dtype=bool)
+        mask[selection.astype(OFFSET_DTYPE).reshape(-1)] = True
+        return mask
+
+    def _result(self, mask, as_mask: bool):
+        return mask if as_mask else np.flatnonzero(mask)
+
+    def _facesToVertices(self, face_mask):
+        mask = np.zeros(self.vertex_count, dtype=bool)
+        mask[self.face_indices[face_mask[self.slot_face]]] = True
+        return mask
+
+    def _verticesToFaces(self, vertex_mask):
+        mask = np.zeros(self.face_count, dtype=bool)
+        mask[self.slot_face[vertex_mask[self.face_indices]]] = True
+        return mask
+
+    def _facesToEdges(self, face_mask):
+        mask = np.zeros(self.edge_count, dtype=bool)
+        ids = self.corner_edge[face_mask[self.slot_face]]
+        mask[ids[ids >= 0]] = True
+        return mask
+
+    def _edgesToVertices(self, edge_mask):
+        mask = np.zeros(self.vertex_count, dtype=bool)
+        mask[self.edges[edge_mask].reshape(-1)] = True
+        return mask
+
+    def _verticesToEdges(self, vertex_mask):
+        return vertex_mask[self.edges[:, 0]] | vertex_mask[self.edges[:, 1]]
+
+    def boundaryVertices(self, as_mask=False):
+        """Return vertices on a mesh boundary (an edge with one face)."""
+        if self._boundary_vertex is None:
+            _, inverse, counts = np.unique(
+                self._corner_keys, return_inverse=True, return_counts=True
+            )
+            single = counts[inverse] == 1
+            mask = np.zeros(self.vertex_count, dtype=bool)
+            mask[self.corner_pairs[single].reshape(-1)] = True
+            self._boundary_vertex = mask
+        return self._result(self._boundary_vertex, as_mask)
+
+    def convertMask(self, mask, fromtype: int, totype: int):
+        """Convert a boolean mask between kGeotypes.
+
+        Conversions follow Mesh.selectConvert: edge -> face selects faces
+        touching either edge vertex, vertex -> edge selects edges with
+        either end selected.
+        """
+        if fromtype == totype:
+            return mask.copy()
+        if fromtype == _kGeotype.face:
+            if totype == _kGeotype.edge:
+                return self._facesToEdges(mask)
+            return self._facesToVertices(mask)
+        if fromtype == _kGeotype.edge:
+            vertex_mask = self._edgesToVertices(mask)
+            if totype == _kGeotype.vertex:
+                return vertex_mask
+            return self._verticesToFaces(vertex_mask)
+        if totype == _kGeotype.face:
+            return self._verticesToFaces(mask)
+        return self._verticesToEdges(mask)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def convert(self, selection, fromtype: int, totype: int, as_mask=False):
+        """Convert a selection between kGeotypes.
+
+        Args:
+            selection: Ids or boolean mask of type fromtype.
+            fromtype: Source kGeotype.
+            totype: Target kGeotype.
+            as_mask: Return a boolean mask instead of ids.
+
+        Returns:
+            Sorted int64 ids (or mask) of type totype.
+        """
+        mask = self.toMask(selection, fromtype)
+        return self._result(self.convertMask(mask, fromtype, totype), as_mask)
+
+    def grow(self, selection, seltype: int, as_mask=False):
+        """Grow a selection by one ring.
+
+        Faces and edges grow by everything sharing a vertex with the
+        selection (Mesh.selectGrowF / selectGrowE); vertices grow by their
+        face-loop neighbors.
+        """
+        mask = self.toMask(selection, seltype)
+        if seltype == _kGeotype.vertex:
+            a, b = self.corner_pairs[:, 0], self.corner_pairs[:, 1]
+            grown = mask.copy()
+            grown[b[mask[a]]] = True
+            grown[a[mask[b]]] = True
+        else:
+            vertex_mask = self.convertMask(mask, seltype, _kGeotype.vertex)
+            grown = self.convertMask(vertex_mask, _kGeotype.vertex, seltype)
+        return self._result(grown, as_mask)
+
+    def shrink(self, selection, seltype: int, as_mask=False):
+        """Shrink a selection by one ring.
+
+        Keeps elements whose vertices are surrounded by the selection only:
+        faces whose every vertex has all its faces selected, edges whose
+        ends have all their edges selected, vertices whose neighbors are
+        all selected. Vertices on the mesh boundary are never surrounded.
+        """
+        mask = self.toMask(selection, seltype)
+        open_vertex = self.boundaryVertices(True).copy()
+        if seltype == _kGeotype.vertex:
+            a, b = self.corner_pairs[:, 0], self.corner_pairs[:, 1]
+            open_vertex[a[~mask[b]]] = True
+            open_vertex[b[~mask[a]]] = True
+            return self._result(mask & ~open_vertex, as_mask)
+        if seltype == _kGeotype.face:
+            open_vertex |= self._facesToVertices(~mask)
+            open_face = self._verticesToFaces(open_vertex)
+            return self._result(mask & ~open_face, as_mask)
+        open_vertex |= self._edgesToVertices(~mask)
+        return self._result(mask & ~self._verticesToEdges(open_vertex), as_mask)
+
+    def border(self, faces, as_mask=False):
+        """Return the border edges of a face selection.
+
+        A border edge is used by exactly one selected face.
+        """
+        face_mask = self.toMask(faces, _kGeotype.face)
+        ids = self.corner_edge[face_mask[self.slot_face]]
+        uses = np.bincount(ids[ids >= 0], minlength=self.edge_count)
+        return self._result(uses == 1, as_mask)
+
+    def borderCorners(self, faces, as_mask=False):
+        """Return the face corners on the border of a face selection.
+
+        Corner i is the directed side corner_pairs[i]; the corners of face f
+        are face_offsets[f]:face_offsets[f + 1]. A side is interior when the
+        selected faces use it exactly once in each direction. Sides used
+        once, twice in one direction (flipped winding) or by more than two
+        faces are on the border. Unlike border, sides missing from the edge
+        list count too.
+        """
+        face_mask = self.toMask(faces, _kGeotype.face)
+        selected = np.flatnonzero(face_mask[self.slot_face])
+        pairs = self.corner_pairs[selected]
+        forward = (pairs[:, 0] << 32) | pairs[:, 1]
+        backward = (pairs[:, 1] << 32) | pairs[:, 0]
+        keys, inverse, uses = np.unique(
+            forward, return_inverse=True, return_counts=True
+        )
+        interior = uses[inverse] == 1
+        if len(keys):
+            pos = np.minimum(np.searchsorted(keys, backward), len(keys) - 1)
+            interior &= (keys[pos] == backward) & (uses[pos] == 1)
+        mask = np.zeros(len(self.corner_pairs), dtype=bool)
+        mask[selected[~interior]] = True
+        return self._result(mask, as_mask)
+
+    def interior(self, faces, as_mask=False):
+        """Return vertices of a face selection not on its border."""
+        face_mask = self.toMask(faces, _kGeotype.face)
+        vertices = self._facesToVertices(face_mask)
+        on_border = self.corner_pairs[self.borderCorners(face_mask, True)]
+        vertices[on_border.reshape(-1)] = False
+        return self._result(vertices, as_mask)
@@ -5,6 +5,7 @@
 
 #include <algorithm>
 #include <chull/chull.h>
+#include <chull/quickhull.h>
 #include <geometry/vector.h>
 #include <memory>
 #include <stdexcept>
@@ -186,13 +187,16 @@ void Hull::addOne(ChullVertex *p) {
         p->onHull = false;
         return;
     }
-    for (auto &e : edges_) {
+    // makeConeFace appends edges; only visit the edges present before p
+    const size_t edgeCount = edges_.size();
+    for (size_t i = 0; i < edgeCount; ++i) {
+        ChullEdge *e = edges_[i].get();
         if (e->adjFace[0] && e->adjFace[1] && e->adjFace[0]->visible &&
             e->adjFace[1]->visible)
             e->remove = true;
         else if ((e->adjFace[0] && e->adjFace[0]->visible) ||
                  (e->adjFace[1] && e->adjFace[1]->visible))
-            e->newFace = makeConeFace(e.get(), p);
+            e->newFace = makeConeFace(e, p);
     }
 }
 
@@ -290,7 +294,7 @@ std::pair<size_t, size_t> Hull::cleanVertices(size_t evi, size_t vi) {
     return {evi, static_cast<size_t>(nextV)};
 }
 
-Hull::Hull(const std::vector<Geometry::Vector> &points) {
+void Hull::buildIncremental(const std::vector<Geometry::Vector> &points) {
     for (size_t i = 0; i < points.size(); ++i) {
         auto vert = std::make_unique<ChullVertex>();
         vert->v = points[i];
@@ -339,18 +343,77 @@ Hull::Hull(const std::vector<Geometry::Vector> &points) {
     edgeOrderOnFaces();
 }
 
+void Hull::collectIncremental() {
+    for (size_t i = 0; i < vertices_.size(); ++i) {
+        const Geometry::Vector &p = vertices_[i]->v;
+        positions_.insert(positions_.end(), {p.x, p.y, p.z});
+        pointIds_.push_back(static_cast<uint32_t>(vertices_[i]->vnum));
+        vertices_[i]->vnum = static_cast<int>(i);
+    }
+    for (const auto &f : faces_)
+        for (const ChullVertex *v : f->vertex)
+            faceIndices_.push_back(static_cast<uint32_t>(v->vnum));
+    faces_.clear();
+    edges_.clear();
+    vertices_.clear();
+}
+
+void Hull::buildQuickhull(const float *points, size_t count) {
+    faceIndices_ = quickhull(points, count);
+    // number hull vertices in input order
+    std::vector<uint32_t> remap(count, UINT32_MAX);
+    for (uint32_t v : faceIndices_)
+        remap[v] = 0;
+    for (size_t i = 0; i < count; ++i) {
+        if (remap[i] == UINT32_MAX)
+            continue;
+        remap[i] = static_cast<uint32_t>(pointIds_.size());
+        pointIds_.push_back(static_cast<uint32_t>(i));
+        positions_.insert(positions_.end(), points + 3 * i, points + 3 * i + 3);
+    }
+    for (uint32_t &v : faceIndices_)
+        v = remap[v];
+}
+
+Hull::Hull(const std::vector<Geometry::Vector> &points, bool quickhull) {
+    if (quickhull) {
+        std::vector<float> flat;
+        flat.reserve(3 * points.size());
+        for (const auto &p : points)
+            flat.insert(flat.end(), {p.x, p.y, p.z});
+        buildQuickhull(flat.data(), points.size());
+    } else {
+        buildIncremental(points);
+        collectIncremental();
+    }
+}
+
+Hull::Hull(const float *points, size_t count, bool quickhull) {
+    if (quickhull) {
+        buildQuickhull(points, count);
+    } else {
+        std::vector<Geometry::Vector> vertices;
+        vertices.reserve(count);
+        for (size_t i = 0; i < count; ++i)
+            vertices.emplace_back(points[3 * i], points[3 * i + 1],
+                                  points[3 * i + 2]);
+        buildIncremental(vertices);
+        collectIncremental();
+    }
+}
+
 std::pair<std::vector<std::vector<int>>, std::vector<Geometry::Vector>>
 Hull::exportHull() const {
     std::vector<std::vector<int>> outFaces;
     std::vector<Geometry::Vector> outVertices;
-    for (size_t i = 0; i < vertices_.size(); ++i)
-        vertices_[i]->vnum = static_cast<int>(i);
-    for (const auto &f : faces_) {
-        outFaces.push_back(
-            {f->vertex[0]->vnum, f->vertex[1]->vnum, f->vertex[2]->vnum});
+    for (size_t i = 0; i < faceIndices_.size(); i += 3) {
+        outFaces.push_back({static_cast<int>(faceIndices_[i]),
+                            static_cast<int>(faceIndices_[i + 1]),
+                            static_cast<int>(faceIndices_[i + 2])});
     }
-    for (const auto &vert : vertices_)
-        outVertices.push_back(vert->v);
+    for (size_t i = 0; i < positions_.size(); i += 3)
+        outVertices.emplace_back(positions_[i], positions_[i + 1],
+                                 positions_[i + 2]);
     return {outFaces, outVertices};
 }
 
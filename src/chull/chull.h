@@ -1,11 +1,13 @@
 /**
  * @file chull.h
  * @brief 3D convex hull via incremental construction (double-triangle /
- * O'Rourke)
+ * O'Rourke) or Quickhull
  */
 
 #pragma once
 
+#include <cstddef>
+#include <cstdint>
 #include <geometry/vector.h>
 #include <memory>
 #include <vector>
@@ -44,16 +46,29 @@ bool collinear(const ChullVertex *a, const ChullVertex *b,
 
 /**
  * Convex hull of a 3D point set.
- * Builds hull in constructor; use exportHull() to get [faces, vertices].
+ * Builds hull in constructor; use exportHull() to get [faces, vertices], or
+ * the flat getFaceIndices() / getPositions() / getPointIds() buffers.
  */
 class Hull {
   public:
     /**
      * Build convex hull from point set.
      * @param points Input points (Vector or equivalent)
+     * @param quickhull Use the Quickhull engine (quickhull.h) instead of
+     *   the incremental one
      * @throws std::runtime_error if all points are collinear or coplanar
      */
-    explicit Hull(const std::vector<Geometry::Vector> &points);
+    explicit Hull(const std::vector<Geometry::Vector> &points,
+                  bool quickhull = false);
+
+    /**
+     * Build convex hull from a flat point buffer.
+     * @param points Row-major (count, 3) coordinates
+     * @param count Number of points
+     * @param quickhull Use the Quickhull engine instead of the incremental one
+     * @throws std::runtime_error if all points are collinear or coplanar
+     */
+    Hull(const float *points, size_t count, bool quickhull = false);
 
     Hull(const Hull &) = delete;
     Hull &operator=(const Hull &) = delete;
@@ -68,11 +83,26 @@ class Hull {
     std::pair<std::vector<std::vector<int>>, std::vector<Geometry::Vector>>
     exportHull() const;
 
+    /** Triangles as 3 indices each into getPositions(). */
+    const std::vector<uint32_t> &getFaceIndices() const { return faceIndices_; }
+    /** Hull vertex positions, 3 floats each. */
+    const std::vector<float> &getPositions() const { return positions_; }
+    /** Input point index of each hull vertex. */
+    const std::vector<uint32_t> &getPointIds() const { return pointIds_; }
+
   private:
+    std::vector<uint32_t> faceIndices_;
+    std::vector<float> positions_;
+    std::vector<uint32_t> pointIds_;
+
+    // incremental engine state, released once the hull is exported
     std::vector<std::unique_ptr<ChullVertex>> vertices_;
     std::vector<std::unique_ptr<ChullEdge>> edges_;
     std::vector<std::unique_ptr<ChullFace>> faces_;
 
+    void buildIncremental(const std::vector<Geometry::Vector> &points);
+    void buildQuickhull(const float *points, size_t count);
+    void collectIncremental();
     static int volumeSign(const ChullFace *f, const ChullVertex *p);
     size_t doubleTriangle();
     void constructHull(size_t startV);
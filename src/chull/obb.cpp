@@ -0,0 +1,272 @@
+/**
+ * @file obb.cpp
+ * @brief Oriented bounding boxes fitted to a point set or its convex hull
+ */
+
+#include <algorithm>
+#include <array>
+#include <chull/obb.h>
+#include <chull/quickhull.h>
+#include <cmath>
+#include <geometry/parallel.h>
+#include <limits>
+#include <stdexcept>
+#include <vector>
+
+namespace meshTools {
+namespace Chull {
+
+using Geometry::Bbox;
+using Geometry::Vector;
+
+namespace {
+
+using Point2 = std::array<double, 2>;
+using Point3 = std::array<double, 3>;
+
+/** Items per thread in orientedBoxes; each range is a full hull build. */
+constexpr size_t kBoxesPerThread = 16;
+
+double dot2(const Point2 &a, const Point2 &b) {
+    return a[0] * b[0] + a[1] * b[1];
+}
+
+double dot3(const Point3 &a, const Point3 &b) {
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2];
+}
+
+Point3 cross3(const Point3 &a, const Point3 &b) {
+    return {a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2],
+            a[0] * b[1] - a[1] * b[0]};
+}
+
+/** Scale to unit length; false for a zero vector. */
+bool normalize3(Point3 &a) {
+    const double length = std::sqrt(dot3(a, a));
+    if (length == 0)
+        return false;
+    for (double &x : a)
+        x /= length;
+    return true;
+}
+
+double boxVolume(const Bbox &box) {
+    return double(box.max.x - box.min.x) * double(box.max.y - box.min.y) *
+           double(box.max.z - box.min.z);
+}
+
+/** Counterclockwise 2D convex hull without collinear points (monotone
+ * chain); sorts points. */
+std::vector<Point2> convexHull2d(std::vector<Point2> &points) {
+    std::sort(points.begin(), points.end());
+    points.erase(std::unique(points.begin(), points.end()), points.end());
+    if (points.size() < 3)
+        return points;
+    auto turn = [](const Point2 &o, const Point2 &a, const Point2 &b) {
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0]);
+    };
+    std::vector<Point2> hull(2 * points.size());
+    size_t k = 0;
+    for (size_t i = 0; i < points.size(); i++) {
+        while (k >= 2 && turn(hull[k - 2], hull[k - 1], points[i]) <= 0)
+            k--;
+        hull[k++] = points[i];
+    }
+    for (size_t i = points.size() - 1, lower = k + 1; i-- > 0;) {
+        while (k >= lower && turn(hull[k - 2], hull[k - 1], points[i]) <= 0)
+            k--;
+        hull[k++] = points[i];
+    }
+    hull.resize(k - 1);
+    return hull;
+}
+
+/**
+ * Minimum-area rectangle around a counterclockwise convex polygon by
+ * rotating calipers: one side lies on a polygon edge, and the points
+ * farthest along that edge, along its inward normal and against the edge
+ * only move forward as the edge advances.
+ * @param dir Receives the unit direction of the rectangle side.
+ * @return Rectangle area.
+ */
+double minAreaRectangle(const std::vector<Point2> &hull, Point2 &dir) {
+    const size_t n = hull.size();
+    dir = {1, 0};
+    if (n < 3) {
+        if (n == 2) {
+            const Point2 d = {hull[1][0] - hull[0][0], hull[1][1] - hull[0][1]};
+            const double length = std::sqrt(dot2(d, d));
+            dir = {d[0] / length, d[1] / length};
+        }
+        return 0;
+    }
+    double best = std::numeric_limits<double>::infinity();
+    size_t far = 1, top = 1, back = 1;
+    for (size_t i = 0; i < n; i++) {
+        const Point2 &a = hull[i], &b = hull[(i + 1) % n];
+        Point2 e = {b[0] - a[0], b[1] - a[1]};
+        const double length = std::sqrt(dot2(e, e));
+        e = {e[0] / length, e[1] / length};
+        const Point2 up = {-e[1], e[0]};
+        if (i == 0)
+            far = 1;
+        while (dot2(hull[(far + 1) % n], e) > dot2(hull[far], e))
+            far = (far + 1) % n;
+        if (i == 0)
+            top = far;
+        while (dot2(hull[(top + 1) % n], up) > dot2(hull[top], up))
+            top = (top + 1) % n;
+        if (i == 0)
+            back = top;
+        while (dot2(hull[(back + 1) % n], e) < dot2(hull[back], e))
+            back = (back + 1) % n;
+        const double area = (dot2(hull[far], e) - dot2(hull[back], e)) *
+                            (dot2(hull[top], up) - dot2(a, up));
+        if (area < best) {
+            best = area;
+            dir = e;
+        }
+    }
+    return best;
+}
+
+/** Set box axes to a frame, sort them by decreasing extent, keep the frame
+ * right-handed and fit the box to points. */
+void fitSorted(Bbox &box, const Vector axes[3], const float *points,
+               size_t count) {
+    for (int i = 0; i < 3; i++)
+        box.axis[i] = axes[i];
+    box.fitToAxes(points, count);
+    const float extent[3] = {box.max.x - box.min.x, box.max.y - box.min.y,
+                             box.max.z - box.min.z};
+    int order[3] = {0, 1, 2};
+    std::sort(order, order + 3,
+              [&](int i, int j) { return extent[i] > extent[j]; });
+    box.axis[0] = axes[order[0]];
+    box.axis[1] = axes[order[1]];
+    box.axis[2] = box.axis[0].cross(box.axis[1]);
+    box.fitToAxes(points, count);
+}
+
+/** Smallest box over the hull face normals and the hull principal axes. */
+Bbox minVolumeBox(const std::vector<float> &hullPoints,
+                  const std::vector<uint32_t> &faces) {
+    const size_t count = hullPoints.size() / 3;
+    std::vector<Point3> points(count);
+    for (size_t i = 0; i < count; i++)
+        points[i] = {hullPoints[3 * i], hullPoints[3 * i + 1],
+                     hullPoints[3 * i + 2]};
+
+    Bbox best;
+    best.obbFromPointSet(hullPoints.data(), count);
+    double bestVolume = boxVolume(best);
+    Vector bestAxes[3] = {best.axis[0], best.axis[1], best.axis[2]};
+
+    std::vector<Point2> plane;
+    for (size_t f = 0; f + 2 < faces.size(); f += 3) {
+        const Point3 &a = points[faces[f]], &b = points[faces[f + 1]],
+                     &c = points[faces[f + 2]];
+        Point3 normal = cross3({b[0] - a[0], b[1] - a[1], b[2] - a[2]},
+                               {c[0] - a[0], c[1] - a[1], c[2] - a[2]});
+        if (!normalize3(normal))
+            continue;
+        // in-plane basis from the world axis least aligned with the normal
+        Point3 helper = {0, 0, 0};
+        int smallest = 0;
+        for (int k = 1; k < 3; k++)
+            if (std::fabs(normal[k]) < std::fabs(normal[smallest]))
+                smallest = k;
+        helper[smallest] = 1;
+        Point3 u = cross3(normal, helper);
+        normalize3(u);
+        const Point3 v = cross3(normal, u);
+
+        double low = std::numeric_limits<double>::infinity(), high = -low;
+        plane.resize(count);
+        for (size_t i = 0; i < count; i++) {
+            plane[i] = {dot3(points[i], u), dot3(points[i], v)};
+            const double h = dot3(points[i], normal);
+            low = std::min(low, h);
+            high = std::max(high, h);
+        }
+        Point2 dir;
+        const double volume =
+            minAreaRectangle(convexHull2d(plane), dir) * (high - low);
+        if (volume < bestVolume) {
+            bestVolume = volume;
+            const Point3 side = {dir[0] * u[0] + dir[1] * v[0],
+                                 dir[0] * u[1] + dir[1] * v[1],
+                                 dir[0] * u[2] + dir[1] * v[2]};
+            const Point3 other = cross3(normal, side);
+            bestAxes[0] =
+                Vector(float(side[0]), float(side[1]), float(side[2]));
+            bestAxes[1] =
+                Vector(float(other[0]), float(other[1]), float(other[2]));
+            bestAxes[2] =
+                Vector(float(normal[0]), float(normal[1]), float(normal[2]));
+        }
+    }
+    fitSorted(best, bestAxes, hullPoints.data(), count);
+    return best;
+}
+
+} // namespace
+
+Bbox orientedBox(const float *points, size_t count, ObbMethod method) {
+    Bbox box;
+    if (method == ObbMethod::Covariance || count < 4) {
+        box.obbFromPointSet(points, count);
+        return box;
+    }
+    std::vector<uint32_t> faces;
+    try {
+        faces = quickhull(points, count);
+    } catch (const std::runtime_error &) {
+        // coplanar or collinear: the hull has no volume to fit
+        box.obbFromPointSet(points, count);
+        return box;
+    }
+    // hull vertices as a compact buffer, faces renumbered into it
+    std::vector<uint32_t> slot(count, UINT32_MAX);
+    std::vector<float> hullPoints;
+    for (uint32_t &v : faces) {
+        if (slot[v] == UINT32_MAX) {
+            slot[v] = static_cast<uint32_t>(hullPoints.size() / 3);
+            hullPoints.insert(hullPoints.end(), points + 3 * size_t(v),
+                              points + 3 * size_t(v) + 3);
+        }
+        v = slot[v];
+    }
+    if (method == ObbMethod::HullCovariance) {
+        box.obbFromPointSet(hullPoints.data(), hullPoints.size() / 3);
+        return box;
+    }
+    return minVolumeBox(hullPoints, faces);
+}
+
+void orientedBoxes(const float *points, const uint32_t *offsets,
+                   size_t rangeCount, ObbMethod method, float *out,
+                   unsigned threads) {
+    Geometry::parallelFor(
+        rangeCount, threads,
+        [&](size_t begin, size_t end) {
+            for (size_t r = begin; r < end; r++) {
+                const Bbox box =
+                    orientedBox(points + 3 * size_t(offsets[r]),
+                                offsets[r + 1] - offsets[r], method);
+                const Vector fields[6] = {box.min,     box.max,
+                                          box.center,  box.axis[0],
+                                          box.axis[1], box.axis[2]};
+                float *o = out + 18 * r;
+                for (int i = 0; i < 6; i++) {
+                    o[3 * i] = fields[i].x;
+                    o[3 * i + 1] = fields[i].y;
+                    o[3 * i + 2] = fields[i].z;
+                }
+            }
+        },
+        kBoxesPerThread);
+}
+
+} // namespace Chull
+} // namespace meshTools
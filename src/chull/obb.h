@@ -0,0 +1,59 @@
+/**
+ * @file obb.h
+ * @brief Oriented bounding boxes fitted to a point set or its convex hull
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <geometry/bbox.h>
+
+namespace meshTools {
+namespace Chull {
+
+/** How orientedBox() chooses the box axes. */
+enum class ObbMethod {
+    /** Principal axes of all points (Bbox::obbFromPointSet). */
+    Covariance,
+    /** Principal axes of the convex hull vertices only, so interior point
+     * density does not tilt the box. */
+    HullCovariance,
+    /** Smallest box over candidate frames: for every hull face normal the
+     * projected hull gets its minimum-area rectangle (rotating calipers);
+     * the hull principal axes are a candidate too. */
+    MinVolume,
+};
+
+/**
+ * @brief Oriented bounding box of a point set.
+ *
+ * Hull methods fall back to Covariance when the points are coplanar,
+ * collinear or fewer than 4. Axes are ordered by decreasing box extent for
+ * MinVolume and by decreasing variance otherwise; the frame is always
+ * right-handed. Fields follow Bbox::fitToAxes.
+ * @param points Row-major (count, 3) coordinates.
+ * @param count Number of points.
+ * @param method Axis selection.
+ */
+Geometry::Bbox orientedBox(const float *points, size_t count, ObbMethod method);
+
+/**
+ * @brief Oriented bounding boxes of many point ranges at once.
+ *
+ * Range r covers points offsets[r] to offsets[r + 1]. Offsets must be
+ * non-decreasing and within the point buffer.
+ * @param points Row-major (pointCount, 3) coordinates.
+ * @param offsets rangeCount + 1 offsets into points.
+ * @param rangeCount Number of ranges.
+ * @param method Axis selection.
+ * @param out rangeCount * 18 floats: min, max, center, axis[0], axis[1],
+ * axis[2] (3 floats each) per range.
+ * @param threads Worker threads; 0 uses the hardware concurrency.
+ */
+void orientedBoxes(const float *points, const uint32_t *offsets,
+                   size_t rangeCount, ObbMethod method, float *out,
+                   unsigned threads = 1);
+
+} // namespace Chull
+} // namespace meshTools
@@ -0,0 +1,431 @@
+/**
+ * @file quickhull.cpp
+ * @brief Implementation of 3D Quickhull
+ */
+
+#include <algorithm>
+#include <chull/quickhull.h>
+#include <cmath>
+#include <limits>
+#include <stdexcept>
+
+namespace meshTools {
+namespace Chull {
+
+namespace {
+
+constexpr uint32_t kNone = UINT32_MAX;
+
+struct Face {
+    uint32_t v[3];
+    uint32_t adj[3]; // neighbor across edge v[i] -> v[i + 1]
+    double n[3];     // unit outward normal
+    double d;        // plane offset, dot(n, p) == d on the plane
+    std::vector<uint32_t> conflict;
+    uint32_t far = kNone;
+    double farDist = 0.0;
+    uint32_t mark = 0;
+    bool alive = true;
+};
+
+class Builder {
+  public:
+    Builder(const float *points, const std::vector<uint32_t> &candidates)
+        : points_(points), candidates_(candidates) {}
+
+    /** Build the hull; returns false if the candidates are degenerate. */
+    bool build(const char **error);
+    std::vector<uint32_t> triangles() const;
+    /** Plane distance of point p above face f. */
+    double distance(uint32_t f, uint32_t p) const {
+        const Face &face = faces_[f];
+        const float *q = points_ + 3 * size_t(p);
+        return face.n[0] * q[0] + face.n[1] * q[1] + face.n[2] * q[2] - face.d;
+    }
+    double epsilon() const { return eps_; }
+    const std::vector<Face> &faces() const { return faces_; }
+
+  private:
+    const float *points_;
+    const std::vector<uint32_t> &candidates_;
+    double eps_ = 0.0;
+
+    // face arena
+    std::vector<Face> faces_;
+    std::vector<uint32_t> freeFaces_;
+    uint32_t stamp_ = 0;
+
+    // scratch buffers reused across expansions
+    std::vector<uint32_t> stack_;
+    std::vector<uint32_t> visible_;
+    std::vector<std::pair<uint32_t, int>> horizon_;
+    std::vector<uint32_t> created_;
+    std::vector<uint32_t> pending_;
+    std::vector<uint32_t> coneFace_; // new face starting at a horizon vertex
+
+    const float *point(uint32_t p) const { return points_ + 3 * size_t(p); }
+    uint32_t allocFace(uint32_t a, uint32_t b, uint32_t c);
+    bool initialSimplex(uint32_t simplex[4], const char **error) const;
+    void addConflict(uint32_t p, const std::vector<uint32_t> &faces);
+    void expand(uint32_t f);
+};
+
+uint32_t Builder::allocFace(uint32_t a, uint32_t b, uint32_t c) {
+    uint32_t f;
+    if (!freeFaces_.empty()) {
+        f = freeFaces_.back();
+        freeFaces_.pop_back();
+    } else {
+        f = static_cast<uint32_t>(faces_.size());
+        faces_.emplace_back();
+    }
+    Face &face = faces_[f];
+    face.v[0] = a;
+    face.v[1] = b;
+    face.v[2] = c;
+    face.adj[0] = face.adj[1] = face.adj[2] = kNone;
+    face.conflict.clear();
+    face.far = kNone;
+    face.farDist = 0.0;
+    face.mark = 0;
+    face.alive = true;
+
+    const float *pa = point(a), *pb = point(b), *pc = point(c);
+    double u[3], w[3];
+    for (int k = 0; k < 3; k++) {
+        u[k] = double(pb[k]) - pa[k];
+        w[k] = double(pc[k]) - pa[k];
+    }
+    double n[3] = {u[1] * w[2] - u[2] * w[1], u[2] * w[0] - u[0] * w[2],
+                   u[0] * w[1] - u[1] * w[0]};
+    double len = std::sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2]);
+    if (len > 0.0)
+        for (double &x : n)
+            x /= len;
+    for (int k = 0; k < 3; k++)
+        face.n[k] = n[k];
+    face.d = n[0] * pa[0] + n[1] * pa[1] + n[2] * pa[2];
+    return f;
+}
+
+bool Builder::initialSimplex(uint32_t simplex[4], const char **error) const {
+    // most distant pair among the axis extremes
+    uint32_t extreme[6];
+    std::fill(extreme, extreme + 6, candidates_[0]);
+    for (uint32_t p : candidates_) {
+        for (int k = 0; k < 3; k++) {
+            if (point(p)[k] < point(extreme[2 * k])[k])
+                extreme[2 * k] = p;
+            if (point(p)[k] > point(extreme[2 * k + 1])[k])
+                extreme[2 * k + 1] = p;
+        }
+    }
+    auto dist2 = [this](uint32_t a, uint32_t b) {
+        double s = 0.0;
+        for (int k = 0; k < 3; k++) {
+            double x = double(point(a)[k]) - point(b)[k];
+            s += x * x;
+        }
+        return s;
+    };
+    double best = 0.0;
+    for (int i = 0; i < 6; i++)
+        for (int j = i + 1; j < 6; j++)
+            if (dist2(extreme[i], extreme[j]) > best) {
+                best = dist2(extreme[i], extreme[j]);
+                simplex[0] = extreme[i];
+                simplex[1] = extreme[j];
+            }
+    if (best == 0.0) {
+        *error = "Quickhull: All points are collinear!";
+        return false;
+    }
+
+    // farthest from the line through the pair
+    const float *a = point(simplex[0]);
+    double dir[3];
+    for (int k = 0; k < 3; k++)
+        dir[k] = double(point(simplex[1])[k]) - a[k];
+    best = 0.0;
+    for (uint32_t p : candidates_) {
+        double w[3];
+        for (int k = 0; k < 3; k++)
+            w[k] = double(point(p)[k]) - a[k];
+        double c[3] = {dir[1] * w[2] - dir[2] * w[1],
+                       dir[2] * w[0] - dir[0] * w[2],
+                       dir[0] * w[1] - dir[1] * w[0]};
+        double s = c[0] * c[0] + c[1] * c[1] + c[2] * c[2];
+        if (s > best) {
+            best = s;
+            simplex[2] = p;
+        }
+    }
+    if (std::sqrt(best) <= eps_ * std::sqrt(dist2(simplex[0], simplex[1]))) {
+        *error = "Quickhull: All points are collinear!";
+        return false;
+    }
+
+    // farthest from the plane of the triangle
+    double u[3], w[3];
+    for (int k = 0; k < 3; k++)
+        w[k] = double(point(simplex[2])[k]) - a[k];
+    double n[3] = {dir[1] * w[2] - dir[2] * w[1], dir[2] * w[0] - dir[0] * w[2],
+                   dir[0] * w[1] - dir[1] * w[0]};
+    double len = std::sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2]);
+    best = 0.0;
+    for (uint32_t p : candidates_) {
+        for (int k = 0; k < 3; k++)
+            u[k] = double(point(p)[k]) - a[k];
+        double s = std::fabs(n[0] * u[0] + n[1] * u[1] + n[2] * u[2]) / len;
+        if (s > best) {
+            best = s;
+            simplex[3] = p;
+        }
+    }
+    if (best <= eps_) {
+        *error = "Quickhull: All points are coplanar!";
+        return false;
+    }
+    return true;
+}
+
+void Builder::addConflict(uint32_t p, const std::vector<uint32_t> &faces) {
+    for (uint32_t f : faces) {
+        double dist = distance(f, p);
+        if (dist > eps_) {
+            Face &face = faces_[f];
+            face.conflict.push_back(p);
+            if (dist > face.farDist) {
+                face.farDist = dist;
+                face.far = p;
+            }
+            return;
+        }
+    }
+    // on or inside the hull so far: never a hull vertex
+}
+
+void Builder::expand(uint32_t f) {
+    uint32_t eye = faces_[f].far;
+
+    // visible faces by DFS from f; the rest of their edges form the horizon
+    ++stamp_;
+    visible_.clear();
+    horizon_.clear();
+    stack_.clear();
+    faces_[f].mark = stamp_;
+    stack_.push_back(f);
+    while (!stack_.empty()) {
+        uint32_t t = stack_.back();
+        stack_.pop_back();
+        visible_.push_back(t);
+        for (int i = 0; i < 3; i++) {
+            uint32_t n = faces_[t].adj[i];
+            if (faces_[n].mark == stamp_)
+                continue;
+            if (distance(n, eye) > eps_) {
+                faces_[n].mark = stamp_;
+                stack_.push_back(n);
+            } else {
+                horizon_.emplace_back(t, i);
+            }
+        }
+    }
+
+    // cone from the eye over each horizon edge
+    created_.clear();
+    for (const auto &[t, i] : horizon_) {
+        uint32_t a = faces_[t].v[i];
+        uint32_t b = faces_[t].v[(i + 1) % 3];
+        uint32_t n = faces_[t].adj[i];
+        uint32_t nf = allocFace(a, b, eye);
+        faces_[nf].adj[0] = n;
+        for (int k = 0; k < 3; k++)
+            if (faces_[n].v[k] == b && faces_[n].v[(k + 1) % 3] == a)
+                faces_[n].adj[k] = nf;
+        coneFace_[a] = nf;
+        created_.push_back(nf);
+    }
+    // the horizon is a simple cycle: the face over (a, b) meets the face
+    // starting at b along the edge (b, eye)
+    for (uint32_t nf : created_) {
+        uint32_t next = coneFace_[faces_[nf].v[1]];
+        faces_[nf].adj[1] = next;
+        faces_[next].adj[2] = nf;
+    }
+
+    for (uint32_t t : visible_) {
+        pending_.swap(faces_[t].conflict);
+        for (uint32_t p : pending_)
+            if (p != eye)
+                addConflict(p, created_);
+        pending_.clear();
+        faces_[t].alive = false;
+        freeFaces_.push_back(t);
+    }
+}
+
+bool Builder::build(const char **error) {
+    double extent[3] = {0.0, 0.0, 0.0};
+    for (uint32_t p : candidates_)
+        for (int k = 0; k < 3; k++)
+            extent[k] = std::max(extent[k], double(std::fabs(point(p)[k])));
+    // tolerance of a plane distance for float input evaluated in double
+    eps_ = 3.0 * std::numeric_limits<double>::epsilon() *
+           (extent[0] + extent[1] + extent[2]);
+
+    uint32_t s[4];
+    if (!initialSimplex(s, error))
+        return false;
+    uint32_t maxId = *std::max_element(candidates_.begin(), candidates_.end());
+    coneFace_.assign(size_t(maxId) + 1, kNone);
+
+    // tetra faces, each with the remaining vertex behind it
+    uint32_t tri[4][3] = {{s[0], s[1], s[2]},
+                          {s[0], s[3], s[1]},
+                          {s[1], s[3], s[2]},
+                          {s[2], s[3], s[0]}};
+    const uint32_t opposite[4] = {s[3], s[2], s[0], s[1]};
+    std::vector<uint32_t> initial;
+    for (int i = 0; i < 4; i++) {
+        uint32_t f = allocFace(tri[i][0], tri[i][1], tri[i][2]);
+        if (distance(f, opposite[i]) > 0.0) {
+            std::swap(tri[i][1], tri[i][2]);
+            faces_[f].alive = false;
+            freeFaces_.push_back(f);
+            f = allocFace(tri[i][0], tri[i][1], tri[i][2]);
+        }
+        initial.push_back(f);
+    }
+    for (uint32_t f : initial)
+        for (int i = 0; i < 3; i++) {
+            uint32_t a = faces_[f].v[i], b = faces_[f].v[(i + 1) % 3];
+            for (uint32_t g : initial)
+                for (int k = 0; k < 3; k++)
+                    if (faces_[g].v[k] == b && faces_[g].v[(k + 1) % 3] == a)
+                        faces_[f].adj[i] = g;
+        }
+
+    for (uint32_t p : candidates_)
+        if (p != s[0] && p != s[1] && p != s[2] && p != s[3])
+            addConflict(p, initial);
+
+    std::vector<uint32_t> work;
+    for (uint32_t f : initial)
+        if (!faces_[f].conflict.empty())
+            work.push_back(f);
+    while (!work.empty()) {
+        uint32_t f = work.back();
+        work.pop_back();
+        if (!faces_[f].alive || faces_[f].conflict.empty())
+            continue;
+        expand(f);
+        for (uint32_t nf : created_)
+            if (!faces_[nf].conflict.empty())
+                work.push_back(nf);
+    }
+    return true;
+}
+
+std::vector<uint32_t> Builder::triangles() const {
+    std::vector<uint32_t> out;
+    for (const Face &face : faces_)
+        if (face.alive)
+            out.insert(out.end(), face.v, face.v + 3);
+    return out;
+}
+
+// directions for the Akl-Toussaint polytope: axes and cube diagonals
+constexpr int kDirections = 7;
+constexpr float kDirection[kDirections][3] = {{1, 0, 0}, {0, 1, 0},  {0, 0, 1},
+                                              {1, 1, 1}, {1, 1, -1}, {1, -1, 1},
+                                              {-1, 1, 1}};
+
+} // namespace
+
+std::vector<uint32_t> extremeFilter(const float *points, size_t count) {
+    std::vector<uint32_t> all(count);
+    for (size_t i = 0; i < count; i++)
+        all[i] = static_cast<uint32_t>(i);
+    if (count < 16)
+        return all;
+
+    std::vector<uint32_t> extreme(2 * kDirections, 0);
+    std::vector<float> lo(kDirections), hi(kDirections);
+    for (int k = 0; k < kDirections; k++) {
+        const float *c = kDirection[k];
+        lo[k] = hi[k] = c[0] * points[0] + c[1] * points[1] + c[2] * points[2];
+    }
+    for (size_t i = 1; i < count; i++) {
+        const float *p = points + 3 * i;
+        for (int k = 0; k < kDirections; k++) {
+            const float *c = kDirection[k];
+            float s = c[0] * p[0] + c[1] * p[1] + c[2] * p[2];
+            if (s < lo[k]) {
+                lo[k] = s;
+                extreme[2 * k] = static_cast<uint32_t>(i);
+            }
+            if (s > hi[k]) {
+                hi[k] = s;
+                extreme[2 * k + 1] = static_cast<uint32_t>(i);
+            }
+        }
+    }
+    std::sort(extreme.begin(), extreme.end());
+    extreme.erase(std::unique(extreme.begin(), extreme.end()), extreme.end());
+    if (extreme.size() < 4)
+        return all;
+
+    Builder polytope(points, extreme);
+    const char *error = nullptr;
+    if (!polytope.build(&error))
+        return all;
+    std::vector<uint32_t> planes;
+    for (uint32_t f = 0; f < polytope.faces().size(); f++)
+        if (polytope.faces()[f].alive)
+            planes.push_back(f);
+
+    // keep points above any face of the polytope, plus its vertices
+    std::vector<uint32_t> keep;
+    size_t e = 0;
+    for (size_t i = 0; i < count; i++) {
+        uint32_t p = static_cast<uint32_t>(i);
+        if (e < extreme.size() && extreme[e] == p) {
+            keep.push_back(p);
+            e++;
+            continue;
+        }
+        for (uint32_t f : planes) {
+            if (polytope.distance(f, p) > polytope.epsilon()) {
+                keep.push_back(p);
+                break;
+            }
+        }
+    }
+    return keep;
+}
+
+std::vector<uint32_t> quickhull(const float *points, size_t count) {
+    if (count < 3)
+        return {};
+    if (count == 3) {
+        double u[3], w[3];
+        for (int k = 0; k < 3; k++) {
+            u[k] = double(points[3 + k]) - points[k];
+            w[k] = double(points[6 + k]) - points[k];
+        }
+        if (u[1] * w[2] == u[2] * w[1] && u[2] * w[0] == u[0] * w[2] &&
+            u[0] * w[1] == u[1] * w[0])
+            throw std::runtime_error("Quickhull: All points are collinear!");
+        return {0, 1, 2};
+    }
+    std::vector<uint32_t> candidates = extremeFilter(points, count);
+    Builder builder(points, candidates);
+    const char *error = nullptr;
+    if (!builder.build(&error))
+        throw std::runtime_error(error);
+    return builder.triangles();
+}
+
+} // namespace Chull
+} // namespace meshTools
@@ -0,0 +1,46 @@
+/**
+ * @file quickhull.h
+ * @brief 3D convex hull via Quickhull with conflict lists
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace meshTools {
+namespace Chull {
+
+/**
+ * @brief Akl-Toussaint pre-filter for convex hull candidates.
+ *
+ * Takes the extreme points along the 3 axes and 4 cube diagonals (both
+ * directions), hulls them, and drops every point on or inside that
+ * polytope. Hull vertices are never dropped.
+ * @param points Row-major (count, 3) coordinates.
+ * @param count Number of points.
+ * @return Ascending indices of the remaining candidates; all indices if the
+ * extreme points are degenerate.
+ */
+std::vector<uint32_t> extremeFilter(const float *points, size_t count);
+
+/**
+ * @brief Convex hull of a point set with Quickhull.
+ *
+ * Each hull face keeps a conflict list of the points above it. A face with
+ * a non-empty list is expanded at its farthest point: the faces visible
+ * from that point are replaced by a cone over their horizon, and their
+ * conflict points are redistributed to the new faces. Faces live in one
+ * array with freed slots reused. Candidates are first reduced with
+ * extremeFilter().
+ * @param points Row-major (count, 3) coordinates.
+ * @param count Number of points.
+ * @return Triangles as 3 indices into points each, counterclockwise when
+ * seen from outside.
+ * @throws std::runtime_error if all points are collinear or coplanar.
+ */
+std::vector<uint32_t> quickhull(const float *points, size_t count);
+
+} // namespace Chull
+} // namespace meshTools
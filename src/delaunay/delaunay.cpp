@@ -3,9 +3,11 @@
  * @brief Implementation of 3D Delaunay tetrahedralization
  */
 
+#include <algorithm>
 #include <cmath>
 #include <delaunay/delaunay.h>
 #include <geometry/vector.h>
+#include <random>
 
 namespace meshTools {
 namespace Delaunay {
@@ -18,6 +20,16 @@ float det3(const float a[3][3]) {
            a[0][2] * (a[1][0] * a[2][1] - a[1][1] * a[2][0]);
 }
 
+// Rounds smaller than this are inserted in one Hilbert-sorted batch.
+constexpr size_t kMinRound = 1024;
+constexpr int kHilbertBits = 21;
+
+uint64_t edgeKey(uint32_t a, uint32_t b) {
+    if (a > b)
+        std::swap(a, b);
+    return (uint64_t(a) << 32) | b;
+}
+
 } // namespace
 
 float det4(const float m[4][4]) {
@@ -37,171 +49,429 @@ float det4(const float m[4][4]) {
            m[3][0] * det3(s4);
 }
 
-void Delaunay::calculateCircumsphere(
-    Tetra &t, const std::vector<Geometry::Vector> &verts) {
-    const Geometry::Vector &v0 = verts[t.v[0]];
-    const Geometry::Vector &v1 = verts[t.v[1]];
-    const Geometry::Vector &v2 = verts[t.v[2]];
-    const Geometry::Vector &v3 = verts[t.v[3]];
-    float v0_len = v0.x * v0.x + v0.y * v0.y + v0.z * v0.z;
-    float v1_len = v1.x * v1.x + v1.y * v1.y + v1.z * v1.z;
-    float v2_len = v2.x * v2.x + v2.y * v2.y + v2.z * v2.z;
-    float v3_len = v3.x * v3.x + v3.y * v3.y + v3.z * v3.z;
-    float a = 2.f * t.determinant;
-    float m0[4][4] = {{v0_len, v0.y, v0.z, 1.f},
-                      {v1_len, v1.y, v1.z, 1.f},
-                      {v2_len, v2.y, v2.z, 1.f},
-                      {v3_len, v3.y, v3.z, 1.f}};
-    float m1[4][4] = {{v0_len, v0.x, v0.z, 1.f},
-                      {v1_len, v1.x, v1.z, 1.f},
-                      {v2_len, v2.x, v2.z, 1.f},
-                      {v3_len, v3.x, v3.z, 1.f}};
-    float m2[4][4] = {{v0_len, v0.x, v0.y, 1.f},
-                      {v1_len, v1.x, v1.y, 1.f},
-                      {v2_len, v2.x, v2.y, 1.f},
-                      {v3_len, v3.x, v3.y, 1.f}};
-    float d0 = det4(m0);
-    float d1 = -det4(m1);
-    float d2 = det4(m2);
-    t.circumcenter.x = d0 / a;
-    t.circumcenter.y = d1 / a;
-    t.circumcenter.z = d2 / a;
-    Geometry::Vector diff = t.circumcenter - v0;
-    t.circumradius =
-        std::sqrt(diff.x * diff.x + diff.y * diff.y + diff.z * diff.z);
-}
-
-void Delaunay::addTetrahedra(size_t vIndex, size_t tetraIndex, int caseVal) {
-    if (caseVal != 0)
-        return;
-    const Tetra &t = tetras_[tetraIndex];
-    size_t v0 = t.v[0], v1 = t.v[1], v2 = t.v[2], v3 = t.v[3];
-    Tetra nt0, nt1, nt2, nt3;
-    nt0.v[0] = v0;
-    nt0.v[1] = v1;
-    nt0.v[2] = v2;
-    nt0.v[3] = vIndex;
-    nt1.v[0] = v0;
-    nt1.v[1] = v1;
-    nt1.v[2] = vIndex;
-    nt1.v[3] = v3;
-    nt2.v[0] = v0;
-    nt2.v[1] = vIndex;
-    nt2.v[2] = v2;
-    nt2.v[3] = v3;
-    nt3.v[0] = vIndex;
-    nt3.v[1] = v1;
-    nt3.v[2] = v2;
-    nt3.v[3] = v3;
-    float m0[4][4] = {
-        {vertices_[v0].x, vertices_[v0].y, vertices_[v0].z, 1.f},
-        {vertices_[v1].x, vertices_[v1].y, vertices_[v1].z, 1.f},
-        {vertices_[v2].x, vertices_[v2].y, vertices_[v2].z, 1.f},
-        {vertices_[vIndex].x, vertices_[vIndex].y, vertices_[vIndex].z, 1.f}};
-    float m1[4][4] = {
-        {vertices_[v0].x, vertices_[v0].y, vertices_[v0].z, 1.f},
-        {vertices_[v1].x, vertices_[v1].y, vertices_[v1].z, 1.f},
-        {vertices_[vIndex].x, vertices_[vIndex].y, vertices_[vIndex].z, 1.f},
-        {vertices_[v3].x, vertices_[v3].y, vertices_[v3].z, 1.f}};
-    float m2[4][4] = {
-        {vertices_[v0].x, vertices_[v0].y, vertices_[v0].z, 1.f},
-        {vertices_[vIndex].x, vertices_[vIndex].y, vertices_[vIndex].z, 1.f},
-        {vertices_[v2].x, vertices_[v2].y, vertices_[v2].z, 1.f},
-        {vertices_[v3].x, vertices_[v3].y, vertices_[v3].z, 1.f}};
-    float m3[4][4] = {
-        {vertices_[vIndex].x, vertices_[vIndex].y, vertices_[vIndex].z, 1.f},
-        {vertices_[v1].x, vertices_[v1].y, vertices_[v1].z, 1.f},
-        {vertices_[v2].x, vertices_[v2].y, vertices_[v2].z, 1.f},
-        {vertices_[v3].x, vertices_[v3].y, vertices_[v3].z, 1.f}};
-    nt0.determinant = det4(m0);
-    nt1.determinant = det4(m1);
-    nt2.determinant = det4(m2);
-    nt3.determinant = det4(m3);
-    calculateCircumsphere(nt0, vertices_);
-    calculateCircumsphere(nt1, vertices_);
-    calculateCircumsphere(nt2, vertices_);
-    calculateCircumsphere(nt3, vertices_);
-    nt0.parent = tetraIndex;
-    nt1.parent = tetraIndex;
-    nt2.parent = tetraIndex;
-    nt3.parent = tetraIndex;
-    tetras_.push_back(nt0);
-    tetras_.push_back(nt1);
-    tetras_.push_back(nt2);
-    tetras_.push_back(nt3);
-}
-
-void Delaunay::pointInTetrahedra(size_t vIndex, size_t tetraIndex) {
-    const Tetra &tetra = tetras_[tetraIndex];
-    size_t v0 = tetra.v[0], v1 = tetra.v[1], v2 = tetra.v[2], v3 = tetra.v[3];
-    float d = tetra.determinant;
-    const Geometry::Vector &pv = vertices_[vIndex];
-    const Geometry::Vector &p0 = vertices_[v0];
-    const Geometry::Vector &p1 = vertices_[v1];
-    const Geometry::Vector &p2 = vertices_[v2];
-    const Geometry::Vector &p3 = vertices_[v3];
-    float mat0[4][4] = {{pv.x, pv.y, pv.z, 1.f},
-                        {p1.x, p1.y, p1.z, 1.f},
-                        {p2.x, p2.y, p2.z, 1.f},
-                        {p3.x, p3.y, p3.z, 1.f}};
-    float mat1[4][4] = {{p0.x, p0.y, p0.z, 1.f},
-                        {pv.x, pv.y, pv.z, 1.f},
-                        {p2.x, p2.y, p2.z, 1.f},
-                        {p3.x, p3.y, p3.z, 1.f}};
-    float mat2[4][4] = {{p0.x, p0.y, p0.z, 1.f},
-                        {p1.x, p1.y, p1.z, 1.f},
-                        {pv.x, pv.y, pv.z, 1.f},
-                        {p3.x, p3.y, p3.z, 1.f}};
-    float mat3[4][4] = {{p0.x, p0.y, p0.z, 1.f},
-                        {p1.x, p1.y, p1.z, 1.f},
-                        {p2.x, p2.y, p2.z, 1.f},
-                        {pv.x, pv.y, pv.z, 1.f}};
-    float d0 = det4(mat0);
-    float d1 = det4(mat1);
-    float d2 = det4(mat2);
-    float d3 = det4(mat3);
-    if (d == 0.f) {
-        return;
+double orient3d(const double *a, const double *b, const double *c,
+                const double *d) {
+    double adx = a[0] - d[0], ady = a[1] - d[1], adz = a[2] - d[2];
+    double bdx = b[0] - d[0], bdy = b[1] - d[1], bdz = b[2] - d[2];
+    double cdx = c[0] - d[0], cdy = c[1] - d[1], cdz = c[2] - d[2];
+    return adx * (bdy * cdz - bdz * cdy) + bdx * (cdy * adz - cdz * ady) +
+           cdx * (ady * bdz - adz * bdy);
+}
+
+double insphere(const double *a, const double *b, const double *c,
+                const double *d, const double *e) {
+    double aex = a[0] - e[0], aey = a[1] - e[1], aez = a[2] - e[2];
+    double bex = b[0] - e[0], bey = b[1] - e[1], bez = b[2] - e[2];
+    double cex = c[0] - e[0], cey = c[1] - e[1], cez = c[2] - e[2];
+    double dex = d[0] - e[0], dey = d[1] - e[1], dez = d[2] - e[2];
+    double ab = aex * bey - bex * aey;
+    double bc = bex * cey - cex * bey;
+    double cd = cex * dey - dex * cey;
+    double da = dex * aey - aex * dey;
+    double ac = aex * cey - cex * aey;
+    double bd = bex * dey - dex * bey;
+    double abc = aez * bc - bez * ac + cez * ab;
+    double bcd = bez * cd - cez * bd + dez * bc;
+    double cda = cez * da + dez * ac + aez * cd;
+    double dab = dez * ab + aez * bd + bez * da;
+    double alift = aex * aex + aey * aey + aez * aez;
+    double blift = bex * bex + bey * bey + bez * bez;
+    double clift = cex * cex + cey * cey + cez * cez;
+    double dlift = dex * dex + dey * dey + dez * dez;
+    return (dlift * abc - clift * dab) + (blift * cda - alift * bcd);
+}
+
+uint64_t hilbertIndex(uint32_t x, uint32_t y, uint32_t z, int bits) {
+    // Skilling, "Programming the Hilbert curve" (2004): axes -> transpose
+    uint32_t X[3] = {x, y, z};
+    uint32_t M = 1u << (bits - 1);
+    for (uint32_t Q = M; Q > 1; Q >>= 1) {
+        uint32_t P = Q - 1;
+        for (int i = 0; i < 3; i++) {
+            if (X[i] & Q) {
+                X[0] ^= P;
+            } else {
+                uint32_t t = (X[0] ^ X[i]) & P;
+                X[0] ^= t;
+                X[i] ^= t;
+            }
+        }
+    }
+    for (int i = 1; i < 3; i++)
+        X[i] ^= X[i - 1];
+    uint32_t t = 0;
+    for (uint32_t Q = M; Q > 1; Q >>= 1)
+        if (X[2] & Q)
+            t ^= Q - 1;
+    for (int i = 0; i < 3; i++)
+        X[i] ^= t;
+    uint64_t key = 0;
+    for (int b = bits - 1; b >= 0; b--)
+        for (int i = 0; i < 3; i++)
+            key = (key << 1) | ((X[i] >> b) & 1u);
+    return key;
+}
+
+std::vector<uint32_t> brioOrder(const float *points, size_t count) {
+    std::vector<uint32_t> order(count);
+    for (size_t i = 0; i < count; i++)
+        order[i] = static_cast<uint32_t>(i);
+    if (count == 0)
+        return order;
+
+    // Fisher-Yates with a fixed seed keeps the order reproducible
+    std::mt19937 rng(0x5eed);
+    for (size_t i = count - 1; i > 0; i--)
+        std::swap(order[i], order[rng() % (i + 1)]);
+
+    float lo[3] = {points[0], points[1], points[2]};
+    float hi[3] = {points[0], points[1], points[2]};
+    for (size_t i = 1; i < count; i++)
+        for (int k = 0; k < 3; k++) {
+            lo[k] = std::min(lo[k], points[3 * i + k]);
+            hi[k] = std::max(hi[k], points[3 * i + k]);
+        }
+    double extent = 0.0;
+    for (int k = 0; k < 3; k++)
+        extent = std::max(extent, double(hi[k]) - lo[k]);
+    double scale = extent > 0.0 ? ((1u << kHilbertBits) - 1) / extent : 0.0;
+    std::vector<uint64_t> keys(count);
+    for (size_t i = 0; i < count; i++) {
+        uint32_t q[3];
+        for (int k = 0; k < 3; k++)
+            q[k] = static_cast<uint32_t>((points[3 * i + k] - lo[k]) * scale);
+        keys[i] = hilbertIndex(q[0], q[1], q[2], kHilbertBits);
+    }
+
+    size_t end = count;
+    while (end > 0) {
+        size_t start = end <= kMinRound ? 0 : end / 2;
+        std::sort(order.begin() + start, order.begin() + end,
+                  [&](uint32_t a, uint32_t b) { return keys[a] < keys[b]; });
+        end = start;
+    }
+    return order;
+}
+
+Delaunay::Delaunay(const std::vector<Geometry::Vector> &vertices, float)
+    : origVertices_(vertices) {
+    build();
+}
+
+Delaunay::Delaunay(const float *points, size_t count) {
+    origVertices_.reserve(count);
+    for (size_t i = 0; i < count; i++)
+        origVertices_.emplace_back(points[3 * i], points[3 * i + 1],
+                                   points[3 * i + 2]);
+    build();
+}
+
+uint32_t Delaunay::allocTetra() {
+    if (!freeTetras_.empty()) {
+        uint32_t t = freeTetras_.back();
+        freeTetras_.pop_back();
+        tetMark_[t] = 0;
+        return t;
     }
-    if ((d > 0.f && d0 > 0.f && d1 > 0.f && d2 > 0.f && d3 > 0.f) ||
-        (d < 0.f && d0 < 0.f && d1 < 0.f && d2 < 0.f && d3 < 0.f)) {
-        addTetrahedra(vIndex, tetraIndex, 0);
-    }
-}
-
-Delaunay::Delaunay(const std::vector<Geometry::Vector> &vertices,
-                   float maxVal) {
-    origVertices_ = vertices;
-    float k = 3.f * maxVal;
-    vertices_.push_back(Geometry::Vector(k, 0.f, 0.f));
-    vertices_.push_back(Geometry::Vector(-k, k, 0.f));
-    vertices_.push_back(Geometry::Vector(0.f, 0.f, k));
-    vertices_.push_back(Geometry::Vector(0.f, -2.f * k, 0.f));
-    Tetra t0;
-    t0.v[0] = 0;
-    t0.v[1] = 1;
-    t0.v[2] = 2;
-    t0.v[3] = 3;
-    float m[4][4] = {{vertices_[0].x, vertices_[0].y, vertices_[0].z, 1.f},
-                     {vertices_[1].x, vertices_[1].y, vertices_[1].z, 1.f},
-                     {vertices_[2].x, vertices_[2].y, vertices_[2].z, 1.f},
-                     {vertices_[3].x, vertices_[3].y, vertices_[3].z, 1.f}};
-    t0.determinant = det4(m);
-    calculateCircumsphere(t0, vertices_);
-    t0.parent = 0;
-    tetras_.push_back(t0);
-    for (const auto &vert : origVertices_) {
-        vertices_.push_back(vert);
-        size_t vi = vertices_.size() - 1;
-        pointInTetrahedra(vi, 0);
+    uint32_t t = static_cast<uint32_t>(tetMark_.size());
+    tetVerts_.resize(tetVerts_.size() + 4);
+    tetAdj_.resize(tetAdj_.size() + 4);
+    tetMark_.push_back(0);
+    return t;
+}
+
+int Delaunay::infiniteSlot(uint32_t t) const {
+    const uint32_t *tv = &tetVerts_[4 * size_t(t)];
+    for (int k = 0; k < 4; k++)
+        if (tv[k] == kInfiniteVertex)
+            return k;
+    return -1;
+}
+
+double Delaunay::orientWith(uint32_t t, int slot, const double *p) const {
+    const uint32_t *tv = &tetVerts_[4 * size_t(t)];
+    const double *q[4];
+    for (int k = 0; k < 4; k++)
+        q[k] = k == slot ? p : coord(tv[k]);
+    return orient3d(q[0], q[1], q[2], q[3]);
+}
+
+bool Delaunay::inConflict(uint32_t t, const double *p) const {
+    int slot = infiniteSlot(t);
+    if (slot < 0) {
+        const uint32_t *tv = &tetVerts_[4 * size_t(t)];
+        return insphere(coord(tv[0]), coord(tv[1]), coord(tv[2]), coord(tv[3]),
+                        p) > 0.0;
+    }
+    // A ghost tetra conflicts with points beyond its hull face, and with
+    // points in the face plane inside the face's circumcircle, i.e. inside
+    // the circumsphere of the finite tetra behind the face.
+    double o = orientWith(t, slot, p);
+    if (o != 0.0)
+        return o > 0.0;
+    return inConflict(tetAdj_[4 * size_t(t) + slot], p);
+}
+
+uint32_t Delaunay::locate(uint32_t v) const {
+    const double *p = coord(v);
+    uint32_t t = lastTetra_;
+    // The visibility walk terminates on Delaunay meshes; the rotating start
+    // face and the step limit guard against round-off cycles.
+    size_t limit = tetMark_.size() + 16;
+    for (size_t step = 0; step < limit; step++) {
+        int slot = infiniteSlot(t);
+        if (slot >= 0) {
+            // entered through the hull face: p lies beyond it
+            if (orientWith(t, slot, p) > 0.0)
+                return t;
+            t = tetAdj_[4 * size_t(t) + slot];
+            continue;
+        }
+        uint32_t next = t;
+        for (int k = 0; k < 4; k++) {
+            int i = (k + int(step)) & 3;
+            if (orientWith(t, i, p) < 0.0) {
+                next = tetAdj_[4 * size_t(t) + i];
+                break;
+            }
+        }
+        if (next == t)
+            return t;
+        t = next;
     }
+    return kNoTetra;
+}
+
+void Delaunay::linkFaces(uint32_t apex) {
+    // Faces of the new tetras that contain apex are shared pairwise; two
+    // such faces match when their other two vertices do.
+    links_.clear();
+    for (uint32_t nt : created_) {
+        const uint32_t *ntv = &tetVerts_[4 * size_t(nt)];
+        for (int k = 0; k < 4; k++) {
+            if (ntv[k] == apex)
+                continue;
+            uint32_t e[2];
+            int m = 0;
+            for (int j = 0; j < 4; j++)
+                if (j != k && ntv[j] != apex)
+                    e[m++] = ntv[j];
+            links_.push_back({edgeKey(e[0], e[1]), nt, uint32_t(k)});
+        }
+    }
+    std::sort(
+        links_.begin(), links_.end(),
+        [](const FaceLink &a, const FaceLink &b) { return a.edge < b.edge; });
+    for (size_t i = 0; i + 1 < links_.size(); i += 2) {
+        const FaceLink &a = links_[i];
+        const FaceLink &b = links_[i + 1];
+        tetAdj_[4 * size_t(a.tetra) + a.face] = b.tetra;
+        tetAdj_[4 * size_t(b.tetra) + b.face] = a.tetra;
+    }
+}
+
+bool Delaunay::insert(uint32_t v, uint32_t stamp) {
+    uint32_t start = locate(v);
+    if (start == kNoTetra)
+        return false;
+    const double *p = coord(v);
+    for (int i = 0; i < 4; i++) {
+        uint32_t w = tetVerts_[4 * size_t(start) + i];
+        if (w == kInfiniteVertex)
+            continue;
+        const double *q = coord(w);
+        if (q[0] == p[0] && q[1] == p[1] && q[2] == p[2])
+            return false;
+    }
+
+    // grow the cavity of tetras whose circumsphere contains p
+    cavity_.clear();
+    stack_.clear();
+    tetMark_[start] = stamp;
+    cavity_.push_back(start);
+    stack_.push_back(start);
+    while (!stack_.empty()) {
+        uint32_t t = stack_.back();
+        stack_.pop_back();
+        for (int i = 0; i < 4; i++) {
+            uint32_t n = tetAdj_[4 * size_t(t) + i];
+            if (tetMark_[n] == stamp)
+                continue;
+            if (inConflict(n, p)) {
+                tetMark_[n] = stamp;
+                cavity_.push_back(n);
+                stack_.push_back(n);
+            }
+        }
+    }
+
+    // connect each boundary face of the cavity to p
+    created_.clear();
+    for (uint32_t t : cavity_) {
+        for (int i = 0; i < 4; i++) {
+            uint32_t n = tetAdj_[4 * size_t(t) + i];
+            if (tetMark_[n] == stamp)
+                continue;
+            uint32_t nt = allocTetra();
+            uint32_t *ntv = &tetVerts_[4 * size_t(nt)];
+            uint32_t *nta = &tetAdj_[4 * size_t(nt)];
+            for (int k = 0; k < 4; k++) {
+                ntv[k] = tetVerts_[4 * size_t(t) + k];
+                nta[k] = kNoTetra;
+            }
+            // p is on the same side of the face as the vertex it replaces,
+            // so the orientation is preserved
+            ntv[i] = v;
+            nta[i] = n;
+            for (int k = 0; k < 4; k++)
+                if (tetAdj_[4 * size_t(n) + k] == t)
+                    tetAdj_[4 * size_t(n) + k] = nt;
+            created_.push_back(nt);
+        }
+    }
+    linkFaces(v);
+
+    for (uint32_t t : cavity_) {
+        tetMark_[t] = kNoTetra;
+        freeTetras_.push_back(t);
+    }
+    for (uint32_t nt : created_) {
+        if (infiniteSlot(nt) < 0) {
+            lastTetra_ = nt;
+            break;
+        }
+    }
+    return true;
+}
+
+bool Delaunay::seed(std::vector<uint32_t> &order) {
+    // first four affinely independent points, in insertion order
+    size_t found[4] = {0, 0, 0, 0};
+    size_t n = 1;
+    const double *p0 = coord(order[0]);
+    for (size_t i = 1; i < order.size() && n < 4; i++) {
+        const double *p = coord(order[i]);
+        bool independent = false;
+        if (n == 1) {
+            independent = p[0] != p0[0] || p[1] != p0[1] || p[2] != p0[2];
+        } else if (n == 2) {
+            const double *p1 = coord(order[found[1]]);
+            double u[3], w[3];
+            for (int k = 0; k < 3; k++) {
+                u[k] = p1[k] - p0[k];
+                w[k] = p[k] - p0[k];
+            }
+            independent = u[1] * w[2] - u[2] * w[1] != 0.0 ||
+                          u[2] * w[0] - u[0] * w[2] != 0.0 ||
+                          u[0] * w[1] - u[1] * w[0] != 0.0;
+        } else {
+            independent = orient3d(p0, coord(order[found[1]]),
+                                   coord(order[found[2]]), p) != 0.0;
+        }
+        if (independent)
+            found[n++] = i;
+    }
+    if (n < 4)
+        return false;
+
+    uint32_t tv[4];
+    for (int k = 0; k < 4; k++)
+        tv[k] = order[found[k]];
+    for (int k = 3; k > 0; k--)
+        order.erase(order.begin() + found[k]);
+    order.erase(order.begin());
+    if (orient3d(coord(tv[0]), coord(tv[1]), coord(tv[2]), coord(tv[3])) < 0.0)
+        std::swap(tv[2], tv[3]);
+
+    uint32_t root = allocTetra();
+    created_.clear();
+    for (int i = 0; i < 4; i++) {
+        // Ghost tetra over the face opposite vertex i. With the infinite
+        // vertex in slot i the tetra is flipped (two slots swapped) so that
+        // putting any point beyond the face in that slot is positive.
+        uint32_t g = allocTetra();
+        uint32_t *gv = &tetVerts_[4 * size_t(g)];
+        for (int k = 0; k < 4; k++) {
+            gv[k] = tv[k];
+            tetAdj_[4 * size_t(g) + k] = kNoTetra;
+        }
+        gv[i] = kInfiniteVertex;
+        int a = (i + 1) & 3, b = (i + 2) & 3;
+        std::swap(gv[a], gv[b]);
+        tetAdj_[4 * size_t(g) + i] = root;
+        tetAdj_[4 * size_t(root) + i] = g;
+        created_.push_back(g);
+    }
+    for (int k = 0; k < 4; k++)
+        tetVerts_[4 * size_t(root) + k] = tv[k];
+    linkFaces(kInfiniteVertex);
+    lastTetra_ = root;
+    return true;
+}
+
+void Delaunay::build() {
+    size_t count = origVertices_.size();
+    std::vector<float> flat;
+    flat.reserve(3 * count);
+    coords_.reserve(3 * count);
+    for (const auto &p : origVertices_) {
+        float xyz[3] = {p.x, p.y, p.z};
+        for (int k = 0; k < 3; k++) {
+            flat.push_back(xyz[k]);
+            coords_.push_back(xyz[k]);
+        }
+    }
+
+    // about 6.5 tetras per point for uniform samples, plus ghosts
+    size_t estimate = 7 * count + 8;
+    tetVerts_.reserve(4 * estimate);
+    tetAdj_.reserve(4 * estimate);
+    tetMark_.reserve(estimate);
+
+    std::vector<uint32_t> order = brioOrder(flat.data(), count);
+    if (count < 4 || !seed(order))
+        return;
+    uint32_t stamp = 1;
+    for (uint32_t i : order) {
+        if (!insert(i, stamp++))
+            duplicates_++;
+    }
+}
+
+bool Delaunay::isFinite(size_t t) const {
+    return tetMark_[t] != kNoTetra && infiniteSlot(uint32_t(t)) < 0;
+}
+
+size_t Delaunay::tetraCount() const {
+    size_t n = 0;
+    for (size_t t = 0; t < tetMark_.size(); t++)
+        n += isFinite(t);
+    return n;
 }
 
 std::vector<std::vector<int>> Delaunay::getTetras() const {
     std::vector<std::vector<int>> out;
-    for (const auto &t : tetras_) {
-        out.push_back({static_cast<int>(t.v[0]), static_cast<int>(t.v[1]),
-                       static_cast<int>(t.v[2]), static_cast<int>(t.v[3])});
+    out.reserve(tetraCount());
+    for (size_t t = 0; t < tetMark_.size(); t++) {
+        if (!isFinite(t))
+            continue;
+        const uint32_t *v = &tetVerts_[4 * t];
+        // swap the last two so the volume (b - a) . ((c - a) x (d - a)) is
+        // positive
+        out.push_back({static_cast<int>(v[0]), static_cast<int>(v[1]),
+                       static_cast<int>(v[3]), static_cast<int>(v[2])});
+    }
+    return out;
+}
+
+std::vector<uint32_t> Delaunay::getTetraIndices() const {
+    std::vector<uint32_t> out;
+    out.reserve(4 * tetraCount());
+    for (size_t t = 0; t < tetMark_.size(); t++) {
+        if (!isFinite(t))
+            continue;
+        const uint32_t *v = &tetVerts_[4 * t];
+        out.insert(out.end(), {v[0], v[1], v[3], v[2]});
     }
     return out;
 }
@@ -1,10 +1,12 @@
 /**
  * @file delaunay.h
- * @brief 3D Delaunay tetrahedralization (incremental algorithm)
+ * @brief 3D Delaunay tetrahedralization (incremental Bowyer-Watson)
  */
 
 #pragma once
 
+#include <cstddef>
+#include <cstdint>
 #include <geometry/vector.h>
 #include <vector>
 
@@ -14,32 +16,75 @@ namespace Delaunay {
 /** Determinant of a 4x4 matrix (row-major, 4 rows of 4 floats). */
 float det4(const float m[4][4]);
 
+/** Marks a missing tetra (free slot, failed point location). */
+constexpr uint32_t kNoTetra = UINT32_MAX;
+
 /**
- * Tetrahedron with 4 vertex indices, determinant, circumcenter and
- * circumradius. Used internally during construction.
+ * @brief Orientation of (a, b, c, d) in double precision.
+ * @return Positive if d lies below the plane of a, b, c (a, b, c appear
+ * counterclockwise from above), negative if above, zero if coplanar.
  */
-struct Tetra {
-    size_t v[4];
-    float determinant = 0.f;
-    Geometry::Vector circumcenter;
-    float circumradius = 0.f;
-    std::vector<size_t> child;
-    size_t parent = 0; // index into tetras
-};
+double orient3d(const double *a, const double *b, const double *c,
+                const double *d);
+
+/**
+ * @brief In-sphere test in double precision.
+ * @return Positive if e lies inside the sphere through a, b, c, d when
+ * orient3d(a, b, c, d) > 0, negative if outside, zero if cospherical.
+ */
+double insphere(const double *a, const double *b, const double *c,
+                const double *d, const double *e);
+
+/**
+ * @brief Position of a point along a 3D Hilbert curve.
+ * @param x, y, z Grid coordinates in [0, 2^bits).
+ * @param bits Bits per axis (at most 21).
+ */
+uint64_t hilbertIndex(uint32_t x, uint32_t y, uint32_t z, int bits);
+
+/**
+ * @brief Biased randomized insertion order (BRIO).
+ *
+ * Points are shuffled with a fixed seed and split into rounds of doubling
+ * size (the last round holds half the points); each round is sorted along
+ * a Hilbert curve so consecutive insertions are spatially close.
+ * @param points Row-major (count, 3) coordinates.
+ * @param count Number of points.
+ * @return Permutation of [0, count).
+ */
+std::vector<uint32_t> brioOrder(const float *points, size_t count);
 
 /**
  * 3D Delaunay tetrahedralization built incrementally from a point set.
- * Starts from a bounding tetrahedron, inserts points, subdivides tetrahedra.
+ *
+ * Points are inserted in BRIO order with Bowyer-Watson: a visibility walk
+ * from the last created tetra locates the point, the cavity of tetras
+ * whose circumsphere contains it is removed, and the cavity boundary is
+ * connected to the point. Tetras live in flat arrays (4 vertex and 4
+ * neighbor indices each; neighbor i is across the face opposite vertex i)
+ * with freed slots reused, so insertion does no per-tetra allocation.
+ *
+ * The convex hull is closed by ghost tetras joining each hull face to a
+ * symbolic vertex at infinity instead of a large bounding tetrahedron, so
+ * hull faces do not depend on far-away coordinates.
  */
 class Delaunay {
   public:
     /**
      * Build Delaunay from point set.
      * @param vertices Input points
-     * @param maxVal Used to construct bounding tetrahedron (k = 3*maxVal)
+     * @param maxVal Unused; kept for compatibility (the bounding vertex is
+     *   symbolic)
      */
     Delaunay(const std::vector<Geometry::Vector> &vertices, float maxVal);
 
+    /**
+     * Build Delaunay from a flat point buffer.
+     * @param points Row-major (count, 3) coordinates
+     * @param count Number of points
+     */
+    Delaunay(const float *points, size_t count);
+
     Delaunay(const Delaunay &) = delete;
     Delaunay &operator=(const Delaunay &) = delete;
     Delaunay(Delaunay &&) = default;
@@ -49,22 +94,58 @@ class Delaunay {
     const std::vector<Geometry::Vector> &getOrigVertices() const {
         return origVertices_;
     }
-    /** All vertices (bounding + input). */
+    /** All vertices; same as getOrigVertices(). */
     const std::vector<Geometry::Vector> &getVertices() const {
-        return vertices_;
+        return origVertices_;
     }
-    /** Tetrahedra as 4-tuples of vertex indices. */
+    /**
+     * Tetrahedra as 4-tuples (a, b, c, d) of indices into getVertices(),
+     * ordered so that (b - a) . ((c - a) x (d - a)) is positive.
+     */
     std::vector<std::vector<int>> getTetras() const;
+    /** Same tetras as getTetras() as a flat array, 4 indices per tetra. */
+    std::vector<uint32_t> getTetraIndices() const;
+    /** Number of tetras returned by getTetras(). */
+    size_t tetraCount() const;
+    /** Number of input points skipped as duplicates. */
+    size_t duplicateCount() const { return duplicates_; }
 
   private:
+    static constexpr uint32_t kInfiniteVertex = UINT32_MAX;
+
     std::vector<Geometry::Vector> origVertices_;
-    std::vector<Geometry::Vector> vertices_;
-    std::vector<Tetra> tetras_;
+    std::vector<double> coords_; // 3 per vertex, for the predicates
+
+    // flat tetra store
+    std::vector<uint32_t> tetVerts_; // 4 per tetra
+    std::vector<uint32_t> tetAdj_;   // 4 per tetra
+    std::vector<uint32_t> tetMark_;  // cavity stamp, kNoTetra if free
+    std::vector<uint32_t> freeTetras_;
+    uint32_t lastTetra_ = 0;
+    size_t duplicates_ = 0;
+
+    // scratch buffers reused across insertions
+    std::vector<uint32_t> cavity_;
+    std::vector<uint32_t> stack_;
+    std::vector<uint32_t> created_;
+    struct FaceLink {
+        uint64_t edge; // sorted vertex pair of the face besides the new point
+        uint32_t tetra;
+        uint32_t face;
+    };
+    std::vector<FaceLink> links_;
 
-    void addTetrahedra(size_t vIndex, size_t tetraIndex, int caseVal);
-    void pointInTetrahedra(size_t vIndex, size_t tetraIndex);
-    static void
-    calculateCircumsphere(Tetra &t, const std::vector<Geometry::Vector> &verts);
+    void build();
+    bool seed(std::vector<uint32_t> &order);
+    const double *coord(uint32_t v) const { return &coords_[3 * size_t(v)]; }
+    uint32_t allocTetra();
+    int infiniteSlot(uint32_t t) const;
+    double orientWith(uint32_t t, int slot, const double *p) const;
+    bool inConflict(uint32_t t, const double *p) const;
+    uint32_t locate(uint32_t v) const;
+    void linkFaces(uint32_t apex);
+    bool insert(uint32_t v, uint32_t stamp);
+    bool isFinite(size_t t) const;
 };
 
 } // namespace Delaunay
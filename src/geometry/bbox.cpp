@@ -3,117 +3,137 @@
  * @brief Implementation of bounding box calculations
  */
 
+#include <algorithm>
 #include <geometry/bbox.h>
 #include <geometry/math.h>
+#include <geometry/parallel.h>
 #include <geometry/transform.h>
+#include <limits>
+#include <mutex>
 #include <vector>
 
 namespace meshTools {
 namespace Geometry {
 
-void Bbox::fromPointSet(const std::vector<Vector> &pointset) {
-    std::vector<Vector> sortedPointset;
-    sortedPointset = sortedVectorArray(pointset, 0);
-    min.x = sortedPointset.front().x;
-    max.x = sortedPointset.back().x;
-    sortedPointset = sortedVectorArray(pointset, 1);
-    min.y = sortedPointset.front().y;
-    max.y = sortedPointset.back().y;
-    sortedPointset = sortedVectorArray(pointset, 2);
-    min.z = sortedPointset.front().z;
-    max.z = sortedPointset.back().z;
-    calcCenter();
-}
+namespace {
 
-void Bbox::obbFromPointSet(const std::vector<Vector> &pointset) {
-    Vector means;
-    const size_t pointsetSize = pointset.size();
-    for (size_t i = 0; i < pointsetSize; i++) {
-        means += pointset[i];
-    }
-    means /= static_cast<float>(pointsetSize);
-    float m[3][3] = {{0, 0, 0}, {0, 0, 0}, {0, 0, 0}};
-    float mc[3][3];
-    float factor;
-    m[2][2] = 1;
-    for (int x = 0; x < 3; x++)
-        for (int y = 0; y < 3; y++) {
-            for (int i = 0; i < pointsetSize; i++) {
-                m[x][y] +=
-                    (means[x] - pointset[i][x]) * (means[y] - pointset[i][y]);
+constexpr size_t kLanes = 8; // points per block
+
+/**
+ * Fold count points into lo/hi. The block loop keeps 8 points' worth of
+ * running min/max (24 floats, i.e. lane k tracks axis k % 3) so it
+ * compiles to packed min/max instructions.
+ */
+void minMax(const float *p, size_t count, float lo[3], float hi[3]) {
+    size_t i = 0;
+    if (count >= kLanes) {
+        float blockLo[3 * kLanes], blockHi[3 * kLanes];
+        for (size_t k = 0; k < 3 * kLanes; k++)
+            blockLo[k] = blockHi[k] = p[k];
+        for (i = kLanes; i + kLanes <= count; i += kLanes) {
+            const float *q = p + 3 * i;
+            for (size_t k = 0; k < 3 * kLanes; k++) {
+                blockLo[k] = q[k] < blockLo[k] ? q[k] : blockLo[k];
+                blockHi[k] = q[k] > blockHi[k] ? q[k] : blockHi[k];
             }
-            m[x][y] /= pointsetSize;
         }
-    float a, b, c, d;
-    a = -1;
-    b = m[0][0] + m[1][1] + m[2][2];
-    c = -m[0][0] * m[1][1] - m[0][0] * m[2][2] - m[1][1] * m[2][2] +
-        m[0][1] * m[1][0] + m[1][2] * m[2][1] + m[0][2] * m[2][0];
-    d = m[0][0] * m[1][1] * m[2][2] - m[0][1] * m[1][0] * m[2][2] -
-        m[1][2] * m[2][1] * m[0][0] - m[0][2] * m[2][0] * m[1][1] +
-        m[0][1] * m[1][2] * m[2][0] + m[0][2] * m[1][0] * m[2][1];
-    const Vector roots = math::solveCubic(a, b, c, d);
-    for (int i = 0; i < 3; i++) {
-        memcpy(&mc, &m, sizeof(m));
-        mc[0][0] -= roots[i];
-        mc[1][1] -= roots[i];
-        mc[2][2] -= roots[i];
-
-        if (mc[0][0] == 0) {
-            std::swap(mc[0], mc[2]);
-        } else {
-            factor = mc[2][0] / mc[0][0];
-            mc[2][0] += -mc[0][0] * factor;
-            mc[2][1] += -mc[0][1] * factor;
-            mc[2][2] += -mc[0][2] * factor;
+        for (size_t k = 0; k < 3 * kLanes; k++) {
+            lo[k % 3] = std::min(lo[k % 3], blockLo[k]);
+            hi[k % 3] = std::max(hi[k % 3], blockHi[k]);
         }
-
-        if (mc[0][0] == 0) {
-            std::swap(mc[0], mc[1]);
-        } else {
-            factor = mc[1][0] / mc[0][0];
-            mc[1][0] += -mc[0][0] * factor;
-            mc[1][1] += -mc[0][1] * factor;
-            mc[1][2] += -mc[0][2] * factor;
+    }
+    for (; i < count; i++)
+        for (int a = 0; a < 3; a++) {
+            lo[a] = std::min(lo[a], p[3 * i + a]);
+            hi[a] = std::max(hi[a], p[3 * i + a]);
         }
+}
+
+} // namespace
+
+void Bbox::fromPointSet(const std::vector<Vector> &pointset, unsigned threads) {
+    fromPointSet(reinterpret_cast<const float *>(pointset.data()),
+                 pointset.size(), threads);
+}
 
-        if (mc[1][1] == 0) {
-            std::swap(mc[1], mc[2]);
-        } else {
-            factor = mc[2][1] / mc[1][1];
-            mc[2][0] += -mc[1][0] * factor;
-            mc[2][1] += -mc[1][1] * factor;
-            mc[2][2] += -mc[1][2] * factor;
+void Bbox::fromPointSet(const float *points, size_t count, unsigned threads) {
+    if (count == 0) {
+        min = max = center = Vector();
+        return;
+    }
+    float lo[3] = {points[0], points[1], points[2]};
+    float hi[3] = {points[0], points[1], points[2]};
+    std::mutex merge;
+    parallelFor(count, threads, [&](size_t begin, size_t end) {
+        const float *first = points + 3 * begin;
+        float chunkLo[3] = {first[0], first[1], first[2]};
+        float chunkHi[3] = {first[0], first[1], first[2]};
+        minMax(points + 3 * begin, end - begin, chunkLo, chunkHi);
+        std::lock_guard<std::mutex> lock(merge);
+        for (int a = 0; a < 3; a++) {
+            lo[a] = std::min(lo[a], chunkLo[a]);
+            hi[a] = std::max(hi[a], chunkHi[a]);
         }
+    });
+    min = Vector(lo[0], lo[1], lo[2]);
+    max = Vector(hi[0], hi[1], hi[2]);
+    calcCenter();
+}
+
+void Bbox::obbFromPointSet(const std::vector<Vector> &pointset) {
+    obbFromPointSet(reinterpret_cast<const float *>(pointset.data()),
+                    pointset.size());
+}
 
-        axis[i] = Vector(mc[0]).cross(Vector(mc[1])).normalize();
+void Bbox::obbFromPointSet(const float *points, size_t count) {
+    if (count == 0) {
+        min = max = center = Vector();
+        axis[0] = Vector(1, 0, 0);
+        axis[1] = Vector(0, 1, 0);
+        axis[2] = Vector(0, 0, 1);
+        return;
+    }
+    // sums relative to the first point, so large offsets do not cancel
+    double sum[3] = {0, 0, 0};
+    double sum2[3][3] = {{0, 0, 0}, {0, 0, 0}, {0, 0, 0}};
+    for (size_t i = 1; i < count; i++) {
+        const double d[3] = {double(points[3 * i]) - points[0],
+                             double(points[3 * i + 1]) - points[1],
+                             double(points[3 * i + 2]) - points[2]};
+        for (int x = 0; x < 3; x++) {
+            sum[x] += d[x];
+            for (int y = x; y < 3; y++)
+                sum2[x][y] += d[x] * d[y];
+        }
     }
-    axis[2] = axis[0].cross(axis[1]);
+    double cov[3][3];
+    for (int x = 0; x < 3; x++)
+        for (int y = x; y < 3; y++)
+            cov[x][y] = cov[y][x] =
+                sum2[x][y] / count - sum[x] * sum[y] / (double(count) * count);
 
-    min = Vector(0, 0, 0);
-    max = Vector(0, 0, 0);
-    for (size_t i = 0; i < pointsetSize; i++) {
+    double values[3], vectors[3][3];
+    math::symmetricEigen(cov, values, vectors);
+    for (int i = 0; i < 3; i++)
+        axis[i] = Vector(float(vectors[i][0]), float(vectors[i][1]),
+                         float(vectors[i][2]));
+    fitToAxes(points, count);
+}
 
-        const Vector &v =
-            Vector(axis[0].dot(pointset[i]), axis[1].dot(pointset[i]),
-                   axis[2].dot(pointset[i]));
-        if (i == 0) {
-            max = v;
-            min = v;
-            continue;
+void Bbox::fitToAxes(const float *points, size_t count) {
+    float lo[3], hi[3];
+    for (size_t i = 0; i < count; i++) {
+        const Vector p(points[3 * i], points[3 * i + 1], points[3 * i + 2]);
+        for (int a = 0; a < 3; a++) {
+            const float d = axis[a].dot(p);
+            lo[a] = i == 0 ? d : std::min(lo[a], d);
+            hi[a] = i == 0 ? d : std::max(hi[a], d);
         }
-        min.x = std::min(min.x, v.x);
-        min.y = std::min(min.y, v.y);
-        min.z = std::min(min.z, v.z);
-        max.x = std::max(max.x, v.x);
-        max.y = std::max(max.y, v.y);
-        max.z = std::max(max.z, v.z);
     }
-    center = (min + max) * 0.5;
-    const Vector &rt = Vector(axis[0].x, axis[1].x, axis[2].x);
-    const Vector &ru = Vector(axis[0].y, axis[1].y, axis[2].y);
-    const Vector &rf = Vector(axis[0].z, axis[1].z, axis[2].z);
-    center = Vector(center.dot(rt), center.dot(ru), center.dot(rf));
+    min = Vector(lo[0], lo[1], lo[2]);
+    max = Vector(hi[0], hi[1], hi[2]);
+    const Vector mid = (min + max) * 0.5;
+    center = axis[0] * mid.x + axis[1] * mid.y + axis[2] * mid.z;
 }
 
 void Bbox::calcCenter() {
@@ -122,5 +142,31 @@ void Bbox::calcCenter() {
     center.z = (min.z + max.z) / 2;
 }
 
+void rangeBounds(const float *points, const uint32_t *offsets,
+                 size_t rangeCount, const uint32_t *indices, float *out,
+                 unsigned threads) {
+    const float inf = std::numeric_limits<float>::infinity();
+    parallelFor(rangeCount, threads, [&](size_t begin, size_t end) {
+        for (size_t r = begin; r < end; r++) {
+            float *lo = out + 6 * r;
+            float *hi = lo + 3;
+            lo[0] = lo[1] = lo[2] = inf;
+            hi[0] = hi[1] = hi[2] = -inf;
+            const uint32_t first = offsets[r], last = offsets[r + 1];
+            if (!indices) {
+                minMax(points + 3 * size_t(first), last - first, lo, hi);
+                continue;
+            }
+            for (uint32_t i = first; i < last; i++) {
+                const float *p = points + 3 * size_t(indices[i]);
+                for (int a = 0; a < 3; a++) {
+                    lo[a] = std::min(lo[a], p[a]);
+                    hi[a] = std::max(hi[a], p[a]);
+                }
+            }
+        }
+    });
+}
+
 } // namespace Geometry
 } // namespace meshTools
\ No newline at end of file
@@ -5,7 +5,10 @@
 
 #pragma once
 
+#include <cstddef>
+#include <cstdint>
 #include <geometry/vector.h>
+#include <vector>
 
 namespace meshTools {
 namespace Geometry {
@@ -47,8 +50,22 @@ class Bbox {
     /**
      * @brief Compute axis-aligned bounding box from a set of points
      * @param pointset Set of points to compute bounding box from
+     * @param threads Worker threads; 0 uses the hardware concurrency
      */
-    void fromPointSet(const std::vector<Vector> &pointset);
+    void fromPointSet(const std::vector<Vector> &pointset,
+                      unsigned threads = 1);
+
+    /**
+     * @brief Compute axis-aligned bounding box from a flat point buffer
+     *
+     * One pass of per-axis min/max; with several threads each takes a
+     * contiguous chunk and the partial boxes are merged. An empty buffer
+     * gives a zero box.
+     * @param points Row-major (count, 3) coordinates
+     * @param count Number of points
+     * @param threads Worker threads; 0 uses the hardware concurrency
+     */
+    void fromPointSet(const float *points, size_t count, unsigned threads = 1);
 
     /**
      * @brief Compute oriented bounding box (OBB) from a set of points
@@ -56,6 +73,29 @@ class Bbox {
      */
     void obbFromPointSet(const std::vector<Vector> &pointset);
 
+    /**
+     * @brief Compute oriented bounding box (OBB) from a flat point buffer
+     *
+     * The covariance is accumulated in one pass in double precision and
+     * diagonalized with math::symmetricEigen; axis[] are its eigenvectors
+     * by descending variance, then fitToAxes() sets the extents. An empty
+     * buffer gives a zero box with the world axes.
+     * @param points Row-major (count, 3) coordinates
+     * @param count Number of points
+     */
+    void obbFromPointSet(const float *points, size_t count);
+
+    /**
+     * @brief Fit the box to a point buffer along the current axis[]
+     *
+     * min and max become the extents in the axis[] frame (min.x is the
+     * smallest axis[0] projection, ...) and center the world position of
+     * their midpoint. axis[] must be orthonormal.
+     * @param points Row-major (count, 3) coordinates
+     * @param count Number of points (at least 1)
+     */
+    void fitToAxes(const float *points, size_t count);
+
     /**
      * @brief Calculate the center point of the bounding box
      */
@@ -80,5 +120,24 @@ class Bbox {
     }
 };
 
+/**
+ * @brief Axis-aligned bounds of many point ranges at once
+ *
+ * Range r covers entries offsets[r] to offsets[r + 1] (CSR layout), which
+ * are point indices when indices is given (e.g. face vertex lists) and
+ * point positions otherwise (e.g. consecutive instances or clusters).
+ * Offsets must be non-decreasing and every referenced point in range.
+ * @param points Row-major (pointCount, 3) coordinates
+ * @param offsets rangeCount + 1 offsets into indices (or points)
+ * @param rangeCount Number of ranges
+ * @param indices Point indices, or nullptr for contiguous point ranges
+ * @param out rangeCount * 6 floats: min x, y, z then max x, y, z per range;
+ * an empty range gets min = +inf and max = -inf
+ * @param threads Worker threads; 0 uses the hardware concurrency
+ */
+void rangeBounds(const float *points, const uint32_t *offsets,
+                 size_t rangeCount, const uint32_t *indices, float *out,
+                 unsigned threads = 1);
+
 } // namespace Geometry
 } // namespace meshTools
@@ -0,0 +1,470 @@
+/**
+ * @file bvh.cpp
+ * @brief Bounding volume hierarchy build and traversal
+ */
+
+#include <algorithm>
+#include <cmath>
+#include <geometry/bvh.h>
+#include <geometry/parallel.h>
+
+namespace meshTools {
+namespace Geometry {
+
+namespace {
+
+constexpr int kBins = 16;
+constexpr uint32_t kMaxLeafSize = 8;
+constexpr int kMaxDepth = 60;
+constexpr int kStackSize = 2 * kMaxDepth + 4;
+constexpr size_t kQueriesPerThread = 256;
+constexpr float kInf = std::numeric_limits<float>::infinity();
+
+struct Box {
+    float lo[3] = {kInf, kInf, kInf};
+    float hi[3] = {-kInf, -kInf, -kInf};
+
+    void grow(const float *p) {
+        for (int a = 0; a < 3; a++) {
+            lo[a] = std::min(lo[a], p[a]);
+            hi[a] = std::max(hi[a], p[a]);
+        }
+    }
+    void grow(const Box &b) {
+        for (int a = 0; a < 3; a++) {
+            lo[a] = std::min(lo[a], b.lo[a]);
+            hi[a] = std::max(hi[a], b.hi[a]);
+        }
+    }
+    float area() const {
+        const float x = hi[0] - lo[0], y = hi[1] - lo[1], z = hi[2] - lo[2];
+        return x < 0 ? 0 : 2 * (x * y + y * z + z * x);
+    }
+};
+
+/** Entry t of a ray into a node box, or +inf if it misses within tMax. */
+inline float enterBox(const Bvh::Node &node, const float origin[3],
+                      const float inverse[3], float tMin, float tMax) {
+    for (int a = 0; a < 3; a++) {
+        float t0 = (node.lo[a] - origin[a]) * inverse[a];
+        float t1 = (node.hi[a] - origin[a]) * inverse[a];
+        if (t0 > t1)
+            std::swap(t0, t1);
+        // NaN (origin on a slab of a flat direction) keeps the old bounds
+        tMin = t0 > tMin ? t0 : tMin;
+        tMax = t1 < tMax ? t1 : tMax;
+        if (tMin > tMax)
+            return kInf;
+    }
+    return tMin;
+}
+
+/** Squared distance from p to a node box. */
+inline float boxDistance2(const Bvh::Node &node, const Vector &p) {
+    float d2 = 0;
+    for (int a = 0; a < 3; a++) {
+        const float v = p[a];
+        const float d = v < node.lo[a]   ? node.lo[a] - v
+                        : v > node.hi[a] ? v - node.hi[a]
+                                         : 0.0f;
+        d2 += d * d;
+    }
+    return d2;
+}
+
+/** Two-sided Moller-Trumbore; t of the hit or +inf. */
+inline float rayTriangle(const float *tri, const Vector &origin,
+                         const Vector &direction, float tMin, float tMax) {
+    const Vector v0(tri[0], tri[1], tri[2]);
+    const Vector e1 = Vector(tri[3], tri[4], tri[5]) - v0;
+    const Vector e2 = Vector(tri[6], tri[7], tri[8]) - v0;
+    const Vector p = direction.cross(e2);
+    const float det = e1.dot(p);
+    if (det == 0)
+        return kInf;
+    const float inv = 1 / det;
+    const Vector s = origin - v0;
+    const float u = s.dot(p) * inv;
+    if (u < 0 || u > 1)
+        return kInf;
+    const Vector q = s.cross(e1);
+    const float v = direction.dot(q) * inv;
+    if (v < 0 || u + v > 1)
+        return kInf;
+    const float t = e2.dot(q) * inv;
+    return t >= tMin && t <= tMax ? t : kInf;
+}
+
+/** Closest point to p on a triangle (Ericson, Real-Time Collision
+ * Detection 5.1.5). */
+Vector closestOnTriangle(const float *tri, const Vector &p) {
+    const Vector a(tri[0], tri[1], tri[2]), b(tri[3], tri[4], tri[5]),
+        c(tri[6], tri[7], tri[8]);
+    const Vector ab = b - a, ac = c - a, ap = p - a;
+    const float d1 = ab.dot(ap), d2 = ac.dot(ap);
+    if (d1 <= 0 && d2 <= 0)
+        return a;
+    const Vector bp = p - b;
+    const float d3 = ab.dot(bp), d4 = ac.dot(bp);
+    if (d3 >= 0 && d4 <= d3)
+        return b;
+    const float vc = d1 * d4 - d3 * d2;
+    if (vc <= 0 && d1 >= 0 && d3 <= 0)
+        return a + ab * (d1 / (d1 - d3));
+    const Vector cp = p - c;
+    const float d5 = ab.dot(cp), d6 = ac.dot(cp);
+    if (d6 >= 0 && d5 <= d6)
+        return c;
+    const float vb = d5 * d2 - d1 * d6;
+    if (vb <= 0 && d2 >= 0 && d6 <= 0)
+        return a + ac * (d2 / (d2 - d6));
+    const float va = d3 * d6 - d5 * d4;
+    if (va <= 0 && (d4 - d3) >= 0 && (d5 - d6) >= 0)
+        return b + (c - b) * ((d4 - d3) / ((d4 - d3) + (d5 - d6)));
+    const float denom = 1 / (va + vb + vc);
+    return a + ab * (vb * denom) + ac * (vc * denom);
+}
+
+inline Vector triangleNormal(const float *tri) {
+    const Vector v0(tri[0], tri[1], tri[2]);
+    return (Vector(tri[3], tri[4], tri[5]) - v0)
+        .cross(Vector(tri[6], tri[7], tri[8]) - v0)
+        .normalize();
+}
+
+inline Vector load(const float *p) { return Vector(p[0], p[1], p[2]); }
+
+inline void store(float *out, const Vector &v) {
+    out[0] = v.x;
+    out[1] = v.y;
+    out[2] = v.z;
+}
+
+} // namespace
+
+struct Bvh::Build {
+    std::vector<Box> bounds;      // per input triangle
+    std::vector<float> centroids; // 3 per input triangle
+    std::vector<uint32_t> order;  // input triangles in leaf order
+};
+
+Bvh::Bvh(const float *positions, size_t vertexCount, const uint32_t *offsets,
+         const uint32_t *indices, size_t faceCount) {
+    (void)vertexCount;
+    std::vector<float> corners;
+    for (size_t f = 0; f < faceCount; f++) {
+        const uint32_t first = offsets[f], last = offsets[f + 1];
+        for (uint32_t i = first + 1; i + 1 < last; i++) {
+            for (uint32_t v : {indices[first], indices[i], indices[i + 1]})
+                corners.insert(corners.end(), positions + 3 * size_t(v),
+                               positions + 3 * size_t(v) + 3);
+            triFaces_.push_back(static_cast<uint32_t>(f));
+        }
+    }
+    const size_t count = triFaces_.size();
+    if (count == 0)
+        return;
+
+    Build state;
+    state.bounds.resize(count);
+    state.centroids.resize(3 * count);
+    state.order.resize(count);
+    for (size_t t = 0; t < count; t++) {
+        const float *tri = &corners[9 * t];
+        for (int k = 0; k < 3; k++)
+            state.bounds[t].grow(tri + 3 * k);
+        for (int a = 0; a < 3; a++)
+            state.centroids[3 * t + a] =
+                (state.bounds[t].lo[a] + state.bounds[t].hi[a]) * 0.5f;
+        state.order[t] = static_cast<uint32_t>(t);
+    }
+    nodes_.reserve(count);
+    build(state, 0, static_cast<uint32_t>(count), 0);
+
+    triangles_.resize(9 * count);
+    std::vector<uint32_t> faces(count);
+    for (size_t i = 0; i < count; i++) {
+        const uint32_t t = state.order[i];
+        std::copy_n(&corners[9 * size_t(t)], 9, &triangles_[9 * i]);
+        faces[i] = triFaces_[t];
+    }
+    triFaces_.swap(faces);
+}
+
+uint32_t Bvh::build(Build &state, uint32_t begin, uint32_t end, int depth) {
+    const uint32_t index = static_cast<uint32_t>(nodes_.size());
+    nodes_.emplace_back();
+    Box box, centroidBox;
+    for (uint32_t i = begin; i < end; i++) {
+        box.grow(state.bounds[state.order[i]]);
+        centroidBox.grow(&state.centroids[3 * size_t(state.order[i])]);
+    }
+    const uint32_t n = end - begin;
+    auto makeLeaf = [&]() {
+        Node &node = nodes_[index];
+        std::copy_n(box.lo, 3, node.lo);
+        std::copy_n(box.hi, 3, node.hi);
+        node.start = begin;
+        node.count = n;
+        return index;
+    };
+    if (n <= 2 || depth >= kMaxDepth)
+        return makeLeaf();
+
+    // binned SAH over all three axes; costs in triangle tests per unit of
+    // parent area (traversal step = 1)
+    float bestCost = kInf;
+    int bestAxis = -1, bestSplit = 0;
+    for (int a = 0; a < 3; a++) {
+        const float extent = centroidBox.hi[a] - centroidBox.lo[a];
+        if (!(extent > 0))
+            continue;
+        const float scale = kBins / extent;
+        Box bins[kBins];
+        uint32_t counts[kBins] = {};
+        for (uint32_t i = begin; i < end; i++) {
+            const uint32_t t = state.order[i];
+            const int b = std::min(
+                kBins - 1,
+                int((state.centroids[3 * t + a] - centroidBox.lo[a]) * scale));
+            bins[b].grow(state.bounds[t]);
+            counts[b]++;
+        }
+        float rightArea[kBins];
+        uint32_t rightCount[kBins];
+        Box right;
+        uint32_t sum = 0;
+        for (int b = kBins - 1; b > 0; b--) {
+            right.grow(bins[b]);
+            sum += counts[b];
+            rightArea[b] = right.area();
+            rightCount[b] = sum;
+        }
+        Box left;
+        sum = 0;
+        for (int b = 0; b < kBins - 1; b++) {
+            left.grow(bins[b]);
+            sum += counts[b];
+            if (sum == 0 || rightCount[b + 1] == 0)
+                continue;
+            const float cost =
+                left.area() * sum + rightArea[b + 1] * rightCount[b + 1];
+            if (cost < bestCost) {
+                bestCost = cost;
+                bestAxis = a;
+                bestSplit = b;
+            }
+        }
+    }
+    const float parentArea = box.area();
+    const float splitCost =
+        parentArea > 0 ? 1 + bestCost / parentArea : float(n);
+    if (bestAxis < 0 || (n <= kMaxLeafSize && splitCost >= float(n)))
+        return makeLeaf();
+
+    const float lo = centroidBox.lo[bestAxis];
+    const float scale = kBins / (centroidBox.hi[bestAxis] - lo);
+    uint32_t *first = state.order.data() + begin;
+    uint32_t *middle =
+        std::partition(first, state.order.data() + end, [&](uint32_t t) {
+            const int b =
+                std::min(kBins - 1,
+                         int((state.centroids[3 * t + bestAxis] - lo) * scale));
+            return b <= bestSplit;
+        });
+    const uint32_t mid = begin + static_cast<uint32_t>(middle - first);
+
+    build(state, begin, mid, depth + 1);
+    const uint32_t second = build(state, mid, end, depth + 1);
+    Node &node = nodes_[index];
+    std::copy_n(box.lo, 3, node.lo);
+    std::copy_n(box.hi, 3, node.hi);
+    node.start = second;
+    node.count = 0;
+    return index;
+}
+
+bool Bvh::intersect(const Vector &origin, const Vector &direction,
+                    float minDistance, float maxDistance, Hit &hit) const {
+    if (nodes_.empty())
+        return false;
+    const float o[3] = {origin.x, origin.y, origin.z};
+    const float inverse[3] = {1 / direction.x, 1 / direction.y,
+                              1 / direction.z};
+    float best = maxDistance;
+    int64_t bestTriangle = -1;
+    uint32_t stack[kStackSize];
+    int top = 0;
+    if (enterBox(nodes_[0], o, inverse, minDistance, best) < kInf)
+        stack[top++] = 0;
+    while (top > 0) {
+        const Node &node = nodes_[stack[--top]];
+        if (node.count > 0) {
+            for (uint32_t i = node.start; i < node.start + node.count; i++) {
+                const float t = rayTriangle(&triangles_[9 * size_t(i)], origin,
+                                            direction, minDistance, best);
+                if (t < kInf) {
+                    best = t;
+                    bestTriangle = i;
+                }
+            }
+            continue;
+        }
+        const uint32_t near = static_cast<uint32_t>(&node - nodes_.data()) + 1;
+        const uint32_t far = node.start;
+        float tNear = enterBox(nodes_[near], o, inverse, minDistance, best);
+        float tFar = enterBox(nodes_[far], o, inverse, minDistance, best);
+        uint32_t first = near, second = far;
+        if (tFar < tNear) {
+            std::swap(first, second);
+            std::swap(tNear, tFar);
+        }
+        // push the farther child first so the nearer one is visited next
+        if (tFar < kInf)
+            stack[top++] = second;
+        if (tNear < kInf)
+            stack[top++] = first;
+    }
+    if (bestTriangle < 0)
+        return false;
+    const float *tri = &triangles_[9 * size_t(bestTriangle)];
+    hit.distance = best;
+    hit.face = static_cast<int32_t>(triFaces_[bestTriangle]);
+    hit.point = origin + direction * best;
+    hit.normal = triangleNormal(tri);
+    return true;
+}
+
+bool Bvh::occluded(const Vector &origin, const Vector &direction,
+                   float minDistance, float maxDistance) const {
+    if (nodes_.empty())
+        return false;
+    const float o[3] = {origin.x, origin.y, origin.z};
+    const float inverse[3] = {1 / direction.x, 1 / direction.y,
+                              1 / direction.z};
+    uint32_t stack[kStackSize];
+    int top = 0;
+    stack[top++] = 0;
+    while (top > 0) {
+        const uint32_t index = stack[--top];
+        const Node &node = nodes_[index];
+        if (enterBox(node, o, inverse, minDistance, maxDistance) == kInf)
+            continue;
+        if (node.count == 0) {
+            stack[top++] = node.start;
+            stack[top++] = index + 1;
+            continue;
+        }
+        for (uint32_t i = node.start; i < node.start + node.count; i++)
+            if (rayTriangle(&triangles_[9 * size_t(i)], origin, direction,
+                            minDistance, maxDistance) < kInf)
+                return true;
+    }
+    return false;
+}
+
+bool Bvh::closestPoint(const Vector &point, float maxDistance, Hit &hit) const {
+    if (nodes_.empty())
+        return false;
+    float best2 = maxDistance * maxDistance;
+    int64_t bestTriangle = -1;
+    Vector bestPoint;
+    uint32_t stack[kStackSize];
+    int top = 0;
+    stack[top++] = 0;
+    while (top > 0) {
+        const uint32_t index = stack[--top];
+        const Node &node = nodes_[index];
+        if (boxDistance2(node, point) > best2)
+            continue;
+        if (node.count > 0) {
+            for (uint32_t i = node.start; i < node.start + node.count; i++) {
+                const Vector q =
+                    closestOnTriangle(&triangles_[9 * size_t(i)], point);
+                const float d2 = (q - point).lengthSquared();
+                if (d2 <= best2) {
+                    best2 = d2;
+                    bestTriangle = i;
+                    bestPoint = q;
+                }
+            }
+            continue;
+        }
+        const uint32_t first = index + 1, second = node.start;
+        const float d1 = boxDistance2(nodes_[first], point);
+        const float d2 = boxDistance2(nodes_[second], point);
+        // visit the nearer box first: it is pushed last
+        if (d1 <= d2) {
+            stack[top++] = second;
+            stack[top++] = first;
+        } else {
+            stack[top++] = first;
+            stack[top++] = second;
+        }
+    }
+    if (bestTriangle < 0)
+        return false;
+    hit.distance = std::sqrt(best2);
+    hit.face = static_cast<int32_t>(triFaces_[bestTriangle]);
+    hit.point = bestPoint;
+    hit.normal = triangleNormal(&triangles_[9 * size_t(bestTriangle)]);
+    return true;
+}
+
+void Bvh::intersect(const float *origins, const float *directions, size_t count,
+                    float minDistance, float maxDistance, float *distances,
+                    int32_t *faces, float *points, float *normals,
+                    unsigned threads) const {
+    const float nan = std::numeric_limits<float>::quiet_NaN();
+    parallelFor(
+        count, threads,
+        [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; i++) {
+                Hit hit;
+                if (!intersect(load(origins + 3 * i), load(directions + 3 * i),
+                               minDistance, maxDistance, hit))
+                    hit.point = hit.normal = Vector(nan, nan, nan);
+                distances[i] = hit.distance;
+                faces[i] = hit.face;
+                store(points + 3 * i, hit.point);
+                store(normals + 3 * i, hit.normal);
+            }
+        },
+        kQueriesPerThread);
+}
+
+void Bvh::occluded(const float *origins, const float *directions, size_t count,
+                   float minDistance, float maxDistance, uint8_t *out,
+                   unsigned threads) const {
+    parallelFor(
+        count, threads,
+        [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; i++)
+                out[i] =
+                    occluded(load(origins + 3 * i), load(directions + 3 * i),
+                             minDistance, maxDistance);
+        },
+        kQueriesPerThread);
+}
+
+void Bvh::closestPoints(const float *points, size_t count, float maxDistance,
+                        float *closest, int32_t *faces, float *distances,
+                        unsigned threads) const {
+    const float nan = std::numeric_limits<float>::quiet_NaN();
+    parallelFor(
+        count, threads,
+        [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; i++) {
+                Hit hit;
+                if (!closestPoint(load(points + 3 * i), maxDistance, hit))
+                    hit.point = Vector(nan, nan, nan);
+                distances[i] = hit.distance;
+                faces[i] = hit.face;
+                store(closest + 3 * i, hit.point);
+            }
+        },
+        kQueriesPerThread);
+}
+
+} // namespace Geometry
+} // namespace meshTools
@@ -0,0 +1,146 @@
+/**
+ * @file bvh.h
+ * @brief Bounding volume hierarchy over mesh triangles
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <geometry/vector.h>
+#include <limits>
+#include <vector>
+
+namespace meshTools {
+namespace Geometry {
+
+/**
+ * @class Bvh
+ * @brief Bounding volume hierarchy for ray and closest-point queries
+ *
+ * Polygons are fan-triangulated (exact for convex faces) and the triangles
+ * are split top-down with a binned surface area heuristic. Nodes are stored
+ * depth-first in one array: an interior node's first child follows it and
+ * the second child is at its start index; a leaf holds count triangles
+ * from start. Triangle corners are copied into leaf order, so queries
+ * read the tree and triangles sequentially.
+ */
+class Bvh {
+  public:
+    /** @brief Flattened tree node (32 bytes) */
+    struct Node {
+        float lo[3];    ///< Box minimum
+        uint32_t start; ///< First triangle (leaf) or second child (interior)
+        float hi[3];    ///< Box maximum
+        uint32_t count; ///< Triangle count; 0 for an interior node
+    };
+
+    /** @brief Result of a ray or closest-point query */
+    struct Hit {
+        float distance = std::numeric_limits<float>::infinity(); ///< Ray
+        ///< parameter t (hit = origin + t * direction) or point distance
+        int32_t face = -1; ///< Face id, -1 if nothing was found
+        Vector point;      ///< Hit or closest point
+        Vector normal;     ///< Unit normal of the triangle found
+    };
+
+    /** @brief Empty hierarchy */
+    Bvh() = default;
+
+    /**
+     * @brief Build over polygon faces given in CSR form
+     * @param positions Row-major (vertexCount, 3) coordinates
+     * @param vertexCount Number of vertices
+     * @param offsets faceCount + 1 offsets into indices
+     * @param indices Concatenated face vertex ids (all below vertexCount)
+     * @param faceCount Number of faces; faces with fewer than 3 vertices
+     * are skipped
+     */
+    Bvh(const float *positions, size_t vertexCount, const uint32_t *offsets,
+        const uint32_t *indices, size_t faceCount);
+
+    /**
+     * @brief Closest ray hit (both triangle sides count)
+     * @param origin Ray origin
+     * @param direction Ray direction (need not be unit length)
+     * @param minDistance Smallest accepted t, e.g. to leave a surface
+     * @param maxDistance Largest accepted t
+     * @param hit Receives the hit; unchanged if there is none
+     * @return True if a triangle was hit
+     */
+    bool intersect(const Vector &origin, const Vector &direction,
+                   float minDistance, float maxDistance, Hit &hit) const;
+
+    /**
+     * @brief Any-hit test: stops at the first triangle found
+     * @return True if some triangle is hit with t in [minDistance,
+     * maxDistance]
+     */
+    bool occluded(const Vector &origin, const Vector &direction,
+                  float minDistance, float maxDistance) const;
+
+    /**
+     * @brief Closest point on the mesh surface
+     * @param point Query point
+     * @param maxDistance Ignore surface farther than this
+     * @param hit Receives the closest point, its distance and face
+     * @return True if a point within maxDistance was found
+     */
+    bool closestPoint(const Vector &point, float maxDistance, Hit &hit) const;
+
+    /**
+     * @brief Batched intersect()
+     * @param origins Row-major (count, 3) ray origins
+     * @param directions Row-major (count, 3) ray directions
+     * @param count Number of rays
+     * @param minDistance Smallest accepted t
+     * @param maxDistance Largest accepted t
+     * @param distances count hit parameters, +inf for a miss
+     * @param faces count face ids, -1 for a miss
+     * @param points (count, 3) hit points, NaN for a miss
+     * @param normals (count, 3) triangle normals, NaN for a miss
+     * @param threads Worker threads; 0 uses the hardware concurrency
+     */
+    void intersect(const float *origins, const float *directions, size_t count,
+                   float minDistance, float maxDistance, float *distances,
+                   int32_t *faces, float *points, float *normals,
+                   unsigned threads = 1) const;
+
+    /**
+     * @brief Batched occluded()
+     * @param out count flags, 1 if the ray hits something
+     */
+    void occluded(const float *origins, const float *directions, size_t count,
+                  float minDistance, float maxDistance, uint8_t *out,
+                  unsigned threads = 1) const;
+
+    /**
+     * @brief Batched closestPoint()
+     * @param points Row-major (count, 3) query points
+     * @param count Number of queries
+     * @param maxDistance Ignore surface farther than this
+     * @param closest (count, 3) closest points, NaN if none found
+     * @param faces count face ids, -1 if none found
+     * @param distances count distances, +inf if none found
+     * @param threads Worker threads; 0 uses the hardware concurrency
+     */
+    void closestPoints(const float *points, size_t count, float maxDistance,
+                       float *closest, int32_t *faces, float *distances,
+                       unsigned threads = 1) const;
+
+    /** @brief Tree nodes, root first */
+    const std::vector<Node> &nodes() const { return nodes_; }
+    /** @brief Number of triangles */
+    size_t triangleCount() const { return triFaces_.size(); }
+
+  private:
+    std::vector<Node> nodes_;
+    std::vector<float> triangles_;   // 9 floats per triangle, leaf order
+    std::vector<uint32_t> triFaces_; // face of each triangle, leaf order
+
+    struct Build;
+    uint32_t build(Build &state, uint32_t begin, uint32_t end, int depth);
+};
+
+} // namespace Geometry
+} // namespace meshTools
@@ -0,0 +1,129 @@
+/**
+ * @file counters.h
+ * @brief Named call, item and time counters for batched entry points
+ *
+ * Counters are always on: a CounterScope costs two clock reads and three
+ * relaxed atomic adds, which is noise next to a batched call. Looking a
+ * counter up by name takes a lock, so call sites resolve it once:
+ *
+ *     static Counter &counter = namedCounter("Bvh.raycast");
+ *     CounterScope scope(counter, rays);
+ *
+ * Each shared
+ * library that includes this header gets its own registry, so every
+ * extension module reports the entry points it owns.
+ */
+
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <string>
+#include <vector>
+
+namespace meshTools {
+namespace Geometry {
+
+/** @brief Running totals of one named entry point. */
+struct Counter {
+    std::atomic<uint64_t> calls{0};
+    std::atomic<uint64_t> items{0};
+    std::atomic<uint64_t> nanoseconds{0};
+};
+
+/** @brief Copy of a Counter taken by counterValues(). */
+struct CounterValue {
+    std::string name;
+    uint64_t calls;
+    uint64_t items;
+    uint64_t nanoseconds;
+};
+
+namespace detail {
+
+inline std::mutex &counterMutex() {
+    static std::mutex mutex;
+    return mutex;
+}
+
+inline std::map<std::string, Counter> &counterRegistry() {
+    static std::map<std::string, Counter> registry;
+    return registry;
+}
+
+} // namespace detail
+
+/**
+ * @brief The counter called name, created on first use.
+ * @return A reference that stays valid for the life of the library.
+ */
+inline Counter &namedCounter(const std::string &name) {
+    std::lock_guard<std::mutex> lock(detail::counterMutex());
+    return detail::counterRegistry()[name];
+}
+
+/** @brief Snapshot of every counter, sorted by name. */
+inline std::vector<CounterValue> counterValues() {
+    std::lock_guard<std::mutex> lock(detail::counterMutex());
+    std::vector<CounterValue> values;
+    values.reserve(detail::counterRegistry().size());
+    for (const auto &[name, c] : detail::counterRegistry())
+        values.push_back({name, c.calls.load(std::memory_order_relaxed),
+                          c.items.load(std::memory_order_relaxed),
+                          c.nanoseconds.load(std::memory_order_relaxed)});
+    return values;
+}
+
+/** @brief Zero every counter; names stay registered. */
+inline void resetCounters() {
+    std::lock_guard<std::mutex> lock(detail::counterMutex());
+    for (auto &entry : detail::counterRegistry()) {
+        entry.second.calls.store(0, std::memory_order_relaxed);
+        entry.second.items.store(0, std::memory_order_relaxed);
+        entry.second.nanoseconds.store(0, std::memory_order_relaxed);
+    }
+}
+
+/**
+ * @brief Add one call, its item count and its elapsed time to a counter
+ * when the scope ends.
+ */
+class CounterScope {
+  public:
+    using Clock = std::chrono::steady_clock;
+
+    /**
+     * @param counter Counter from namedCounter(), usually named after the
+     * Python-facing method.
+     * @param items Amount of work in the call (points, rays, faces...).
+     */
+    explicit CounterScope(Counter &counter, uint64_t items = 0)
+        : counter_(counter), items_(items), start_(Clock::now()) {}
+
+    CounterScope(const CounterScope &) = delete;
+    CounterScope &operator=(const CounterScope &) = delete;
+
+    ~CounterScope() {
+        const auto elapsed =
+            std::chrono::duration_cast<std::chrono::nanoseconds>(Clock::now() -
+                                                                 start_);
+        counter_.calls.fetch_add(1, std::memory_order_relaxed);
+        counter_.items.fetch_add(items_, std::memory_order_relaxed);
+        counter_.nanoseconds.fetch_add(static_cast<uint64_t>(elapsed.count()),
+                                       std::memory_order_relaxed);
+    }
+
+    /** @brief Set the item count once it is known (e.g. an output size). */
+    void setItems(uint64_t items) { items_ = items; }
+
+  private:
+    Counter &counter_;
+    uint64_t items_;
+    Clock::time_point start_;
+};
+
+} // namespace Geometry
+} // namespace meshTools
@@ -6,7 +6,9 @@
 #include <geometry/math.h>
 #include <geometry/vector.h>
 
+#include <algorithm>
 #include <cmath>
+#include <cstring>
 #include <vector>
 
 namespace meshTools {
@@ -98,6 +100,61 @@ Vector solveCubic(float a, float b, float c, float d) {
     return Vector();
 }
 
+void symmetricEigen(const double a[3][3], double values[3],
+                    double vectors[3][3]) {
+    double m[3][3], v[3][3] = {{1, 0, 0}, {0, 1, 0}, {0, 0, 1}};
+    memcpy(m, a, sizeof(m));
+    static const int pairs[3][2] = {{0, 1}, {0, 2}, {1, 2}};
+    for (int sweep = 0; sweep < 50; sweep++) {
+        const double off =
+            m[0][1] * m[0][1] + m[0][2] * m[0][2] + m[1][2] * m[1][2];
+        const double diag =
+            m[0][0] * m[0][0] + m[1][1] * m[1][1] + m[2][2] * m[2][2];
+        if (off <= 1e-30 * diag || off == 0)
+            break;
+        for (const auto &pq : pairs) {
+            const int p = pq[0], q = pq[1];
+            if (m[p][q] == 0)
+                continue;
+            // rotation zeroing m[p][q]: m = J^T m J, v = v J
+            const double theta = (m[q][q] - m[p][p]) / (2 * m[p][q]);
+            const double t = (theta >= 0 ? 1.0 : -1.0) /
+                             (std::fabs(theta) + std::sqrt(theta * theta + 1));
+            const double c = 1 / std::sqrt(t * t + 1), s = t * c;
+            for (int k = 0; k < 3; k++) {
+                const double kp = m[k][p], kq = m[k][q];
+                m[k][p] = c * kp - s * kq;
+                m[k][q] = s * kp + c * kq;
+            }
+            for (int k = 0; k < 3; k++) {
+                const double pk = m[p][k], qk = m[q][k];
+                m[p][k] = c * pk - s * qk;
+                m[q][k] = s * pk + c * qk;
+            }
+            for (int k = 0; k < 3; k++) {
+                const double kp = v[k][p], kq = v[k][q];
+                v[k][p] = c * kp - s * kq;
+                v[k][q] = s * kp + c * kq;
+            }
+        }
+    }
+    int order[3] = {0, 1, 2};
+    std::sort(order, order + 3,
+              [&](int i, int j) { return m[i][i] > m[j][j]; });
+    for (int i = 0; i < 3; i++) {
+        values[i] = m[order[i]][order[i]];
+        for (int k = 0; k < 3; k++)
+            vectors[i][k] = v[k][order[i]];
+    }
+    // third axis from the first two keeps the basis right-handed
+    vectors[2][0] =
+        vectors[0][1] * vectors[1][2] - vectors[0][2] * vectors[1][1];
+    vectors[2][1] =
+        vectors[0][2] * vectors[1][0] - vectors[0][0] * vectors[1][2];
+    vectors[2][2] =
+        vectors[0][0] * vectors[1][1] - vectors[0][1] * vectors[1][0];
+}
+
 } // namespace math
 } // namespace Geometry
 } // namespace meshTools
\ No newline at end of file
@@ -57,6 +57,16 @@ float fit(float p, float oldmin, float oldmax, float newmin, float newmax);
  */
 Vector solveCubic(float a, float b, float c, float d);
 
+/**
+ * @brief Eigen-decomposition of a symmetric 3x3 matrix (cyclic Jacobi)
+ * @param a Symmetric matrix; only read
+ * @param values Eigenvalues in descending order
+ * @param vectors Unit eigenvectors as rows, vectors[i] for values[i]; they
+ * form a right-handed orthonormal basis
+ */
+void symmetricEigen(const double a[3][3], double values[3],
+                    double vectors[3][3]);
+
 /**
  * @brief Test if a point is inside a polygon
  * @param point The point to test
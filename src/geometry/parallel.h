@@ -0,0 +1,175 @@
+/**
+ * @file parallel.h
+ * @brief Split an index range across std::threads
+ */
+
+#pragma once
+
+#include <algorithm>
+#include <condition_variable>
+#include <cstddef>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace meshTools {
+namespace Geometry {
+
+/** Smallest number of items worth handing to a separate thread. */
+constexpr size_t kMinItemsPerThread = 4096;
+
+/**
+ * @brief Number of worker threads to use for count items.
+ * @param count Number of items.
+ * @param threads Requested threads; 0 uses the hardware concurrency.
+ * @param grain Smallest number of items worth a thread.
+ */
+inline unsigned threadCount(size_t count, unsigned threads,
+                            size_t grain = kMinItemsPerThread) {
+    if (threads == 0)
+        threads = std::max(1u, std::thread::hardware_concurrency());
+    size_t useful = std::max<size_t>(1, count / std::max<size_t>(1, grain));
+    return static_cast<unsigned>(std::min<size_t>(threads, useful));
+}
+
+/**
+ * @brief Call fn(begin, end) on contiguous chunks of [0, count).
+ *
+ * Chunks run on up to threads std::threads; small ranges run inline on the
+ * calling thread. fn must be safe to call concurrently on disjoint ranges.
+ * @param count Number of items.
+ * @param threads Requested threads; 0 uses the hardware concurrency.
+ * @param fn Callable taking (size_t begin, size_t end).
+ * @param grain Smallest number of items worth a thread; lower it for
+ * expensive items.
+ */
+template <typename Fn>
+void parallelFor(size_t count, unsigned threads, const Fn &fn,
+                 size_t grain = kMinItemsPerThread) {
+    unsigned workers = threadCount(count, threads, grain);
+    if (workers <= 1) {
+        fn(size_t(0), count);
+        return;
+    }
+    size_t chunk = (count + workers - 1) / workers;
+    std::vector<std::thread> pool;
+    pool.reserve(workers - 1);
+    for (unsigned w = 1; w < workers; ++w) {
+        size_t begin = w * chunk;
+        size_t end = std::min(count, begin + chunk);
+        if (begin < end)
+            pool.emplace_back([&fn, begin, end]() { fn(begin, end); });
+    }
+    fn(size_t(0), std::min(count, chunk));
+    for (std::thread &t : pool)
+        t.join();
+}
+
+/**
+ * @class ThreadPool
+ * @brief Persistent workers for repeated parallelFor calls
+ *
+ * parallelFor starts and joins its threads on every call, which is noise
+ * for one large batch but dominates when medium batches are evaluated many
+ * times (e.g. once per frame). A ThreadPool keeps its workers alive between
+ * calls. Calls from several threads are serialized.
+ */
+class ThreadPool {
+  public:
+    /**
+     * @param threads Total threads including the calling one; 0 uses the
+     * hardware concurrency.
+     */
+    explicit ThreadPool(unsigned threads = 0) {
+        if (threads == 0)
+            threads = std::max(1u, std::thread::hardware_concurrency());
+        workers.reserve(threads - 1);
+        for (unsigned w = 1; w < threads; ++w)
+            workers.emplace_back([this]() { work(); });
+    }
+
+    ~ThreadPool() {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            stop = true;
+        }
+        wake.notify_all();
+        for (std::thread &t : workers)
+            t.join();
+    }
+
+    ThreadPool(const ThreadPool &) = delete;
+    ThreadPool &operator=(const ThreadPool &) = delete;
+
+    /** Number of threads a call runs on, including the calling one. */
+    unsigned size() const { return static_cast<unsigned>(workers.size()) + 1; }
+
+    /**
+     * @brief parallelFor on the pool's threads.
+     *
+     * fn must not throw and must be safe to call concurrently on disjoint
+     * ranges.
+     */
+    template <typename Fn>
+    void parallelFor(size_t count, const Fn &fn,
+                     size_t grain = kMinItemsPerThread) {
+        const unsigned parts = threadCount(count, size(), grain);
+        if (parts <= 1) {
+            fn(size_t(0), count);
+            return;
+        }
+        const size_t chunk = (count + parts - 1) / parts;
+        std::lock_guard<std::mutex> run(runMutex);
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            task = [&fn, chunk, count](size_t part) {
+                size_t begin = part * chunk;
+                if (begin < count)
+                    fn(begin, std::min(count, begin + chunk));
+            };
+            chunks = parts;
+            next = 0;
+            pending = parts;
+        }
+        wake.notify_all();
+        std::unique_lock<std::mutex> lock(mutex);
+        runChunks(lock);
+        done.wait(lock, [this]() { return pending == 0; });
+        task = nullptr;
+    }
+
+  private:
+    /** Run chunks until none are left to start; lock is held on return. */
+    void runChunks(std::unique_lock<std::mutex> &lock) {
+        while (next < chunks) {
+            const size_t part = next++;
+            lock.unlock();
+            task(part);
+            lock.lock();
+            if (--pending == 0)
+                done.notify_all();
+        }
+    }
+
+    void work() {
+        std::unique_lock<std::mutex> lock(mutex);
+        while (true) {
+            wake.wait(lock, [this]() { return stop || next < chunks; });
+            if (stop)
+                return;
+            runChunks(lock);
+        }
+    }
+
+    std::vector<std::thread> workers;
+    std::mutex mutex;    ///< Guards everything below
+    std::mutex runMutex; ///< Serializes parallelFor calls
+    std::condition_variable wake, done;
+    std::function<void(size_t)> task;
+    size_t chunks = 0, next = 0, pending = 0;
+    bool stop = false;
+};
+
+} // namespace Geometry
+} // namespace meshTools
@@ -3,6 +3,9 @@
  * @brief Implementation of polygon triangulation and operations
  */
 
+#include <algorithm>
+#include <cmath>
+#include <geometry/parallel.h>
 #include <geometry/polygon.h>
 #include <geometry/vector.h>
 
@@ -49,5 +52,242 @@ std::vector<int> Polygon::triangulate() const {
     return resultIndices;
 }
 
+namespace {
+
+/** Rings at least this long get a z-order list for the point-in-ear test. */
+constexpr size_t kZOrderMinSize = 64;
+/** Polygons per thread in triangulatePolygons. */
+constexpr size_t kPolygonsPerThread = 1024;
+
+/**
+ * Ear clipper over one projected ring. Buffers are kept between polygons,
+ * so one instance per thread allocates only when a larger ring comes in.
+ */
+class EarClipper {
+  public:
+    /** Triangulate ring (n >= 3 vertex ids) into out (3 * (n - 2) ids). */
+    void run(const float *points, const uint32_t *ring, size_t n,
+             uint32_t *out);
+
+  private:
+    struct Node {
+        uint32_t index;       // vertex id
+        float x, y;           // projected coordinates
+        uint32_t z;           // z-order key
+        int32_t prev, next;   // ring links
+        int32_t prevZ, nextZ; // z-order links, -1 at the ends
+    };
+
+    std::vector<Node> mNodes;
+    std::vector<int32_t> mOrder;
+    bool mHashed = false;
+    float mMinX = 0, mMinY = 0, mScale = 0;
+
+    static float area(const Node &p, const Node &q, const Node &r) {
+        return (q.x - p.x) * (r.y - p.y) - (q.y - p.y) * (r.x - p.x);
+    }
+    static bool sameSpot(const Node &p, const Node &q) {
+        return p.x == q.x && p.y == q.y;
+    }
+    /** Inclusive point-in-triangle for a counterclockwise a, b, c. */
+    static bool inTriangle(const Node &a, const Node &b, const Node &c,
+                           const Node &p) {
+        return (c.x - p.x) * (a.y - p.y) - (a.x - p.x) * (c.y - p.y) >= 0 &&
+               (a.x - p.x) * (b.y - p.y) - (b.x - p.x) * (a.y - p.y) >= 0 &&
+               (b.x - p.x) * (c.y - p.y) - (c.x - p.x) * (b.y - p.y) >= 0;
+    }
+    uint32_t zKey(float x, float y) const;
+    /** True if p is a reflex or flat vertex inside the ear a, b, c. */
+    bool blocks(const Node &a, const Node &b, const Node &c,
+                const Node &p) const {
+        return !sameSpot(p, a) && !sameSpot(p, b) && !sameSpot(p, c) &&
+               inTriangle(a, b, c, p) &&
+               area(mNodes[p.prev], p, mNodes[p.next]) <= 0;
+    }
+    bool isEar(int32_t ear, bool allowFlat) const;
+    void remove(int32_t node);
+};
+
+uint32_t EarClipper::zKey(float x, float y) const {
+    // 16-bit cell coordinates interleaved into a Morton code
+    uint32_t ix = static_cast<uint32_t>((x - mMinX) * mScale);
+    uint32_t iy = static_cast<uint32_t>((y - mMinY) * mScale);
+    auto spread = [](uint32_t v) {
+        v = (v | (v << 8)) & 0x00FF00FF;
+        v = (v | (v << 4)) & 0x0F0F0F0F;
+        v = (v | (v << 2)) & 0x33333333;
+        return (v | (v << 1)) & 0x55555555;
+    };
+    return spread(ix) | (spread(iy) << 1);
+}
+
+bool EarClipper::isEar(int32_t ear, bool allowFlat) const {
+    const Node &b = mNodes[ear];
+    const Node &a = mNodes[b.prev];
+    const Node &c = mNodes[b.next];
+    const float turn = area(a, b, c);
+    if (turn < 0 || (turn == 0 && !allowFlat))
+        return false;
+    if (!mHashed) {
+        for (int32_t p = c.next; p != b.prev; p = mNodes[p].next)
+            if (blocks(a, b, c, mNodes[p]))
+                return false;
+        return true;
+    }
+    // only nodes whose z key falls in the ear's bounding box can block it
+    const uint32_t minZ =
+        zKey(std::min({a.x, b.x, c.x}), std::min({a.y, b.y, c.y}));
+    const uint32_t maxZ =
+        zKey(std::max({a.x, b.x, c.x}), std::max({a.y, b.y, c.y}));
+    for (int32_t p = b.nextZ; p >= 0 && mNodes[p].z <= maxZ;
+         p = mNodes[p].nextZ)
+        if (p != b.prev && p != b.next && blocks(a, b, c, mNodes[p]))
+            return false;
+    for (int32_t p = b.prevZ; p >= 0 && mNodes[p].z >= minZ;
+         p = mNodes[p].prevZ)
+        if (p != b.prev && p != b.next && blocks(a, b, c, mNodes[p]))
+            return false;
+    return true;
+}
+
+void EarClipper::remove(int32_t node) {
+    Node &n = mNodes[node];
+    mNodes[n.prev].next = n.next;
+    mNodes[n.next].prev = n.prev;
+    if (n.prevZ >= 0)
+        mNodes[n.prevZ].nextZ = n.nextZ;
+    if (n.nextZ >= 0)
+        mNodes[n.nextZ].prevZ = n.prevZ;
+}
+
+void EarClipper::run(const float *points, const uint32_t *ring, size_t n,
+                     uint32_t *out) {
+    // Newell normal picks the projection plane and the winding
+    double normal[3] = {0, 0, 0};
+    for (size_t i = 0; i < n; i++) {
+        const float *p = points + 3 * size_t(ring[i]);
+        const float *q = points + 3 * size_t(ring[(i + 1) % n]);
+        normal[0] += (double(p[1]) - q[1]) * (double(p[2]) + q[2]);
+        normal[1] += (double(p[2]) - q[2]) * (double(p[0]) + q[0]);
+        normal[2] += (double(p[0]) - q[0]) * (double(p[1]) + q[1]);
+    }
+    int drop = 0;
+    for (int k = 1; k < 3; k++)
+        if (std::fabs(normal[k]) > std::fabs(normal[drop]))
+            drop = k;
+    // cyclic axes keep the orientation; swap them for a negative normal
+    int u = (drop + 1) % 3, v = (drop + 2) % 3;
+    if (normal[drop] < 0)
+        std::swap(u, v);
+
+    mNodes.resize(n);
+    float maxX = -INFINITY, maxY = -INFINITY;
+    mMinX = mMinY = INFINITY;
+    for (size_t i = 0; i < n; i++) {
+        const float *p = points + 3 * size_t(ring[i]);
+        Node &node = mNodes[i];
+        node.index = ring[i];
+        node.x = p[u];
+        node.y = p[v];
+        node.prev = static_cast<int32_t>(i == 0 ? n - 1 : i - 1);
+        node.next = static_cast<int32_t>(i + 1 == n ? 0 : i + 1);
+        node.prevZ = node.nextZ = -1;
+        mMinX = std::min(mMinX, node.x);
+        mMinY = std::min(mMinY, node.y);
+        maxX = std::max(maxX, node.x);
+        maxY = std::max(maxY, node.y);
+    }
+    const float size = std::max(maxX - mMinX, maxY - mMinY);
+    mHashed = n >= kZOrderMinSize && size > 0;
+    if (mHashed) {
+        mScale = 65535.0f / size;
+        mOrder.resize(n);
+        for (size_t i = 0; i < n; i++) {
+            mNodes[i].z = zKey(mNodes[i].x, mNodes[i].y);
+            mOrder[i] = static_cast<int32_t>(i);
+        }
+        std::sort(mOrder.begin(), mOrder.end(), [&](int32_t a, int32_t b) {
+            return mNodes[a].z < mNodes[b].z;
+        });
+        for (size_t i = 0; i < n; i++) {
+            mNodes[mOrder[i]].prevZ = i > 0 ? mOrder[i - 1] : -1;
+            mNodes[mOrder[i]].nextZ = i + 1 < n ? mOrder[i + 1] : -1;
+        }
+    }
+
+    // passes: 0 proper empty ears, 1 also flat ones, 2 any non-reflex
+    // vertex, 3 any vertex at all
+    size_t remaining = n;
+    int32_t ear = 0, stop = 0;
+    int pass = 0;
+    while (remaining > 3) {
+        const Node &node = mNodes[ear];
+        const int32_t prev = node.prev, next = node.next;
+        bool clip;
+        if (pass < 2)
+            clip = isEar(ear, pass == 1);
+        else if (pass == 2)
+            clip = area(mNodes[prev], node, mNodes[next]) >= 0;
+        else
+            clip = true;
+        if (clip) {
+            *out++ = mNodes[prev].index;
+            *out++ = node.index;
+            *out++ = mNodes[next].index;
+            remove(ear);
+            remaining--;
+            // skipping the next vertex avoids fans of slivers
+            ear = stop = mNodes[next].next;
+            pass = 0;
+            continue;
+        }
+        ear = next;
+        if (ear == stop)
+            pass++;
+    }
+    const Node &last = mNodes[ear];
+    *out++ = mNodes[last.prev].index;
+    *out++ = last.index;
+    *out++ = mNodes[last.next].index;
+}
+
+} // namespace
+
+size_t triangulatedCount(const uint32_t *offsets, size_t polygonCount) {
+    size_t count = 0;
+    for (size_t i = 0; i < polygonCount; i++) {
+        const size_t n = offsets[i + 1] - offsets[i];
+        count += n >= 3 ? n - 2 : 0;
+    }
+    return count;
+}
+
+void triangulatePolygons(const float *points, const uint32_t *offsets,
+                         const uint32_t *indices, size_t polygonCount,
+                         uint32_t *triangles, unsigned threads) {
+    // first triangle of each polygon, so workers write disjoint ranges
+    std::vector<size_t> first(polygonCount + 1, 0);
+    for (size_t i = 0; i < polygonCount; i++) {
+        const size_t n = offsets[i + 1] - offsets[i];
+        first[i + 1] = first[i] + (n >= 3 ? n - 2 : 0);
+    }
+    parallelFor(
+        polygonCount, threads,
+        [&](size_t begin, size_t end) {
+            EarClipper clipper;
+            for (size_t i = begin; i < end; i++) {
+                const size_t n = offsets[i + 1] - offsets[i];
+                uint32_t *out = triangles + 3 * first[i];
+                const uint32_t *ring = indices + offsets[i];
+                if (n == 3) {
+                    std::copy_n(ring, 3, out);
+                } else if (n > 3) {
+                    clipper.run(points, ring, n, out);
+                }
+            }
+        },
+        kPolygonsPerThread);
+}
+
 } // namespace Geometry
 } // namespace meshTools
@@ -4,6 +4,8 @@
  */
 #pragma once
 
+#include <cstddef>
+#include <cstdint>
 #include <geometry/vector.h>
 #include <vector>
 
@@ -42,5 +44,36 @@ class Polygon {
     size_t mSize;                ///< Number of vertices in the polygon
 };
 
+/**
+ * @brief Number of triangles triangulatePolygons writes
+ * @param offsets polygonCount + 1 offsets into the index buffer
+ * @param polygonCount Number of polygons
+ * @return Sum of n - 2 over polygons with n >= 3 vertices
+ */
+size_t triangulatedCount(const uint32_t *offsets, size_t polygonCount);
+
+/**
+ * @brief Triangulate many polygons given in CSR form by ear clipping
+ *
+ * Each ring is projected onto the plane of its Newell normal and clipped
+ * on a doubly linked list; rings of 64 vertices or more also keep a
+ * z-order-curve list so the point-in-ear test only visits nearby vertices.
+ * Rings that admit no valid ear (self-intersecting, collinear or repeated
+ * points) fall back to degenerate ears and finally to clipping any
+ * vertex, so a polygon with n >= 3 vertices always yields exactly n - 2
+ * triangles, in the input winding. Polygons with fewer vertices yield
+ * none.
+ * @param points Row-major (vertexCount, 3) coordinates
+ * @param offsets polygonCount + 1 offsets into indices
+ * @param indices Concatenated polygon vertex ids
+ * @param polygonCount Number of polygons
+ * @param triangles Receives 3 * triangulatedCount() vertex ids, polygon by
+ * polygon
+ * @param threads Worker threads; 0 uses the hardware concurrency
+ */
+void triangulatePolygons(const float *points, const uint32_t *offsets,
+                         const uint32_t *indices, size_t polygonCount,
+                         uint32_t *triangles, unsigned threads = 1);
+
 } // namespace Geometry
 } // namespace meshTools
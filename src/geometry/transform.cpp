@@ -366,5 +366,146 @@ Transform Transform::perspective(float fov, float n, float f) const {
     return t;
 }
 
+namespace {
+
+// points per block; x, y, z are split into lanes of this width
+constexpr size_t kBlock = 8;
+
+// out = m * in for the 3x4 part of m (w = 1)
+void affineBlock(const float (&m)[4][4], const float *in, float *out,
+                 size_t n) {
+    float x[kBlock], y[kBlock], z[kBlock];
+    for (size_t k = 0; k < n; k++) {
+        x[k] = in[3 * k];
+        y[k] = in[3 * k + 1];
+        z[k] = in[3 * k + 2];
+    }
+    for (size_t k = 0; k < n; k++) {
+        out[3 * k] = m[0][0] * x[k] + m[0][1] * y[k] + m[0][2] * z[k] + m[0][3];
+        out[3 * k + 1] =
+            m[1][0] * x[k] + m[1][1] * y[k] + m[1][2] * z[k] + m[1][3];
+        out[3 * k + 2] =
+            m[2][0] * x[k] + m[2][1] * y[k] + m[2][2] * z[k] + m[2][3];
+    }
+}
+
+void projectiveBlock(const float (&m)[4][4], const float *in, float *out,
+                     size_t n) {
+    float x[kBlock], y[kBlock], z[kBlock];
+    for (size_t k = 0; k < n; k++) {
+        x[k] = in[3 * k];
+        y[k] = in[3 * k + 1];
+        z[k] = in[3 * k + 2];
+    }
+    for (size_t k = 0; k < n; k++) {
+        float w = m[3][0] * x[k] + m[3][1] * y[k] + m[3][2] * z[k] + m[3][3];
+        float s = w == 1.0f ? 1.0f : 1.0f / w;
+        out[3 * k] =
+            (m[0][0] * x[k] + m[0][1] * y[k] + m[0][2] * z[k] + m[0][3]) * s;
+        out[3 * k + 1] =
+            (m[1][0] * x[k] + m[1][1] * y[k] + m[1][2] * z[k] + m[1][3]) * s;
+        out[3 * k + 2] =
+            (m[2][0] * x[k] + m[2][1] * y[k] + m[2][2] * z[k] + m[2][3]) * s;
+    }
+}
+
+void normalBlock(const float (&m)[4][4], bool normalize, const float *in,
+                 float *out, size_t n) {
+    float x[kBlock], y[kBlock], z[kBlock];
+    for (size_t k = 0; k < n; k++) {
+        x[k] = in[3 * k];
+        y[k] = in[3 * k + 1];
+        z[k] = in[3 * k + 2];
+    }
+    float nx[kBlock], ny[kBlock], nz[kBlock];
+    for (size_t k = 0; k < n; k++) {
+        nx[k] = m[0][0] * x[k] + m[0][1] * y[k] + m[0][2] * z[k];
+        ny[k] = m[1][0] * x[k] + m[1][1] * y[k] + m[1][2] * z[k];
+        nz[k] = m[2][0] * x[k] + m[2][1] * y[k] + m[2][2] * z[k];
+    }
+    if (normalize) {
+        for (size_t k = 0; k < n; k++) {
+            float len2 = nx[k] * nx[k] + ny[k] * ny[k] + nz[k] * nz[k];
+            float s = len2 > 0.0f ? 1.0f / std::sqrt(len2) : 0.0f;
+            nx[k] *= s;
+            ny[k] *= s;
+            nz[k] *= s;
+        }
+    }
+    for (size_t k = 0; k < n; k++) {
+        out[3 * k] = nx[k];
+        out[3 * k + 1] = ny[k];
+        out[3 * k + 2] = nz[k];
+    }
+}
+
+template <typename Kernel>
+void forEachBlock(const float *in, float *out, size_t count, Kernel kernel) {
+    for (size_t i = 0; i < count; i += kBlock) {
+        size_t n = count - i < kBlock ? count - i : kBlock;
+        kernel(in + 3 * i, out + 3 * i, n);
+    }
+}
+
+} // namespace
+
+void Transform::applyToArray(const float *in, float *out, size_t count) const {
+    const bool affine = m[3][0] == 0.0f && m[3][1] == 0.0f && m[3][2] == 0.0f &&
+                        m[3][3] == 1.0f;
+    if (affine)
+        forEachBlock(in, out, count,
+                     [this](const float *i, float *o, size_t n) {
+                         affineBlock(m, i, o, n);
+                     });
+    else
+        forEachBlock(in, out, count,
+                     [this](const float *i, float *o, size_t n) {
+                         projectiveBlock(m, i, o, n);
+                     });
+}
+
+void Transform::applyToNormals(const float *in, float *out, size_t count,
+                               bool normalize) const {
+    // inverse-transpose of the 3x3 part = cofactor matrix / determinant
+    double c[3][3];
+    for (int i = 0; i < 3; i++)
+        for (int j = 0; j < 3; j++) {
+            int i1 = (i + 1) % 3, i2 = (i + 2) % 3;
+            int j1 = (j + 1) % 3, j2 = (j + 2) % 3;
+            c[i][j] =
+                double(m[i1][j1]) * m[i2][j2] - double(m[i1][j2]) * m[i2][j1];
+        }
+    double det = m[0][0] * c[0][0] + m[0][1] * c[0][1] + m[0][2] * c[0][2];
+    // only the sign matters when normalizing
+    double scale = det == 0.0  ? 1.0
+                   : normalize ? (det > 0 ? 1.0 : -1.0)
+                               : 1.0 / det;
+    float n[4][4] = {};
+    for (int i = 0; i < 3; i++)
+        for (int j = 0; j < 3; j++)
+            n[i][j] = static_cast<float>(c[i][j] * scale);
+    forEachBlock(in, out, count,
+                 [&n, normalize](const float *i, float *o, size_t k) {
+                     normalBlock(n, normalize, i, o, k);
+                 });
+}
+
+Transform Transform::fuse(const std::vector<Transform> &chain) {
+    double r[4][4] = {{1, 0, 0, 0}, {0, 1, 0, 0}, {0, 0, 1, 0}, {0, 0, 0, 1}};
+    for (const Transform &t : chain) {
+        double p[4][4];
+        for (int i = 0; i < 4; i++)
+            for (int j = 0; j < 4; j++)
+                p[i][j] = t.m[i][0] * r[0][j] + t.m[i][1] * r[1][j] +
+                          t.m[i][2] * r[2][j] + t.m[i][3] * r[3][j];
+        memcpy(r, p, sizeof(r));
+    }
+    Transform out;
+    for (int i = 0; i < 4; i++)
+        for (int j = 0; j < 4; j++)
+            out.m[i][j] = static_cast<float>(r[i][j]);
+    return out;
+}
+
 } // namespace Geometry
 } // namespace meshTools
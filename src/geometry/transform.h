@@ -5,8 +5,10 @@
 
 #pragma once
 
+#include <cstddef>
 #include <cstring>
 #include <string>
+#include <vector>
 
 namespace meshTools {
 namespace Geometry {
@@ -185,6 +187,41 @@ class Transform {
      */
     Vector getTranslate() const;
 
+    /**
+     * @brief Transform a buffer of points, as Vector::applyTransform does
+     *
+     * Affine matrices skip the perspective divide. Points are processed in
+     * small blocks split into x, y, z lanes so the compiler can vectorize
+     * the arithmetic.
+     * @param in Row-major (count, 3) points
+     * @param out Row-major (count, 3) result; may be the same buffer as in
+     * @param count Number of points
+     */
+    void applyToArray(const float *in, float *out, size_t count) const;
+
+    /**
+     * @brief Transform a buffer of normals by the inverse-transpose of the
+     * upper 3x3 matrix
+     *
+     * Translation and perspective are ignored. A singular matrix uses its
+     * cofactor matrix, which still maps normals of the collapsed geometry.
+     * @param in Row-major (count, 3) normals
+     * @param out Row-major (count, 3) result; may be the same buffer as in
+     * @param count Number of normals
+     * @param normalize Rescale results to unit length (zero stays zero)
+     */
+    void applyToNormals(const float *in, float *out, size_t count,
+                        bool normalize = true) const;
+
+    /**
+     * @brief Fuse a chain of transforms into one matrix
+     *
+     * The product is accumulated in double precision.
+     * @param chain Transforms in the order they are applied to a point
+     * @return Matrix applying chain[0] first and chain.back() last
+     */
+    static Transform fuse(const std::vector<Transform> &chain);
+
     /**
      * @brief Matrix multiplication operator
      * @param left Left operand matrix
@@ -0,0 +1,82 @@
+/**
+ * @file vector_array.h
+ * @brief Contiguous array of Vectors viewable as a float32 (N, 3) buffer
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <geometry/vector.h>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace meshTools {
+namespace Geometry {
+
+static_assert(sizeof(Vector) == 3 * sizeof(float) &&
+                  std::is_standard_layout<Vector>::value,
+              "Vector must be three packed floats to alias a float buffer");
+
+/**
+ * @class VectorArray
+ * @brief Fixed-size array of Vectors stored as packed x, y, z floats
+ *
+ * The storage is a std::vector<Vector>, so it can be passed by reference to
+ * any API taking const std::vector<Vector> &, and read or written as a
+ * row-major (size(), 3) float buffer through data(). The size is fixed after
+ * construction so that buffer views stay valid.
+ */
+class VectorArray {
+  public:
+    /** @brief Empty array */
+    VectorArray() = default;
+
+    /**
+     * @brief Array of count zero vectors
+     * @param count Number of vectors
+     */
+    explicit VectorArray(size_t count) : vectors_(count) {}
+
+    /**
+     * @brief Take ownership of a vector list
+     * @param vectors Vectors to store
+     */
+    explicit VectorArray(std::vector<Vector> vectors)
+        : vectors_(std::move(vectors)) {}
+
+    /**
+     * @brief Copy from a float buffer
+     * @param points Row-major (count, 3) coordinates
+     * @param count Number of vectors
+     */
+    VectorArray(const float *points, size_t count) : vectors_(count) {
+        float *out = data();
+        for (size_t i = 0; i < 3 * count; i++)
+            out[i] = points[i];
+    }
+
+    /** @brief Number of vectors */
+    size_t size() const { return vectors_.size(); }
+
+    /** @brief Row-major (size(), 3) coordinates */
+    float *data() { return reinterpret_cast<float *>(vectors_.data()); }
+    /** @brief Row-major (size(), 3) coordinates */
+    const float *data() const {
+        return reinterpret_cast<const float *>(vectors_.data());
+    }
+
+    /** @brief The vectors, for APIs taking std::vector<Vector> */
+    const std::vector<Vector> &vectors() const { return vectors_; }
+
+    /** @brief Vector at index (unchecked) */
+    Vector &operator[](size_t index) { return vectors_[index]; }
+    /** @brief Vector at index (unchecked) */
+    const Vector &operator[](size_t index) const { return vectors_[index]; }
+
+  private:
+    std::vector<Vector> vectors_;
+};
+
+} // namespace Geometry
+} // namespace meshTools
@@ -6,6 +6,9 @@
 #include <geometry/vector.h>
 #include <mesh/mesh.h>
 
+#include <algorithm>
+#include <stdexcept>
+
 namespace meshTools {
 namespace Mesh {
 
@@ -85,5 +88,233 @@ Vector Face::computeCenter() const {
     return center;
 }
 
+Mesh Mesh::fromArrays(const float *positions, size_t vertCount,
+                      const uint32_t *faceCounts, size_t faceCount,
+                      const uint32_t *faceIndices, size_t indexCount) {
+    size_t total = 0;
+    for (size_t f = 0; f < faceCount; f++)
+        total += faceCounts[f];
+    if (total != indexCount)
+        throw std::invalid_argument(
+            "face_counts do not sum to the length of face_indices");
+
+    Mesh mesh;
+    mesh.vertStore.reserve(vertCount);
+    mesh.verts.reserve(vertCount);
+    for (size_t i = 0; i < vertCount; i++) {
+        auto vert = std::make_unique<Vert>();
+        vert->id = static_cast<unsigned int>(i);
+        vert->v = Vector(positions[3 * i], positions[3 * i + 1],
+                         positions[3 * i + 2]);
+        mesh.verts.push_back(vert.get());
+        mesh.vertStore.push_back(std::move(vert));
+    }
+
+    mesh.halfEdges.resize(indexCount);
+    mesh.vertHalfEdge.assign(vertCount, -1);
+    mesh.faceHalfEdge.assign(faceCount, -1);
+    mesh.edgeHalfEdge.reserve(indexCount / 2 + 1);
+    mesh.edgeMap.reserve(indexCount / 2 + 1);
+    mesh.faceStore.reserve(faceCount);
+    mesh.faces.reserve(faceCount);
+
+    size_t base = 0;
+    for (size_t f = 0; f < faceCount; f++) {
+        const size_t n = faceCounts[f];
+        auto face = std::make_unique<Face>();
+        Face *fp = face.get();
+        fp->id = static_cast<unsigned int>(f);
+        if (n > 0)
+            mesh.faceHalfEdge[f] = static_cast<int>(base);
+
+        for (size_t k = 0; k < n; k++) {
+            const uint32_t v = faceIndices[base + k];
+            if (v >= vertCount)
+                throw std::out_of_range("face index out of range");
+            HalfEdge &he = mesh.halfEdges[base + k];
+            he.vert = static_cast<int>(v);
+            he.face = static_cast<int>(f);
+            he.next = static_cast<int>(base + (k + 1) % n);
+            he.prev = static_cast<int>(base + (k + n - 1) % n);
+            fp->verts.push_back(mesh.verts[v]);
+            mesh.verts[v]->faces.push_back(fp);
+        }
+
+        for (size_t k = 0; k < n; k++) {
+            const int h = static_cast<int>(base + k);
+            const uint32_t v0 = faceIndices[base + k];
+            const uint32_t v1 = faceIndices[base + (k + 1) % n];
+            const uint32_t next_id = static_cast<uint32_t>(mesh.edges.size());
+            auto inserted = mesh.edgeMap.try_emplace(edgeKey(v0, v1), next_id);
+            const uint32_t e = inserted.first->second;
+            Edge *ep;
+            if (inserted.second) {
+                auto edge = std::make_unique<Edge>();
+                ep = edge.get();
+                ep->id = e;
+                ep->verts[0] = mesh.verts[v0];
+                ep->verts[1] = mesh.verts[v1];
+                mesh.verts[v0]->edges.push_back(ep);
+                if (v1 != v0)
+                    mesh.verts[v1]->edges.push_back(ep);
+                mesh.edges.push_back(ep);
+                mesh.edgeStore.push_back(std::move(edge));
+                mesh.edgeHalfEdge.push_back(h);
+            } else {
+                ep = mesh.edges[e];
+                // Link manifold, consistently wound pairs only; extra or
+                // same-direction half-edges stay boundary-like.
+                HalfEdge &first = mesh.halfEdges[mesh.edgeHalfEdge[e]];
+                if (first.opposite == -1 &&
+                    first.vert != static_cast<int>(v0)) {
+                    first.opposite = h;
+                    mesh.halfEdges[h].opposite = mesh.edgeHalfEdge[e];
+                }
+            }
+            mesh.halfEdges[h].edge = static_cast<int>(e);
+            if (ep->faces.empty() || ep->faces.back() != fp)
+                ep->faces.push_back(fp);
+            fp->edges.push_back(ep);
+            if (mesh.vertHalfEdge[v0] == -1)
+                mesh.vertHalfEdge[v0] = h;
+        }
+
+        fp->normal = fp->computeNormal();
+        mesh.faces.push_back(fp);
+        mesh.faceStore.push_back(std::move(face));
+        base += n;
+    }
+
+    // Boundary vertices start their fan on an unpaired outgoing half-edge
+    for (size_t h = 0; h < mesh.halfEdges.size(); h++) {
+        if (mesh.halfEdges[h].opposite == -1)
+            mesh.vertHalfEdge[mesh.halfEdges[h].vert] = static_cast<int>(h);
+    }
+    return mesh;
+}
+
+int Mesh::findEdge(uint32_t v0, uint32_t v1) const {
+    auto it = edgeMap.find(edgeKey(v0, v1));
+    return it == edgeMap.end() ? -1 : static_cast<int>(it->second);
+}
+
+int Mesh::findHalfEdge(uint32_t from, uint32_t to) const {
+    const int e = findEdge(from, to);
+    if (e < 0)
+        return -1;
+    const int h = edgeHalfEdge[e];
+    if (halfEdges[h].vert == static_cast<int>(from) &&
+        target(h) == static_cast<int>(to))
+        return h;
+    const int o = halfEdges[h].opposite;
+    if (o >= 0 && halfEdges[o].vert == static_cast<int>(from))
+        return o;
+    return -1;
+}
+
+std::vector<uint32_t> Mesh::vertexNeighbors(uint32_t v) const {
+    const Vert *vert = verts.at(v);
+    std::vector<uint32_t> n;
+    n.reserve(vert->edges.size());
+    for (const Edge *e : vert->edges)
+        n.push_back(e->verts[0] == vert ? e->verts[1]->id : e->verts[0]->id);
+    return n;
+}
+
+std::vector<uint32_t> Mesh::oneRing(uint32_t v) const {
+    std::vector<uint32_t> ring;
+    const int start = vertHalfEdge.at(v);
+    if (start < 0)
+        return ring;
+    int h = start;
+    do {
+        ring.push_back(target(h));
+        const int in = halfEdges[h].prev;
+        const int o = halfEdges[in].opposite;
+        if (o < 0) {
+            ring.push_back(halfEdges[in].vert);
+            break;
+        }
+        h = o;
+    } while (h != start && ring.size() <= halfEdges.size());
+
+    for (uint32_t n : vertexNeighbors(v)) {
+        if (std::find(ring.begin(), ring.end(), n) == ring.end())
+            ring.push_back(n);
+    }
+    return ring;
+}
+
+std::vector<uint32_t>
+Mesh::faceNeighbors(uint32_t v, const std::vector<uint32_t> &faceIds) const {
+    std::vector<uint32_t> result;
+    auto add = [&result](uint32_t n) {
+        if (std::find(result.begin(), result.end(), n) == result.end())
+            result.push_back(n);
+    };
+    for (uint32_t f : faceIds) {
+        const int start = faceHalfEdge.at(f);
+        if (start < 0)
+            continue;
+        int h = start;
+        do {
+            if (halfEdges[h].vert == static_cast<int>(v)) {
+                add(halfEdges[halfEdges[h].prev].vert);
+                add(target(h));
+                break;
+            }
+            h = halfEdges[h].next;
+        } while (h != start);
+    }
+    return result;
+}
+
+std::vector<uint32_t> Mesh::vertexFaces(uint32_t v) const {
+    std::vector<uint32_t> result;
+    for (const Face *f : verts.at(v)->faces)
+        result.push_back(f->id);
+    return result;
+}
+
+std::vector<uint32_t> Mesh::edgeFaces(uint32_t e) const {
+    std::vector<uint32_t> result;
+    for (const Face *f : edges.at(e)->faces)
+        result.push_back(f->id);
+    return result;
+}
+
+std::vector<uint32_t> Mesh::faceEdges(uint32_t f) const {
+    std::vector<uint32_t> result;
+    for (const Edge *e : faces.at(f)->edges)
+        result.push_back(e->id);
+    return result;
+}
+
+std::vector<uint32_t> Mesh::edgeVerts(uint32_t e) const {
+    const Edge *edge = edges.at(e);
+    return {edge->verts[0]->id, edge->verts[1]->id};
+}
+
+bool Mesh::isBoundaryEdge(uint32_t e) const {
+    return edges.at(e)->faces.size() < 2;
+}
+
+bool Mesh::isBoundaryVertex(uint32_t v) const {
+    for (const Edge *e : verts.at(v)->edges) {
+        if (e->faces.size() < 2)
+            return true;
+    }
+    return false;
+}
+
+std::vector<uint32_t> Mesh::boundaryEdges() const {
+    std::vector<uint32_t> result;
+    for (const Edge *e : edges) {
+        if (e->faces.size() < 2)
+            result.push_back(e->id);
+    }
+    return result;
+}
+
 } // namespace Mesh
 } // namespace meshTools
\ No newline at end of file
@@ -5,8 +5,13 @@
 
 #pragma once
 
+#include <cstddef>
+#include <cstdint>
 #include <geometry/bbox.h>
 #include <geometry/vector.h>
+#include <memory>
+#include <string>
+#include <unordered_map>
 #include <vector>
 
 namespace meshTools {
@@ -157,11 +162,29 @@ class Face {
     Vert *operator[](const size_t &index) const { return verts[index]; }
 };
 
+/**
+ * @struct HalfEdge
+ * @brief Directed edge of a face loop
+ *
+ * Half-edges are stored by index in Mesh::halfEdges. Each face owns one
+ * half-edge per corner; two half-edges of a manifold edge are opposite.
+ */
+struct HalfEdge {
+    int vert = -1;     ///< Origin vertex id
+    int face = -1;     ///< Owning face id
+    int edge = -1;     ///< Undirected edge id
+    int next = -1;     ///< Next half-edge in the face loop
+    int prev = -1;     ///< Previous half-edge in the face loop
+    int opposite = -1; ///< Opposite half-edge, -1 on a boundary
+};
+
 /**
  * @class Mesh
  * @brief Mesh container class
  *
  * Main mesh data structure containing vertices, edges, faces, and bounding box.
+ * Meshes built with fromArrays() own their Vert/Edge/Face objects and carry a
+ * half-edge index; they can be moved but not copied.
  */
 class Mesh {
   public:
@@ -171,11 +194,161 @@ class Mesh {
      */
     Mesh() { mode = "generic"; }
 
+    Mesh(const Mesh &) = delete;
+    Mesh &operator=(const Mesh &) = delete;
+    Mesh(Mesh &&) = default;
+    Mesh &operator=(Mesh &&) = default;
+
+    /**
+     * @brief Build a mesh and its half-edge index from flat buffers
+     *
+     * Runs in a single pass over the face corners; undirected edges are
+     * found through a hash map keyed on the sorted vertex pair.
+     *
+     * @param positions Vertex positions, 3 floats per vertex
+     * @param vertCount Number of vertices
+     * @param faceCounts Number of corners of each face
+     * @param faceCount Number of faces
+     * @param faceIndices Concatenated face vertex ids
+     * @param indexCount Length of faceIndices
+     * @return Built mesh
+     * @throws std::invalid_argument If faceCounts does not sum to indexCount
+     * @throws std::out_of_range If a face index is not a valid vertex id
+     */
+    static Mesh fromArrays(const float *positions, size_t vertCount,
+                           const uint32_t *faceCounts, size_t faceCount,
+                           const uint32_t *faceIndices, size_t indexCount);
+
+    /**
+     * @brief Find the undirected edge joining two vertices
+     * @param v0 First vertex id
+     * @param v1 Second vertex id
+     * @return Edge id, or -1 if the vertices are not connected
+     */
+    int findEdge(uint32_t v0, uint32_t v1) const;
+
+    /**
+     * @brief Find the half-edge running from one vertex to another
+     * @param from Origin vertex id
+     * @param to Target vertex id
+     * @return Half-edge id, or -1 if there is none
+     */
+    int findHalfEdge(uint32_t from, uint32_t to) const;
+
+    /**
+     * @brief Get the opposite half-edge
+     * @param h Half-edge id
+     * @return Opposite half-edge id, or -1 on a boundary
+     */
+    int opposite(uint32_t h) const { return halfEdges[h].opposite; }
+
+    /**
+     * @brief Get the target vertex of a half-edge
+     * @param h Half-edge id
+     * @return Vertex id the half-edge points to
+     */
+    int target(uint32_t h) const { return halfEdges[halfEdges[h].next].vert; }
+
+    /**
+     * @brief Get the vertices sharing an edge with a vertex
+     * @param v Vertex id
+     * @return Neighbor vertex ids, unordered
+     */
+    std::vector<uint32_t> vertexNeighbors(uint32_t v) const;
+
+    /**
+     * @brief Get the ordered one-ring of a vertex
+     *
+     * Walks the outgoing half-edges around the vertex; on a boundary vertex
+     * the walk starts and ends on the boundary. Neighbors a non-manifold
+     * vertex has outside the walked fan are appended at the end.
+     *
+     * @param v Vertex id
+     * @return Neighbor vertex ids in fan order
+     */
+    std::vector<uint32_t> oneRing(uint32_t v) const;
+
+    /**
+     * @brief Get the corner neighbors of a vertex within given faces
+     *
+     * For each face containing the vertex, appends the previous and next
+     * corner of the face loop, skipping vertices already collected.
+     *
+     * @param v Vertex id
+     * @param faceIds Faces to look in
+     * @return Neighbor vertex ids in face order
+     */
+    std::vector<uint32_t>
+    faceNeighbors(uint32_t v, const std::vector<uint32_t> &faceIds) const;
+
+    /**
+     * @brief Get the faces using a vertex
+     * @param v Vertex id
+     * @return Face ids
+     */
+    std::vector<uint32_t> vertexFaces(uint32_t v) const;
+
+    /**
+     * @brief Get the faces sharing an edge
+     * @param e Edge id
+     * @return Face ids
+     */
+    std::vector<uint32_t> edgeFaces(uint32_t e) const;
+
+    /**
+     * @brief Get the edges of a face in loop order
+     * @param f Face id
+     * @return Edge ids
+     */
+    std::vector<uint32_t> faceEdges(uint32_t f) const;
+
+    /**
+     * @brief Get the two vertex ids of an edge
+     * @param e Edge id
+     * @return Vertex ids
+     */
+    std::vector<uint32_t> edgeVerts(uint32_t e) const;
+
+    /**
+     * @brief Check whether an edge has fewer than two faces
+     * @param e Edge id
+     * @return True if the edge lies on a boundary
+     */
+    bool isBoundaryEdge(uint32_t e) const;
+
+    /**
+     * @brief Check whether a vertex lies on a boundary edge
+     * @param v Vertex id
+     * @return True if the vertex lies on a boundary
+     */
+    bool isBoundaryVertex(uint32_t v) const;
+
+    /**
+     * @brief Get all boundary edges
+     * @return Edge ids with fewer than two faces
+     */
+    std::vector<uint32_t> boundaryEdges() const;
+
     std::string mode;          ///< Mesh mode (e.g., "generic")
     std::vector<Vert *> verts; ///< All vertices in the mesh
     std::vector<Edge *> edges; ///< All edges in the mesh
     std::vector<Face *> faces; ///< All faces in the mesh
     Bbox bbox;                 ///< Bounding box of the mesh
+
+    std::vector<HalfEdge> halfEdges; ///< Half-edges, one per face corner
+    std::vector<int> vertHalfEdge;   ///< Outgoing half-edge per vertex
+    std::vector<int> edgeHalfEdge;   ///< First half-edge per edge
+    std::vector<int> faceHalfEdge;   ///< First half-edge per face
+
+  private:
+    static uint64_t edgeKey(uint32_t v0, uint32_t v1) {
+        return v0 < v1 ? (uint64_t(v0) << 32) | v1 : (uint64_t(v1) << 32) | v0;
+    }
+
+    std::unordered_map<uint64_t, uint32_t> edgeMap;
+    std::vector<std::unique_ptr<Vert>> vertStore;
+    std::vector<std::unique_ptr<Edge>> edgeStore;
+    std::vector<std::unique_ptr<Face>> faceStore;
 };
 
 } // namespace Mesh
@@ -0,0 +1,326 @@
+/**
+ * @file mesh_io.cpp
+ * @brief Implementation of the OBJ and PLY tokenizers
+ */
+
+#include <mesh/mesh_io.h>
+
+#include <algorithm>
+#include <charconv>
+#include <cmath>
+#include <cstring>
+#include <stdexcept>
+
+namespace meshTools {
+namespace Mesh {
+
+namespace {
+
+inline bool isBlank(char c) { return c == ' ' || c == '\t' || c == '\r'; }
+
+inline bool isSpace(char c) { return isBlank(c) || c == '\n' || c == '\f'; }
+
+inline const char *skipBlanks(const char *p, const char *end) {
+    while (p < end && isBlank(*p))
+        ++p;
+    return p;
+}
+
+/** Parse a number at p (an optional leading '+' is allowed). */
+template <class T>
+inline const char *parse(const char *p, const char *end, T &value) {
+    if (p < end && *p == '+')
+        ++p;
+    const auto result = std::from_chars(p, end, value);
+    return result.ec == std::errc() ? result.ptr : nullptr;
+}
+
+/** 0-based id of a 1-based or negative (relative) OBJ reference. */
+inline bool resolve(long long id, size_t total, int32_t &out) {
+    if (id > 0)
+        out = static_cast<int32_t>(id - 1);
+    else if (id < 0 && static_cast<size_t>(-id) <= total)
+        out = static_cast<int32_t>(static_cast<long long>(total) + id);
+    else
+        return false;
+    return true;
+}
+
+inline bool hostIsBigEndian() {
+    const uint16_t one = 1;
+    uint8_t first;
+    std::memcpy(&first, &one, 1);
+    return first == 0;
+}
+
+/** Read one integer-valued PLY scalar. */
+inline long long readScalar(const uint8_t *p, PlyType type, bool swap) {
+    uint8_t bytes[8];
+    const size_t size = plyTypeSize(type);
+    std::memcpy(bytes, p, size);
+    if (swap)
+        std::reverse(bytes, bytes + size);
+    switch (type) {
+    case PlyType::Int8: {
+        int8_t v;
+        std::memcpy(&v, bytes, 1);
+        return v;
+    }
+    case PlyType::UInt8:
+        return bytes[0];
+    case PlyType::Int16: {
+        int16_t v;
+        std::memcpy(&v, bytes, 2);
+        return v;
+    }
+    case PlyType::UInt16: {
+        uint16_t v;
+        std::memcpy(&v, bytes, 2);
+        return v;
+    }
+    case PlyType::Int32: {
+        int32_t v;
+        std::memcpy(&v, bytes, 4);
+        return v;
+    }
+    case PlyType::UInt32: {
+        uint32_t v;
+        std::memcpy(&v, bytes, 4);
+        return v;
+    }
+    case PlyType::Float32: {
+        float v;
+        std::memcpy(&v, bytes, 4);
+        return static_cast<long long>(v);
+    }
+    case PlyType::Float64: {
+        double v;
+        std::memcpy(&v, bytes, 8);
+        return static_cast<long long>(v);
+    }
+    }
+    return 0;
+}
+
+} // namespace
+
+void ObjReader::feed(const char *data, size_t size) {
+    const char *p = data;
+    const char *end = data + size;
+    while (p < end) {
+        const char *eol =
+            static_cast<const char *>(std::memchr(p, '\n', end - p));
+        if (!eol)
+            eol = end;
+        ++line;
+        parseLine(p, eol);
+        p = eol + 1;
+    }
+}
+
+void ObjReader::clear() {
+    positions.clear();
+    uvs.clear();
+    faceCounts.clear();
+    faceIndices.clear();
+    faceUvIndices.clear();
+}
+
+void ObjReader::parseLine(const char *p, const char *end) {
+    p = skipBlanks(p, end);
+    if (p == end || *p == '#')
+        return;
+    const char *keyword = p;
+    while (p < end && !isBlank(*p))
+        ++p;
+    const size_t length = p - keyword;
+    const auto fail = [this](const char *what) {
+        throw std::invalid_argument("OBJ line " + std::to_string(line) +
+                                    ": malformed " + what + " statement");
+    };
+
+    if (length == 1 && keyword[0] == 'v') {
+        float xyz[3];
+        for (float &value : xyz) {
+            p = parse(skipBlanks(p, end), end, value);
+            if (!p)
+                fail("v");
+        }
+        positions.insert(positions.end(), xyz, xyz + 3);
+        ++vertexTotal;
+    } else if (length == 2 && keyword[0] == 'v' && keyword[1] == 't') {
+        ++uvTotal;
+        if (topologyOnly)
+            return;
+        float uvw[3] = {0.0f, 0.0f, 0.0f};
+        for (int i = 0; i < 3; ++i) {
+            p = skipBlanks(p, end);
+            if (p == end && i > 0)
+                break;
+            p = parse(p, end, uvw[i]);
+            if (!p)
+                fail("vt");
+        }
+        uvs.insert(uvs.end(), uvw, uvw + 3);
+    } else if (length == 1 && keyword[0] == 'f') {
+        uint32_t count = 0;
+        while (true) {
+            p = skipBlanks(p, end);
+            if (p == end)
+                break;
+            long long id;
+            int32_t vertex, uv = -1;
+            p = parse(p, end, id);
+            if (!p || !resolve(id, vertexTotal, vertex))
+                fail("f");
+            if (p < end && *p == '/') {
+                ++p;
+                if (p < end && *p != '/') {
+                    p = parse(p, end, id);
+                    if (!p || !resolve(id, uvTotal, uv))
+                        fail("f");
+                }
+                if (p < end && *p == '/') {
+                    ++p;
+                    // normal id: not stored
+                    p = parse(p, end, id);
+                    if (!p)
+                        fail("f");
+                }
+            }
+            if (p < end && !isBlank(*p))
+                fail("f");
+            faceIndices.push_back(vertex);
+            if (!topologyOnly)
+                faceUvIndices.push_back(uv);
+            ++count;
+        }
+        if (count < 3)
+            fail("f");
+        faceCounts.push_back(count);
+    }
+}
+
+PlyType plyType(const std::string &name) {
+    if (name == "char" || name == "int8")
+        return PlyType::Int8;
+    if (name == "uchar" || name == "uint8")
+        return PlyType::UInt8;
+    if (name == "short" || name == "int16")
+        return PlyType::Int16;
+    if (name == "ushort" || name == "uint16")
+        return PlyType::UInt16;
+    if (name == "int" || name == "int32")
+        return PlyType::Int32;
+    if (name == "uint" || name == "uint32")
+        return PlyType::UInt32;
+    if (name == "float" || name == "float32")
+        return PlyType::Float32;
+    if (name == "double" || name == "float64")
+        return PlyType::Float64;
+    throw std::invalid_argument("unknown PLY type '" + name + "'");
+}
+
+size_t plyTypeSize(PlyType type) {
+    switch (type) {
+    case PlyType::Int8:
+    case PlyType::UInt8:
+        return 1;
+    case PlyType::Int16:
+    case PlyType::UInt16:
+        return 2;
+    case PlyType::Int32:
+    case PlyType::UInt32:
+    case PlyType::Float32:
+        return 4;
+    case PlyType::Float64:
+        return 8;
+    }
+    return 0;
+}
+
+size_t parseNumbers(const char *data, size_t size, std::vector<double> &out) {
+    const char *p = data;
+    const char *end = data + size;
+    size_t parsed = 0;
+    while (true) {
+        while (p < end && isSpace(*p))
+            ++p;
+        if (p == end)
+            break;
+        const char *token = p;
+        while (p < end && !isSpace(*p))
+            ++p;
+        double value;
+        if (parse(token, p, value) != p)
+            throw std::invalid_argument("not a number: '" +
+                                        std::string(token, p) + "'");
+        out.push_back(value);
+        ++parsed;
+    }
+    return parsed;
+}
+
+size_t decodeTextLists(const double *values, size_t size, size_t before,
+                       size_t after, size_t maxRows,
+                       std::vector<uint32_t> &counts,
+                       std::vector<int32_t> &indices) {
+    size_t pos = 0;
+    for (size_t row = 0; row < maxRows; ++row) {
+        if (pos + before >= size)
+            break;
+        const double count = values[pos + before];
+        if (count < 0 || count != std::floor(count))
+            throw std::invalid_argument("bad PLY list count");
+        const size_t n = static_cast<size_t>(count);
+        const size_t first = pos + before + 1;
+        if (first + n + after > size)
+            break;
+        counts.push_back(static_cast<uint32_t>(n));
+        for (size_t i = 0; i < n; ++i)
+            indices.push_back(static_cast<int32_t>(values[first + i]));
+        pos = first + n + after;
+    }
+    return pos;
+}
+
+size_t decodeBinaryLists(const uint8_t *data, size_t size, PlyType countType,
+                         PlyType indexType, size_t before, size_t after,
+                         bool bigEndian, size_t maxRows,
+                         std::vector<uint32_t> &counts,
+                         std::vector<int32_t> &indices) {
+    const bool swap = bigEndian != hostIsBigEndian();
+    const size_t countSize = plyTypeSize(countType);
+    const size_t indexSize = plyTypeSize(indexType);
+    // ids stored as native 32-bit ints are copied a row at a time
+    const bool direct =
+        !swap && (indexType == PlyType::Int32 || indexType == PlyType::UInt32);
+    size_t pos = 0;
+    for (size_t row = 0; row < maxRows; ++row) {
+        if (pos + before + countSize > size)
+            break;
+        const long long count =
+            readScalar(data + pos + before, countType, swap);
+        if (count < 0)
+            throw std::invalid_argument("bad PLY list count");
+        const size_t n = static_cast<size_t>(count);
+        const size_t first = pos + before + countSize;
+        if (first + n * indexSize + after > size)
+            break;
+        counts.push_back(static_cast<uint32_t>(n));
+        if (direct) {
+            const size_t offset = indices.size();
+            indices.resize(offset + n);
+            std::memcpy(indices.data() + offset, data + first, n * 4);
+        } else {
+            for (size_t i = 0; i < n; ++i)
+                indices.push_back(static_cast<int32_t>(
+                    readScalar(data + first + i * indexSize, indexType, swap)));
+        }
+        pos = first + n * indexSize + after;
+    }
+    return pos;
+}
+
+} // namespace Mesh
+} // namespace meshTools
@@ -0,0 +1,124 @@
+/**
+ * @file mesh_io.h
+ * @brief Chunked tokenizers for Wavefront OBJ and PLY mesh files
+ *
+ * The readers work on one chunk of the file at a time and append what they
+ * parse to flat arrays (positions, CSR faces, UVs), so a caller can stream
+ * a file of any size through a fixed-size buffer and move the arrays out
+ * between chunks. Chunks must end on a line (OBJ) or token (ASCII PLY)
+ * boundary; binary PLY chunks may end anywhere.
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <vector>
+
+namespace meshTools {
+namespace Mesh {
+
+/**
+ * @class ObjReader
+ * @brief Incremental Wavefront OBJ parser
+ *
+ * Reads v, vt and f statements and ignores everything else (vn, l, o, g,
+ * s, usemtl, comments...). Face corners may be v, v/vt, v//vn or v/vt/vn;
+ * negative (relative) ids are resolved against the vertices and UVs seen
+ * so far. Ids are returned 0-based and are not range-checked.
+ */
+class ObjReader {
+  public:
+    /**
+     * @param topologyOnly Skip vt statements and face UV ids.
+     */
+    explicit ObjReader(bool topologyOnly = false)
+        : topologyOnly(topologyOnly) {}
+
+    /**
+     * @brief Parse whole lines; the last line may lack its newline.
+     * @throws std::invalid_argument On a malformed v, vt or f statement.
+     */
+    void feed(const char *data, size_t size);
+
+    /** @brief Drop the parsed arrays; running counts are kept. */
+    void clear();
+
+    bool topologyOnly;
+    std::vector<float> positions;       ///< x, y, z per vertex
+    std::vector<float> uvs;             ///< u, v, w per UV (missing are 0)
+    std::vector<uint32_t> faceCounts;   ///< Corners per face
+    std::vector<int32_t> faceIndices;   ///< Vertex id per corner
+    std::vector<int32_t> faceUvIndices; ///< UV id per corner, -1 if none
+    size_t vertexTotal = 0;             ///< Vertices parsed over all chunks
+    size_t uvTotal = 0;                 ///< UVs parsed over all chunks
+    size_t line = 0;                    ///< Lines parsed over all chunks
+
+  private:
+    void parseLine(const char *begin, const char *end);
+};
+
+/** @brief Scalar types of PLY properties. */
+enum class PlyType {
+    Int8,
+    UInt8,
+    Int16,
+    UInt16,
+    Int32,
+    UInt32,
+    Float32,
+    Float64
+};
+
+/**
+ * @brief PlyType from a PLY type name ("uchar", "uint8", "int", ...).
+ * @throws std::invalid_argument Unknown name.
+ */
+PlyType plyType(const std::string &name);
+
+/** @brief Size of a PlyType in bytes. */
+size_t plyTypeSize(PlyType type);
+
+/**
+ * @brief Parse whitespace-separated ASCII numbers.
+ * @param out Receives the values.
+ * @return Number of values parsed.
+ * @throws std::invalid_argument On a token that is not a number.
+ */
+size_t parseNumbers(const char *data, size_t size, std::vector<double> &out);
+
+/**
+ * @brief Decode PLY rows made of a list of vertex ids between fixed-size
+ * fields, from already parsed ASCII values.
+ *
+ * Each row is `before` values, a count, count ids and `after` values.
+ * Stops after maxRows rows or before a row that is not complete.
+ *
+ * @return Number of values consumed.
+ * @throws std::invalid_argument Negative or non-integer count.
+ */
+size_t decodeTextLists(const double *values, size_t size, size_t before,
+                       size_t after, size_t maxRows,
+                       std::vector<uint32_t> &counts,
+                       std::vector<int32_t> &indices);
+
+/**
+ * @brief Decode binary PLY rows made of a list of vertex ids between
+ * fixed-size fields.
+ *
+ * Each row is `before` bytes, a count of countType, count ids of indexType
+ * and `after` bytes. Stops after maxRows rows or before a row that is not
+ * complete in data.
+ *
+ * @param bigEndian Values are stored big-endian.
+ * @return Number of bytes consumed.
+ */
+size_t decodeBinaryLists(const uint8_t *data, size_t size, PlyType countType,
+                         PlyType indexType, size_t before, size_t after,
+                         bool bigEndian, size_t maxRows,
+                         std::vector<uint32_t> &counts,
+                         std::vector<int32_t> &indices);
+
+} // namespace Mesh
+} // namespace meshTools
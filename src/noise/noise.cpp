@@ -3,15 +3,39 @@
  * @brief Implementation of Simplex-style procedural noise
  */
 
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <stdexcept>
+
+#include <geometry/parallel.h>
 #include <noise/noise.h>
 #include <noise/noise_tables.h>
 
+// The AVX2 packet kernel is compiled for AVX2 with a target attribute and
+// picked at run time on GCC/Clang x86; MSVC builds it only under /arch:AVX2.
+#if (defined(__GNUC__) || defined(__clang__)) &&                               \
+    (defined(__x86_64__) || defined(__i386__))
+#define MESHTOOLS_NOISE_AVX2 1
+#define MESHTOOLS_AVX2_TARGET __attribute__((target("avx2")))
+#elif defined(_MSC_VER) && defined(__AVX2__)
+#define MESHTOOLS_NOISE_AVX2 1
+#define MESHTOOLS_AVX2_TARGET
+#endif
+
+#ifdef MESHTOOLS_NOISE_AVX2
+#include <immintrin.h>
+#endif
+
 namespace meshTools {
 namespace Noise {
 
+using Geometry::parallelFor;
+
 namespace {
 
 constexpr int TABMASK = 0xFF;
+constexpr size_t kLanes = Noise::kPacketSize;
 
 inline int floor2int(float val) {
     int i = static_cast<int>(std::floor(val));
@@ -20,6 +44,199 @@ inline int floor2int(float val) {
 
 inline float lerp(float t, float a, float b) { return a + (b - a) * t; }
 
+bool cpuHasAvx2() {
+#if defined(MESHTOOLS_NOISE_AVX2) && defined(_MSC_VER)
+    return true;
+#elif defined(MESHTOOLS_NOISE_AVX2)
+    return __builtin_cpu_supports("avx2");
+#else
+    return false;
+#endif
+}
+
+std::atomic<bool> useSimd{cpuHasAvx2()};
+
+#ifdef MESHTOOLS_NOISE_AVX2
+
+/** perm widened to 32 bits for the gathers. */
+struct PermTable {
+    int32_t values[256];
+    PermTable() {
+        for (int i = 0; i < 256; ++i)
+            values[i] = perm[i];
+    }
+};
+const PermTable permTable;
+
+MESHTOOLS_AVX2_TARGET inline __m256i permLanes(__m256i i) {
+    return _mm256_i32gather_epi32(
+        permTable.values, _mm256_and_si256(i, _mm256_set1_epi32(TABMASK)), 4);
+}
+
+/** floor2int on 8 lanes. */
+MESHTOOLS_AVX2_TARGET inline __m256i floorLanes(__m256 v) {
+    __m256i i = _mm256_cvttps_epi32(_mm256_floor_ps(v));
+    __m256 below =
+        _mm256_and_ps(_mm256_cmp_ps(v, _mm256_setzero_ps(), _CMP_LT_OQ),
+                      _mm256_cmp_ps(v, _mm256_cvtepi32_ps(i), _CMP_NEQ_UQ));
+    // true lanes are all ones, i.e. -1
+    return _mm256_add_epi32(i, _mm256_castps_si256(below));
+}
+
+/** Gradient at table index i dotted with (rx, ry, rz). */
+MESHTOOLS_AVX2_TARGET inline __m256 gradLanes(__m256i i, __m256 rx, __m256 ry,
+                                              __m256 rz) {
+    const float *g = &grads3[0][0];
+    __m256i row = _mm256_add_epi32(i, _mm256_add_epi32(i, i));
+    __m256 gx = _mm256_i32gather_ps(g, row, 4);
+    __m256 gy = _mm256_i32gather_ps(g + 1, row, 4);
+    __m256 gz = _mm256_i32gather_ps(g + 2, row, 4);
+    return _mm256_add_ps(
+        _mm256_add_ps(_mm256_mul_ps(gx, rx), _mm256_mul_ps(gy, ry)),
+        _mm256_mul_ps(gz, rz));
+}
+
+/** Corner term for x cell xi, given the inner tabindex3 lookup p. */
+MESHTOOLS_AVX2_TARGET inline __m256 corner(__m256i xi, __m256i p, __m256 rx,
+                                           __m256 ry, __m256 rz) {
+    return gradLanes(permLanes(_mm256_add_epi32(xi, p)), rx, ry, rz);
+}
+
+MESHTOOLS_AVX2_TARGET inline __m256 lerpLanes(__m256 t, __m256 a, __m256 b) {
+    return _mm256_add_ps(a, _mm256_mul_ps(_mm256_sub_ps(b, a), t));
+}
+
+MESHTOOLS_AVX2_TARGET inline __m256 smoothLanes(__m256 r) {
+    return _mm256_mul_ps(_mm256_mul_ps(r, r),
+                         _mm256_sub_ps(_mm256_set1_ps(3.f),
+                                       _mm256_mul_ps(_mm256_set1_ps(2.f), r)));
+}
+
+/**
+ * noise3d on 8 lanes, operation for operation, so every lane matches the
+ * scalar result exactly.
+ */
+MESHTOOLS_AVX2_TARGET void noise3dAvx2(const float *x, const float *y,
+                                       const float *z, float *out) {
+    const __m256 px = _mm256_loadu_ps(x), py = _mm256_loadu_ps(y),
+                 pz = _mm256_loadu_ps(z);
+    const __m256 one = _mm256_set1_ps(1.f);
+    const __m256i ione = _mm256_set1_epi32(1);
+    const __m256i ix = floorLanes(px), iy = floorLanes(py), iz = floorLanes(pz);
+    const __m256 rx0 = _mm256_sub_ps(px, _mm256_cvtepi32_ps(ix));
+    const __m256 ry0 = _mm256_sub_ps(py, _mm256_cvtepi32_ps(iy));
+    const __m256 rz0 = _mm256_sub_ps(pz, _mm256_cvtepi32_ps(iz));
+    const __m256 rx1 = _mm256_sub_ps(rx0, one), ry1 = _mm256_sub_ps(ry0, one),
+                 rz1 = _mm256_sub_ps(rz0, one);
+    const __m256 sx = smoothLanes(rx0), sy = smoothLanes(ry0),
+                 sz = smoothLanes(rz0);
+    const __m256i ix1 = _mm256_add_epi32(ix, ione),
+                  iy1 = _mm256_add_epi32(iy, ione);
+    // tabindex3 shares its inner lookups between the eight corners
+    const __m256i pz0 = permLanes(iz);
+    const __m256i pz1 = permLanes(_mm256_add_epi32(iz, ione));
+    const __m256i p00 = permLanes(_mm256_add_epi32(iy, pz0));
+    const __m256i p10 = permLanes(_mm256_add_epi32(iy1, pz0));
+    const __m256i p01 = permLanes(_mm256_add_epi32(iy, pz1));
+    const __m256i p11 = permLanes(_mm256_add_epi32(iy1, pz1));
+    __m256 a = lerpLanes(sx, corner(ix, p00, rx0, ry0, rz0),
+                         corner(ix1, p00, rx1, ry0, rz0));
+    __m256 b = lerpLanes(sx, corner(ix, p10, rx0, ry1, rz0),
+                         corner(ix1, p10, rx1, ry1, rz0));
+    const __m256 c = lerpLanes(sy, a, b);
+    a = lerpLanes(sx, corner(ix, p01, rx0, ry0, rz1),
+                  corner(ix1, p01, rx1, ry0, rz1));
+    b = lerpLanes(sx, corner(ix, p11, rx0, ry1, rz1),
+                  corner(ix1, p11, rx1, ry1, rz1));
+    const __m256 d = lerpLanes(sy, a, b);
+    _mm256_storeu_ps(out, lerpLanes(sz, c, d));
+}
+
+#endif
+
+/** fBm (Absolute = false) or turbulence on one packet. */
+template <bool Absolute>
+void fractalPacket(const Noise &noise, const float *x, const float *y,
+                   const float *z, int octaves, float lacunarity, float gain,
+                   float *out) {
+    float px[kLanes], py[kLanes], pz[kLanes], n[kLanes];
+    float res[kLanes] = {};
+    std::copy(x, x + kLanes, px);
+    std::copy(y, y + kLanes, py);
+    std::copy(z, z + kLanes, pz);
+    float amp = 1.f;
+    for (int i = 0; i < octaves; ++i) {
+        noise.snoisePacket(px, py, pz, n);
+        for (size_t l = 0; l < kLanes; ++l) {
+            res[l] += amp * (Absolute && n[l] < 0.f ? -n[l] : n[l]);
+            px[l] *= lacunarity;
+            py[l] *= lacunarity;
+            pz[l] *= lacunarity;
+        }
+        amp *= gain;
+    }
+    for (size_t l = 0; l < kLanes; ++l)
+        out[l] = 0.5f * (res[l] + 1.f);
+}
+
+/** vfBm (Absolute = false) or vturbulence on one packet. */
+template <bool Absolute>
+void vfractalPacket(const Noise &noise, const float *x, const float *y,
+                    const float *z, int octaves, float lacunarity, float gain,
+                    float *ox, float *oy, float *oz) {
+    float px[kLanes], py[kLanes], pz[kLanes], px10[kLanes], py10[kLanes];
+    float n[3][kLanes];
+    float *o[3] = {ox, oy, oz};
+    std::copy(x, x + kLanes, px);
+    std::copy(y, y + kLanes, py);
+    std::copy(z, z + kLanes, pz);
+    for (float *lanes : o)
+        std::fill(lanes, lanes + kLanes, 0.f);
+    float amp = 1.f;
+    for (int i = 0; i < octaves; ++i) {
+        // vsnoise offsets: (x, y, z), (x + 10, y, z), (x + 10, y + 10, z)
+        for (size_t l = 0; l < kLanes; ++l) {
+            px10[l] = px[l] + 10.f;
+            py10[l] = py[l] + 10.f;
+        }
+        noise.snoisePacket(px, py, pz, n[0]);
+        noise.snoisePacket(px10, py, pz, n[1]);
+        noise.snoisePacket(px10, py10, pz, n[2]);
+        for (int c = 0; c < 3; ++c)
+            for (size_t l = 0; l < kLanes; ++l) {
+                const float v = n[c][l];
+                o[c][l] += amp * (Absolute && v < 0.f ? -v : v);
+            }
+        for (size_t l = 0; l < kLanes; ++l) {
+            px[l] *= lacunarity;
+            py[l] *= lacunarity;
+            pz[l] *= lacunarity;
+        }
+        amp *= gain;
+    }
+}
+
+/**
+ * Call kernel(first, n, x, y, z) on packets of (x, y, z) points in
+ * [begin, end); the last packet is padded with zeros past its n points.
+ */
+template <typename Kernel>
+void forPackets(const float *points, size_t begin, size_t end,
+                const Kernel &kernel) {
+    float x[kLanes], y[kLanes], z[kLanes];
+    for (size_t first = begin; first < end; first += kLanes) {
+        const size_t n = std::min(kLanes, end - first);
+        const float *p = points + first * 3;
+        for (size_t l = 0; l < kLanes; ++l) {
+            const bool live = l < n;
+            x[l] = live ? p[l * 3] : 0.f;
+            y[l] = live ? p[l * 3 + 1] : 0.f;
+            z[l] = live ? p[l * 3 + 2] : 0.f;
+        }
+        kernel(first, n, x, y, z);
+    }
+}
+
 } // namespace
 
 int Noise::tabindex2(int ix, int iy) {
@@ -253,5 +470,267 @@ void Noise::vturbulence(float x, float y, float z, int octaves,
     }
 }
 
+void Noise::snoisePacket(const float *x, const float *y, const float *z,
+                         float *out) const {
+#ifdef MESHTOOLS_NOISE_AVX2
+    if (useSimd.load(std::memory_order_relaxed)) {
+        noise3dAvx2(x, y, z, out);
+        return;
+    }
+#endif
+    for (size_t l = 0; l < kLanes; ++l)
+        out[l] = noise3d(x[l], y[l], z[l]);
+}
+
+void Noise::fBmPacket(const float *x, const float *y, const float *z,
+                      int octaves, float lacunarity, float gain,
+                      float *out) const {
+    fractalPacket<false>(*this, x, y, z, octaves, lacunarity, gain, out);
+}
+
+void Noise::turbulencePacket(const float *x, const float *y, const float *z,
+                             int octaves, float lacunarity, float gain,
+                             float *out) const {
+    fractalPacket<true>(*this, x, y, z, octaves, lacunarity, gain, out);
+}
+
+void Noise::vfBmPacket(const float *x, const float *y, const float *z,
+                       int octaves, float lacunarity, float gain, float *ox,
+                       float *oy, float *oz) const {
+    vfractalPacket<false>(*this, x, y, z, octaves, lacunarity, gain, ox, oy,
+                          oz);
+}
+
+void Noise::vturbulencePacket(const float *x, const float *y, const float *z,
+                              int octaves, float lacunarity, float gain,
+                              float *ox, float *oy, float *oz) const {
+    vfractalPacket<true>(*this, x, y, z, octaves, lacunarity, gain, ox, oy, oz);
+}
+
+bool Noise::simd() { return useSimd.load(); }
+
+bool Noise::setSimd(bool enable) {
+    useSimd.store(enable && cpuHasAvx2());
+    return useSimd.load();
+}
+
+void Noise::setThreads(unsigned threads) {
+    pool = std::make_shared<Geometry::ThreadPool>(threads);
+}
+
+void Noise::clearThreads() { pool.reset(); }
+
+unsigned Noise::threads() const { return pool ? pool->size() : 0; }
+
+template <typename Fn>
+void Noise::runArray(size_t count, unsigned threads, const Fn &fn) const {
+    // a packet of eight 8-octave fractals is far heavier than one item of
+    // the mesh kernels parallelFor's default grain is tuned for
+    constexpr size_t grain = 1024;
+    if (threads == 0 && pool)
+        pool->parallelFor(count, fn, grain);
+    else
+        parallelFor(count, threads, fn, grain);
+}
+
+namespace {
+
+void checkDims(int dims) {
+    if (dims < 2 || dims > 4)
+        throw std::invalid_argument("points must have 2, 3 or 4 columns");
+}
+
+} // namespace
+
+void Noise::snoiseArray(const float *points, size_t count, int dims, float *out,
+                        unsigned threads) const {
+    checkDims(dims);
+    runArray(count, threads, [&](size_t begin, size_t end) {
+        if (dims == 3) {
+            forPackets(points, begin, end,
+                       [&](size_t first, size_t n, const float *x,
+                           const float *y, const float *z) {
+                           float lanes[kLanes];
+                           snoisePacket(x, y, z, lanes);
+                           std::copy(lanes, lanes + n, out + first);
+                       });
+            return;
+        }
+        for (size_t i = begin; i < end; ++i) {
+            const float *p = points + i * dims;
+            if (dims == 2)
+                out[i] = noise2d(p[0], p[1]);
+            else
+                out[i] = noise4d(p[0], p[1], p[2], p[3]);
+        }
+    });
+}
+
+void Noise::vsnoiseArray(const float *points, size_t count, int dims,
+                         float *out, unsigned threads) const {
+    checkDims(dims);
+    runArray(count, threads, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i) {
+            const float *p = points + i * dims;
+            float *o = out + i * dims;
+            if (dims == 2)
+                vsnoise(p[0], p[1], o[0], o[1]);
+            else if (dims == 3)
+                vsnoise(p[0], p[1], p[2], o[0], o[1], o[2]);
+            else
+                vsnoise(p[0], p[1], p[2], p[3], o[0], o[1], o[2], o[3]);
+        }
+    });
+}
+
+void Noise::fBmArray(const float *points, size_t count, int octaves,
+                     float lacunarity, float gain, float *out,
+                     unsigned threads) const {
+    runArray(count, threads, [&](size_t begin, size_t end) {
+        forPackets(points, begin, end,
+                   [&](size_t first, size_t n, const float *x, const float *y,
+                       const float *z) {
+                       float lanes[kLanes];
+                       fBmPacket(x, y, z, octaves, lacunarity, gain, lanes);
+                       std::copy(lanes, lanes + n, out + first);
+                   });
+    });
+}
+
+void Noise::turbulenceArray(const float *points, size_t count, int octaves,
+                            float lacunarity, float gain, float *out,
+                            unsigned threads) const {
+    runArray(count, threads, [&](size_t begin, size_t end) {
+        forPackets(points, begin, end,
+                   [&](size_t first, size_t n, const float *x, const float *y,
+                       const float *z) {
+                       float lanes[kLanes];
+                       turbulencePacket(x, y, z, octaves, lacunarity, gain,
+                                        lanes);
+                       std::copy(lanes, lanes + n, out + first);
+                   });
+    });
+}
+
+namespace {
+
+/** Interleave n points of ox, oy, oz lanes into out rows. */
+void storeRows(const float (&lanes)[3][kLanes], size_t n, float *out) {
+    for (size_t l = 0; l < n; ++l)
+        for (int c = 0; c < 3; ++c)
+            out[l * 3 + c] = lanes[c][l];
+}
+
+} // namespace
+
+void Noise::vfBmArray(const float *points, size_t count, int octaves,
+                      float lacunarity, float gain, float *out,
+                      unsigned threads) const {
+    runArray(count, threads, [&](size_t begin, size_t end) {
+        forPackets(points, begin, end,
+                   [&](size_t first, size_t n, const float *x, const float *y,
+                       const float *z) {
+                       float lanes[3][kLanes];
+                       vfBmPacket(x, y, z, octaves, lacunarity, gain, lanes[0],
+                                  lanes[1], lanes[2]);
+                       storeRows(lanes, n, out + first * 3);
+                   });
+    });
+}
+
+void Noise::vturbulenceArray(const float *points, size_t count, int octaves,
+                             float lacunarity, float gain, float *out,
+                             unsigned threads) const {
+    runArray(count, threads, [&](size_t begin, size_t end) {
+        forPackets(points, begin, end,
+                   [&](size_t first, size_t n, const float *x, const float *y,
+                       const float *z) {
+                       float lanes[3][kLanes];
+                       vturbulencePacket(x, y, z, octaves, lacunarity, gain,
+                                         lanes[0], lanes[1], lanes[2]);
+                       storeRows(lanes, n, out + first * 3);
+                   });
+    });
+}
+
+namespace {
+
+/** Grid ids and weights of the taps along one axis. */
+template <int Taps>
+void gridTaps(double cell, long long resolution, size_t *ids, double *weights) {
+    const double base = std::floor(cell);
+    const double t = cell - base;
+    long long first = static_cast<long long>(base) % resolution;
+    if (first < 0)
+        first += resolution;
+    if (Taps == 2) {
+        weights[0] = 1.0 - t;
+        weights[1] = t;
+    } else {
+        // Catmull-Rom
+        const double t2 = t * t, t3 = t2 * t;
+        weights[0] = 0.5 * (-t3 + 2.0 * t2 - t);
+        weights[1] = 0.5 * (3.0 * t3 - 5.0 * t2 + 2.0);
+        weights[2] = 0.5 * (-3.0 * t3 + 4.0 * t2 + t);
+        weights[3] = 0.5 * (t3 - t2);
+        first -= 1;
+    }
+    for (int i = 0; i < Taps; ++i)
+        ids[i] = static_cast<size_t>(((first + i) % resolution + resolution) %
+                                     resolution);
+}
+
+template <int Taps>
+void sampleGridTaps(const float *grid, size_t resolution, size_t channels,
+                    double scale, const float *points, size_t begin, size_t end,
+                    float *out) {
+    const long long r = static_cast<long long>(resolution);
+    size_t ids[3][Taps];
+    double weights[3][Taps];
+    for (size_t i = begin; i < end; ++i) {
+        for (int axis = 0; axis < 3; ++axis)
+            gridTaps<Taps>(points[i * 3 + axis] * scale, r, ids[axis],
+                           weights[axis]);
+        double total[4] = {0.0, 0.0, 0.0, 0.0};
+        for (int a = 0; a < Taps; ++a) {
+            const size_t rowX = ids[0][a] * resolution;
+            for (int b = 0; b < Taps; ++b) {
+                const size_t rowXY = (rowX + ids[1][b]) * resolution;
+                const double weightXY = weights[0][a] * weights[1][b];
+                for (int c = 0; c < Taps; ++c) {
+                    const float *value = grid + (rowXY + ids[2][c]) * channels;
+                    const double weight = weightXY * weights[2][c];
+                    for (size_t k = 0; k < channels; ++k)
+                        total[k] += weight * value[k];
+                }
+            }
+        }
+        for (size_t k = 0; k < channels; ++k)
+            out[i * channels + k] = static_cast<float>(total[k]);
+    }
+}
+
+} // namespace
+
+void sampleGrid(const float *grid, size_t resolution, size_t channels,
+                float period, const float *points, size_t count, bool cubic,
+                float *out, unsigned threads) {
+    if (resolution < 2)
+        throw std::invalid_argument("resolution must be at least 2");
+    if (channels < 1 || channels > 4)
+        throw std::invalid_argument("grid must have 1 to 4 channels");
+    if (!(period > 0.f))
+        throw std::invalid_argument("period must be positive");
+    const double scale = static_cast<double>(resolution) / period;
+    parallelFor(count, threads, [&](size_t begin, size_t end) {
+        if (cubic)
+            sampleGridTaps<4>(grid, resolution, channels, scale, points, begin,
+                              end, out);
+        else
+            sampleGridTaps<2>(grid, resolution, channels, scale, points, begin,
+                              end, out);
+    });
+}
+
 } // namespace Noise
 } // namespace meshTools
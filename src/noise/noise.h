@@ -6,9 +6,15 @@
 #pragma once
 
 #include <cmath>
+#include <cstddef>
+#include <memory>
 #include <vector>
 
 namespace meshTools {
+namespace Geometry {
+class ThreadPool;
+} // namespace Geometry
+
 namespace Noise {
 
 /**
@@ -17,6 +23,9 @@ namespace Noise {
  */
 class Noise {
   public:
+    /** Points evaluated together by the packet kernels. */
+    static constexpr size_t kPacketSize = 8;
+
     Noise() = default;
 
     /** Scalar noise 2D. */
@@ -48,7 +57,102 @@ class Noise {
     void vturbulence(float x, float y, float z, int octaves, float lacunarity,
                      float gain, float &ox, float &oy, float &oz) const;
 
+    /**
+     * @brief 3D noise for kPacketSize points given as coordinate lanes.
+     *
+     * Runs on AVX2 when the CPU has it (see simd) and on a portable lane
+     * loop otherwise; both return the same values as snoise(x, y, z).
+     */
+    void snoisePacket(const float *x, const float *y, const float *z,
+                      float *out) const;
+    /** fBm for kPacketSize points given as coordinate lanes. */
+    void fBmPacket(const float *x, const float *y, const float *z, int octaves,
+                   float lacunarity, float gain, float *out) const;
+    /** Turbulence for kPacketSize points given as coordinate lanes. */
+    void turbulencePacket(const float *x, const float *y, const float *z,
+                          int octaves, float lacunarity, float gain,
+                          float *out) const;
+    /** Vector fBm for kPacketSize points into ox, oy, oz lanes. */
+    void vfBmPacket(const float *x, const float *y, const float *z, int octaves,
+                    float lacunarity, float gain, float *ox, float *oy,
+                    float *oz) const;
+    /** Vector turbulence for kPacketSize points into ox, oy, oz lanes. */
+    void vturbulencePacket(const float *x, const float *y, const float *z,
+                           int octaves, float lacunarity, float gain, float *ox,
+                           float *oy, float *oz) const;
+
+    /** @brief Whether the packet kernels run on AVX2. */
+    static bool simd();
+    /**
+     * @brief Turn the AVX2 packet path on or off (process wide).
+     *
+     * Enabling has no effect on CPUs or builds without AVX2.
+     * @return Whether the AVX2 path is now in use.
+     */
+    static bool setSimd(bool enable);
+
+    /**
+     * @brief Keep a pool of worker threads for the array methods.
+     *
+     * Array methods called with threads = 0 then run on the pool instead
+     * of starting threads per call. Copies of this Noise share the pool.
+     * @param threads Pool size including the calling thread; 0 uses the
+     * hardware concurrency.
+     */
+    void setThreads(unsigned threads);
+    /** @brief Drop the pool; array methods start threads per call again. */
+    void clearThreads();
+    /** @brief Pool size, or 0 without a pool. */
+    unsigned threads() const;
+
+    /**
+     * @brief Scalar noise for count points of dims (2, 3 or 4) floats.
+     * @param points Row-major (count, dims) coordinates.
+     * @param count Number of points.
+     * @param dims Coordinates per point.
+     * @param out count results.
+     * @param threads Worker threads; 0 uses the hardware concurrency.
+     */
+    void snoiseArray(const float *points, size_t count, int dims, float *out,
+                     unsigned threads = 0) const;
+    /**
+     * @brief Vector noise for count points of dims (2, 3 or 4) floats.
+     * @param points Row-major (count, dims) coordinates.
+     * @param count Number of points.
+     * @param dims Coordinates per point.
+     * @param out Row-major (count, dims) results.
+     * @param threads Worker threads; 0 uses the hardware concurrency.
+     */
+    void vsnoiseArray(const float *points, size_t count, int dims, float *out,
+                      unsigned threads = 0) const;
+    /**
+     * @brief fBm for count (x, y, z) points into out[count].
+     *
+     * Points are evaluated kPacketSize at a time by fBmPacket; the other
+     * fractal array methods work the same way.
+     */
+    void fBmArray(const float *points, size_t count, int octaves,
+                  float lacunarity, float gain, float *out,
+                  unsigned threads = 0) const;
+    /** Turbulence for count (x, y, z) points into out[count]. */
+    void turbulenceArray(const float *points, size_t count, int octaves,
+                         float lacunarity, float gain, float *out,
+                         unsigned threads = 0) const;
+    /** Vector fBm for count (x, y, z) points into out[count * 3]. */
+    void vfBmArray(const float *points, size_t count, int octaves,
+                   float lacunarity, float gain, float *out,
+                   unsigned threads = 0) const;
+    /** Vector turbulence for count (x, y, z) points into out[count * 3]. */
+    void vturbulenceArray(const float *points, size_t count, int octaves,
+                          float lacunarity, float gain, float *out,
+                          unsigned threads = 0) const;
+
   private:
+    template <typename Fn>
+    void runArray(size_t count, unsigned threads, const Fn &fn) const;
+
+    std::shared_ptr<Geometry::ThreadPool> pool;
+
     static int tabindex2(int ix, int iy);
     static int tabindex3(int ix, int iy, int iz);
     static int tabindex4(int ix, int iy, int iz, int it);
@@ -57,5 +161,26 @@ class Noise {
     float noise4d(float x, float y, float z, float t) const;
 };
 
+/**
+ * @brief Interpolate a periodic grid of values at count (x, y, z) points.
+ *
+ * The grid covers the cube [0, period)^3 with resolution samples per axis
+ * and repeats every period, so any point can be looked up.
+ * @param grid Row-major (resolution, resolution, resolution, channels)
+ * values indexed [x, y, z].
+ * @param resolution Samples per axis (at least 2).
+ * @param channels Values per sample (1 to 4).
+ * @param period Size of the cube the grid covers.
+ * @param points Row-major (count, 3) coordinates.
+ * @param count Number of points.
+ * @param cubic Catmull-Rom over 4^3 samples instead of trilinear over 2^3.
+ * @param out Row-major (count, channels) results.
+ * @param threads Worker threads; 0 uses the hardware concurrency.
+ * @throws std::invalid_argument Bad resolution, channels or period.
+ */
+void sampleGrid(const float *grid, size_t resolution, size_t channels,
+                float period, const float *points, size_t count, bool cubic,
+                float *out, unsigned threads = 0);
+
 } // namespace Noise
 } // namespace meshTools
@@ -10,6 +10,8 @@ building; optionally set MESHTOOLS_BUILD_DIR.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Repo root: conftest is in tests/
 _repo_root = Path(__file__).resolve().parent.parent
 
@@ -49,3 +51,26 @@ if _python_dir.exists():
     _s = str(_python_dir.resolve())
     if _s not in sys.path:
         sys.path.insert(0, _s)
+
+
+@pytest.fixture
+def grid_mesh():
+    """Factory for an n x n quad grid in the XY plane, built through addFace.
+
+    Call it as grid_mesh(n=2, cls=Mesh, z=None); z(i, j), when given, lifts
+    vertex (i, j) off the plane.
+    """
+    from meshTools import Mesh, Point
+
+    def build(n=2, cls=Mesh, z=None):
+        mesh = cls()
+        for j in range(n + 1):
+            for i in range(n + 1):
+                mesh.addVertex(Point(i, j, z(i, j) if z else 0))
+        for j in range(n):
+            for i in range(n):
+                a = j * (n + 1) + i
+                mesh.addFace([a, a + 1, a + n + 2, a + n + 1])
+        return mesh
+
+    return build
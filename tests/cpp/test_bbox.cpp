@@ -1,6 +1,8 @@
 #include <gtest/gtest.h>
 #include <geometry/bbox.h>
 #include <geometry/vector.h>
+#include <cmath>
+#include <vector>
 
 using namespace meshTools::Geometry;
 
@@ -103,3 +105,77 @@ TEST_F(BboxTest, FromPointSetWithNegatives) {
     EXPECT_FLOAT_EQ(bbox.max.y, -1.0f);
     EXPECT_FLOAT_EQ(bbox.max.z, -1.0f);
 }
+
+TEST_F(BboxTest, FromPointSetThreadsMatchSerial) {
+    std::vector<Vector> points;
+    for (int i = 0; i < 50001; i++)
+        points.emplace_back(std::sin(0.37f * i) * i, std::cos(0.11f * i),
+                            0.001f * ((i * 7919) % 10007) - 3.0f);
+    Bbox serial, threaded;
+    serial.fromPointSet(points);
+    threaded.fromPointSet(points, 4);
+    EXPECT_TRUE(serial.min == threaded.min);
+    EXPECT_TRUE(serial.max == threaded.max);
+    for (const Vector &p : points) {
+        EXPECT_LE(serial.min.x, p.x);
+        EXPECT_GE(serial.max.z, p.z);
+    }
+    EXPECT_FLOAT_EQ(serial.min.z, -3.0f);
+    EXPECT_FLOAT_EQ(serial.max.z, 0.001f * 10006 - 3.0f);
+}
+
+TEST_F(BboxTest, FromPointSetEmpty) {
+    Bbox bbox(minV, maxV, center);
+    bbox.fromPointSet(std::vector<Vector>());
+    EXPECT_TRUE(bbox.min == Vector());
+    EXPECT_TRUE(bbox.max == Vector());
+}
+
+TEST_F(BboxTest, RangeBounds) {
+    const float points[] = {0, 0, 0, 2, 1, -1, -1, 3, 4, 5, 5, 5};
+    const uint32_t offsets[] = {0, 2, 2, 4};
+    float out[18];
+    rangeBounds(points, offsets, 3, nullptr, out, 2);
+    EXPECT_FLOAT_EQ(out[0], 0.0f);  // min x of points 0, 1
+    EXPECT_FLOAT_EQ(out[2], -1.0f); // min z
+    EXPECT_FLOAT_EQ(out[3], 2.0f);  // max x
+    EXPECT_TRUE(std::isinf(out[6]) && out[6] > 0); // empty range
+    EXPECT_TRUE(std::isinf(out[9]) && out[9] < 0);
+    EXPECT_FLOAT_EQ(out[12], -1.0f);
+    EXPECT_FLOAT_EQ(out[17], 5.0f);
+
+    const uint32_t indices[] = {3, 0, 2};
+    const uint32_t faceOffsets[] = {0, 3};
+    rangeBounds(points, faceOffsets, 1, indices, out);
+    EXPECT_FLOAT_EQ(out[0], -1.0f);
+    EXPECT_FLOAT_EQ(out[1], 0.0f);
+    EXPECT_FLOAT_EQ(out[5], 5.0f);
+}
+
+TEST_F(BboxTest, ObbFromPointSetPrincipalAxes) {
+    // points spread along (1, 1, 0), then (-1, 1, 0), barely along z
+    std::vector<Vector> points;
+    for (int i = -10; i <= 10; i++)
+        for (int j = -3; j <= 3; j++)
+            points.emplace_back(1000.0f + i - j, 1000.0f + i + j,
+                                0.01f * ((i + j) % 2));
+    Bbox bbox;
+    bbox.obbFromPointSet(points);
+    const float h = std::sqrt(0.5f);
+    EXPECT_NEAR(std::fabs(bbox.axis[0].dot(Vector(h, h, 0))), 1.0f, 1e-5f);
+    EXPECT_NEAR(std::fabs(bbox.axis[1].dot(Vector(-h, h, 0))), 1.0f, 1e-5f);
+    EXPECT_NEAR(bbox.axis[0].cross(bbox.axis[1]).dot(bbox.axis[2]), 1.0f,
+                1e-6f);
+    EXPECT_NEAR(bbox.max.x - bbox.min.x, 20.0f / h, 1e-2f);
+    EXPECT_NEAR(bbox.max.y - bbox.min.y, 6.0f / h, 1e-2f);
+    EXPECT_NEAR(bbox.center.x, 1000.0f, 1e-2f);
+    EXPECT_NEAR(bbox.center.y, 1000.0f, 1e-2f);
+}
+
+TEST_F(BboxTest, ObbFromPointSetDegenerate) {
+    Bbox bbox;
+    bbox.obbFromPointSet(std::vector<Vector>(4, Vector(1, 2, 3)));
+    EXPECT_TRUE(bbox.center == Vector(1, 2, 3));
+    EXPECT_FLOAT_EQ(bbox.axis[0].length(), 1.0f);
+    EXPECT_FLOAT_EQ(bbox.axis[2].length(), 1.0f);
+}
@@ -0,0 +1,230 @@
+#include <gtest/gtest.h>
+#include <geometry/bvh.h>
+#include <geometry/ray.h>
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <random>
+#include <vector>
+
+using namespace meshTools::Geometry;
+
+namespace {
+
+const float kInf = std::numeric_limits<float>::infinity();
+
+// Bumpy grid of quads plus a loose triangle soup, as CSR faces
+struct TestMesh {
+    std::vector<float> positions;
+    std::vector<uint32_t> offsets{0};
+    std::vector<uint32_t> indices;
+
+    size_t faceCount() const { return offsets.size() - 1; }
+
+    TestMesh() {
+        const int n = 12;
+        for (int j = 0; j <= n; j++)
+            for (int i = 0; i <= n; i++) {
+                positions.push_back(float(i));
+                positions.push_back(0.3f * std::sin(0.7f * i + 0.4f * j));
+                positions.push_back(float(j));
+            }
+        for (int j = 0; j < n; j++)
+            for (int i = 0; i < n; i++) {
+                const uint32_t a = j * (n + 1) + i;
+                indices.insert(indices.end(), {a, a + 1, a + n + 2, a + n + 1});
+                offsets.push_back(uint32_t(indices.size()));
+            }
+        std::mt19937 rng(7);
+        std::uniform_real_distribution<float> u(-2.0f, 14.0f);
+        for (int t = 0; t < 40; t++) {
+            const uint32_t base = uint32_t(positions.size() / 3);
+            const float c[3] = {u(rng), u(rng) * 0.25f + 2.0f, u(rng)};
+            for (int k = 0; k < 3; k++)
+                for (int a = 0; a < 3; a++)
+                    positions.push_back(c[a] + u(rng) * 0.05f);
+            indices.insert(indices.end(), {base, base + 1, base + 2});
+            offsets.push_back(uint32_t(indices.size()));
+        }
+    }
+
+    Vector vertex(uint32_t v) const {
+        return Vector(positions[3 * v], positions[3 * v + 1],
+                      positions[3 * v + 2]);
+    }
+
+    Bvh bvh() const {
+        return Bvh(positions.data(), positions.size() / 3, offsets.data(),
+                   indices.data(), faceCount());
+    }
+
+    // Brute-force closest hit over fan triangles
+    float raycast(const Vector &o, const Vector &d, int32_t &face) const {
+        const Ray ray(o, d);
+        float best = kInf;
+        face = -1;
+        for (size_t f = 0; f < faceCount(); f++)
+            for (uint32_t i = offsets[f] + 1; i + 1 < offsets[f + 1]; i++) {
+                const Vector triangle[3] = {vertex(indices[offsets[f]]),
+                                            vertex(indices[i]),
+                                            vertex(indices[i + 1])};
+                // (u, v, t), or a zero vector on a miss
+                const Vector hit = ray.triangleRayHit(triangle);
+                if (hit.z > 0 && hit.z < best) {
+                    best = hit.z;
+                    face = int32_t(f);
+                }
+            }
+        return best;
+    }
+};
+
+} // namespace
+
+TEST(BvhTest, EmptyMesh) {
+    Bvh bvh;
+    Bvh::Hit hit;
+    EXPECT_EQ(bvh.triangleCount(), 0u);
+    EXPECT_FALSE(bvh.intersect(Vector(0, 0, 0), Vector(1, 0, 0), 0, kInf, hit));
+    EXPECT_FALSE(bvh.occluded(Vector(0, 0, 0), Vector(1, 0, 0), 0, kInf));
+    EXPECT_FALSE(bvh.closestPoint(Vector(0, 0, 0), kInf, hit));
+    EXPECT_EQ(hit.face, -1);
+}
+
+TEST(BvhTest, FlattenedTreeCoversTriangles) {
+    TestMesh mesh;
+    Bvh bvh = mesh.bvh();
+    EXPECT_EQ(bvh.triangleCount(), 12u * 12u * 2u + 40u);
+    size_t leafTriangles = 0;
+    const auto &nodes = bvh.nodes();
+    for (size_t i = 0; i < nodes.size(); i++) {
+        const Bvh::Node &node = nodes[i];
+        leafTriangles += node.count;
+        if (node.count == 0) {
+            // children lie after their parent and inside its box
+            ASSERT_GT(node.start, i + 1);
+            for (size_t child : {i + 1, size_t(node.start)})
+                for (int a = 0; a < 3; a++) {
+                    EXPECT_GE(nodes[child].lo[a], node.lo[a]);
+                    EXPECT_LE(nodes[child].hi[a], node.hi[a]);
+                }
+        }
+    }
+    EXPECT_EQ(leafTriangles, bvh.triangleCount());
+    EXPECT_LT(nodes.size(), 2 * bvh.triangleCount());
+}
+
+TEST(BvhTest, RaycastMatchesBruteForce) {
+    TestMesh mesh;
+    Bvh bvh = mesh.bvh();
+    std::mt19937 rng(3);
+    std::uniform_real_distribution<float> u(-1.0f, 13.0f);
+    std::uniform_real_distribution<float> s(-1.0f, 1.0f);
+    int hits = 0;
+    for (int r = 0; r < 500; r++) {
+        const Vector o(u(rng), 4.0f + s(rng), u(rng));
+        const Vector d(s(rng), -1.0f, s(rng));
+        int32_t face;
+        const float expected = mesh.raycast(o, d, face);
+        Bvh::Hit hit;
+        const bool found = bvh.intersect(o, d, 0, kInf, hit);
+        ASSERT_EQ(found, expected < kInf);
+        EXPECT_EQ(bvh.occluded(o, d, 0, kInf), found);
+        if (!found)
+            continue;
+        hits++;
+        EXPECT_NEAR(hit.distance, expected, 1e-4f);
+        EXPECT_EQ(hit.face, face);
+        EXPECT_NEAR(hit.normal.length(), 1.0f, 1e-5f);
+        EXPECT_NEAR((hit.point - (o + d * expected)).length(), 0.0f, 1e-4f);
+        // a shorter ray stops in front of the surface
+        EXPECT_FALSE(bvh.occluded(o, d, 0, expected * 0.5f));
+    }
+    EXPECT_GT(hits, 300);
+}
+
+TEST(BvhTest, MinDistanceSkipsNearHits) {
+    TestMesh mesh;
+    Bvh bvh = mesh.bvh();
+    // straight down through the grid plane at y ~ 0
+    const Vector o(5.5f, 1.0f, 5.5f), d(0, -1, 0);
+    Bvh::Hit hit;
+    ASSERT_TRUE(bvh.intersect(o, d, 0, kInf, hit));
+    EXPECT_FALSE(bvh.intersect(o, d, hit.distance + 1e-3f, kInf, hit));
+    EXPECT_FALSE(bvh.occluded(o, d, 0, hit.distance * 0.5f));
+}
+
+TEST(BvhTest, ClosestPointMatchesBruteForce) {
+    TestMesh mesh;
+    Bvh bvh = mesh.bvh();
+    // one single-face tree per face: the brute force skips all pruning
+    std::vector<Bvh> single;
+    for (size_t f = 0; f < mesh.faceCount(); f++) {
+        const uint32_t offsets[2] = {mesh.offsets[f], mesh.offsets[f + 1]};
+        single.emplace_back(mesh.positions.data(), mesh.positions.size() / 3,
+                            offsets, mesh.indices.data(), 1);
+    }
+    std::mt19937 rng(11);
+    std::uniform_real_distribution<float> u(-3.0f, 15.0f);
+    for (int q = 0; q < 300; q++) {
+        const Vector p(u(rng), u(rng) * 0.3f, u(rng));
+        float expected = kInf;
+        for (const Bvh &face : single) {
+            Bvh::Hit hit;
+            if (face.closestPoint(p, kInf, hit))
+                expected = std::min(expected, hit.distance);
+        }
+        Bvh::Hit hit;
+        ASSERT_TRUE(bvh.closestPoint(p, kInf, hit));
+        EXPECT_NEAR(hit.distance, expected, 1e-5f);
+        EXPECT_NEAR((hit.point - p).length(), hit.distance, 1e-4f);
+        Bvh::Hit bounded;
+        EXPECT_FALSE(bvh.closestPoint(p, hit.distance * 0.9f, bounded));
+    }
+}
+
+TEST(BvhTest, BatchedQueriesMatchSingle) {
+    TestMesh mesh;
+    Bvh bvh = mesh.bvh();
+    const size_t count = 1000;
+    std::vector<float> origins(3 * count), directions(3 * count);
+    std::mt19937 rng(5);
+    std::uniform_real_distribution<float> u(-1.0f, 13.0f);
+    for (size_t i = 0; i < count; i++) {
+        origins[3 * i] = u(rng);
+        origins[3 * i + 1] = 3.0f;
+        origins[3 * i + 2] = u(rng);
+        directions[3 * i] = 0.1f;
+        directions[3 * i + 1] = -1.0f;
+        directions[3 * i + 2] = 0.0f;
+    }
+    std::vector<float> distances(count), points(3 * count), normals(3 * count);
+    std::vector<int32_t> faces(count);
+    std::vector<uint8_t> blocked(count);
+    bvh.intersect(origins.data(), directions.data(), count, 0, kInf,
+                  distances.data(), faces.data(), points.data(),
+                  normals.data(), 4);
+    bvh.occluded(origins.data(), directions.data(), count, 0, kInf,
+                 blocked.data(), 4);
+    std::vector<float> closest(3 * count), gaps(count);
+    std::vector<int32_t> closestFaces(count);
+    bvh.closestPoints(origins.data(), count, kInf, closest.data(),
+                      closestFaces.data(), gaps.data(), 4);
+    for (size_t i = 0; i < count; i++) {
+        const Vector o(origins[3 * i], origins[3 * i + 1], origins[3 * i + 2]);
+        const Vector d(directions[3 * i], directions[3 * i + 1],
+                       directions[3 * i + 2]);
+        Bvh::Hit hit;
+        const bool found = bvh.intersect(o, d, 0, kInf, hit);
+        EXPECT_EQ(blocked[i], found ? 1 : 0);
+        EXPECT_EQ(faces[i], found ? hit.face : -1);
+        if (found)
+            EXPECT_EQ(distances[i], hit.distance);
+        else
+            EXPECT_TRUE(std::isinf(distances[i]) && std::isnan(points[3 * i]));
+        Bvh::Hit near;
+        ASSERT_TRUE(bvh.closestPoint(o, kInf, near));
+        EXPECT_EQ(gaps[i], near.distance);
+        EXPECT_EQ(closestFaces[i], near.face);
+    }
+}
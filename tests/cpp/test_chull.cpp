@@ -0,0 +1,172 @@
+#include <chull/chull.h>
+#include <chull/obb.h>
+#include <chull/quickhull.h>
+#include <cmath>
+#include <gtest/gtest.h>
+#include <random>
+#include <set>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+using namespace meshTools::Chull;
+
+namespace {
+
+std::vector<float> randomPoints(size_t count, unsigned seed) {
+    std::mt19937 rng(seed);
+    std::normal_distribution<float> dist;
+    std::vector<float> points(3 * count);
+    for (float &x : points)
+        x = dist(rng);
+    return points;
+}
+
+/** Largest signed distance of any point above a hull face plane. */
+double maxHeight(const std::vector<float> &points,
+                 const std::vector<uint32_t> &faces) {
+    double worst = -1.0;
+    for (size_t f = 0; f < faces.size(); f += 3) {
+        const float *a = &points[3 * faces[f]];
+        const float *b = &points[3 * faces[f + 1]];
+        const float *c = &points[3 * faces[f + 2]];
+        double u[3], w[3];
+        for (int k = 0; k < 3; k++) {
+            u[k] = double(b[k]) - a[k];
+            w[k] = double(c[k]) - a[k];
+        }
+        double n[3] = {u[1] * w[2] - u[2] * w[1], u[2] * w[0] - u[0] * w[2],
+                       u[0] * w[1] - u[1] * w[0]};
+        for (size_t i = 0; i < points.size(); i += 3) {
+            double h = 0.0;
+            for (int k = 0; k < 3; k++)
+                h += n[k] * (double(points[i + k]) - a[k]);
+            worst = std::max(worst, h);
+        }
+    }
+    return worst;
+}
+
+} // namespace
+
+TEST(QuickhullTest, ClosedAndConvex) {
+    std::vector<float> points = randomPoints(20000, 1);
+    std::vector<uint32_t> faces = quickhull(points.data(), 20000);
+    ASSERT_GT(faces.size(), 0u);
+    EXPECT_LT(maxHeight(points, faces), 1e-9);
+    std::set<std::pair<uint32_t, uint32_t>> edges;
+    for (size_t f = 0; f < faces.size(); f += 3)
+        for (int k = 0; k < 3; k++)
+            EXPECT_TRUE(
+                edges.insert({faces[f + k], faces[f + (k + 1) % 3]}).second);
+    for (const auto &[u, v] : edges)
+        EXPECT_TRUE(edges.count({v, u}));
+}
+
+TEST(QuickhullTest, ExtremeFilterKeepsHullVertices) {
+    std::vector<float> points = randomPoints(20000, 2);
+    std::vector<uint32_t> kept = extremeFilter(points.data(), 20000);
+    EXPECT_LT(kept.size(), 20000u);
+    std::set<uint32_t> keep(kept.begin(), kept.end());
+    for (uint32_t v : quickhull(points.data(), 20000))
+        EXPECT_TRUE(keep.count(v));
+}
+
+TEST(QuickhullTest, CubeWithInteriorPoints) {
+    std::vector<float> points;
+    for (int i = 0; i < 8; i++)
+        points.insert(points.end(),
+                      {float(i & 1), float((i >> 1) & 1), float(i >> 2)});
+    for (int i = 0; i < 50; i++)
+        points.insert(points.end(), {0.5f, 0.01f * i, 0.3f});
+    Hull hull(points.data(), points.size() / 3, true);
+    EXPECT_EQ(hull.getFaceIndices().size(), 36u);
+    EXPECT_EQ(hull.getPointIds(),
+              (std::vector<uint32_t>{0, 1, 2, 3, 4, 5, 6, 7}));
+    EXPECT_EQ(hull.exportHull().second.size(), 8u);
+}
+
+TEST(QuickhullTest, DegenerateThrows) {
+    std::vector<float> line = {0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3};
+    EXPECT_THROW(quickhull(line.data(), 4), std::runtime_error);
+    std::vector<float> plane = {0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0};
+    EXPECT_THROW(quickhull(plane.data(), 4), std::runtime_error);
+}
+
+TEST(HullTest, IncrementalTetrahedron) {
+    std::vector<float> points = {0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1};
+    Hull hull(points.data(), 4);
+    EXPECT_EQ(hull.getFaceIndices().size(), 12u);
+    EXPECT_EQ(hull.getPositions(), points);
+}
+
+namespace {
+
+/** Corners and interior points of a 4 x 2 x 1 box rotated about z and x. */
+std::vector<float> rotatedBox() {
+    std::mt19937 rng(5);
+    std::uniform_real_distribution<float> unit(-1.0f, 1.0f);
+    std::vector<float> local;
+    for (int c = 0; c < 8; c++)
+        local.insert(local.end(), {c & 1 ? 2.0f : -2.0f, c & 2 ? 1.0f : -1.0f,
+                                   c & 4 ? 0.5f : -0.5f});
+    for (int i = 0; i < 500; i++) // dense diagonal streak biases covariance
+        local.insert(local.end(), {1.9f * unit(rng), 0.9f * unit(rng) * 0.1f,
+                                   0.45f * unit(rng)});
+    const float a = 0.4f, b = 0.7f;
+    std::vector<float> points;
+    for (size_t i = 0; i < local.size(); i += 3) {
+        const float x = local[i], y = local[i + 1], z = local[i + 2];
+        const float x1 = std::cos(a) * x - std::sin(a) * y;
+        const float y1 = std::sin(a) * x + std::cos(a) * y;
+        points.insert(points.end(), {x1 + 5.0f,
+                                     std::cos(b) * y1 - std::sin(b) * z,
+                                     std::sin(b) * y1 + std::cos(b) * z});
+    }
+    return points;
+}
+
+float extentProduct(const meshTools::Geometry::Bbox &box) {
+    return (box.max.x - box.min.x) * (box.max.y - box.min.y) *
+           (box.max.z - box.min.z);
+}
+
+} // namespace
+
+TEST(OrientedBoxTest, MinVolumeFindsRotatedBox) {
+    std::vector<float> points = rotatedBox();
+    const size_t count = points.size() / 3;
+    auto box = orientedBox(points.data(), count, ObbMethod::MinVolume);
+    EXPECT_NEAR(extentProduct(box), 8.0f, 1e-3f);
+    EXPECT_NEAR(box.max.x - box.min.x, 4.0f, 1e-4f);
+    EXPECT_NEAR(box.max.z - box.min.z, 1.0f, 1e-4f);
+    EXPECT_NEAR(box.center.x, 5.0f, 1e-4f);
+    EXPECT_NEAR(box.axis[0].cross(box.axis[1]).dot(box.axis[2]), 1.0f, 1e-5f);
+    auto covariance = orientedBox(points.data(), count, ObbMethod::Covariance);
+    EXPECT_GE(extentProduct(covariance), extentProduct(box));
+}
+
+TEST(OrientedBoxTest, FlatInputFallsBackToCovariance) {
+    std::vector<float> plane = {0, 0, 0, 2, 0, 0, 0, 1, 0, 2, 1, 0, 1, 0.5f, 0};
+    auto box = orientedBox(plane.data(), 5, ObbMethod::MinVolume);
+    EXPECT_FLOAT_EQ(box.max.z - box.min.z, 0.0f);
+    EXPECT_NEAR(box.max.x - box.min.x, 2.0f, 1e-5f);
+    EXPECT_NEAR(box.center.y, 0.5f, 1e-5f);
+}
+
+TEST(OrientedBoxTest, BatchMatchesSingle) {
+    std::vector<float> points = rotatedBox();
+    std::vector<float> more = randomPoints(100, 3);
+    points.insert(points.end(), more.begin(), more.end());
+    const uint32_t boxCount = static_cast<uint32_t>(rotatedBox().size() / 3);
+    const uint32_t offsets[] = {0, boxCount, boxCount, boxCount + 100};
+    std::vector<float> out(3 * 18);
+    orientedBoxes(points.data(), offsets, 3, ObbMethod::HullCovariance,
+                  out.data(), 2);
+    auto single = orientedBox(points.data() + 3 * boxCount, 100,
+                              ObbMethod::HullCovariance);
+    EXPECT_FLOAT_EQ(out[36 + 0], single.min.x);
+    EXPECT_FLOAT_EQ(out[36 + 7], single.center.y);
+    EXPECT_FLOAT_EQ(out[36 + 17], single.axis[2].z);
+    EXPECT_FLOAT_EQ(out[18 + 9], 1.0f); // empty range: world axes
+}
@@ -0,0 +1,68 @@
+#include <algorithm>
+#include <geometry/counters.h>
+#include <geometry/parallel.h>
+#include <gtest/gtest.h>
+#include <string>
+#include <vector>
+
+using namespace meshTools::Geometry;
+
+namespace {
+
+const CounterValue *find(const std::vector<CounterValue> &values,
+                         const std::string &name) {
+    auto it =
+        std::find_if(values.begin(), values.end(),
+                     [&](const CounterValue &v) { return v.name == name; });
+    return it == values.end() ? nullptr : &*it;
+}
+
+} // namespace
+
+TEST(CountersTest, ScopeAddsCallsItemsAndTime) {
+    resetCounters();
+    Counter &counter = namedCounter("test.scope");
+    EXPECT_EQ(&namedCounter("test.scope"), &counter);
+    {
+        CounterScope scope(counter, 10);
+    }
+    {
+        CounterScope scope(counter);
+        scope.setItems(5);
+    }
+    const auto values = counterValues();
+    const CounterValue *value = find(values, "test.scope");
+    ASSERT_NE(value, nullptr);
+    EXPECT_EQ(value->calls, 2u);
+    EXPECT_EQ(value->items, 15u);
+}
+
+TEST(CountersTest, ResetKeepsNames) {
+    {
+        CounterScope scope(namedCounter("test.reset"), 1);
+    }
+    resetCounters();
+    const auto values = counterValues();
+    const CounterValue *value = find(values, "test.reset");
+    ASSERT_NE(value, nullptr);
+    EXPECT_EQ(value->calls, 0u);
+    EXPECT_EQ(value->items, 0u);
+    EXPECT_EQ(value->nanoseconds, 0u);
+}
+
+TEST(CountersTest, ConcurrentScopes) {
+    resetCounters();
+    Counter &counter = namedCounter("test.threads");
+    parallelFor(
+        64, 4,
+        [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; i++)
+                CounterScope scope(counter, 2);
+        },
+        1);
+    const auto values = counterValues();
+    const CounterValue *value = find(values, "test.threads");
+    ASSERT_NE(value, nullptr);
+    EXPECT_EQ(value->calls, 64u);
+    EXPECT_EQ(value->items, 128u);
+}
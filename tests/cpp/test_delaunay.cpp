@@ -0,0 +1,114 @@
+#include <algorithm>
+#include <delaunay/delaunay.h>
+#include <gtest/gtest.h>
+#include <random>
+#include <vector>
+
+using namespace meshTools::Delaunay;
+
+namespace {
+
+std::vector<double> toDouble(const std::vector<float> &points) {
+    return std::vector<double>(points.begin(), points.end());
+}
+
+double tetraVolume(const std::vector<double> &p, const uint32_t *t) {
+    // orient3d is positive for the mirrored order
+    return orient3d(&p[3 * t[0]], &p[3 * t[1]], &p[3 * t[3]], &p[3 * t[2]]) /
+           6.0;
+}
+
+std::vector<float> gridPoints(int n) {
+    std::vector<float> points;
+    for (int i = 0; i < n; i++)
+        for (int j = 0; j < n; j++)
+            for (int k = 0; k < n; k++) {
+                points.push_back(float(i));
+                points.push_back(float(j));
+                points.push_back(float(k));
+            }
+    return points;
+}
+
+} // namespace
+
+TEST(DelaunayTest, BrioOrderIsPermutation) {
+    std::mt19937 rng(3);
+    std::uniform_real_distribution<float> dist(-5.f, 5.f);
+    std::vector<float> points(3 * 5000);
+    for (float &x : points)
+        x = dist(rng);
+    std::vector<uint32_t> order = brioOrder(points.data(), 5000);
+    ASSERT_EQ(order.size(), 5000u);
+    std::sort(order.begin(), order.end());
+    for (uint32_t i = 0; i < 5000; i++)
+        EXPECT_EQ(order[i], i);
+}
+
+TEST(DelaunayTest, EmptyCircumsphere) {
+    std::mt19937 rng(7);
+    std::uniform_real_distribution<float> dist(-10.f, 10.f);
+    size_t count = 300;
+    std::vector<float> points(3 * count);
+    for (float &x : points)
+        x = dist(rng);
+    Delaunay d(points.data(), count);
+    std::vector<uint32_t> tetras = d.getTetraIndices();
+    ASSERT_EQ(tetras.size(), 4 * d.tetraCount());
+    ASSERT_GT(d.tetraCount(), 0u);
+    std::vector<double> p = toDouble(points);
+    for (size_t t = 0; t < tetras.size(); t += 4) {
+        const uint32_t *v = &tetras[t];
+        EXPECT_GT(tetraVolume(p, v), 0.0);
+        for (size_t i = 0; i < count; i++) {
+            if (i == v[0] || i == v[1] || i == v[2] || i == v[3])
+                continue;
+            EXPECT_LE(insphere(&p[3 * v[0]], &p[3 * v[1]], &p[3 * v[3]],
+                               &p[3 * v[2]], &p[3 * i]),
+                      0.0);
+        }
+    }
+}
+
+TEST(DelaunayTest, GridFillsHull) {
+    for (int n = 2; n <= 5; n++) {
+        std::vector<float> points = gridPoints(n);
+        Delaunay d(points.data(), points.size() / 3);
+        std::vector<uint32_t> tetras = d.getTetraIndices();
+        std::vector<double> p = toDouble(points);
+        double volume = 0.0;
+        for (size_t t = 0; t < tetras.size(); t += 4) {
+            double v = tetraVolume(p, &tetras[t]);
+            EXPECT_GT(v, 0.0);
+            volume += v;
+        }
+        double side = n - 1;
+        EXPECT_NEAR(volume, side * side * side, 1e-9);
+    }
+}
+
+TEST(DelaunayTest, DuplicatesSkipped) {
+    std::vector<float> points = gridPoints(3);
+    points.insert(points.end(), points.begin(), points.begin() + 12);
+    Delaunay d(points.data(), points.size() / 3);
+    EXPECT_EQ(d.duplicateCount(), 4u);
+    for (uint32_t v : d.getTetraIndices())
+        EXPECT_LT(v, points.size() / 3);
+}
+
+TEST(DelaunayTest, DegenerateInput) {
+    std::vector<float> plane = {0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0};
+    EXPECT_EQ(Delaunay(plane.data(), 4).tetraCount(), 0u);
+    EXPECT_EQ(Delaunay(plane.data(), 2).tetraCount(), 0u);
+}
+
+TEST(DelaunayTest, VectorConstructorMatchesArray) {
+    std::vector<float> points = gridPoints(3);
+    std::vector<meshTools::Geometry::Vector> vertices;
+    for (size_t i = 0; i < points.size(); i += 3)
+        vertices.emplace_back(points[i], points[i + 1], points[i + 2]);
+    Delaunay a(vertices, 10.f);
+    Delaunay b(points.data(), vertices.size());
+    EXPECT_EQ(a.getTetraIndices(), b.getTetraIndices());
+    EXPECT_EQ(a.getTetras().size(), a.tetraCount());
+}
@@ -180,3 +180,45 @@ TEST_F(MathTest, SolveCubicSimple) {
     float sum = roots.x + roots.y + roots.z;
     EXPECT_NEAR(sum, 6.0f, 1e-3);
 }
+
+TEST_F(MathTest, SymmetricEigen) {
+    // eigenvalues 4, 2, 1 in a rotated frame
+    const double c = std::cos(0.3), s = std::sin(0.3);
+    const double r[3][3] = {{c, -s, 0}, {s * c, c * c, -s}, {s * s, s * c, c}};
+    const double d[3] = {2, 1, 4};
+    double a[3][3];
+    for (int i = 0; i < 3; i++)
+        for (int j = 0; j < 3; j++)
+            a[i][j] = r[i][0] * d[0] * r[j][0] + r[i][1] * d[1] * r[j][1] +
+                      r[i][2] * d[2] * r[j][2];
+    double values[3], vectors[3][3];
+    math::symmetricEigen(a, values, vectors);
+    EXPECT_NEAR(values[0], 4.0, 1e-12);
+    EXPECT_NEAR(values[1], 2.0, 1e-12);
+    EXPECT_NEAR(values[2], 1.0, 1e-12);
+    for (int i = 0; i < 3; i++) {
+        // A v = lambda v
+        for (int k = 0; k < 3; k++) {
+            double av = a[k][0] * vectors[i][0] + a[k][1] * vectors[i][1] +
+                        a[k][2] * vectors[i][2];
+            EXPECT_NEAR(av, values[i] * vectors[i][k], 1e-12);
+        }
+    }
+    const double det =
+        vectors[0][0] * (vectors[1][1] * vectors[2][2] -
+                         vectors[1][2] * vectors[2][1]) -
+        vectors[0][1] * (vectors[1][0] * vectors[2][2] -
+                         vectors[1][2] * vectors[2][0]) +
+        vectors[0][2] * (vectors[1][0] * vectors[2][1] -
+                         vectors[1][1] * vectors[2][0]);
+    EXPECT_NEAR(det, 1.0, 1e-12);
+}
+
+TEST_F(MathTest, SymmetricEigenRepeatedValues) {
+    const double a[3][3] = {{3, 0, 0}, {0, 3, 0}, {0, 0, 3}};
+    double values[3], vectors[3][3];
+    math::symmetricEigen(a, values, vectors);
+    EXPECT_DOUBLE_EQ(values[0], 3.0);
+    EXPECT_DOUBLE_EQ(values[2], 3.0);
+    EXPECT_DOUBLE_EQ(vectors[2][2], 1.0);
+}
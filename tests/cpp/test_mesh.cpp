@@ -0,0 +1,78 @@
+#include <algorithm>
+#include <gtest/gtest.h>
+#include <mesh/mesh.h>
+#include <stdexcept>
+
+using namespace meshTools::Mesh;
+
+class HalfEdgeTest : public ::testing::Test {
+  protected:
+    // 2x2 quad grid: 9 vertices, 4 faces, 12 edges
+    std::vector<float> positions;
+    std::vector<uint32_t> counts{4, 4, 4, 4};
+    std::vector<uint32_t> indices{0, 1, 4, 3, 1, 2, 5, 4,
+                                  3, 4, 7, 6, 4, 5, 8, 7};
+
+    void SetUp() override {
+        for (int j = 0; j < 3; j++)
+            for (int i = 0; i < 3; i++)
+                positions.insert(positions.end(), {float(i), float(j), 0.0f});
+    }
+
+    Mesh build() const {
+        return Mesh::fromArrays(positions.data(), 9, counts.data(),
+                                counts.size(), indices.data(), indices.size());
+    }
+};
+
+TEST_F(HalfEdgeTest, Counts) {
+    Mesh mesh = build();
+    EXPECT_EQ(mesh.verts.size(), 9u);
+    EXPECT_EQ(mesh.faces.size(), 4u);
+    EXPECT_EQ(mesh.edges.size(), 12u);
+    EXPECT_EQ(mesh.halfEdges.size(), 16u);
+    EXPECT_FLOAT_EQ(mesh.faces[0]->normal.z, 1.0f);
+}
+
+TEST_F(HalfEdgeTest, OppositeHalfEdges) {
+    Mesh mesh = build();
+    const int h = mesh.findHalfEdge(1, 4);
+    ASSERT_GE(h, 0);
+    const int o = mesh.opposite(h);
+    ASSERT_GE(o, 0);
+    EXPECT_EQ(mesh.halfEdges[o].vert, 4);
+    EXPECT_EQ(mesh.opposite(o), h);
+    EXPECT_EQ(mesh.halfEdges[h].edge, mesh.halfEdges[o].edge);
+    EXPECT_EQ(mesh.opposite(mesh.findHalfEdge(0, 1)), -1);
+}
+
+TEST_F(HalfEdgeTest, OneRing) {
+    Mesh mesh = build();
+    std::vector<uint32_t> ring = mesh.oneRing(4);
+    std::sort(ring.begin(), ring.end());
+    EXPECT_EQ(ring, (std::vector<uint32_t>{1, 3, 5, 7}));
+    // Boundary vertex: fan starts and ends on the boundary
+    ring = mesh.oneRing(1);
+    ASSERT_EQ(ring.size(), 3u);
+    EXPECT_EQ(ring[1], 4u);
+}
+
+TEST_F(HalfEdgeTest, Boundary) {
+    Mesh mesh = build();
+    EXPECT_EQ(mesh.boundaryEdges().size(), 8u);
+    EXPECT_FALSE(mesh.isBoundaryVertex(4));
+    EXPECT_TRUE(mesh.isBoundaryVertex(0));
+    EXPECT_EQ(mesh.findEdge(0, 8), -1);
+}
+
+TEST_F(HalfEdgeTest, InvalidArrays) {
+    std::vector<uint32_t> badCounts{4};
+    EXPECT_THROW(Mesh::fromArrays(positions.data(), 9, badCounts.data(), 1,
+                                  indices.data(), indices.size()),
+                 std::invalid_argument);
+    std::vector<uint32_t> badIndices{0, 1, 42};
+    std::vector<uint32_t> triCount{3};
+    EXPECT_THROW(Mesh::fromArrays(positions.data(), 9, triCount.data(), 1,
+                                  badIndices.data(), badIndices.size()),
+                 std::out_of_range);
+}
@@ -0,0 +1,103 @@
+#include <cstring>
+#include <gtest/gtest.h>
+#include <mesh/mesh_io.h>
+#include <stdexcept>
+#include <string>
+
+using namespace meshTools::Mesh;
+
+TEST(ObjReaderTest, VerticesUvsAndFaces) {
+    const std::string text = "# comment\n"
+                             "v 0 0 0\nv 1 0 0\nv 1 1 0\r\nv 0 1 0\n"
+                             "vt 0.25 0.75\nvn 0 0 1\n"
+                             "f 1/1/1 2/1/1 3/1/1 4/1/1\n"
+                             "f -4 -3 -2";
+    ObjReader reader;
+    reader.feed(text.data(), text.size());
+    EXPECT_EQ(reader.vertexTotal, 4u);
+    EXPECT_EQ(reader.line, 9u);
+    ASSERT_EQ(reader.positions.size(), 12u);
+    EXPECT_FLOAT_EQ(reader.positions[6], 1.0f);
+    ASSERT_EQ(reader.uvs.size(), 3u);
+    EXPECT_FLOAT_EQ(reader.uvs[1], 0.75f);
+    EXPECT_FLOAT_EQ(reader.uvs[2], 0.0f);
+    EXPECT_EQ(reader.faceCounts, (std::vector<uint32_t>{4, 3}));
+    EXPECT_EQ(reader.faceIndices, (std::vector<int32_t>{0, 1, 2, 3, 0, 1, 2}));
+    EXPECT_EQ(reader.faceUvIndices,
+              (std::vector<int32_t>{0, 0, 0, 0, -1, -1, -1}));
+}
+
+TEST(ObjReaderTest, ChunksKeepRunningTotals) {
+    ObjReader reader(true);
+    const std::string first = "v 0 0 0\nv 1 0 0\nvt 0 0\n";
+    const std::string second = "v 0 1 0\nf 1/1 2/1 -1/1\n";
+    reader.feed(first.data(), first.size());
+    reader.clear();
+    reader.feed(second.data(), second.size());
+    EXPECT_EQ(reader.positions.size(), 3u);
+    EXPECT_TRUE(reader.uvs.empty());
+    EXPECT_TRUE(reader.faceUvIndices.empty());
+    EXPECT_EQ(reader.faceIndices, (std::vector<int32_t>{0, 1, 2}));
+}
+
+TEST(ObjReaderTest, MalformedStatements) {
+    for (const std::string text :
+         {"v 1 2\n", "v 0 0 0\nf 1 1\n", "f 1 x 2\n", "v 0 0 0\nf -2 1 1\n"}) {
+        ObjReader reader;
+        EXPECT_THROW(reader.feed(text.data(), text.size()),
+                     std::invalid_argument)
+            << text;
+    }
+}
+
+TEST(PlyTest, ParseNumbers) {
+    const std::string text = " 1 -2.5\n+3e2\t4 ";
+    std::vector<double> values;
+    EXPECT_EQ(parseNumbers(text.data(), text.size(), values), 4u);
+    EXPECT_EQ(values, (std::vector<double>{1, -2.5, 300, 4}));
+    const std::string bad = "1 two";
+    EXPECT_THROW(parseNumbers(bad.data(), bad.size(), values),
+                 std::invalid_argument);
+}
+
+TEST(PlyTest, TextListsStopAtIncompleteRow) {
+    // one leading value before each list, none after
+    const std::vector<double> values{7, 3, 0, 1, 2, 7, 4, 2, 3, 4, 5, 7, 3, 6};
+    std::vector<uint32_t> counts;
+    std::vector<int32_t> indices;
+    const size_t used = decodeTextLists(values.data(), values.size(), 1, 0, 10,
+                                        counts, indices);
+    EXPECT_EQ(used, 11u);
+    EXPECT_EQ(counts, (std::vector<uint32_t>{3, 4}));
+    EXPECT_EQ(indices, (std::vector<int32_t>{0, 1, 2, 2, 3, 4, 5}));
+}
+
+TEST(PlyTest, BinaryListsBigEndian) {
+    // ushort count, big-endian ushort ids, one trailing byte per row
+    const uint8_t data[] = {0, 3, 0, 1, 0, 2, 1, 0, 9,
+                            0, 3, 0, 4, 0, 5, 0, 6, 9};
+    std::vector<uint32_t> counts;
+    std::vector<int32_t> indices;
+    const size_t used =
+        decodeBinaryLists(data, sizeof(data), PlyType::UInt16, PlyType::UInt16,
+                          0, 1, true, 10, counts, indices);
+    EXPECT_EQ(used, sizeof(data));
+    EXPECT_EQ(counts, (std::vector<uint32_t>{3, 3}));
+    EXPECT_EQ(indices, (std::vector<int32_t>{1, 2, 256, 4, 5, 6}));
+}
+
+TEST(PlyTest, BinaryListsNativeInts) {
+    const int32_t ids[3] = {5, 6, 7};
+    uint8_t data[1 + sizeof(ids) + 2];
+    data[0] = 3;
+    std::memcpy(data + 1, ids, sizeof(ids));
+    std::vector<uint32_t> counts;
+    std::vector<int32_t> indices;
+    const size_t used =
+        decodeBinaryLists(data, sizeof(data), PlyType::UInt8, PlyType::Int32, 0,
+                          0, false, 1, counts, indices);
+    EXPECT_EQ(used, 13u);
+    EXPECT_EQ(indices, (std::vector<int32_t>{5, 6, 7}));
+    EXPECT_EQ(plyType("uint8"), PlyType::UInt8);
+    EXPECT_THROW(plyType("long"), std::invalid_argument);
+}
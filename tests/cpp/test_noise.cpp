@@ -0,0 +1,184 @@
+#include <geometry/parallel.h>
+#include <gtest/gtest.h>
+#include <noise/noise.h>
+#include <stdexcept>
+#include <vector>
+
+using namespace meshTools::Noise;
+using meshTools::Geometry::parallelFor;
+using meshTools::Geometry::threadCount;
+using meshTools::Geometry::ThreadPool;
+
+class NoiseArrayTest : public ::testing::Test {
+  protected:
+    std::vector<float> points;
+    size_t count = 20000;
+
+    void SetUp() override {
+        for (size_t i = 0; i < count * 4; i++)
+            points.push_back(0.37f * float(i % 97) - 0.011f * float(i));
+    }
+};
+
+TEST_F(NoiseArrayTest, ScalarMatchesPerPoint) {
+    Noise noise;
+    for (int dims = 2; dims <= 4; dims++) {
+        std::vector<float> out(count);
+        noise.snoiseArray(points.data(), count, dims, out.data(), 1);
+        for (size_t i = 0; i < count; i += 997) {
+            const float *p = points.data() + i * dims;
+            float expected = dims == 2   ? noise.snoise(p[0], p[1])
+                             : dims == 3 ? noise.snoise(p[0], p[1], p[2])
+                                         : noise.snoise(p[0], p[1], p[2], p[3]);
+            EXPECT_EQ(out[i], expected);
+        }
+    }
+}
+
+TEST_F(NoiseArrayTest, ThreadsMatchSingleThread) {
+    Noise noise;
+    std::vector<float> one(count * 3), many(count * 3);
+    noise.vfBmArray(points.data(), count, 4, 2.f, 0.5f, one.data(), 1);
+    noise.vfBmArray(points.data(), count, 4, 2.f, 0.5f, many.data(), 4);
+    EXPECT_EQ(one, many);
+    float x, y, z;
+    noise.vfBm(points[30], points[31], points[32], 4, 2.f, 0.5f, x, y, z);
+    EXPECT_EQ(one[30], x);
+    EXPECT_EQ(one[31], y);
+    EXPECT_EQ(one[32], z);
+}
+
+TEST_F(NoiseArrayTest, PacketsMatchScalar) {
+    Noise noise;
+    const bool simd = Noise::simd();
+    const size_t n = Noise::kPacketSize;
+    // integers, negatives and exact cell boundaries go through floor2int
+    std::vector<float> x = {-2.f, -0.5f, 0.f, 1.f, 3.75f, -17.3f, 250.2f, 1e4f};
+    std::vector<float> y = {0.25f, -1.f, 7.5f, -3.3f, 0.f, 2.f, -255.9f, 3.f};
+    std::vector<float> z = {1.5f, 2.f, -0.1f, 0.f, -9.f, 4.4f, 31.f, -2.5f};
+    for (bool enable : {false, true}) {
+        Noise::setSimd(enable);
+        std::vector<float> s(n), f(n), t(n), vf(n * 3), vt(n * 3);
+        noise.snoisePacket(x.data(), y.data(), z.data(), s.data());
+        noise.fBmPacket(x.data(), y.data(), z.data(), 8, 2.f, 0.5f, f.data());
+        noise.turbulencePacket(x.data(), y.data(), z.data(), 8, 2.f, 0.5f,
+                               t.data());
+        noise.vfBmPacket(x.data(), y.data(), z.data(), 5, 1.9f, 0.6f, vf.data(),
+                         vf.data() + n, vf.data() + 2 * n);
+        noise.vturbulencePacket(x.data(), y.data(), z.data(), 5, 1.9f, 0.6f,
+                                vt.data(), vt.data() + n, vt.data() + 2 * n);
+        for (size_t l = 0; l < n; l++) {
+            EXPECT_EQ(s[l], noise.snoise(x[l], y[l], z[l]));
+            EXPECT_EQ(f[l], noise.fBm(x[l], y[l], z[l], 8, 2.f, 0.5f));
+            EXPECT_EQ(t[l], noise.turbulence(x[l], y[l], z[l], 8, 2.f, 0.5f));
+            float ox, oy, oz;
+            noise.vfBm(x[l], y[l], z[l], 5, 1.9f, 0.6f, ox, oy, oz);
+            EXPECT_EQ(vf[l], ox);
+            EXPECT_EQ(vf[n + l], oy);
+            EXPECT_EQ(vf[2 * n + l], oz);
+            noise.vturbulence(x[l], y[l], z[l], 5, 1.9f, 0.6f, ox, oy, oz);
+            EXPECT_EQ(vt[l], ox);
+            EXPECT_EQ(vt[n + l], oy);
+            EXPECT_EQ(vt[2 * n + l], oz);
+        }
+    }
+    Noise::setSimd(simd);
+}
+
+TEST_F(NoiseArrayTest, PartialPacketMatchesScalar) {
+    Noise noise;
+    const size_t partial = 13;
+    std::vector<float> out(partial + 1, -5.f);
+    noise.turbulenceArray(points.data(), partial, 3, 2.f, 0.5f, out.data(), 1);
+    for (size_t i = 0; i < partial; i++) {
+        const float *p = points.data() + i * 3;
+        EXPECT_EQ(out[i], noise.turbulence(p[0], p[1], p[2], 3, 2.f, 0.5f));
+    }
+    EXPECT_EQ(out[partial], -5.f);
+}
+
+TEST_F(NoiseArrayTest, PoolMatchesSingleThread) {
+    Noise noise;
+    EXPECT_EQ(noise.threads(), 0u);
+    std::vector<float> one(count), pooled(count);
+    noise.fBmArray(points.data(), count, 8, 2.f, 0.5f, one.data(), 1);
+    noise.setThreads(3);
+    EXPECT_EQ(noise.threads(), 3u);
+    Noise copy = noise;
+    EXPECT_EQ(copy.threads(), 3u);
+    for (int repeat = 0; repeat < 3; repeat++) {
+        copy.fBmArray(points.data(), count, 8, 2.f, 0.5f, pooled.data());
+        EXPECT_EQ(one, pooled);
+    }
+    noise.clearThreads();
+    EXPECT_EQ(noise.threads(), 0u);
+    EXPECT_EQ(copy.threads(), 3u);
+}
+
+TEST_F(NoiseArrayTest, RejectsBadDims) {
+    Noise noise;
+    std::vector<float> out(count * 5);
+    EXPECT_THROW(noise.snoiseArray(points.data(), 4, 5, out.data()),
+                 std::invalid_argument);
+    EXPECT_THROW(noise.vsnoiseArray(points.data(), 4, 1, out.data()),
+                 std::invalid_argument);
+}
+
+TEST(ParallelFor, CoversRangeOnce) {
+    std::vector<int> hits(100000, 0);
+    parallelFor(hits.size(), 3, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++)
+            hits[i]++;
+    });
+    for (int h : hits)
+        ASSERT_EQ(h, 1);
+    EXPECT_EQ(threadCount(10, 8), 1u);
+}
+
+TEST(ThreadPool, CoversRangeOnceEachCall) {
+    ThreadPool pool(4);
+    EXPECT_EQ(pool.size(), 4u);
+    std::vector<int> hits(50000, 0);
+    for (int call = 1; call <= 5; call++) {
+        pool.parallelFor(
+            hits.size(),
+            [&](size_t begin, size_t end) {
+                for (size_t i = begin; i < end; i++)
+                    hits[i]++;
+            },
+            1000);
+        for (int h : hits)
+            ASSERT_EQ(h, call);
+    }
+    // below the grain everything runs on the calling thread
+    size_t calls = 0;
+    pool.parallelFor(10, [&](size_t, size_t) { calls++; });
+    EXPECT_EQ(calls, 1u);
+}
+
+TEST(SampleGrid, InterpolatesAndWraps) {
+    // f = x + 2y + 3z on a 4^3 grid with period 2: linear inside the cube
+    const size_t r = 4;
+    std::vector<float> grid(r * r * r);
+    for (size_t x = 0; x < r; x++)
+        for (size_t y = 0; y < r; y++)
+            for (size_t z = 0; z < r; z++)
+                grid[(x * r + y) * r + z] = float(x + 2 * y + 3 * z);
+    std::vector<float> points = {0.25f, 0.5f, 0.75f, 2.25f, -1.5f,
+                                 4.75f, 1.0f, 1.0f,  1.0f};
+    std::vector<float> out(3);
+    sampleGrid(grid.data(), r, 1, 2.f, points.data(), 3, false, out.data(), 1);
+    EXPECT_NEAR(out[0], 0.5f + 2.f + 4.5f, 1e-5f);
+    EXPECT_NEAR(out[1], out[0], 1e-5f); // one period away on every axis
+    EXPECT_NEAR(out[2], 2.f + 4.f + 6.f, 1e-5f);
+    // Catmull-Rom reproduces grid values exactly
+    sampleGrid(grid.data(), r, 1, 2.f, points.data() + 6, 1, true, out.data(),
+               1);
+    EXPECT_NEAR(out[0], 12.f, 1e-5f);
+    EXPECT_THROW(
+        sampleGrid(grid.data(), 1, 1, 2.f, points.data(), 1, false, out.data()),
+        std::invalid_argument);
+    EXPECT_THROW(
+        sampleGrid(grid.data(), r, 5, 2.f, points.data(), 1, false, out.data()),
+        std::invalid_argument);
+}
@@ -0,0 +1,161 @@
+#include <cmath>
+#include <geometry/polygon.h>
+#include <gtest/gtest.h>
+#include <numeric>
+#include <vector>
+
+using namespace meshTools::Geometry;
+
+namespace {
+
+// Polygons in CSR form, points stored as flat xyz floats
+struct Polygons {
+    std::vector<float> points;
+    std::vector<uint32_t> offsets{0};
+    std::vector<uint32_t> indices;
+
+    size_t count() const { return offsets.size() - 1; }
+
+    // Add a ring in the plane z = height, turned about x by tilt radians
+    void add(const std::vector<float> &xy, float height = 0, float tilt = 0) {
+        const uint32_t base = uint32_t(points.size() / 3);
+        for (size_t i = 0; i < xy.size(); i += 2) {
+            const float y = xy[i + 1];
+            points.push_back(xy[i]);
+            points.push_back(y * std::cos(tilt) - height * std::sin(tilt));
+            points.push_back(y * std::sin(tilt) + height * std::cos(tilt));
+            indices.push_back(base + uint32_t(i / 2));
+        }
+        offsets.push_back(uint32_t(indices.size()));
+    }
+
+    std::vector<uint32_t> triangulate(unsigned threads = 1) const {
+        std::vector<uint32_t> triangles(
+            3 * triangulatedCount(offsets.data(), count()));
+        triangulatePolygons(points.data(), offsets.data(), indices.data(),
+                            count(), triangles.data(), threads);
+        return triangles;
+    }
+
+    // Vector area of triangle (a, b, c)
+    Vector cross(uint32_t a, uint32_t b, uint32_t c) const {
+        const Vector pa(points[3 * a], points[3 * a + 1], points[3 * a + 2]);
+        const Vector pb(points[3 * b], points[3 * b + 1], points[3 * b + 2]);
+        const Vector pc(points[3 * c], points[3 * c + 1], points[3 * c + 2]);
+        return (pb - pa).cross(pc - pa) * 0.5f;
+    }
+
+    // Newell vector area of polygon f
+    Vector area(size_t f) const {
+        Vector total(0, 0, 0);
+        const uint32_t first = indices[offsets[f]];
+        for (uint32_t i = offsets[f] + 1; i + 1 < offsets[f + 1]; i++)
+            total = total + cross(first, indices[i], indices[i + 1]);
+        return total;
+    }
+};
+
+std::vector<float> star(int tips, float inner, float outer) {
+    std::vector<float> xy;
+    for (int i = 0; i < 2 * tips; i++) {
+        const float r = i % 2 ? inner : outer;
+        const float a = float(M_PI) * i / tips;
+        xy.push_back(r * std::cos(a));
+        xy.push_back(r * std::sin(a));
+    }
+    return xy;
+}
+
+// Check counts, winding and that triangle areas add up per polygon
+void expectTiles(const Polygons &polygons, const std::vector<uint32_t> &tris) {
+    size_t t = 0;
+    for (size_t f = 0; f < polygons.count(); f++) {
+        const size_t n = polygons.offsets[f + 1] - polygons.offsets[f];
+        const Vector expected = polygons.area(f);
+        const Vector normal = expected.normalize();
+        float sum = 0, absSum = 0;
+        for (size_t k = 0; n >= 3 && k < n - 2; k++, t++) {
+            const float a =
+                polygons.cross(tris[3 * t], tris[3 * t + 1], tris[3 * t + 2])
+                    .dot(normal);
+            sum += a;
+            absSum += std::fabs(a);
+        }
+        // no triangle is flipped: signed and unsigned areas agree
+        EXPECT_NEAR(sum, expected.length(), 1e-3f * (1 + sum)) << "face " << f;
+        EXPECT_NEAR(absSum, sum, 1e-3f * (1 + sum)) << "face " << f;
+    }
+    EXPECT_EQ(3 * t, tris.size());
+}
+
+} // namespace
+
+TEST(TriangulatePolygonsTest, Counts) {
+    Polygons polygons;
+    polygons.add({0, 0, 1, 0});
+    polygons.add({0, 0, 1, 0, 0, 1});
+    polygons.add({0, 0, 1, 0, 1, 1, 0, 1});
+    EXPECT_EQ(triangulatedCount(polygons.offsets.data(), polygons.count()), 3u);
+    const std::vector<uint32_t> tris = polygons.triangulate();
+    // triangles pass through unchanged, the short ring is skipped
+    EXPECT_EQ(tris[0], 2u);
+    EXPECT_EQ(tris[1], 3u);
+    EXPECT_EQ(tris[2], 4u);
+    expectTiles(polygons, tris);
+}
+
+TEST(TriangulatePolygonsTest, ConcaveAndTilted) {
+    Polygons polygons;
+    // U shape, an arrow head, stars and a clockwise square
+    const std::vector<float> u = {0, 0, 3, 0, 3, 2, 2, 2,
+                                  2, 1, 1, 1, 1, 2, 0, 2};
+    polygons.add(u);
+    polygons.add(u, 1.0f, 2.0f);
+    polygons.add({0, 0, 2, 1, 0, 2, 0.5f, 1});
+    polygons.add(star(5, 0.4f, 1.0f), 0.5f, 0.7f);
+    polygons.add(star(7, 0.2f, 1.0f), 0.0f, 3.1f);
+    polygons.add({0, 0, 0, 1, 1, 1, 1, 0});
+    expectTiles(polygons, polygons.triangulate());
+}
+
+TEST(TriangulatePolygonsTest, LargeRingsUseZOrder) {
+    Polygons polygons;
+    // a comb (deep concavities) and a many-tipped star, both past the
+    // size where ear tests walk the z-order list
+    std::vector<float> comb = {0, 0};
+    for (int i = 0; i < 60; i++) {
+        comb.insert(comb.end(), {float(2 * i), 5, float(2 * i + 1), 5,
+                                 float(2 * i + 1), 0.5f});
+    }
+    comb.insert(comb.end(), {120, 0});
+    // the comb runs clockwise
+    polygons.add(comb);
+    polygons.add(star(200, 0.9f, 1.0f), 0.0f, 0.3f);
+    expectTiles(polygons, polygons.triangulate());
+}
+
+TEST(TriangulatePolygonsTest, DegenerateInput) {
+    Polygons polygons;
+    // collinear ring, repeated vertices and a bow tie
+    polygons.add({0, 0, 1, 0, 2, 0, 3, 0});
+    polygons.add({0, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1});
+    polygons.add({0, 0, 1, 1, 1, 0, 0, 1});
+    const std::vector<uint32_t> tris = polygons.triangulate();
+    ASSERT_EQ(tris.size(), 3u * (2 + 4 + 2));
+    // every triangle still references its own polygon's vertices
+    size_t t = 0;
+    for (size_t f = 0; f < polygons.count(); f++) {
+        const size_t n = polygons.offsets[f + 1] - polygons.offsets[f];
+        for (size_t k = 0; k < 3 * (n - 2); k++, t++) {
+            EXPECT_GE(tris[t], polygons.indices[polygons.offsets[f]]);
+            EXPECT_LE(tris[t], polygons.indices[polygons.offsets[f + 1] - 1]);
+        }
+    }
+}
+
+TEST(TriangulatePolygonsTest, ThreadsMatchSerial) {
+    Polygons polygons;
+    for (int i = 0; i < 3000; i++)
+        polygons.add(star(3 + i % 20, 0.5f, 1.0f), float(i), 0.01f * i);
+    EXPECT_EQ(polygons.triangulate(1), polygons.triangulate(4));
+}
@@ -2,6 +2,7 @@
 #include <geometry/transform.h>
 #include <geometry/vector.h>
 #include <cmath>
+#include <vector>
 
 using namespace meshTools::Geometry;
 
@@ -191,3 +192,59 @@ TEST_F(TransformTest, AssignmentOperator) {
     EXPECT_FLOAT_EQ(t2.m[1][3], 2.0f);
     EXPECT_FLOAT_EQ(t2.m[2][3], 3.0f);
 }
+
+TEST_F(TransformTest, ApplyToArrayMatchesApplyTransform) {
+    Transform t = identity.rotateAxis(0.7f, Vector(0.0f, 0.6f, 0.8f)) *
+                  identity.translate(1.0f, -2.0f, 0.5f) *
+                  identity.scale(2.0f, 3.0f, 0.5f);
+    std::vector<Vector> points;
+    for (int i = 0; i < 21; i++)
+        points.emplace_back(0.5f * i, 1.0f - i, 0.25f * i * i);
+    std::vector<Vector> out(points.size());
+    t.applyToArray(reinterpret_cast<const float *>(points.data()),
+                   reinterpret_cast<float *>(out.data()), points.size());
+    for (size_t i = 0; i < points.size(); i++) {
+        Vector expected = points[i].applyTransform(t);
+        EXPECT_FLOAT_EQ(out[i].x, expected.x);
+        EXPECT_FLOAT_EQ(out[i].y, expected.y);
+        EXPECT_FLOAT_EQ(out[i].z, expected.z);
+    }
+
+    // in place
+    t.applyToArray(reinterpret_cast<const float *>(points.data()),
+                   reinterpret_cast<float *>(points.data()), points.size());
+    for (size_t i = 0; i < points.size(); i++)
+        EXPECT_FLOAT_EQ(points[i].y, out[i].y);
+}
+
+TEST_F(TransformTest, ApplyToNormalsUsesInverseTranspose) {
+    // a plane tilted in x-y keeps its normal perpendicular after a
+    // non-uniform scale
+    Transform t = identity.scale(4.0f, 1.0f, 1.0f);
+    Vector tangent(1.0f, -1.0f, 0.0f);
+    Vector normal(1.0f, 1.0f, 0.0f);
+    Vector out;
+    t.applyToNormals(&normal.x, &out.x, 1);
+    EXPECT_NEAR(out.dot(tangent.applyTransform(t)), 0.0f, 1e-6f);
+    EXPECT_NEAR(out.length(), 1.0f, 1e-6f);
+
+    t.applyToNormals(&normal.x, &out.x, 1, false);
+    EXPECT_FLOAT_EQ(out.x, 0.25f);
+    EXPECT_FLOAT_EQ(out.y, 1.0f);
+}
+
+TEST_F(TransformTest, FuseAppliesChainInOrder) {
+    Transform a = identity.translate(1.0f, 0.0f, 0.0f);
+    Transform b = identity.scale(2.0f, 2.0f, 2.0f);
+    Transform c = identity.rotateZ(0.5f);
+    Transform fused = Transform::fuse({a, b, c});
+    Vector expected = v1.applyTransform(a).applyTransform(b).applyTransform(c);
+    Vector result = v1.applyTransform(fused);
+    EXPECT_NEAR(result.x, expected.x, 1e-5f);
+    EXPECT_NEAR(result.y, expected.y, 1e-5f);
+    EXPECT_NEAR(result.z, expected.z, 1e-5f);
+
+    Transform single = Transform::fuse({});
+    EXPECT_FLOAT_EQ(single.m[0][0], 1.0f);
+    EXPECT_FLOAT_EQ(single.m[0][3], 0.0f);
+}
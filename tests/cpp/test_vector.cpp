@@ -1,5 +1,6 @@
 #include <gtest/gtest.h>
 #include <geometry/vector.h>
+#include <geometry/vector_array.h>
 #include <cmath>
 
 using namespace meshTools::Geometry;
@@ -275,3 +276,14 @@ TEST(VectorSortTest, SortedVectorArray) {
     // Original should be unchanged
     EXPECT_FLOAT_EQ(vectors[0].y, 3.0f);
 }
+
+TEST(VectorArrayTest, FloatBufferAliasesVectors) {
+    const float points[6] = {1.0f, 2.0f, 3.0f, 4.0f, 5.0f, 6.0f};
+    VectorArray array(points, 2);
+    ASSERT_EQ(array.size(), 2u);
+    EXPECT_EQ(array[1], Vector(4.0f, 5.0f, 6.0f));
+    array.data()[3] = 7.0f;
+    EXPECT_FLOAT_EQ(array.vectors()[1].x, 7.0f);
+    EXPECT_EQ(reinterpret_cast<const float *>(array.vectors().data()),
+              array.data());
+}
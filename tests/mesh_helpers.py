@@ -0,0 +1,61 @@
+"""Small meshes and helpers shared by the test modules.
+
+Import after pytest.importorskip("meshTools"); tests/ is on sys.path when
+pytest collects from it.
+"""
+
+from meshTools import Mesh, Point, Vector
+
+# outward-facing quads over cube_positions()
+CUBE_FACES = [
+    [0, 1, 3, 2],
+    [4, 6, 7, 5],
+    [0, 4, 5, 1],
+    [2, 3, 7, 6],
+    [0, 2, 6, 4],
+    [1, 5, 7, 3],
+]
+
+
+def csr(faces):
+    """Return (offsets, indices) NumPy arrays of a list of faces."""
+    import numpy as np
+
+    offsets = np.cumsum([0] + [len(face) for face in faces])
+    return offsets, np.array([v for face in faces for v in face])
+
+
+def cube_positions():
+    """(8, 3) corners of the cube [-1, 1]^3, x slowest."""
+    import numpy as np
+
+    return np.array(
+        [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], float
+    )
+
+
+def cube_mesh(cls=Mesh):
+    """The cube [-1, 1]^3 built through addVertex / addFace."""
+    mesh = cls()
+    for p in cube_positions().tolist():
+        mesh.addVertex(Point(*p))
+    for face in CUBE_FACES:
+        mesh.addFace(face)
+    return mesh
+
+
+def uv_mesh(cls=Mesh):
+    """A quad and a triangle with one UV per corner."""
+    mesh = cls()
+    for p in [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0)]:
+        mesh.addVertex(Point(*p))
+    mesh.addFace([0, 1, 2, 3])
+    mesh.addFace([1, 4, 2])
+    mesh.uvs = [Vector(x, y, 0) for x, y in [(0, 0), (1, 0), (1, 1), (0, 1)]]
+    mesh.face_uvs = [[0, 1, 2, 3], [1, 0, 2]]
+    return mesh
+
+
+def xyz(v):
+    """Components of a Vector or Point as a tuple."""
+    return (v.x, v.y, v.z)
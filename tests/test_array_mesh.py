@@ -0,0 +1,160 @@
+"""Tests for array-backed mesh storage (MeshBuffers, ArrayMesh)."""
+
+from copy import copy
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from meshTools import ArrayMesh, Mesh, MeshBuffers, Point
+
+
+def _grid_mesh(cls):
+    """2x1 quad strip: 6 vertices, 2 faces."""
+    mesh = cls()
+    for x in range(3):
+        mesh.addVertex(Point(x, 0, 0))
+        mesh.addVertex(Point(x, 1, 0))
+    mesh.addFace([0, 2, 3, 1])
+    mesh.addFace([2, 4, 5, 3])
+    return mesh
+
+
+class TestMeshBuffers:
+    """CSR storage behaviour."""
+
+    def test_from_arrays(self):
+        b = MeshBuffers(
+            np.zeros((4, 3)),
+            face_counts=[3, 3],
+            face_indices=[0, 1, 2, 2, 1, 3],
+        )
+        assert b.positions.dtype == np.float32
+        assert b.positions.shape == (4, 3)
+        assert b.face_offsets.tolist() == [0, 3, 6]
+        assert b.face(1) == [2, 1, 3]
+
+    def test_inconsistent_csr_raises(self):
+        with pytest.raises(ValueError):
+            MeshBuffers(np.zeros((3, 3)), [3, 3], [0, 1, 2])
+
+    def test_staged_edits_compact(self):
+        b = MeshBuffers(np.zeros((5, 3)), [3, 3], [0, 1, 2, 2, 1, 3])
+        b.setFace(0, [0, 1, 4, 2])
+        b.appendFace([1, 3, 4])
+        b.setFace(1, [3, 2, 1])
+        assert b.faces() == [[0, 1, 4, 2], [3, 2, 1], [1, 3, 4]]
+        assert b.face_counts.tolist() == [4, 3, 3]
+
+    def test_vertex_faces_incremental(self):
+        b = MeshBuffers(np.zeros((5, 3)), [3, 3], [0, 1, 2, 2, 1, 3])
+        assert b.vertexFaces(1) == [0, 1]
+        b.appendFace([1, 3, 4])
+        b.setFace(0, [0, 4, 2])
+        assert sorted(b.vertexFaces(1)) == [1, 2]
+        assert sorted(b.vertexFaces(4)) == [0, 2]
+        offsets, faces = b.vertexFaceTable()
+        assert faces[offsets[4] : offsets[5]].tolist() == [0, 2]
+
+    def test_set_vertex_index(self):
+        b = MeshBuffers(np.zeros((3, 3)), [3], [0, 1, 2])
+        b.appendVertex((0, 0, 0))  # leaves spare capacity past vertex 3
+        assert b.setVertex(-1, (1, 2, 3)) == 3
+        assert b.vertex(3) == (1, 2, 3)
+        with pytest.raises(IndexError):
+            b.setVertex(4, (0, 0, 0))
+        with pytest.raises(IndexError):
+            b.setVertex(-5, (0, 0, 0))
+
+    def test_delete_faces(self):
+        b = MeshBuffers(
+            np.zeros((5, 3)), [3, 3, 3], [0, 1, 2, 2, 1, 3, 1, 3, 4]
+        )
+        b.deleteFaces([1])
+        assert b.faces() == [[0, 1, 2], [1, 3, 4]]
+        assert b.vertexFaces(3) == [1]
+
+
+class TestArrayMesh:
+    """ArrayMesh matches the list-backed Mesh."""
+
+    def test_matches_list_mesh(self):
+        ref = _grid_mesh(Mesh)
+        mesh = _grid_mesh(ArrayMesh)
+        assert len(mesh.vertices) == len(ref.vertices)
+        assert [list(f) for f in mesh.faces] == ref.faces
+        for a, b in zip(mesh.normals, ref.normals):
+            assert (a - b).length() < 1e-6
+        for i in range(len(ref.vertices)):
+            assert mesh.vertices[i].parent_faces == ref.vertices[i].parent_faces
+
+    def test_update_vertex_negative_id(self):
+        mesh = _grid_mesh(ArrayMesh)
+        assert mesh.normals[1].z == pytest.approx(1)
+        mesh.updateVertex(-1, Point(2, 1, 1))
+        assert mesh.buffers.positions[5].tolist() == [2, 1, 1]
+        assert mesh.normals[1].z < 0.99
+
+    def test_views_write_through(self):
+        mesh = _grid_mesh(ArrayMesh)
+        mesh.updateVertex(0, Point(0, 0, 2))
+        assert mesh.buffers.positions[0].tolist() == [0, 0, 2]
+        mesh.faces[1][0] = 0
+        assert mesh.buffers.face(1) == [0, 4, 5, 3]
+        assert 1 in mesh.vertices[0].parent_faces
+        mesh.updateFace(0, [0, 2, 3])
+        assert mesh.faces[0] == [0, 2, 3]
+
+    def test_ruler_persists(self):
+        mesh = _grid_mesh(ArrayMesh)
+        mesh.vertices[3].addRuler(Point(0, 0, 1))
+        assert mesh.vertices[3].ruler.z == 1
+
+    def test_truncate_and_copy(self):
+        mesh = _grid_mesh(ArrayMesh)
+        vertices = copy(mesh.vertices)
+        vertices[0] = Point(9, 9, 9)
+        assert mesh.vertices[0].x == 0
+        mesh.vertices += vertices
+        assert len(mesh.vertices) == 12
+        mesh.vertices = mesh.vertices[:6]
+        assert len(mesh.vertices) == 6
+
+    def test_from_arrays_and_mesh(self):
+        ref = _grid_mesh(Mesh)
+        mesh = ArrayMesh.fromMesh(ref)
+        other = ArrayMesh(
+            mesh.buffers.positions,
+            mesh.buffers.face_counts,
+            mesh.buffers.face_indices,
+        )
+        assert other.buffers.faces() == ref.faces
+        assert len(other.normals) == 2
+
+    def test_edges_match_list_mesh(self):
+        ref = _grid_mesh(Mesh)
+        mesh = _grid_mesh(ArrayMesh)
+        other = ArrayMesh(
+            mesh.buffers.positions,
+            mesh.buffers.face_counts,
+            mesh.buffers.face_indices,
+        )
+        assert mesh.edges == ref.edges
+        assert other.edges == ref.edges
+        assert other.findEdge(3, 2) == ref.findEdge(2, 3)
+
+    def test_bvh_cached_until_buffers_change(self):
+        mesh = _grid_mesh(ArrayMesh)
+        bvh = mesh.bvh()
+        assert mesh.bvh() is bvh
+        assert bvh.triangle_count == _grid_mesh(Mesh).bvh().triangle_count == 4
+        origins = np.float32([[0.5, 0.5, 1], [1.5, 0.5, 1], [5, 5, 1]])
+        directions = np.float32([[0, 0, -1]] * 3)
+        t, faces, _, _ = bvh.raycast(origins, directions)
+        assert faces.tolist() == [0, 1, -1]
+        assert t[:2].tolist() == [1, 1]
+        mesh.updateVertex(0, Point(0, 0, -1))
+        assert mesh.bvh() is not bvh
+        t, faces, _, _ = mesh.bvh().raycast(origins, directions)
+        assert faces.tolist() == [0, 1, -1]
+        assert t[0] > 1
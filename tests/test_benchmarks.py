@@ -0,0 +1,57 @@
+"""Smoke tests for the benchmark suite: every case runs at a tiny size."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+
+_repo_root = str(Path(__file__).resolve().parent.parent)
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from benchmarks import run
+from benchmarks.cases import CASES
+
+_VARIANTS = [(name, v) for name, bench in CASES.items() for v in bench.variants]
+
+
+@pytest.mark.parametrize("name, variant", _VARIANTS)
+def test_case_runs(name, variant):
+    bench = CASES[name]
+    reason = bench.skipReason(64, variant)
+    if reason:
+        pytest.skip(reason)
+    result = run.measure(bench, 64, variant, repeat=1)
+    assert result["items"] > 0
+    assert result["seconds"] >= 0
+    assert result["unit"] == bench.unit
+
+
+def test_limits_skip_large_sizes():
+    assert CASES["chull.Hull"].skipReason(10**6, "python")
+    assert CASES["noise.fBm"].skipReason(10**6, "python")
+
+
+def test_parse_scale():
+    assert run.parseScale("1M") == 1_000_000
+    assert run.parseScale("250") == 250
+    with pytest.raises(run.argparse.ArgumentTypeError):
+        run.parseScale("huge")
+
+
+def test_speedups_and_regressions():
+    results = [
+        {"case": "c", "variant": "python", "size": 1, "seconds": 4.0},
+        {"case": "c", "variant": "native", "size": 1, "seconds": 0.5},
+        {"case": "c", "variant": "native", "size": 2, "seconds": 0.5},
+    ]
+    assert run.speedups(results) == [
+        {"case": "c", "variant": "native", "size": 1, "speedup": 8.0}
+    ]
+    results[1]["throughput"] = 70.0
+    baseline = {"results": [dict(results[1], throughput=100.0)]}
+    assert len(run.regressions(results, baseline, 0.25)) == 1
+    assert run.regressions(results, baseline, 0.5) == []
@@ -6,10 +6,12 @@ import pytest
 pytest.importorskip("meshTools.geometry")
 from meshTools.geometry import (
     BBox,
+    Bvh,
     Transform,
     Vector,
     Ray,
     Polygon,
+    VectorArray,
     epsilonTest,
     pointInPoly,
     interpolateBezier,
@@ -18,7 +20,9 @@ from meshTools.geometry import (
     solveCubic,
     fit,
     getBarycentric,
+    rangeBounds,
     sortedVectorArray,
+    triangulatePolygons,
 )
 
 
@@ -222,6 +226,54 @@ class TestBBox:
         if center is not None:
             assert hasattr(center, "x")
 
+    def test_obb_principal_axes(self):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(5)
+        points = rng.normal(size=(5000, 3)) * [5, 2, 0.5] + 1000
+        points = points.astype(np.float32)
+        b = BBox()
+        b.obbFromPointSet(points)
+        _, vectors = np.linalg.eigh(np.cov(points.T.astype(np.float64)))
+        axes = np.array([[a.x, a.y, a.z] for a in b.axis])
+        assert np.allclose(
+            np.abs(axes @ vectors[:, ::-1]), np.eye(3), atol=1e-3
+        )
+        assert np.linalg.det(axes) == pytest.approx(1, abs=1e-5)
+        local = points @ axes.T
+        assert b.min.x == pytest.approx(local[:, 0].min(), abs=1e-2)
+
+    def test_from_point_set_array(self):
+        np = pytest.importorskip("numpy")
+        points = np.random.default_rng(2).normal(size=(20001, 3))
+        points = points.astype(np.float32)
+        for source in (points, VectorArray(points)):
+            for threads in (1, 0, 3):
+                b = BBox()
+                b.fromPointSet(source, threads=threads)
+                assert [b.min.x, b.min.y, b.min.z] == points.min(0).tolist()
+                assert [b.max.x, b.max.y, b.max.z] == points.max(0).tolist()
+        b.fromPointSet(np.arange(6.0).reshape(2, 3))
+        assert b.center == Vector(1.5, 2.5, 3.5)
+
+    def test_range_bounds(self):
+        np = pytest.importorskip("numpy")
+        points = np.random.default_rng(3).random((50, 3), dtype=np.float32)
+        offsets = np.array([0, 10, 10, 50])
+        bounds = rangeBounds(points, offsets, threads=0)
+        assert bounds.shape == (3, 2, 3)
+        assert np.array_equal(bounds[0, 0], points[:10].min(0))
+        assert np.array_equal(bounds[2, 1], points[10:].max(0))
+        assert np.isposinf(bounds[1, 0]).all()
+        assert np.isneginf(bounds[1, 1]).all()
+        faces = np.array([4, 8, 1, 7, 7])
+        bounds = rangeBounds(points, np.array([0, 3, 5]), indices=faces)
+        assert np.array_equal(bounds[0, 1], points[[4, 8, 1]].max(0))
+        assert np.array_equal(bounds[1, 0], points[7])
+        with pytest.raises(ValueError):
+            rangeBounds(points, np.array([0, 5, 3]))
+        with pytest.raises(ValueError):
+            rangeBounds(points, np.array([0, 2]), indices=np.array([0, 50]))
+
 
 class TestRay:
     """Ray binding tests."""
@@ -241,6 +293,149 @@ class TestRay:
         dist = r.pointDistance(p)
         assert isinstance(dist, (int, float))
 
+    def test_triangle_ray_hit(self):
+        r = Ray(Vector(0.25, 0.25, 2), Vector(0, 0, -1))
+        hit = r.triangleRayHit(
+            Vector(0, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0)
+        )
+        assert (hit.x, hit.y, hit.z) == pytest.approx((0.25, 0.25, 2))
+        miss = r.triangleRayHit(
+            Vector(2, 0, 0), Vector(3, 0, 0), Vector(2, 1, 0)
+        )
+        assert miss.z == 0
+
+
+def _bvh_grid(np, n=8):
+    """Bumpy n x n quad grid in the XZ plane as positions and CSR faces."""
+    i, j = np.meshgrid(np.arange(n + 1), np.arange(n + 1))
+    y = 0.25 * np.sin(0.9 * i + 0.5 * j)
+    positions = np.stack([i, y, j], axis=-1).reshape(-1, 3).astype(np.float32)
+    a = (np.arange(n)[None, :] + (n + 1) * np.arange(n)[:, None]).ravel()
+    indices = np.stack([a, a + 1, a + n + 2, a + n + 1], axis=1).ravel()
+    offsets = np.arange(0, 4 * n * n + 1, 4)
+    return positions, offsets.astype(np.uint32), indices.astype(np.uint32)
+
+
+def _brute_raycast(np, positions, offsets, indices, origins, directions):
+    """Closest two-sided hit t per ray over fan triangles (inf on a miss)."""
+    best = np.full(len(origins), np.inf)
+    for f in range(len(offsets) - 1):
+        face = indices[offsets[f] : offsets[f + 1]]
+        for k in range(1, len(face) - 1):
+            v0, v1, v2 = positions[[face[0], face[k], face[k + 1]]]
+            e1, e2 = v1 - v0, v2 - v0
+            p = np.cross(directions, e2)
+            det = p @ e1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                s = origins - v0
+                u = np.einsum("ij,ij->i", s, p) / det
+                q = np.cross(s, e1)
+                v = np.einsum("ij,ij->i", directions, q) / det
+                t = q @ e2 / det
+            ok = (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0) & (det != 0)
+            best = np.where(ok & (t < best), t, best)
+    return best
+
+
+class TestBvh:
+    """Bvh binding tests, checked against brute force."""
+
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    def test_counts(self, np):
+        positions, offsets, indices = _bvh_grid(np)
+        bvh = Bvh(positions, offsets, indices)
+        assert bvh.triangle_count == 2 * 8 * 8
+        assert 1 <= bvh.node_count < 2 * bvh.triangle_count
+
+    def test_raycast_matches_brute_force(self, np):
+        positions, offsets, indices = _bvh_grid(np)
+        bvh = Bvh(positions, offsets, indices)
+        rng = np.random.default_rng(1)
+        count = 400
+        origins = np.column_stack(
+            [
+                rng.uniform(-1, 9, count),
+                np.full(count, 2.0),
+                rng.uniform(-1, 9, count),
+            ]
+        ).astype(np.float32)
+        directions = np.column_stack(
+            [
+                rng.uniform(-1, 1, count),
+                -np.ones(count),
+                rng.uniform(-1, 1, count),
+            ]
+        ).astype(np.float32)
+        t, faces, points, normals = bvh.raycast(origins, directions, threads=0)
+        expected = _brute_raycast(
+            np,
+            positions.astype(np.float64),
+            offsets,
+            indices,
+            origins.astype(np.float64),
+            directions.astype(np.float64),
+        )
+        hit = np.isfinite(expected)
+        assert hit.sum() > 200
+        np.testing.assert_array_equal(np.isfinite(t), hit)
+        np.testing.assert_allclose(t[hit], expected[hit], rtol=1e-4, atol=1e-5)
+        assert (faces[~hit] == -1).all() and (faces[hit] >= 0).all()
+        assert np.isnan(points[~hit]).all()
+        np.testing.assert_allclose(
+            points[hit],
+            origins[hit] + t[hit, None] * directions[hit],
+            atol=1e-4,
+        )
+        np.testing.assert_allclose(
+            np.linalg.norm(normals[hit], axis=1), 1, atol=1e-5
+        )
+        np.testing.assert_array_equal(bvh.occluded(origins, directions), hit)
+        short = bvh.occluded(origins, directions, max_distance=0.5)
+        assert not short.any()
+
+    def test_closest_point(self, np):
+        positions, offsets, indices = _bvh_grid(np)
+        bvh = Bvh(positions, offsets, indices)
+        rng = np.random.default_rng(2)
+        points = rng.uniform(-2, 10, (200, 3)).astype(np.float32)
+        closest, faces, distances = bvh.closestPoint(points)
+        # brute force: one single-face tree per face, no pruning across faces
+        per_face = np.stack(
+            [
+                Bvh(positions, offsets[f : f + 2], indices).closestPoint(
+                    points
+                )[2]
+                for f in range(len(offsets) - 1)
+            ]
+        )
+        np.testing.assert_allclose(distances, per_face.min(axis=0), atol=1e-5)
+        np.testing.assert_array_equal(
+            per_face[faces, np.arange(len(points))], distances
+        )
+        np.testing.assert_allclose(
+            np.linalg.norm(closest - points, axis=1), distances, atol=1e-4
+        )
+        # nothing within a small radius of a far point
+        far = np.float32([[4, 50, 4]])
+        closest, faces, distances = bvh.closestPoint(far, max_distance=1)
+        assert faces[0] == -1 and np.isinf(distances[0])
+        assert np.isnan(closest).all()
+
+    def test_invalid_faces(self, np):
+        positions, offsets, indices = _bvh_grid(np)
+        with pytest.raises(ValueError):
+            Bvh(positions, offsets, np.full_like(indices, len(positions)))
+        with pytest.raises(ValueError):
+            Bvh(positions, offsets[::-1].copy(), indices)
+        with pytest.raises(ValueError):
+            Bvh(positions, np.zeros(0, np.uint32), indices)
+        bvh = Bvh(positions, offsets, indices)
+        with pytest.raises(ValueError):
+            bvh.raycast(positions, positions[:3])
+
 
 class TestTransform:
     """Transform binding tests."""
@@ -281,6 +476,56 @@ class TestTransform:
         c = a * b
         assert c.m is not None
 
+    def test_apply_to_array(self):
+        np = pytest.importorskip("numpy")
+        t = Transform().rotateAxis(0.7, Vector(0, 0.6, 0.8))
+        t = t * Transform().translate(1.0, -2.0, 0.5)
+        points = np.random.default_rng(1).random((37, 3), dtype=np.float32)
+        result = t.applyToArray(points)
+        assert result.dtype == np.float32 and result.shape == (37, 3)
+        for p, r in zip(points.tolist(), result.tolist()):
+            expected = Vector(*p).applyTransform(t)
+            assert r == pytest.approx([expected.x, expected.y, expected.z])
+        assert t.applyToArray(points, out=points) is points
+        assert np.array_equal(points, result)
+        array = VectorArray(points)
+        t.applyToArray(array, out=array)
+        assert array[0].x == pytest.approx(
+            Vector(*result[0]).applyTransform(t).x
+        )
+
+    def test_apply_to_array_rejects_bad_out(self):
+        np = pytest.importorskip("numpy")
+        points = np.zeros((4, 3), dtype=np.float32)
+        with pytest.raises(TypeError):
+            Transform().applyToArray(points, out=np.zeros((4, 3)))
+        with pytest.raises(ValueError):
+            Transform().applyToArray(points, out=np.zeros((3, 3), np.float32))
+
+    def test_apply_to_normals(self):
+        np = pytest.importorskip("numpy")
+        t = Transform().scale(4.0, 1.0, 1.0)
+        normals = np.array([[1, 1, 0], [0, 0, 2]], dtype=np.float32)
+        result = t.applyToNormals(normals)
+        assert np.allclose(np.linalg.norm(result, axis=1), 1)
+        tangent = Vector(1, -1, 0).applyTransform(t)
+        assert abs(Vector(*result[0]).dot(tangent)) < 1e-6
+        raw = t.applyToNormals(normals, normalize=False)
+        assert raw[0].tolist() == pytest.approx([0.25, 1, 0])
+
+    def test_fuse(self):
+        chain = [
+            Transform().translate(1.0, 0.0, 0.0),
+            Transform().scale(2.0, 2.0, 2.0),
+            Transform().rotateZ(0.5),
+        ]
+        v = Vector(1, 2, 3)
+        expected = v
+        for t in chain:
+            expected = expected.applyTransform(t)
+        result = v.applyTransform(Transform.fuse(chain))
+        assert (result - expected).length() < 1e-5
+
 
 class TestPolygon:
     """Polygon binding tests."""
@@ -297,3 +542,107 @@ class TestPolygon:
         tris = poly.triangulate()
         assert isinstance(tris, list)
         assert all(isinstance(i, int) for i in tris)
+
+
+class TestTriangulatePolygons:
+    """Batched ear clipping over CSR polygons."""
+
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    @staticmethod
+    def _area(np, points, triangles):
+        a, b, c = (points[triangles[:, k]] for k in range(3))
+        return np.cross(b - a, c - a)[:, 2] / 2
+
+    def test_concave_and_mixed_sizes(self, np):
+        # U shape (area 5), a triangle, a quad, a segment
+        u = [(0, 0), (3, 0), (3, 2), (2, 2), (2, 1), (1, 1), (1, 2), (0, 2)]
+        points = np.array([(x, y, 0) for x, y in u], dtype=np.float32)
+        offsets = np.array([0, 8, 11, 15, 17])
+        indices = np.array(list(range(8)) + [0, 1, 2] + [0, 1, 2, 7] + [3, 4])
+        triangles = triangulatePolygons(points, offsets, indices)
+        assert triangles.shape == (6 + 1 + 2, 3)
+        assert triangles[6].tolist() == [0, 1, 2]
+        area = self._area(np, points, triangles)
+        # every triangle keeps the counterclockwise winding
+        assert (area > 0).all()
+        assert area[:6].sum() == pytest.approx(5)
+        assert area[7:].sum() == pytest.approx(6)
+
+    def test_threads_and_large_rings(self, np):
+        angles = np.linspace(0, 2 * np.pi, 1000, endpoint=False)
+        radius = np.where(np.arange(1000) % 2, 0.5, 1.0)
+        ring = np.stack(
+            [radius * np.cos(angles), radius * np.sin(angles), 0 * angles], 1
+        )
+        points = np.concatenate([ring, ring + (3, 0, 0)]).astype(np.float32)
+        offsets = np.array([0, 1000, 2000])
+        # second copy wound clockwise
+        indices = np.concatenate([np.arange(1000), np.arange(2000, 1000, -1)])
+        indices[1000] = 1000
+        triangles = triangulatePolygons(points, offsets, indices, threads=2)
+        assert triangles.shape == (2 * 998, 3)
+        area = self._area(np, points, triangles)
+        assert (area[:998] >= 0).all() and (area[998:] <= 0).all()
+        assert area[:998].sum() == pytest.approx(-area[998:].sum(), rel=1e-4)
+
+    def test_bad_offsets(self, np):
+        points = np.zeros((3, 3), dtype=np.float32)
+        with pytest.raises(ValueError):
+            triangulatePolygons(points, np.array([0, 4]), np.array([0, 1, 2]))
+        with pytest.raises(ValueError):
+            triangulatePolygons(points, np.array([0, 3]), np.array([0, 1, 5]))
+
+
+class TestVectorArray:
+    """VectorArray buffer type and the entry points that accept it."""
+
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    def test_numpy_view_shares_memory(self, np):
+        points = np.arange(12, dtype=np.float32).reshape(4, 3)
+        array = VectorArray(points)
+        view = np.asarray(array)
+        assert view.dtype == np.float32 and view.shape == (4, 3)
+        assert np.array_equal(view, points)
+        view[1] = (7, 8, 9)
+        assert array[1] == Vector(7, 8, 9)
+        array[-1] = Vector(1, 2, 3)
+        assert view[3].tolist() == [1, 2, 3]
+        memory = memoryview(array)
+        assert memory.format == "f" and memory.shape == (4, 3)
+
+    def test_init_and_sequence(self, np):
+        array = VectorArray([Vector(1, 2, 3), Vector(4, 5, 6)])
+        assert len(array) == 2
+        assert [v.x for v in array] == [1, 4]
+        assert array.toList()[1] == Vector(4, 5, 6)
+        assert len(VectorArray(5)) == 5
+        strided = np.arange(18, dtype=np.float64).reshape(6, 3)[::2]
+        assert VectorArray(strided)[1] == Vector(6, 7, 8)
+        with pytest.raises(IndexError):
+            array[2]
+
+    def test_entry_points_accept_array(self, np):
+        square = [Vector(0, 0, 0), Vector(1, 0, 0), Vector(1, 1, 0)]
+        square.append(Vector(0, 1, 0))
+        array = VectorArray(square)
+        for method in ("fromPointSet", "obbFromPointSet"):
+            from_list, from_array = BBox(), BBox()
+            getattr(from_list, method)(square)
+            getattr(from_array, method)(array)
+            assert from_list.min == from_array.min
+            assert from_list.max == from_array.max
+        assert pointInPoly(Vector(0.5, 0.5, 0), array)
+        ordered = sortedVectorArray(VectorArray(square[::-1]), 0)
+        assert isinstance(ordered, VectorArray)
+        assert [v.x for v in ordered] == [
+            v.x for v in sortedVectorArray(square, 0)
+        ]
+        normal = Vector(0, 0, 1)
+        triangles = Polygon(array, [0, 1, 2, 3], normal).triangulate()
+        assert triangles == Polygon(square, [0, 1, 2, 3], normal).triangulate()
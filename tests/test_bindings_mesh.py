@@ -3,7 +3,7 @@
 import pytest
 
 pytest.importorskip("meshTools")
-from meshTools import _mesh
+from meshTools import Vector, _mesh
 
 if _mesh is None:
     pytest.skip("_mesh extension not built", allow_module_level=True)
@@ -36,3 +36,62 @@ class TestMesh:
         assert verts is not None
         # Should be a sequence (list or list-like) of Vert
         assert hasattr(verts, "__len__")
+
+
+def _grid_arrays():
+    """2x2 quad grid: 9 vertices, 4 faces, 12 edges."""
+    positions = [Vector(i, j, 0) for j in range(3) for i in range(3)]
+    faces = [[0, 1, 4, 3], [1, 2, 5, 4], [3, 4, 7, 6], [4, 5, 8, 7]]
+    counts = [len(f) for f in faces]
+    indices = [v for f in faces for v in f]
+    return positions, counts, indices
+
+
+class TestHalfEdge:
+    """Mesh.fromArrays half-edge index."""
+
+    def test_counts(self):
+        m = _mesh.Mesh.fromArrays(*_grid_arrays())
+        assert m.vertexCount == 9
+        assert m.faceCount == 4
+        assert m.edgeCount == 12
+        assert m.halfEdgeCount == 16
+        assert len(m.faces) == 4
+        assert m.faces[0].normal.z == pytest.approx(1.0)
+
+    def test_edge_lookup(self):
+        m = _mesh.Mesh.fromArrays(*_grid_arrays())
+        e = m.findEdge(4, 1)
+        assert e == m.findEdge(1, 4)
+        assert sorted(m.edgeFaces(e)) == [0, 1]
+        assert sorted(m.edgeVerts(e)) == [1, 4]
+        assert m.findEdge(0, 8) == -1
+
+    def test_opposite(self):
+        m = _mesh.Mesh.fromArrays(*_grid_arrays())
+        h = m.findHalfEdge(1, 4)
+        o = m.opposite(h)
+        assert m.origin(o) == 4
+        assert m.opposite(o) == h
+        assert m.opposite(m.findHalfEdge(0, 1)) == -1
+
+    def test_one_ring(self):
+        m = _mesh.Mesh.fromArrays(*_grid_arrays())
+        assert sorted(m.oneRing(4)) == [1, 3, 5, 7]
+        assert sorted(m.oneRing(1)) == [0, 2, 4]
+        assert sorted(m.vertexNeighbors(0)) == [1, 3]
+        assert m.faceNeighbors(4, [0]) == [1, 3]
+
+    def test_boundary(self):
+        m = _mesh.Mesh.fromArrays(*_grid_arrays())
+        assert len(m.boundaryEdges()) == 8
+        assert not m.isBoundaryVertex(4)
+        assert m.isBoundaryVertex(0)
+        assert m.isBoundaryEdge(m.findEdge(0, 1))
+
+    def test_invalid_arrays(self):
+        positions, _counts, indices = _grid_arrays()
+        with pytest.raises(ValueError):
+            _mesh.Mesh.fromArrays(positions, [4], indices)
+        with pytest.raises(IndexError):
+            _mesh.Mesh.fromArrays(positions, [3], [0, 1, 42])
@@ -3,8 +3,8 @@
 import pytest
 
 pytest.importorskip("meshTools.chull")
-from meshTools.chull import Hull
-from meshTools.geometry import Vector
+from meshTools.chull import Hull, orientedBox, orientedBoxes
+from meshTools.geometry import Vector, VectorArray
 
 
 class TestHull:
@@ -41,3 +41,113 @@ class TestHull:
         faces, vertices = h.exportHull()
         assert len(vertices) == 4
         assert len(faces) == 4
+
+    @pytest.mark.parametrize("quickhull", [False, True])
+    def test_cube_engines_agree(self, quickhull):
+        """Both engines hull the cube with its 8 corners and 12 triangles."""
+        cube = [Vector(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+        for points in (cube, VectorArray(cube)):
+            faces, vertices = Hull(points, quickhull=quickhull).exportHull()
+            assert len(vertices) == 8
+            assert len(faces) == 12
+
+
+class TestQuickhullArrays:
+    """Hull.fromArray and the flat face_indices/positions/point_ids arrays."""
+
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    def test_random_points_inside(self, np):
+        points = np.random.default_rng(2).normal(size=(5000, 3))
+        points = points.astype(np.float32)
+        hull = Hull.fromArray(points)
+        faces = hull.face_indices
+        positions = hull.positions.astype(np.float64)
+        assert faces.dtype == np.uint32 and faces.shape[1] == 3
+        assert np.array_equal(hull.positions, points[hull.point_ids])
+        a, b, c = (positions[faces[:, k]] for k in range(3))
+        normals = np.cross(b - a, c - a)
+        height = np.einsum("fk,pfk->pf", normals, points[:, None] - a)
+        assert height.max() < 1e-5
+        # closed surface: every directed edge has its reverse
+        edges = {
+            (int(u), int(v)) for f in faces for u, v in zip(f, np.roll(f, -1))
+        }
+        assert len(edges) == 3 * len(faces)
+        assert all((v, u) in edges for u, v in edges)
+
+    def test_matches_incremental_volume(self, np):
+        points = np.random.default_rng(3).uniform(-1, 1, (300, 3))
+        volumes = []
+        for quickhull in (False, True):
+            hull = Hull.fromArray(points, quickhull=quickhull)
+            p = hull.positions.astype(np.float64)[hull.face_indices]
+            volumes.append(np.linalg.det(p).sum() / 6)
+        assert volumes[0] == pytest.approx(volumes[1])
+
+    def test_coplanar_raises(self, np):
+        points = np.zeros((10, 3), np.float32)
+        points[:, :2] = np.random.default_rng(4).uniform(size=(10, 2))
+        with pytest.raises(RuntimeError):
+            Hull.fromArray(points)
+
+
+class TestOrientedBox:
+    """orientedBox / orientedBoxes OBB engine."""
+
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    @pytest.fixture
+    def box_points(self, np):
+        """8 x 4 x 2 box with a dense diagonal streak, rotated and moved."""
+        rng = np.random.default_rng(4)
+        inside = rng.uniform(-1, 1, (2000, 3)) * [4, 2, 1]
+        corners = [[x, y, z] for x in (-4, 4) for y in (-2, 2) for z in (-1, 1)]
+        streak = np.outer(rng.uniform(-1, 1, 2000), [3.9, 1.9, 0.9])
+        rotation = np.linalg.qr(rng.normal(size=(3, 3)))[0]
+        points = np.vstack([inside, corners, streak]) @ rotation.T
+        return (points + [100, -50, 30]).astype(np.float32)
+
+    @staticmethod
+    def _check_frame(np, box, points):
+        axes = np.array([[a.x, a.y, a.z] for a in box.axis])
+        assert np.allclose(axes @ axes.T, np.eye(3), atol=1e-5)
+        assert np.linalg.det(axes) > 0
+        local = points @ axes.T
+        low = [box.min.x, box.min.y, box.min.z]
+        high = [box.max.x, box.max.y, box.max.z]
+        assert np.allclose(local.min(0), low, atol=1e-3)
+        assert np.allclose(local.max(0), high, atol=1e-3)
+
+    def test_methods(self, np, box_points):
+        volumes = {}
+        for method in ("covariance", "hull", "minvolume"):
+            box = orientedBox(box_points, method)
+            self._check_frame(np, box, box_points)
+            extent = box.max - box.min
+            volumes[method] = extent.x * extent.y * extent.z
+        assert volumes["minvolume"] == pytest.approx(64, rel=1e-4)
+        assert volumes["covariance"] > 1.5 * volumes["minvolume"]
+        with pytest.raises(ValueError):
+            orientedBox(box_points, "sphere")
+
+    def test_flat_and_list_input(self, np):
+        square = [Vector(0, 0, 0), Vector(2, 0, 0), Vector(2, 1, 0)]
+        square.append(Vector(0, 1, 0))
+        box = orientedBox(square)
+        assert box.max.z - box.min.z == pytest.approx(0, abs=1e-6)
+        assert box.center == Vector(1, 0.5, 0)
+
+    def test_batch(self, np, box_points):
+        offsets = np.array([0, 100, 100, len(box_points)])
+        boxes = orientedBoxes(box_points, offsets, "hull", threads=0)
+        assert boxes.shape == (3, 6, 3) and boxes.dtype == np.float32
+        single = orientedBox(box_points[:100], "hull")
+        assert boxes[0, 2].tolist() == pytest.approx(
+            [single.center.x, single.center.y, single.center.z]
+        )
+        assert boxes[1, 3:].tolist() == np.eye(3).tolist()
@@ -0,0 +1,204 @@
+"""Tests for the streaming plane clip engine."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from mesh_helpers import CUBE_FACES, csr, cube_mesh
+from meshTools import ArrayMesh, Mesh, Point, Ray, Vector
+from meshTools.clip import clipPlanes
+
+
+def _cube():
+    """Unit cube [0, 1]^3 with outward-facing quads."""
+    positions = np.array(
+        [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)], float
+    )
+    return (positions, *csr(CUBE_FACES))
+
+
+def _u_prism():
+    """U-shaped prism (concave top and bottom faces), volume 5."""
+    outline = [(0, 0), (3, 0), (3, 2), (2, 2), (2, 1), (1, 1), (1, 2), (0, 2)]
+    n = len(outline)
+    positions = np.array(
+        [(x, y, 0) for x, y in outline] + [(x, y, 1) for x, y in outline],
+        float,
+    )
+    faces = [list(range(n))[::-1], list(range(n, 2 * n))]
+    faces += [[i, (i + 1) % n, (i + 1) % n + n, i + n] for i in range(n)]
+    return (positions, *csr(faces))
+
+
+def _volume(positions, offsets, indices):
+    """Signed volume of a closed polygon mesh (fan-triangulated)."""
+    positions = np.asarray(positions, dtype=np.float64)
+    total = 0.0
+    for f in range(len(offsets) - 1):
+        ring = positions[indices[offsets[f] : offsets[f + 1]]]
+        for k in range(1, len(ring) - 1):
+            total += np.dot(ring[0], np.cross(ring[k], ring[k + 1])) / 6
+    return total
+
+
+def _result_volume(result):
+    return _volume(result.positions, result.face_offsets, result.face_indices)
+
+
+def _closed(result):
+    """True if every directed edge has exactly one opposite edge."""
+    offsets, indices = result.face_offsets, result.face_indices
+    edges = []
+    for f in range(len(offsets) - 1):
+        ring = indices[offsets[f] : offsets[f + 1]].tolist()
+        edges += list(zip(ring, ring[1:] + ring[:1]))
+    directed = set(edges)
+    return len(directed) == len(edges) and all(
+        (b, a) in directed for a, b in edges
+    )
+
+
+class TestClipPlanes:
+    """clipPlanes on raw CSR arrays."""
+
+    def test_no_planes_is_identity(self):
+        positions, offsets, indices = _cube()
+        result = clipPlanes(positions, offsets, indices, [])
+        np.testing.assert_array_equal(result.face_indices, indices)
+        assert result.face_sources.tolist() == list(range(6))
+        assert _result_volume(result) == pytest.approx(1)
+
+    def test_axis_plane_with_cap(self):
+        positions, offsets, indices = _cube()
+        ray = Ray(Vector(0, 0, 0.25), Vector(0, 0, 1))
+        result = clipPlanes(positions, offsets, indices, [ray], cap=True)
+        # four kept corners plus one cut vertex per vertical edge
+        assert len(result.positions) == 8
+        assert result.face_sources.tolist() == [0, 1, 2, 3, 5, -1]
+        assert (result.vertex_sources >= 0).sum() == 4
+        assert _closed(result)
+        assert _result_volume(result) == pytest.approx(0.75)
+        cut = result.positions[result.vertex_sources < 0]
+        np.testing.assert_allclose(cut[:, 2], 0.25)
+
+    def test_cut_edges_get_one_vertex(self):
+        positions, offsets, indices = _cube()
+        plane = ((0.5, 0.5, 0.5), (1, 1, 1))
+        result = clipPlanes(positions, offsets, indices, [plane], cap=True)
+        # hexagonal section: six cut edges, each shared by two faces
+        assert (result.vertex_sources < 0).sum() == 6
+        assert sorted(result.face_counts.tolist()) == [3, 3, 3, 5, 5, 5, 6]
+        assert _closed(result)
+        assert _result_volume(result) == pytest.approx(0.5)
+
+    def test_several_planes_cut_earlier_caps(self):
+        positions, offsets, indices = _cube()
+        planes = [((0.5, 0.5, 0.5), (1, 1, 1)), ((0.3, 0, 0), (-1, 0, 0))]
+        result = clipPlanes(positions, offsets, indices, planes, cap=True)
+        assert _closed(result)
+        # x <= 0.3 and y + z >= 1.5 - x: integral of (0.5 + x)^2 / 2
+        assert _result_volume(result) == pytest.approx((0.8**3 - 0.5**3) / 6)
+
+    def test_plane_through_vertices_reuses_them(self):
+        positions, offsets, indices = _cube()
+        plane = ((0, 0, 0), (1, -1, 0))
+        result = clipPlanes(positions, offsets, indices, [plane], cap=True)
+        assert len(result.positions) == 6
+        assert (result.vertex_sources < 0).sum() == 0
+        assert _closed(result)
+        assert _result_volume(result) == pytest.approx(0.5)
+
+    def test_keep_both_splits(self):
+        positions, offsets, indices = _cube()
+        plane = ((0, 0, 0.5), (0, 0, 1))
+        result = clipPlanes(
+            positions, offsets, indices, [plane], keep_both=True
+        )
+        assert len(result.positions) == 12
+        assert len(result.face_counts) == 10
+        assert _result_volume(result) == pytest.approx(1)
+
+    @pytest.mark.parametrize(
+        "normal, volume, caps", [((0, 1, 0), 1, 2), ((0, -1, 0), 4, 2)]
+    )
+    def test_concave_faces_split(self, normal, volume, caps):
+        positions, offsets, indices = _u_prism()
+        plane = ((0, 1.5, 0), normal)
+        result = clipPlanes(positions, offsets, indices, [plane], cap=True)
+        assert (result.face_sources == -1).sum() == caps
+        assert _closed(result)
+        assert _result_volume(result) == pytest.approx(volume)
+        # bridges were split off: no piece repeats a vertex
+        for f in range(len(result.face_counts)):
+            ring = result.face_indices[
+                result.face_offsets[f] : result.face_offsets[f + 1]
+            ]
+            assert len(set(ring.tolist())) == len(ring)
+
+    def test_corner_data_interpolated(self):
+        positions, offsets, indices = _cube()
+        # corner data equal to the corner position interpolates exactly
+        data = positions[indices]
+        plane = ((0.5, 0.5, 0.5), (1, 1, 1))
+        result = clipPlanes(
+            positions, offsets, indices, [plane], corner_data=data
+        )
+        np.testing.assert_allclose(
+            result.corner_data, result.positions[result.face_indices], atol=1e-6
+        )
+
+
+def _mesh_volume(mesh):
+    positions = np.array([(v.x, v.y, v.z) for v in mesh.vertices])
+    return _volume(positions, *csr(mesh.faces))
+
+
+@pytest.mark.parametrize("cls", [Mesh, ArrayMesh])
+class TestMeshClip:
+    """Mesh.clipPlane and the operations built on it."""
+
+    def test_clip_plane(self, cls):
+        mesh = cube_mesh(cls)
+        mesh.clipPlane(True, Ray(Vector(0, 0, 0.5), Vector(0, 0, 1)), cap=True)
+        assert len(mesh.vertices) == 8
+        assert len(mesh.faces) == 6
+        assert len(mesh.normals) == 6
+        assert len(mesh.edges) == 12
+        assert _mesh_volume(mesh) == pytest.approx(2)
+
+    def test_parent_faces_rebuilt(self, cls):
+        mesh = cube_mesh(cls)
+        mesh.clipPlane(True, Ray(Vector(0, 0, 0.5), Vector(0, 0, 1)), cap=True)
+        for i, vertex in enumerate(mesh.vertices):
+            faces = [f for f, face in enumerate(mesh.faces) if i in face]
+            assert sorted(vertex.parent_faces) == faces
+        assert (
+            len(mesh.findVertexNeighbor(0, mesh.vertices[0].parent_faces)) == 3
+        )
+
+    def test_keep_both_halves(self, cls):
+        mesh = cube_mesh(cls)
+        mesh.clipPlane(False, Ray(Vector(0, 0, 0), Vector(1, 0, 0)))
+        assert len(mesh.faces) == 10
+        assert _mesh_volume(mesh) == pytest.approx(8)
+
+    def test_symmetry(self, cls):
+        mesh = cube_mesh(cls)
+        mesh.vertices[7] = Point(1, 1, 2)
+        mesh.symmetry()
+        positions = np.array([(v.x, v.y, v.z) for v in mesh.vertices])
+        assert len(mesh.faces) == 10
+        assert positions[:, 2].max() == pytest.approx(1)
+        assert _mesh_volume(mesh) == pytest.approx(8)
+
+    def test_face_uvs_follow_cut(self, cls):
+        mesh = cube_mesh(cls)
+        mesh.uvs = [Vector(v.x, v.y, v.z) for v in mesh.vertices]
+        mesh.face_uvs = [list(face) for face in mesh.faces]
+        mesh.clipPlane(True, Ray(Vector(0, 0, 0.5), Vector(0, 0, 1)))
+        for face, uv_face in zip(mesh.faces, mesh.face_uvs):
+            for v, uv in zip(face, uv_face):
+                vertex, value = mesh.vertices[v], mesh.uvs[uv]
+                assert (value.x, value.y, value.z) == pytest.approx(
+                    (vertex.x, vertex.y, vertex.z), abs=1e-6
+                )
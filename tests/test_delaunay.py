@@ -6,7 +6,7 @@ import pytest
 
 pytest.importorskip("meshTools.delaunay")
 from meshTools.delaunay import Delaunay
-from meshTools.geometry import Point, fit
+from meshTools.geometry import Point, VectorArray, fit
 
 
 class TestDelaunay:
@@ -28,3 +28,54 @@ class TestDelaunay:
         assert d is not None
         assert hasattr(d, "orig_vertices")
         assert len(d.orig_vertices) == 20
+
+    def test_tetras_index_input_vertices(self):
+        """Tetras index the input points directly (no bounding vertices)."""
+        corners = [
+            Point(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)
+        ]
+        d = Delaunay(corners, 10)
+        assert len(d.vertices) == 8
+        assert d.tetra_count == len(d.tetras) > 0
+        assert all(0 <= i < 8 for t in d.tetras for i in t)
+        assert Delaunay(VectorArray(corners), 10).tetras == d.tetras
+
+
+class TestDelaunayArray:
+    """Delaunay.fromArray and the (T, 4) tetra_indices array."""
+
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    def test_empty_circumsphere(self, np):
+        points = np.random.default_rng(1).uniform(-10, 10, (200, 3))
+        points = points.astype(np.float32)
+        d = Delaunay.fromArray(points)
+        tetras = d.tetra_indices
+        assert tetras.dtype == np.uint32
+        assert tetras.shape == (d.tetra_count, 4)
+        p = points.astype(np.float64)
+        a = p[tetras[:, 0]]
+        edges = p[tetras[:, 1:]] - a[:, None]
+        assert (np.linalg.det(edges) > 0).all()
+        # circumcenters from 2 (b - a) . c = |b|^2 - |a|^2
+        rhs = (p[tetras[:, 1:]] ** 2).sum(2) - (a**2).sum(1)[:, None]
+        centers = np.linalg.solve(2 * edges, rhs[..., None])[..., 0]
+        radius = ((centers - a) ** 2).sum(1)
+        dist = ((p[None] - centers[:, None]) ** 2).sum(2)
+        assert (dist >= radius[:, None] * (1 - 1e-6)).all()
+
+    def test_grid_volume_and_duplicates(self, np):
+        axis = np.arange(4, dtype=np.float32)
+        grid = np.stack(np.meshgrid(axis, axis, axis), -1).reshape(-1, 3)
+        points = np.concatenate([grid, grid[:5]])
+        d = Delaunay.fromArray(points)
+        assert d.duplicate_count == 5
+        p = points.astype(np.float64)[d.tetra_indices]
+        volume = np.linalg.det(p[:, 1:] - p[:, :1]).sum() / 6
+        assert volume == pytest.approx(27)
+
+    def test_rejects_wrong_shape(self, np):
+        with pytest.raises(TypeError):
+            Delaunay.fromArray(np.zeros((4, 2), np.float32))
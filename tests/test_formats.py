@@ -0,0 +1,237 @@
+"""Tests for the streaming OBJ / PLY readers and writers."""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from mesh_helpers import uv_mesh, xyz
+from meshTools import ArrayMesh, Mesh, Point, Vector, formats
+from meshTools.formats import readObj, readPly, writePly
+
+_FALLBACKS = {
+    "_ObjReader": formats._PyObjReader,
+    "_parseNumbers": formats._pyParseNumbers,
+    "_decodeTextLists": formats._pyDecodeTextLists,
+    "_decodeBinaryLists": formats._pyDecodeBinaryLists,
+}
+
+
+@pytest.fixture(params=["native", "python"])
+def tokenizer(request, monkeypatch):
+    """Run a test with the _mesh tokenizers and with the Python ones."""
+    if request.param == "native":
+        if formats._mesh is None:
+            pytest.skip("_mesh extension not built")
+    else:
+        for name, value in _FALLBACKS.items():
+            monkeypatch.setattr(formats, name, value)
+    return request.param
+
+
+class TestRoundTrip:
+    """Mesh.save() then Mesh.load() through each format."""
+
+    @pytest.mark.parametrize("binary", [True, False])
+    @pytest.mark.parametrize("suffix", [".obj", ".ply"])
+    def test_geometry(self, tmp_path, tokenizer, suffix, binary):
+        mesh = uv_mesh()
+        mesh.updateVertex(4, Point(2.5, -0.125, 1e-3))
+        path = tmp_path / f"mesh{suffix}"
+        mesh.save(path, binary=binary)
+        loaded = Mesh.load(path)
+        assert isinstance(loaded, ArrayMesh)
+        assert loaded.faces == mesh.faces
+        assert [xyz(v) for v in loaded.vertices] == pytest.approx(
+            [xyz(v) for v in mesh.vertices]
+        )
+
+    def test_obj_face_uvs(self, tmp_path, tokenizer):
+        path = tmp_path / "mesh.obj"
+        uv_mesh().save(path)
+        loaded = Mesh.load(path)
+        assert [xyz(uv) for uv in loaded.uvs] == [
+            xyz(uv) for uv in uv_mesh().uvs
+        ]
+        assert loaded.face_uvs == [[0, 1, 2, 3], [1, 0, 2]]
+        assert Mesh.load(path, topology_only=True).uvs == []
+
+    @pytest.mark.parametrize("binary", [True, False])
+    def test_ply_vertex_uvs(self, tmp_path, tokenizer, binary):
+        mesh = uv_mesh()
+        mesh.uvs.append(Vector(0.5, 0.5, 0))
+        mesh.face_uvs = [list(face) for face in mesh.faces]
+        path = tmp_path / "mesh.ply"
+        mesh.save(path, binary=binary)
+        loaded = Mesh.load(path)
+        assert [xyz(uv) for uv in loaded.uvs] == [xyz(uv) for uv in mesh.uvs]
+        assert loaded.face_uvs == mesh.face_uvs
+        assert Mesh.load(path, topology_only=True).uvs == []
+
+    def test_large_counts(self, tmp_path, tokenizer):
+        # more than 255 corners needs a wider PLY list count
+        arrays = {
+            "positions": np.random.default_rng(0).random((300, 3)),
+            "face_offsets": np.array([0, 3, 303]),
+            "face_indices": np.concatenate([[0, 1, 2], np.arange(300)]),
+        }
+        path = tmp_path / "mesh.ply"
+        writePly(path, arrays)
+        loaded = readPly(path, chunk_size=64)
+        assert loaded["face_offsets"].tolist() == [0, 3, 303]
+        assert np.array_equal(loaded["face_indices"], arrays["face_indices"])
+
+
+class TestObj:
+    """OBJ statements, chunking and errors."""
+
+    TEXT = (
+        b"# quad with normals\n"
+        b"o quad\nv 0 0 0\nv 1 0 0\nv 1 1 0\r\nv 0 1 0\n"
+        b"vt 0 0\nvt 1 0\nvt 1 1\nvn 0 0 1\n"
+        b"usemtl grey\n"
+        b"f 1/1/1 2/2/1 3/3/1\n"
+        b"f -4//1 -2//1 -1//1"
+    )
+
+    @pytest.mark.parametrize("chunk_size", [5, 1 << 20])
+    def test_statements(self, tmp_path, tokenizer, chunk_size):
+        path = tmp_path / "mesh.obj"
+        path.write_bytes(self.TEXT)
+        arrays = readObj(path, chunk_size=chunk_size)
+        assert arrays["positions"].shape == (4, 3)
+        assert arrays["face_offsets"].tolist() == [0, 3, 6]
+        assert arrays["face_indices"].tolist() == [0, 1, 2, 0, 2, 3]
+        # the second face has no UVs, so face UVs are dropped
+        assert len(arrays["uvs"]) == 3
+        assert "face_uv_indices" not in arrays
+
+    @pytest.mark.parametrize(
+        "text",
+        [b"v 0 0\n", b"v 0 0 0\nv 1 0 0\nf 1 2\n", b"v 0 0 0\nf 1 a 1\n"],
+    )
+    def test_malformed(self, tmp_path, tokenizer, text):
+        path = tmp_path / "mesh.obj"
+        path.write_bytes(text)
+        with pytest.raises(ValueError, match="OBJ line"):
+            readObj(path)
+
+    def test_out_of_range(self, tmp_path, tokenizer):
+        path = tmp_path / "mesh.obj"
+        path.write_bytes(b"v 0 0 0\nv 1 0 0\nf 1 2 3\n")
+        with pytest.raises(ValueError, match="out of range"):
+            readObj(path)
+
+
+def _ply(header, body):
+    return ("ply\n" + "\n".join(header) + "\nend_header\n").encode() + body
+
+
+class TestPly:
+    """PLY headers, layouts and errors."""
+
+    def test_big_endian_extra_properties(self, tmp_path, tokenizer):
+        header = [
+            "format binary_big_endian 1.0",
+            "comment extra properties and elements",
+            "element vertex 3",
+            "property double x",
+            "property double y",
+            "property double z",
+            "property uchar red",
+            "element face 1",
+            "property uchar flags",
+            "property list uchar ushort vertex_index",
+            "property float quality",
+            "element edge 1",
+            "property int vertex1",
+            "property int vertex2",
+        ]
+        body = b"".join(
+            struct.pack(">dddB", *p, 255)
+            for p in [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+        )
+        body += struct.pack(">BBHHHf", 1, 3, 0, 1, 2, 0.5)
+        body += struct.pack(">ii", 0, 1)
+        path = tmp_path / "mesh.ply"
+        path.write_bytes(_ply(header, body))
+        arrays = readPly(path, chunk_size=7)
+        assert arrays["positions"].tolist() == [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+        assert arrays["face_indices"].tolist() == [0, 1, 2]
+
+    def test_ascii_skips_elements(self, tmp_path, tokenizer):
+        header = [
+            "format ascii 1.0",
+            "element material 1",
+            "property float shine",
+            "element vertex 4",
+            "property float x",
+            "property float y",
+            "property float z",
+            "property float s",
+            "property float t",
+            "element face 2",
+            "property list uchar int vertex_indices",
+            "property int group",
+        ]
+        body = (
+            b"0.5\n"
+            b"0 0 0 0 0\n1 0 0 1 0\n1 1 0 1 1\n0 1 0 0 1\n"
+            b"3 0 1 2 7\n4 0 1 2 3 7\n"
+        )
+        path = tmp_path / "mesh.ply"
+        path.write_bytes(_ply(header, body))
+        arrays = readPly(path, chunk_size=4)
+        assert arrays["face_offsets"].tolist() == [0, 3, 7]
+        assert arrays["face_indices"].tolist() == [0, 1, 2, 0, 1, 2, 3]
+        assert arrays["uvs"][:, :2].tolist() == [[0, 0], [1, 0], [1, 1], [0, 1]]
+        assert arrays["face_uv_indices"] is arrays["face_indices"]
+
+    @pytest.mark.parametrize(
+        ("header", "body", "message"),
+        [
+            (["format ascii 1.0", "element vertex 2"], b"", "x, y, z"),
+            (["format binary 1.0"], b"", "unsupported PLY format"),
+            (["format ascii 1.0", "property float x"], b"", "bad PLY header"),
+            (
+                [
+                    "format ascii 1.0",
+                    "element tristrips 1",
+                    "property list uchar int vertex_indices",
+                    "element vertex 0",
+                ],
+                b"3 0 1 2\n",
+                "cannot skip",
+            ),
+            (
+                [
+                    "format binary_little_endian 1.0",
+                    "element vertex 2",
+                    "property float x",
+                    "property float y",
+                    "property float z",
+                ],
+                bytes(20),
+                "truncated",
+            ),
+            (
+                [
+                    "format ascii 1.0",
+                    "element vertex 1",
+                    "property float x",
+                    "property float y",
+                    "property float z",
+                    "element face 1",
+                    "property list uchar int vertex_indices",
+                ],
+                b"0 0 0\n3 0 0 1\n",
+                "out of range",
+            ),
+        ],
+    )
+    def test_invalid(self, tmp_path, tokenizer, header, body, message):
+        path = tmp_path / "mesh.ply"
+        path.write_bytes(_ply(header, body))
+        with pytest.raises(ValueError, match=message):
+            readPly(path)
@@ -0,0 +1,84 @@
+"""Tests for lazy package imports and the packed noise tables."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("meshTools")
+import meshTools
+from meshTools import noise_tabs
+
+
+def _imported_after(code):
+    """Modules in sys.modules after running code in a fresh interpreter."""
+    script = f"import sys\n{code}\nprint('\\n'.join(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return set(process.stdout.split())
+
+
+class TestLazyImport:
+    """import meshTools loads geometry only; the rest loads on first use."""
+
+    def test_import_is_light(self):
+        modules = _imported_after("import meshTools")
+        assert "meshTools.geometry" in modules
+        for name in (
+            "meshTools.mesh",
+            "meshTools.noise",
+            "meshTools.noise_tabs",
+            "meshTools.chull",
+            "meshTools.delaunay",
+            "numpy",
+        ):
+            assert name not in modules
+
+    def test_mesh_does_not_load_fallbacks(self):
+        modules = _imported_after("import meshTools; meshTools.Mesh")
+        assert "meshTools.mesh" in modules
+        assert "meshTools.noise_tabs" not in modules
+        assert "meshTools.chull" not in modules
+
+    def test_lazy_attributes(self):
+        from meshTools.mesh import Mesh
+
+        assert meshTools.Mesh is Mesh
+        assert meshTools.noise.Noise is not None
+        assert {"Mesh", "ArrayMesh", "noise"} <= set(dir(meshTools))
+        with pytest.raises(AttributeError):
+            meshTools.missing  # noqa: B018
+
+
+class TestNoiseTabs:
+    """The tables decode to the shapes and types NoisePy indexes."""
+
+    def test_shapes(self):
+        assert len(noise_tabs.perm) == 256
+        assert sorted(noise_tabs.perm) == list(range(256))
+        assert len(noise_tabs.uniform) == 256
+        assert all(0 <= u <= 1 for u in noise_tabs.uniform)
+        for name, width in (("grads2", 2), ("grads3", 3), ("grads4", 4)):
+            table = getattr(noise_tabs, name)
+            assert len(table) == 256
+            assert {len(row) for row in table} == {width}
+            assert isinstance(table[0][0], float)
+
+    def test_values(self):
+        assert noise_tabs.perm[:4] == [174, 170, 229, 205]
+        assert noise_tabs.uniform[0] == 0.21715864926591522
+        assert noise_tabs.grads2[0] == [
+            0.45149288432193807,
+            -0.89227471969492511,
+        ]
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            noise_tabs.grads5  # noqa: B018
@@ -0,0 +1,120 @@
+"""Tests for the sparse Laplacian relax engine."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from meshTools import ArrayMesh, Mesh, kGeotype
+from meshTools.laplacian import CsrMatrix, LaplacianRelax, conjugateGradient
+
+SELECTION = [6, 7, 8, 11, 12, 13]
+
+
+@pytest.fixture
+def bumpy_grid(grid_mesh):
+    """4 x 4 quad grid with a bumpy z, so relax has something to smooth."""
+    return lambda cls=Mesh: grid_mesh(4, cls, z=lambda i, j: (i * j) % 3 * 0.1)
+
+
+def _positions(mesh):
+    return np.array([(v.x, v.y, v.z) for v in mesh.vertices])
+
+
+class TestCsr:
+    """CsrMatrix and the conjugate gradient solver."""
+
+    def test_matvec_matches_dense(self):
+        rows = [0, 0, 1, 2, 2, 0]
+        cols = [0, 2, 1, 0, 2, 0]
+        data = [1.0, 2.0, 3.0, 4.0, 5.0, 1.0]
+        matrix = CsrMatrix.fromCoo(rows, cols, data, (4, 3))
+        dense = np.zeros((4, 3))
+        np.add.at(dense, (rows, cols), data)
+        x = np.arange(6.0).reshape(3, 2)
+        assert np.allclose(matrix.matvec(x), dense @ x)
+        assert np.allclose(matrix.rowSums(), dense.sum(axis=1))
+
+    def test_conjugate_gradient(self):
+        a = np.array([[4.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 2.0]])
+        b = np.array([[1.0, 0.0], [2.0, 1.0], [3.0, 0.0]])
+        x = conjugateGradient(lambda v: a @ v, b, diagonal=np.diag(a))
+        assert np.allclose(a @ x, b)
+
+
+class TestRelax:
+    """Mesh.relax through LaplacianRelax."""
+
+    def test_explicit_matches_neighbor_average(self, bumpy_grid):
+        mesh = bumpy_grid()
+        x = _positions(mesh)
+        neighbors = {
+            v: mesh.findVertexNeighbor(v, mesh.vertices[v].parent_faces)
+            for v in SELECTION
+        }
+        for _ in range(3):
+            step = x.copy()
+            for v in SELECTION:
+                step[v] += 0.5 * (x[neighbors[v]].mean(axis=0) - x[v])
+            x = step
+        mesh.relax(
+            SELECTION, selection_type=kGeotype.vertex, factor=0.5, iterations=3
+        )
+        assert np.allclose(_positions(mesh), x)
+
+    def test_fallback_matches_numpy(self, bumpy_grid, monkeypatch):
+        result = []
+        for numpy in (True, False):
+            if not numpy:
+                monkeypatch.setattr("meshTools.mesh.np", None)
+            mesh = bumpy_grid()
+            mesh.relax(
+                SELECTION,
+                selection_type=kGeotype.vertex,
+                factor=0.5,
+                iterations=3,
+            )
+            result.append(_positions(mesh))
+        assert np.allclose(result[0], result[1])
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"factor": 0.5, "iterations": 3},
+            {"factor": 10, "iterations": 2, "implicit": True},
+            {"weights": "cotangent", "factor": 0.5},
+        ],
+    )
+    def test_array_mesh_parity(self, bumpy_grid, kwargs):
+        result = []
+        for cls in (Mesh, ArrayMesh):
+            mesh = bumpy_grid(cls)
+            mesh.relax(SELECTION, selection_type=kGeotype.vertex, **kwargs)
+            result.append(_positions(mesh))
+        assert np.allclose(result[0], result[1], atol=1e-6)
+
+    def test_implicit_large_step_is_harmonic(self, bumpy_grid):
+        mesh = bumpy_grid(ArrayMesh)
+        start = _positions(mesh)
+        mesh.relax(
+            SELECTION, selection_type=kGeotype.vertex, factor=1e6, implicit=True
+        )
+        reference = LaplacianRelax(bumpy_grid(ArrayMesh).buffers, SELECTION)
+        harmonic = reference.relax(start, 1.0, 2000)
+        assert np.allclose(_positions(mesh), harmonic, atol=1e-5)
+        fixed = np.setdiff1d(np.arange(len(start)), SELECTION)
+        assert np.array_equal(_positions(mesh)[fixed], start[fixed])
+
+    def test_cotangent_keeps_plane(self, bumpy_grid):
+        mesh = bumpy_grid(ArrayMesh)
+        mesh.buffers.positions[:, 2] = 0
+        mesh.relax(
+            SELECTION,
+            selection_type=kGeotype.vertex,
+            weights="cotangent",
+            iterations=5,
+        )
+        assert np.allclose(mesh.buffers.positions[:, 2], 0)
+
+    def test_unknown_weights(self, bumpy_grid):
+        with pytest.raises(ValueError):
+            LaplacianRelax(bumpy_grid(ArrayMesh).buffers, [6], "mean")
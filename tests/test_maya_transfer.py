@@ -0,0 +1,335 @@
+"""Tests for the bulk Maya transfer against a stub OpenMaya.
+
+The stub implements just the OpenMaya 1.0 / 2.0 calls meshTools.maya
+makes, over an in-memory scene of named meshes, so MayaMesh loading and
+meshToMaya can be checked outside Maya.
+"""
+
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from meshTools import ArrayMesh, Point, Vector
+
+
+class _SceneMesh:
+    """A mesh in the stub scene, stored as plain lists."""
+
+    def __init__(self, points, counts, connects, u=(), v=(), uv_ids=()):
+        self.points = [tuple(p) for p in points]
+        self.counts = list(counts)
+        self.connects = list(connects)
+        self.u, self.v = list(u), list(v)
+        self.uv_counts = list(counts) if uv_ids else []
+        self.uv_ids = list(uv_ids)
+        self.name = "mesh"
+        # Maya numbers edges in its own order: reversed face order here
+        edges = {}
+        start = 0
+        for count in self.counts:
+            face = self.connects[start : start + count]
+            start += count
+            for a, b in zip(face, face[1:] + face[:1]):
+                edges.setdefault(frozenset((a, b)), (a, b))
+        self.edges = list(edges.values())[::-1]
+
+
+def _stubMaya(scene):
+    """Build maya, maya.OpenMaya, maya.api.OpenMaya and maya.cmds."""
+    om1 = types.ModuleType("maya.OpenMaya")
+    om2 = types.ModuleType("maya.api.OpenMaya")
+    for module in (om1, om2):
+        module.MSpace = types.SimpleNamespace(kObject=2, kWorld=4)
+
+    class MIntArray(list):
+        def length(self):
+            return len(self)
+
+    class MFloatArray(MIntArray):
+        pass
+
+    class MFloatPointArray(list):
+        def __init__(self, flat=None, count=0):
+            list.__init__(self)
+            if flat is not None:
+                for i in range(count):
+                    self.append(
+                        types.SimpleNamespace(
+                            x=flat[4 * i], y=flat[4 * i + 1], z=flat[4 * i + 2]
+                        )
+                    )
+
+        def length(self):
+            return len(self)
+
+    class MScriptUtil:
+        def createFromList(self, values, count):
+            self.values = list(values)[:count]
+
+        def asFloat4Ptr(self):
+            return self.values
+
+        def asInt2Ptr(self):
+            return self.values
+
+        def getInt2ArrayItem(self, pointer, row, column):
+            return pointer[column]
+
+        @staticmethod
+        def createIntArrayFromList(values, result):
+            result.extend(values)
+
+        createFloatArrayFromList = createIntArrayFromList
+
+    class MDagPath1:
+        def __init__(self, name):
+            self.name = name
+
+        def fullPathName(self):
+            return self.name
+
+    class MFnMesh1:
+        def __init__(self, target=None):
+            self.mesh = None if target is None else scene[target.name]
+            self.in_dag = target is not None
+
+        def fullPathName(self):
+            if not self.in_dag:
+                raise RuntimeError("(kFailure): Object does not exist")
+            return self.mesh.name
+
+        def create(self, nverts, nfaces, points, counts, connects, parent=None):
+            assert (nverts, nfaces) == (len(points), len(counts))
+            self.mesh = _SceneMesh(
+                [(p.x, p.y, p.z) for p in points], counts, connects
+            )
+            self.mesh.name = f"polySurfaceShape{len(scene)}"
+            self.mesh.parent = parent
+            scene[self.mesh.name] = self.mesh
+            self.in_dag = parent is None
+
+        def setUVs(self, u, v):
+            self.mesh.u, self.mesh.v = list(u), list(v)
+
+        def assignUVs(self, counts, ids):
+            self.mesh.uv_counts, self.mesh.uv_ids = list(counts), list(ids)
+
+        def getPoints(self, result, space):
+            result.extend(
+                types.SimpleNamespace(x=x, y=y, z=z)
+                for x, y, z in self.mesh.points
+            )
+
+        def getVertices(self, counts, connects):
+            counts.extend(self.mesh.counts)
+            connects.extend(self.mesh.connects)
+
+        def numUVs(self):
+            return len(self.mesh.u)
+
+        def getUVs(self, u, v):
+            u.extend(self.mesh.u)
+            v.extend(self.mesh.v)
+
+        def getAssignedUVs(self, counts, ids):
+            counts.extend(self.mesh.uv_counts)
+            ids.extend(self.mesh.uv_ids)
+
+        def numEdges(self):
+            return len(self.mesh.edges)
+
+        def getEdgeVertices(self, edge, pointer):
+            pointer[:] = self.mesh.edges[edge]
+
+        def updateSurface(self):
+            pass
+
+        def name(self):
+            return self.mesh.name
+
+        def setName(self, name):
+            del scene[self.mesh.name]
+            self.mesh.name = name
+            scene[name] = self.mesh
+
+        def parent(self, index):
+            return "transform1"
+
+    class MFnDagNode:
+        def __init__(self, node):
+            self.node = node
+
+        def setName(self, name):
+            self.node = name
+
+        def fullPathName(self):
+            return "|" + self.node
+
+    om1.MIntArray = MIntArray
+    om1.MFloatArray = MFloatArray
+    om1.MFloatPointArray = MFloatPointArray
+    om1.MScriptUtil = MScriptUtil
+    om1.MDagPath = MDagPath1
+    om1.MFnMesh = MFnMesh1
+    om1.MFnDagNode = MFnDagNode
+
+    class MObject:
+        pass
+
+    class MDagPath2(MDagPath1):
+        pass
+
+    class MSelectionList:
+        def add(self, name):
+            self.name = name
+
+        def getDagPath(self, index):
+            return MDagPath2(self.name)
+
+    class MFnMesh2:
+        def __init__(self, dag):
+            self.mesh = scene[dag.name]
+            self.numEdges = len(self.mesh.edges)
+
+        def getFloatPoints(self, space):
+            return [(x, y, z, 1.0) for x, y, z in self.mesh.points]
+
+        def getVertices(self):
+            return list(self.mesh.counts), list(self.mesh.connects)
+
+        def numUVs(self):
+            return len(self.mesh.u)
+
+        def getUVs(self):
+            return list(self.mesh.u), list(self.mesh.v)
+
+        def getAssignedUVs(self):
+            return list(self.mesh.uv_counts), list(self.mesh.uv_ids)
+
+        def getEdgeVertices(self, edge):
+            return self.mesh.edges[edge]
+
+    om2.MObject = MObject
+    om2.MDagPath = MDagPath2
+    om2.MSelectionList = MSelectionList
+    om2.MFnMesh = MFnMesh2
+
+    cmds = types.ModuleType("maya.cmds")
+    cmds.sets = lambda *args, **kwargs: None
+    maya = types.ModuleType("maya")
+    api = types.ModuleType("maya.api")
+    maya.OpenMaya, maya.cmds, maya.api, api.OpenMaya = om1, cmds, api, om2
+    return {
+        "maya": maya,
+        "maya.OpenMaya": om1,
+        "maya.cmds": cmds,
+        "maya.api": api,
+        "maya.api.OpenMaya": om2,
+    }
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    """Stub Maya holding a quad + triangle mesh named 'mesh'."""
+    scene = {}
+    scene["mesh"] = _SceneMesh(
+        [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0)],
+        [4, 3],
+        [0, 1, 2, 3, 1, 4, 2],
+        u=[0, 1, 1, 0],
+        v=[0, 0, 1, 1],
+        uv_ids=[0, 1, 2, 3, 1, 0, 2],
+    )
+    for name, module in _stubMaya(scene).items():
+        monkeypatch.setitem(sys.modules, name, module)
+    # import meshTools.maya afresh against this scene's stubs
+    for name in list(sys.modules):
+        if name.startswith("meshTools.maya"):
+            monkeypatch.delitem(sys.modules, name)
+    return scene
+
+
+def _om1():
+    return sys.modules["maya.OpenMaya"]
+
+
+class TestRead:
+    """Maya mesh -> arrays and MayaMesh."""
+
+    def test_arrays(self, scene):
+        from meshTools.maya import transfer
+
+        arrays = transfer.readArrays("mesh", edges=True)
+        assert arrays["positions"].dtype == np.float32
+        assert arrays["positions"].tolist()[4] == [2, 0, 0]
+        assert arrays["face_offsets"].tolist() == [0, 4, 7]
+        assert arrays["face_indices"].tolist() == [0, 1, 2, 3, 1, 4, 2]
+        assert arrays["uvs"][:, :2].tolist() == [[0, 0], [1, 0], [1, 1], [0, 1]]
+        assert arrays["face_uv_indices"].tolist() == scene["mesh"].uv_ids
+        assert arrays["edges"].tolist() == [
+            list(e) for e in scene["mesh"].edges
+        ]
+
+    def test_mesh_data_outside_dag(self, scene):
+        from meshTools.maya import transfer
+
+        data = _om1().MFnMesh()
+        data.mesh = scene["mesh"]
+        arrays = transfer.readArrays(data, edges=True)
+        expected = transfer.readArrays("mesh", edges=True)
+        for name, array in expected.items():
+            assert np.array_equal(arrays[name], array), name
+
+    def test_maya_mesh(self, scene):
+        from meshTools.maya import MayaMesh
+
+        dag = _om1().MDagPath("mesh")
+        mesh = MayaMesh(dag=dag, vertices=1, faces=1, normals=1, edges=1)
+        assert [(p.x, p.y, p.z) for p in mesh.vertices][1] == (1, 0, 0)
+        assert mesh.faces == [[0, 1, 2, 3], [1, 4, 2]]
+        assert [(n.x, n.y, n.z) for n in mesh.normals] == [(0, 0, 1), (0, 0, 1)]
+        assert mesh.edges == [list(e) for e in scene["mesh"].edges]
+
+    def test_array_mesh(self, scene):
+        from meshTools.maya import transfer
+
+        mesh = transfer.readArrayMesh("mesh")
+        assert isinstance(mesh, ArrayMesh)
+        assert mesh.faces == [[0, 1, 2, 3], [1, 4, 2]]
+        assert mesh.face_uvs == [[0, 1, 2, 3], [1, 0, 2]]
+
+
+class TestWrite:
+    """MayaMesh.meshToMaya through createMesh."""
+
+    def test_round_trip(self, scene):
+        from meshTools.maya import MayaMesh
+
+        mesh = MayaMesh(dag=_om1().MDagPath("mesh"), vertices=1, faces=1)
+        mesh.uvs = [Vector(0.5, 0.25, 0), Vector(1, 1, 0)]
+        mesh.face_uvs = [[0, 1, 0, 1], [1, 1, 0]]
+        transform, _ = mesh.meshToMaya(uvs=1, name="copy")
+        assert transform == "|copy"
+        created = scene["copyShape"]
+        assert created.points == scene["mesh"].points
+        assert created.counts == [4, 3]
+        assert created.connects == scene["mesh"].connects
+        assert (created.u, created.v) == ([0.5, 1], [0.25, 1])
+        assert created.uv_ids == [0, 1, 0, 1, 1, 1, 0]
+
+    def test_parent_and_bad_ids(self, scene, caplog):
+        from meshTools.maya import MayaMesh
+
+        mesh = MayaMesh(empty=1)
+        for p in [(0, 0, 0), (1, 0, 0), (0, 1, 0)]:
+            mesh.addVertex(Point(*p))
+        mesh.faces = [[0, 1, 2], [0, 2, 7, 1]]
+        assert mesh.meshToMaya(parent="meshData") is None
+        (created,) = [m for m in scene.values() if m.name != "mesh"]
+        assert created.parent == "meshData"
+        assert created.counts == [3, 3]
+        assert created.connects == [0, 1, 2, 0, 2, 1]
+        assert "unknown vertex" in caplog.text
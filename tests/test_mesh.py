@@ -0,0 +1,195 @@
+"""Tests for the pure-Python Mesh: edge index, selection, noise."""
+
+import pytest
+
+pytest.importorskip("meshTools")
+from meshTools import Mesh, Point, Transform, Vector, kGeotype
+from meshTools.mesh import edgeKey
+
+
+class TestEdgeIndex:
+    """Persistent (min, max) -> edge id index."""
+
+    def test_add_face_registers_edges(self, grid_mesh):
+        mesh = grid_mesh()
+        assert len(mesh.edges) == 12
+        assert mesh.findEdge(4, 1) == mesh.findEdge(1, 4)
+        assert mesh.edges[mesh.findEdge(1, 4)] in ([1, 4], [4, 1])
+        assert mesh.findEdge(0, 8) == -1
+
+    def test_user_edges_first_duplicate_wins(self, grid_mesh):
+        mesh = grid_mesh()
+        mesh.edges = [[1, 0], [3, 4], [0, 1]]
+        assert mesh.findEdge(0, 1) == 0
+        mesh.edges.append([4, 5])
+        assert mesh.findEdge(5, 4) == 3
+
+    def test_update_face_adds_edges(self, grid_mesh):
+        mesh = grid_mesh()
+        mesh.updateFace(0, [0, 1, 4])
+        assert mesh.findEdge(0, 4) == 12
+
+    def test_delete_faces_prunes_edges(self, grid_mesh):
+        mesh = grid_mesh()
+        mesh._Mesh__deleteFaces([0])
+        assert mesh.findEdge(0, 1) == -1
+        assert mesh.findEdge(0, 3) == -1
+        # shared with face 1 / face 2
+        assert mesh.findEdge(1, 4) != -1
+        assert mesh.findEdge(3, 4) != -1
+        assert len(mesh.edges) == 10
+        for i, edge in enumerate(mesh.edges):
+            assert mesh.findEdge(*edge) == i
+
+    def test_delete_faces_after_edits(self, grid_mesh):
+        # edge face counts follow addFace / updateFace and in-place edits
+        mesh = grid_mesh()
+        mesh._Mesh__deleteFaces([3])
+        mesh.updateFace(0, [0, 1, 4])
+        mesh.addFace([0, 4, 3])
+        mesh.faces[1][3] = 8
+        mesh.invalidateTopology()
+        mesh._Mesh__deleteFaces([0])
+        assert mesh.findEdge(1, 4) == -1
+        assert mesh.findEdge(0, 4) != -1
+        mesh._Mesh__deleteFaces([0, 1])
+        assert mesh.faces == [[0, 4, 3]]
+        assert sorted(edgeKey(*edge) for edge in mesh.edges) == [
+            (0, 3),
+            (0, 4),
+            (3, 4),
+            (4, 5),  # dropped by the in-place edit, not by a delete
+        ]
+
+
+class TestSelectConvert:
+    """Selection conversion through the edge index."""
+
+    def test_face_to_edge(self, grid_mesh):
+        mesh = grid_mesh()
+        edges = mesh.selectConvert([0], kGeotype.face, kGeotype.edge)
+        keys = {edgeKey(*mesh.edges[e]) for e in edges}
+        assert keys == {(0, 1), (1, 4), (3, 4), (0, 3)}
+
+    def test_edge_to_face(self, grid_mesh):
+        mesh = grid_mesh()
+        edge = mesh.findEdge(1, 4)
+        assert sorted(
+            mesh.selectConvert([edge], kGeotype.edge, kGeotype.face)
+        ) == [0, 1, 2, 3]
+
+    def test_vertex_to_edge(self, grid_mesh):
+        mesh = grid_mesh()
+        edges = mesh.selectConvert([0], kGeotype.vertex, kGeotype.edge)
+        assert sorted(edgeKey(*mesh.edges[e]) for e in edges) == [
+            (0, 1),
+            (0, 3),
+        ]
+
+    def test_find_vertex_neighbor(self, grid_mesh):
+        mesh = grid_mesh()
+        neighbors = mesh.findVertexNeighbor(4, mesh.vertices[4].parent_faces)
+        assert sorted(neighbors) == [1, 3, 5, 7]
+
+    def test_find_vertex_neighbor_after_edit(self, grid_mesh):
+        # a stale half-edge index is bypassed, not rebuilt per query
+        mesh = grid_mesh()
+        mesh.topology()
+        mesh.updateFace(0, [0, 1, 4])
+        mesh.addFace([0, 4, 3])
+        assert sorted(mesh.findVertexNeighbor(4, [0, 4])) == [0, 1, 3]
+        assert mesh._topology is None
+
+
+class TestNoise:
+    """Mesh.noise displaces y by per-vertex turbulence."""
+
+    def test_matches_scalar_turbulence(self, grid_mesh):
+        from meshTools.noise import Noise
+
+        mesh = grid_mesh()
+        before = [(v.x, v.y, v.z) for v in mesh.vertices]
+        mesh.noise([0, 4, 8], selection_type=kGeotype.vertex, amount=0.5)
+        n = Noise()
+        for i, (x, y, z) in enumerate(before):
+            expected = y
+            if i in (0, 4, 8):
+                expected += n.turbulence(x, y, z, 2, 1.2, 0.5)
+            assert mesh.vertices[i].y == pytest.approx(expected, abs=1e-6)
+            assert mesh.vertices[i].x == x
+
+
+class TestTransformCopies:
+    """Mesh operations that append transformed copies of the vertices."""
+
+    def test_multi_duplicate_transform(self, grid_mesh):
+        source = grid_mesh()
+        mesh = grid_mesh(1)
+        mesh.multiDuplicateTransform(source, Transform().translate(0, 0, 2))
+        assert len(mesh.vertices) == 4 + 9
+        assert [mesh.vertices[8].x, mesh.vertices[8].z] == [1, 2]
+        assert mesh.faces[1] == [4, 5, 8, 7]
+
+    def test_symmetry_mirrors_z(self):
+        mesh = Mesh()
+        for p in [(0, 0, -1), (1, 0, -1), (1, 1, -1), (0, 1, -1)]:
+            mesh.addVertex(Point(*p))
+        mesh.addFace([0, 1, 2, 3])
+        mesh.symmetry()
+        assert [v.z for v in mesh.vertices[4:]] == [1, 1, 1, 1]
+        assert mesh.faces[1] == [7, 6, 5, 4]
+
+    def test_radial_symmetry_copies(self):
+        mesh = Mesh()
+        for p in [(0, 1, -0.2), (1, 1, -0.2), (1, 2, -0.2), (0, 2, -0.2)]:
+            mesh.addVertex(Point(*p))
+        mesh.addFace([0, 1, 2, 3])
+        mesh.radialSymmetry(3)
+        assert len(mesh.vertices) == 24 and len(mesh.faces) == 6
+        radius = Vector(0, 1, -0.2).length()
+        for v in mesh.vertices[::4]:
+            assert Vector(0, v.y, v.z).length() == pytest.approx(radius)
+
+
+class TestTriangulate:
+    """Mesh.triangulate over a selection of faces."""
+
+    def test_grid_and_concave_face(self, grid_mesh):
+        mesh = grid_mesh()
+        outline = [(0, 0), (3, 0), (3, 2), (2, 2), (2, 1), (1, 1), (1, 2)]
+        base = len(mesh.vertices)
+        for x, y in outline:
+            mesh.addVertex(Point(x, y, 5))
+        mesh.addFace(list(range(base, base + len(outline))))
+        mesh.triangulate([1, 4], selection_type=kGeotype.face)
+        # three untouched quads first, then 2 + 5 triangles
+        assert len(mesh.faces) == 3 + 2 + 5
+        assert [len(f) for f in mesh.faces] == [4] * 3 + [3] * 7
+        assert len(mesh.normals) == len(mesh.faces)
+        for normal in mesh.normals[3:]:
+            assert normal.z == pytest.approx(1)
+        assert mesh.faces[0] == [0, 1, 4, 3]
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_face_uvs_and_links_follow(self, grid_mesh, numpy, monkeypatch):
+        if not numpy:
+            monkeypatch.setattr("meshTools.mesh.np", None)
+        mesh = grid_mesh()
+        mesh.uvs = [Vector(v.x, v.y, 0) for v in mesh.vertices]
+        # uv ids rotated against the vertex ids of each face
+        mesh.face_uvs = [face[1:] + face[:1] for face in mesh.faces]
+        corner_uvs = [
+            dict(zip(face, uvs)) for face, uvs in zip(mesh.faces, mesh.face_uvs)
+        ]
+        mesh.triangulate([0, 3], selection_type=kGeotype.face)
+        assert len(mesh.face_uvs) == len(mesh.faces) == 6
+        # kept faces 1 and 2, then two triangles each of faces 0 and 3
+        sources = [1, 2, 0, 0, 3, 3]
+        for face, uvs, source in zip(mesh.faces, mesh.face_uvs, sources):
+            assert uvs == [corner_uvs[source][vert] for vert in face]
+        for i, vertex in enumerate(mesh.vertices):
+            faces = [f for f, face in enumerate(mesh.faces) if i in face]
+            assert sorted(vertex.parent_faces) == faces
+        mesh.face_uvs = mesh.face_uvs[1:]
+        mesh.triangulate([0], selection_type=kGeotype.face)
+        assert mesh.face_uvs == []
@@ -0,0 +1,137 @@
+"""Tests for the binary mesh container and Mesh.save / Mesh.load."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from mesh_helpers import uv_mesh, xyz
+from meshTools import ArrayMesh, Mesh, Point, meshfile
+from meshTools.meshfile import MeshWriter, readArrays, writeArrays
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "mesh.mtm"
+
+
+class TestRoundTrip:
+    """save() then load() keeps every stored attribute."""
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_attributes(self, path, mmap):
+        mesh = uv_mesh()
+        mesh.save(path)
+        loaded = Mesh.load(path, mmap=mmap)
+        assert isinstance(loaded, ArrayMesh)
+        assert loaded.faces == mesh.faces
+        assert [xyz(v) for v in loaded.vertices] == [
+            xyz(v) for v in mesh.vertices
+        ]
+        assert loaded.edges == mesh.edges
+        assert [xyz(uv) for uv in loaded.uvs] == [xyz(uv) for uv in mesh.uvs]
+        assert loaded.face_uvs == mesh.face_uvs
+        assert [xyz(n) for n in loaded.normals] == [(0, 0, 1), (0, 0, 1)]
+
+    def test_mapped_without_copy(self, path):
+        uv_mesh().save(path)
+        loaded = Mesh.load(path)
+        positions = loaded.buffers.positions
+        base = positions
+        while base.base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap)
+        assert positions.ctypes.data % 64 == 0
+        assert loaded.buffers.face_indices.ctypes.data % 64 == 0
+        # copy-on-write: edits stay in memory
+        loaded.updateVertex(0, Point(0, 0, 5))
+        assert readArrays(path)["positions"][0].tolist() == [0, 0, 0]
+
+    def test_resave_is_identical(self, path, tmp_path):
+        uv_mesh().save(path)
+        Mesh.load(path).save(tmp_path / "again.mtm")
+        assert (tmp_path / "again.mtm").read_bytes() == path.read_bytes()
+
+    def test_stale_normals_recomputed(self, path):
+        mesh = uv_mesh()
+        mesh.save(path)
+        loaded = Mesh.load(path)
+        loaded.updateVertex(4, Point(1, 0, 1))
+        normal = loaded.normals[1]
+        assert abs(normal.z) < 1
+
+    def test_subclass(self, path):
+        class Custom(ArrayMesh):
+            pass
+
+        uv_mesh().save(path)
+        assert type(Custom.load(path)) is Custom
+
+
+class TestMeshWriter:
+    """Streaming writes and file validation."""
+
+    def test_streamed_blocks(self, path, tmp_path):
+        positions = np.random.default_rng(0).random((10, 3))
+        with MeshWriter(path) as writer:
+            writer.addVertices(positions[:4])
+            writer.addVertices(positions[4:])
+            writer.addFaces([3, 4], [0, 1, 2, 2, 3, 4, 5])
+            writer.addFaces([3], [7, 8, 9])
+        loaded = Mesh.load(path)
+        assert np.allclose(loaded.buffers.positions, positions)
+        assert loaded.faces == [[0, 1, 2], [2, 3, 4, 5], [7, 8, 9]]
+        # without stored edges they are derived from the faces
+        assert [0, 1] in loaded.edges
+
+        other = tmp_path / "arrays.mtm"
+        writeArrays(
+            other,
+            {
+                "positions": positions,
+                "face_indices": [0, 1, 2, 2, 3, 4, 5, 7, 8, 9],
+                "face_offsets": [0, 3, 7, 10],
+            },
+        )
+        assert Mesh.load(other).faces == loaded.faces
+
+    def test_section_is_contiguous(self, path):
+        with MeshWriter(path) as writer:
+            writer.addVertices(np.zeros((1, 3)))
+            writer.write("normals", np.zeros((1, 3)))
+            with pytest.raises(ValueError):
+                writer.addVertices(np.zeros((1, 3)))
+            with pytest.raises(ValueError):
+                writer.write("colors", [1])
+
+    def test_inconsistent_faces(self, path):
+        with MeshWriter(path) as writer, pytest.raises(ValueError):
+            writer.addFaces([3], [0, 1])
+
+    def test_rejects_bad_files(self, path, tmp_path):
+        path.write_bytes(b"not a mesh file" * 8)
+        with pytest.raises(ValueError, match="not a meshTools"):
+            readArrays(path)
+
+        incomplete = tmp_path / "incomplete.mtm"
+        with pytest.raises(RuntimeError), MeshWriter(incomplete) as writer:
+            writer.addVertices(np.zeros((4, 3)))
+            raise RuntimeError("interrupted")
+        with pytest.raises(ValueError, match="incomplete"):
+            readArrays(incomplete)
+
+        truncated = tmp_path / "truncated.mtm"
+        uv_mesh().save(truncated)
+        truncated.write_bytes(truncated.read_bytes()[:200])
+        with pytest.raises(ValueError, match="truncated"):
+            readArrays(truncated)
+
+    @pytest.mark.parametrize("dtype", [b"garbage", b"O", b"\xff\xfe", b"V0"])
+    def test_rejects_bad_dtype(self, path, dtype):
+        uv_mesh().save(path)
+        data = bytearray(path.read_bytes())
+        # dtype field of the first section header
+        start = meshfile._kFileHeader.size + 24
+        data[start : start + 8] = dtype.ljust(8, b"\x00")
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="bad section dtype"):
+            readArrays(path)
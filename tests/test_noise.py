@@ -22,3 +22,144 @@ class TestNoise:
         val = n.snoise(0.1, 0.2, 0.3)
         assert isinstance(val, (int, float))
         assert -1 <= val <= 1
+
+
+class TestNoiseArrays:
+    """Batched *Array entry points match the scalar methods."""
+
+    def _points(self, np, dims):
+        rng = np.random.default_rng(7)
+        return (rng.random((200, dims)) * 8 - 4).astype(np.float32)
+
+    @pytest.mark.parametrize("dims", [2, 3, 4])
+    def test_snoise_and_vsnoise(self, dims):
+        np = pytest.importorskip("numpy")
+        n = Noise()
+        points = self._points(np, dims)
+        values = n.snoiseArray(points)
+        vectors = n.vsnoiseArray(points)
+        assert values.shape == (200,)
+        assert vectors.shape == (200, dims)
+        for i in (0, 57, 199):
+            p = points[i].tolist()
+            assert values[i] == pytest.approx(n.snoise(*p), abs=1e-6)
+            assert vectors[i].tolist() == pytest.approx(n.vsnoise(*p), abs=1e-6)
+
+    def test_fractal_out_buffer(self):
+        np = pytest.importorskip("numpy")
+        n = Noise()
+        points = self._points(np, 3)
+        out = np.zeros((200, 3), dtype=np.float32)
+        assert n.vturbulenceArray(points, 3, 2.0, 0.5, out=out) is out
+        turbulence = n.turbulenceArray(points, 3, 2.0, 0.5, threads=2)
+        fbm = n.fBmArray(points, 3, 2.0, 0.5)
+        p = points[11].tolist()
+        assert out[11].tolist() == pytest.approx(
+            n.vturbulence(*p, 3, 2.0, 0.5), abs=1e-6
+        )
+        assert turbulence[11] == pytest.approx(
+            n.turbulence(*p, 3, 2.0, 0.5), abs=1e-6
+        )
+        assert fbm[11] == pytest.approx(n.fBm(*p, 3, 2.0, 0.5), abs=1e-6)
+
+    def test_worker_pool(self):
+        np = pytest.importorskip("numpy")
+        n = Noise()
+        points = self._points(np, 3).repeat(50, axis=0)
+        expected = n.vfBmArray(points, 6, 2.0, 0.5, threads=1)
+        assert n.threads == 0
+        n.setThreads(3)
+        if n.threads:
+            assert n.threads == 3
+        assert np.array_equal(n.vfBmArray(points, 6, 2.0, 0.5), expected)
+        n.clearThreads()
+        assert n.threads == 0
+
+    def test_simd_packets_match_portable(self):
+        np = pytest.importorskip("numpy")
+        from meshTools.noise import _NoiseCpp
+
+        if _NoiseCpp is None:
+            pytest.skip("C++ _noise extension not built")
+        n = _NoiseCpp()
+        # 1003 points: a partial last packet
+        points = self._points(np, 3).repeat(6, axis=0)[:1003] * 40
+        enabled = _NoiseCpp.simd()
+        try:
+            _NoiseCpp.setSimd(False)
+            portable = n.turbulenceArray(points, 8, 2.0, 0.5, threads=1)
+            _NoiseCpp.setSimd(True)
+            packets = n.turbulenceArray(points, 8, 2.0, 0.5, threads=1)
+        finally:
+            _NoiseCpp.setSimd(enabled)
+        assert np.array_equal(packets, portable)
+        p = points[1002].tolist()
+        assert packets[1002] == n.turbulence(*p, 8, 2.0, 0.5)
+
+    def test_bad_shapes(self):
+        np = pytest.importorskip("numpy")
+        n = Noise()
+        with pytest.raises(ValueError):
+            n.fBmArray(np.zeros((4, 2)), 2, 2.0, 0.5)
+        with pytest.raises(ValueError):
+            n.snoiseArray(np.zeros((4, 3)), out=np.zeros(3, np.float32))
+        with pytest.raises(TypeError):
+            n.snoiseArray(np.zeros((4, 3)), out=np.zeros(4))
+
+
+class TestNoisePyArrays:
+    """NoisePy kernels equal its scalar methods at float32 inputs."""
+
+    def _points(self, np, dims):
+        rng = np.random.default_rng(3)
+        # both signs and exact lattice points exercise the periodic hash
+        points = rng.random((300, dims)) * 600 - 300
+        points[:20] = np.round(points[:20])
+        return points.astype(np.float32)
+
+    @pytest.mark.parametrize("dims", [2, 3, 4])
+    def test_snoise_and_vsnoise(self, dims):
+        np = pytest.importorskip("numpy")
+        from meshTools.noise import NoisePy
+
+        n = NoisePy()
+        points = self._points(np, dims)
+        rows = points.tolist()
+        expected = np.array([n.snoise(*p) for p in rows], dtype=np.float32)
+        vectors = np.array([n.vsnoise(*p) for p in rows], dtype=np.float32)
+        assert np.array_equal(n.snoiseArray(points), expected)
+        assert np.array_equal(n.vsnoiseArray(points), vectors)
+
+    @pytest.mark.parametrize(
+        "name", ["fBm", "turbulence", "vfBm", "vturbulence"]
+    )
+    @pytest.mark.parametrize("octaves", [0, 1, 5])
+    def test_fractals(self, name, octaves):
+        np = pytest.importorskip("numpy")
+        from meshTools.noise import NoisePy
+
+        n = NoisePy()
+        points = self._points(np, 3)
+        scalar = getattr(n, name)
+        expected = np.array(
+            [scalar(*p, octaves, 1.9, 0.6) for p in points.tolist()],
+            dtype=np.float32,
+        )
+        result = getattr(n, name + "Array")(points, octaves, 1.9, 0.6)
+        assert np.array_equal(result, expected.reshape(result.shape))
+
+    def test_float64_points_are_rounded(self):
+        # the kernels see float32 inputs; results are the scalar values at
+        # the rounded points, not at the float64 ones
+        np = pytest.importorskip("numpy")
+        from meshTools.noise import NoisePy
+
+        n = NoisePy()
+        points = np.random.default_rng(4).random((200, 3)) * 10 - 5
+        rounded = points.astype(np.float32)
+        expected = np.array(
+            [n.snoise(*p) for p in rounded.tolist()], dtype=np.float32
+        )
+        assert np.array_equal(n.snoiseArray(points), expected)
+        exact = np.array([n.snoise(*p) for p in points.tolist()])
+        assert np.allclose(n.snoiseArray(points), exact, atol=1e-6)
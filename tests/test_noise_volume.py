@@ -0,0 +1,168 @@
+"""Tests for baked noise volumes (meshTools.noise_volume)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+noise_volume = pytest.importorskip("meshTools.noise_volume")
+from meshTools.noise import Noise
+from meshTools.noise_volume import NoiseVolume
+
+
+@pytest.fixture(autouse=True)
+def _emptyCache():
+    noise_volume.clearCache()
+    budget = noise_volume.cacheBudget()
+    yield
+    noise_volume.setCacheBudget(budget)
+    noise_volume.clearCache()
+
+
+@pytest.fixture(params=["native", "python"])
+def sampler(request, monkeypatch):
+    """Run lookups through the C++ kernel and the NumPy fallback."""
+    if request.param == "python":
+        monkeypatch.setattr(noise_volume, "_sampleGrid", None)
+    elif noise_volume._sampleGrid is None:
+        pytest.skip("C++ _noise extension not built")
+    return request.param
+
+
+def _points(count=500, scale=10.0):
+    rng = np.random.default_rng(5)
+    return ((rng.random((count, 3)) - 0.5) * scale).astype(np.float32)
+
+
+class TestBake:
+    """Baking evaluates the noise function and tiles seamlessly."""
+
+    def test_grid_matches_noise_at_period(self):
+        volume = NoiseVolume.bake("fBm", 3, 2.0, 0.5, resolution=8, period=2)
+        assert volume.values.shape == (8, 8, 8, 1)
+        assert volume.key == ("fBm", 3, 2.0, 0.5, 8, 2.0)
+        # the grid origin holds f(period, period, period)
+        expected = Noise().fBm(2.0, 2.0, 2.0, 3, 2.0, 0.5)
+        assert volume.values[0, 0, 0, 0] == pytest.approx(expected, abs=1e-6)
+
+    def test_vector_function(self):
+        volume = NoiseVolume.bake("vsnoise", resolution=4, period=1)
+        assert volume.channels == 3
+        assert volume.key[1:4] == (0, 0.0, 0.0)
+
+    def test_bad_parameters(self):
+        with pytest.raises(ValueError):
+            NoiseVolume.bake("pnoise")
+        with pytest.raises(ValueError):
+            NoiseVolume.bake(resolution=1)
+        with pytest.raises(ValueError):
+            NoiseVolume.bake(period=0)
+
+
+class TestSample:
+    """Batched trilinear / tricubic lookups."""
+
+    @pytest.mark.parametrize("mode", ["trilinear", "tricubic"])
+    def test_interpolates_grid_values(self, sampler, mode):
+        volume = NoiseVolume.bake("turbulence", 2, resolution=8, period=4)
+        # grid points, also one period away in each direction
+        ids = np.array([[0, 0, 0], [1, 2, 3], [7, 5, 6]])
+        points = np.concatenate([ids, ids + 8, ids - 8]) * 0.5
+        values = volume.sample(points, mode)
+        expected = volume.values[ids[:, 0], ids[:, 1], ids[:, 2], 0]
+        assert values.dtype == np.float32
+        assert values.tolist() == pytest.approx(
+            np.tile(expected, 3).tolist(), abs=1e-6
+        )
+
+    @pytest.mark.parametrize("mode", ["trilinear", "tricubic"])
+    def test_periodic(self, sampler, mode):
+        volume = NoiseVolume.bake("vfBm", 2, resolution=6, period=3)
+        points = _points()
+        shifted = volume.sample(points + np.float32([3, -6, 9]), mode)
+        values = volume.sample(points, mode)
+        assert values.shape == (500, 3)
+        assert np.allclose(values, shifted, atol=1e-5)
+
+    def test_native_matches_python(self, monkeypatch):
+        if noise_volume._sampleGrid is None:
+            pytest.skip("C++ _noise extension not built")
+        volume = NoiseVolume.bake("fBm", 4, resolution=16, period=2)
+        points = _points(2000)
+        native = [volume.sample(points, m) for m in noise_volume.kModes]
+        monkeypatch.setattr(noise_volume, "_sampleGrid", None)
+        for mode, values in zip(noise_volume.kModes, native):
+            assert np.allclose(values, volume.sample(points, mode), atol=1e-6)
+
+    def test_out_buffer(self, sampler):
+        volume = NoiseVolume.bake("snoise", resolution=4, period=2)
+        out = np.zeros(500, dtype=np.float32)
+        assert volume.sample(_points(), out=out) is out
+        assert out.any()
+        with pytest.raises(ValueError):
+            volume.sample(_points(), mode="nearest")
+        with pytest.raises(ValueError):
+            volume.sample(np.zeros((4, 2)))
+
+
+class TestCache:
+    """NoiseVolume.get memoization, byte budget and file cache."""
+
+    def test_memoized_by_parameters(self):
+        a = NoiseVolume.get("fBm", 2, resolution=4)
+        assert NoiseVolume.get("fBm", 2, 2.0, 0.5, 4) is a
+        assert NoiseVolume.get("fBm", 3, resolution=4) is not a
+        # snoise ignores the fractal parameters
+        b = NoiseVolume.get("snoise", 2, resolution=4)
+        assert NoiseVolume.get("snoise", 5, 3.0, 0.1, 4) is b
+
+    def test_budget_evicts_least_recently_used(self):
+        nbytes = 4**3 * 4
+        noise_volume.setCacheBudget(2 * nbytes)
+        a = NoiseVolume.get("fBm", 1, resolution=4)
+        b = NoiseVolume.get("fBm", 2, resolution=4)
+        assert NoiseVolume.get("fBm", 1, resolution=4) is a
+        NoiseVolume.get("fBm", 3, resolution=4)  # evicts b
+        assert NoiseVolume.get("fBm", 1, resolution=4) is a
+        assert NoiseVolume.get("fBm", 2, resolution=4) is not b
+        # larger than the budget: returned but not cached
+        big = NoiseVolume.get("fBm", 1, resolution=8)
+        assert NoiseVolume.get("fBm", 1, resolution=8) is not big
+
+    def test_directory(self, tmp_path):
+        baked = NoiseVolume.get(
+            "vturbulence", 2, resolution=4, directory=tmp_path
+        )
+        (path,) = tmp_path.iterdir()
+        assert path.suffix == ".mtn"
+        noise_volume.clearCache()
+        loaded = NoiseVolume.get(
+            "vturbulence", 2, resolution=4, directory=tmp_path
+        )
+        assert loaded is not baked
+        assert isinstance(loaded.values, np.memmap)
+        assert np.array_equal(loaded.values, baked.values)
+
+
+class TestFile:
+    """save / load of .mtn files."""
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_round_trip(self, tmp_path, mmap):
+        volume = NoiseVolume.bake("turbulence", 5, 1.5, 0.6, 6, 1.25)
+        path = tmp_path / "volume.mtn"
+        volume.save(path)
+        loaded = NoiseVolume.load(path, mmap=mmap)
+        assert loaded.key == volume.key
+        assert isinstance(loaded.values, np.memmap) == mmap
+        assert np.array_equal(loaded.values, volume.values)
+        points = _points()
+        assert np.array_equal(loaded.sample(points), volume.sample(points))
+
+    def test_rejects_bad_files(self, tmp_path):
+        path = tmp_path / "volume.mtn"
+        path.write_bytes(b"not a volume" * 8)
+        with pytest.raises(ValueError, match="not a meshTools noise volume"):
+            NoiseVolume.load(path)
+        NoiseVolume.bake(resolution=4).save(path)
+        path.write_bytes(path.read_bytes()[:-4])
+        with pytest.raises(ValueError, match="truncated"):
+            NoiseVolume.load(path)
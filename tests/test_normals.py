@@ -0,0 +1,193 @@
+"""Tests for vectorized normals and the lazy Mesh normals cache."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from mesh_helpers import CUBE_FACES, csr, cube_mesh, cube_positions
+from meshTools import ArrayMesh, Mesh, Point, Ray, Vector
+from meshTools.normals import faceNormals, vertexNormals
+
+
+class TestKernels:
+    """faceNormals and vertexNormals on raw CSR arrays."""
+
+    def test_face_normals(self):
+        # concave L in the xy plane, a tilted triangle, a degenerate face
+        positions = np.array(
+            [
+                (0, 0, 0),
+                (2, 0, 0),
+                (2, 1, 0),
+                (1, 1, 0),
+                (1, 2, 0),
+                (0, 2, 0),
+                (0, 0, 1),
+                (0, 1, 0),
+            ],
+            float,
+        )
+        offsets, indices = csr([[0, 1, 2, 3, 4, 5], [6, 1, 7], [0, 1, 1, 0]])
+        normals = faceNormals(positions, offsets, indices)
+        np.testing.assert_allclose(normals[0], (0, 0, 1))
+        expected = np.cross(
+            positions[1] - positions[6], positions[7] - positions[6]
+        )
+        np.testing.assert_allclose(
+            normals[1], expected / np.linalg.norm(expected)
+        )
+        np.testing.assert_array_equal(normals[2], 0)
+
+    @pytest.mark.parametrize("weighting", ["area", "angle"])
+    def test_cube_corners(self, weighting):
+        positions = cube_positions()
+        normals = vertexNormals(positions, *csr(CUBE_FACES), weighting)
+        np.testing.assert_allclose(normals, positions / math.sqrt(3))
+
+    def test_weightings_differ(self):
+        # a fan of one large and two thin triangles around vertex 0
+        positions = np.array(
+            [(0, 0, 0), (4, 0, 0), (0, 4, 0), (0, 0, 1), (0.1, 0, 1)], float
+        )
+        faces = [[0, 1, 2], [0, 3, 4], [0, 4, 1]]
+        area = vertexNormals(positions, *csr(faces), "area")[0]
+        angle = vertexNormals(positions, *csr(faces), "angle")[0]
+        assert area[2] > angle[2]
+        np.testing.assert_allclose(np.linalg.norm([area, angle], axis=1), 1)
+        # unused vertices stay zero; vertex_count pads the result
+        padded = vertexNormals(positions, *csr(faces[:1]), vertex_count=6)
+        assert padded.shape == (6, 3)
+        np.testing.assert_array_equal(padded[3:], 0)
+
+    def test_unknown_weighting(self):
+        with pytest.raises(ValueError):
+            vertexNormals(cube_positions(), *csr(CUBE_FACES), "uniform")
+
+
+def _as_tuples(normals):
+    return [(n.x, n.y, n.z) for n in normals]
+
+
+@pytest.mark.parametrize("cls", [Mesh, ArrayMesh])
+class TestNormalsCache:
+    """Mesh.normals recomputes lazily and only what changed."""
+
+    @pytest.fixture
+    def count(self, cls, monkeypatch):
+        """Record the face ids each batch recomputes (None for all)."""
+        calls = []
+        compute = cls._computeFaceNormals
+
+        def counting(mesh, faces):
+            calls.append(None if faces is None else list(faces))
+            return compute(mesh, faces)
+
+        monkeypatch.setattr(cls, "_computeFaceNormals", counting)
+        return calls
+
+    def test_edits_are_deferred(self, cls, count):
+        mesh = cube_mesh(cls)
+        assert count == []
+        normals = _as_tuples(mesh.normals)
+        assert normals[0] == pytest.approx((-1, 0, 0))
+        assert len(count) == 1
+        assert len(mesh.normals) == 6
+        assert len(count) == 1
+
+    def test_update_vertex_marks_its_faces(self, cls, count):
+        mesh = cube_mesh(cls)
+        assert len(mesh.normals) == 6
+        mesh.updateVertex(7, Point(2, 2, 2))
+        normals = _as_tuples(mesh.normals)
+        assert count[-1] == [1, 3, 5]
+        fresh = cube_mesh(Mesh)
+        fresh.vertices[7] = Point(2, 2, 2)
+        assert normals == pytest.approx(_as_tuples(fresh.normals))
+
+    def test_add_and_update_face(self, cls, count):
+        mesh = cube_mesh(cls)
+        assert len(mesh.normals) == 6
+        mesh.updateFace(0, [2, 3, 1, 0])
+        mesh.addFace([0, 1, 7])
+        normals = mesh.normals
+        assert count[-1] == [0, 6]
+        assert len(normals) == 7
+        assert _as_tuples(normals)[0] == pytest.approx((1, 0, 0))
+
+    def test_delete_keeps_alignment(self, cls, count):
+        mesh = cube_mesh(cls)
+        assert len(mesh.normals) == 6
+        mesh.updateVertex(7, Point(2, 2, 2))
+        # faces 3 and 5 are still dirty when face 1 goes
+        mesh._Mesh__deleteFaces([1])
+        reference = cube_mesh(Mesh)
+        reference.vertices[7] = Point(2, 2, 2)
+        expected = _as_tuples(reference.normals)
+        assert _as_tuples(mesh.normals) == pytest.approx(
+            expected[:1] + expected[2:]
+        )
+        assert count[-1] == [2, 4]
+
+    def test_update_vertex_after_clip(self, cls):
+        mesh = cube_mesh(cls)
+        mesh.clipPlane(True, Ray(Vector(0, 0, 0.5), Vector(0, 0, 1)))
+        before = _as_tuples(mesh.normals)
+        mesh.updateVertex(mesh.faces[0][0], Point(3, 3, 3))
+        reference = cls()
+        reference.vertices = mesh.vertices
+        reference.faces = mesh.faces
+        assert _as_tuples(mesh.normals) == pytest.approx(
+            _as_tuples(reference.normals)
+        )
+        assert _as_tuples(mesh.normals)[0] != pytest.approx(before[0])
+
+    def test_update_vertex_without_links(self, cls):
+        mesh = cls()
+        mesh.vertices = [Point(*p) for p in cube_positions().tolist()]
+        mesh.faces = [list(face) for face in CUBE_FACES]
+        assert len(mesh.normals) == 6
+        mesh.updateVertex(7, Point(2, 2, 2))
+        reference = cube_mesh(Mesh)
+        reference.vertices[7] = Point(2, 2, 2)
+        assert _as_tuples(mesh.normals) == pytest.approx(
+            _as_tuples(reference.normals)
+        )
+
+    def test_in_place_edits_need_invalidate(self, cls):
+        mesh = cube_mesh(cls)
+        assert len(mesh.normals) == 6
+        mesh.vertices[7] = Point(2, 2, 2)
+        mesh.invalidateNormals()
+        reference = cube_mesh(Mesh)
+        reference.vertices[7] = Point(2, 2, 2)
+        assert _as_tuples(mesh.normals) == pytest.approx(
+            _as_tuples(reference.normals)
+        )
+
+    def test_recompute_resets(self, cls):
+        mesh = cube_mesh(cls)
+        mesh.recomputeNormals()
+        mesh.recomputeNormals()
+        assert len(mesh.normals) == 6
+
+    def test_assigned_normals_are_kept(self, cls):
+        mesh = cube_mesh(cls)
+        custom = [mesh.normals[0]] * 6
+        mesh.normals = custom
+        assert mesh.normals is custom
+        mesh.updateFace(2, [0, 4, 5, 1])
+        assert mesh.normals[0] is custom[0]
+
+    def test_vertex_normals_cached(self, cls):
+        mesh = cube_mesh(cls)
+        normals = mesh.vertexNormals()
+        assert mesh.vertexNormals() is normals
+        np.testing.assert_allclose(normals, cube_positions() / math.sqrt(3))
+        angle = mesh.vertexNormals("angle")
+        np.testing.assert_allclose(angle, normals)
+        mesh.updateVertex(7, Point(2, 2, 2))
+        moved = mesh.vertexNormals()
+        assert moved is not normals
+        assert not np.allclose(moved[3], normals[3])
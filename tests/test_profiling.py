@@ -0,0 +1,145 @@
+"""Tests for profiling spans, reports and native counters."""
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip("meshTools")
+from meshTools import Ray, Vector, kGeotype, profiling
+from meshTools.profiling import Profiler, profiled
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+
+
+class TestSpans:
+    """Profiler.span timing, nesting and aggregation."""
+
+    def test_nested_self_time(self, profiler):
+        with profiler.span("outer", items=3):
+            time.sleep(0.01)
+            with profiler.span("inner") as inner:
+                time.sleep(0.02)
+                inner.setItems(7)
+        report = profiler.report()
+        outer, inner = report["outer"], report["inner"]
+        assert outer.calls == inner.calls == 1
+        assert (outer.items, inner.items) == (3, 7)
+        assert outer.seconds >= inner.seconds >= 0.02
+        assert outer.self_seconds == pytest.approx(
+            outer.seconds - inner.seconds
+        )
+        assert [s.name for s in report.children("outer")] == ["outer/inner"]
+
+    def test_aggregates_by_name(self, profiler):
+        for _ in range(3):
+            with profiler.span("step", items=2):
+                pass
+        stats = profiler.report()["step"]
+        assert (stats.calls, stats.items) == (3, 6)
+        assert profiler.report().top(1)[0] is not None
+
+    def test_disabled_records_nothing(self):
+        profiler = Profiler()
+        with profiler.span("ignored"):
+            pass
+        assert "ignored" not in profiler.report()
+
+    def test_memory_peak(self, profiler):
+        profiler.disable()
+        profiler.enable(memory=True)
+        with profiler.span("outer"):
+            with profiler.span("allocate"):
+                block = bytearray(4 << 20)
+            del block
+        report = profiler.report()
+        assert report["allocate"].peak_memory >= 4 << 20
+        # the child's peak counts towards its parent
+        assert report["outer"].peak_memory >= 4 << 20
+
+    def test_chrome_trace(self, profiler, tmp_path):
+        with profiler.span("outer"), profiler.span("inner", items=1):
+            pass
+        path = tmp_path / "trace.json"
+        profiler.report().saveChromeTrace(path)
+        events = json.loads(path.read_text())["traceEvents"]
+        assert [e["name"] for e in events] == ["inner", "outer"]
+        assert all(e["ph"] == "X" for e in events)
+        inner, outer = events
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1
+        assert inner["args"] == {"items": 1}
+
+    def test_event_cap(self):
+        profiler = Profiler(max_events=2)
+        profiler.enable()
+        for _ in range(5):
+            with profiler.span("step"):
+                pass
+        report = profiler.report()
+        assert len(report.events) == 2
+        assert report.dropped_events == 3
+        assert report["step"].calls == 5
+
+
+class TestProfiled:
+    """@profiled and the Mesh operations it wraps."""
+
+    def test_decorator(self):
+        @profiled(items=lambda values: len(values))
+        def total(values):
+            return sum(values)
+
+        with profiling.profile() as profiler:
+            assert total([1, 2, 3]) == 6
+        stats = profiler.report()[total.__qualname__]
+        assert (stats.calls, stats.items) == (1, 3)
+        # disabled again after the block
+        total([1])
+        assert profiling.report()[total.__qualname__].calls == 1
+
+    def test_mesh_ops(self, grid_mesh):
+        mesh = grid_mesh(3)
+        with profiling.profile() as profiler:
+            mesh.selectConvert([0, 1], kGeotype.face, kGeotype.vertex)
+            mesh.clipPlane(True, Ray(Vector(1.5, 0, 0), Vector(1, 0, 0)))
+        report = profiler.report()
+        assert report["Mesh.selectConvert"].items == 2
+        assert report["Mesh.clipPlane"].calls == 1
+        assert report["Mesh.clipPlane"].items == 9
+        # clipPlanes runs inside clipPlane
+        children = [s.name for s in report.children("Mesh.clipPlane")]
+        assert children == ["Mesh.clipPlane/Mesh.clipPlanes"]
+        assert "  Mesh.clipPlanes" in str(report)
+        json.dumps(report.toDict())
+
+
+class TestNativeCounters:
+    """counters() of the C++ extensions, merged by nativeCounters()."""
+
+    def test_counters(self):
+        np = pytest.importorskip("numpy")
+        from meshTools import BBox, _geometry
+
+        if _geometry is None:
+            pytest.skip("_geometry extension not built")
+        points = np.random.default_rng(0).random((100, 3), dtype=np.float32)
+        profiling.resetNativeCounters()
+        with profiling.profile() as profiler:
+            BBox().fromPointSet(points)
+            BBox().fromPointSet(points)
+        counters = profiling.nativeCounters()["_geometry.BBox.fromPointSet"]
+        assert counters["calls"] == 2
+        assert counters["items"] == 200
+        assert counters["seconds"] >= 0
+        assert profiler.report().native == {
+            "_geometry.BBox.fromPointSet": counters
+        }
+        profiling.resetNativeCounters()
+        assert "_geometry.BBox.fromPointSet" not in profiling.nativeCounters()
@@ -0,0 +1,136 @@
+"""Tests for the batch SelectionEngine."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("meshTools")
+from meshTools import ArrayMesh, Mesh, kGeotype
+from meshTools.mesh import edgeKey
+from meshTools.selection import fromBitset, toBitset
+
+
+class TestConvert:
+    """Conversions match Mesh.selectConvert semantics."""
+
+    def test_face_to_vertex_and_edge(self, grid_mesh):
+        engine = grid_mesh(3).selectionEngine()
+        verts = engine.convert([4], kGeotype.face, kGeotype.vertex)
+        assert verts.tolist() == [5, 6, 9, 10]
+        edges = engine.convert([4], kGeotype.face, kGeotype.edge)
+        assert len(edges) == 4
+
+    def test_vertex_to_face(self, grid_mesh):
+        engine = grid_mesh(3).selectionEngine()
+        faces = engine.convert([5], kGeotype.vertex, kGeotype.face)
+        assert faces.tolist() == [0, 1, 3, 4]
+
+    def test_mask_input_and_output(self, grid_mesh):
+        mesh = grid_mesh(3)
+        engine = mesh.selectionEngine()
+        mask = np.zeros(len(mesh.faces), dtype=bool)
+        mask[4] = True
+        out = engine.convert(mask, kGeotype.face, kGeotype.vertex, True)
+        assert out.dtype == bool
+        assert np.flatnonzero(out).tolist() == [5, 6, 9, 10]
+
+    def test_bitset_roundtrip(self):
+        mask = np.array([1, 0, 0, 1, 1, 0, 0, 0, 0, 1], dtype=bool)
+        bits = toBitset(mask)
+        assert len(bits) == 2
+        assert fromBitset(bits, len(mask)).tolist() == mask.tolist()
+
+    def test_engine_rebuilds_after_edit(self, grid_mesh):
+        mesh = grid_mesh(3, ArrayMesh)
+        first = mesh.selectionEngine()
+        mesh.updateFace(0, [0, 1, 5])
+        assert mesh.selectionEngine() is not first
+        faces = mesh.selectConvert([4], kGeotype.vertex, kGeotype.face)
+        assert faces == [3]
+
+
+class TestQueries:
+    """Grow, shrink, border and interior."""
+
+    def test_grow_faces(self, grid_mesh):
+        mesh = grid_mesh(3)
+        assert mesh.selectGrowF([4]) == list(range(9))
+
+    def test_grow_vertices(self, grid_mesh):
+        engine = grid_mesh(3).selectionEngine()
+        grown = engine.grow([5], kGeotype.vertex)
+        assert grown.tolist() == [1, 4, 5, 6, 9]
+
+    def test_shrink_faces(self, grid_mesh):
+        engine = grid_mesh(3).selectionEngine()
+        # faces on the mesh boundary shrink away too
+        assert engine.shrink(range(9), kGeotype.face).tolist() == [4]
+        mesh = grid_mesh(5)
+        engine = mesh.selectionEngine()
+        block = [7, 8, 9, 12, 13, 14, 17, 18, 19]
+        assert engine.shrink(block, kGeotype.face).tolist() == [13]
+
+    def test_shrink_vertices(self, grid_mesh):
+        engine = grid_mesh(3).selectionEngine()
+        ring = engine.grow([5], kGeotype.vertex)
+        assert engine.shrink(ring, kGeotype.vertex).tolist() == [5]
+
+    def test_border_and_interior(self, grid_mesh):
+        mesh = grid_mesh(3)
+        engine = mesh.selectionEngine()
+        border = engine.border(range(9))
+        assert len(border) == 12
+        keys = {edgeKey(*mesh.edges[e]) for e in border}
+        assert (0, 1) in keys
+        assert (5, 6) not in keys
+        assert engine.interior(range(9)).tolist() == [5, 6, 9, 10]
+
+    def test_border_corners_ignore_edge_list(self, grid_mesh):
+        mesh = grid_mesh(3)
+        mesh.edges = []
+        engine = mesh.selectionEngine()
+        corners = engine.borderCorners([4])
+        assert corners.tolist() == [16, 17, 18, 19]
+        assert engine.interior(range(9)).tolist() == [5, 6, 9, 10]
+
+
+@pytest.fixture(params=["engine", "python"])
+def engine_mode(request, monkeypatch):
+    """Run Mesh queries through the engine and the pure Python fallback."""
+    if request.param == "python":
+        monkeypatch.setattr(Mesh, "selectionEngine", lambda self: None)
+    return request.param
+
+
+class TestMeshQueries:
+    """Mesh border, interior, grow and shrink through the engine."""
+
+    def test_border_loops(self, grid_mesh, engine_mode):
+        mesh = grid_mesh(5)
+        ring = [6, 7, 8, 11, 13, 16, 17, 18]
+        loops, groups, reject = mesh._Mesh__selectFaceBordersEx(ring)
+        assert loops == [
+            [7, 8, 9, 10, 16, 22, 28, 27, 26, 25, 19, 13],
+            [15, 14, 20, 21],
+        ]
+        assert sorted(groups[1]) == [6, 7, 8, 11, 13, 16, 17, 18]
+        assert len(reject) == 16
+        assert mesh._Mesh__selectFaceBorders(ring) == loops
+        assert mesh._Mesh__selectFacesInterior(ring) == []
+
+    def test_flipped_face_is_border(self, grid_mesh, engine_mode):
+        mesh = grid_mesh(3)
+        mesh.faces[1].reverse()
+        mesh.invalidateTopology()
+        loops = mesh._Mesh__selectFaceBorders([0, 1])
+        # the shared side runs the same way twice: border, listed once
+        assert loops == [[0, 1, 5, 4], [5, 6, 2]]
+
+    def test_grow_and_shrink(self, grid_mesh, engine_mode):
+        mesh = grid_mesh(3)
+        assert sorted(mesh.selectGrowV([5])) == [1, 4, 5, 6, 9]
+        assert mesh.selectShrinkV([1, 4, 5, 6, 9]) == [5]
+        assert mesh.selectShrinkF(list(range(9))) == [4]
+        edges = mesh.selectConvert([4], kGeotype.face, kGeotype.edge)
+        assert mesh.selectShrinkE(sorted(edges)) == []
+        grown = mesh.selectGrowE(sorted(edges))
+        assert mesh.selectShrinkE(sorted(grown)) == sorted(edges)